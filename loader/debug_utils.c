@@ -201,9 +201,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDebugUtilsMessengerEXT(VkInstanc
             }
         }
 
-        if (icd_term->dispatch.CreateDebugUtilsMessengerEXT) {
-            res = icd_term->dispatch.CreateDebugUtilsMessengerEXT(icd_term->instance, pCreateInfo, pAllocator,
-                                                                  &icd_term->debug_utils_messenger_list.list[next_index]);
+        if (ICD_TERM_DISPATCH(icd_term, CreateDebugUtilsMessengerEXT)) {
+            res = ICD_TERM_DISPATCH(icd_term, CreateDebugUtilsMessengerEXT)(icd_term->instance, pCreateInfo, pAllocator,
+                                                                            &icd_term->debug_utils_messenger_list.list[next_index]);
 
             if (res != VK_SUCCESS) {
                 goto out;
@@ -239,9 +239,9 @@ out:
         if (pNextIndex) {
             for (struct loader_icd_term *icd_term = inst->icd_terms; icd_term; icd_term = icd_term->next) {
                 if (icd_term->debug_utils_messenger_list.list && icd_term->debug_utils_messenger_list.list[next_index] &&
-                    NULL != icd_term->dispatch.DestroyDebugUtilsMessengerEXT) {
-                    icd_term->dispatch.DestroyDebugUtilsMessengerEXT(
-                        icd_term->instance, icd_term->debug_utils_messenger_list.list[next_index], pAllocator);
+                    NULL != ICD_TERM_DISPATCH(icd_term, DestroyDebugUtilsMessengerEXT)) {
+                    ICD_TERM_DISPATCH(icd_term, DestroyDebugUtilsMessengerEXT)
+                    (icd_term->instance, icd_term->debug_utils_messenger_list.list[next_index], pAllocator);
                 }
             }
         }
@@ -271,9 +271,9 @@ VKAPI_ATTR void VKAPI_CALL terminator_DestroyDebugUtilsMessengerEXT(VkInstance i
 
     for (struct loader_icd_term *icd_term = inst->icd_terms; icd_term; icd_term = icd_term->next) {
         if (icd_term->debug_utils_messenger_list.list && icd_term->debug_utils_messenger_list.list[*debug_messenger_index] &&
-            NULL != icd_term->dispatch.DestroyDebugUtilsMessengerEXT) {
-            icd_term->dispatch.DestroyDebugUtilsMessengerEXT(
-                icd_term->instance, icd_term->debug_utils_messenger_list.list[*debug_messenger_index], pAllocator);
+            NULL != ICD_TERM_DISPATCH(icd_term, DestroyDebugUtilsMessengerEXT)) {
+            ICD_TERM_DISPATCH(icd_term, DestroyDebugUtilsMessengerEXT)
+            (icd_term->instance, icd_term->debug_utils_messenger_list.list[*debug_messenger_index], pAllocator);
         }
     }
 
@@ -479,9 +479,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDebugReportCallbackEXT(VkInstanc
             }
         }
 
-        if (icd_term->dispatch.CreateDebugReportCallbackEXT) {
-            res = icd_term->dispatch.CreateDebugReportCallbackEXT(icd_term->instance, pCreateInfo, pAllocator,
-                                                                  &icd_term->debug_report_callback_list.list[next_index]);
+        if (ICD_TERM_DISPATCH(icd_term, CreateDebugReportCallbackEXT)) {
+            res = ICD_TERM_DISPATCH(icd_term, CreateDebugReportCallbackEXT)(icd_term->instance, pCreateInfo, pAllocator,
+                                                                            &icd_term->debug_report_callback_list.list[next_index]);
 
             if (res != VK_SUCCESS) {
                 goto out;
@@ -517,9 +517,9 @@ out:
         if (pNextIndex) {
             for (struct loader_icd_term *icd_term = inst->icd_terms; icd_term; icd_term = icd_term->next) {
                 if (icd_term->debug_report_callback_list.list && icd_term->debug_report_callback_list.list[next_index] &&
-                    NULL != icd_term->dispatch.DestroyDebugReportCallbackEXT) {
-                    icd_term->dispatch.DestroyDebugReportCallbackEXT(
-                        icd_term->instance, icd_term->debug_report_callback_list.list[next_index], pAllocator);
+                    NULL != ICD_TERM_DISPATCH(icd_term, DestroyDebugReportCallbackEXT)) {
+                    ICD_TERM_DISPATCH(icd_term, DestroyDebugReportCallbackEXT)
+                    (icd_term->instance, icd_term->debug_report_callback_list.list[next_index], pAllocator);
                 }
             }
         }
@@ -548,9 +548,9 @@ VKAPI_ATTR void VKAPI_CALL terminator_DestroyDebugReportCallbackEXT(VkInstance i
     }
     for (struct loader_icd_term *icd_term = inst->icd_terms; icd_term; icd_term = icd_term->next) {
         if (icd_term->debug_report_callback_list.list && icd_term->debug_report_callback_list.list[*debug_report_index] &&
-            NULL != icd_term->dispatch.DestroyDebugReportCallbackEXT) {
-            icd_term->dispatch.DestroyDebugReportCallbackEXT(
-                icd_term->instance, icd_term->debug_report_callback_list.list[*debug_report_index], pAllocator);
+            NULL != ICD_TERM_DISPATCH(icd_term, DestroyDebugReportCallbackEXT)) {
+            ICD_TERM_DISPATCH(icd_term, DestroyDebugReportCallbackEXT)
+            (icd_term->instance, icd_term->debug_report_callback_list.list[*debug_report_index], pAllocator);
         }
     }
 
@@ -569,15 +569,15 @@ VKAPI_ATTR void VKAPI_CALL terminator_DestroyDebugReportCallbackEXT(VkInstance i
 VKAPI_ATTR void VKAPI_CALL terminator_DebugReportMessageEXT(VkInstance instance, VkDebugReportFlagsEXT flags,
                                                             VkDebugReportObjectTypeEXT objType, uint64_t object, size_t location,
                                                             int32_t msgCode, const char *pLayerPrefix, const char *pMsg) {
-    const struct loader_icd_term *icd_term;
+    struct loader_icd_term *icd_term;
 
     struct loader_instance *inst = (struct loader_instance *)instance;
 
     loader_platform_thread_lock_mutex(&loader_lock);
     for (icd_term = inst->icd_terms; icd_term; icd_term = icd_term->next) {
-        if (icd_term->dispatch.DebugReportMessageEXT != NULL) {
-            icd_term->dispatch.DebugReportMessageEXT(icd_term->instance, flags, objType, object, location, msgCode, pLayerPrefix,
-                                                     pMsg);
+        if (ICD_TERM_DISPATCH(icd_term, DebugReportMessageEXT) != NULL) {
+            ICD_TERM_DISPATCH(icd_term, DebugReportMessageEXT)
+            (icd_term->instance, flags, objType, object, location, msgCode, pLayerPrefix, pMsg);
         }
     }
 
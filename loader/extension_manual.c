@@ -63,12 +63,12 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceExternalImageFormatPr
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
-    if (!icd_term->dispatch.GetPhysicalDeviceExternalImageFormatPropertiesNV) {
+    if (!ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalImageFormatPropertiesNV)) {
         if (externalHandleType) {
             return VK_ERROR_FORMAT_NOT_SUPPORTED;
         }
 
-        if (!icd_term->dispatch.GetPhysicalDeviceImageFormatProperties) {
+        if (!ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties)) {
             return VK_ERROR_INITIALIZATION_FAILED;
         }
 
@@ -76,11 +76,11 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceExternalImageFormatPr
         pExternalImageFormatProperties->exportFromImportedHandleTypes = 0;
         pExternalImageFormatProperties->compatibleHandleTypes = 0;
 
-        return icd_term->dispatch.GetPhysicalDeviceImageFormatProperties(
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties)(
             phys_dev_term->phys_dev, format, type, tiling, usage, flags, &pExternalImageFormatProperties->imageFormatProperties);
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceExternalImageFormatPropertiesNV(
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalImageFormatPropertiesNV)(
         phys_dev_term->phys_dev, format, type, tiling, usage, flags, externalHandleType, pExternalImageFormatProperties);
 }
 
@@ -115,10 +115,10 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilities2E
         unwrapped_surface = phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index];
     }
 
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilities2EXT) {
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilities2EXT)) {
         // Pass the call to the driver
-        return icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilities2EXT(phys_dev_term->phys_dev, unwrapped_surface,
-                                                                           pSurfaceCapabilities);
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilities2EXT)(phys_dev_term->phys_dev, unwrapped_surface,
+                                                                                     pSurfaceCapabilities);
     } else {
         // Emulate the call
         loader_log(icd_term->this_instance, VULKAN_LOADER_INFO_BIT, 0,
@@ -127,8 +127,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilities2E
                    icd_term->scanned_icd->lib_name);
 
         VkSurfaceCapabilitiesKHR surface_caps;
-        VkResult res =
-            icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilitiesKHR(phys_dev_term->phys_dev, unwrapped_surface, &surface_caps);
+        VkResult res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilitiesKHR)(phys_dev_term->phys_dev,
+                                                                                            unwrapped_surface, &surface_caps);
         pSurfaceCapabilities->minImageCount = surface_caps.minImageCount;
         pSurfaceCapabilities->maxImageCount = surface_caps.maxImageCount;
         pSurfaceCapabilities->currentExtent = surface_caps.currentExtent;
@@ -169,14 +169,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_ReleaseDisplayEXT(VkPhysicalDevice phy
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
-    if (icd_term->dispatch.ReleaseDisplayEXT == NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, ReleaseDisplayEXT) == NULL) {
         loader_log(icd_term->this_instance, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD \"%s\" associated with VkPhysicalDevice does not support vkReleaseDisplayEXT - Consequently, the call is "
                    "invalid because it should not be possible to acquire a display on this device",
                    icd_term->scanned_icd->lib_name);
         abort();
     }
-    return icd_term->dispatch.ReleaseDisplayEXT(phys_dev_term->phys_dev, display);
+    return ICD_TERM_DISPATCH(icd_term, ReleaseDisplayEXT)(phys_dev_term->phys_dev, display);
 }
 
 // ---- VK_EXT_acquire_xlib_display extension trampoline/terminators
@@ -199,9 +199,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_AcquireXlibDisplayEXT(VkPhysicalDevice
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
-    if (icd_term->dispatch.AcquireXlibDisplayEXT != NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, AcquireXlibDisplayEXT) != NULL) {
         // Pass the call to the driver
-        return icd_term->dispatch.AcquireXlibDisplayEXT(phys_dev_term->phys_dev, dpy, display);
+        return ICD_TERM_DISPATCH(icd_term, AcquireXlibDisplayEXT)(phys_dev_term->phys_dev, dpy, display);
     } else {
         // Emulate the call
         loader_log(icd_term->this_instance, VULKAN_LOADER_INFO_BIT, 0,
@@ -230,9 +230,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetRandROutputDisplayEXT(VkPhysicalDev
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
-    if (icd_term->dispatch.GetRandROutputDisplayEXT != NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, GetRandROutputDisplayEXT) != NULL) {
         // Pass the call to the driver
-        return icd_term->dispatch.GetRandROutputDisplayEXT(phys_dev_term->phys_dev, dpy, rrOutput, pDisplay);
+        return ICD_TERM_DISPATCH(icd_term, GetRandROutputDisplayEXT)(phys_dev_term->phys_dev, dpy, rrOutput, pDisplay);
     } else {
         // Emulate the call
         loader_log(icd_term->this_instance, VULKAN_LOADER_INFO_BIT, 0,
@@ -269,7 +269,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfacePresentModes2E
     VkPresentModeKHR *pPresentModes) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfacePresentModes2EXT) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfacePresentModes2EXT)) {
         loader_log(icd_term->this_instance, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD associated with VkPhysicalDevice does not support GetPhysicalDeviceSurfacePresentModes2EXT");
         abort();
@@ -283,12 +283,12 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfacePresentModes2E
             surface_info_copy.sType = pSurfaceInfo->sType;
             surface_info_copy.pNext = pSurfaceInfo->pNext;
             surface_info_copy.surface = icd_term->surface_list.list[icd_surface->surface_index];
-            return icd_term->dispatch.GetPhysicalDeviceSurfacePresentModes2EXT(phys_dev_term->phys_dev, &surface_info_copy,
-                                                                               pPresentModeCount, pPresentModes);
+            return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfacePresentModes2EXT)(
+                phys_dev_term->phys_dev, &surface_info_copy, pPresentModeCount, pPresentModes);
         }
     }
-    return icd_term->dispatch.GetPhysicalDeviceSurfacePresentModes2EXT(phys_dev_term->phys_dev, pSurfaceInfo, pPresentModeCount,
-                                                                       pPresentModes);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfacePresentModes2EXT)(phys_dev_term->phys_dev, pSurfaceInfo,
+                                                                                 pPresentModeCount, pPresentModes);
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL GetDeviceGroupSurfacePresentModes2EXT(VkDevice device,
@@ -368,7 +368,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceToolPropertiesEXT(VkP
     VkResult res = VK_SUCCESS;
     VkResult enumerate_res = VK_SUCCESS;
 
-    enumerate_res = icd_term->dispatch.EnumerateDeviceExtensionProperties(phys_dev_term->phys_dev, NULL, &ext_count, NULL);
+    enumerate_res =
+        ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)(phys_dev_term->phys_dev, NULL, &ext_count, NULL);
     if (enumerate_res != VK_SUCCESS) {
         goto out;
     }
@@ -380,7 +381,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceToolPropertiesEXT(VkP
         goto out;
     }
 
-    enumerate_res = icd_term->dispatch.EnumerateDeviceExtensionProperties(phys_dev_term->phys_dev, NULL, &ext_count, ext_props);
+    enumerate_res =
+        ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)(phys_dev_term->phys_dev, NULL, &ext_count, ext_props);
     if (enumerate_res != VK_SUCCESS) {
         goto out;
     }
@@ -392,13 +394,13 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceToolPropertiesEXT(VkP
         }
     }
 
-    if (tooling_info_supported && icd_term->dispatch.GetPhysicalDeviceToolPropertiesEXT) {
-        res = icd_term->dispatch.GetPhysicalDeviceToolPropertiesEXT(phys_dev_term->phys_dev, pToolCount, pToolProperties);
+    if (tooling_info_supported && ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceToolPropertiesEXT)) {
+        res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceToolPropertiesEXT)(phys_dev_term->phys_dev, pToolCount, pToolProperties);
     }
 
 out:
     // In the case the driver didn't support the extension, make sure that the first layer doesn't find the count uninitialized
-    if (!tooling_info_supported || !icd_term->dispatch.GetPhysicalDeviceToolPropertiesEXT) {
+    if (!tooling_info_supported || !ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceToolPropertiesEXT)) {
         *pToolCount = 0;
     }
 
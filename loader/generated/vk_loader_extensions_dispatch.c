@@ -0,0 +1,3400 @@
+// *** THIS FILE IS GENERATED - DO NOT EDIT ***
+// See loader_extension_generator.py for modifications
+
+/*
+ * Copyright (c) 2015-2022 The Khronos Group Inc.
+ * Copyright (c) 2015-2022 Valve Corporation
+ * Copyright (c) 2015-2022 LunarG, Inc.
+ * Copyright (c) 2021-2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * Copyright (c) 2023-2023 RasterGrid Kft.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * Author: Mark Lobodzinski <mark@lunarg.com>
+ * Author: Mark Young <marky@lunarg.com>
+ */
+
+// clang-format off
+#include "vk_loader_extensions_internal.h"
+
+// Device extension error function
+VKAPI_ATTR VkResult VKAPI_CALL vkDevExtError(VkDevice dev) {
+    struct loader_device *found_dev;
+    // The device going in is a trampoline device
+    struct loader_icd_term *icd_term = loader_get_icd_and_device(dev, &found_dev);
+
+    if (icd_term)
+        loader_log(icd_term->this_instance, VULKAN_LOADER_ERROR_BIT, 0,
+                   "Bad destination in loader trampoline dispatch,"
+                   "Are layers and extensions that you are calling enabled?");
+    return VK_ERROR_EXTENSION_NOT_PRESENT;
+}
+
+const char loader_name_pool[] =
+    "\0"
+    "vkCreateInstance\0"
+    "vkDestroyInstance\0"
+    "vkEnumeratePhysicalDevices\0"
+    "vkGetPhysicalDeviceFeatures\0"
+    "vkGetPhysicalDeviceFormatProperties\0"
+    "vkGetPhysicalDeviceImageFormatProperties\0"
+    "vkGetPhysicalDeviceProperties\0"
+    "vkGetPhysicalDeviceQueueFamilyProperties\0"
+    "vkGetPhysicalDeviceMemoryProperties\0"
+    "vkGetInstanceProcAddr\0"
+    "vkGetDeviceProcAddr\0"
+    "vkCreateDevice\0"
+    "vkDestroyDevice\0"
+    "vkEnumerateInstanceExtensionProperties\0"
+    "vkEnumerateDeviceExtensionProperties\0"
+    "vkEnumerateInstanceLayerProperties\0"
+    "vkEnumerateDeviceLayerProperties\0"
+    "vkGetDeviceQueue\0"
+    "vkQueueSubmit\0"
+    "vkQueueWaitIdle\0"
+    "vkDeviceWaitIdle\0"
+    "vkAllocateMemory\0"
+    "vkFreeMemory\0"
+    "vkMapMemory\0"
+    "vkUnmapMemory\0"
+    "vkFlushMappedMemoryRanges\0"
+    "vkInvalidateMappedMemoryRanges\0"
+    "vkGetDeviceMemoryCommitment\0"
+    "vkBindBufferMemory\0"
+    "vkBindImageMemory\0"
+    "vkGetBufferMemoryRequirements\0"
+    "vkGetImageMemoryRequirements\0"
+    "vkGetImageSparseMemoryRequirements\0"
+    "vkGetPhysicalDeviceSparseImageFormatProperties\0"
+    "vkQueueBindSparse\0"
+    "vkCreateFence\0"
+    "vkDestroyFence\0"
+    "vkResetFences\0"
+    "vkGetFenceStatus\0"
+    "vkWaitForFences\0"
+    "vkCreateSemaphore\0"
+    "vkDestroySemaphore\0"
+    "vkCreateEvent\0"
+    "vkDestroyEvent\0"
+    "vkGetEventStatus\0"
+    "vkSetEvent\0"
+    "vkResetEvent\0"
+    "vkCreateQueryPool\0"
+    "vkDestroyQueryPool\0"
+    "vkGetQueryPoolResults\0"
+    "vkCreateBuffer\0"
+    "vkDestroyBuffer\0"
+    "vkCreateBufferView\0"
+    "vkDestroyBufferView\0"
+    "vkCreateImage\0"
+    "vkDestroyImage\0"
+    "vkGetImageSubresourceLayout\0"
+    "vkCreateImageView\0"
+    "vkDestroyImageView\0"
+    "vkCreateShaderModule\0"
+    "vkDestroyShaderModule\0"
+    "vkCreatePipelineCache\0"
+    "vkDestroyPipelineCache\0"
+    "vkGetPipelineCacheData\0"
+    "vkMergePipelineCaches\0"
+    "vkCreateGraphicsPipelines\0"
+    "vkCreateComputePipelines\0"
+    "vkDestroyPipeline\0"
+    "vkCreatePipelineLayout\0"
+    "vkDestroyPipelineLayout\0"
+    "vkCreateSampler\0"
+    "vkDestroySampler\0"
+    "vkCreateDescriptorSetLayout\0"
+    "vkDestroyDescriptorSetLayout\0"
+    "vkCreateDescriptorPool\0"
+    "vkDestroyDescriptorPool\0"
+    "vkResetDescriptorPool\0"
+    "vkAllocateDescriptorSets\0"
+    "vkFreeDescriptorSets\0"
+    "vkUpdateDescriptorSets\0"
+    "vkCreateFramebuffer\0"
+    "vkDestroyFramebuffer\0"
+    "vkCreateRenderPass\0"
+    "vkDestroyRenderPass\0"
+    "vkGetRenderAreaGranularity\0"
+    "vkCreateCommandPool\0"
+    "vkDestroyCommandPool\0"
+    "vkResetCommandPool\0"
+    "vkAllocateCommandBuffers\0"
+    "vkFreeCommandBuffers\0"
+    "vkBeginCommandBuffer\0"
+    "vkEndCommandBuffer\0"
+    "vkResetCommandBuffer\0"
+    "vkCmdBindPipeline\0"
+    "vkCmdSetViewport\0"
+    "vkCmdSetScissor\0"
+    "vkCmdSetLineWidth\0"
+    "vkCmdSetDepthBias\0"
+    "vkCmdSetBlendConstants\0"
+    "vkCmdSetDepthBounds\0"
+    "vkCmdSetStencilCompareMask\0"
+    "vkCmdSetStencilWriteMask\0"
+    "vkCmdSetStencilReference\0"
+    "vkCmdBindDescriptorSets\0"
+    "vkCmdBindIndexBuffer\0"
+    "vkCmdBindVertexBuffers\0"
+    "vkCmdDraw\0"
+    "vkCmdDrawIndexed\0"
+    "vkCmdDrawIndirect\0"
+    "vkCmdDrawIndexedIndirect\0"
+    "vkCmdDispatch\0"
+    "vkCmdDispatchIndirect\0"
+    "vkCmdCopyBuffer\0"
+    "vkCmdCopyImage\0"
+    "vkCmdBlitImage\0"
+    "vkCmdCopyBufferToImage\0"
+    "vkCmdCopyImageToBuffer\0"
+    "vkCmdUpdateBuffer\0"
+    "vkCmdFillBuffer\0"
+    "vkCmdClearColorImage\0"
+    "vkCmdClearDepthStencilImage\0"
+    "vkCmdClearAttachments\0"
+    "vkCmdResolveImage\0"
+    "vkCmdSetEvent\0"
+    "vkCmdResetEvent\0"
+    "vkCmdWaitEvents\0"
+    "vkCmdPipelineBarrier\0"
+    "vkCmdBeginQuery\0"
+    "vkCmdEndQuery\0"
+    "vkCmdResetQueryPool\0"
+    "vkCmdWriteTimestamp\0"
+    "vkCmdCopyQueryPoolResults\0"
+    "vkCmdPushConstants\0"
+    "vkCmdBeginRenderPass\0"
+    "vkCmdNextSubpass\0"
+    "vkCmdEndRenderPass\0"
+    "vkCmdExecuteCommands\0"
+    "vkEnumerateInstanceVersion\0"
+    "vkBindBufferMemory2\0"
+    "vkBindImageMemory2\0"
+    "vkGetDeviceGroupPeerMemoryFeatures\0"
+    "vkCmdSetDeviceMask\0"
+    "vkCmdDispatchBase\0"
+    "vkEnumeratePhysicalDeviceGroups\0"
+    "vkGetImageMemoryRequirements2\0"
+    "vkGetBufferMemoryRequirements2\0"
+    "vkGetImageSparseMemoryRequirements2\0"
+    "vkGetPhysicalDeviceFeatures2\0"
+    "vkGetPhysicalDeviceProperties2\0"
+    "vkGetPhysicalDeviceFormatProperties2\0"
+    "vkGetPhysicalDeviceImageFormatProperties2\0"
+    "vkGetPhysicalDeviceQueueFamilyProperties2\0"
+    "vkGetPhysicalDeviceMemoryProperties2\0"
+    "vkGetPhysicalDeviceSparseImageFormatProperties2\0"
+    "vkTrimCommandPool\0"
+    "vkGetDeviceQueue2\0"
+    "vkCreateSamplerYcbcrConversion\0"
+    "vkDestroySamplerYcbcrConversion\0"
+    "vkCreateDescriptorUpdateTemplate\0"
+    "vkDestroyDescriptorUpdateTemplate\0"
+    "vkUpdateDescriptorSetWithTemplate\0"
+    "vkGetPhysicalDeviceExternalBufferProperties\0"
+    "vkGetPhysicalDeviceExternalFenceProperties\0"
+    "vkGetPhysicalDeviceExternalSemaphoreProperties\0"
+    "vkGetDescriptorSetLayoutSupport\0"
+    "vkCmdDrawIndirectCount\0"
+    "vkCmdDrawIndexedIndirectCount\0"
+    "vkCreateRenderPass2\0"
+    "vkCmdBeginRenderPass2\0"
+    "vkCmdNextSubpass2\0"
+    "vkCmdEndRenderPass2\0"
+    "vkResetQueryPool\0"
+    "vkGetSemaphoreCounterValue\0"
+    "vkWaitSemaphores\0"
+    "vkSignalSemaphore\0"
+    "vkGetBufferDeviceAddress\0"
+    "vkGetBufferOpaqueCaptureAddress\0"
+    "vkGetDeviceMemoryOpaqueCaptureAddress\0"
+    "vkGetPhysicalDeviceToolProperties\0"
+    "vkCreatePrivateDataSlot\0"
+    "vkDestroyPrivateDataSlot\0"
+    "vkSetPrivateData\0"
+    "vkGetPrivateData\0"
+    "vkCmdSetEvent2\0"
+    "vkCmdResetEvent2\0"
+    "vkCmdWaitEvents2\0"
+    "vkCmdPipelineBarrier2\0"
+    "vkCmdWriteTimestamp2\0"
+    "vkQueueSubmit2\0"
+    "vkCmdCopyBuffer2\0"
+    "vkCmdCopyImage2\0"
+    "vkCmdCopyBufferToImage2\0"
+    "vkCmdCopyImageToBuffer2\0"
+    "vkCmdBlitImage2\0"
+    "vkCmdResolveImage2\0"
+    "vkCmdBeginRendering\0"
+    "vkCmdEndRendering\0"
+    "vkCmdSetCullMode\0"
+    "vkCmdSetFrontFace\0"
+    "vkCmdSetPrimitiveTopology\0"
+    "vkCmdSetViewportWithCount\0"
+    "vkCmdSetScissorWithCount\0"
+    "vkCmdBindVertexBuffers2\0"
+    "vkCmdSetDepthTestEnable\0"
+    "vkCmdSetDepthWriteEnable\0"
+    "vkCmdSetDepthCompareOp\0"
+    "vkCmdSetDepthBoundsTestEnable\0"
+    "vkCmdSetStencilTestEnable\0"
+    "vkCmdSetStencilOp\0"
+    "vkCmdSetRasterizerDiscardEnable\0"
+    "vkCmdSetDepthBiasEnable\0"
+    "vkCmdSetPrimitiveRestartEnable\0"
+    "vkGetDeviceBufferMemoryRequirements\0"
+    "vkGetDeviceImageMemoryRequirements\0"
+    "vkGetDeviceImageSparseMemoryRequirements\0"
+    "vkCmdSetLineStipple\0"
+    "vkMapMemory2\0"
+    "vkUnmapMemory2\0"
+    "vkCmdBindIndexBuffer2\0"
+    "vkGetRenderingAreaGranularity\0"
+    "vkGetDeviceImageSubresourceLayout\0"
+    "vkGetImageSubresourceLayout2\0"
+    "vkCmdPushDescriptorSet\0"
+    "vkCmdPushDescriptorSetWithTemplate\0"
+    "vkCmdSetRenderingAttachmentLocations\0"
+    "vkCmdSetRenderingInputAttachmentIndices\0"
+    "vkCmdBindDescriptorSets2\0"
+    "vkCmdPushConstants2\0"
+    "vkCmdPushDescriptorSet2\0"
+    "vkCmdPushDescriptorSetWithTemplate2\0"
+    "vkCopyMemoryToImage\0"
+    "vkCopyImageToMemory\0"
+    "vkCopyImageToImage\0"
+    "vkTransitionImageLayout\0"
+    "vkDestroySurfaceKHR\0"
+    "vkGetPhysicalDeviceSurfaceSupportKHR\0"
+    "vkGetPhysicalDeviceSurfaceCapabilitiesKHR\0"
+    "vkGetPhysicalDeviceSurfaceFormatsKHR\0"
+    "vkGetPhysicalDeviceSurfacePresentModesKHR\0"
+    "vkCreateSwapchainKHR\0"
+    "vkDestroySwapchainKHR\0"
+    "vkGetSwapchainImagesKHR\0"
+    "vkAcquireNextImageKHR\0"
+    "vkQueuePresentKHR\0"
+    "vkGetDeviceGroupPresentCapabilitiesKHR\0"
+    "vkGetDeviceGroupSurfacePresentModesKHR\0"
+    "vkGetPhysicalDevicePresentRectanglesKHR\0"
+    "vkAcquireNextImage2KHR\0"
+    "vkGetPhysicalDeviceDisplayPropertiesKHR\0"
+    "vkGetPhysicalDeviceDisplayPlanePropertiesKHR\0"
+    "vkGetDisplayPlaneSupportedDisplaysKHR\0"
+    "vkGetDisplayModePropertiesKHR\0"
+    "vkCreateDisplayModeKHR\0"
+    "vkGetDisplayPlaneCapabilitiesKHR\0"
+    "vkCreateDisplayPlaneSurfaceKHR\0"
+    "vkCreateSharedSwapchainsKHR\0"
+    "vkCreateXlibSurfaceKHR\0"
+    "vkGetPhysicalDeviceXlibPresentationSupportKHR\0"
+    "vkCreateXcbSurfaceKHR\0"
+    "vkGetPhysicalDeviceXcbPresentationSupportKHR\0"
+    "vkCreateWaylandSurfaceKHR\0"
+    "vkGetPhysicalDeviceWaylandPresentationSupportKHR\0"
+    "vkCreateAndroidSurfaceKHR\0"
+    "vkCreateWin32SurfaceKHR\0"
+    "vkGetPhysicalDeviceWin32PresentationSupportKHR\0"
+    "vkGetPhysicalDeviceVideoCapabilitiesKHR\0"
+    "vkGetPhysicalDeviceVideoFormatPropertiesKHR\0"
+    "vkCreateVideoSessionKHR\0"
+    "vkDestroyVideoSessionKHR\0"
+    "vkGetVideoSessionMemoryRequirementsKHR\0"
+    "vkBindVideoSessionMemoryKHR\0"
+    "vkCreateVideoSessionParametersKHR\0"
+    "vkUpdateVideoSessionParametersKHR\0"
+    "vkDestroyVideoSessionParametersKHR\0"
+    "vkCmdBeginVideoCodingKHR\0"
+    "vkCmdEndVideoCodingKHR\0"
+    "vkCmdControlVideoCodingKHR\0"
+    "vkCmdDecodeVideoKHR\0"
+    "vkCmdBeginRenderingKHR\0"
+    "vkCmdEndRenderingKHR\0"
+    "vkGetPhysicalDeviceFeatures2KHR\0"
+    "vkGetPhysicalDeviceProperties2KHR\0"
+    "vkGetPhysicalDeviceFormatProperties2KHR\0"
+    "vkGetPhysicalDeviceImageFormatProperties2KHR\0"
+    "vkGetPhysicalDeviceQueueFamilyProperties2KHR\0"
+    "vkGetPhysicalDeviceMemoryProperties2KHR\0"
+    "vkGetPhysicalDeviceSparseImageFormatProperties2KHR\0"
+    "vkGetDeviceGroupPeerMemoryFeaturesKHR\0"
+    "vkCmdSetDeviceMaskKHR\0"
+    "vkCmdDispatchBaseKHR\0"
+    "vkTrimCommandPoolKHR\0"
+    "vkEnumeratePhysicalDeviceGroupsKHR\0"
+    "vkGetPhysicalDeviceExternalBufferPropertiesKHR\0"
+    "vkGetMemoryWin32HandleKHR\0"
+    "vkGetMemoryWin32HandlePropertiesKHR\0"
+    "vkGetMemoryFdKHR\0"
+    "vkGetMemoryFdPropertiesKHR\0"
+    "vkGetPhysicalDeviceExternalSemaphorePropertiesKHR\0"
+    "vkImportSemaphoreWin32HandleKHR\0"
+    "vkGetSemaphoreWin32HandleKHR\0"
+    "vkImportSemaphoreFdKHR\0"
+    "vkGetSemaphoreFdKHR\0"
+    "vkCmdPushDescriptorSetKHR\0"
+    "vkCmdPushDescriptorSetWithTemplateKHR\0"
+    "vkCreateDescriptorUpdateTemplateKHR\0"
+    "vkDestroyDescriptorUpdateTemplateKHR\0"
+    "vkUpdateDescriptorSetWithTemplateKHR\0"
+    "vkCreateRenderPass2KHR\0"
+    "vkCmdBeginRenderPass2KHR\0"
+    "vkCmdNextSubpass2KHR\0"
+    "vkCmdEndRenderPass2KHR\0"
+    "vkGetSwapchainStatusKHR\0"
+    "vkGetPhysicalDeviceExternalFencePropertiesKHR\0"
+    "vkImportFenceWin32HandleKHR\0"
+    "vkGetFenceWin32HandleKHR\0"
+    "vkImportFenceFdKHR\0"
+    "vkGetFenceFdKHR\0"
+    "vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR\0"
+    "vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR\0"
+    "vkAcquireProfilingLockKHR\0"
+    "vkReleaseProfilingLockKHR\0"
+    "vkGetPhysicalDeviceSurfaceCapabilities2KHR\0"
+    "vkGetPhysicalDeviceSurfaceFormats2KHR\0"
+    "vkGetPhysicalDeviceDisplayProperties2KHR\0"
+    "vkGetPhysicalDeviceDisplayPlaneProperties2KHR\0"
+    "vkGetDisplayModeProperties2KHR\0"
+    "vkGetDisplayPlaneCapabilities2KHR\0"
+    "vkGetImageMemoryRequirements2KHR\0"
+    "vkGetBufferMemoryRequirements2KHR\0"
+    "vkGetImageSparseMemoryRequirements2KHR\0"
+    "vkCreateSamplerYcbcrConversionKHR\0"
+    "vkDestroySamplerYcbcrConversionKHR\0"
+    "vkBindBufferMemory2KHR\0"
+    "vkBindImageMemory2KHR\0"
+    "vkGetDescriptorSetLayoutSupportKHR\0"
+    "vkCmdDrawIndirectCountKHR\0"
+    "vkCmdDrawIndexedIndirectCountKHR\0"
+    "vkGetSemaphoreCounterValueKHR\0"
+    "vkWaitSemaphoresKHR\0"
+    "vkSignalSemaphoreKHR\0"
+    "vkGetPhysicalDeviceFragmentShadingRatesKHR\0"
+    "vkCmdSetFragmentShadingRateKHR\0"
+    "vkCmdSetRenderingAttachmentLocationsKHR\0"
+    "vkCmdSetRenderingInputAttachmentIndicesKHR\0"
+    "vkWaitForPresentKHR\0"
+    "vkGetBufferDeviceAddressKHR\0"
+    "vkGetBufferOpaqueCaptureAddressKHR\0"
+    "vkGetDeviceMemoryOpaqueCaptureAddressKHR\0"
+    "vkCreateDeferredOperationKHR\0"
+    "vkDestroyDeferredOperationKHR\0"
+    "vkGetDeferredOperationMaxConcurrencyKHR\0"
+    "vkGetDeferredOperationResultKHR\0"
+    "vkDeferredOperationJoinKHR\0"
+    "vkGetPipelineExecutablePropertiesKHR\0"
+    "vkGetPipelineExecutableStatisticsKHR\0"
+    "vkGetPipelineExecutableInternalRepresentationsKHR\0"
+    "vkMapMemory2KHR\0"
+    "vkUnmapMemory2KHR\0"
+    "vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR\0"
+    "vkGetEncodedVideoSessionParametersKHR\0"
+    "vkCmdEncodeVideoKHR\0"
+    "vkCmdSetEvent2KHR\0"
+    "vkCmdResetEvent2KHR\0"
+    "vkCmdWaitEvents2KHR\0"
+    "vkCmdPipelineBarrier2KHR\0"
+    "vkCmdWriteTimestamp2KHR\0"
+    "vkQueueSubmit2KHR\0"
+    "vkCmdCopyBuffer2KHR\0"
+    "vkCmdCopyImage2KHR\0"
+    "vkCmdCopyBufferToImage2KHR\0"
+    "vkCmdCopyImageToBuffer2KHR\0"
+    "vkCmdBlitImage2KHR\0"
+    "vkCmdResolveImage2KHR\0"
+    "vkCmdTraceRaysIndirect2KHR\0"
+    "vkGetDeviceBufferMemoryRequirementsKHR\0"
+    "vkGetDeviceImageMemoryRequirementsKHR\0"
+    "vkGetDeviceImageSparseMemoryRequirementsKHR\0"
+    "vkCmdBindIndexBuffer2KHR\0"
+    "vkGetRenderingAreaGranularityKHR\0"
+    "vkGetDeviceImageSubresourceLayoutKHR\0"
+    "vkGetImageSubresourceLayout2KHR\0"
+    "vkCreatePipelineBinariesKHR\0"
+    "vkDestroyPipelineBinaryKHR\0"
+    "vkGetPipelineKeyKHR\0"
+    "vkGetPipelineBinaryDataKHR\0"
+    "vkReleaseCapturedPipelineDataKHR\0"
+    "vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR\0"
+    "vkCmdSetLineStippleKHR\0"
+    "vkGetPhysicalDeviceCalibrateableTimeDomainsKHR\0"
+    "vkGetCalibratedTimestampsKHR\0"
+    "vkCmdBindDescriptorSets2KHR\0"
+    "vkCmdPushConstants2KHR\0"
+    "vkCmdPushDescriptorSet2KHR\0"
+    "vkCmdPushDescriptorSetWithTemplate2KHR\0"
+    "vkCmdSetDescriptorBufferOffsets2EXT\0"
+    "vkCmdBindDescriptorBufferEmbeddedSamplers2EXT\0"
+    "vkCreateDebugReportCallbackEXT\0"
+    "vkDestroyDebugReportCallbackEXT\0"
+    "vkDebugReportMessageEXT\0"
+    "vkDebugMarkerSetObjectTagEXT\0"
+    "vkDebugMarkerSetObjectNameEXT\0"
+    "vkCmdDebugMarkerBeginEXT\0"
+    "vkCmdDebugMarkerEndEXT\0"
+    "vkCmdDebugMarkerInsertEXT\0"
+    "vkCmdBindTransformFeedbackBuffersEXT\0"
+    "vkCmdBeginTransformFeedbackEXT\0"
+    "vkCmdEndTransformFeedbackEXT\0"
+    "vkCmdBeginQueryIndexedEXT\0"
+    "vkCmdEndQueryIndexedEXT\0"
+    "vkCmdDrawIndirectByteCountEXT\0"
+    "vkCreateCuModuleNVX\0"
+    "vkCreateCuFunctionNVX\0"
+    "vkDestroyCuModuleNVX\0"
+    "vkDestroyCuFunctionNVX\0"
+    "vkCmdCuLaunchKernelNVX\0"
+    "vkGetImageViewHandleNVX\0"
+    "vkGetImageViewHandle64NVX\0"
+    "vkGetImageViewAddressNVX\0"
+    "vkCmdDrawIndirectCountAMD\0"
+    "vkCmdDrawIndexedIndirectCountAMD\0"
+    "vkGetShaderInfoAMD\0"
+    "vkCreateStreamDescriptorSurfaceGGP\0"
+    "vkGetPhysicalDeviceExternalImageFormatPropertiesNV\0"
+    "vkGetMemoryWin32HandleNV\0"
+    "vkCreateViSurfaceNN\0"
+    "vkCmdBeginConditionalRenderingEXT\0"
+    "vkCmdEndConditionalRenderingEXT\0"
+    "vkCmdSetViewportWScalingNV\0"
+    "vkReleaseDisplayEXT\0"
+    "vkAcquireXlibDisplayEXT\0"
+    "vkGetRandROutputDisplayEXT\0"
+    "vkGetPhysicalDeviceSurfaceCapabilities2EXT\0"
+    "vkDisplayPowerControlEXT\0"
+    "vkRegisterDeviceEventEXT\0"
+    "vkRegisterDisplayEventEXT\0"
+    "vkGetSwapchainCounterEXT\0"
+    "vkGetRefreshCycleDurationGOOGLE\0"
+    "vkGetPastPresentationTimingGOOGLE\0"
+    "vkCmdSetDiscardRectangleEXT\0"
+    "vkCmdSetDiscardRectangleEnableEXT\0"
+    "vkCmdSetDiscardRectangleModeEXT\0"
+    "vkSetHdrMetadataEXT\0"
+    "vkCreateIOSSurfaceMVK\0"
+    "vkCreateMacOSSurfaceMVK\0"
+    "vkSetDebugUtilsObjectNameEXT\0"
+    "vkSetDebugUtilsObjectTagEXT\0"
+    "vkQueueBeginDebugUtilsLabelEXT\0"
+    "vkQueueEndDebugUtilsLabelEXT\0"
+    "vkQueueInsertDebugUtilsLabelEXT\0"
+    "vkCmdBeginDebugUtilsLabelEXT\0"
+    "vkCmdEndDebugUtilsLabelEXT\0"
+    "vkCmdInsertDebugUtilsLabelEXT\0"
+    "vkCreateDebugUtilsMessengerEXT\0"
+    "vkDestroyDebugUtilsMessengerEXT\0"
+    "vkSubmitDebugUtilsMessageEXT\0"
+    "vkGetAndroidHardwareBufferPropertiesANDROID\0"
+    "vkGetMemoryAndroidHardwareBufferANDROID\0"
+    "vkCreateExecutionGraphPipelinesAMDX\0"
+    "vkGetExecutionGraphPipelineScratchSizeAMDX\0"
+    "vkGetExecutionGraphPipelineNodeIndexAMDX\0"
+    "vkCmdInitializeGraphScratchMemoryAMDX\0"
+    "vkCmdDispatchGraphAMDX\0"
+    "vkCmdDispatchGraphIndirectAMDX\0"
+    "vkCmdDispatchGraphIndirectCountAMDX\0"
+    "vkCmdSetSampleLocationsEXT\0"
+    "vkGetPhysicalDeviceMultisamplePropertiesEXT\0"
+    "vkGetImageDrmFormatModifierPropertiesEXT\0"
+    "vkCreateValidationCacheEXT\0"
+    "vkDestroyValidationCacheEXT\0"
+    "vkMergeValidationCachesEXT\0"
+    "vkGetValidationCacheDataEXT\0"
+    "vkCmdBindShadingRateImageNV\0"
+    "vkCmdSetViewportShadingRatePaletteNV\0"
+    "vkCmdSetCoarseSampleOrderNV\0"
+    "vkCreateAccelerationStructureNV\0"
+    "vkDestroyAccelerationStructureNV\0"
+    "vkGetAccelerationStructureMemoryRequirementsNV\0"
+    "vkBindAccelerationStructureMemoryNV\0"
+    "vkCmdBuildAccelerationStructureNV\0"
+    "vkCmdCopyAccelerationStructureNV\0"
+    "vkCmdTraceRaysNV\0"
+    "vkCreateRayTracingPipelinesNV\0"
+    "vkGetRayTracingShaderGroupHandlesKHR\0"
+    "vkGetRayTracingShaderGroupHandlesNV\0"
+    "vkGetAccelerationStructureHandleNV\0"
+    "vkCmdWriteAccelerationStructuresPropertiesNV\0"
+    "vkCompileDeferredNV\0"
+    "vkGetMemoryHostPointerPropertiesEXT\0"
+    "vkCmdWriteBufferMarkerAMD\0"
+    "vkCmdWriteBufferMarker2AMD\0"
+    "vkGetPhysicalDeviceCalibrateableTimeDomainsEXT\0"
+    "vkGetCalibratedTimestampsEXT\0"
+    "vkCmdDrawMeshTasksNV\0"
+    "vkCmdDrawMeshTasksIndirectNV\0"
+    "vkCmdDrawMeshTasksIndirectCountNV\0"
+    "vkCmdSetExclusiveScissorEnableNV\0"
+    "vkCmdSetExclusiveScissorNV\0"
+    "vkCmdSetCheckpointNV\0"
+    "vkGetQueueCheckpointDataNV\0"
+    "vkGetQueueCheckpointData2NV\0"
+    "vkInitializePerformanceApiINTEL\0"
+    "vkUninitializePerformanceApiINTEL\0"
+    "vkCmdSetPerformanceMarkerINTEL\0"
+    "vkCmdSetPerformanceStreamMarkerINTEL\0"
+    "vkCmdSetPerformanceOverrideINTEL\0"
+    "vkAcquirePerformanceConfigurationINTEL\0"
+    "vkReleasePerformanceConfigurationINTEL\0"
+    "vkQueueSetPerformanceConfigurationINTEL\0"
+    "vkGetPerformanceParameterINTEL\0"
+    "vkSetLocalDimmingAMD\0"
+    "vkCreateImagePipeSurfaceFUCHSIA\0"
+    "vkCreateMetalSurfaceEXT\0"
+    "vkGetBufferDeviceAddressEXT\0"
+    "vkGetPhysicalDeviceToolPropertiesEXT\0"
+    "vkGetPhysicalDeviceCooperativeMatrixPropertiesNV\0"
+    "vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV\0"
+    "vkGetPhysicalDeviceSurfacePresentModes2EXT\0"
+    "vkAcquireFullScreenExclusiveModeEXT\0"
+    "vkReleaseFullScreenExclusiveModeEXT\0"
+    "vkGetDeviceGroupSurfacePresentModes2EXT\0"
+    "vkCreateHeadlessSurfaceEXT\0"
+    "vkCmdSetLineStippleEXT\0"
+    "vkResetQueryPoolEXT\0"
+    "vkCmdSetCullModeEXT\0"
+    "vkCmdSetFrontFaceEXT\0"
+    "vkCmdSetPrimitiveTopologyEXT\0"
+    "vkCmdSetViewportWithCountEXT\0"
+    "vkCmdSetScissorWithCountEXT\0"
+    "vkCmdBindVertexBuffers2EXT\0"
+    "vkCmdSetDepthTestEnableEXT\0"
+    "vkCmdSetDepthWriteEnableEXT\0"
+    "vkCmdSetDepthCompareOpEXT\0"
+    "vkCmdSetDepthBoundsTestEnableEXT\0"
+    "vkCmdSetStencilTestEnableEXT\0"
+    "vkCmdSetStencilOpEXT\0"
+    "vkCopyMemoryToImageEXT\0"
+    "vkCopyImageToMemoryEXT\0"
+    "vkCopyImageToImageEXT\0"
+    "vkTransitionImageLayoutEXT\0"
+    "vkGetImageSubresourceLayout2EXT\0"
+    "vkReleaseSwapchainImagesEXT\0"
+    "vkGetGeneratedCommandsMemoryRequirementsNV\0"
+    "vkCmdPreprocessGeneratedCommandsNV\0"
+    "vkCmdExecuteGeneratedCommandsNV\0"
+    "vkCmdBindPipelineShaderGroupNV\0"
+    "vkCreateIndirectCommandsLayoutNV\0"
+    "vkDestroyIndirectCommandsLayoutNV\0"
+    "vkCmdSetDepthBias2EXT\0"
+    "vkAcquireDrmDisplayEXT\0"
+    "vkGetDrmDisplayEXT\0"
+    "vkCreatePrivateDataSlotEXT\0"
+    "vkDestroyPrivateDataSlotEXT\0"
+    "vkSetPrivateDataEXT\0"
+    "vkGetPrivateDataEXT\0"
+    "vkCreateCudaModuleNV\0"
+    "vkGetCudaModuleCacheNV\0"
+    "vkCreateCudaFunctionNV\0"
+    "vkDestroyCudaModuleNV\0"
+    "vkDestroyCudaFunctionNV\0"
+    "vkCmdCudaLaunchKernelNV\0"
+    "vkExportMetalObjectsEXT\0"
+    "vkGetDescriptorSetLayoutSizeEXT\0"
+    "vkGetDescriptorSetLayoutBindingOffsetEXT\0"
+    "vkGetDescriptorEXT\0"
+    "vkCmdBindDescriptorBuffersEXT\0"
+    "vkCmdSetDescriptorBufferOffsetsEXT\0"
+    "vkCmdBindDescriptorBufferEmbeddedSamplersEXT\0"
+    "vkGetBufferOpaqueCaptureDescriptorDataEXT\0"
+    "vkGetImageOpaqueCaptureDescriptorDataEXT\0"
+    "vkGetImageViewOpaqueCaptureDescriptorDataEXT\0"
+    "vkGetSamplerOpaqueCaptureDescriptorDataEXT\0"
+    "vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT\0"
+    "vkCmdSetFragmentShadingRateEnumNV\0"
+    "vkGetDeviceFaultInfoEXT\0"
+    "vkAcquireWinrtDisplayNV\0"
+    "vkGetWinrtDisplayNV\0"
+    "vkCreateDirectFBSurfaceEXT\0"
+    "vkGetPhysicalDeviceDirectFBPresentationSupportEXT\0"
+    "vkCmdSetVertexInputEXT\0"
+    "vkGetMemoryZirconHandleFUCHSIA\0"
+    "vkGetMemoryZirconHandlePropertiesFUCHSIA\0"
+    "vkImportSemaphoreZirconHandleFUCHSIA\0"
+    "vkGetSemaphoreZirconHandleFUCHSIA\0"
+    "vkCreateBufferCollectionFUCHSIA\0"
+    "vkSetBufferCollectionImageConstraintsFUCHSIA\0"
+    "vkSetBufferCollectionBufferConstraintsFUCHSIA\0"
+    "vkDestroyBufferCollectionFUCHSIA\0"
+    "vkGetBufferCollectionPropertiesFUCHSIA\0"
+    "vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI\0"
+    "vkCmdSubpassShadingHUAWEI\0"
+    "vkCmdBindInvocationMaskHUAWEI\0"
+    "vkGetMemoryRemoteAddressNV\0"
+    "vkGetPipelinePropertiesEXT\0"
+    "vkCmdSetPatchControlPointsEXT\0"
+    "vkCmdSetRasterizerDiscardEnableEXT\0"
+    "vkCmdSetDepthBiasEnableEXT\0"
+    "vkCmdSetLogicOpEXT\0"
+    "vkCmdSetPrimitiveRestartEnableEXT\0"
+    "vkCreateScreenSurfaceQNX\0"
+    "vkGetPhysicalDeviceScreenPresentationSupportQNX\0"
+    "vkCmdSetColorWriteEnableEXT\0"
+    "vkCmdDrawMultiEXT\0"
+    "vkCmdDrawMultiIndexedEXT\0"
+    "vkCreateMicromapEXT\0"
+    "vkDestroyMicromapEXT\0"
+    "vkCmdBuildMicromapsEXT\0"
+    "vkBuildMicromapsEXT\0"
+    "vkCopyMicromapEXT\0"
+    "vkCopyMicromapToMemoryEXT\0"
+    "vkCopyMemoryToMicromapEXT\0"
+    "vkWriteMicromapsPropertiesEXT\0"
+    "vkCmdCopyMicromapEXT\0"
+    "vkCmdCopyMicromapToMemoryEXT\0"
+    "vkCmdCopyMemoryToMicromapEXT\0"
+    "vkCmdWriteMicromapsPropertiesEXT\0"
+    "vkGetDeviceMicromapCompatibilityEXT\0"
+    "vkGetMicromapBuildSizesEXT\0"
+    "vkCmdDrawClusterHUAWEI\0"
+    "vkCmdDrawClusterIndirectHUAWEI\0"
+    "vkSetDeviceMemoryPriorityEXT\0"
+    "vkGetDescriptorSetLayoutHostMappingInfoVALVE\0"
+    "vkGetDescriptorSetHostMappingVALVE\0"
+    "vkCmdCopyMemoryIndirectNV\0"
+    "vkCmdCopyMemoryToImageIndirectNV\0"
+    "vkCmdDecompressMemoryNV\0"
+    "vkCmdDecompressMemoryIndirectCountNV\0"
+    "vkGetPipelineIndirectMemoryRequirementsNV\0"
+    "vkCmdUpdatePipelineIndirectBufferNV\0"
+    "vkGetPipelineIndirectDeviceAddressNV\0"
+    "vkCmdSetDepthClampEnableEXT\0"
+    "vkCmdSetPolygonModeEXT\0"
+    "vkCmdSetRasterizationSamplesEXT\0"
+    "vkCmdSetSampleMaskEXT\0"
+    "vkCmdSetAlphaToCoverageEnableEXT\0"
+    "vkCmdSetAlphaToOneEnableEXT\0"
+    "vkCmdSetLogicOpEnableEXT\0"
+    "vkCmdSetColorBlendEnableEXT\0"
+    "vkCmdSetColorBlendEquationEXT\0"
+    "vkCmdSetColorWriteMaskEXT\0"
+    "vkCmdSetTessellationDomainOriginEXT\0"
+    "vkCmdSetRasterizationStreamEXT\0"
+    "vkCmdSetConservativeRasterizationModeEXT\0"
+    "vkCmdSetExtraPrimitiveOverestimationSizeEXT\0"
+    "vkCmdSetDepthClipEnableEXT\0"
+    "vkCmdSetSampleLocationsEnableEXT\0"
+    "vkCmdSetColorBlendAdvancedEXT\0"
+    "vkCmdSetProvokingVertexModeEXT\0"
+    "vkCmdSetLineRasterizationModeEXT\0"
+    "vkCmdSetLineStippleEnableEXT\0"
+    "vkCmdSetDepthClipNegativeOneToOneEXT\0"
+    "vkCmdSetViewportWScalingEnableNV\0"
+    "vkCmdSetViewportSwizzleNV\0"
+    "vkCmdSetCoverageToColorEnableNV\0"
+    "vkCmdSetCoverageToColorLocationNV\0"
+    "vkCmdSetCoverageModulationModeNV\0"
+    "vkCmdSetCoverageModulationTableEnableNV\0"
+    "vkCmdSetCoverageModulationTableNV\0"
+    "vkCmdSetShadingRateImageEnableNV\0"
+    "vkCmdSetRepresentativeFragmentTestEnableNV\0"
+    "vkCmdSetCoverageReductionModeNV\0"
+    "vkGetShaderModuleIdentifierEXT\0"
+    "vkGetShaderModuleCreateInfoIdentifierEXT\0"
+    "vkGetPhysicalDeviceOpticalFlowImageFormatsNV\0"
+    "vkCreateOpticalFlowSessionNV\0"
+    "vkDestroyOpticalFlowSessionNV\0"
+    "vkBindOpticalFlowSessionImageNV\0"
+    "vkCmdOpticalFlowExecuteNV\0"
+    "vkAntiLagUpdateAMD\0"
+    "vkCreateShadersEXT\0"
+    "vkDestroyShaderEXT\0"
+    "vkGetShaderBinaryDataEXT\0"
+    "vkCmdBindShadersEXT\0"
+    "vkCmdSetDepthClampRangeEXT\0"
+    "vkGetFramebufferTilePropertiesQCOM\0"
+    "vkGetDynamicRenderingTilePropertiesQCOM\0"
+    "vkSetLatencySleepModeNV\0"
+    "vkLatencySleepNV\0"
+    "vkSetLatencyMarkerNV\0"
+    "vkGetLatencyTimingsNV\0"
+    "vkQueueNotifyOutOfBandNV\0"
+    "vkCmdSetAttachmentFeedbackLoopEnableEXT\0"
+    "vkGetScreenBufferPropertiesQNX\0"
+    "vkGetGeneratedCommandsMemoryRequirementsEXT\0"
+    "vkCmdPreprocessGeneratedCommandsEXT\0"
+    "vkCmdExecuteGeneratedCommandsEXT\0"
+    "vkCreateIndirectCommandsLayoutEXT\0"
+    "vkDestroyIndirectCommandsLayoutEXT\0"
+    "vkCreateIndirectExecutionSetEXT\0"
+    "vkDestroyIndirectExecutionSetEXT\0"
+    "vkUpdateIndirectExecutionSetPipelineEXT\0"
+    "vkUpdateIndirectExecutionSetShaderEXT\0"
+    "vkGetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV\0"
+    "vkCreateAccelerationStructureKHR\0"
+    "vkDestroyAccelerationStructureKHR\0"
+    "vkCmdBuildAccelerationStructuresKHR\0"
+    "vkCmdBuildAccelerationStructuresIndirectKHR\0"
+    "vkBuildAccelerationStructuresKHR\0"
+    "vkCopyAccelerationStructureKHR\0"
+    "vkCopyAccelerationStructureToMemoryKHR\0"
+    "vkCopyMemoryToAccelerationStructureKHR\0"
+    "vkWriteAccelerationStructuresPropertiesKHR\0"
+    "vkCmdCopyAccelerationStructureKHR\0"
+    "vkCmdCopyAccelerationStructureToMemoryKHR\0"
+    "vkCmdCopyMemoryToAccelerationStructureKHR\0"
+    "vkGetAccelerationStructureDeviceAddressKHR\0"
+    "vkCmdWriteAccelerationStructuresPropertiesKHR\0"
+    "vkGetDeviceAccelerationStructureCompatibilityKHR\0"
+    "vkGetAccelerationStructureBuildSizesKHR\0"
+    "vkCmdTraceRaysKHR\0"
+    "vkCreateRayTracingPipelinesKHR\0"
+    "vkGetRayTracingCaptureReplayShaderGroupHandlesKHR\0"
+    "vkCmdTraceRaysIndirectKHR\0"
+    "vkGetRayTracingShaderGroupStackSizeKHR\0"
+    "vkCmdSetRayTracingPipelineStackSizeKHR\0"
+    "vkCmdDrawMeshTasksEXT\0"
+    "vkCmdDrawMeshTasksIndirectEXT\0"
+    "vkCmdDrawMeshTasksIndirectCountEXT\0"
+    "VK_VERSION_1_0\0"
+    "VK_VERSION_1_1\0"
+    "VK_VERSION_1_2\0"
+    "VK_VERSION_1_3\0"
+    "VK_VERSION_1_4\0"
+    "VK_KHR_surface\0"
+    "VK_KHR_swapchain\0"
+    "VK_KHR_display\0"
+    "VK_KHR_display_swapchain\0"
+    "VK_KHR_xlib_surface\0"
+    "VK_KHR_xcb_surface\0"
+    "VK_KHR_wayland_surface\0"
+    "VK_KHR_win32_surface\0"
+    "VK_KHR_sampler_mirror_clamp_to_edge\0"
+    "VK_KHR_video_queue\0"
+    "VK_KHR_video_decode_queue\0"
+    "VK_KHR_video_encode_h264\0"
+    "VK_KHR_video_encode_h265\0"
+    "VK_KHR_video_decode_h264\0"
+    "VK_KHR_dynamic_rendering\0"
+    "VK_KHR_multiview\0"
+    "VK_KHR_get_physical_device_properties2\0"
+    "VK_KHR_device_group\0"
+    "VK_KHR_shader_draw_parameters\0"
+    "VK_KHR_maintenance1\0"
+    "VK_KHR_device_group_creation\0"
+    "VK_KHR_external_memory_capabilities\0"
+    "VK_KHR_external_memory\0"
+    "VK_KHR_external_memory_win32\0"
+    "VK_KHR_external_memory_fd\0"
+    "VK_KHR_win32_keyed_mutex\0"
+    "VK_KHR_external_semaphore_capabilities\0"
+    "VK_KHR_external_semaphore\0"
+    "VK_KHR_external_semaphore_win32\0"
+    "VK_KHR_external_semaphore_fd\0"
+    "VK_KHR_push_descriptor\0"
+    "VK_KHR_shader_float16_int8\0"
+    "VK_KHR_16bit_storage\0"
+    "VK_KHR_incremental_present\0"
+    "VK_KHR_descriptor_update_template\0"
+    "VK_KHR_imageless_framebuffer\0"
+    "VK_KHR_create_renderpass2\0"
+    "VK_KHR_shared_presentable_image\0"
+    "VK_KHR_external_fence_capabilities\0"
+    "VK_KHR_external_fence\0"
+    "VK_KHR_external_fence_win32\0"
+    "VK_KHR_external_fence_fd\0"
+    "VK_KHR_performance_query\0"
+    "VK_KHR_maintenance2\0"
+    "VK_KHR_get_surface_capabilities2\0"
+    "VK_KHR_variable_pointers\0"
+    "VK_KHR_get_display_properties2\0"
+    "VK_KHR_dedicated_allocation\0"
+    "VK_KHR_storage_buffer_storage_class\0"
+    "VK_KHR_shader_bfloat16\0"
+    "VK_KHR_relaxed_block_layout\0"
+    "VK_KHR_get_memory_requirements2\0"
+    "VK_KHR_image_format_list\0"
+    "VK_KHR_sampler_ycbcr_conversion\0"
+    "VK_KHR_bind_memory2\0"
+    "VK_KHR_portability_subset\0"
+    "VK_KHR_maintenance3\0"
+    "VK_KHR_draw_indirect_count\0"
+    "VK_KHR_shader_subgroup_extended_types\0"
+    "VK_KHR_8bit_storage\0"
+    "VK_KHR_shader_atomic_int64\0"
+    "VK_KHR_shader_clock\0"
+    "VK_KHR_video_decode_h265\0"
+    "VK_KHR_global_priority\0"
+    "VK_KHR_driver_properties\0"
+    "VK_KHR_shader_float_controls\0"
+    "VK_KHR_depth_stencil_resolve\0"
+    "VK_KHR_swapchain_mutable_format\0"
+    "VK_KHR_timeline_semaphore\0"
+    "VK_KHR_vulkan_memory_model\0"
+    "VK_KHR_shader_terminate_invocation\0"
+    "VK_KHR_fragment_shading_rate\0"
+    "VK_KHR_dynamic_rendering_local_read\0"
+    "VK_KHR_shader_quad_control\0"
+    "VK_KHR_spirv_1_4\0"
+    "VK_KHR_surface_protected_capabilities\0"
+    "VK_KHR_separate_depth_stencil_layouts\0"
+    "VK_KHR_present_wait\0"
+    "VK_KHR_uniform_buffer_standard_layout\0"
+    "VK_KHR_buffer_device_address\0"
+    "VK_KHR_deferred_host_operations\0"
+    "VK_KHR_pipeline_executable_properties\0"
+    "VK_KHR_map_memory2\0"
+    "VK_KHR_shader_integer_dot_product\0"
+    "VK_KHR_pipeline_library\0"
+    "VK_KHR_shader_non_semantic_info\0"
+    "VK_KHR_present_id\0"
+    "VK_KHR_video_encode_queue\0"
+    "VK_KHR_synchronization2\0"
+    "VK_KHR_fragment_shader_barycentric\0"
+    "VK_KHR_shader_subgroup_uniform_control_flow\0"
+    "VK_KHR_zero_initialize_workgroup_memory\0"
+    "VK_KHR_workgroup_memory_explicit_layout\0"
+    "VK_KHR_copy_commands2\0"
+    "VK_KHR_format_feature_flags2\0"
+    "VK_KHR_ray_tracing_maintenance1\0"
+    "VK_KHR_portability_enumeration\0"
+    "VK_KHR_maintenance4\0"
+    "VK_KHR_shader_subgroup_rotate\0"
+    "VK_KHR_shader_maximal_reconvergence\0"
+    "VK_KHR_maintenance5\0"
+    "VK_KHR_present_id2\0"
+    "VK_KHR_ray_tracing_position_fetch\0"
+    "VK_KHR_pipeline_binary\0"
+    "VK_KHR_cooperative_matrix\0"
+    "VK_KHR_compute_shader_derivatives\0"
+    "VK_KHR_video_decode_av1\0"
+    "VK_KHR_video_encode_av1\0"
+    "VK_KHR_video_decode_vp9\0"
+    "VK_KHR_video_maintenance1\0"
+    "VK_KHR_vertex_attribute_divisor\0"
+    "VK_KHR_load_store_op_none\0"
+    "VK_KHR_unified_image_layouts\0"
+    "VK_KHR_shader_float_controls2\0"
+    "VK_KHR_index_type_uint8\0"
+    "VK_KHR_line_rasterization\0"
+    "VK_KHR_calibrated_timestamps\0"
+    "VK_KHR_shader_expect_assume\0"
+    "VK_KHR_maintenance6\0"
+    "VK_KHR_video_encode_quantization_map\0"
+    "VK_KHR_shader_relaxed_extended_instruction\0"
+    "VK_KHR_maintenance7\0"
+    "VK_KHR_maintenance8\0"
+    "VK_KHR_maintenance9\0"
+    "VK_KHR_video_maintenance2\0"
+    "VK_KHR_depth_clamp_zero_one\0"
+    "VK_KHR_robustness2\0"
+    "VK_EXT_debug_report\0"
+    "VK_NV_glsl_shader\0"
+    "VK_EXT_depth_range_unrestricted\0"
+    "VK_IMG_filter_cubic\0"
+    "VK_AMD_rasterization_order\0"
+    "VK_AMD_shader_trinary_minmax\0"
+    "VK_AMD_shader_explicit_vertex_parameter\0"
+    "VK_EXT_debug_marker\0"
+    "VK_AMD_gcn_shader\0"
+    "VK_NV_dedicated_allocation\0"
+    "VK_EXT_transform_feedback\0"
+    "VK_NVX_binary_import\0"
+    "VK_NVX_image_view_handle\0"
+    "VK_AMD_draw_indirect_count\0"
+    "VK_AMD_negative_viewport_height\0"
+    "VK_AMD_gpu_shader_half_float\0"
+    "VK_AMD_shader_ballot\0"
+    "VK_AMD_texture_gather_bias_lod\0"
+    "VK_AMD_shader_info\0"
+    "VK_AMD_shader_image_load_store_lod\0"
+    "VK_GGP_stream_descriptor_surface\0"
+    "VK_NV_corner_sampled_image\0"
+    "VK_IMG_format_pvrtc\0"
+    "VK_NV_external_memory_capabilities\0"
+    "VK_NV_external_memory\0"
+    "VK_NV_external_memory_win32\0"
+    "VK_NV_win32_keyed_mutex\0"
+    "VK_EXT_validation_flags\0"
+    "VK_NN_vi_surface\0"
+    "VK_EXT_shader_subgroup_ballot\0"
+    "VK_EXT_shader_subgroup_vote\0"
+    "VK_EXT_texture_compression_astc_hdr\0"
+    "VK_EXT_astc_decode_mode\0"
+    "VK_EXT_pipeline_robustness\0"
+    "VK_EXT_conditional_rendering\0"
+    "VK_NV_clip_space_w_scaling\0"
+    "VK_EXT_direct_mode_display\0"
+    "VK_EXT_acquire_xlib_display\0"
+    "VK_EXT_display_surface_counter\0"
+    "VK_EXT_display_control\0"
+    "VK_GOOGLE_display_timing\0"
+    "VK_NV_sample_mask_override_coverage\0"
+    "VK_NV_geometry_shader_passthrough\0"
+    "VK_NV_viewport_array2\0"
+    "VK_NVX_multiview_per_view_attributes\0"
+    "VK_NV_viewport_swizzle\0"
+    "VK_EXT_discard_rectangles\0"
+    "VK_EXT_conservative_rasterization\0"
+    "VK_EXT_depth_clip_enable\0"
+    "VK_EXT_swapchain_colorspace\0"
+    "VK_EXT_hdr_metadata\0"
+    "VK_IMG_relaxed_line_rasterization\0"
+    "VK_MVK_ios_surface\0"
+    "VK_MVK_macos_surface\0"
+    "VK_EXT_external_memory_dma_buf\0"
+    "VK_EXT_queue_family_foreign\0"
+    "VK_EXT_debug_utils\0"
+    "VK_EXT_sampler_filter_minmax\0"
+    "VK_AMD_gpu_shader_int16\0"
+    "VK_AMDX_shader_enqueue\0"
+    "VK_AMD_mixed_attachment_samples\0"
+    "VK_AMD_shader_fragment_mask\0"
+    "VK_EXT_inline_uniform_block\0"
+    "VK_EXT_shader_stencil_export\0"
+    "VK_EXT_sample_locations\0"
+    "VK_EXT_blend_operation_advanced\0"
+    "VK_NV_fragment_coverage_to_color\0"
+    "VK_NV_framebuffer_mixed_samples\0"
+    "VK_NV_fill_rectangle\0"
+    "VK_NV_shader_sm_builtins\0"
+    "VK_EXT_post_depth_coverage\0"
+    "VK_EXT_image_drm_format_modifier\0"
+    "VK_EXT_validation_cache\0"
+    "VK_EXT_descriptor_indexing\0"
+    "VK_EXT_shader_viewport_index_layer\0"
+    "VK_NV_shading_rate_image\0"
+    "VK_NV_ray_tracing\0"
+    "VK_NV_representative_fragment_test\0"
+    "VK_EXT_filter_cubic\0"
+    "VK_QCOM_render_pass_shader_resolve\0"
+    "VK_EXT_global_priority\0"
+    "VK_EXT_external_memory_host\0"
+    "VK_AMD_buffer_marker\0"
+    "VK_AMD_pipeline_compiler_control\0"
+    "VK_EXT_calibrated_timestamps\0"
+    "VK_AMD_shader_core_properties\0"
+    "VK_AMD_memory_overallocation_behavior\0"
+    "VK_EXT_vertex_attribute_divisor\0"
+    "VK_GGP_frame_token\0"
+    "VK_EXT_pipeline_creation_feedback\0"
+    "VK_NV_shader_subgroup_partitioned\0"
+    "VK_NV_compute_shader_derivatives\0"
+    "VK_NV_mesh_shader\0"
+    "VK_NV_fragment_shader_barycentric\0"
+    "VK_NV_shader_image_footprint\0"
+    "VK_NV_scissor_exclusive\0"
+    "VK_NV_device_diagnostic_checkpoints\0"
+    "VK_INTEL_shader_integer_functions2\0"
+    "VK_INTEL_performance_query\0"
+    "VK_EXT_pci_bus_info\0"
+    "VK_AMD_display_native_hdr\0"
+    "VK_FUCHSIA_imagepipe_surface\0"
+    "VK_EXT_metal_surface\0"
+    "VK_EXT_fragment_density_map\0"
+    "VK_EXT_scalar_block_layout\0"
+    "VK_GOOGLE_hlsl_functionality1\0"
+    "VK_GOOGLE_decorate_string\0"
+    "VK_EXT_subgroup_size_control\0"
+    "VK_AMD_shader_core_properties2\0"
+    "VK_AMD_device_coherent_memory\0"
+    "VK_EXT_shader_image_atomic_int64\0"
+    "VK_EXT_memory_budget\0"
+    "VK_EXT_memory_priority\0"
+    "VK_NV_dedicated_allocation_image_aliasing\0"
+    "VK_EXT_buffer_device_address\0"
+    "VK_EXT_tooling_info\0"
+    "VK_EXT_separate_stencil_usage\0"
+    "VK_EXT_validation_features\0"
+    "VK_NV_cooperative_matrix\0"
+    "VK_NV_coverage_reduction_mode\0"
+    "VK_EXT_fragment_shader_interlock\0"
+    "VK_EXT_ycbcr_image_arrays\0"
+    "VK_EXT_provoking_vertex\0"
+    "VK_EXT_full_screen_exclusive\0"
+    "VK_EXT_headless_surface\0"
+    "VK_EXT_line_rasterization\0"
+    "VK_EXT_shader_atomic_float\0"
+    "VK_EXT_host_query_reset\0"
+    "VK_EXT_index_type_uint8\0"
+    "VK_EXT_extended_dynamic_state\0"
+    "VK_EXT_host_image_copy\0"
+    "VK_EXT_map_memory_placed\0"
+    "VK_EXT_shader_atomic_float2\0"
+    "VK_EXT_surface_maintenance1\0"
+    "VK_EXT_swapchain_maintenance1\0"
+    "VK_EXT_shader_demote_to_helper_invocation\0"
+    "VK_NV_device_generated_commands\0"
+    "VK_NV_inherited_viewport_scissor\0"
+    "VK_EXT_texel_buffer_alignment\0"
+    "VK_QCOM_render_pass_transform\0"
+    "VK_EXT_depth_bias_control\0"
+    "VK_EXT_device_memory_report\0"
+    "VK_EXT_acquire_drm_display\0"
+    "VK_EXT_robustness2\0"
+    "VK_EXT_custom_border_color\0"
+    "VK_GOOGLE_user_type\0"
+    "VK_NV_present_barrier\0"
+    "VK_EXT_private_data\0"
+    "VK_EXT_pipeline_creation_cache_control\0"
+    "VK_NV_device_diagnostics_config\0"
+    "VK_QCOM_render_pass_store_ops\0"
+    "VK_NV_cuda_kernel_launch\0"
+    "VK_NV_low_latency\0"
+    "VK_EXT_metal_objects\0"
+    "VK_EXT_descriptor_buffer\0"
+    "VK_EXT_graphics_pipeline_library\0"
+    "VK_AMD_shader_early_and_late_fragment_tests\0"
+    "VK_NV_fragment_shading_rate_enums\0"
+    "VK_NV_ray_tracing_motion_blur\0"
+    "VK_EXT_ycbcr_2plane_444_formats\0"
+    "VK_EXT_fragment_density_map2\0"
+    "VK_QCOM_rotated_copy_commands\0"
+    "VK_EXT_image_robustness\0"
+    "VK_EXT_image_compression_control\0"
+    "VK_EXT_attachment_feedback_loop_layout\0"
+    "VK_EXT_4444_formats\0"
+    "VK_EXT_device_fault\0"
+    "VK_ARM_rasterization_order_attachment_access\0"
+    "VK_EXT_rgba10x6_formats\0"
+    "VK_NV_acquire_winrt_display\0"
+    "VK_EXT_directfb_surface\0"
+    "VK_VALVE_mutable_descriptor_type\0"
+    "VK_EXT_vertex_input_dynamic_state\0"
+    "VK_EXT_physical_device_drm\0"
+    "VK_EXT_device_address_binding_report\0"
+    "VK_EXT_depth_clip_control\0"
+    "VK_EXT_primitive_topology_list_restart\0"
+    "VK_EXT_present_mode_fifo_latest_ready\0"
+    "VK_FUCHSIA_external_memory\0"
+    "VK_FUCHSIA_external_semaphore\0"
+    "VK_FUCHSIA_buffer_collection\0"
+    "VK_HUAWEI_subpass_shading\0"
+    "VK_HUAWEI_invocation_mask\0"
+    "VK_NV_external_memory_rdma\0"
+    "VK_EXT_pipeline_properties\0"
+    "VK_EXT_frame_boundary\0"
+    "VK_EXT_multisampled_render_to_single_sampled\0"
+    "VK_EXT_extended_dynamic_state2\0"
+    "VK_QNX_screen_surface\0"
+    "VK_EXT_color_write_enable\0"
+    "VK_EXT_primitives_generated_query\0"
+    "VK_EXT_global_priority_query\0"
+    "VK_EXT_image_view_min_lod\0"
+    "VK_EXT_multi_draw\0"
+    "VK_EXT_image_2d_view_of_3d\0"
+    "VK_EXT_shader_tile_image\0"
+    "VK_EXT_opacity_micromap\0"
+    "VK_NV_displacement_micromap\0"
+    "VK_EXT_load_store_op_none\0"
+    "VK_HUAWEI_cluster_culling_shader\0"
+    "VK_EXT_border_color_swizzle\0"
+    "VK_EXT_pageable_device_local_memory\0"
+    "VK_ARM_shader_core_properties\0"
+    "VK_ARM_scheduling_controls\0"
+    "VK_EXT_image_sliced_view_of_3d\0"
+    "VK_VALVE_descriptor_set_host_mapping\0"
+    "VK_EXT_depth_clamp_zero_one\0"
+    "VK_EXT_non_seamless_cube_map\0"
+    "VK_ARM_render_pass_striped\0"
+    "VK_QCOM_fragment_density_map_offset\0"
+    "VK_NV_copy_memory_indirect\0"
+    "VK_NV_memory_decompression\0"
+    "VK_NV_device_generated_commands_compute\0"
+    "VK_NV_ray_tracing_linear_swept_spheres\0"
+    "VK_NV_linear_color_attachment\0"
+    "VK_GOOGLE_surfaceless_query\0"
+    "VK_EXT_image_compression_control_swapchain\0"
+    "VK_QCOM_image_processing\0"
+    "VK_EXT_nested_command_buffer\0"
+    "VK_EXT_external_memory_acquire_unmodified\0"
+    "VK_EXT_extended_dynamic_state3\0"
+    "VK_EXT_subpass_merge_feedback\0"
+    "VK_LUNARG_direct_driver_loading\0"
+    "VK_EXT_shader_module_identifier\0"
+    "VK_EXT_rasterization_order_attachment_access\0"
+    "VK_NV_optical_flow\0"
+    "VK_EXT_legacy_dithering\0"
+    "VK_EXT_pipeline_protected_access\0"
+    "VK_ANDROID_external_format_resolve\0"
+    "VK_AMD_anti_lag\0"
+    "VK_EXT_shader_object\0"
+    "VK_QCOM_tile_properties\0"
+    "VK_SEC_amigo_profiling\0"
+    "VK_QCOM_multiview_per_view_viewports\0"
+    "VK_NV_ray_tracing_invocation_reorder\0"
+    "VK_NV_extended_sparse_address_space\0"
+    "VK_EXT_mutable_descriptor_type\0"
+    "VK_EXT_legacy_vertex_attributes\0"
+    "VK_EXT_layer_settings\0"
+    "VK_ARM_shader_core_builtins\0"
+    "VK_EXT_pipeline_library_group_handles\0"
+    "VK_EXT_dynamic_rendering_unused_attachments\0"
+    "VK_NV_low_latency2\0"
+    "VK_QCOM_multiview_per_view_render_areas\0"
+    "VK_NV_per_stage_descriptor_set\0"
+    "VK_QCOM_image_processing2\0"
+    "VK_QCOM_filter_cubic_weights\0"
+    "VK_QCOM_ycbcr_degamma\0"
+    "VK_QCOM_filter_cubic_clamp\0"
+    "VK_EXT_attachment_feedback_loop_dynamic_state\0"
+    "VK_QNX_external_memory_screen_buffer\0"
+    "VK_MSFT_layered_driver\0"
+    "VK_NV_descriptor_pool_overallocation\0"
+    "VK_NV_display_stereo\0"
+    "VK_NV_raw_access_chains\0"
+    "VK_NV_command_buffer_inheritance\0"
+    "VK_NV_shader_atomic_float16_vector\0"
+    "VK_EXT_shader_replicated_composites\0"
+    "VK_EXT_shader_float8\0"
+    "VK_NV_ray_tracing_validation\0"
+    "VK_EXT_device_generated_commands\0"
+    "VK_MESA_image_alignment_control\0"
+    "VK_EXT_depth_clamp_control\0"
+    "VK_HUAWEI_hdr_vivid\0"
+    "VK_NV_cooperative_matrix2\0"
+    "VK_ARM_pipeline_opacity_micromap\0"
+    "VK_EXT_vertex_attribute_robustness\0"
+    "VK_ARM_format_pack\0"
+    "VK_VALVE_fragment_density_map_layered\0"
+    "VK_NV_present_metering\0"
+    "VK_EXT_zero_initialize_device_memory\0"
+    "VK_KHR_acceleration_structure\0"
+    "VK_KHR_ray_tracing_pipeline\0"
+    "VK_KHR_ray_query\0"
+    "VK_EXT_mesh_shader";
+
+VKAPI_ATTR bool VKAPI_CALL loader_icd_init_entries(struct loader_instance* inst, struct loader_icd_term *icd_term) {
+    const PFN_vkGetInstanceProcAddr fp_gipa = icd_term->scanned_icd->GetInstanceProcAddr;
+
+#define LOOKUP_GIPA(func) icd_term->dispatch.func = (PFN_vk##func)fp_gipa(icd_term->instance, "vk" #func);
+
+#define LOOKUP_REQUIRED_GIPA(func)                                                      \
+    do {                                                                                \
+        LOOKUP_GIPA(func);                                                              \
+        if (!icd_term->dispatch.func) {                                                 \
+            loader_log(inst, VULKAN_LOADER_WARN_BIT, 0, "Unable to load %s from ICD %s",\
+                       "vk"#func, icd_term->scanned_icd->lib_name);                     \
+            return false;                                                               \
+        }                                                                               \
+    } while (0)
+
+
+    // ---- Core Vulkan 1.0
+    LOOKUP_REQUIRED_GIPA(DestroyInstance);
+    LOOKUP_REQUIRED_GIPA(EnumeratePhysicalDevices);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceFeatures);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceFormatProperties);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceImageFormatProperties);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceProperties);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceQueueFamilyProperties);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceMemoryProperties);
+    LOOKUP_REQUIRED_GIPA(GetDeviceProcAddr);
+    LOOKUP_REQUIRED_GIPA(CreateDevice);
+    LOOKUP_REQUIRED_GIPA(EnumerateDeviceExtensionProperties);
+    LOOKUP_REQUIRED_GIPA(GetPhysicalDeviceSparseImageFormatProperties);
+
+    // ---- Core Vulkan 1.1
+    LOOKUP_GIPA(EnumeratePhysicalDeviceGroups);
+    LOOKUP_GIPA(GetPhysicalDeviceFeatures2);
+    LOOKUP_GIPA(GetPhysicalDeviceProperties2);
+    LOOKUP_GIPA(GetPhysicalDeviceFormatProperties2);
+    LOOKUP_GIPA(GetPhysicalDeviceImageFormatProperties2);
+    LOOKUP_GIPA(GetPhysicalDeviceQueueFamilyProperties2);
+    LOOKUP_GIPA(GetPhysicalDeviceMemoryProperties2);
+    LOOKUP_GIPA(GetPhysicalDeviceSparseImageFormatProperties2);
+    LOOKUP_GIPA(GetPhysicalDeviceExternalBufferProperties);
+    LOOKUP_GIPA(GetPhysicalDeviceExternalFenceProperties);
+    LOOKUP_GIPA(GetPhysicalDeviceExternalSemaphoreProperties);
+
+    // ---- Core Vulkan 1.3
+    LOOKUP_GIPA(GetPhysicalDeviceToolProperties);
+
+    // ---- VK_KHR_surface extension commands
+    LOOKUP_GIPA(DestroySurfaceKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceSurfaceSupportKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceSurfaceCapabilitiesKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceSurfaceFormatsKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceSurfacePresentModesKHR);
+
+    // ---- VK_KHR_swapchain extension commands
+    LOOKUP_GIPA(GetPhysicalDevicePresentRectanglesKHR);
+
+    // ---- VK_KHR_display extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceDisplayPropertiesKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceDisplayPlanePropertiesKHR);
+    LOOKUP_GIPA(GetDisplayPlaneSupportedDisplaysKHR);
+    LOOKUP_GIPA(GetDisplayModePropertiesKHR);
+    LOOKUP_GIPA(CreateDisplayModeKHR);
+    LOOKUP_GIPA(GetDisplayPlaneCapabilitiesKHR);
+    LOOKUP_GIPA(CreateDisplayPlaneSurfaceKHR);
+
+    // ---- VK_KHR_xlib_surface extension commands
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    LOOKUP_GIPA(CreateXlibSurfaceKHR);
+#endif // VK_USE_PLATFORM_XLIB_KHR
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    LOOKUP_GIPA(GetPhysicalDeviceXlibPresentationSupportKHR);
+#endif // VK_USE_PLATFORM_XLIB_KHR
+
+    // ---- VK_KHR_xcb_surface extension commands
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    LOOKUP_GIPA(CreateXcbSurfaceKHR);
+#endif // VK_USE_PLATFORM_XCB_KHR
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    LOOKUP_GIPA(GetPhysicalDeviceXcbPresentationSupportKHR);
+#endif // VK_USE_PLATFORM_XCB_KHR
+
+    // ---- VK_KHR_wayland_surface extension commands
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    LOOKUP_GIPA(CreateWaylandSurfaceKHR);
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    LOOKUP_GIPA(GetPhysicalDeviceWaylandPresentationSupportKHR);
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+
+    // ---- VK_KHR_android_surface extension commands
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    LOOKUP_GIPA(CreateAndroidSurfaceKHR);
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+
+    // ---- VK_KHR_win32_surface extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    LOOKUP_GIPA(CreateWin32SurfaceKHR);
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    LOOKUP_GIPA(GetPhysicalDeviceWin32PresentationSupportKHR);
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_KHR_video_queue extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceVideoCapabilitiesKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceVideoFormatPropertiesKHR);
+
+    // ---- VK_KHR_get_physical_device_properties2 extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceFeatures2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceProperties2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceFormatProperties2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceImageFormatProperties2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceQueueFamilyProperties2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceMemoryProperties2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceSparseImageFormatProperties2KHR);
+
+    // ---- VK_KHR_device_group_creation extension commands
+    LOOKUP_GIPA(EnumeratePhysicalDeviceGroupsKHR);
+
+    // ---- VK_KHR_external_memory_capabilities extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceExternalBufferPropertiesKHR);
+
+    // ---- VK_KHR_external_semaphore_capabilities extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceExternalSemaphorePropertiesKHR);
+
+    // ---- VK_KHR_external_fence_capabilities extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceExternalFencePropertiesKHR);
+
+    // ---- VK_KHR_performance_query extension commands
+    LOOKUP_GIPA(EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR);
+    LOOKUP_GIPA(GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR);
+
+    // ---- VK_KHR_get_surface_capabilities2 extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceSurfaceCapabilities2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceSurfaceFormats2KHR);
+
+    // ---- VK_KHR_get_display_properties2 extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceDisplayProperties2KHR);
+    LOOKUP_GIPA(GetPhysicalDeviceDisplayPlaneProperties2KHR);
+    LOOKUP_GIPA(GetDisplayModeProperties2KHR);
+    LOOKUP_GIPA(GetDisplayPlaneCapabilities2KHR);
+
+    // ---- VK_KHR_fragment_shading_rate extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceFragmentShadingRatesKHR);
+
+    // ---- VK_KHR_video_encode_queue extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR);
+
+    // ---- VK_KHR_cooperative_matrix extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceCooperativeMatrixPropertiesKHR);
+
+    // ---- VK_KHR_calibrated_timestamps extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceCalibrateableTimeDomainsKHR);
+
+    // ---- VK_EXT_debug_report extension commands
+    LOOKUP_GIPA(CreateDebugReportCallbackEXT);
+    LOOKUP_GIPA(DestroyDebugReportCallbackEXT);
+    LOOKUP_GIPA(DebugReportMessageEXT);
+
+    // ---- VK_GGP_stream_descriptor_surface extension commands
+#if defined(VK_USE_PLATFORM_GGP)
+    LOOKUP_GIPA(CreateStreamDescriptorSurfaceGGP);
+#endif // VK_USE_PLATFORM_GGP
+
+    // ---- VK_NV_external_memory_capabilities extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceExternalImageFormatPropertiesNV);
+
+    // ---- VK_NN_vi_surface extension commands
+#if defined(VK_USE_PLATFORM_VI_NN)
+    LOOKUP_GIPA(CreateViSurfaceNN);
+#endif // VK_USE_PLATFORM_VI_NN
+
+    // ---- VK_EXT_direct_mode_display extension commands
+    LOOKUP_GIPA(ReleaseDisplayEXT);
+
+    // ---- VK_EXT_acquire_xlib_display extension commands
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    LOOKUP_GIPA(AcquireXlibDisplayEXT);
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    LOOKUP_GIPA(GetRandROutputDisplayEXT);
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+
+    // ---- VK_EXT_display_surface_counter extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceSurfaceCapabilities2EXT);
+
+    // ---- VK_MVK_ios_surface extension commands
+#if defined(VK_USE_PLATFORM_IOS_MVK)
+    LOOKUP_GIPA(CreateIOSSurfaceMVK);
+#endif // VK_USE_PLATFORM_IOS_MVK
+
+    // ---- VK_MVK_macos_surface extension commands
+#if defined(VK_USE_PLATFORM_MACOS_MVK)
+    LOOKUP_GIPA(CreateMacOSSurfaceMVK);
+#endif // VK_USE_PLATFORM_MACOS_MVK
+
+    // ---- VK_EXT_debug_utils extension commands
+    LOOKUP_GIPA(CreateDebugUtilsMessengerEXT);
+    LOOKUP_GIPA(DestroyDebugUtilsMessengerEXT);
+    LOOKUP_GIPA(SubmitDebugUtilsMessageEXT);
+
+    // ---- VK_EXT_sample_locations extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceMultisamplePropertiesEXT);
+
+    // ---- VK_EXT_calibrated_timestamps extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceCalibrateableTimeDomainsEXT);
+
+    // ---- VK_FUCHSIA_imagepipe_surface extension commands
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    LOOKUP_GIPA(CreateImagePipeSurfaceFUCHSIA);
+#endif // VK_USE_PLATFORM_FUCHSIA
+
+    // ---- VK_EXT_metal_surface extension commands
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    LOOKUP_GIPA(CreateMetalSurfaceEXT);
+#endif // VK_USE_PLATFORM_METAL_EXT
+
+    // ---- VK_EXT_tooling_info extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceToolPropertiesEXT);
+
+    // ---- VK_NV_cooperative_matrix extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceCooperativeMatrixPropertiesNV);
+
+    // ---- VK_NV_coverage_reduction_mode extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV);
+
+    // ---- VK_EXT_full_screen_exclusive extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    LOOKUP_GIPA(GetPhysicalDeviceSurfacePresentModes2EXT);
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_headless_surface extension commands
+    LOOKUP_GIPA(CreateHeadlessSurfaceEXT);
+
+    // ---- VK_EXT_acquire_drm_display extension commands
+    LOOKUP_GIPA(AcquireDrmDisplayEXT);
+    LOOKUP_GIPA(GetDrmDisplayEXT);
+
+    // ---- VK_NV_acquire_winrt_display extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    LOOKUP_GIPA(AcquireWinrtDisplayNV);
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    LOOKUP_GIPA(GetWinrtDisplayNV);
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_directfb_surface extension commands
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    LOOKUP_GIPA(CreateDirectFBSurfaceEXT);
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    LOOKUP_GIPA(GetPhysicalDeviceDirectFBPresentationSupportEXT);
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+
+    // ---- VK_QNX_screen_surface extension commands
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    LOOKUP_GIPA(CreateScreenSurfaceQNX);
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    LOOKUP_GIPA(GetPhysicalDeviceScreenPresentationSupportQNX);
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+
+    // ---- VK_NV_optical_flow extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceOpticalFlowImageFormatsNV);
+
+    // ---- VK_NV_cooperative_matrix2 extension commands
+    LOOKUP_GIPA(GetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV);
+
+#undef LOOKUP_REQUIRED_GIPA
+#undef LOOKUP_GIPA
+
+    return true;
+};
+
+// Entry of the generated tables of commands looked up to initialize a dispatch table
+struct loader_dispatch_table_init_entry {
+    uint32_t table_offset;                 // Offset of the command in the dispatch table
+    uint16_t name_offset;                  // Offset of the command name in loader_name_pool
+    uint32_t api_version;                  // Core version which added the command, 0 for extension commands
+};
+
+// Look up each command of entries with gpa and store it at its offset in table. The core commands newer than
+// api_version are set to NULL instead, and the number of them is returned.
+static uint32_t loader_init_device_dispatch_entries(void *table, const struct loader_dispatch_table_init_entry *entries,
+                                                    size_t entry_count, uint32_t api_version, PFN_vkGetDeviceProcAddr gpa, VkDevice dev) {
+    uint32_t skipped_count = 0;
+    for (size_t i = 0; i < entry_count; i++) {
+        PFN_vkVoidFunction func = NULL;
+        if (entries[i].api_version > api_version) {
+            skipped_count++;
+        } else {
+            func = gpa(dev, &loader_name_pool[entries[i].name_offset]);
+        }
+        *(PFN_vkVoidFunction *)((char *)table + entries[i].table_offset) = func;
+    }
+    return skipped_count;
+}
+
+// Look up each command of entries with gpa and store it at its offset in table
+static void loader_init_instance_dispatch_entries(void *table, const struct loader_dispatch_table_init_entry *entries,
+                                                  size_t entry_count, PFN_vkGetInstanceProcAddr gpa, VkInstance inst) {
+    for (size_t i = 0; i < entry_count; i++) {
+        *(PFN_vkVoidFunction *)((char *)table + entries[i].table_offset) = gpa(inst, &loader_name_pool[entries[i].name_offset]);
+    }
+}
+
+static const struct loader_dispatch_table_init_entry device_core_dispatch_init_table[] = {
+    // ---- Core Vulkan 1.0 commands
+    {offsetof(VkLayerDispatchTable, DestroyDevice), 332, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetDeviceQueue), 492, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, QueueSubmit), 509, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, QueueWaitIdle), 523, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DeviceWaitIdle), 539, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, AllocateMemory), 556, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, FreeMemory), 573, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, MapMemory), 586, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, UnmapMemory), 598, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, FlushMappedMemoryRanges), 612, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, InvalidateMappedMemoryRanges), 638, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetDeviceMemoryCommitment), 669, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, BindBufferMemory), 697, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, BindImageMemory), 716, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements), 734, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetImageMemoryRequirements), 764, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements), 793, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, QueueBindSparse), 875, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateFence), 893, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyFence), 907, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, ResetFences), 922, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetFenceStatus), 936, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, WaitForFences), 953, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateSemaphore), 969, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroySemaphore), 987, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateEvent), 1006, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyEvent), 1020, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetEventStatus), 1035, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, SetEvent), 1052, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, ResetEvent), 1063, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateQueryPool), 1076, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyQueryPool), 1094, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetQueryPoolResults), 1113, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateBuffer), 1135, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyBuffer), 1150, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateBufferView), 1166, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyBufferView), 1185, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateImage), 1205, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyImage), 1219, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetImageSubresourceLayout), 1234, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateImageView), 1262, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyImageView), 1280, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateShaderModule), 1299, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyShaderModule), 1320, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreatePipelineCache), 1342, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyPipelineCache), 1364, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetPipelineCacheData), 1387, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, MergePipelineCaches), 1410, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateGraphicsPipelines), 1432, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateComputePipelines), 1458, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyPipeline), 1483, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreatePipelineLayout), 1501, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyPipelineLayout), 1524, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateSampler), 1548, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroySampler), 1564, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateDescriptorSetLayout), 1581, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyDescriptorSetLayout), 1609, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateDescriptorPool), 1638, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyDescriptorPool), 1661, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, ResetDescriptorPool), 1685, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, AllocateDescriptorSets), 1707, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, FreeDescriptorSets), 1732, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, UpdateDescriptorSets), 1753, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateFramebuffer), 1776, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyFramebuffer), 1796, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateRenderPass), 1817, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyRenderPass), 1836, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, GetRenderAreaGranularity), 1856, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CreateCommandPool), 1883, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, DestroyCommandPool), 1903, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, ResetCommandPool), 1924, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, AllocateCommandBuffers), 1943, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, FreeCommandBuffers), 1968, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, BeginCommandBuffer), 1989, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, EndCommandBuffer), 2010, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, ResetCommandBuffer), 2029, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBindPipeline), 2050, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetViewport), 2068, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetScissor), 2085, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetLineWidth), 2101, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBias), 2119, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetBlendConstants), 2137, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBounds), 2160, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilCompareMask), 2180, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilWriteMask), 2207, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilReference), 2232, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBindDescriptorSets), 2257, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBindIndexBuffer), 2281, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBindVertexBuffers), 2302, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdDraw), 2325, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndexed), 2335, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndirect), 2352, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirect), 2370, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdDispatch), 2395, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdDispatchIndirect), 2409, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdCopyBuffer), 2431, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdCopyImage), 2447, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBlitImage), 2462, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdCopyBufferToImage), 2477, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer), 2500, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdUpdateBuffer), 2523, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdFillBuffer), 2541, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdClearColorImage), 2557, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdClearDepthStencilImage), 2578, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdClearAttachments), 2606, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdResolveImage), 2628, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdSetEvent), 2646, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdResetEvent), 2660, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdWaitEvents), 2676, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdPipelineBarrier), 2692, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBeginQuery), 2713, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdEndQuery), 2729, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdResetQueryPool), 2743, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdWriteTimestamp), 2763, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdCopyQueryPoolResults), 2783, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdPushConstants), 2809, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdBeginRenderPass), 2828, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdNextSubpass), 2849, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdEndRenderPass), 2866, VK_API_VERSION_1_0},
+    {offsetof(VkLayerDispatchTable, CmdExecuteCommands), 2885, VK_API_VERSION_1_0},
+
+    // ---- Core Vulkan 1.1 commands
+    {offsetof(VkLayerDispatchTable, BindBufferMemory2), 2933, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, BindImageMemory2), 2953, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, GetDeviceGroupPeerMemoryFeatures), 2972, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, CmdSetDeviceMask), 3007, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, CmdDispatchBase), 3026, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, GetImageMemoryRequirements2), 3076, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements2), 3106, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements2), 3137, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, TrimCommandPool), 3439, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, GetDeviceQueue2), 3457, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, CreateSamplerYcbcrConversion), 3475, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, DestroySamplerYcbcrConversion), 3506, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, CreateDescriptorUpdateTemplate), 3538, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, DestroyDescriptorUpdateTemplate), 3571, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, UpdateDescriptorSetWithTemplate), 3605, VK_API_VERSION_1_1},
+    {offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSupport), 3773, VK_API_VERSION_1_1},
+
+    // ---- Core Vulkan 1.2 commands
+    {offsetof(VkLayerDispatchTable, CmdDrawIndirectCount), 3805, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCount), 3828, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, CreateRenderPass2), 3858, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, CmdBeginRenderPass2), 3878, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, CmdNextSubpass2), 3900, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, CmdEndRenderPass2), 3918, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, ResetQueryPool), 3938, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, GetSemaphoreCounterValue), 3955, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, WaitSemaphores), 3982, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, SignalSemaphore), 3999, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, GetBufferDeviceAddress), 4017, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureAddress), 4042, VK_API_VERSION_1_2},
+    {offsetof(VkLayerDispatchTable, GetDeviceMemoryOpaqueCaptureAddress), 4074, VK_API_VERSION_1_2},
+
+    // ---- Core Vulkan 1.3 commands
+    {offsetof(VkLayerDispatchTable, CreatePrivateDataSlot), 4146, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, DestroyPrivateDataSlot), 4170, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, SetPrivateData), 4195, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, GetPrivateData), 4212, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetEvent2), 4229, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdResetEvent2), 4244, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdWaitEvents2), 4261, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdPipelineBarrier2), 4278, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdWriteTimestamp2), 4300, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, QueueSubmit2), 4321, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdCopyBuffer2), 4336, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdCopyImage2), 4353, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdCopyBufferToImage2), 4369, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer2), 4393, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdBlitImage2), 4417, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdResolveImage2), 4433, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdBeginRendering), 4452, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdEndRendering), 4472, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetCullMode), 4490, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetFrontFace), 4507, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetPrimitiveTopology), 4525, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetViewportWithCount), 4551, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetScissorWithCount), 4577, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdBindVertexBuffers2), 4602, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthTestEnable), 4626, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthWriteEnable), 4650, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthCompareOp), 4675, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBoundsTestEnable), 4698, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilTestEnable), 4728, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilOp), 4754, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetRasterizerDiscardEnable), 4772, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBiasEnable), 4804, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, CmdSetPrimitiveRestartEnable), 4828, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, GetDeviceBufferMemoryRequirements), 4859, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, GetDeviceImageMemoryRequirements), 4895, VK_API_VERSION_1_3},
+    {offsetof(VkLayerDispatchTable, GetDeviceImageSparseMemoryRequirements), 4930, VK_API_VERSION_1_3},
+
+    // ---- Core Vulkan 1.4 commands
+    {offsetof(VkLayerDispatchTable, CmdSetLineStipple), 4971, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, MapMemory2), 4991, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, UnmapMemory2), 5004, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdBindIndexBuffer2), 5019, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, GetRenderingAreaGranularity), 5041, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, GetDeviceImageSubresourceLayout), 5071, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2), 5105, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSet), 5134, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate), 5157, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdSetRenderingAttachmentLocations), 5192, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdSetRenderingInputAttachmentIndices), 5229, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdBindDescriptorSets2), 5269, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdPushConstants2), 5294, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSet2), 5314, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate2), 5338, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CopyMemoryToImage), 5374, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CopyImageToMemory), 5394, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, CopyImageToImage), 5414, VK_API_VERSION_1_4},
+    {offsetof(VkLayerDispatchTable, TransitionImageLayout), 5433, VK_API_VERSION_1_4},
+};
+
+// Init Device function pointer dispatch table with core commands
+VKAPI_ATTR uint32_t VKAPI_CALL loader_init_device_dispatch_table(struct loader_dev_dispatch_table *dev_table, PFN_vkGetDeviceProcAddr gpa,
+                                                                 VkDevice dev, uint32_t api_version) {
+    VkLayerDispatchTable *table = &dev_table->core_dispatch;
+    if (table->magic != DEVICE_DISP_TABLE_MAGIC_NUMBER) { abort(); }
+    for (uint32_t i = 0; i < MAX_NUM_UNKNOWN_EXTS; i++) dev_table->ext_dispatch[i] = (PFN_vkDevExt)vkDevExtError;
+    uint32_t skipped_count = loader_init_device_dispatch_entries(table, device_core_dispatch_init_table, sizeof(device_core_dispatch_init_table) / sizeof(device_core_dispatch_init_table[0]), api_version, gpa, dev);
+    table->GetDeviceProcAddr = gpa;
+    return skipped_count;
+}
+
+static const struct loader_dispatch_table_init_entry device_extension_gipa_dispatch_init_table[] = {
+    // ---- VK_EXT_debug_utils extension commands
+    {offsetof(VkLayerDispatchTable, SetDebugUtilsObjectNameEXT), 11898, 0},
+    {offsetof(VkLayerDispatchTable, SetDebugUtilsObjectTagEXT), 11927, 0},
+    {offsetof(VkLayerDispatchTable, QueueBeginDebugUtilsLabelEXT), 11955, 0},
+    {offsetof(VkLayerDispatchTable, QueueEndDebugUtilsLabelEXT), 11986, 0},
+    {offsetof(VkLayerDispatchTable, QueueInsertDebugUtilsLabelEXT), 12015, 0},
+    {offsetof(VkLayerDispatchTable, CmdBeginDebugUtilsLabelEXT), 12047, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndDebugUtilsLabelEXT), 12076, 0},
+    {offsetof(VkLayerDispatchTable, CmdInsertDebugUtilsLabelEXT), 12103, 0},
+};
+
+static const struct loader_dispatch_table_init_entry device_extension_gdpa_dispatch_init_table[] = {
+    // ---- VK_KHR_swapchain extension commands
+    {offsetof(VkLayerDispatchTable, CreateSwapchainKHR), 5635, 0},
+    {offsetof(VkLayerDispatchTable, DestroySwapchainKHR), 5656, 0},
+    {offsetof(VkLayerDispatchTable, GetSwapchainImagesKHR), 5678, 0},
+    {offsetof(VkLayerDispatchTable, AcquireNextImageKHR), 5702, 0},
+    {offsetof(VkLayerDispatchTable, QueuePresentKHR), 5724, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceGroupPresentCapabilitiesKHR), 5742, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceGroupSurfacePresentModesKHR), 5781, 0},
+    {offsetof(VkLayerDispatchTable, AcquireNextImage2KHR), 5860, 0},
+
+    // ---- VK_KHR_display_swapchain extension commands
+    {offsetof(VkLayerDispatchTable, CreateSharedSwapchainsKHR), 6123, 0},
+
+    // ---- VK_KHR_video_queue extension commands
+    {offsetof(VkLayerDispatchTable, CreateVideoSessionKHR), 6543, 0},
+    {offsetof(VkLayerDispatchTable, DestroyVideoSessionKHR), 6567, 0},
+    {offsetof(VkLayerDispatchTable, GetVideoSessionMemoryRequirementsKHR), 6592, 0},
+    {offsetof(VkLayerDispatchTable, BindVideoSessionMemoryKHR), 6631, 0},
+    {offsetof(VkLayerDispatchTable, CreateVideoSessionParametersKHR), 6659, 0},
+    {offsetof(VkLayerDispatchTable, UpdateVideoSessionParametersKHR), 6693, 0},
+    {offsetof(VkLayerDispatchTable, DestroyVideoSessionParametersKHR), 6727, 0},
+    {offsetof(VkLayerDispatchTable, CmdBeginVideoCodingKHR), 6762, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndVideoCodingKHR), 6787, 0},
+    {offsetof(VkLayerDispatchTable, CmdControlVideoCodingKHR), 6810, 0},
+
+    // ---- VK_KHR_video_decode_queue extension commands
+    {offsetof(VkLayerDispatchTable, CmdDecodeVideoKHR), 6837, 0},
+
+    // ---- VK_KHR_dynamic_rendering extension commands
+    {offsetof(VkLayerDispatchTable, CmdBeginRenderingKHR), 6857, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndRenderingKHR), 6880, 0},
+
+    // ---- VK_KHR_device_group extension commands
+    {offsetof(VkLayerDispatchTable, GetDeviceGroupPeerMemoryFeaturesKHR), 7188, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDeviceMaskKHR), 7226, 0},
+    {offsetof(VkLayerDispatchTable, CmdDispatchBaseKHR), 7248, 0},
+
+    // ---- VK_KHR_maintenance1 extension commands
+    {offsetof(VkLayerDispatchTable, TrimCommandPoolKHR), 7269, 0},
+
+    // ---- VK_KHR_external_memory_win32 extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, GetMemoryWin32HandleKHR), 7372, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, GetMemoryWin32HandlePropertiesKHR), 7398, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_KHR_external_memory_fd extension commands
+    {offsetof(VkLayerDispatchTable, GetMemoryFdKHR), 7434, 0},
+    {offsetof(VkLayerDispatchTable, GetMemoryFdPropertiesKHR), 7451, 0},
+
+    // ---- VK_KHR_external_semaphore_win32 extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, ImportSemaphoreWin32HandleKHR), 7528, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, GetSemaphoreWin32HandleKHR), 7560, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_KHR_external_semaphore_fd extension commands
+    {offsetof(VkLayerDispatchTable, ImportSemaphoreFdKHR), 7589, 0},
+    {offsetof(VkLayerDispatchTable, GetSemaphoreFdKHR), 7612, 0},
+
+    // ---- VK_KHR_push_descriptor extension commands
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSetKHR), 7632, 0},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplateKHR), 7658, 0},
+
+    // ---- VK_KHR_descriptor_update_template extension commands
+    {offsetof(VkLayerDispatchTable, CreateDescriptorUpdateTemplateKHR), 7696, 0},
+    {offsetof(VkLayerDispatchTable, DestroyDescriptorUpdateTemplateKHR), 7732, 0},
+    {offsetof(VkLayerDispatchTable, UpdateDescriptorSetWithTemplateKHR), 7769, 0},
+
+    // ---- VK_KHR_create_renderpass2 extension commands
+    {offsetof(VkLayerDispatchTable, CreateRenderPass2KHR), 7806, 0},
+    {offsetof(VkLayerDispatchTable, CmdBeginRenderPass2KHR), 7829, 0},
+    {offsetof(VkLayerDispatchTable, CmdNextSubpass2KHR), 7854, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndRenderPass2KHR), 7875, 0},
+
+    // ---- VK_KHR_shared_presentable_image extension commands
+    {offsetof(VkLayerDispatchTable, GetSwapchainStatusKHR), 7898, 0},
+
+    // ---- VK_KHR_external_fence_win32 extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, ImportFenceWin32HandleKHR), 7968, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, GetFenceWin32HandleKHR), 7996, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_KHR_external_fence_fd extension commands
+    {offsetof(VkLayerDispatchTable, ImportFenceFdKHR), 8021, 0},
+    {offsetof(VkLayerDispatchTable, GetFenceFdKHR), 8040, 0},
+
+    // ---- VK_KHR_performance_query extension commands
+    {offsetof(VkLayerDispatchTable, AcquireProfilingLockKHR), 8176, 0},
+    {offsetof(VkLayerDispatchTable, ReleaseProfilingLockKHR), 8202, 0},
+
+    // ---- VK_KHR_get_memory_requirements2 extension commands
+    {offsetof(VkLayerDispatchTable, GetImageMemoryRequirements2KHR), 8461, 0},
+    {offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements2KHR), 8494, 0},
+    {offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements2KHR), 8528, 0},
+
+    // ---- VK_KHR_sampler_ycbcr_conversion extension commands
+    {offsetof(VkLayerDispatchTable, CreateSamplerYcbcrConversionKHR), 8567, 0},
+    {offsetof(VkLayerDispatchTable, DestroySamplerYcbcrConversionKHR), 8601, 0},
+
+    // ---- VK_KHR_bind_memory2 extension commands
+    {offsetof(VkLayerDispatchTable, BindBufferMemory2KHR), 8636, 0},
+    {offsetof(VkLayerDispatchTable, BindImageMemory2KHR), 8659, 0},
+
+    // ---- VK_KHR_maintenance3 extension commands
+    {offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSupportKHR), 8681, 0},
+
+    // ---- VK_KHR_draw_indirect_count extension commands
+    {offsetof(VkLayerDispatchTable, CmdDrawIndirectCountKHR), 8716, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCountKHR), 8742, 0},
+
+    // ---- VK_KHR_timeline_semaphore extension commands
+    {offsetof(VkLayerDispatchTable, GetSemaphoreCounterValueKHR), 8775, 0},
+    {offsetof(VkLayerDispatchTable, WaitSemaphoresKHR), 8805, 0},
+    {offsetof(VkLayerDispatchTable, SignalSemaphoreKHR), 8825, 0},
+
+    // ---- VK_KHR_fragment_shading_rate extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetFragmentShadingRateKHR), 8889, 0},
+
+    // ---- VK_KHR_dynamic_rendering_local_read extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetRenderingAttachmentLocationsKHR), 8920, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetRenderingInputAttachmentIndicesKHR), 8960, 0},
+
+    // ---- VK_KHR_present_wait extension commands
+    {offsetof(VkLayerDispatchTable, WaitForPresentKHR), 9003, 0},
+
+    // ---- VK_KHR_buffer_device_address extension commands
+    {offsetof(VkLayerDispatchTable, GetBufferDeviceAddressKHR), 9023, 0},
+    {offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureAddressKHR), 9051, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceMemoryOpaqueCaptureAddressKHR), 9086, 0},
+
+    // ---- VK_KHR_deferred_host_operations extension commands
+    {offsetof(VkLayerDispatchTable, CreateDeferredOperationKHR), 9127, 0},
+    {offsetof(VkLayerDispatchTable, DestroyDeferredOperationKHR), 9156, 0},
+    {offsetof(VkLayerDispatchTable, GetDeferredOperationMaxConcurrencyKHR), 9186, 0},
+    {offsetof(VkLayerDispatchTable, GetDeferredOperationResultKHR), 9226, 0},
+    {offsetof(VkLayerDispatchTable, DeferredOperationJoinKHR), 9258, 0},
+
+    // ---- VK_KHR_pipeline_executable_properties extension commands
+    {offsetof(VkLayerDispatchTable, GetPipelineExecutablePropertiesKHR), 9285, 0},
+    {offsetof(VkLayerDispatchTable, GetPipelineExecutableStatisticsKHR), 9322, 0},
+    {offsetof(VkLayerDispatchTable, GetPipelineExecutableInternalRepresentationsKHR), 9359, 0},
+
+    // ---- VK_KHR_map_memory2 extension commands
+    {offsetof(VkLayerDispatchTable, MapMemory2KHR), 9409, 0},
+    {offsetof(VkLayerDispatchTable, UnmapMemory2KHR), 9425, 0},
+
+    // ---- VK_KHR_video_encode_queue extension commands
+    {offsetof(VkLayerDispatchTable, GetEncodedVideoSessionParametersKHR), 9499, 0},
+    {offsetof(VkLayerDispatchTable, CmdEncodeVideoKHR), 9537, 0},
+
+    // ---- VK_KHR_synchronization2 extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetEvent2KHR), 9557, 0},
+    {offsetof(VkLayerDispatchTable, CmdResetEvent2KHR), 9575, 0},
+    {offsetof(VkLayerDispatchTable, CmdWaitEvents2KHR), 9595, 0},
+    {offsetof(VkLayerDispatchTable, CmdPipelineBarrier2KHR), 9615, 0},
+    {offsetof(VkLayerDispatchTable, CmdWriteTimestamp2KHR), 9640, 0},
+    {offsetof(VkLayerDispatchTable, QueueSubmit2KHR), 9664, 0},
+
+    // ---- VK_KHR_copy_commands2 extension commands
+    {offsetof(VkLayerDispatchTable, CmdCopyBuffer2KHR), 9682, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyImage2KHR), 9702, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyBufferToImage2KHR), 9721, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer2KHR), 9748, 0},
+    {offsetof(VkLayerDispatchTable, CmdBlitImage2KHR), 9775, 0},
+    {offsetof(VkLayerDispatchTable, CmdResolveImage2KHR), 9794, 0},
+
+    // ---- VK_KHR_ray_tracing_maintenance1 extension commands
+    {offsetof(VkLayerDispatchTable, CmdTraceRaysIndirect2KHR), 9816, 0},
+
+    // ---- VK_KHR_maintenance4 extension commands
+    {offsetof(VkLayerDispatchTable, GetDeviceBufferMemoryRequirementsKHR), 9843, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceImageMemoryRequirementsKHR), 9882, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceImageSparseMemoryRequirementsKHR), 9920, 0},
+
+    // ---- VK_KHR_maintenance5 extension commands
+    {offsetof(VkLayerDispatchTable, CmdBindIndexBuffer2KHR), 9964, 0},
+    {offsetof(VkLayerDispatchTable, GetRenderingAreaGranularityKHR), 9989, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceImageSubresourceLayoutKHR), 10022, 0},
+    {offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2KHR), 10059, 0},
+
+    // ---- VK_KHR_pipeline_binary extension commands
+    {offsetof(VkLayerDispatchTable, CreatePipelineBinariesKHR), 10091, 0},
+    {offsetof(VkLayerDispatchTable, DestroyPipelineBinaryKHR), 10119, 0},
+    {offsetof(VkLayerDispatchTable, GetPipelineKeyKHR), 10146, 0},
+    {offsetof(VkLayerDispatchTable, GetPipelineBinaryDataKHR), 10166, 0},
+    {offsetof(VkLayerDispatchTable, ReleaseCapturedPipelineDataKHR), 10193, 0},
+
+    // ---- VK_KHR_line_rasterization extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetLineStippleKHR), 10276, 0},
+
+    // ---- VK_KHR_calibrated_timestamps extension commands
+    {offsetof(VkLayerDispatchTable, GetCalibratedTimestampsKHR), 10346, 0},
+
+    // ---- VK_KHR_maintenance6 extension commands
+    {offsetof(VkLayerDispatchTable, CmdBindDescriptorSets2KHR), 10375, 0},
+    {offsetof(VkLayerDispatchTable, CmdPushConstants2KHR), 10403, 0},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSet2KHR), 10426, 0},
+    {offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate2KHR), 10453, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDescriptorBufferOffsets2EXT), 10492, 0},
+    {offsetof(VkLayerDispatchTable, CmdBindDescriptorBufferEmbeddedSamplers2EXT), 10528, 0},
+
+    // ---- VK_EXT_debug_marker extension commands
+    {offsetof(VkLayerDispatchTable, DebugMarkerSetObjectTagEXT), 10661, 0},
+    {offsetof(VkLayerDispatchTable, DebugMarkerSetObjectNameEXT), 10690, 0},
+    {offsetof(VkLayerDispatchTable, CmdDebugMarkerBeginEXT), 10720, 0},
+    {offsetof(VkLayerDispatchTable, CmdDebugMarkerEndEXT), 10745, 0},
+    {offsetof(VkLayerDispatchTable, CmdDebugMarkerInsertEXT), 10768, 0},
+
+    // ---- VK_EXT_transform_feedback extension commands
+    {offsetof(VkLayerDispatchTable, CmdBindTransformFeedbackBuffersEXT), 10794, 0},
+    {offsetof(VkLayerDispatchTable, CmdBeginTransformFeedbackEXT), 10831, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndTransformFeedbackEXT), 10862, 0},
+    {offsetof(VkLayerDispatchTable, CmdBeginQueryIndexedEXT), 10891, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndQueryIndexedEXT), 10917, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndirectByteCountEXT), 10941, 0},
+
+    // ---- VK_NVX_binary_import extension commands
+    {offsetof(VkLayerDispatchTable, CreateCuModuleNVX), 10971, 0},
+    {offsetof(VkLayerDispatchTable, CreateCuFunctionNVX), 10991, 0},
+    {offsetof(VkLayerDispatchTable, DestroyCuModuleNVX), 11013, 0},
+    {offsetof(VkLayerDispatchTable, DestroyCuFunctionNVX), 11034, 0},
+    {offsetof(VkLayerDispatchTable, CmdCuLaunchKernelNVX), 11057, 0},
+
+    // ---- VK_NVX_image_view_handle extension commands
+    {offsetof(VkLayerDispatchTable, GetImageViewHandleNVX), 11080, 0},
+    {offsetof(VkLayerDispatchTable, GetImageViewHandle64NVX), 11104, 0},
+    {offsetof(VkLayerDispatchTable, GetImageViewAddressNVX), 11130, 0},
+
+    // ---- VK_AMD_draw_indirect_count extension commands
+    {offsetof(VkLayerDispatchTable, CmdDrawIndirectCountAMD), 11155, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCountAMD), 11181, 0},
+
+    // ---- VK_AMD_shader_info extension commands
+    {offsetof(VkLayerDispatchTable, GetShaderInfoAMD), 11214, 0},
+
+    // ---- VK_NV_external_memory_win32 extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, GetMemoryWin32HandleNV), 11319, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_conditional_rendering extension commands
+    {offsetof(VkLayerDispatchTable, CmdBeginConditionalRenderingEXT), 11364, 0},
+    {offsetof(VkLayerDispatchTable, CmdEndConditionalRenderingEXT), 11398, 0},
+
+    // ---- VK_NV_clip_space_w_scaling extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetViewportWScalingNV), 11430, 0},
+
+    // ---- VK_EXT_display_control extension commands
+    {offsetof(VkLayerDispatchTable, DisplayPowerControlEXT), 11571, 0},
+    {offsetof(VkLayerDispatchTable, RegisterDeviceEventEXT), 11596, 0},
+    {offsetof(VkLayerDispatchTable, RegisterDisplayEventEXT), 11621, 0},
+    {offsetof(VkLayerDispatchTable, GetSwapchainCounterEXT), 11647, 0},
+
+    // ---- VK_GOOGLE_display_timing extension commands
+    {offsetof(VkLayerDispatchTable, GetRefreshCycleDurationGOOGLE), 11672, 0},
+    {offsetof(VkLayerDispatchTable, GetPastPresentationTimingGOOGLE), 11704, 0},
+
+    // ---- VK_EXT_discard_rectangles extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleEXT), 11738, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleEnableEXT), 11766, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleModeEXT), 11800, 0},
+
+    // ---- VK_EXT_hdr_metadata extension commands
+    {offsetof(VkLayerDispatchTable, SetHdrMetadataEXT), 11832, 0},
+
+    // ---- VK_ANDROID_external_memory_android_hardware_buffer extension commands
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    {offsetof(VkLayerDispatchTable, GetAndroidHardwareBufferPropertiesANDROID), 12225, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    {offsetof(VkLayerDispatchTable, GetMemoryAndroidHardwareBufferANDROID), 12269, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+
+    // ---- VK_AMDX_shader_enqueue extension commands
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, CreateExecutionGraphPipelinesAMDX), 12309, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, GetExecutionGraphPipelineScratchSizeAMDX), 12345, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, GetExecutionGraphPipelineNodeIndexAMDX), 12388, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, CmdInitializeGraphScratchMemoryAMDX), 12429, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, CmdDispatchGraphAMDX), 12467, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, CmdDispatchGraphIndirectAMDX), 12490, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    {offsetof(VkLayerDispatchTable, CmdDispatchGraphIndirectCountAMDX), 12521, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+
+    // ---- VK_EXT_sample_locations extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetSampleLocationsEXT), 12557, 0},
+
+    // ---- VK_EXT_image_drm_format_modifier extension commands
+    {offsetof(VkLayerDispatchTable, GetImageDrmFormatModifierPropertiesEXT), 12628, 0},
+
+    // ---- VK_EXT_validation_cache extension commands
+    {offsetof(VkLayerDispatchTable, CreateValidationCacheEXT), 12669, 0},
+    {offsetof(VkLayerDispatchTable, DestroyValidationCacheEXT), 12696, 0},
+    {offsetof(VkLayerDispatchTable, MergeValidationCachesEXT), 12724, 0},
+    {offsetof(VkLayerDispatchTable, GetValidationCacheDataEXT), 12751, 0},
+
+    // ---- VK_NV_shading_rate_image extension commands
+    {offsetof(VkLayerDispatchTable, CmdBindShadingRateImageNV), 12779, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetViewportShadingRatePaletteNV), 12807, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoarseSampleOrderNV), 12844, 0},
+
+    // ---- VK_NV_ray_tracing extension commands
+    {offsetof(VkLayerDispatchTable, CreateAccelerationStructureNV), 12872, 0},
+    {offsetof(VkLayerDispatchTable, DestroyAccelerationStructureNV), 12904, 0},
+    {offsetof(VkLayerDispatchTable, GetAccelerationStructureMemoryRequirementsNV), 12937, 0},
+    {offsetof(VkLayerDispatchTable, BindAccelerationStructureMemoryNV), 12984, 0},
+    {offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructureNV), 13020, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureNV), 13054, 0},
+    {offsetof(VkLayerDispatchTable, CmdTraceRaysNV), 13087, 0},
+    {offsetof(VkLayerDispatchTable, CreateRayTracingPipelinesNV), 13104, 0},
+    {offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupHandlesKHR), 13134, 0},
+    {offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupHandlesNV), 13171, 0},
+    {offsetof(VkLayerDispatchTable, GetAccelerationStructureHandleNV), 13207, 0},
+    {offsetof(VkLayerDispatchTable, CmdWriteAccelerationStructuresPropertiesNV), 13242, 0},
+    {offsetof(VkLayerDispatchTable, CompileDeferredNV), 13287, 0},
+
+    // ---- VK_EXT_external_memory_host extension commands
+    {offsetof(VkLayerDispatchTable, GetMemoryHostPointerPropertiesEXT), 13307, 0},
+
+    // ---- VK_AMD_buffer_marker extension commands
+    {offsetof(VkLayerDispatchTable, CmdWriteBufferMarkerAMD), 13343, 0},
+    {offsetof(VkLayerDispatchTable, CmdWriteBufferMarker2AMD), 13369, 0},
+
+    // ---- VK_EXT_calibrated_timestamps extension commands
+    {offsetof(VkLayerDispatchTable, GetCalibratedTimestampsEXT), 13443, 0},
+
+    // ---- VK_NV_mesh_shader extension commands
+    {offsetof(VkLayerDispatchTable, CmdDrawMeshTasksNV), 13472, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectNV), 13493, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectCountNV), 13522, 0},
+
+    // ---- VK_NV_scissor_exclusive extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetExclusiveScissorEnableNV), 13556, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetExclusiveScissorNV), 13589, 0},
+
+    // ---- VK_NV_device_diagnostic_checkpoints extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetCheckpointNV), 13616, 0},
+    {offsetof(VkLayerDispatchTable, GetQueueCheckpointDataNV), 13637, 0},
+    {offsetof(VkLayerDispatchTable, GetQueueCheckpointData2NV), 13664, 0},
+
+    // ---- VK_INTEL_performance_query extension commands
+    {offsetof(VkLayerDispatchTable, InitializePerformanceApiINTEL), 13692, 0},
+    {offsetof(VkLayerDispatchTable, UninitializePerformanceApiINTEL), 13724, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetPerformanceMarkerINTEL), 13758, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetPerformanceStreamMarkerINTEL), 13789, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetPerformanceOverrideINTEL), 13826, 0},
+    {offsetof(VkLayerDispatchTable, AcquirePerformanceConfigurationINTEL), 13859, 0},
+    {offsetof(VkLayerDispatchTable, ReleasePerformanceConfigurationINTEL), 13898, 0},
+    {offsetof(VkLayerDispatchTable, QueueSetPerformanceConfigurationINTEL), 13937, 0},
+    {offsetof(VkLayerDispatchTable, GetPerformanceParameterINTEL), 13977, 0},
+
+    // ---- VK_AMD_display_native_hdr extension commands
+    {offsetof(VkLayerDispatchTable, SetLocalDimmingAMD), 14008, 0},
+
+    // ---- VK_EXT_buffer_device_address extension commands
+    {offsetof(VkLayerDispatchTable, GetBufferDeviceAddressEXT), 14085, 0},
+
+    // ---- VK_EXT_full_screen_exclusive extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, AcquireFullScreenExclusiveModeEXT), 14308, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, ReleaseFullScreenExclusiveModeEXT), 14344, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerDispatchTable, GetDeviceGroupSurfacePresentModes2EXT), 14380, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_line_rasterization extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetLineStippleEXT), 14447, 0},
+
+    // ---- VK_EXT_host_query_reset extension commands
+    {offsetof(VkLayerDispatchTable, ResetQueryPoolEXT), 14470, 0},
+
+    // ---- VK_EXT_extended_dynamic_state extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetCullModeEXT), 14490, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetFrontFaceEXT), 14510, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetPrimitiveTopologyEXT), 14531, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetViewportWithCountEXT), 14560, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetScissorWithCountEXT), 14589, 0},
+    {offsetof(VkLayerDispatchTable, CmdBindVertexBuffers2EXT), 14617, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthTestEnableEXT), 14644, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthWriteEnableEXT), 14671, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthCompareOpEXT), 14699, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBoundsTestEnableEXT), 14725, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilTestEnableEXT), 14758, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetStencilOpEXT), 14787, 0},
+
+    // ---- VK_EXT_host_image_copy extension commands
+    {offsetof(VkLayerDispatchTable, CopyMemoryToImageEXT), 14808, 0},
+    {offsetof(VkLayerDispatchTable, CopyImageToMemoryEXT), 14831, 0},
+    {offsetof(VkLayerDispatchTable, CopyImageToImageEXT), 14854, 0},
+    {offsetof(VkLayerDispatchTable, TransitionImageLayoutEXT), 14876, 0},
+    {offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2EXT), 14903, 0},
+
+    // ---- VK_EXT_swapchain_maintenance1 extension commands
+    {offsetof(VkLayerDispatchTable, ReleaseSwapchainImagesEXT), 14935, 0},
+
+    // ---- VK_NV_device_generated_commands extension commands
+    {offsetof(VkLayerDispatchTable, GetGeneratedCommandsMemoryRequirementsNV), 14963, 0},
+    {offsetof(VkLayerDispatchTable, CmdPreprocessGeneratedCommandsNV), 15006, 0},
+    {offsetof(VkLayerDispatchTable, CmdExecuteGeneratedCommandsNV), 15041, 0},
+    {offsetof(VkLayerDispatchTable, CmdBindPipelineShaderGroupNV), 15073, 0},
+    {offsetof(VkLayerDispatchTable, CreateIndirectCommandsLayoutNV), 15104, 0},
+    {offsetof(VkLayerDispatchTable, DestroyIndirectCommandsLayoutNV), 15137, 0},
+
+    // ---- VK_EXT_depth_bias_control extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBias2EXT), 15171, 0},
+
+    // ---- VK_EXT_private_data extension commands
+    {offsetof(VkLayerDispatchTable, CreatePrivateDataSlotEXT), 15235, 0},
+    {offsetof(VkLayerDispatchTable, DestroyPrivateDataSlotEXT), 15262, 0},
+    {offsetof(VkLayerDispatchTable, SetPrivateDataEXT), 15290, 0},
+    {offsetof(VkLayerDispatchTable, GetPrivateDataEXT), 15310, 0},
+
+    // ---- VK_NV_cuda_kernel_launch extension commands
+    {offsetof(VkLayerDispatchTable, CreateCudaModuleNV), 15330, 0},
+    {offsetof(VkLayerDispatchTable, GetCudaModuleCacheNV), 15351, 0},
+    {offsetof(VkLayerDispatchTable, CreateCudaFunctionNV), 15374, 0},
+    {offsetof(VkLayerDispatchTable, DestroyCudaModuleNV), 15397, 0},
+    {offsetof(VkLayerDispatchTable, DestroyCudaFunctionNV), 15419, 0},
+    {offsetof(VkLayerDispatchTable, CmdCudaLaunchKernelNV), 15443, 0},
+
+    // ---- VK_EXT_metal_objects extension commands
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    {offsetof(VkLayerDispatchTable, ExportMetalObjectsEXT), 15467, 0},
+#endif // VK_USE_PLATFORM_METAL_EXT
+
+    // ---- VK_EXT_descriptor_buffer extension commands
+    {offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSizeEXT), 15491, 0},
+    {offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutBindingOffsetEXT), 15523, 0},
+    {offsetof(VkLayerDispatchTable, GetDescriptorEXT), 15564, 0},
+    {offsetof(VkLayerDispatchTable, CmdBindDescriptorBuffersEXT), 15583, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDescriptorBufferOffsetsEXT), 15613, 0},
+    {offsetof(VkLayerDispatchTable, CmdBindDescriptorBufferEmbeddedSamplersEXT), 15648, 0},
+    {offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureDescriptorDataEXT), 15693, 0},
+    {offsetof(VkLayerDispatchTable, GetImageOpaqueCaptureDescriptorDataEXT), 15735, 0},
+    {offsetof(VkLayerDispatchTable, GetImageViewOpaqueCaptureDescriptorDataEXT), 15776, 0},
+    {offsetof(VkLayerDispatchTable, GetSamplerOpaqueCaptureDescriptorDataEXT), 15821, 0},
+    {offsetof(VkLayerDispatchTable, GetAccelerationStructureOpaqueCaptureDescriptorDataEXT), 15864, 0},
+
+    // ---- VK_NV_fragment_shading_rate_enums extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetFragmentShadingRateEnumNV), 15921, 0},
+
+    // ---- VK_EXT_device_fault extension commands
+    {offsetof(VkLayerDispatchTable, GetDeviceFaultInfoEXT), 15955, 0},
+
+    // ---- VK_EXT_vertex_input_dynamic_state extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetVertexInputEXT), 16100, 0},
+
+    // ---- VK_FUCHSIA_external_memory extension commands
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, GetMemoryZirconHandleFUCHSIA), 16123, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, GetMemoryZirconHandlePropertiesFUCHSIA), 16154, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+
+    // ---- VK_FUCHSIA_external_semaphore extension commands
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, ImportSemaphoreZirconHandleFUCHSIA), 16195, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, GetSemaphoreZirconHandleFUCHSIA), 16232, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+
+    // ---- VK_FUCHSIA_buffer_collection extension commands
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, CreateBufferCollectionFUCHSIA), 16266, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, SetBufferCollectionImageConstraintsFUCHSIA), 16298, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, SetBufferCollectionBufferConstraintsFUCHSIA), 16343, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, DestroyBufferCollectionFUCHSIA), 16389, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerDispatchTable, GetBufferCollectionPropertiesFUCHSIA), 16422, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+
+    // ---- VK_HUAWEI_subpass_shading extension commands
+    {offsetof(VkLayerDispatchTable, GetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI), 16461, 0},
+    {offsetof(VkLayerDispatchTable, CmdSubpassShadingHUAWEI), 16509, 0},
+
+    // ---- VK_HUAWEI_invocation_mask extension commands
+    {offsetof(VkLayerDispatchTable, CmdBindInvocationMaskHUAWEI), 16535, 0},
+
+    // ---- VK_NV_external_memory_rdma extension commands
+    {offsetof(VkLayerDispatchTable, GetMemoryRemoteAddressNV), 16565, 0},
+
+    // ---- VK_EXT_pipeline_properties extension commands
+    {offsetof(VkLayerDispatchTable, GetPipelinePropertiesEXT), 16592, 0},
+
+    // ---- VK_EXT_extended_dynamic_state2 extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetPatchControlPointsEXT), 16619, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetRasterizerDiscardEnableEXT), 16649, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthBiasEnableEXT), 16684, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetLogicOpEXT), 16711, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetPrimitiveRestartEnableEXT), 16730, 0},
+
+    // ---- VK_EXT_color_write_enable extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetColorWriteEnableEXT), 16837, 0},
+
+    // ---- VK_EXT_multi_draw extension commands
+    {offsetof(VkLayerDispatchTable, CmdDrawMultiEXT), 16865, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawMultiIndexedEXT), 16883, 0},
+
+    // ---- VK_EXT_opacity_micromap extension commands
+    {offsetof(VkLayerDispatchTable, CreateMicromapEXT), 16908, 0},
+    {offsetof(VkLayerDispatchTable, DestroyMicromapEXT), 16928, 0},
+    {offsetof(VkLayerDispatchTable, CmdBuildMicromapsEXT), 16949, 0},
+    {offsetof(VkLayerDispatchTable, BuildMicromapsEXT), 16972, 0},
+    {offsetof(VkLayerDispatchTable, CopyMicromapEXT), 16992, 0},
+    {offsetof(VkLayerDispatchTable, CopyMicromapToMemoryEXT), 17010, 0},
+    {offsetof(VkLayerDispatchTable, CopyMemoryToMicromapEXT), 17036, 0},
+    {offsetof(VkLayerDispatchTable, WriteMicromapsPropertiesEXT), 17062, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyMicromapEXT), 17092, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyMicromapToMemoryEXT), 17113, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyMemoryToMicromapEXT), 17142, 0},
+    {offsetof(VkLayerDispatchTable, CmdWriteMicromapsPropertiesEXT), 17171, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceMicromapCompatibilityEXT), 17204, 0},
+    {offsetof(VkLayerDispatchTable, GetMicromapBuildSizesEXT), 17240, 0},
+
+    // ---- VK_HUAWEI_cluster_culling_shader extension commands
+    {offsetof(VkLayerDispatchTable, CmdDrawClusterHUAWEI), 17267, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawClusterIndirectHUAWEI), 17290, 0},
+
+    // ---- VK_EXT_pageable_device_local_memory extension commands
+    {offsetof(VkLayerDispatchTable, SetDeviceMemoryPriorityEXT), 17321, 0},
+
+    // ---- VK_VALVE_descriptor_set_host_mapping extension commands
+    {offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutHostMappingInfoVALVE), 17350, 0},
+    {offsetof(VkLayerDispatchTable, GetDescriptorSetHostMappingVALVE), 17395, 0},
+
+    // ---- VK_NV_copy_memory_indirect extension commands
+    {offsetof(VkLayerDispatchTable, CmdCopyMemoryIndirectNV), 17430, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyMemoryToImageIndirectNV), 17456, 0},
+
+    // ---- VK_NV_memory_decompression extension commands
+    {offsetof(VkLayerDispatchTable, CmdDecompressMemoryNV), 17489, 0},
+    {offsetof(VkLayerDispatchTable, CmdDecompressMemoryIndirectCountNV), 17513, 0},
+
+    // ---- VK_NV_device_generated_commands_compute extension commands
+    {offsetof(VkLayerDispatchTable, GetPipelineIndirectMemoryRequirementsNV), 17550, 0},
+    {offsetof(VkLayerDispatchTable, CmdUpdatePipelineIndirectBufferNV), 17592, 0},
+    {offsetof(VkLayerDispatchTable, GetPipelineIndirectDeviceAddressNV), 17628, 0},
+
+    // ---- VK_EXT_extended_dynamic_state3 extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetDepthClampEnableEXT), 17665, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetPolygonModeEXT), 17693, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetRasterizationSamplesEXT), 17716, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetSampleMaskEXT), 17748, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetAlphaToCoverageEnableEXT), 17770, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetAlphaToOneEnableEXT), 17803, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetLogicOpEnableEXT), 17831, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetColorBlendEnableEXT), 17856, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetColorBlendEquationEXT), 17884, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetColorWriteMaskEXT), 17914, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetTessellationDomainOriginEXT), 17940, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetRasterizationStreamEXT), 17976, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetConservativeRasterizationModeEXT), 18007, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetExtraPrimitiveOverestimationSizeEXT), 18048, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthClipEnableEXT), 18092, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetSampleLocationsEnableEXT), 18119, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetColorBlendAdvancedEXT), 18152, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetProvokingVertexModeEXT), 18182, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetLineRasterizationModeEXT), 18213, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetLineStippleEnableEXT), 18246, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthClipNegativeOneToOneEXT), 18275, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetViewportWScalingEnableNV), 18312, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetViewportSwizzleNV), 18345, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoverageToColorEnableNV), 18371, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoverageToColorLocationNV), 18403, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoverageModulationModeNV), 18437, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoverageModulationTableEnableNV), 18470, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoverageModulationTableNV), 18510, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetShadingRateImageEnableNV), 18544, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetRepresentativeFragmentTestEnableNV), 18577, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetCoverageReductionModeNV), 18620, 0},
+
+    // ---- VK_EXT_shader_module_identifier extension commands
+    {offsetof(VkLayerDispatchTable, GetShaderModuleIdentifierEXT), 18652, 0},
+    {offsetof(VkLayerDispatchTable, GetShaderModuleCreateInfoIdentifierEXT), 18683, 0},
+
+    // ---- VK_NV_optical_flow extension commands
+    {offsetof(VkLayerDispatchTable, CreateOpticalFlowSessionNV), 18769, 0},
+    {offsetof(VkLayerDispatchTable, DestroyOpticalFlowSessionNV), 18798, 0},
+    {offsetof(VkLayerDispatchTable, BindOpticalFlowSessionImageNV), 18828, 0},
+    {offsetof(VkLayerDispatchTable, CmdOpticalFlowExecuteNV), 18860, 0},
+
+    // ---- VK_AMD_anti_lag extension commands
+    {offsetof(VkLayerDispatchTable, AntiLagUpdateAMD), 18886, 0},
+
+    // ---- VK_EXT_shader_object extension commands
+    {offsetof(VkLayerDispatchTable, CreateShadersEXT), 18905, 0},
+    {offsetof(VkLayerDispatchTable, DestroyShaderEXT), 18924, 0},
+    {offsetof(VkLayerDispatchTable, GetShaderBinaryDataEXT), 18943, 0},
+    {offsetof(VkLayerDispatchTable, CmdBindShadersEXT), 18968, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetDepthClampRangeEXT), 18988, 0},
+
+    // ---- VK_QCOM_tile_properties extension commands
+    {offsetof(VkLayerDispatchTable, GetFramebufferTilePropertiesQCOM), 19015, 0},
+    {offsetof(VkLayerDispatchTable, GetDynamicRenderingTilePropertiesQCOM), 19050, 0},
+
+    // ---- VK_NV_low_latency2 extension commands
+    {offsetof(VkLayerDispatchTable, SetLatencySleepModeNV), 19090, 0},
+    {offsetof(VkLayerDispatchTable, LatencySleepNV), 19114, 0},
+    {offsetof(VkLayerDispatchTable, SetLatencyMarkerNV), 19131, 0},
+    {offsetof(VkLayerDispatchTable, GetLatencyTimingsNV), 19152, 0},
+    {offsetof(VkLayerDispatchTable, QueueNotifyOutOfBandNV), 19174, 0},
+
+    // ---- VK_EXT_attachment_feedback_loop_dynamic_state extension commands
+    {offsetof(VkLayerDispatchTable, CmdSetAttachmentFeedbackLoopEnableEXT), 19199, 0},
+
+    // ---- VK_QNX_external_memory_screen_buffer extension commands
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    {offsetof(VkLayerDispatchTable, GetScreenBufferPropertiesQNX), 19239, 0},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+
+    // ---- VK_EXT_device_generated_commands extension commands
+    {offsetof(VkLayerDispatchTable, GetGeneratedCommandsMemoryRequirementsEXT), 19270, 0},
+    {offsetof(VkLayerDispatchTable, CmdPreprocessGeneratedCommandsEXT), 19314, 0},
+    {offsetof(VkLayerDispatchTable, CmdExecuteGeneratedCommandsEXT), 19350, 0},
+    {offsetof(VkLayerDispatchTable, CreateIndirectCommandsLayoutEXT), 19383, 0},
+    {offsetof(VkLayerDispatchTable, DestroyIndirectCommandsLayoutEXT), 19417, 0},
+    {offsetof(VkLayerDispatchTable, CreateIndirectExecutionSetEXT), 19452, 0},
+    {offsetof(VkLayerDispatchTable, DestroyIndirectExecutionSetEXT), 19484, 0},
+    {offsetof(VkLayerDispatchTable, UpdateIndirectExecutionSetPipelineEXT), 19517, 0},
+    {offsetof(VkLayerDispatchTable, UpdateIndirectExecutionSetShaderEXT), 19557, 0},
+
+    // ---- VK_KHR_acceleration_structure extension commands
+    {offsetof(VkLayerDispatchTable, CreateAccelerationStructureKHR), 19662, 0},
+    {offsetof(VkLayerDispatchTable, DestroyAccelerationStructureKHR), 19695, 0},
+    {offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructuresKHR), 19729, 0},
+    {offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructuresIndirectKHR), 19765, 0},
+    {offsetof(VkLayerDispatchTable, BuildAccelerationStructuresKHR), 19809, 0},
+    {offsetof(VkLayerDispatchTable, CopyAccelerationStructureKHR), 19842, 0},
+    {offsetof(VkLayerDispatchTable, CopyAccelerationStructureToMemoryKHR), 19873, 0},
+    {offsetof(VkLayerDispatchTable, CopyMemoryToAccelerationStructureKHR), 19912, 0},
+    {offsetof(VkLayerDispatchTable, WriteAccelerationStructuresPropertiesKHR), 19951, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureKHR), 19994, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureToMemoryKHR), 20028, 0},
+    {offsetof(VkLayerDispatchTable, CmdCopyMemoryToAccelerationStructureKHR), 20070, 0},
+    {offsetof(VkLayerDispatchTable, GetAccelerationStructureDeviceAddressKHR), 20112, 0},
+    {offsetof(VkLayerDispatchTable, CmdWriteAccelerationStructuresPropertiesKHR), 20155, 0},
+    {offsetof(VkLayerDispatchTable, GetDeviceAccelerationStructureCompatibilityKHR), 20201, 0},
+    {offsetof(VkLayerDispatchTable, GetAccelerationStructureBuildSizesKHR), 20250, 0},
+
+    // ---- VK_KHR_ray_tracing_pipeline extension commands
+    {offsetof(VkLayerDispatchTable, CmdTraceRaysKHR), 20290, 0},
+    {offsetof(VkLayerDispatchTable, CreateRayTracingPipelinesKHR), 20308, 0},
+    {offsetof(VkLayerDispatchTable, GetRayTracingCaptureReplayShaderGroupHandlesKHR), 20339, 0},
+    {offsetof(VkLayerDispatchTable, CmdTraceRaysIndirectKHR), 20389, 0},
+    {offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupStackSizeKHR), 20415, 0},
+    {offsetof(VkLayerDispatchTable, CmdSetRayTracingPipelineStackSizeKHR), 20454, 0},
+
+    // ---- VK_EXT_mesh_shader extension commands
+    {offsetof(VkLayerDispatchTable, CmdDrawMeshTasksEXT), 20493, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectEXT), 20515, 0},
+    {offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectCountEXT), 20545, 0},
+};
+
+// Init Device function pointer dispatch table with extension commands
+VKAPI_ATTR void VKAPI_CALL loader_init_device_extension_dispatch_table(struct loader_dev_dispatch_table *dev_table,
+                                                                       PFN_vkGetInstanceProcAddr gipa,
+                                                                       PFN_vkGetDeviceProcAddr gdpa,
+                                                                       VkInstance inst,
+                                                                       VkDevice dev) {
+    VkLayerDispatchTable *table = &dev_table->core_dispatch;
+    table->magic = DEVICE_DISP_TABLE_MAGIC_NUMBER;
+    loader_init_instance_dispatch_entries(table, device_extension_gipa_dispatch_init_table, sizeof(device_extension_gipa_dispatch_init_table) / sizeof(device_extension_gipa_dispatch_init_table[0]), gipa, inst);
+    loader_init_device_dispatch_entries(table, device_extension_gdpa_dispatch_init_table, sizeof(device_extension_gdpa_dispatch_init_table) / sizeof(device_extension_gdpa_dispatch_init_table[0]), UINT32_MAX, gdpa, dev);
+}
+
+static const struct loader_dispatch_table_init_entry instance_core_dispatch_init_table[] = {
+    // ---- Core Vulkan 1.0 commands
+    {offsetof(VkLayerInstanceDispatchTable, DestroyInstance), 18, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDevices), 36, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFeatures), 63, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFormatProperties), 91, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceImageFormatProperties), 127, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceProperties), 168, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyProperties), 198, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMemoryProperties), 239, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, EnumerateDeviceExtensionProperties), 387, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, EnumerateDeviceLayerProperties), 459, VK_API_VERSION_1_0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSparseImageFormatProperties), 828, VK_API_VERSION_1_0},
+
+    // ---- Core Vulkan 1.1 commands
+    {offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDeviceGroups), 3044, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFeatures2), 3173, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceProperties2), 3202, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFormatProperties2), 3233, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceImageFormatProperties2), 3270, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyProperties2), 3312, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMemoryProperties2), 3354, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSparseImageFormatProperties2), 3391, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalBufferProperties), 3639, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalFenceProperties), 3683, VK_API_VERSION_1_1},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalSemaphoreProperties), 3726, VK_API_VERSION_1_1},
+
+    // ---- Core Vulkan 1.3 commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceToolProperties), 4112, VK_API_VERSION_1_3},
+};
+
+// Init Instance function pointer dispatch table with core commands
+VKAPI_ATTR void VKAPI_CALL loader_init_instance_core_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,
+                                                                    VkInstance inst) {
+    loader_init_instance_dispatch_entries(table, instance_core_dispatch_init_table, sizeof(instance_core_dispatch_init_table) / sizeof(instance_core_dispatch_init_table[0]), gpa, inst);
+    table->GetInstanceProcAddr = gpa;
+}
+
+static const struct loader_dispatch_table_init_entry instance_extension_dispatch_init_table[] = {
+    // ---- VK_KHR_surface extension commands
+    {offsetof(VkLayerInstanceDispatchTable, DestroySurfaceKHR), 5457, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceSupportKHR), 5477, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceCapabilitiesKHR), 5514, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceFormatsKHR), 5556, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfacePresentModesKHR), 5593, 0},
+
+    // ---- VK_KHR_swapchain extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDevicePresentRectanglesKHR), 5820, 0},
+
+    // ---- VK_KHR_display extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayPropertiesKHR), 5883, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayPlanePropertiesKHR), 5923, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetDisplayPlaneSupportedDisplaysKHR), 5968, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetDisplayModePropertiesKHR), 6006, 0},
+    {offsetof(VkLayerInstanceDispatchTable, CreateDisplayModeKHR), 6036, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetDisplayPlaneCapabilitiesKHR), 6059, 0},
+    {offsetof(VkLayerInstanceDispatchTable, CreateDisplayPlaneSurfaceKHR), 6092, 0},
+
+    // ---- VK_KHR_xlib_surface extension commands
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, CreateXlibSurfaceKHR), 6151, 0},
+#endif // VK_USE_PLATFORM_XLIB_KHR
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceXlibPresentationSupportKHR), 6174, 0},
+#endif // VK_USE_PLATFORM_XLIB_KHR
+
+    // ---- VK_KHR_xcb_surface extension commands
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, CreateXcbSurfaceKHR), 6220, 0},
+#endif // VK_USE_PLATFORM_XCB_KHR
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceXcbPresentationSupportKHR), 6242, 0},
+#endif // VK_USE_PLATFORM_XCB_KHR
+
+    // ---- VK_KHR_wayland_surface extension commands
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, CreateWaylandSurfaceKHR), 6287, 0},
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceWaylandPresentationSupportKHR), 6313, 0},
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+
+    // ---- VK_KHR_android_surface extension commands
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, CreateAndroidSurfaceKHR), 6362, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+
+    // ---- VK_KHR_win32_surface extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, CreateWin32SurfaceKHR), 6388, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceWin32PresentationSupportKHR), 6412, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_KHR_video_queue extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceVideoCapabilitiesKHR), 6459, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceVideoFormatPropertiesKHR), 6499, 0},
+
+    // ---- VK_KHR_get_physical_device_properties2 extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFeatures2KHR), 6901, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceProperties2KHR), 6933, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFormatProperties2KHR), 6967, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceImageFormatProperties2KHR), 7007, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyProperties2KHR), 7052, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMemoryProperties2KHR), 7097, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSparseImageFormatProperties2KHR), 7137, 0},
+
+    // ---- VK_KHR_device_group_creation extension commands
+    {offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDeviceGroupsKHR), 7290, 0},
+
+    // ---- VK_KHR_external_memory_capabilities extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalBufferPropertiesKHR), 7325, 0},
+
+    // ---- VK_KHR_external_semaphore_capabilities extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalSemaphorePropertiesKHR), 7478, 0},
+
+    // ---- VK_KHR_external_fence_capabilities extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalFencePropertiesKHR), 7922, 0},
+
+    // ---- VK_KHR_performance_query extension commands
+    {offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR), 8056, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR), 8120, 0},
+
+    // ---- VK_KHR_get_surface_capabilities2 extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceCapabilities2KHR), 8228, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceFormats2KHR), 8271, 0},
+
+    // ---- VK_KHR_get_display_properties2 extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayProperties2KHR), 8309, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayPlaneProperties2KHR), 8350, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetDisplayModeProperties2KHR), 8396, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetDisplayPlaneCapabilities2KHR), 8427, 0},
+
+    // ---- VK_KHR_fragment_shading_rate extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFragmentShadingRatesKHR), 8846, 0},
+
+    // ---- VK_KHR_video_encode_queue extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR), 9443, 0},
+
+    // ---- VK_KHR_cooperative_matrix extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCooperativeMatrixPropertiesKHR), 10226, 0},
+
+    // ---- VK_KHR_calibrated_timestamps extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCalibrateableTimeDomainsKHR), 10299, 0},
+
+    // ---- VK_EXT_debug_report extension commands
+    {offsetof(VkLayerInstanceDispatchTable, CreateDebugReportCallbackEXT), 10574, 0},
+    {offsetof(VkLayerInstanceDispatchTable, DestroyDebugReportCallbackEXT), 10605, 0},
+    {offsetof(VkLayerInstanceDispatchTable, DebugReportMessageEXT), 10637, 0},
+
+    // ---- VK_GGP_stream_descriptor_surface extension commands
+#if defined(VK_USE_PLATFORM_GGP)
+    {offsetof(VkLayerInstanceDispatchTable, CreateStreamDescriptorSurfaceGGP), 11233, 0},
+#endif // VK_USE_PLATFORM_GGP
+
+    // ---- VK_NV_external_memory_capabilities extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalImageFormatPropertiesNV), 11268, 0},
+
+    // ---- VK_NN_vi_surface extension commands
+#if defined(VK_USE_PLATFORM_VI_NN)
+    {offsetof(VkLayerInstanceDispatchTable, CreateViSurfaceNN), 11344, 0},
+#endif // VK_USE_PLATFORM_VI_NN
+
+    // ---- VK_EXT_direct_mode_display extension commands
+    {offsetof(VkLayerInstanceDispatchTable, ReleaseDisplayEXT), 11457, 0},
+
+    // ---- VK_EXT_acquire_xlib_display extension commands
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    {offsetof(VkLayerInstanceDispatchTable, AcquireXlibDisplayEXT), 11477, 0},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    {offsetof(VkLayerInstanceDispatchTable, GetRandROutputDisplayEXT), 11501, 0},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+
+    // ---- VK_EXT_display_surface_counter extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceCapabilities2EXT), 11528, 0},
+
+    // ---- VK_MVK_ios_surface extension commands
+#if defined(VK_USE_PLATFORM_IOS_MVK)
+    {offsetof(VkLayerInstanceDispatchTable, CreateIOSSurfaceMVK), 11852, 0},
+#endif // VK_USE_PLATFORM_IOS_MVK
+
+    // ---- VK_MVK_macos_surface extension commands
+#if defined(VK_USE_PLATFORM_MACOS_MVK)
+    {offsetof(VkLayerInstanceDispatchTable, CreateMacOSSurfaceMVK), 11874, 0},
+#endif // VK_USE_PLATFORM_MACOS_MVK
+
+    // ---- VK_EXT_debug_utils extension commands
+    {offsetof(VkLayerInstanceDispatchTable, CreateDebugUtilsMessengerEXT), 12133, 0},
+    {offsetof(VkLayerInstanceDispatchTable, DestroyDebugUtilsMessengerEXT), 12164, 0},
+    {offsetof(VkLayerInstanceDispatchTable, SubmitDebugUtilsMessageEXT), 12196, 0},
+
+    // ---- VK_EXT_sample_locations extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMultisamplePropertiesEXT), 12584, 0},
+
+    // ---- VK_EXT_calibrated_timestamps extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCalibrateableTimeDomainsEXT), 13396, 0},
+
+    // ---- VK_FUCHSIA_imagepipe_surface extension commands
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    {offsetof(VkLayerInstanceDispatchTable, CreateImagePipeSurfaceFUCHSIA), 14029, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+
+    // ---- VK_EXT_metal_surface extension commands
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    {offsetof(VkLayerInstanceDispatchTable, CreateMetalSurfaceEXT), 14061, 0},
+#endif // VK_USE_PLATFORM_METAL_EXT
+
+    // ---- VK_EXT_tooling_info extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceToolPropertiesEXT), 14113, 0},
+
+    // ---- VK_NV_cooperative_matrix extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCooperativeMatrixPropertiesNV), 14150, 0},
+
+    // ---- VK_NV_coverage_reduction_mode extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV), 14199, 0},
+
+    // ---- VK_EXT_full_screen_exclusive extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfacePresentModes2EXT), 14265, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_headless_surface extension commands
+    {offsetof(VkLayerInstanceDispatchTable, CreateHeadlessSurfaceEXT), 14420, 0},
+
+    // ---- VK_EXT_acquire_drm_display extension commands
+    {offsetof(VkLayerInstanceDispatchTable, AcquireDrmDisplayEXT), 15193, 0},
+    {offsetof(VkLayerInstanceDispatchTable, GetDrmDisplayEXT), 15216, 0},
+
+    // ---- VK_NV_acquire_winrt_display extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, AcquireWinrtDisplayNV), 15979, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    {offsetof(VkLayerInstanceDispatchTable, GetWinrtDisplayNV), 16003, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_directfb_surface extension commands
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    {offsetof(VkLayerInstanceDispatchTable, CreateDirectFBSurfaceEXT), 16023, 0},
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDirectFBPresentationSupportEXT), 16050, 0},
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+
+    // ---- VK_QNX_screen_surface extension commands
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    {offsetof(VkLayerInstanceDispatchTable, CreateScreenSurfaceQNX), 16764, 0},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceScreenPresentationSupportQNX), 16789, 0},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+
+    // ---- VK_NV_optical_flow extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceOpticalFlowImageFormatsNV), 18724, 0},
+
+    // ---- VK_NV_cooperative_matrix2 extension commands
+    {offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV), 19595, 0},
+};
+
+// Init Instance function pointer dispatch table with core commands
+VKAPI_ATTR void VKAPI_CALL loader_init_instance_extension_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,
+                                                                        VkInstance inst) {
+    loader_init_instance_dispatch_entries(table, instance_extension_dispatch_init_table, sizeof(instance_extension_dispatch_init_table) / sizeof(instance_extension_dispatch_init_table[0]), gpa, inst);
+}
+
+// Functions that required a terminator need to have a separate dispatch table which contains their corresponding
+// device function. This is used in the terminators themselves.
+void init_extension_device_proc_terminator_dispatch(struct loader_device *dev) {
+    struct loader_device_terminator_dispatch* dispatch = &dev->loader_dispatch.extension_terminator_dispatch;
+    PFN_vkGetDeviceProcAddr gpda = ICD_TERM_DISPATCH(dev->phys_dev_term->this_icd_term, GetDeviceProcAddr);
+    // ---- VK_KHR_swapchain extension commands
+    if (dev->driver_extensions.khr_swapchain_enabled)
+       dispatch->CreateSwapchainKHR = (PFN_vkCreateSwapchainKHR)gpda(dev->icd_device, "vkCreateSwapchainKHR");
+    if (dev->driver_extensions.khr_swapchain_enabled)
+       dispatch->GetDeviceGroupSurfacePresentModesKHR = (PFN_vkGetDeviceGroupSurfacePresentModesKHR)gpda(dev->icd_device, "vkGetDeviceGroupSurfacePresentModesKHR");
+    // ---- VK_KHR_display_swapchain extension commands
+    if (dev->driver_extensions.khr_display_swapchain_enabled)
+       dispatch->CreateSharedSwapchainsKHR = (PFN_vkCreateSharedSwapchainsKHR)gpda(dev->icd_device, "vkCreateSharedSwapchainsKHR");
+    // ---- VK_EXT_debug_marker extension commands
+    if (dev->driver_extensions.ext_debug_marker_enabled)
+       dispatch->DebugMarkerSetObjectTagEXT = (PFN_vkDebugMarkerSetObjectTagEXT)gpda(dev->icd_device, "vkDebugMarkerSetObjectTagEXT");
+    if (dev->driver_extensions.ext_debug_marker_enabled)
+       dispatch->DebugMarkerSetObjectNameEXT = (PFN_vkDebugMarkerSetObjectNameEXT)gpda(dev->icd_device, "vkDebugMarkerSetObjectNameEXT");
+    // ---- VK_EXT_debug_utils extension commands
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->SetDebugUtilsObjectNameEXT = (PFN_vkSetDebugUtilsObjectNameEXT)gpda(dev->icd_device, "vkSetDebugUtilsObjectNameEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->SetDebugUtilsObjectTagEXT = (PFN_vkSetDebugUtilsObjectTagEXT)gpda(dev->icd_device, "vkSetDebugUtilsObjectTagEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->QueueBeginDebugUtilsLabelEXT = (PFN_vkQueueBeginDebugUtilsLabelEXT)gpda(dev->icd_device, "vkQueueBeginDebugUtilsLabelEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->QueueEndDebugUtilsLabelEXT = (PFN_vkQueueEndDebugUtilsLabelEXT)gpda(dev->icd_device, "vkQueueEndDebugUtilsLabelEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->QueueInsertDebugUtilsLabelEXT = (PFN_vkQueueInsertDebugUtilsLabelEXT)gpda(dev->icd_device, "vkQueueInsertDebugUtilsLabelEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->CmdBeginDebugUtilsLabelEXT = (PFN_vkCmdBeginDebugUtilsLabelEXT)gpda(dev->icd_device, "vkCmdBeginDebugUtilsLabelEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->CmdEndDebugUtilsLabelEXT = (PFN_vkCmdEndDebugUtilsLabelEXT)gpda(dev->icd_device, "vkCmdEndDebugUtilsLabelEXT");
+    if (dev->driver_extensions.ext_debug_utils_enabled)
+       dispatch->CmdInsertDebugUtilsLabelEXT = (PFN_vkCmdInsertDebugUtilsLabelEXT)gpda(dev->icd_device, "vkCmdInsertDebugUtilsLabelEXT");
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    // ---- VK_EXT_full_screen_exclusive extension commands
+    if (dev->driver_extensions.ext_full_screen_exclusive_enabled && (dev->driver_extensions.khr_device_group_enabled || dev->driver_extensions.version_1_1_enabled))
+       dispatch->GetDeviceGroupSurfacePresentModes2EXT = (PFN_vkGetDeviceGroupSurfacePresentModes2EXT)gpda(dev->icd_device, "vkGetDeviceGroupSurfacePresentModes2EXT");
+#endif // VK_USE_PLATFORM_WIN32_KHR
+}
+
+// Offsets in VkLayerDispatchTable of the entries of struct loader_hot_dispatch_table, in the same order
+static const uint16_t hot_dispatch_table_offsets[] = {
+    offsetof(VkLayerDispatchTable, CmdDrawIndexed),
+    offsetof(VkLayerDispatchTable, CmdDraw),
+    offsetof(VkLayerDispatchTable, CmdBindDescriptorSets),
+    offsetof(VkLayerDispatchTable, CmdBindPipeline),
+    offsetof(VkLayerDispatchTable, CmdPushConstants),
+    offsetof(VkLayerDispatchTable, CmdBindVertexBuffers),
+    offsetof(VkLayerDispatchTable, CmdBindIndexBuffer),
+    offsetof(VkLayerDispatchTable, CmdSetViewport),
+    offsetof(VkLayerDispatchTable, CmdSetScissor),
+    offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirect),
+    offsetof(VkLayerDispatchTable, CmdDrawIndirect),
+    offsetof(VkLayerDispatchTable, CmdDispatch),
+    offsetof(VkLayerDispatchTable, CmdPipelineBarrier),
+    offsetof(VkLayerDispatchTable, CmdPipelineBarrier2),
+    offsetof(VkLayerDispatchTable, CmdCopyBuffer),
+    offsetof(VkLayerDispatchTable, CmdCopyBufferToImage),
+    offsetof(VkLayerDispatchTable, CmdBeginRenderPass),
+    offsetof(VkLayerDispatchTable, CmdEndRenderPass),
+    offsetof(VkLayerDispatchTable, CmdBeginRendering),
+    offsetof(VkLayerDispatchTable, CmdEndRendering),
+    offsetof(VkLayerDispatchTable, BeginCommandBuffer),
+    offsetof(VkLayerDispatchTable, EndCommandBuffer),
+    offsetof(VkLayerDispatchTable, ResetCommandPool),
+    offsetof(VkLayerDispatchTable, QueueSubmit),
+    offsetof(VkLayerDispatchTable, QueueSubmit2),
+    offsetof(VkLayerDispatchTable, AcquireNextImageKHR),
+    offsetof(VkLayerDispatchTable, QueuePresentKHR),
+    offsetof(VkLayerDispatchTable, WaitForFences),
+    offsetof(VkLayerDispatchTable, ResetFences),
+    offsetof(VkLayerDispatchTable, GetDeviceProcAddr),
+    offsetof(VkLayerDispatchTable, DestroyDevice),
+    offsetof(VkLayerDispatchTable, GetDeviceQueue),
+    offsetof(VkLayerDispatchTable, QueueWaitIdle),
+    offsetof(VkLayerDispatchTable, DeviceWaitIdle),
+    offsetof(VkLayerDispatchTable, AllocateMemory),
+    offsetof(VkLayerDispatchTable, FreeMemory),
+    offsetof(VkLayerDispatchTable, MapMemory),
+    offsetof(VkLayerDispatchTable, UnmapMemory),
+    offsetof(VkLayerDispatchTable, FlushMappedMemoryRanges),
+    offsetof(VkLayerDispatchTable, InvalidateMappedMemoryRanges),
+    offsetof(VkLayerDispatchTable, GetDeviceMemoryCommitment),
+    offsetof(VkLayerDispatchTable, BindBufferMemory),
+    offsetof(VkLayerDispatchTable, BindImageMemory),
+    offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements),
+    offsetof(VkLayerDispatchTable, GetImageMemoryRequirements),
+    offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements),
+    offsetof(VkLayerDispatchTable, QueueBindSparse),
+    offsetof(VkLayerDispatchTable, CreateFence),
+    offsetof(VkLayerDispatchTable, DestroyFence),
+    offsetof(VkLayerDispatchTable, GetFenceStatus),
+    offsetof(VkLayerDispatchTable, CreateSemaphore),
+    offsetof(VkLayerDispatchTable, DestroySemaphore),
+    offsetof(VkLayerDispatchTable, CreateEvent),
+    offsetof(VkLayerDispatchTable, DestroyEvent),
+    offsetof(VkLayerDispatchTable, GetEventStatus),
+    offsetof(VkLayerDispatchTable, SetEvent),
+    offsetof(VkLayerDispatchTable, ResetEvent),
+    offsetof(VkLayerDispatchTable, CreateQueryPool),
+    offsetof(VkLayerDispatchTable, DestroyQueryPool),
+    offsetof(VkLayerDispatchTable, GetQueryPoolResults),
+    offsetof(VkLayerDispatchTable, CreateBuffer),
+    offsetof(VkLayerDispatchTable, DestroyBuffer),
+    offsetof(VkLayerDispatchTable, CreateBufferView),
+    offsetof(VkLayerDispatchTable, DestroyBufferView),
+    offsetof(VkLayerDispatchTable, CreateImage),
+    offsetof(VkLayerDispatchTable, DestroyImage),
+    offsetof(VkLayerDispatchTable, GetImageSubresourceLayout),
+    offsetof(VkLayerDispatchTable, CreateImageView),
+    offsetof(VkLayerDispatchTable, DestroyImageView),
+    offsetof(VkLayerDispatchTable, CreateShaderModule),
+    offsetof(VkLayerDispatchTable, DestroyShaderModule),
+    offsetof(VkLayerDispatchTable, CreatePipelineCache),
+    offsetof(VkLayerDispatchTable, DestroyPipelineCache),
+    offsetof(VkLayerDispatchTable, GetPipelineCacheData),
+    offsetof(VkLayerDispatchTable, MergePipelineCaches),
+    offsetof(VkLayerDispatchTable, CreateGraphicsPipelines),
+    offsetof(VkLayerDispatchTable, CreateComputePipelines),
+    offsetof(VkLayerDispatchTable, DestroyPipeline),
+    offsetof(VkLayerDispatchTable, CreatePipelineLayout),
+    offsetof(VkLayerDispatchTable, DestroyPipelineLayout),
+    offsetof(VkLayerDispatchTable, CreateSampler),
+    offsetof(VkLayerDispatchTable, DestroySampler),
+    offsetof(VkLayerDispatchTable, CreateDescriptorSetLayout),
+    offsetof(VkLayerDispatchTable, DestroyDescriptorSetLayout),
+    offsetof(VkLayerDispatchTable, CreateDescriptorPool),
+    offsetof(VkLayerDispatchTable, DestroyDescriptorPool),
+    offsetof(VkLayerDispatchTable, ResetDescriptorPool),
+    offsetof(VkLayerDispatchTable, AllocateDescriptorSets),
+    offsetof(VkLayerDispatchTable, FreeDescriptorSets),
+    offsetof(VkLayerDispatchTable, UpdateDescriptorSets),
+    offsetof(VkLayerDispatchTable, CreateFramebuffer),
+    offsetof(VkLayerDispatchTable, DestroyFramebuffer),
+    offsetof(VkLayerDispatchTable, CreateRenderPass),
+    offsetof(VkLayerDispatchTable, DestroyRenderPass),
+    offsetof(VkLayerDispatchTable, GetRenderAreaGranularity),
+    offsetof(VkLayerDispatchTable, CreateCommandPool),
+    offsetof(VkLayerDispatchTable, DestroyCommandPool),
+    offsetof(VkLayerDispatchTable, AllocateCommandBuffers),
+    offsetof(VkLayerDispatchTable, FreeCommandBuffers),
+    offsetof(VkLayerDispatchTable, ResetCommandBuffer),
+    offsetof(VkLayerDispatchTable, CmdSetLineWidth),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBias),
+    offsetof(VkLayerDispatchTable, CmdSetBlendConstants),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBounds),
+    offsetof(VkLayerDispatchTable, CmdSetStencilCompareMask),
+    offsetof(VkLayerDispatchTable, CmdSetStencilWriteMask),
+    offsetof(VkLayerDispatchTable, CmdSetStencilReference),
+    offsetof(VkLayerDispatchTable, CmdDispatchIndirect),
+    offsetof(VkLayerDispatchTable, CmdCopyImage),
+    offsetof(VkLayerDispatchTable, CmdBlitImage),
+    offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer),
+    offsetof(VkLayerDispatchTable, CmdUpdateBuffer),
+    offsetof(VkLayerDispatchTable, CmdFillBuffer),
+    offsetof(VkLayerDispatchTable, CmdClearColorImage),
+    offsetof(VkLayerDispatchTable, CmdClearDepthStencilImage),
+    offsetof(VkLayerDispatchTable, CmdClearAttachments),
+    offsetof(VkLayerDispatchTable, CmdResolveImage),
+    offsetof(VkLayerDispatchTable, CmdSetEvent),
+    offsetof(VkLayerDispatchTable, CmdResetEvent),
+    offsetof(VkLayerDispatchTable, CmdWaitEvents),
+    offsetof(VkLayerDispatchTable, CmdBeginQuery),
+    offsetof(VkLayerDispatchTable, CmdEndQuery),
+    offsetof(VkLayerDispatchTable, CmdResetQueryPool),
+    offsetof(VkLayerDispatchTable, CmdWriteTimestamp),
+    offsetof(VkLayerDispatchTable, CmdCopyQueryPoolResults),
+    offsetof(VkLayerDispatchTable, CmdNextSubpass),
+    offsetof(VkLayerDispatchTable, CmdExecuteCommands),
+    offsetof(VkLayerDispatchTable, BindBufferMemory2),
+    offsetof(VkLayerDispatchTable, BindImageMemory2),
+    offsetof(VkLayerDispatchTable, GetDeviceGroupPeerMemoryFeatures),
+    offsetof(VkLayerDispatchTable, CmdSetDeviceMask),
+    offsetof(VkLayerDispatchTable, CmdDispatchBase),
+    offsetof(VkLayerDispatchTable, GetImageMemoryRequirements2),
+    offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements2),
+    offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements2),
+    offsetof(VkLayerDispatchTable, TrimCommandPool),
+    offsetof(VkLayerDispatchTable, GetDeviceQueue2),
+    offsetof(VkLayerDispatchTable, CreateSamplerYcbcrConversion),
+    offsetof(VkLayerDispatchTable, DestroySamplerYcbcrConversion),
+    offsetof(VkLayerDispatchTable, CreateDescriptorUpdateTemplate),
+    offsetof(VkLayerDispatchTable, DestroyDescriptorUpdateTemplate),
+    offsetof(VkLayerDispatchTable, UpdateDescriptorSetWithTemplate),
+    offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSupport),
+    offsetof(VkLayerDispatchTable, CmdDrawIndirectCount),
+    offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCount),
+    offsetof(VkLayerDispatchTable, CreateRenderPass2),
+    offsetof(VkLayerDispatchTable, CmdBeginRenderPass2),
+    offsetof(VkLayerDispatchTable, CmdNextSubpass2),
+    offsetof(VkLayerDispatchTable, CmdEndRenderPass2),
+    offsetof(VkLayerDispatchTable, ResetQueryPool),
+    offsetof(VkLayerDispatchTable, GetSemaphoreCounterValue),
+    offsetof(VkLayerDispatchTable, WaitSemaphores),
+    offsetof(VkLayerDispatchTable, SignalSemaphore),
+    offsetof(VkLayerDispatchTable, GetBufferDeviceAddress),
+    offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureAddress),
+    offsetof(VkLayerDispatchTable, GetDeviceMemoryOpaqueCaptureAddress),
+    offsetof(VkLayerDispatchTable, CreatePrivateDataSlot),
+    offsetof(VkLayerDispatchTable, DestroyPrivateDataSlot),
+    offsetof(VkLayerDispatchTable, SetPrivateData),
+    offsetof(VkLayerDispatchTable, GetPrivateData),
+    offsetof(VkLayerDispatchTable, CmdSetEvent2),
+    offsetof(VkLayerDispatchTable, CmdResetEvent2),
+    offsetof(VkLayerDispatchTable, CmdWaitEvents2),
+    offsetof(VkLayerDispatchTable, CmdWriteTimestamp2),
+    offsetof(VkLayerDispatchTable, CmdCopyBuffer2),
+    offsetof(VkLayerDispatchTable, CmdCopyImage2),
+    offsetof(VkLayerDispatchTable, CmdCopyBufferToImage2),
+    offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer2),
+    offsetof(VkLayerDispatchTable, CmdBlitImage2),
+    offsetof(VkLayerDispatchTable, CmdResolveImage2),
+    offsetof(VkLayerDispatchTable, CmdSetCullMode),
+    offsetof(VkLayerDispatchTable, CmdSetFrontFace),
+    offsetof(VkLayerDispatchTable, CmdSetPrimitiveTopology),
+    offsetof(VkLayerDispatchTable, CmdSetViewportWithCount),
+    offsetof(VkLayerDispatchTable, CmdSetScissorWithCount),
+    offsetof(VkLayerDispatchTable, CmdBindVertexBuffers2),
+    offsetof(VkLayerDispatchTable, CmdSetDepthTestEnable),
+    offsetof(VkLayerDispatchTable, CmdSetDepthWriteEnable),
+    offsetof(VkLayerDispatchTable, CmdSetDepthCompareOp),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBoundsTestEnable),
+    offsetof(VkLayerDispatchTable, CmdSetStencilTestEnable),
+    offsetof(VkLayerDispatchTable, CmdSetStencilOp),
+    offsetof(VkLayerDispatchTable, CmdSetRasterizerDiscardEnable),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBiasEnable),
+    offsetof(VkLayerDispatchTable, CmdSetPrimitiveRestartEnable),
+    offsetof(VkLayerDispatchTable, GetDeviceBufferMemoryRequirements),
+    offsetof(VkLayerDispatchTable, GetDeviceImageMemoryRequirements),
+    offsetof(VkLayerDispatchTable, GetDeviceImageSparseMemoryRequirements),
+    offsetof(VkLayerDispatchTable, CmdSetLineStipple),
+    offsetof(VkLayerDispatchTable, MapMemory2),
+    offsetof(VkLayerDispatchTable, UnmapMemory2),
+    offsetof(VkLayerDispatchTable, CmdBindIndexBuffer2),
+    offsetof(VkLayerDispatchTable, GetRenderingAreaGranularity),
+    offsetof(VkLayerDispatchTable, GetDeviceImageSubresourceLayout),
+    offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSet),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate),
+    offsetof(VkLayerDispatchTable, CmdSetRenderingAttachmentLocations),
+    offsetof(VkLayerDispatchTable, CmdSetRenderingInputAttachmentIndices),
+    offsetof(VkLayerDispatchTable, CmdBindDescriptorSets2),
+    offsetof(VkLayerDispatchTable, CmdPushConstants2),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSet2),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate2),
+    offsetof(VkLayerDispatchTable, CopyMemoryToImage),
+    offsetof(VkLayerDispatchTable, CopyImageToMemory),
+    offsetof(VkLayerDispatchTable, CopyImageToImage),
+    offsetof(VkLayerDispatchTable, TransitionImageLayout),
+    offsetof(VkLayerDispatchTable, CreateSwapchainKHR),
+    offsetof(VkLayerDispatchTable, DestroySwapchainKHR),
+    offsetof(VkLayerDispatchTable, GetSwapchainImagesKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceGroupPresentCapabilitiesKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceGroupSurfacePresentModesKHR),
+    offsetof(VkLayerDispatchTable, AcquireNextImage2KHR),
+    offsetof(VkLayerDispatchTable, CreateSharedSwapchainsKHR),
+    offsetof(VkLayerDispatchTable, CreateVideoSessionKHR),
+    offsetof(VkLayerDispatchTable, DestroyVideoSessionKHR),
+    offsetof(VkLayerDispatchTable, GetVideoSessionMemoryRequirementsKHR),
+    offsetof(VkLayerDispatchTable, BindVideoSessionMemoryKHR),
+    offsetof(VkLayerDispatchTable, CreateVideoSessionParametersKHR),
+    offsetof(VkLayerDispatchTable, UpdateVideoSessionParametersKHR),
+    offsetof(VkLayerDispatchTable, DestroyVideoSessionParametersKHR),
+    offsetof(VkLayerDispatchTable, CmdBeginVideoCodingKHR),
+    offsetof(VkLayerDispatchTable, CmdEndVideoCodingKHR),
+    offsetof(VkLayerDispatchTable, CmdControlVideoCodingKHR),
+    offsetof(VkLayerDispatchTable, CmdDecodeVideoKHR),
+    offsetof(VkLayerDispatchTable, CmdBeginRenderingKHR),
+    offsetof(VkLayerDispatchTable, CmdEndRenderingKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceGroupPeerMemoryFeaturesKHR),
+    offsetof(VkLayerDispatchTable, CmdSetDeviceMaskKHR),
+    offsetof(VkLayerDispatchTable, CmdDispatchBaseKHR),
+    offsetof(VkLayerDispatchTable, TrimCommandPoolKHR),
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, GetMemoryWin32HandleKHR),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, GetMemoryWin32HandlePropertiesKHR),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    offsetof(VkLayerDispatchTable, GetMemoryFdKHR),
+    offsetof(VkLayerDispatchTable, GetMemoryFdPropertiesKHR),
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, ImportSemaphoreWin32HandleKHR),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, GetSemaphoreWin32HandleKHR),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    offsetof(VkLayerDispatchTable, ImportSemaphoreFdKHR),
+    offsetof(VkLayerDispatchTable, GetSemaphoreFdKHR),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSetKHR),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplateKHR),
+    offsetof(VkLayerDispatchTable, CreateDescriptorUpdateTemplateKHR),
+    offsetof(VkLayerDispatchTable, DestroyDescriptorUpdateTemplateKHR),
+    offsetof(VkLayerDispatchTable, UpdateDescriptorSetWithTemplateKHR),
+    offsetof(VkLayerDispatchTable, CreateRenderPass2KHR),
+    offsetof(VkLayerDispatchTable, CmdBeginRenderPass2KHR),
+    offsetof(VkLayerDispatchTable, CmdNextSubpass2KHR),
+    offsetof(VkLayerDispatchTable, CmdEndRenderPass2KHR),
+    offsetof(VkLayerDispatchTable, GetSwapchainStatusKHR),
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, ImportFenceWin32HandleKHR),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, GetFenceWin32HandleKHR),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    offsetof(VkLayerDispatchTable, ImportFenceFdKHR),
+    offsetof(VkLayerDispatchTable, GetFenceFdKHR),
+    offsetof(VkLayerDispatchTable, AcquireProfilingLockKHR),
+    offsetof(VkLayerDispatchTable, ReleaseProfilingLockKHR),
+    offsetof(VkLayerDispatchTable, GetImageMemoryRequirements2KHR),
+    offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements2KHR),
+    offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements2KHR),
+    offsetof(VkLayerDispatchTable, CreateSamplerYcbcrConversionKHR),
+    offsetof(VkLayerDispatchTable, DestroySamplerYcbcrConversionKHR),
+    offsetof(VkLayerDispatchTable, BindBufferMemory2KHR),
+    offsetof(VkLayerDispatchTable, BindImageMemory2KHR),
+    offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSupportKHR),
+    offsetof(VkLayerDispatchTable, CmdDrawIndirectCountKHR),
+    offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCountKHR),
+    offsetof(VkLayerDispatchTable, GetSemaphoreCounterValueKHR),
+    offsetof(VkLayerDispatchTable, WaitSemaphoresKHR),
+    offsetof(VkLayerDispatchTable, SignalSemaphoreKHR),
+    offsetof(VkLayerDispatchTable, CmdSetFragmentShadingRateKHR),
+    offsetof(VkLayerDispatchTable, CmdSetRenderingAttachmentLocationsKHR),
+    offsetof(VkLayerDispatchTable, CmdSetRenderingInputAttachmentIndicesKHR),
+    offsetof(VkLayerDispatchTable, WaitForPresentKHR),
+    offsetof(VkLayerDispatchTable, GetBufferDeviceAddressKHR),
+    offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureAddressKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceMemoryOpaqueCaptureAddressKHR),
+    offsetof(VkLayerDispatchTable, CreateDeferredOperationKHR),
+    offsetof(VkLayerDispatchTable, DestroyDeferredOperationKHR),
+    offsetof(VkLayerDispatchTable, GetDeferredOperationMaxConcurrencyKHR),
+    offsetof(VkLayerDispatchTable, GetDeferredOperationResultKHR),
+    offsetof(VkLayerDispatchTable, DeferredOperationJoinKHR),
+    offsetof(VkLayerDispatchTable, GetPipelineExecutablePropertiesKHR),
+    offsetof(VkLayerDispatchTable, GetPipelineExecutableStatisticsKHR),
+    offsetof(VkLayerDispatchTable, GetPipelineExecutableInternalRepresentationsKHR),
+    offsetof(VkLayerDispatchTable, MapMemory2KHR),
+    offsetof(VkLayerDispatchTable, UnmapMemory2KHR),
+    offsetof(VkLayerDispatchTable, GetEncodedVideoSessionParametersKHR),
+    offsetof(VkLayerDispatchTable, CmdEncodeVideoKHR),
+    offsetof(VkLayerDispatchTable, CmdSetEvent2KHR),
+    offsetof(VkLayerDispatchTable, CmdResetEvent2KHR),
+    offsetof(VkLayerDispatchTable, CmdWaitEvents2KHR),
+    offsetof(VkLayerDispatchTable, CmdPipelineBarrier2KHR),
+    offsetof(VkLayerDispatchTable, CmdWriteTimestamp2KHR),
+    offsetof(VkLayerDispatchTable, QueueSubmit2KHR),
+    offsetof(VkLayerDispatchTable, CmdCopyBuffer2KHR),
+    offsetof(VkLayerDispatchTable, CmdCopyImage2KHR),
+    offsetof(VkLayerDispatchTable, CmdCopyBufferToImage2KHR),
+    offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer2KHR),
+    offsetof(VkLayerDispatchTable, CmdBlitImage2KHR),
+    offsetof(VkLayerDispatchTable, CmdResolveImage2KHR),
+    offsetof(VkLayerDispatchTable, CmdTraceRaysIndirect2KHR),
+    offsetof(VkLayerDispatchTable, GetDeviceBufferMemoryRequirementsKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceImageMemoryRequirementsKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceImageSparseMemoryRequirementsKHR),
+    offsetof(VkLayerDispatchTable, CmdBindIndexBuffer2KHR),
+    offsetof(VkLayerDispatchTable, GetRenderingAreaGranularityKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceImageSubresourceLayoutKHR),
+    offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2KHR),
+    offsetof(VkLayerDispatchTable, CreatePipelineBinariesKHR),
+    offsetof(VkLayerDispatchTable, DestroyPipelineBinaryKHR),
+    offsetof(VkLayerDispatchTable, GetPipelineKeyKHR),
+    offsetof(VkLayerDispatchTable, GetPipelineBinaryDataKHR),
+    offsetof(VkLayerDispatchTable, ReleaseCapturedPipelineDataKHR),
+    offsetof(VkLayerDispatchTable, CmdSetLineStippleKHR),
+    offsetof(VkLayerDispatchTable, GetCalibratedTimestampsKHR),
+    offsetof(VkLayerDispatchTable, CmdBindDescriptorSets2KHR),
+    offsetof(VkLayerDispatchTable, CmdPushConstants2KHR),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSet2KHR),
+    offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate2KHR),
+    offsetof(VkLayerDispatchTable, CmdSetDescriptorBufferOffsets2EXT),
+    offsetof(VkLayerDispatchTable, CmdBindDescriptorBufferEmbeddedSamplers2EXT),
+    offsetof(VkLayerDispatchTable, DebugMarkerSetObjectTagEXT),
+    offsetof(VkLayerDispatchTable, DebugMarkerSetObjectNameEXT),
+    offsetof(VkLayerDispatchTable, CmdDebugMarkerBeginEXT),
+    offsetof(VkLayerDispatchTable, CmdDebugMarkerEndEXT),
+    offsetof(VkLayerDispatchTable, CmdDebugMarkerInsertEXT),
+    offsetof(VkLayerDispatchTable, CmdBindTransformFeedbackBuffersEXT),
+    offsetof(VkLayerDispatchTable, CmdBeginTransformFeedbackEXT),
+    offsetof(VkLayerDispatchTable, CmdEndTransformFeedbackEXT),
+    offsetof(VkLayerDispatchTable, CmdBeginQueryIndexedEXT),
+    offsetof(VkLayerDispatchTable, CmdEndQueryIndexedEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawIndirectByteCountEXT),
+    offsetof(VkLayerDispatchTable, CreateCuModuleNVX),
+    offsetof(VkLayerDispatchTable, CreateCuFunctionNVX),
+    offsetof(VkLayerDispatchTable, DestroyCuModuleNVX),
+    offsetof(VkLayerDispatchTable, DestroyCuFunctionNVX),
+    offsetof(VkLayerDispatchTable, CmdCuLaunchKernelNVX),
+    offsetof(VkLayerDispatchTable, GetImageViewHandleNVX),
+    offsetof(VkLayerDispatchTable, GetImageViewHandle64NVX),
+    offsetof(VkLayerDispatchTable, GetImageViewAddressNVX),
+    offsetof(VkLayerDispatchTable, CmdDrawIndirectCountAMD),
+    offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCountAMD),
+    offsetof(VkLayerDispatchTable, GetShaderInfoAMD),
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, GetMemoryWin32HandleNV),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    offsetof(VkLayerDispatchTable, CmdBeginConditionalRenderingEXT),
+    offsetof(VkLayerDispatchTable, CmdEndConditionalRenderingEXT),
+    offsetof(VkLayerDispatchTable, CmdSetViewportWScalingNV),
+    offsetof(VkLayerDispatchTable, DisplayPowerControlEXT),
+    offsetof(VkLayerDispatchTable, RegisterDeviceEventEXT),
+    offsetof(VkLayerDispatchTable, RegisterDisplayEventEXT),
+    offsetof(VkLayerDispatchTable, GetSwapchainCounterEXT),
+    offsetof(VkLayerDispatchTable, GetRefreshCycleDurationGOOGLE),
+    offsetof(VkLayerDispatchTable, GetPastPresentationTimingGOOGLE),
+    offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleModeEXT),
+    offsetof(VkLayerDispatchTable, SetHdrMetadataEXT),
+    offsetof(VkLayerDispatchTable, SetDebugUtilsObjectNameEXT),
+    offsetof(VkLayerDispatchTable, SetDebugUtilsObjectTagEXT),
+    offsetof(VkLayerDispatchTable, QueueBeginDebugUtilsLabelEXT),
+    offsetof(VkLayerDispatchTable, QueueEndDebugUtilsLabelEXT),
+    offsetof(VkLayerDispatchTable, QueueInsertDebugUtilsLabelEXT),
+    offsetof(VkLayerDispatchTable, CmdBeginDebugUtilsLabelEXT),
+    offsetof(VkLayerDispatchTable, CmdEndDebugUtilsLabelEXT),
+    offsetof(VkLayerDispatchTable, CmdInsertDebugUtilsLabelEXT),
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    offsetof(VkLayerDispatchTable, GetAndroidHardwareBufferPropertiesANDROID),
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    offsetof(VkLayerDispatchTable, GetMemoryAndroidHardwareBufferANDROID),
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, CreateExecutionGraphPipelinesAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, GetExecutionGraphPipelineScratchSizeAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, GetExecutionGraphPipelineNodeIndexAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, CmdInitializeGraphScratchMemoryAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, CmdDispatchGraphAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, CmdDispatchGraphIndirectAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    offsetof(VkLayerDispatchTable, CmdDispatchGraphIndirectCountAMDX),
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    offsetof(VkLayerDispatchTable, CmdSetSampleLocationsEXT),
+    offsetof(VkLayerDispatchTable, GetImageDrmFormatModifierPropertiesEXT),
+    offsetof(VkLayerDispatchTable, CreateValidationCacheEXT),
+    offsetof(VkLayerDispatchTable, DestroyValidationCacheEXT),
+    offsetof(VkLayerDispatchTable, MergeValidationCachesEXT),
+    offsetof(VkLayerDispatchTable, GetValidationCacheDataEXT),
+    offsetof(VkLayerDispatchTable, CmdBindShadingRateImageNV),
+    offsetof(VkLayerDispatchTable, CmdSetViewportShadingRatePaletteNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoarseSampleOrderNV),
+    offsetof(VkLayerDispatchTable, CreateAccelerationStructureNV),
+    offsetof(VkLayerDispatchTable, DestroyAccelerationStructureNV),
+    offsetof(VkLayerDispatchTable, GetAccelerationStructureMemoryRequirementsNV),
+    offsetof(VkLayerDispatchTable, BindAccelerationStructureMemoryNV),
+    offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructureNV),
+    offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureNV),
+    offsetof(VkLayerDispatchTable, CmdTraceRaysNV),
+    offsetof(VkLayerDispatchTable, CreateRayTracingPipelinesNV),
+    offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupHandlesKHR),
+    offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupHandlesNV),
+    offsetof(VkLayerDispatchTable, GetAccelerationStructureHandleNV),
+    offsetof(VkLayerDispatchTable, CmdWriteAccelerationStructuresPropertiesNV),
+    offsetof(VkLayerDispatchTable, CompileDeferredNV),
+    offsetof(VkLayerDispatchTable, GetMemoryHostPointerPropertiesEXT),
+    offsetof(VkLayerDispatchTable, CmdWriteBufferMarkerAMD),
+    offsetof(VkLayerDispatchTable, CmdWriteBufferMarker2AMD),
+    offsetof(VkLayerDispatchTable, GetCalibratedTimestampsEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawMeshTasksNV),
+    offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectNV),
+    offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectCountNV),
+    offsetof(VkLayerDispatchTable, CmdSetExclusiveScissorEnableNV),
+    offsetof(VkLayerDispatchTable, CmdSetExclusiveScissorNV),
+    offsetof(VkLayerDispatchTable, CmdSetCheckpointNV),
+    offsetof(VkLayerDispatchTable, GetQueueCheckpointDataNV),
+    offsetof(VkLayerDispatchTable, GetQueueCheckpointData2NV),
+    offsetof(VkLayerDispatchTable, InitializePerformanceApiINTEL),
+    offsetof(VkLayerDispatchTable, UninitializePerformanceApiINTEL),
+    offsetof(VkLayerDispatchTable, CmdSetPerformanceMarkerINTEL),
+    offsetof(VkLayerDispatchTable, CmdSetPerformanceStreamMarkerINTEL),
+    offsetof(VkLayerDispatchTable, CmdSetPerformanceOverrideINTEL),
+    offsetof(VkLayerDispatchTable, AcquirePerformanceConfigurationINTEL),
+    offsetof(VkLayerDispatchTable, ReleasePerformanceConfigurationINTEL),
+    offsetof(VkLayerDispatchTable, QueueSetPerformanceConfigurationINTEL),
+    offsetof(VkLayerDispatchTable, GetPerformanceParameterINTEL),
+    offsetof(VkLayerDispatchTable, SetLocalDimmingAMD),
+    offsetof(VkLayerDispatchTable, GetBufferDeviceAddressEXT),
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, AcquireFullScreenExclusiveModeEXT),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, ReleaseFullScreenExclusiveModeEXT),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    offsetof(VkLayerDispatchTable, GetDeviceGroupSurfacePresentModes2EXT),
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    offsetof(VkLayerDispatchTable, CmdSetLineStippleEXT),
+    offsetof(VkLayerDispatchTable, ResetQueryPoolEXT),
+    offsetof(VkLayerDispatchTable, CmdSetCullModeEXT),
+    offsetof(VkLayerDispatchTable, CmdSetFrontFaceEXT),
+    offsetof(VkLayerDispatchTable, CmdSetPrimitiveTopologyEXT),
+    offsetof(VkLayerDispatchTable, CmdSetViewportWithCountEXT),
+    offsetof(VkLayerDispatchTable, CmdSetScissorWithCountEXT),
+    offsetof(VkLayerDispatchTable, CmdBindVertexBuffers2EXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthTestEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthWriteEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthCompareOpEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBoundsTestEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetStencilTestEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetStencilOpEXT),
+    offsetof(VkLayerDispatchTable, CopyMemoryToImageEXT),
+    offsetof(VkLayerDispatchTable, CopyImageToMemoryEXT),
+    offsetof(VkLayerDispatchTable, CopyImageToImageEXT),
+    offsetof(VkLayerDispatchTable, TransitionImageLayoutEXT),
+    offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2EXT),
+    offsetof(VkLayerDispatchTable, ReleaseSwapchainImagesEXT),
+    offsetof(VkLayerDispatchTable, GetGeneratedCommandsMemoryRequirementsNV),
+    offsetof(VkLayerDispatchTable, CmdPreprocessGeneratedCommandsNV),
+    offsetof(VkLayerDispatchTable, CmdExecuteGeneratedCommandsNV),
+    offsetof(VkLayerDispatchTable, CmdBindPipelineShaderGroupNV),
+    offsetof(VkLayerDispatchTable, CreateIndirectCommandsLayoutNV),
+    offsetof(VkLayerDispatchTable, DestroyIndirectCommandsLayoutNV),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBias2EXT),
+    offsetof(VkLayerDispatchTable, CreatePrivateDataSlotEXT),
+    offsetof(VkLayerDispatchTable, DestroyPrivateDataSlotEXT),
+    offsetof(VkLayerDispatchTable, SetPrivateDataEXT),
+    offsetof(VkLayerDispatchTable, GetPrivateDataEXT),
+    offsetof(VkLayerDispatchTable, CreateCudaModuleNV),
+    offsetof(VkLayerDispatchTable, GetCudaModuleCacheNV),
+    offsetof(VkLayerDispatchTable, CreateCudaFunctionNV),
+    offsetof(VkLayerDispatchTable, DestroyCudaModuleNV),
+    offsetof(VkLayerDispatchTable, DestroyCudaFunctionNV),
+    offsetof(VkLayerDispatchTable, CmdCudaLaunchKernelNV),
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    offsetof(VkLayerDispatchTable, ExportMetalObjectsEXT),
+#endif // VK_USE_PLATFORM_METAL_EXT
+    offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSizeEXT),
+    offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutBindingOffsetEXT),
+    offsetof(VkLayerDispatchTable, GetDescriptorEXT),
+    offsetof(VkLayerDispatchTable, CmdBindDescriptorBuffersEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDescriptorBufferOffsetsEXT),
+    offsetof(VkLayerDispatchTable, CmdBindDescriptorBufferEmbeddedSamplersEXT),
+    offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureDescriptorDataEXT),
+    offsetof(VkLayerDispatchTable, GetImageOpaqueCaptureDescriptorDataEXT),
+    offsetof(VkLayerDispatchTable, GetImageViewOpaqueCaptureDescriptorDataEXT),
+    offsetof(VkLayerDispatchTable, GetSamplerOpaqueCaptureDescriptorDataEXT),
+    offsetof(VkLayerDispatchTable, GetAccelerationStructureOpaqueCaptureDescriptorDataEXT),
+    offsetof(VkLayerDispatchTable, CmdSetFragmentShadingRateEnumNV),
+    offsetof(VkLayerDispatchTable, GetDeviceFaultInfoEXT),
+    offsetof(VkLayerDispatchTable, CmdSetVertexInputEXT),
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, GetMemoryZirconHandleFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, GetMemoryZirconHandlePropertiesFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, ImportSemaphoreZirconHandleFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, GetSemaphoreZirconHandleFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, CreateBufferCollectionFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, SetBufferCollectionImageConstraintsFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, SetBufferCollectionBufferConstraintsFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, DestroyBufferCollectionFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    offsetof(VkLayerDispatchTable, GetBufferCollectionPropertiesFUCHSIA),
+#endif // VK_USE_PLATFORM_FUCHSIA
+    offsetof(VkLayerDispatchTable, GetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI),
+    offsetof(VkLayerDispatchTable, CmdSubpassShadingHUAWEI),
+    offsetof(VkLayerDispatchTable, CmdBindInvocationMaskHUAWEI),
+    offsetof(VkLayerDispatchTable, GetMemoryRemoteAddressNV),
+    offsetof(VkLayerDispatchTable, GetPipelinePropertiesEXT),
+    offsetof(VkLayerDispatchTable, CmdSetPatchControlPointsEXT),
+    offsetof(VkLayerDispatchTable, CmdSetRasterizerDiscardEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthBiasEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetLogicOpEXT),
+    offsetof(VkLayerDispatchTable, CmdSetPrimitiveRestartEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetColorWriteEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawMultiEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawMultiIndexedEXT),
+    offsetof(VkLayerDispatchTable, CreateMicromapEXT),
+    offsetof(VkLayerDispatchTable, DestroyMicromapEXT),
+    offsetof(VkLayerDispatchTable, CmdBuildMicromapsEXT),
+    offsetof(VkLayerDispatchTable, BuildMicromapsEXT),
+    offsetof(VkLayerDispatchTable, CopyMicromapEXT),
+    offsetof(VkLayerDispatchTable, CopyMicromapToMemoryEXT),
+    offsetof(VkLayerDispatchTable, CopyMemoryToMicromapEXT),
+    offsetof(VkLayerDispatchTable, WriteMicromapsPropertiesEXT),
+    offsetof(VkLayerDispatchTable, CmdCopyMicromapEXT),
+    offsetof(VkLayerDispatchTable, CmdCopyMicromapToMemoryEXT),
+    offsetof(VkLayerDispatchTable, CmdCopyMemoryToMicromapEXT),
+    offsetof(VkLayerDispatchTable, CmdWriteMicromapsPropertiesEXT),
+    offsetof(VkLayerDispatchTable, GetDeviceMicromapCompatibilityEXT),
+    offsetof(VkLayerDispatchTable, GetMicromapBuildSizesEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawClusterHUAWEI),
+    offsetof(VkLayerDispatchTable, CmdDrawClusterIndirectHUAWEI),
+    offsetof(VkLayerDispatchTable, SetDeviceMemoryPriorityEXT),
+    offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutHostMappingInfoVALVE),
+    offsetof(VkLayerDispatchTable, GetDescriptorSetHostMappingVALVE),
+    offsetof(VkLayerDispatchTable, CmdCopyMemoryIndirectNV),
+    offsetof(VkLayerDispatchTable, CmdCopyMemoryToImageIndirectNV),
+    offsetof(VkLayerDispatchTable, CmdDecompressMemoryNV),
+    offsetof(VkLayerDispatchTable, CmdDecompressMemoryIndirectCountNV),
+    offsetof(VkLayerDispatchTable, GetPipelineIndirectMemoryRequirementsNV),
+    offsetof(VkLayerDispatchTable, CmdUpdatePipelineIndirectBufferNV),
+    offsetof(VkLayerDispatchTable, GetPipelineIndirectDeviceAddressNV),
+    offsetof(VkLayerDispatchTable, CmdSetDepthClampEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetPolygonModeEXT),
+    offsetof(VkLayerDispatchTable, CmdSetRasterizationSamplesEXT),
+    offsetof(VkLayerDispatchTable, CmdSetSampleMaskEXT),
+    offsetof(VkLayerDispatchTable, CmdSetAlphaToCoverageEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetAlphaToOneEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetLogicOpEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetColorBlendEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetColorBlendEquationEXT),
+    offsetof(VkLayerDispatchTable, CmdSetColorWriteMaskEXT),
+    offsetof(VkLayerDispatchTable, CmdSetTessellationDomainOriginEXT),
+    offsetof(VkLayerDispatchTable, CmdSetRasterizationStreamEXT),
+    offsetof(VkLayerDispatchTable, CmdSetConservativeRasterizationModeEXT),
+    offsetof(VkLayerDispatchTable, CmdSetExtraPrimitiveOverestimationSizeEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthClipEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetSampleLocationsEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetColorBlendAdvancedEXT),
+    offsetof(VkLayerDispatchTable, CmdSetProvokingVertexModeEXT),
+    offsetof(VkLayerDispatchTable, CmdSetLineRasterizationModeEXT),
+    offsetof(VkLayerDispatchTable, CmdSetLineStippleEnableEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthClipNegativeOneToOneEXT),
+    offsetof(VkLayerDispatchTable, CmdSetViewportWScalingEnableNV),
+    offsetof(VkLayerDispatchTable, CmdSetViewportSwizzleNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoverageToColorEnableNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoverageToColorLocationNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoverageModulationModeNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoverageModulationTableEnableNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoverageModulationTableNV),
+    offsetof(VkLayerDispatchTable, CmdSetShadingRateImageEnableNV),
+    offsetof(VkLayerDispatchTable, CmdSetRepresentativeFragmentTestEnableNV),
+    offsetof(VkLayerDispatchTable, CmdSetCoverageReductionModeNV),
+    offsetof(VkLayerDispatchTable, GetShaderModuleIdentifierEXT),
+    offsetof(VkLayerDispatchTable, GetShaderModuleCreateInfoIdentifierEXT),
+    offsetof(VkLayerDispatchTable, CreateOpticalFlowSessionNV),
+    offsetof(VkLayerDispatchTable, DestroyOpticalFlowSessionNV),
+    offsetof(VkLayerDispatchTable, BindOpticalFlowSessionImageNV),
+    offsetof(VkLayerDispatchTable, CmdOpticalFlowExecuteNV),
+    offsetof(VkLayerDispatchTable, AntiLagUpdateAMD),
+    offsetof(VkLayerDispatchTable, CreateShadersEXT),
+    offsetof(VkLayerDispatchTable, DestroyShaderEXT),
+    offsetof(VkLayerDispatchTable, GetShaderBinaryDataEXT),
+    offsetof(VkLayerDispatchTable, CmdBindShadersEXT),
+    offsetof(VkLayerDispatchTable, CmdSetDepthClampRangeEXT),
+    offsetof(VkLayerDispatchTable, GetFramebufferTilePropertiesQCOM),
+    offsetof(VkLayerDispatchTable, GetDynamicRenderingTilePropertiesQCOM),
+    offsetof(VkLayerDispatchTable, SetLatencySleepModeNV),
+    offsetof(VkLayerDispatchTable, LatencySleepNV),
+    offsetof(VkLayerDispatchTable, SetLatencyMarkerNV),
+    offsetof(VkLayerDispatchTable, GetLatencyTimingsNV),
+    offsetof(VkLayerDispatchTable, QueueNotifyOutOfBandNV),
+    offsetof(VkLayerDispatchTable, CmdSetAttachmentFeedbackLoopEnableEXT),
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    offsetof(VkLayerDispatchTable, GetScreenBufferPropertiesQNX),
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+    offsetof(VkLayerDispatchTable, GetGeneratedCommandsMemoryRequirementsEXT),
+    offsetof(VkLayerDispatchTable, CmdPreprocessGeneratedCommandsEXT),
+    offsetof(VkLayerDispatchTable, CmdExecuteGeneratedCommandsEXT),
+    offsetof(VkLayerDispatchTable, CreateIndirectCommandsLayoutEXT),
+    offsetof(VkLayerDispatchTable, DestroyIndirectCommandsLayoutEXT),
+    offsetof(VkLayerDispatchTable, CreateIndirectExecutionSetEXT),
+    offsetof(VkLayerDispatchTable, DestroyIndirectExecutionSetEXT),
+    offsetof(VkLayerDispatchTable, UpdateIndirectExecutionSetPipelineEXT),
+    offsetof(VkLayerDispatchTable, UpdateIndirectExecutionSetShaderEXT),
+    offsetof(VkLayerDispatchTable, CreateAccelerationStructureKHR),
+    offsetof(VkLayerDispatchTable, DestroyAccelerationStructureKHR),
+    offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructuresKHR),
+    offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructuresIndirectKHR),
+    offsetof(VkLayerDispatchTable, BuildAccelerationStructuresKHR),
+    offsetof(VkLayerDispatchTable, CopyAccelerationStructureKHR),
+    offsetof(VkLayerDispatchTable, CopyAccelerationStructureToMemoryKHR),
+    offsetof(VkLayerDispatchTable, CopyMemoryToAccelerationStructureKHR),
+    offsetof(VkLayerDispatchTable, WriteAccelerationStructuresPropertiesKHR),
+    offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureKHR),
+    offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureToMemoryKHR),
+    offsetof(VkLayerDispatchTable, CmdCopyMemoryToAccelerationStructureKHR),
+    offsetof(VkLayerDispatchTable, GetAccelerationStructureDeviceAddressKHR),
+    offsetof(VkLayerDispatchTable, CmdWriteAccelerationStructuresPropertiesKHR),
+    offsetof(VkLayerDispatchTable, GetDeviceAccelerationStructureCompatibilityKHR),
+    offsetof(VkLayerDispatchTable, GetAccelerationStructureBuildSizesKHR),
+    offsetof(VkLayerDispatchTable, CmdTraceRaysKHR),
+    offsetof(VkLayerDispatchTable, CreateRayTracingPipelinesKHR),
+    offsetof(VkLayerDispatchTable, GetRayTracingCaptureReplayShaderGroupHandlesKHR),
+    offsetof(VkLayerDispatchTable, CmdTraceRaysIndirectKHR),
+    offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupStackSizeKHR),
+    offsetof(VkLayerDispatchTable, CmdSetRayTracingPipelineStackSizeKHR),
+    offsetof(VkLayerDispatchTable, CmdDrawMeshTasksEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectEXT),
+    offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectCountEXT),
+};
+
+// Copy the device dispatch table into the hot dispatch table once it is completely initialized
+void loader_init_hot_dispatch_table(struct loader_dev_dispatch_table *dispatch) {
+    PFN_vkVoidFunction *hot_entries = (PFN_vkVoidFunction *)&dispatch->hot_dispatch;
+    for (size_t i = 0; i < sizeof(hot_dispatch_table_offsets) / sizeof(hot_dispatch_table_offsets[0]); i++) {
+        hot_entries[i] = *(PFN_vkVoidFunction *)((char *)&dispatch->core_dispatch + hot_dispatch_table_offsets[i]);
+    }
+}
+
+// clang-format on
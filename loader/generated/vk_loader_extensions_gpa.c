@@ -0,0 +1,1006 @@
+// *** THIS FILE IS GENERATED - DO NOT EDIT ***
+// See loader_extension_generator.py for modifications
+
+/*
+ * Copyright (c) 2015-2022 The Khronos Group Inc.
+ * Copyright (c) 2015-2022 Valve Corporation
+ * Copyright (c) 2015-2022 LunarG, Inc.
+ * Copyright (c) 2021-2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * Copyright (c) 2023-2023 RasterGrid Kft.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * Author: Mark Lobodzinski <mark@lunarg.com>
+ * Author: Mark Young <marky@lunarg.com>
+ */
+
+// clang-format off
+#include "vk_loader_extensions_internal.h"
+
+// Entry of the generated perfect hash table used by extension_instance_gpa
+struct loader_instance_extension_command_entry {
+    uint16_t name_offset;                  // Offset of the command name in loader_name_pool, 0 for unused slots
+    PFN_vkVoidFunction func;               // Trampoline returned for the command
+    bool requires_enable;                  // Only return func if the instance extension is enabled
+    uint16_t enable_offset;                // Offset of the enable flag in loader_instance_extension_enables
+};
+
+// Perfect hash table of the extension commands known to the loader, generated from the registry
+static const uint16_t instance_extension_command_table_displacements[256] = {
+    0, 0, 0, 1, 0, 4, 0, 0, 3, 3, 0, 0, 0, 2, 0, 1,
+    1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 3, 1, 0, 0, 0, 0,
+    0, 4, 0, 2, 1, 0, 0, 0, 0, 2, 0, 3, 1, 0, 0, 0,
+    0, 10, 0, 0, 0, 5, 0, 1, 1, 1, 2, 7, 1, 4, 1, 7,
+    1, 0, 2, 0, 16, 7, 2, 1, 0, 3, 3, 0, 2, 1, 14, 1,
+    0, 0, 0, 0, 0, 0, 0, 6, 2, 4, 7, 10, 0, 1, 0, 0,
+    3, 0, 1, 2, 10, 0, 1, 4, 4, 1, 5, 1, 2, 6, 5, 1,
+    4, 0, 3, 0, 0, 1, 5, 2, 0, 7, 1, 6, 0, 0, 1, 0,
+    2, 0, 3, 3, 0, 6, 3, 4, 1, 1, 1, 0, 2, 1, 0, 1,
+    4, 0, 2, 0, 1, 0, 0, 0, 8, 25, 7, 0, 0, 0, 0, 3,
+    1, 10, 0, 1, 1, 0, 5, 2, 2, 1, 6, 0, 0, 0, 0, 7,
+    5, 1, 1, 0, 11, 5, 2, 6, 5, 0, 2, 2, 1, 0, 2, 0,
+    13, 2, 4, 2, 2, 9, 6, 0, 0, 12, 47, 0, 1, 3, 9, 2,
+    5, 5, 0, 0, 1, 1, 4, 0, 0, 3, 8, 18, 12, 1, 10, 1,
+    11, 0, 0, 8, 0, 2, 7, 0, 0, 44, 4, 1, 4, 0, 0, 8,
+    0, 2, 3, 4, 7, 0, 0, 7, 5, 12, 2, 5, 0, 11, 23, 7,
+};
+static const struct loader_instance_extension_command_entry instance_extension_command_table[512] = {
+    [0] = {12047, (PFN_vkVoidFunction)CmdBeginDebugUtilsLabelEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [1] = {18182, (PFN_vkVoidFunction)CmdSetProvokingVertexModeEXT, false, 0},
+    [2] = {19842, (PFN_vkVoidFunction)CopyAccelerationStructureKHR, false, 0},
+    [3] = {10991, (PFN_vkVoidFunction)CreateCuFunctionNVX, false, 0},
+    [4] = {20493, (PFN_vkVoidFunction)CmdDrawMeshTasksEXT, false, 0},
+    [6] = {17665, (PFN_vkVoidFunction)CmdSetDepthClampEnableEXT, false, 0},
+    [8] = {16711, (PFN_vkVoidFunction)CmdSetLogicOpEXT, false, 0},
+    [9] = {10453, (PFN_vkVoidFunction)CmdPushDescriptorSetWithTemplate2KHR, false, 0},
+    [10] = {6592, (PFN_vkVoidFunction)GetVideoSessionMemoryRequirementsKHR, false, 0},
+    [11] = {17856, (PFN_vkVoidFunction)CmdSetColorBlendEnableEXT, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [13] = {12309, (PFN_vkVoidFunction)CreateExecutionGraphPipelinesAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [14] = {15583, (PFN_vkVoidFunction)CmdBindDescriptorBuffersEXT, false, 0},
+    [15] = {17628, (PFN_vkVoidFunction)GetPipelineIndirectDeviceAddressNV, false, 0},
+    [16] = {15648, (PFN_vkVoidFunction)CmdBindDescriptorBufferEmbeddedSamplersEXT, false, 0},
+    [17] = {20339, (PFN_vkVoidFunction)GetRayTracingCaptureReplayShaderGroupHandlesKHR, false, 0},
+    [18] = {18048, (PFN_vkVoidFunction)CmdSetExtraPrimitiveOverestimationSizeEXT, false, 0},
+    [19] = {10768, (PFN_vkVoidFunction)CmdDebugMarkerInsertEXT, false, 0},
+    [20] = {18544, (PFN_vkVoidFunction)CmdSetShadingRateImageEnableNV, false, 0},
+    [21] = {17036, (PFN_vkVoidFunction)CopyMemoryToMicromapEXT, false, 0},
+    [23] = {10146, (PFN_vkVoidFunction)GetPipelineKeyKHR, false, 0},
+    [24] = {6901, (PFN_vkVoidFunction)vkGetPhysicalDeviceFeatures2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [25] = {10426, (PFN_vkVoidFunction)CmdPushDescriptorSet2KHR, false, 0},
+    [26] = {9575, (PFN_vkVoidFunction)CmdResetEvent2KHR, false, 0},
+    [27] = {18007, (PFN_vkVoidFunction)CmdSetConservativeRasterizationModeEXT, false, 0},
+    [28] = {11704, (PFN_vkVoidFunction)GetPastPresentationTimingGOOGLE, false, 0},
+    [29] = {7007, (PFN_vkVoidFunction)vkGetPhysicalDeviceImageFormatProperties2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [30] = {18683, (PFN_vkVoidFunction)GetShaderModuleCreateInfoIdentifierEXT, false, 0},
+    [31] = {19090, (PFN_vkVoidFunction)SetLatencySleepModeNV, false, 0},
+    [33] = {11596, (PFN_vkVoidFunction)RegisterDeviceEventEXT, false, 0},
+    [37] = {6837, (PFN_vkVoidFunction)CmdDecodeVideoKHR, false, 0},
+    [38] = {9285, (PFN_vkVoidFunction)GetPipelineExecutablePropertiesKHR, false, 0},
+    [39] = {9537, (PFN_vkVoidFunction)CmdEncodeVideoKHR, false, 0},
+    [40] = {20201, (PFN_vkVoidFunction)GetDeviceAccelerationStructureCompatibilityKHR, false, 0},
+    [42] = {10091, (PFN_vkVoidFunction)CreatePipelineBinariesKHR, false, 0},
+    [43] = {13443, (PFN_vkVoidFunction)GetCalibratedTimestampsEXT, false, 0},
+    [44] = {11034, (PFN_vkVoidFunction)DestroyCuFunctionNVX, false, 0},
+    [45] = {7589, (PFN_vkVoidFunction)ImportSemaphoreFdKHR, false, 0},
+    [47] = {6880, (PFN_vkVoidFunction)CmdEndRenderingKHR, false, 0},
+    [48] = {11268, (PFN_vkVoidFunction)GetPhysicalDeviceExternalImageFormatPropertiesNV, true, offsetof(struct loader_instance_extension_enables, nv_external_memory_capabilities)},
+    [49] = {19417, (PFN_vkVoidFunction)DestroyIndirectCommandsLayoutEXT, false, 0},
+    [50] = {16619, (PFN_vkVoidFunction)CmdSetPatchControlPointsEXT, false, 0},
+    [51] = {15193, (PFN_vkVoidFunction)AcquireDrmDisplayEXT, true, offsetof(struct loader_instance_extension_enables, ext_acquire_drm_display)},
+    [53] = {14008, (PFN_vkVoidFunction)SetLocalDimmingAMD, false, 0},
+    [54] = {12103, (PFN_vkVoidFunction)CmdInsertDebugUtilsLabelEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [55] = {17171, (PFN_vkVoidFunction)CmdWriteMicromapsPropertiesEXT, false, 0},
+    [56] = {8805, (PFN_vkVoidFunction)WaitSemaphoresKHR, false, 0},
+    [57] = {9702, (PFN_vkVoidFunction)CmdCopyImage2KHR, false, 0},
+    [58] = {20515, (PFN_vkVoidFunction)CmdDrawMeshTasksIndirectEXT, false, 0},
+    [59] = {11013, (PFN_vkVoidFunction)DestroyCuModuleNVX, false, 0},
+    [60] = {8775, (PFN_vkVoidFunction)GetSemaphoreCounterValueKHR, false, 0},
+    [61] = {15735, (PFN_vkVoidFunction)GetImageOpaqueCaptureDescriptorDataEXT, false, 0},
+    [62] = {18828, (PFN_vkVoidFunction)BindOpticalFlowSessionImageNV, false, 0},
+    [63] = {13826, (PFN_vkVoidFunction)CmdSetPerformanceOverrideINTEL, false, 0},
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    [64] = {11477, (PFN_vkVoidFunction)AcquireXlibDisplayEXT, true, offsetof(struct loader_instance_extension_enables, ext_acquire_xlib_display)},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    [65] = {15776, (PFN_vkVoidFunction)GetImageViewOpaqueCaptureDescriptorDataEXT, false, 0},
+    [66] = {12669, (PFN_vkVoidFunction)CreateValidationCacheEXT, false, 0},
+    [67] = {18312, (PFN_vkVoidFunction)CmdSetViewportWScalingEnableNV, false, 0},
+    [68] = {7769, (PFN_vkVoidFunction)UpdateDescriptorSetWithTemplateKHR, false, 0},
+    [69] = {8846, (PFN_vkVoidFunction)GetPhysicalDeviceFragmentShadingRatesKHR, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [71] = {12521, (PFN_vkVoidFunction)CmdDispatchGraphIndirectCountAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [72] = {11672, (PFN_vkVoidFunction)GetRefreshCycleDurationGOOGLE, false, 0},
+    [73] = {15006, (PFN_vkVoidFunction)CmdPreprocessGeneratedCommandsNV, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [74] = {16003, (PFN_vkVoidFunction)GetWinrtDisplayNV, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [75] = {18577, (PFN_vkVoidFunction)CmdSetRepresentativeFragmentTestEnableNV, false, 0},
+    [76] = {8120, (PFN_vkVoidFunction)GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR, false, 0},
+    [77] = {19174, (PFN_vkVoidFunction)QueueNotifyOutOfBandNV, false, 0},
+    [78] = {9595, (PFN_vkVoidFunction)CmdWaitEvents2KHR, false, 0},
+    [79] = {7732, (PFN_vkVoidFunction)DestroyDescriptorUpdateTemplateKHR, false, 0},
+    [80] = {7632, (PFN_vkVoidFunction)CmdPushDescriptorSetKHR, false, 0},
+    [81] = {15419, (PFN_vkVoidFunction)DestroyCudaFunctionNV, false, 0},
+    [82] = {15262, (PFN_vkVoidFunction)DestroyPrivateDataSlotEXT, false, 0},
+    [83] = {11738, (PFN_vkVoidFunction)CmdSetDiscardRectangleEXT, false, 0},
+    [84] = {8176, (PFN_vkVoidFunction)AcquireProfilingLockKHR, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [86] = {12345, (PFN_vkVoidFunction)GetExecutionGraphPipelineScratchSizeAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [87] = {9615, (PFN_vkVoidFunction)CmdPipelineBarrier2KHR, false, 0},
+    [88] = {14963, (PFN_vkVoidFunction)GetGeneratedCommandsMemoryRequirementsNV, false, 0},
+    [89] = {8742, (PFN_vkVoidFunction)CmdDrawIndexedIndirectCountKHR, false, 0},
+    [90] = {12937, (PFN_vkVoidFunction)GetAccelerationStructureMemoryRequirementsNV, false, 0},
+    [92] = {19595, (PFN_vkVoidFunction)GetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV, false, 0},
+    [93] = {12779, (PFN_vkVoidFunction)CmdBindShadingRateImageNV, false, 0},
+    [94] = {17010, (PFN_vkVoidFunction)CopyMicromapToMemoryEXT, false, 0},
+    [95] = {19557, (PFN_vkVoidFunction)UpdateIndirectExecutionSetShaderEXT, false, 0},
+    [96] = {16972, (PFN_vkVoidFunction)BuildMicromapsEXT, false, 0},
+    [97] = {7898, (PFN_vkVoidFunction)GetSwapchainStatusKHR, false, 0},
+    [98] = {16100, (PFN_vkVoidFunction)CmdSetVertexInputEXT, false, 0},
+    [99] = {7451, (PFN_vkVoidFunction)GetMemoryFdPropertiesKHR, false, 0},
+    [100] = {6459, (PFN_vkVoidFunction)GetPhysicalDeviceVideoCapabilitiesKHR, false, 0},
+    [101] = {17092, (PFN_vkVoidFunction)CmdCopyMicromapEXT, false, 0},
+    [102] = {14085, (PFN_vkVoidFunction)GetBufferDeviceAddressEXT, false, 0},
+    [103] = {18860, (PFN_vkVoidFunction)CmdOpticalFlowExecuteNV, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [104] = {16422, (PFN_vkVoidFunction)GetBufferCollectionPropertiesFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [105] = {11430, (PFN_vkVoidFunction)CmdSetViewportWScalingNV, false, 0},
+    [106] = {7290, (PFN_vkVoidFunction)vkEnumeratePhysicalDeviceGroups, true, offsetof(struct loader_instance_extension_enables, khr_device_group_creation)},
+    [107] = {17456, (PFN_vkVoidFunction)CmdCopyMemoryToImageIndirectNV, false, 0},
+    [108] = {10794, (PFN_vkVoidFunction)CmdBindTransformFeedbackBuffersEXT, false, 0},
+    [109] = {9127, (PFN_vkVoidFunction)CreateDeferredOperationKHR, false, 0},
+    [112] = {19729, (PFN_vkVoidFunction)CmdBuildAccelerationStructuresKHR, false, 0},
+    [113] = {14644, (PFN_vkVoidFunction)CmdSetDepthTestEnableEXT, false, 0},
+    [114] = {17976, (PFN_vkVoidFunction)CmdSetRasterizationStreamEXT, false, 0},
+    [115] = {11766, (PFN_vkVoidFunction)CmdSetDiscardRectangleEnableEXT, false, 0},
+    [116] = {15104, (PFN_vkVoidFunction)CreateIndirectCommandsLayoutNV, false, 0},
+    [117] = {14589, (PFN_vkVoidFunction)CmdSetScissorWithCountEXT, false, 0},
+    [118] = {15523, (PFN_vkVoidFunction)GetDescriptorSetLayoutBindingOffsetEXT, false, 0},
+    [119] = {11986, (PFN_vkVoidFunction)QueueEndDebugUtilsLabelEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [120] = {17430, (PFN_vkVoidFunction)CmdCopyMemoryIndirectNV, false, 0},
+    [121] = {11057, (PFN_vkVoidFunction)CmdCuLaunchKernelNVX, false, 0},
+    [122] = {18724, (PFN_vkVoidFunction)GetPhysicalDeviceOpticalFlowImageFormatsNV, false, 0},
+    [123] = {11927, (PFN_vkVoidFunction)SetDebugUtilsObjectTagEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [125] = {16684, (PFN_vkVoidFunction)CmdSetDepthBiasEnableEXT, false, 0},
+    [126] = {13977, (PFN_vkVoidFunction)GetPerformanceParameterINTEL, false, 0},
+    [127] = {17770, (PFN_vkVoidFunction)CmdSetAlphaToCoverageEnableEXT, false, 0},
+    [129] = {11080, (PFN_vkVoidFunction)GetImageViewHandleNVX, false, 0},
+    [130] = {7612, (PFN_vkVoidFunction)GetSemaphoreFdKHR, false, 0},
+    [131] = {10299, (PFN_vkVoidFunction)GetPhysicalDeviceCalibrateableTimeDomainsKHR, false, 0},
+    [132] = {6659, (PFN_vkVoidFunction)CreateVideoSessionParametersKHR, false, 0},
+    [133] = {20070, (PFN_vkVoidFunction)CmdCopyMemoryToAccelerationStructureKHR, false, 0},
+    [134] = {19484, (PFN_vkVoidFunction)DestroyIndirectExecutionSetEXT, false, 0},
+    [135] = {16949, (PFN_vkVoidFunction)CmdBuildMicromapsEXT, false, 0},
+    [136] = {11104, (PFN_vkVoidFunction)GetImageViewHandle64NVX, false, 0},
+    [137] = {15955, (PFN_vkVoidFunction)GetDeviceFaultInfoEXT, false, 0},
+    [140] = {15216, (PFN_vkVoidFunction)GetDrmDisplayEXT, true, offsetof(struct loader_instance_extension_enables, ext_acquire_drm_display)},
+    [142] = {7922, (PFN_vkVoidFunction)vkGetPhysicalDeviceExternalFenceProperties, true, offsetof(struct loader_instance_extension_enables, khr_external_fence_capabilities)},
+    [144] = {16509, (PFN_vkVoidFunction)CmdSubpassShadingHUAWEI, false, 0},
+    [145] = {9682, (PFN_vkVoidFunction)CmdCopyBuffer2KHR, false, 0},
+    [146] = {13287, (PFN_vkVoidFunction)CompileDeferredNV, false, 0},
+    [147] = {12872, (PFN_vkVoidFunction)CreateAccelerationStructureNV, false, 0},
+    [148] = {13898, (PFN_vkVoidFunction)ReleasePerformanceConfigurationINTEL, false, 0},
+    [149] = {13616, (PFN_vkVoidFunction)CmdSetCheckpointNV, false, 0},
+    [150] = {10276, (PFN_vkVoidFunction)CmdSetLineStippleKHR, false, 0},
+    [151] = {11647, (PFN_vkVoidFunction)GetSwapchainCounterEXT, false, 0},
+    [152] = {14447, (PFN_vkVoidFunction)CmdSetLineStippleEXT, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [153] = {16389, (PFN_vkVoidFunction)DestroyBufferCollectionFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [154] = {10862, (PFN_vkVoidFunction)CmdEndTransformFeedbackEXT, false, 0},
+    [155] = {13020, (PFN_vkVoidFunction)CmdBuildAccelerationStructureNV, false, 0},
+    [156] = {18345, (PFN_vkVoidFunction)CmdSetViewportSwizzleNV, false, 0},
+    [157] = {15351, (PFN_vkVoidFunction)GetCudaModuleCacheNV, false, 0},
+    [158] = {20389, (PFN_vkVoidFunction)CmdTraceRaysIndirectKHR, false, 0},
+    [159] = {19152, (PFN_vkVoidFunction)GetLatencyTimingsNV, false, 0},
+    [160] = {9721, (PFN_vkVoidFunction)CmdCopyBufferToImage2KHR, false, 0},
+    [163] = {18092, (PFN_vkVoidFunction)CmdSetDepthClipEnableEXT, false, 0},
+    [164] = {19994, (PFN_vkVoidFunction)CmdCopyAccelerationStructureKHR, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [165] = {12467, (PFN_vkVoidFunction)CmdDispatchGraphAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [166] = {10346, (PFN_vkVoidFunction)GetCalibratedTimestampsKHR, false, 0},
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    [168] = {12269, (PFN_vkVoidFunction)GetMemoryAndroidHardwareBufferANDROID, false, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [169] = {14308, (PFN_vkVoidFunction)AcquireFullScreenExclusiveModeEXT, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [171] = {9816, (PFN_vkVoidFunction)CmdTraceRaysIndirect2KHR, false, 0},
+    [173] = {14831, (PFN_vkVoidFunction)CopyImageToMemoryEXT, false, 0},
+    [174] = {13493, (PFN_vkVoidFunction)CmdDrawMeshTasksIndirectNV, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [175] = {12429, (PFN_vkVoidFunction)CmdInitializeGraphScratchMemoryAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [176] = {13104, (PFN_vkVoidFunction)CreateRayTracingPipelinesNV, false, 0},
+    [178] = {7269, (PFN_vkVoidFunction)TrimCommandPoolKHR, false, 0},
+    [179] = {18213, (PFN_vkVoidFunction)CmdSetLineRasterizationModeEXT, false, 0},
+    [180] = {12557, (PFN_vkVoidFunction)CmdSetSampleLocationsEXT, false, 0},
+    [181] = {20290, (PFN_vkVoidFunction)CmdTraceRaysKHR, false, 0},
+    [182] = {6727, (PFN_vkVoidFunction)DestroyVideoSessionParametersKHR, false, 0},
+    [183] = {18510, (PFN_vkVoidFunction)CmdSetCoverageModulationTableNV, false, 0},
+    [184] = {6567, (PFN_vkVoidFunction)DestroyVideoSessionKHR, false, 0},
+    [185] = {11457, (PFN_vkVoidFunction)ReleaseDisplayEXT, true, offsetof(struct loader_instance_extension_enables, ext_direct_mode_display)},
+    [186] = {20454, (PFN_vkVoidFunction)CmdSetRayTracingPipelineStackSizeKHR, false, 0},
+    [187] = {14699, (PFN_vkVoidFunction)CmdSetDepthCompareOpEXT, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [188] = {11319, (PFN_vkVoidFunction)GetMemoryWin32HandleNV, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [189] = {15693, (PFN_vkVoidFunction)GetBufferOpaqueCaptureDescriptorDataEXT, false, 0},
+    [190] = {16730, (PFN_vkVoidFunction)CmdSetPrimitiveRestartEnableEXT, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [191] = {12490, (PFN_vkVoidFunction)CmdDispatchGraphIndirectAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [192] = {12696, (PFN_vkVoidFunction)DestroyValidationCacheEXT, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [193] = {7398, (PFN_vkVoidFunction)GetMemoryWin32HandlePropertiesKHR, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [194] = {19314, (PFN_vkVoidFunction)CmdPreprocessGeneratedCommandsEXT, false, 0},
+    [195] = {19452, (PFN_vkVoidFunction)CreateIndirectExecutionSetEXT, false, 0},
+    [198] = {15374, (PFN_vkVoidFunction)CreateCudaFunctionNV, false, 0},
+    [201] = {17350, (PFN_vkVoidFunction)GetDescriptorSetLayoutHostMappingInfoVALVE, false, 0},
+    [203] = {14490, (PFN_vkVoidFunction)CmdSetCullModeEXT, false, 0},
+    [204] = {19270, (PFN_vkVoidFunction)GetGeneratedCommandsMemoryRequirementsEXT, false, 0},
+    [205] = {17142, (PFN_vkVoidFunction)CmdCopyMemoryToMicromapEXT, false, 0},
+    [206] = {18470, (PFN_vkVoidFunction)CmdSetCoverageModulationTableEnableNV, false, 0},
+    [207] = {8601, (PFN_vkVoidFunction)DestroySamplerYcbcrConversionKHR, false, 0},
+    [208] = {15137, (PFN_vkVoidFunction)DestroyIndirectCommandsLayoutNV, false, 0},
+    [209] = {9443, (PFN_vkVoidFunction)GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR, false, 0},
+    [210] = {18886, (PFN_vkVoidFunction)AntiLagUpdateAMD, false, 0},
+    [212] = {17693, (PFN_vkVoidFunction)CmdSetPolygonModeEXT, false, 0},
+    [213] = {18769, (PFN_vkVoidFunction)CreateOpticalFlowSessionNV, false, 0},
+    [214] = {18943, (PFN_vkVoidFunction)GetShaderBinaryDataEXT, false, 0},
+    [215] = {7226, (PFN_vkVoidFunction)CmdSetDeviceMaskKHR, false, 0},
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    [216] = {15467, (PFN_vkVoidFunction)ExportMetalObjectsEXT, false, 0},
+#endif // VK_USE_PLATFORM_METAL_EXT
+    [217] = {13472, (PFN_vkVoidFunction)CmdDrawMeshTasksNV, false, 0},
+    [218] = {8567, (PFN_vkVoidFunction)CreateSamplerYcbcrConversionKHR, false, 0},
+    [220] = {16928, (PFN_vkVoidFunction)DestroyMicromapEXT, false, 0},
+    [221] = {13396, (PFN_vkVoidFunction)GetPhysicalDeviceCalibrateableTimeDomainsEXT, false, 0},
+    [222] = {8202, (PFN_vkVoidFunction)ReleaseProfilingLockKHR, false, 0},
+    [223] = {14935, (PFN_vkVoidFunction)ReleaseSwapchainImagesEXT, false, 0},
+    [224] = {7696, (PFN_vkVoidFunction)CreateDescriptorUpdateTemplateKHR, false, 0},
+    [225] = {8960, (PFN_vkVoidFunction)CmdSetRenderingInputAttachmentIndicesKHR, false, 0},
+    [226] = {17267, (PFN_vkVoidFunction)CmdDrawClusterHUAWEI, false, 0},
+    [227] = {10119, (PFN_vkVoidFunction)DestroyPipelineBinaryKHR, false, 0},
+    [228] = {9775, (PFN_vkVoidFunction)CmdBlitImage2KHR, false, 0},
+    [229] = {9640, (PFN_vkVoidFunction)CmdWriteTimestamp2KHR, false, 0},
+    [233] = {19383, (PFN_vkVoidFunction)CreateIndirectCommandsLayoutEXT, false, 0},
+    [234] = {13859, (PFN_vkVoidFunction)AcquirePerformanceConfigurationINTEL, false, 0},
+    [235] = {17062, (PFN_vkVoidFunction)WriteMicromapsPropertiesEXT, false, 0},
+    [236] = {19695, (PFN_vkVoidFunction)DestroyAccelerationStructureKHR, false, 0},
+    [237] = {11800, (PFN_vkVoidFunction)CmdSetDiscardRectangleModeEXT, false, 0},
+    [238] = {18437, (PFN_vkVoidFunction)CmdSetCoverageModulationModeNV, false, 0},
+    [240] = {15397, (PFN_vkVoidFunction)DestroyCudaModuleNV, false, 0},
+    [241] = {8636, (PFN_vkVoidFunction)BindBufferMemory2KHR, false, 0},
+    [243] = {16592, (PFN_vkVoidFunction)GetPipelinePropertiesEXT, false, 0},
+    [244] = {18275, (PFN_vkVoidFunction)CmdSetDepthClipNegativeOneToOneEXT, false, 0},
+    [245] = {17489, (PFN_vkVoidFunction)CmdDecompressMemoryNV, false, 0},
+    [249] = {9023, (PFN_vkVoidFunction)GetBufferDeviceAddressKHR, false, 0},
+    [250] = {11181, (PFN_vkVoidFunction)CmdDrawIndexedIndirectCountAMD, false, 0},
+    [251] = {19350, (PFN_vkVoidFunction)CmdExecuteGeneratedCommandsEXT, false, 0},
+    [252] = {7325, (PFN_vkVoidFunction)vkGetPhysicalDeviceExternalBufferProperties, true, offsetof(struct loader_instance_extension_enables, khr_external_memory_capabilities)},
+    [253] = {17748, (PFN_vkVoidFunction)CmdSetSampleMaskEXT, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [254] = {16123, (PFN_vkVoidFunction)GetMemoryZirconHandleFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [255] = {12904, (PFN_vkVoidFunction)DestroyAccelerationStructureNV, false, 0},
+    [256] = {14470, (PFN_vkVoidFunction)ResetQueryPoolEXT, false, 0},
+    [257] = {18652, (PFN_vkVoidFunction)GetShaderModuleIdentifierEXT, false, 0},
+    [258] = {10941, (PFN_vkVoidFunction)CmdDrawIndirectByteCountEXT, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [259] = {14344, (PFN_vkVoidFunction)ReleaseFullScreenExclusiveModeEXT, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [260] = {18119, (PFN_vkVoidFunction)CmdSetSampleLocationsEnableEXT, false, 0},
+    [263] = {6967, (PFN_vkVoidFunction)vkGetPhysicalDeviceFormatProperties2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [264] = {13087, (PFN_vkVoidFunction)CmdTraceRaysNV, false, 0},
+    [265] = {11571, (PFN_vkVoidFunction)DisplayPowerControlEXT, false, 0},
+    [266] = {10661, (PFN_vkVoidFunction)DebugMarkerSetObjectTagEXT, false, 0},
+    [267] = {9051, (PFN_vkVoidFunction)GetBufferOpaqueCaptureAddressKHR, false, 0},
+    [268] = {10226, (PFN_vkVoidFunction)GetPhysicalDeviceCooperativeMatrixPropertiesKHR, false, 0},
+    [269] = {19114, (PFN_vkVoidFunction)LatencySleepNV, false, 0},
+    [270] = {19765, (PFN_vkVoidFunction)CmdBuildAccelerationStructuresIndirectKHR, false, 0},
+    [273] = {19517, (PFN_vkVoidFunction)UpdateIndirectExecutionSetPipelineEXT, false, 0},
+    [274] = {13758, (PFN_vkVoidFunction)CmdSetPerformanceMarkerINTEL, false, 0},
+    [277] = {20545, (PFN_vkVoidFunction)CmdDrawMeshTasksIndirectCountEXT, false, 0},
+    [278] = {10528, (PFN_vkVoidFunction)CmdBindDescriptorBufferEmbeddedSamplers2EXT, false, 0},
+    [279] = {9156, (PFN_vkVoidFunction)DestroyDeferredOperationKHR, false, 0},
+    [281] = {6762, (PFN_vkVoidFunction)CmdBeginVideoCodingKHR, false, 0},
+    [282] = {13134, (PFN_vkVoidFunction)GetRayTracingShaderGroupHandlesKHR, false, 0},
+    [283] = {10403, (PFN_vkVoidFunction)CmdPushConstants2KHR, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [284] = {7372, (PFN_vkVoidFunction)GetMemoryWin32HandleKHR, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [285] = {6933, (PFN_vkVoidFunction)vkGetPhysicalDeviceProperties2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [286] = {9086, (PFN_vkVoidFunction)GetDeviceMemoryOpaqueCaptureAddressKHR, false, 0},
+    [288] = {14758, (PFN_vkVoidFunction)CmdSetStencilTestEnableEXT, false, 0},
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    [289] = {12225, (PFN_vkVoidFunction)GetAndroidHardwareBufferPropertiesANDROID, false, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+    [290] = {13343, (PFN_vkVoidFunction)CmdWriteBufferMarkerAMD, false, 0},
+    [291] = {17884, (PFN_vkVoidFunction)CmdSetColorBlendEquationEXT, false, 0},
+    [292] = {7434, (PFN_vkVoidFunction)GetMemoryFdKHR, false, 0},
+    [293] = {18371, (PFN_vkVoidFunction)CmdSetCoverageToColorEnableNV, false, 0},
+    [294] = {16565, (PFN_vkVoidFunction)GetMemoryRemoteAddressNV, false, 0},
+    [295] = {15041, (PFN_vkVoidFunction)CmdExecuteGeneratedCommandsNV, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [296] = {16232, (PFN_vkVoidFunction)GetSemaphoreZirconHandleFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [297] = {8825, (PFN_vkVoidFunction)SignalSemaphoreKHR, false, 0},
+    [299] = {9882, (PFN_vkVoidFunction)GetDeviceImageMemoryRequirementsKHR, false, 0},
+    [300] = {14876, (PFN_vkVoidFunction)TransitionImageLayoutEXT, false, 0},
+    [301] = {11528, (PFN_vkVoidFunction)GetPhysicalDeviceSurfaceCapabilities2EXT, true, offsetof(struct loader_instance_extension_enables, ext_display_surface_counter)},
+    [302] = {15073, (PFN_vkVoidFunction)CmdBindPipelineShaderGroupNV, false, 0},
+    [303] = {9499, (PFN_vkVoidFunction)GetEncodedVideoSessionParametersKHR, false, 0},
+    [304] = {15921, (PFN_vkVoidFunction)CmdSetFragmentShadingRateEnumNV, false, 0},
+    [305] = {17240, (PFN_vkVoidFunction)GetMicromapBuildSizesEXT, false, 0},
+    [306] = {10022, (PFN_vkVoidFunction)GetDeviceImageSubresourceLayoutKHR, false, 0},
+    [307] = {17113, (PFN_vkVoidFunction)CmdCopyMicromapToMemoryEXT, false, 0},
+    [308] = {17395, (PFN_vkVoidFunction)GetDescriptorSetHostMappingVALVE, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [309] = {16343, (PFN_vkVoidFunction)SetBufferCollectionBufferConstraintsFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [310] = {7658, (PFN_vkVoidFunction)CmdPushDescriptorSetWithTemplateKHR, false, 0},
+    [312] = {13664, (PFN_vkVoidFunction)GetQueueCheckpointData2NV, false, 0},
+    [313] = {14113, (PFN_vkVoidFunction)GetPhysicalDeviceToolPropertiesEXT, false, 0},
+    [314] = {19050, (PFN_vkVoidFunction)GetDynamicRenderingTilePropertiesQCOM, false, 0},
+    [315] = {7478, (PFN_vkVoidFunction)vkGetPhysicalDeviceExternalSemaphoreProperties, true, offsetof(struct loader_instance_extension_enables, khr_external_semaphore_capabilities)},
+    [316] = {18924, (PFN_vkVoidFunction)DestroyShaderEXT, false, 0},
+    [318] = {13207, (PFN_vkVoidFunction)GetAccelerationStructureHandleNV, false, 0},
+    [319] = {17290, (PFN_vkVoidFunction)CmdDrawClusterIndirectHUAWEI, false, 0},
+    [320] = {13724, (PFN_vkVoidFunction)UninitializePerformanceApiINTEL, false, 0},
+    [321] = {6543, (PFN_vkVoidFunction)CreateVideoSessionKHR, false, 0},
+    [322] = {9920, (PFN_vkVoidFunction)GetDeviceImageSparseMemoryRequirementsKHR, false, 0},
+    [323] = {14903, (PFN_vkVoidFunction)GetImageSubresourceLayout2EXT, false, 0},
+    [324] = {8889, (PFN_vkVoidFunction)CmdSetFragmentShadingRateKHR, false, 0},
+    [325] = {9964, (PFN_vkVoidFunction)CmdBindIndexBuffer2KHR, false, 0},
+    [326] = {15171, (PFN_vkVoidFunction)CmdSetDepthBias2EXT, false, 0},
+    [328] = {10720, (PFN_vkVoidFunction)CmdDebugMarkerBeginEXT, false, 0},
+    [329] = {17321, (PFN_vkVoidFunction)SetDeviceMemoryPriorityEXT, false, 0},
+    [330] = {7248, (PFN_vkVoidFunction)CmdDispatchBaseKHR, false, 0},
+    [331] = {9557, (PFN_vkVoidFunction)CmdSetEvent2KHR, false, 0},
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    [333] = {11501, (PFN_vkVoidFunction)GetRandROutputDisplayEXT, true, offsetof(struct loader_instance_extension_enables, ext_acquire_xlib_display)},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    [335] = {8461, (PFN_vkVoidFunction)GetImageMemoryRequirements2KHR, false, 0},
+    [336] = {16908, (PFN_vkVoidFunction)CreateMicromapEXT, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [337] = {16298, (PFN_vkVoidFunction)SetBufferCollectionImageConstraintsFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [338] = {9794, (PFN_vkVoidFunction)CmdResolveImage2KHR, false, 0},
+    [339] = {13242, (PFN_vkVoidFunction)CmdWriteAccelerationStructuresPropertiesNV, false, 0},
+    [340] = {7854, (PFN_vkVoidFunction)CmdNextSubpass2KHR, false, 0},
+    [341] = {8528, (PFN_vkVoidFunction)GetImageSparseMemoryRequirements2KHR, false, 0},
+    [342] = {18246, (PFN_vkVoidFunction)CmdSetLineStippleEnableEXT, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [343] = {7560, (PFN_vkVoidFunction)GetSemaphoreWin32HandleKHR, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [344] = {14725, (PFN_vkVoidFunction)CmdSetDepthBoundsTestEnableEXT, false, 0},
+    [345] = {12076, (PFN_vkVoidFunction)CmdEndDebugUtilsLabelEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [346] = {16535, (PFN_vkVoidFunction)CmdBindInvocationMaskHUAWEI, false, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [347] = {12388, (PFN_vkVoidFunction)GetExecutionGraphPipelineNodeIndexAMDX, false, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [348] = {10375, (PFN_vkVoidFunction)CmdBindDescriptorSets2KHR, false, 0},
+    [350] = {13307, (PFN_vkVoidFunction)GetMemoryHostPointerPropertiesEXT, false, 0},
+    [351] = {16865, (PFN_vkVoidFunction)CmdDrawMultiEXT, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [353] = {16154, (PFN_vkVoidFunction)GetMemoryZirconHandlePropertiesFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [354] = {9186, (PFN_vkVoidFunction)GetDeferredOperationMaxConcurrencyKHR, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [355] = {14380, (PFN_vkVoidFunction)GetDeviceGroupSurfacePresentModes2EXT, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [356] = {19131, (PFN_vkVoidFunction)SetLatencyMarkerNV, false, 0},
+    [357] = {15491, (PFN_vkVoidFunction)GetDescriptorSetLayoutSizeEXT, false, 0},
+    [359] = {17716, (PFN_vkVoidFunction)CmdSetRasterizationSamplesEXT, false, 0},
+    [360] = {8494, (PFN_vkVoidFunction)GetBufferMemoryRequirements2KHR, false, 0},
+    [361] = {14531, (PFN_vkVoidFunction)CmdSetPrimitiveTopologyEXT, false, 0},
+    [363] = {6857, (PFN_vkVoidFunction)CmdBeginRenderingKHR, false, 0},
+    [364] = {10492, (PFN_vkVoidFunction)CmdSetDescriptorBufferOffsets2EXT, false, 0},
+    [368] = {15290, (PFN_vkVoidFunction)SetPrivateDataEXT, false, 0},
+    [369] = {13522, (PFN_vkVoidFunction)CmdDrawMeshTasksIndirectCountNV, false, 0},
+    [370] = {7097, (PFN_vkVoidFunction)vkGetPhysicalDeviceMemoryProperties2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [371] = {17831, (PFN_vkVoidFunction)CmdSetLogicOpEnableEXT, false, 0},
+    [373] = {17592, (PFN_vkVoidFunction)CmdUpdatePipelineIndirectBufferNV, false, 0},
+    [374] = {19809, (PFN_vkVoidFunction)BuildAccelerationStructuresKHR, false, 0},
+    [376] = {14854, (PFN_vkVoidFunction)CopyImageToImageEXT, false, 0},
+    [377] = {16837, (PFN_vkVoidFunction)CmdSetColorWriteEnableEXT, false, 0},
+    [378] = {6810, (PFN_vkVoidFunction)CmdControlVideoCodingKHR, false, 0},
+    [379] = {12724, (PFN_vkVoidFunction)MergeValidationCachesEXT, false, 0},
+    [380] = {15310, (PFN_vkVoidFunction)GetPrivateDataEXT, false, 0},
+    [381] = {10166, (PFN_vkVoidFunction)GetPipelineBinaryDataKHR, false, 0},
+    [383] = {13692, (PFN_vkVoidFunction)InitializePerformanceApiINTEL, false, 0},
+    [384] = {12628, (PFN_vkVoidFunction)GetImageDrmFormatModifierPropertiesEXT, false, 0},
+    [385] = {19662, (PFN_vkVoidFunction)CreateAccelerationStructureKHR, false, 0},
+    [386] = {9226, (PFN_vkVoidFunction)GetDeferredOperationResultKHR, false, 0},
+    [387] = {15613, (PFN_vkVoidFunction)CmdSetDescriptorBufferOffsetsEXT, false, 0},
+    [388] = {20308, (PFN_vkVoidFunction)CreateRayTracingPipelinesKHR, false, 0},
+    [389] = {11898, (PFN_vkVoidFunction)SetDebugUtilsObjectNameEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [390] = {14150, (PFN_vkVoidFunction)GetPhysicalDeviceCooperativeMatrixPropertiesNV, false, 0},
+    [391] = {19015, (PFN_vkVoidFunction)GetFramebufferTilePropertiesQCOM, false, 0},
+    [392] = {10059, (PFN_vkVoidFunction)GetImageSubresourceLayout2KHR, false, 0},
+    [393] = {7875, (PFN_vkVoidFunction)CmdEndRenderPass2KHR, false, 0},
+    [394] = {10891, (PFN_vkVoidFunction)CmdBeginQueryIndexedEXT, false, 0},
+    [395] = {19951, (PFN_vkVoidFunction)WriteAccelerationStructuresPropertiesKHR, false, 0},
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    [396] = {19239, (PFN_vkVoidFunction)GetScreenBufferPropertiesQNX, false, 0},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+    [397] = {7188, (PFN_vkVoidFunction)GetDeviceGroupPeerMemoryFeaturesKHR, false, 0},
+    [398] = {7052, (PFN_vkVoidFunction)vkGetPhysicalDeviceQueueFamilyProperties2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [399] = {9748, (PFN_vkVoidFunction)CmdCopyImageToBuffer2KHR, false, 0},
+    [400] = {13054, (PFN_vkVoidFunction)CmdCopyAccelerationStructureNV, false, 0},
+    [401] = {17513, (PFN_vkVoidFunction)CmdDecompressMemoryIndirectCountNV, false, 0},
+    [402] = {17204, (PFN_vkVoidFunction)GetDeviceMicromapCompatibilityEXT, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [403] = {7968, (PFN_vkVoidFunction)ImportFenceWin32HandleKHR, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [404] = {17940, (PFN_vkVoidFunction)CmdSetTessellationDomainOriginEXT, false, 0},
+    [405] = {14510, (PFN_vkVoidFunction)CmdSetFrontFaceEXT, false, 0},
+    [406] = {6693, (PFN_vkVoidFunction)UpdateVideoSessionParametersKHR, false, 0},
+    [408] = {14560, (PFN_vkVoidFunction)CmdSetViewportWithCountEXT, false, 0},
+    [409] = {10745, (PFN_vkVoidFunction)CmdDebugMarkerEndEXT, false, 0},
+    [410] = {15564, (PFN_vkVoidFunction)GetDescriptorEXT, false, 0},
+    [411] = {6499, (PFN_vkVoidFunction)GetPhysicalDeviceVideoFormatPropertiesKHR, false, 0},
+    [412] = {15330, (PFN_vkVoidFunction)CreateCudaModuleNV, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [413] = {16195, (PFN_vkVoidFunction)ImportSemaphoreZirconHandleFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [414] = {20415, (PFN_vkVoidFunction)GetRayTracingShaderGroupStackSizeKHR, false, 0},
+    [416] = {6787, (PFN_vkVoidFunction)CmdEndVideoCodingKHR, false, 0},
+    [417] = {18152, (PFN_vkVoidFunction)CmdSetColorBlendAdvancedEXT, false, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [418] = {16266, (PFN_vkVoidFunction)CreateBufferCollectionFUCHSIA, false, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [419] = {9409, (PFN_vkVoidFunction)MapMemory2KHR, false, 0},
+    [420] = {7137, (PFN_vkVoidFunction)vkGetPhysicalDeviceSparseImageFormatProperties2, true, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [421] = {18905, (PFN_vkVoidFunction)CreateShadersEXT, false, 0},
+    [422] = {9003, (PFN_vkVoidFunction)WaitForPresentKHR, false, 0},
+    [423] = {9843, (PFN_vkVoidFunction)GetDeviceBufferMemoryRequirementsKHR, false, 0},
+    [425] = {13937, (PFN_vkVoidFunction)QueueSetPerformanceConfigurationINTEL, false, 0},
+    [426] = {9322, (PFN_vkVoidFunction)GetPipelineExecutableStatisticsKHR, false, 0},
+    [427] = {18968, (PFN_vkVoidFunction)CmdBindShadersEXT, false, 0},
+    [430] = {14671, (PFN_vkVoidFunction)CmdSetDepthWriteEnableEXT, false, 0},
+    [431] = {9664, (PFN_vkVoidFunction)QueueSubmit2KHR, false, 0},
+    [432] = {8021, (PFN_vkVoidFunction)ImportFenceFdKHR, false, 0},
+    [433] = {11621, (PFN_vkVoidFunction)RegisterDisplayEventEXT, false, 0},
+    [434] = {14617, (PFN_vkVoidFunction)CmdBindVertexBuffers2EXT, false, 0},
+    [435] = {16461, (PFN_vkVoidFunction)GetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI, false, 0},
+    [436] = {8716, (PFN_vkVoidFunction)CmdDrawIndirectCountKHR, false, 0},
+    [437] = {12984, (PFN_vkVoidFunction)BindAccelerationStructureMemoryNV, false, 0},
+    [438] = {13637, (PFN_vkVoidFunction)GetQueueCheckpointDataNV, false, 0},
+    [439] = {7806, (PFN_vkVoidFunction)CreateRenderPass2KHR, false, 0},
+    [441] = {14787, (PFN_vkVoidFunction)CmdSetStencilOpEXT, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [442] = {7996, (PFN_vkVoidFunction)GetFenceWin32HandleKHR, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [443] = {16992, (PFN_vkVoidFunction)CopyMicromapEXT, false, 0},
+    [444] = {10690, (PFN_vkVoidFunction)DebugMarkerSetObjectNameEXT, false, 0},
+    [445] = {13171, (PFN_vkVoidFunction)GetRayTracingShaderGroupHandlesNV, false, 0},
+    [446] = {12015, (PFN_vkVoidFunction)QueueInsertDebugUtilsLabelEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [447] = {19873, (PFN_vkVoidFunction)CopyAccelerationStructureToMemoryKHR, false, 0},
+    [448] = {11832, (PFN_vkVoidFunction)SetHdrMetadataEXT, false, 0},
+    [449] = {8040, (PFN_vkVoidFunction)GetFenceFdKHR, false, 0},
+    [450] = {12751, (PFN_vkVoidFunction)GetValidationCacheDataEXT, false, 0},
+    [451] = {14808, (PFN_vkVoidFunction)CopyMemoryToImageEXT, false, 0},
+    [452] = {10193, (PFN_vkVoidFunction)ReleaseCapturedPipelineDataKHR, false, 0},
+    [453] = {15443, (PFN_vkVoidFunction)CmdCudaLaunchKernelNV, false, 0},
+    [454] = {6631, (PFN_vkVoidFunction)BindVideoSessionMemoryKHR, false, 0},
+    [455] = {20028, (PFN_vkVoidFunction)CmdCopyAccelerationStructureToMemoryKHR, false, 0},
+    [456] = {19199, (PFN_vkVoidFunction)CmdSetAttachmentFeedbackLoopEnableEXT, false, 0},
+    [457] = {19912, (PFN_vkVoidFunction)CopyMemoryToAccelerationStructureKHR, false, 0},
+    [458] = {18620, (PFN_vkVoidFunction)CmdSetCoverageReductionModeNV, false, 0},
+    [459] = {8920, (PFN_vkVoidFunction)CmdSetRenderingAttachmentLocationsKHR, false, 0},
+    [460] = {11398, (PFN_vkVoidFunction)CmdEndConditionalRenderingEXT, false, 0},
+    [461] = {10917, (PFN_vkVoidFunction)CmdEndQueryIndexedEXT, false, 0},
+    [462] = {12807, (PFN_vkVoidFunction)CmdSetViewportShadingRatePaletteNV, false, 0},
+    [463] = {13589, (PFN_vkVoidFunction)CmdSetExclusiveScissorNV, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [464] = {15979, (PFN_vkVoidFunction)AcquireWinrtDisplayNV, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [465] = {14265, (PFN_vkVoidFunction)GetPhysicalDeviceSurfacePresentModes2EXT, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [466] = {11130, (PFN_vkVoidFunction)GetImageViewAddressNVX, false, 0},
+    [467] = {7829, (PFN_vkVoidFunction)CmdBeginRenderPass2KHR, false, 0},
+    [468] = {9989, (PFN_vkVoidFunction)GetRenderingAreaGranularityKHR, false, 0},
+    [469] = {18403, (PFN_vkVoidFunction)CmdSetCoverageToColorLocationNV, false, 0},
+    [471] = {13789, (PFN_vkVoidFunction)CmdSetPerformanceStreamMarkerINTEL, false, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [472] = {7528, (PFN_vkVoidFunction)ImportSemaphoreWin32HandleKHR, false, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [473] = {12844, (PFN_vkVoidFunction)CmdSetCoarseSampleOrderNV, false, 0},
+    [474] = {9359, (PFN_vkVoidFunction)GetPipelineExecutableInternalRepresentationsKHR, false, 0},
+    [475] = {13369, (PFN_vkVoidFunction)CmdWriteBufferMarker2AMD, false, 0},
+    [476] = {15864, (PFN_vkVoidFunction)GetAccelerationStructureOpaqueCaptureDescriptorDataEXT, false, 0},
+    [477] = {15235, (PFN_vkVoidFunction)CreatePrivateDataSlotEXT, false, 0},
+    [480] = {10971, (PFN_vkVoidFunction)CreateCuModuleNVX, false, 0},
+    [481] = {9258, (PFN_vkVoidFunction)DeferredOperationJoinKHR, false, 0},
+    [483] = {9425, (PFN_vkVoidFunction)UnmapMemory2KHR, false, 0},
+    [484] = {17550, (PFN_vkVoidFunction)GetPipelineIndirectMemoryRequirementsNV, false, 0},
+    [485] = {18988, (PFN_vkVoidFunction)CmdSetDepthClampRangeEXT, false, 0},
+    [487] = {12584, (PFN_vkVoidFunction)GetPhysicalDeviceMultisamplePropertiesEXT, false, 0},
+    [488] = {16883, (PFN_vkVoidFunction)CmdDrawMultiIndexedEXT, false, 0},
+    [489] = {8056, (PFN_vkVoidFunction)EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR, false, 0},
+    [490] = {20250, (PFN_vkVoidFunction)GetAccelerationStructureBuildSizesKHR, false, 0},
+    [491] = {18798, (PFN_vkVoidFunction)DestroyOpticalFlowSessionNV, false, 0},
+    [492] = {20112, (PFN_vkVoidFunction)GetAccelerationStructureDeviceAddressKHR, false, 0},
+    [494] = {11955, (PFN_vkVoidFunction)QueueBeginDebugUtilsLabelEXT, true, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [495] = {14199, (PFN_vkVoidFunction)GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV, false, 0},
+    [497] = {20155, (PFN_vkVoidFunction)CmdWriteAccelerationStructuresPropertiesKHR, false, 0},
+    [498] = {11214, (PFN_vkVoidFunction)GetShaderInfoAMD, false, 0},
+    [499] = {8659, (PFN_vkVoidFunction)BindImageMemory2KHR, false, 0},
+    [500] = {8681, (PFN_vkVoidFunction)GetDescriptorSetLayoutSupportKHR, false, 0},
+    [502] = {10831, (PFN_vkVoidFunction)CmdBeginTransformFeedbackEXT, false, 0},
+    [503] = {13556, (PFN_vkVoidFunction)CmdSetExclusiveScissorEnableNV, false, 0},
+    [504] = {11364, (PFN_vkVoidFunction)CmdBeginConditionalRenderingEXT, false, 0},
+    [505] = {16649, (PFN_vkVoidFunction)CmdSetRasterizerDiscardEnableEXT, false, 0},
+    [508] = {11155, (PFN_vkVoidFunction)CmdDrawIndirectCountAMD, false, 0},
+    [509] = {15821, (PFN_vkVoidFunction)GetSamplerOpaqueCaptureDescriptorDataEXT, false, 0},
+    [510] = {17803, (PFN_vkVoidFunction)CmdSetAlphaToOneEnableEXT, false, 0},
+    [511] = {17914, (PFN_vkVoidFunction)CmdSetColorWriteMaskEXT, false, 0},
+};
+
+// GPA helpers for extensions
+bool extension_instance_gpa(struct loader_instance *ptr_instance, const char *name, void **addr) {
+    *addr = NULL;
+
+    const struct loader_instance_extension_command_entry *entry =
+        &instance_extension_command_table[loader_perfect_hash_slot(loader_hash_name(name, 0u), instance_extension_command_table_displacements, 255u, 9u)];
+    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {
+        return false;
+    }
+    if (entry->requires_enable) {
+        const uint8_t *enables = (const uint8_t *)&ptr_instance->enabled_known_extensions;
+        *addr = (enables[entry->enable_offset] == 1) ? (void *)entry->func : NULL;
+    } else {
+        *addr = (void *)entry->func;
+    }
+    return true;
+}
+
+// Entry of the generated perfect hash table used by extensions_create_instance
+struct loader_instance_extension_enable_entry {
+    uint16_t name_offset;                  // Offset of the extension name in loader_name_pool, 0 for unused slots
+    uint16_t enable_offset;                // Offset of the enable flag in loader_instance_extension_enables
+};
+
+// Perfect hash table of the instance extensions tracked by the loader, generated from the registry
+static const uint16_t instance_extension_enable_table_displacements[8] = {
+    0, 0, 0, 0, 1, 0, 0, 1,
+};
+static const struct loader_instance_extension_enable_entry instance_extension_enable_table[16] = {
+    [0] = {25119, offsetof(struct loader_instance_extension_enables, ext_display_surface_counter)},
+    [1] = {25064, offsetof(struct loader_instance_extension_enables, ext_direct_mode_display)},
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    [2] = {25091, offsetof(struct loader_instance_extension_enables, ext_acquire_xlib_display)},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    [3] = {21008, offsetof(struct loader_instance_extension_enables, khr_get_physical_device_properties2)},
+    [6] = {28030, offsetof(struct loader_instance_extension_enables, ext_acquire_drm_display)},
+    [7] = {21146, offsetof(struct loader_instance_extension_enables, khr_external_memory_capabilities)},
+    [8] = {21630, offsetof(struct loader_instance_extension_enables, khr_external_fence_capabilities)},
+    [9] = {21117, offsetof(struct loader_instance_extension_enables, khr_device_group_creation)},
+    [10] = {24713, offsetof(struct loader_instance_extension_enables, nv_external_memory_capabilities)},
+    [12] = {25616, offsetof(struct loader_instance_extension_enables, ext_debug_utils)},
+    [15] = {21285, offsetof(struct loader_instance_extension_enables, khr_external_semaphore_capabilities)},
+};
+
+// A function that can be used to query enabled extensions during a vkCreateInstance call
+void extensions_create_instance(struct loader_instance *ptr_instance, const VkInstanceCreateInfo *pCreateInfo) {
+    uint8_t *enables = (uint8_t *)&ptr_instance->enabled_known_extensions;
+    for (uint32_t i = 0; i < pCreateInfo->enabledExtensionCount; i++) {
+        const char *name = pCreateInfo->ppEnabledExtensionNames[i];
+        const struct loader_instance_extension_enable_entry *entry =
+            &instance_extension_enable_table[loader_perfect_hash_slot(loader_hash_name(name, 0u), instance_extension_enable_table_displacements, 7u, 4u)];
+        if (0 != entry->name_offset && 0 == strcmp(name, &loader_name_pool[entry->name_offset])) {
+            enables[entry->enable_offset] = 1;
+        }
+    }
+}
+
+// Entry of the generated perfect hash table used by get_extension_device_proc_terminator
+struct loader_device_terminator_entry {
+    uint16_t name_offset;                  // Offset of the command name without the "vk" prefix in loader_name_pool, 0 for unused slots
+    PFN_vkVoidFunction terminator;         // Terminator returned for the command
+    uint32_t driver_extension_offset;      // Offset of the driver extension enable flag guarding terminator
+    uint32_t requirement;                  // Additional requirement checked by loader_device_terminator_requirement_met
+};
+
+// Perfect hash table of the device commands which need a terminator, generated from the registry
+static const uint16_t device_terminator_table_displacements[8] = {
+    0, 3, 4, 0, 0, 0, 4, 0,
+};
+static const struct loader_device_terminator_entry device_terminator_table[16] = {
+    [0] = {10663, (PFN_vkVoidFunction)terminator_DebugMarkerSetObjectTagEXT, offsetof(struct loader_device, driver_extensions.ext_debug_marker_enabled), 0},
+    [1] = {5637, (PFN_vkVoidFunction)terminator_CreateSwapchainKHR, offsetof(struct loader_device, driver_extensions.khr_swapchain_enabled), 0},
+    [2] = {11957, (PFN_vkVoidFunction)terminator_QueueBeginDebugUtilsLabelEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [3] = {11929, (PFN_vkVoidFunction)terminator_SetDebugUtilsObjectTagEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [4] = {11900, (PFN_vkVoidFunction)terminator_SetDebugUtilsObjectNameEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [5] = {11988, (PFN_vkVoidFunction)terminator_QueueEndDebugUtilsLabelEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [6] = {5783, (PFN_vkVoidFunction)terminator_GetDeviceGroupSurfacePresentModesKHR, offsetof(struct loader_device, driver_extensions.khr_swapchain_enabled), 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [7] = {14382, (PFN_vkVoidFunction)terminator_GetDeviceGroupSurfacePresentModes2EXT, offsetof(struct loader_device, driver_extensions.ext_full_screen_exclusive_enabled), 1},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [8] = {12017, (PFN_vkVoidFunction)terminator_QueueInsertDebugUtilsLabelEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [9] = {6125, (PFN_vkVoidFunction)terminator_CreateSharedSwapchainsKHR, offsetof(struct loader_device, driver_extensions.khr_display_swapchain_enabled), 0},
+    [12] = {10692, (PFN_vkVoidFunction)terminator_DebugMarkerSetObjectNameEXT, offsetof(struct loader_device, driver_extensions.ext_debug_marker_enabled), 0},
+    [13] = {12105, (PFN_vkVoidFunction)terminator_CmdInsertDebugUtilsLabelEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [14] = {12049, (PFN_vkVoidFunction)terminator_CmdBeginDebugUtilsLabelEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+    [15] = {12078, (PFN_vkVoidFunction)terminator_CmdEndDebugUtilsLabelEXT, offsetof(struct loader_device, driver_extensions.ext_debug_utils_enabled), 0},
+};
+
+// Check the extension dependencies of a command beyond the extension which added it
+static bool loader_device_terminator_requirement_met(const struct loader_device *dev, uint32_t requirement) {
+    switch (requirement) {
+        case 1:
+            return dev->driver_extensions.khr_device_group_enabled || dev->driver_extensions.version_1_1_enabled;
+        default:
+            return true;
+    }
+}
+
+// Some device commands still need a terminator because the loader needs to unwrap something about them.
+// In many cases, the item needing unwrapping is a VkPhysicalDevice or VkSurfaceKHR object.  But there may be other items
+// in the future.
+PFN_vkVoidFunction get_extension_device_proc_terminator(struct loader_device *dev, const char *name, bool* found_name) {
+    *found_name = false;
+    if (!name || name[0] != 'v' || name[1] != 'k') {
+        return NULL;
+    }
+    name += 2;
+    const struct loader_device_terminator_entry *entry =
+        &device_terminator_table[loader_perfect_hash_slot(loader_hash_name(name, 0u), device_terminator_table_displacements, 7u, 4u)];
+    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {
+        return NULL;
+    }
+
+    *found_name = true;
+    bool enabled = *(const bool *)((const char *)dev + entry->driver_extension_offset);
+    return (enabled && loader_device_terminator_requirement_met(dev, entry->requirement)) ? entry->terminator : NULL;
+}
+
+// This table contains the loader's instance dispatch table, which contains
+// default functions if no instance layers are activated.  This contains
+// pointers to "terminator functions".
+const VkLayerInstanceDispatchTable instance_disp = {
+
+    // ---- Core Vulkan 1.0 commands
+    .DestroyInstance = terminator_DestroyInstance,
+    .EnumeratePhysicalDevices = terminator_EnumeratePhysicalDevices,
+    .GetPhysicalDeviceFeatures = terminator_GetPhysicalDeviceFeatures,
+    .GetPhysicalDeviceFormatProperties = terminator_GetPhysicalDeviceFormatProperties,
+    .GetPhysicalDeviceImageFormatProperties = terminator_GetPhysicalDeviceImageFormatProperties,
+    .GetPhysicalDeviceProperties = terminator_GetPhysicalDeviceProperties,
+    .GetPhysicalDeviceQueueFamilyProperties = terminator_GetPhysicalDeviceQueueFamilyProperties,
+    .GetPhysicalDeviceMemoryProperties = terminator_GetPhysicalDeviceMemoryProperties,
+    .GetInstanceProcAddr = vkGetInstanceProcAddr,
+    .EnumerateDeviceExtensionProperties = terminator_EnumerateDeviceExtensionProperties,
+    .EnumerateDeviceLayerProperties = terminator_EnumerateDeviceLayerProperties,
+    .GetPhysicalDeviceSparseImageFormatProperties = terminator_GetPhysicalDeviceSparseImageFormatProperties,
+
+    // ---- Core Vulkan 1.1 commands
+    .EnumeratePhysicalDeviceGroups = terminator_EnumeratePhysicalDeviceGroups,
+    .GetPhysicalDeviceFeatures2 = terminator_GetPhysicalDeviceFeatures2,
+    .GetPhysicalDeviceProperties2 = terminator_GetPhysicalDeviceProperties2,
+    .GetPhysicalDeviceFormatProperties2 = terminator_GetPhysicalDeviceFormatProperties2,
+    .GetPhysicalDeviceImageFormatProperties2 = terminator_GetPhysicalDeviceImageFormatProperties2,
+    .GetPhysicalDeviceQueueFamilyProperties2 = terminator_GetPhysicalDeviceQueueFamilyProperties2,
+    .GetPhysicalDeviceMemoryProperties2 = terminator_GetPhysicalDeviceMemoryProperties2,
+    .GetPhysicalDeviceSparseImageFormatProperties2 = terminator_GetPhysicalDeviceSparseImageFormatProperties2,
+    .GetPhysicalDeviceExternalBufferProperties = terminator_GetPhysicalDeviceExternalBufferProperties,
+    .GetPhysicalDeviceExternalFenceProperties = terminator_GetPhysicalDeviceExternalFenceProperties,
+    .GetPhysicalDeviceExternalSemaphoreProperties = terminator_GetPhysicalDeviceExternalSemaphoreProperties,
+
+    // ---- Core Vulkan 1.3 commands
+    .GetPhysicalDeviceToolProperties = terminator_GetPhysicalDeviceToolProperties,
+
+    // ---- VK_KHR_surface extension commands
+    .DestroySurfaceKHR = terminator_DestroySurfaceKHR,
+    .GetPhysicalDeviceSurfaceSupportKHR = terminator_GetPhysicalDeviceSurfaceSupportKHR,
+    .GetPhysicalDeviceSurfaceCapabilitiesKHR = terminator_GetPhysicalDeviceSurfaceCapabilitiesKHR,
+    .GetPhysicalDeviceSurfaceFormatsKHR = terminator_GetPhysicalDeviceSurfaceFormatsKHR,
+    .GetPhysicalDeviceSurfacePresentModesKHR = terminator_GetPhysicalDeviceSurfacePresentModesKHR,
+
+    // ---- VK_KHR_swapchain extension commands
+    .GetPhysicalDevicePresentRectanglesKHR = terminator_GetPhysicalDevicePresentRectanglesKHR,
+
+    // ---- VK_KHR_display extension commands
+    .GetPhysicalDeviceDisplayPropertiesKHR = terminator_GetPhysicalDeviceDisplayPropertiesKHR,
+    .GetPhysicalDeviceDisplayPlanePropertiesKHR = terminator_GetPhysicalDeviceDisplayPlanePropertiesKHR,
+    .GetDisplayPlaneSupportedDisplaysKHR = terminator_GetDisplayPlaneSupportedDisplaysKHR,
+    .GetDisplayModePropertiesKHR = terminator_GetDisplayModePropertiesKHR,
+    .CreateDisplayModeKHR = terminator_CreateDisplayModeKHR,
+    .GetDisplayPlaneCapabilitiesKHR = terminator_GetDisplayPlaneCapabilitiesKHR,
+    .CreateDisplayPlaneSurfaceKHR = terminator_CreateDisplayPlaneSurfaceKHR,
+
+    // ---- VK_KHR_xlib_surface extension commands
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    .CreateXlibSurfaceKHR = terminator_CreateXlibSurfaceKHR,
+#endif // VK_USE_PLATFORM_XLIB_KHR
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    .GetPhysicalDeviceXlibPresentationSupportKHR = terminator_GetPhysicalDeviceXlibPresentationSupportKHR,
+#endif // VK_USE_PLATFORM_XLIB_KHR
+
+    // ---- VK_KHR_xcb_surface extension commands
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    .CreateXcbSurfaceKHR = terminator_CreateXcbSurfaceKHR,
+#endif // VK_USE_PLATFORM_XCB_KHR
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    .GetPhysicalDeviceXcbPresentationSupportKHR = terminator_GetPhysicalDeviceXcbPresentationSupportKHR,
+#endif // VK_USE_PLATFORM_XCB_KHR
+
+    // ---- VK_KHR_wayland_surface extension commands
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    .CreateWaylandSurfaceKHR = terminator_CreateWaylandSurfaceKHR,
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    .GetPhysicalDeviceWaylandPresentationSupportKHR = terminator_GetPhysicalDeviceWaylandPresentationSupportKHR,
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+
+    // ---- VK_KHR_android_surface extension commands
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    .CreateAndroidSurfaceKHR = terminator_CreateAndroidSurfaceKHR,
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+
+    // ---- VK_KHR_win32_surface extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    .CreateWin32SurfaceKHR = terminator_CreateWin32SurfaceKHR,
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    .GetPhysicalDeviceWin32PresentationSupportKHR = terminator_GetPhysicalDeviceWin32PresentationSupportKHR,
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_KHR_video_queue extension commands
+    .GetPhysicalDeviceVideoCapabilitiesKHR = terminator_GetPhysicalDeviceVideoCapabilitiesKHR,
+    .GetPhysicalDeviceVideoFormatPropertiesKHR = terminator_GetPhysicalDeviceVideoFormatPropertiesKHR,
+
+    // ---- VK_KHR_get_physical_device_properties2 extension commands
+    .GetPhysicalDeviceFeatures2KHR = terminator_GetPhysicalDeviceFeatures2,
+    .GetPhysicalDeviceProperties2KHR = terminator_GetPhysicalDeviceProperties2,
+    .GetPhysicalDeviceFormatProperties2KHR = terminator_GetPhysicalDeviceFormatProperties2,
+    .GetPhysicalDeviceImageFormatProperties2KHR = terminator_GetPhysicalDeviceImageFormatProperties2,
+    .GetPhysicalDeviceQueueFamilyProperties2KHR = terminator_GetPhysicalDeviceQueueFamilyProperties2,
+    .GetPhysicalDeviceMemoryProperties2KHR = terminator_GetPhysicalDeviceMemoryProperties2,
+    .GetPhysicalDeviceSparseImageFormatProperties2KHR = terminator_GetPhysicalDeviceSparseImageFormatProperties2,
+
+    // ---- VK_KHR_device_group_creation extension commands
+    .EnumeratePhysicalDeviceGroupsKHR = terminator_EnumeratePhysicalDeviceGroups,
+
+    // ---- VK_KHR_external_memory_capabilities extension commands
+    .GetPhysicalDeviceExternalBufferPropertiesKHR = terminator_GetPhysicalDeviceExternalBufferProperties,
+
+    // ---- VK_KHR_external_semaphore_capabilities extension commands
+    .GetPhysicalDeviceExternalSemaphorePropertiesKHR = terminator_GetPhysicalDeviceExternalSemaphoreProperties,
+
+    // ---- VK_KHR_external_fence_capabilities extension commands
+    .GetPhysicalDeviceExternalFencePropertiesKHR = terminator_GetPhysicalDeviceExternalFenceProperties,
+
+    // ---- VK_KHR_performance_query extension commands
+    .EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR = terminator_EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR,
+    .GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR = terminator_GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR,
+
+    // ---- VK_KHR_get_surface_capabilities2 extension commands
+    .GetPhysicalDeviceSurfaceCapabilities2KHR = terminator_GetPhysicalDeviceSurfaceCapabilities2KHR,
+    .GetPhysicalDeviceSurfaceFormats2KHR = terminator_GetPhysicalDeviceSurfaceFormats2KHR,
+
+    // ---- VK_KHR_get_display_properties2 extension commands
+    .GetPhysicalDeviceDisplayProperties2KHR = terminator_GetPhysicalDeviceDisplayProperties2KHR,
+    .GetPhysicalDeviceDisplayPlaneProperties2KHR = terminator_GetPhysicalDeviceDisplayPlaneProperties2KHR,
+    .GetDisplayModeProperties2KHR = terminator_GetDisplayModeProperties2KHR,
+    .GetDisplayPlaneCapabilities2KHR = terminator_GetDisplayPlaneCapabilities2KHR,
+
+    // ---- VK_KHR_fragment_shading_rate extension commands
+    .GetPhysicalDeviceFragmentShadingRatesKHR = terminator_GetPhysicalDeviceFragmentShadingRatesKHR,
+
+    // ---- VK_KHR_video_encode_queue extension commands
+    .GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR = terminator_GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR,
+
+    // ---- VK_KHR_cooperative_matrix extension commands
+    .GetPhysicalDeviceCooperativeMatrixPropertiesKHR = terminator_GetPhysicalDeviceCooperativeMatrixPropertiesKHR,
+
+    // ---- VK_KHR_calibrated_timestamps extension commands
+    .GetPhysicalDeviceCalibrateableTimeDomainsKHR = terminator_GetPhysicalDeviceCalibrateableTimeDomainsKHR,
+
+    // ---- VK_EXT_debug_report extension commands
+    .CreateDebugReportCallbackEXT = terminator_CreateDebugReportCallbackEXT,
+    .DestroyDebugReportCallbackEXT = terminator_DestroyDebugReportCallbackEXT,
+    .DebugReportMessageEXT = terminator_DebugReportMessageEXT,
+
+    // ---- VK_GGP_stream_descriptor_surface extension commands
+#if defined(VK_USE_PLATFORM_GGP)
+    .CreateStreamDescriptorSurfaceGGP = terminator_CreateStreamDescriptorSurfaceGGP,
+#endif // VK_USE_PLATFORM_GGP
+
+    // ---- VK_NV_external_memory_capabilities extension commands
+    .GetPhysicalDeviceExternalImageFormatPropertiesNV = terminator_GetPhysicalDeviceExternalImageFormatPropertiesNV,
+
+    // ---- VK_NN_vi_surface extension commands
+#if defined(VK_USE_PLATFORM_VI_NN)
+    .CreateViSurfaceNN = terminator_CreateViSurfaceNN,
+#endif // VK_USE_PLATFORM_VI_NN
+
+    // ---- VK_EXT_direct_mode_display extension commands
+    .ReleaseDisplayEXT = terminator_ReleaseDisplayEXT,
+
+    // ---- VK_EXT_acquire_xlib_display extension commands
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    .AcquireXlibDisplayEXT = terminator_AcquireXlibDisplayEXT,
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    .GetRandROutputDisplayEXT = terminator_GetRandROutputDisplayEXT,
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+
+    // ---- VK_EXT_display_surface_counter extension commands
+    .GetPhysicalDeviceSurfaceCapabilities2EXT = terminator_GetPhysicalDeviceSurfaceCapabilities2EXT,
+
+    // ---- VK_MVK_ios_surface extension commands
+#if defined(VK_USE_PLATFORM_IOS_MVK)
+    .CreateIOSSurfaceMVK = terminator_CreateIOSSurfaceMVK,
+#endif // VK_USE_PLATFORM_IOS_MVK
+
+    // ---- VK_MVK_macos_surface extension commands
+#if defined(VK_USE_PLATFORM_MACOS_MVK)
+    .CreateMacOSSurfaceMVK = terminator_CreateMacOSSurfaceMVK,
+#endif // VK_USE_PLATFORM_MACOS_MVK
+
+    // ---- VK_EXT_debug_utils extension commands
+    .CreateDebugUtilsMessengerEXT = terminator_CreateDebugUtilsMessengerEXT,
+    .DestroyDebugUtilsMessengerEXT = terminator_DestroyDebugUtilsMessengerEXT,
+    .SubmitDebugUtilsMessageEXT = terminator_SubmitDebugUtilsMessageEXT,
+
+    // ---- VK_EXT_sample_locations extension commands
+    .GetPhysicalDeviceMultisamplePropertiesEXT = terminator_GetPhysicalDeviceMultisamplePropertiesEXT,
+
+    // ---- VK_EXT_calibrated_timestamps extension commands
+    .GetPhysicalDeviceCalibrateableTimeDomainsEXT = terminator_GetPhysicalDeviceCalibrateableTimeDomainsEXT,
+
+    // ---- VK_FUCHSIA_imagepipe_surface extension commands
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    .CreateImagePipeSurfaceFUCHSIA = terminator_CreateImagePipeSurfaceFUCHSIA,
+#endif // VK_USE_PLATFORM_FUCHSIA
+
+    // ---- VK_EXT_metal_surface extension commands
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    .CreateMetalSurfaceEXT = terminator_CreateMetalSurfaceEXT,
+#endif // VK_USE_PLATFORM_METAL_EXT
+
+    // ---- VK_EXT_tooling_info extension commands
+    .GetPhysicalDeviceToolPropertiesEXT = terminator_GetPhysicalDeviceToolPropertiesEXT,
+
+    // ---- VK_NV_cooperative_matrix extension commands
+    .GetPhysicalDeviceCooperativeMatrixPropertiesNV = terminator_GetPhysicalDeviceCooperativeMatrixPropertiesNV,
+
+    // ---- VK_NV_coverage_reduction_mode extension commands
+    .GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV = terminator_GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV,
+
+    // ---- VK_EXT_full_screen_exclusive extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    .GetPhysicalDeviceSurfacePresentModes2EXT = terminator_GetPhysicalDeviceSurfacePresentModes2EXT,
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_headless_surface extension commands
+    .CreateHeadlessSurfaceEXT = terminator_CreateHeadlessSurfaceEXT,
+
+    // ---- VK_EXT_acquire_drm_display extension commands
+    .AcquireDrmDisplayEXT = terminator_AcquireDrmDisplayEXT,
+    .GetDrmDisplayEXT = terminator_GetDrmDisplayEXT,
+
+    // ---- VK_NV_acquire_winrt_display extension commands
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    .AcquireWinrtDisplayNV = terminator_AcquireWinrtDisplayNV,
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    .GetWinrtDisplayNV = terminator_GetWinrtDisplayNV,
+#endif // VK_USE_PLATFORM_WIN32_KHR
+
+    // ---- VK_EXT_directfb_surface extension commands
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    .CreateDirectFBSurfaceEXT = terminator_CreateDirectFBSurfaceEXT,
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    .GetPhysicalDeviceDirectFBPresentationSupportEXT = terminator_GetPhysicalDeviceDirectFBPresentationSupportEXT,
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+
+    // ---- VK_QNX_screen_surface extension commands
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    .CreateScreenSurfaceQNX = terminator_CreateScreenSurfaceQNX,
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    .GetPhysicalDeviceScreenPresentationSupportQNX = terminator_GetPhysicalDeviceScreenPresentationSupportQNX,
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+
+    // ---- VK_NV_optical_flow extension commands
+    .GetPhysicalDeviceOpticalFlowImageFormatsNV = terminator_GetPhysicalDeviceOpticalFlowImageFormatsNV,
+
+    // ---- VK_NV_cooperative_matrix2 extension commands
+    .GetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV = terminator_GetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV,
+};
+
+// Offsets in loader_name_pool of the names of all of the instance extensions supported by the loader.
+// If an instance extension name is not in this list, but it is exported by one or more of the
+// ICDs detected by the loader, then the extension name not in the list will be filtered out
+// before passing the list of extensions to the application.
+const uint16_t LOADER_INSTANCE_EXTENSIONS[] = {
+    20655, // VK_KHR_surface
+    20687, // VK_KHR_display
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    20727, // VK_KHR_xlib_surface
+#endif // VK_USE_PLATFORM_XLIB_KHR
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    20747, // VK_KHR_xcb_surface
+#endif // VK_USE_PLATFORM_XCB_KHR
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    20766, // VK_KHR_wayland_surface
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    20789, // VK_KHR_win32_surface
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    21008, // VK_KHR_get_physical_device_properties2
+    21117, // VK_KHR_device_group_creation
+    21146, // VK_KHR_external_memory_capabilities
+    21285, // VK_KHR_external_semaphore_capabilities
+    21630, // VK_KHR_external_fence_capabilities
+    21785, // VK_KHR_get_surface_capabilities2
+    21843, // VK_KHR_get_display_properties2
+    22636, // VK_KHR_surface_protected_capabilities
+    23288, // VK_KHR_portability_enumeration
+    24116, // VK_EXT_debug_report
+#if defined(VK_USE_PLATFORM_GGP)
+    24633, // VK_GGP_stream_descriptor_surface
+#endif // VK_USE_PLATFORM_GGP
+    24713, // VK_NV_external_memory_capabilities
+    24822, // VK_EXT_validation_flags
+#if defined(VK_USE_PLATFORM_VI_NN)
+    24846, // VK_NN_vi_surface
+#endif // VK_USE_PLATFORM_VI_NN
+    25064, // VK_EXT_direct_mode_display
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    25091, // VK_EXT_acquire_xlib_display
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    25119, // VK_EXT_display_surface_counter
+    25435, // VK_EXT_swapchain_colorspace
+#if defined(VK_USE_PLATFORM_IOS_MVK)
+    25517, // VK_MVK_ios_surface
+#endif // VK_USE_PLATFORM_IOS_MVK
+#if defined(VK_USE_PLATFORM_MACOS_MVK)
+    25536, // VK_MVK_macos_surface
+#endif // VK_USE_PLATFORM_MACOS_MVK
+    25616, // VK_EXT_debug_utils
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    26877, // VK_FUCHSIA_imagepipe_surface
+#endif // VK_USE_PLATFORM_FUCHSIA
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    26906, // VK_EXT_metal_surface
+#endif // VK_USE_PLATFORM_METAL_EXT
+    27326, // VK_EXT_validation_features
+    27520, // VK_EXT_headless_surface
+    27751, // VK_EXT_surface_maintenance1
+    28030, // VK_EXT_acquire_drm_display
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    28820, // VK_EXT_directfb_surface
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    29368, // VK_QNX_screen_surface
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+    30158, // VK_GOOGLE_surfaceless_query
+    30386, // VK_LUNARG_direct_driver_loading
+    30863, // VK_EXT_layer_settings
+    31332, // VK_NV_display_stereo
+};
+const uint32_t LOADER_INSTANCE_EXTENSION_COUNT = sizeof(LOADER_INSTANCE_EXTENSIONS) / sizeof(LOADER_INSTANCE_EXTENSIONS[0]);
+// clang-format on
@@ -0,0 +1,959 @@
+// *** THIS FILE IS GENERATED - DO NOT EDIT ***
+// See loader_extension_generator.py for modifications
+
+/*
+ * Copyright (c) 2015-2022 The Khronos Group Inc.
+ * Copyright (c) 2015-2022 Valve Corporation
+ * Copyright (c) 2015-2022 LunarG, Inc.
+ * Copyright (c) 2021-2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * Copyright (c) 2023-2023 RasterGrid Kft.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * Author: Mark Lobodzinski <mark@lunarg.com>
+ * Author: Mark Young <marky@lunarg.com>
+ */
+
+// clang-format off
+#include "vk_loader_extensions_internal.h"
+
+// Entry of the generated perfect hash table used by loader_lookup_device_dispatch_table
+struct loader_device_command_lookup_entry {
+    uint16_t name_offset;                  // Offset of the command name without the "vk" prefix in loader_name_pool, 0 for unused slots
+    uint32_t table_offset;                 // Offset of the command in VkLayerDispatchTable
+    uint32_t api_version;                  // Core version which added the command, 0 for extension commands
+    PFN_vkVoidFunction trampoline;         // Trampoline that must always be returned instead of the table entry
+    uint32_t layer_extension_offset;       // Offset of the layer extension enable flag guarding trampoline
+};
+
+// Entry of the generated perfect hash table used by loader_lookup_instance_dispatch_table
+struct loader_instance_command_lookup_entry {
+    uint16_t name_offset;                  // Offset of the command name without the "vk" prefix in loader_name_pool, 0 for unused slots
+    uint32_t table_offset;                 // Offset of the command in VkLayerInstanceDispatchTable
+};
+
+// Perfect hash table of all device commands, generated from the registry
+static const uint16_t device_command_lookup_table_displacements[512] = {
+    0, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 1, 1, 0, 1, 0, 0, 3, 0, 1, 0, 0, 0, 3, 1,
+    1, 1, 5, 0, 0, 0, 2, 0, 0, 0, 1, 2, 0, 1, 0, 0,
+    1, 2, 1, 6, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0,
+    1, 0, 2, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 2,
+    0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0,
+    5, 2, 2, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0,
+    0, 2, 0, 3, 1, 0, 0, 1, 0, 0, 0, 0, 2, 0, 0, 0,
+    1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 2,
+    0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1,
+    0, 0, 0, 0, 0, 0, 3, 4, 0, 1, 1, 2, 0, 0, 0, 0,
+    2, 0, 4, 3, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0,
+    0, 3, 0, 0, 0, 0, 1, 1, 0, 0, 3, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 3, 2, 2, 0, 5, 0, 1, 0, 0, 0, 0,
+    3, 5, 0, 0, 0, 0, 0, 0, 0, 2, 0, 1, 0, 0, 0, 0,
+    0, 1, 0, 2, 0, 1, 0, 0, 0, 0, 1, 0, 2, 0, 0, 4,
+    0, 2, 0, 3, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 2, 0, 2, 0, 1, 0, 0, 3, 8, 0, 1,
+    0, 0, 0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0, 0, 0, 0,
+    1, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 0, 2,
+    0, 3, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 2, 0, 0,
+    0, 1, 0, 0, 2, 0, 1, 0, 0, 0, 0, 0, 3, 0, 0, 2,
+    0, 0, 2, 0, 1, 0, 0, 3, 0, 0, 0, 2, 0, 0, 0, 0,
+    0, 0, 0, 0, 4, 0, 0, 0, 2, 0, 1, 0, 0, 2, 0, 1,
+    0, 3, 1, 0, 0, 0, 6, 1, 0, 0, 2, 1, 0, 0, 3, 3,
+    0, 0, 4, 0, 0, 0, 0, 0, 6, 0, 1, 0, 3, 0, 0, 0,
+    0, 0, 0, 0, 1, 0, 0, 2, 0, 2, 2, 1, 1, 0, 0, 0,
+    0, 0, 0, 3, 0, 1, 1, 2, 0, 0, 0, 2, 0, 8, 0, 0,
+    4, 0, 0, 0, 2, 4, 3, 2, 0, 1, 0, 0, 0, 0, 0, 2,
+    3, 0, 0, 2, 2, 3, 3, 0, 4, 0, 0, 0, 4, 2, 0, 1,
+    2, 0, 0, 0, 6, 0, 1, 0, 0, 3, 0, 0, 2, 1, 1, 0,
+    4, 6, 0, 0, 0, 0, 0, 2, 0, 3, 2, 0, 0, 0, 2, 0,
+};
+static const struct loader_device_command_lookup_entry device_command_lookup_table[1024] = {
+    [0] = {541, offsetof(VkLayerDispatchTable, DeviceWaitIdle), VK_API_VERSION_1_0, NULL, 0},
+    [2] = {18277, offsetof(VkLayerDispatchTable, CmdSetDepthClipNegativeOneToOneEXT), 0, NULL, 0},
+    [3] = {19767, offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructuresIndirectKHR), 0, NULL, 0},
+    [5] = {13979, offsetof(VkLayerDispatchTable, GetPerformanceParameterINTEL), 0, NULL, 0},
+    [7] = {14619, offsetof(VkLayerDispatchTable, CmdBindVertexBuffers2EXT), 0, NULL, 0},
+    [8] = {5783, offsetof(VkLayerDispatchTable, GetDeviceGroupSurfacePresentModesKHR), 0, NULL, 0},
+    [16] = {19133, offsetof(VkLayerDispatchTable, SetLatencyMarkerNV), 0, NULL, 0},
+    [17] = {1970, offsetof(VkLayerDispatchTable, FreeCommandBuffers), VK_API_VERSION_1_0, NULL, 0},
+    [18] = {17942, offsetof(VkLayerDispatchTable, CmdSetTessellationDomainOriginEXT), 0, NULL, 0},
+    [21] = {15332, offsetof(VkLayerDispatchTable, CreateCudaModuleNV), 0, NULL, 0},
+    [22] = {12559, offsetof(VkLayerDispatchTable, CmdSetSampleLocationsEXT), 0, NULL, 0},
+    [25] = {5073, offsetof(VkLayerDispatchTable, GetDeviceImageSubresourceLayout), VK_API_VERSION_1_4, NULL, 0},
+    [26] = {7228, offsetof(VkLayerDispatchTable, CmdSetDeviceMaskKHR), 0, NULL, 0},
+    [30] = {4172, offsetof(VkLayerDispatchTable, DestroyPrivateDataSlot), VK_API_VERSION_1_3, NULL, 0},
+    [31] = {17886, offsetof(VkLayerDispatchTable, CmdSetColorBlendEquationEXT), 0, NULL, 0},
+    [37] = {640, offsetof(VkLayerDispatchTable, InvalidateMappedMemoryRanges), VK_API_VERSION_1_0, NULL, 0},
+    [38] = {15043, offsetof(VkLayerDispatchTable, CmdExecuteGeneratedCommandsNV), 0, NULL, 0},
+    [39] = {19731, offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructuresKHR), 0, NULL, 0},
+    [40] = {17206, offsetof(VkLayerDispatchTable, GetDeviceMicromapCompatibilityEXT), 0, NULL, 0},
+    [41] = {5396, offsetof(VkLayerDispatchTable, CopyImageToMemory), VK_API_VERSION_1_4, NULL, 0},
+    [44] = {4509, offsetof(VkLayerDispatchTable, CmdSetFrontFace), VK_API_VERSION_1_3, NULL, 0},
+    [45] = {17515, offsetof(VkLayerDispatchTable, CmdDecompressMemoryIndirectCountNV), 0, NULL, 0},
+    [46] = {17292, offsetof(VkLayerDispatchTable, CmdDrawClusterIndirectHUAWEI), 0, NULL, 0},
+    [47] = {3573, offsetof(VkLayerDispatchTable, DestroyDescriptorUpdateTemplate), VK_API_VERSION_1_1, NULL, 0},
+    [48] = {16994, offsetof(VkLayerDispatchTable, CopyMicromapEXT), 0, NULL, 0},
+    [52] = {2283, offsetof(VkLayerDispatchTable, CmdBindIndexBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [54] = {9539, offsetof(VkLayerDispatchTable, CmdEncodeVideoKHR), 0, NULL, 0},
+    [55] = {1663, offsetof(VkLayerDispatchTable, DestroyDescriptorPool), VK_API_VERSION_1_0, NULL, 0},
+    [56] = {2259, offsetof(VkLayerDispatchTable, CmdBindDescriptorSets), VK_API_VERSION_1_0, NULL, 0},
+    [57] = {20391, offsetof(VkLayerDispatchTable, CmdTraceRaysIndirectKHR), 0, NULL, 0},
+    [58] = {10278, offsetof(VkLayerDispatchTable, CmdSetLineStippleKHR), 0, NULL, 0},
+    [59] = {14856, offsetof(VkLayerDispatchTable, CopyImageToImageEXT), 0, NULL, 0},
+    [60] = {11649, offsetof(VkLayerDispatchTable, GetSwapchainCounterEXT), 0, NULL, 0},
+    [61] = {9324, offsetof(VkLayerDispatchTable, GetPipelineExecutableStatisticsKHR), 0, NULL, 0},
+    [62] = {600, offsetof(VkLayerDispatchTable, UnmapMemory), VK_API_VERSION_1_0, NULL, 0},
+    [63] = {15585, offsetof(VkLayerDispatchTable, CmdBindDescriptorBuffersEXT), 0, NULL, 0},
+    [64] = {17667, offsetof(VkLayerDispatchTable, CmdSetDepthClampEnableEXT), 0, NULL, 0},
+    [65] = {1819, offsetof(VkLayerDispatchTable, CreateRenderPass), VK_API_VERSION_1_0, NULL, 0},
+    [66] = {3108, offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements2), VK_API_VERSION_1_1, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [67] = {14346, offsetof(VkLayerDispatchTable, ReleaseFullScreenExclusiveModeEXT), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [68] = {12390, offsetof(VkLayerDispatchTable, GetExecutionGraphPipelineNodeIndexAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [69] = {19052, offsetof(VkLayerDispatchTable, GetDynamicRenderingTilePropertiesQCOM), 0, NULL, 0},
+    [70] = {5862, offsetof(VkLayerDispatchTable, AcquireNextImage2KHR), 0, NULL, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [71] = {12431, offsetof(VkLayerDispatchTable, CmdInitializeGraphScratchMemoryAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [74] = {18685, offsetof(VkLayerDispatchTable, GetShaderModuleCreateInfoIdentifierEXT), 0, NULL, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [75] = {12492, offsetof(VkLayerDispatchTable, CmdDispatchGraphIndirectAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [76] = {895, offsetof(VkLayerDispatchTable, CreateFence), VK_API_VERSION_1_0, NULL, 0},
+    [77] = {15866, offsetof(VkLayerDispatchTable, GetAccelerationStructureOpaqueCaptureDescriptorDataEXT), 0, NULL, 0},
+    [78] = {4044, offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureAddress), VK_API_VERSION_1_2, NULL, 0},
+    [79] = {8638, offsetof(VkLayerDispatchTable, BindBufferMemory2KHR), 0, NULL, 0},
+    [81] = {13591, offsetof(VkLayerDispatchTable, CmdSetExclusiveScissorNV), 0, NULL, 0},
+    [82] = {13639, offsetof(VkLayerDispatchTable, GetQueueCheckpointDataNV), 0, NULL, 0},
+    [83] = {2785, offsetof(VkLayerDispatchTable, CmdCopyQueryPoolResults), VK_API_VERSION_1_0, NULL, 0},
+    [84] = {8962, offsetof(VkLayerDispatchTable, CmdSetRenderingInputAttachmentIndicesKHR), 0, NULL, 0},
+    [85] = {16102, offsetof(VkLayerDispatchTable, CmdSetVertexInputEXT), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [87] = {7374, offsetof(VkLayerDispatchTable, GetMemoryWin32HandleKHR), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [88] = {18771, offsetof(VkLayerDispatchTable, CreateOpticalFlowSessionNV), 0, NULL, 0},
+    [92] = {5744, offsetof(VkLayerDispatchTable, GetDeviceGroupPresentCapabilitiesKHR), 0, NULL, 0},
+    [94] = {19697, offsetof(VkLayerDispatchTable, DestroyAccelerationStructureKHR), 0, NULL, 0},
+    [95] = {14810, offsetof(VkLayerDispatchTable, CopyMemoryToImageEXT), 0, NULL, 0},
+    [96] = {10168, offsetof(VkLayerDispatchTable, GetPipelineBinaryDataKHR), 0, NULL, 0},
+    [97] = {19664, offsetof(VkLayerDispatchTable, CreateAccelerationStructureKHR), 0, NULL, 0},
+    [99] = {14789, offsetof(VkLayerDispatchTable, CmdSetStencilOpEXT), 0, NULL, 0},
+    [100] = {11834, offsetof(VkLayerDispatchTable, SetHdrMetadataEXT), 0, NULL, 0},
+    [101] = {2103, offsetof(VkLayerDispatchTable, CmdSetLineWidth), VK_API_VERSION_1_0, NULL, 0},
+    [102] = {11598, offsetof(VkLayerDispatchTable, RegisterDeviceEventEXT), 0, NULL, 0},
+    [104] = {4197, offsetof(VkLayerDispatchTable, SetPrivateData), VK_API_VERSION_1_3, NULL, 0},
+    [107] = {7831, offsetof(VkLayerDispatchTable, CmdBeginRenderPass2KHR), 0, NULL, 0},
+    [108] = {10973, offsetof(VkLayerDispatchTable, CreateCuModuleNVX), 0, NULL, 0},
+    [109] = {2327, offsetof(VkLayerDispatchTable, CmdDraw), VK_API_VERSION_1_0, NULL, 0},
+    [110] = {5680, offsetof(VkLayerDispatchTable, GetSwapchainImagesKHR), 0, NULL, 0},
+    [113] = {1460, offsetof(VkLayerDispatchTable, CreateComputePipelines), VK_API_VERSION_1_0, NULL, 0},
+    [114] = {9617, offsetof(VkLayerDispatchTable, CmdPipelineBarrier2KHR), 0, NULL, 0},
+    [115] = {4897, offsetof(VkLayerDispatchTable, GetDeviceImageMemoryRequirements), VK_API_VERSION_1_3, NULL, 0},
+    [116] = {7190, offsetof(VkLayerDispatchTable, GetDeviceGroupPeerMemoryFeaturesKHR), 0, NULL, 0},
+    [117] = {2479, offsetof(VkLayerDispatchTable, CmdCopyBufferToImage), VK_API_VERSION_1_0, NULL, 0},
+    [118] = {15566, offsetof(VkLayerDispatchTable, GetDescriptorEXT), 0, NULL, 0},
+    [119] = {909, offsetof(VkLayerDispatchTable, DestroyFence), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [120] = {16156, offsetof(VkLayerDispatchTable, GetMemoryZirconHandlePropertiesFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [121] = {17750, offsetof(VkLayerDispatchTable, CmdSetSampleMaskEXT), 0, NULL, 0},
+    [122] = {14833, offsetof(VkLayerDispatchTable, CopyImageToMemoryEXT), 0, NULL, 0},
+    [123] = {18154, offsetof(VkLayerDispatchTable, CmdSetColorBlendAdvancedEXT), 0, NULL, 0},
+    [126] = {8463, offsetof(VkLayerDispatchTable, GetImageMemoryRequirements2KHR), 0, NULL, 0},
+    [127] = {13173, offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupHandlesNV), 0, NULL, 0},
+    [131] = {2070, offsetof(VkLayerDispatchTable, CmdSetViewport), VK_API_VERSION_1_0, NULL, 0},
+    [132] = {18579, offsetof(VkLayerDispatchTable, CmdSetRepresentativeFragmentTestEnableNV), 0, NULL, 0},
+    [134] = {13345, offsetof(VkLayerDispatchTable, CmdWriteBufferMarkerAMD), 0, NULL, 0},
+    [136] = {13445, offsetof(VkLayerDispatchTable, GetCalibratedTimestampsEXT), 0, NULL, 0},
+    [139] = {2811, offsetof(VkLayerDispatchTable, CmdPushConstants), VK_API_VERSION_1_0, NULL, 0},
+    [140] = {16567, offsetof(VkLayerDispatchTable, GetMemoryRemoteAddressNV), 0, NULL, 0},
+    [144] = {6594, offsetof(VkLayerDispatchTable, GetVideoSessionMemoryRequirementsKHR), 0, NULL, 0},
+    [146] = {7614, offsetof(VkLayerDispatchTable, GetSemaphoreFdKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [147] = {7530, offsetof(VkLayerDispatchTable, ImportSemaphoreWin32HandleKHR), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [148] = {5271, offsetof(VkLayerDispatchTable, CmdBindDescriptorSets2), VK_API_VERSION_1_4, NULL, 0},
+    [149] = {955, offsetof(VkLayerDispatchTable, WaitForFences), VK_API_VERSION_1_0, NULL, 0},
+    [152] = {11706, offsetof(VkLayerDispatchTable, GetPastPresentationTimingGOOGLE), 0, NULL, 0},
+    [154] = {1926, offsetof(VkLayerDispatchTable, ResetCommandPool), VK_API_VERSION_1_0, NULL, 0},
+    [157] = {11157, offsetof(VkLayerDispatchTable, CmdDrawIndirectCountAMD), 0, NULL, 0},
+    [158] = {14878, offsetof(VkLayerDispatchTable, TransitionImageLayoutEXT), 0, NULL, 0},
+    [159] = {7900, offsetof(VkLayerDispatchTable, GetSwapchainStatusKHR), 0, NULL, 0},
+    [161] = {9228, offsetof(VkLayerDispatchTable, GetDeferredOperationResultKHR), 0, NULL, 0},
+    [165] = {17858, offsetof(VkLayerDispatchTable, CmdSetColorBlendEnableEXT), 0, NULL, 0},
+    [166] = {18888, offsetof(VkLayerDispatchTable, AntiLagUpdateAMD), 0, NULL, 0},
+    [167] = {8807, offsetof(VkLayerDispatchTable, WaitSemaphoresKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [169] = {11321, offsetof(VkLayerDispatchTable, GetMemoryWin32HandleNV), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [170] = {15823, offsetof(VkLayerDispatchTable, GetSamplerOpaqueCaptureDescriptorDataEXT), 0, NULL, 0},
+    [171] = {1905, offsetof(VkLayerDispatchTable, DestroyCommandPool), VK_API_VERSION_1_0, NULL, 0},
+    [173] = {10195, offsetof(VkLayerDispatchTable, ReleaseCapturedPipelineDataKHR), 0, NULL, 0},
+    [174] = {4302, offsetof(VkLayerDispatchTable, CmdWriteTimestamp2), VK_API_VERSION_1_3, NULL, 0},
+    [175] = {924, offsetof(VkLayerDispatchTable, ResetFences), VK_API_VERSION_1_0, NULL, 0},
+    [176] = {14673, offsetof(VkLayerDispatchTable, CmdSetDepthWriteEnableEXT), 0, NULL, 0},
+    [178] = {2209, offsetof(VkLayerDispatchTable, CmdSetStencilWriteMask), VK_API_VERSION_1_0, NULL, 0},
+    [181] = {8603, offsetof(VkLayerDispatchTable, DestroySamplerYcbcrConversionKHR), 0, NULL, 0},
+    [182] = {334, offsetof(VkLayerDispatchTable, DestroyDevice), VK_API_VERSION_1_0, NULL, 0},
+    [183] = {575, offsetof(VkLayerDispatchTable, FreeMemory), VK_API_VERSION_1_0, NULL, 0},
+    [184] = {20310, offsetof(VkLayerDispatchTable, CreateRayTracingPipelinesKHR), 0, NULL, 0},
+    [185] = {11059, offsetof(VkLayerDispatchTable, CmdCuLaunchKernelNVX), 0, NULL, 0},
+    [187] = {4338, offsetof(VkLayerDispatchTable, CmdCopyBuffer2), VK_API_VERSION_1_3, NULL, 0},
+    [188] = {19352, offsetof(VkLayerDispatchTable, CmdExecuteGeneratedCommandsEXT), 0, NULL, 0},
+    [189] = {10722, offsetof(VkLayerDispatchTable, CmdDebugMarkerBeginEXT), 0, NULL, 0},
+    [191] = {14760, offsetof(VkLayerDispatchTable, CmdSetStencilTestEnableEXT), 0, NULL, 0},
+    [192] = {10692, offsetof(VkLayerDispatchTable, DebugMarkerSetObjectNameEXT), 0, (PFN_vkVoidFunction)DebugMarkerSetObjectNameEXT, offsetof(struct loader_device, layer_extensions.ext_debug_marker_enabled)},
+    [193] = {11674, offsetof(VkLayerDispatchTable, GetRefreshCycleDurationGOOGLE), 0, NULL, 0},
+    [194] = {10993, offsetof(VkLayerDispatchTable, CreateCuFunctionNVX), 0, NULL, 0},
+    [195] = {1366, offsetof(VkLayerDispatchTable, DestroyPipelineCache), VK_API_VERSION_1_0, NULL, 0},
+    [196] = {8744, offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCountKHR), 0, NULL, 0},
+    [197] = {20114, offsetof(VkLayerDispatchTable, GetAccelerationStructureDeviceAddressKHR), 0, NULL, 0},
+    [198] = {17115, offsetof(VkLayerDispatchTable, CmdCopyMicromapToMemoryEXT), 0, NULL, 0},
+    [202] = {7250, offsetof(VkLayerDispatchTable, CmdDispatchBaseKHR), 0, NULL, 0},
+    [203] = {13558, offsetof(VkLayerDispatchTable, CmdSetExclusiveScissorEnableNV), 0, NULL, 0},
+    [205] = {17491, offsetof(VkLayerDispatchTable, CmdDecompressMemoryNV), 0, NULL, 0},
+    [206] = {20157, offsetof(VkLayerDispatchTable, CmdWriteAccelerationStructuresPropertiesKHR), 0, NULL, 0},
+    [212] = {9818, offsetof(VkLayerDispatchTable, CmdTraceRaysIndirect2KHR), 0, NULL, 0},
+    [214] = {18347, offsetof(VkLayerDispatchTable, CmdSetViewportSwizzleNV), 0, NULL, 0},
+    [216] = {6125, offsetof(VkLayerDispatchTable, CreateSharedSwapchainsKHR), 0, NULL, 0},
+    [217] = {13309, offsetof(VkLayerDispatchTable, GetMemoryHostPointerPropertiesEXT), 0, NULL, 0},
+    [218] = {20072, offsetof(VkLayerDispatchTable, CmdCopyMemoryToAccelerationStructureKHR), 0, NULL, 0},
+    [219] = {3860, offsetof(VkLayerDispatchTable, CreateRenderPass2), VK_API_VERSION_1_2, NULL, 0},
+    [220] = {7453, offsetof(VkLayerDispatchTable, GetMemoryFdPropertiesKHR), 0, NULL, 0},
+    [221] = {3477, offsetof(VkLayerDispatchTable, CreateSamplerYcbcrConversion), VK_API_VERSION_1_1, NULL, 0},
+    [222] = {13861, offsetof(VkLayerDispatchTable, AcquirePerformanceConfigurationINTEL), 0, NULL, 0},
+    [223] = {10405, offsetof(VkLayerDispatchTable, CmdPushConstants2KHR), 0, NULL, 0},
+    [225] = {19996, offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureKHR), 0, NULL, 0},
+    [226] = {5006, offsetof(VkLayerDispatchTable, UnmapMemory2), VK_API_VERSION_1_4, NULL, 0},
+    [228] = {13289, offsetof(VkLayerDispatchTable, CompileDeferredNV), 0, NULL, 0},
+    [233] = {2162, offsetof(VkLayerDispatchTable, CmdSetDepthBounds), VK_API_VERSION_1_0, NULL, 0},
+    [235] = {1566, offsetof(VkLayerDispatchTable, DestroySampler), VK_API_VERSION_1_0, NULL, 0},
+    [236] = {13474, offsetof(VkLayerDispatchTable, CmdDrawMeshTasksNV), 0, NULL, 0},
+    [237] = {9427, offsetof(VkLayerDispatchTable, UnmapMemory2KHR), 0, NULL, 0},
+    [238] = {4454, offsetof(VkLayerDispatchTable, CmdBeginRendering), VK_API_VERSION_1_3, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [239] = {16424, offsetof(VkLayerDispatchTable, GetBufferCollectionPropertiesFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [240] = {18512, offsetof(VkLayerDispatchTable, CmdSetCoverageModulationTableNV), 0, NULL, 0},
+    [241] = {17978, offsetof(VkLayerDispatchTable, CmdSetRasterizationStreamEXT), 0, NULL, 0},
+    [243] = {9577, offsetof(VkLayerDispatchTable, CmdResetEvent2KHR), 0, NULL, 0},
+    [244] = {6729, offsetof(VkLayerDispatchTable, DestroyVideoSessionParametersKHR), 0, NULL, 0},
+    [245] = {16511, offsetof(VkLayerDispatchTable, CmdSubpassShadingHUAWEI), 0, NULL, 0},
+    [247] = {5136, offsetof(VkLayerDispatchTable, CmdPushDescriptorSet), VK_API_VERSION_1_4, NULL, 0},
+    [248] = {16885, offsetof(VkLayerDispatchTable, CmdDrawMultiIndexedEXT), 0, NULL, 0},
+    [249] = {3807, offsetof(VkLayerDispatchTable, CmdDrawIndirectCount), VK_API_VERSION_1_2, NULL, 0},
+    [251] = {11432, offsetof(VkLayerDispatchTable, CmdSetViewportWScalingNV), 0, NULL, 0},
+    [255] = {9411, offsetof(VkLayerDispatchTable, MapMemory2KHR), 0, NULL, 0},
+    [257] = {15139, offsetof(VkLayerDispatchTable, DestroyIndirectCommandsLayoutNV), 0, NULL, 0},
+    [258] = {19316, offsetof(VkLayerDispatchTable, CmdPreprocessGeneratedCommandsEXT), 0, NULL, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [263] = {12523, offsetof(VkLayerDispatchTable, CmdDispatchGraphIndirectCountAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [264] = {2087, offsetof(VkLayerDispatchTable, CmdSetScissor), VK_API_VERSION_1_0, NULL, 0},
+    [265] = {1168, offsetof(VkLayerDispatchTable, CreateBufferView), VK_API_VERSION_1_0, NULL, 0},
+    [266] = {2559, offsetof(VkLayerDispatchTable, CmdClearColorImage), VK_API_VERSION_1_0, NULL, 0},
+    [270] = {5376, offsetof(VkLayerDispatchTable, CopyMemoryToImage), VK_API_VERSION_1_4, NULL, 0},
+    [272] = {13760, offsetof(VkLayerDispatchTable, CmdSetPerformanceMarkerINTEL), 0, NULL, 0},
+    [275] = {9559, offsetof(VkLayerDispatchTable, CmdSetEvent2KHR), 0, NULL, 0},
+    [276] = {2678, offsetof(VkLayerDispatchTable, CmdWaitEvents), VK_API_VERSION_1_0, NULL, 0},
+    [277] = {15525, offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutBindingOffsetEXT), 0, NULL, 0},
+    [278] = {4231, offsetof(VkLayerDispatchTable, CmdSetEvent2), VK_API_VERSION_1_3, NULL, 0},
+    [279] = {14727, offsetof(VkLayerDispatchTable, CmdSetDepthBoundsTestEnableEXT), 0, NULL, 0},
+    [280] = {12986, offsetof(VkLayerDispatchTable, BindAccelerationStructureMemoryNV), 0, NULL, 0},
+    [283] = {18405, offsetof(VkLayerDispatchTable, CmdSetCoverageToColorLocationNV), 0, NULL, 0},
+    [284] = {3441, offsetof(VkLayerDispatchTable, TrimCommandPool), VK_API_VERSION_1_1, NULL, 0},
+    [285] = {1037, offsetof(VkLayerDispatchTable, GetEventStatus), VK_API_VERSION_1_0, NULL, 0},
+    [289] = {10148, offsetof(VkLayerDispatchTable, GetPipelineKeyKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    [290] = {12227, offsetof(VkLayerDispatchTable, GetAndroidHardwareBufferPropertiesANDROID), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+    [291] = {10121, offsetof(VkLayerDispatchTable, DestroyPipelineBinaryKHR), 0, NULL, 0},
+    [293] = {9966, offsetof(VkLayerDispatchTable, CmdBindIndexBuffer2KHR), 0, NULL, 0},
+    [294] = {3540, offsetof(VkLayerDispatchTable, CreateDescriptorUpdateTemplate), VK_API_VERSION_1_1, NULL, 0},
+    [296] = {1503, offsetof(VkLayerDispatchTable, CreatePipelineLayout), VK_API_VERSION_1_0, NULL, 0},
+    [297] = {10348, offsetof(VkLayerDispatchTable, GetCalibratedTimestampsKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [299] = {16300, offsetof(VkLayerDispatchTable, SetBufferCollectionImageConstraintsFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [300] = {13726, offsetof(VkLayerDispatchTable, UninitializePerformanceApiINTEL), 0, NULL, 0},
+    [301] = {4435, offsetof(VkLayerDispatchTable, CmdResolveImage2), VK_API_VERSION_1_3, NULL, 0},
+    [302] = {2449, offsetof(VkLayerDispatchTable, CmdCopyImage), VK_API_VERSION_1_0, NULL, 0},
+    [303] = {17352, offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutHostMappingInfoVALVE), 0, NULL, 0},
+    [307] = {19017, offsetof(VkLayerDispatchTable, GetFramebufferTilePropertiesQCOM), 0, NULL, 0},
+    [308] = {17833, offsetof(VkLayerDispatchTable, CmdSetLogicOpEnableEXT), 0, NULL, 0},
+    [309] = {1207, offsetof(VkLayerDispatchTable, CreateImage), VK_API_VERSION_1_0, NULL, 0},
+    [310] = {19454, offsetof(VkLayerDispatchTable, CreateIndirectExecutionSetEXT), 0, NULL, 0},
+    [311] = {20517, offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectEXT), 0, NULL, 0},
+    [312] = {1078, offsetof(VkLayerDispatchTable, CreateQueryPool), VK_API_VERSION_1_0, NULL, 0},
+    [313] = {5043, offsetof(VkLayerDispatchTable, GetRenderingAreaGranularity), VK_API_VERSION_1_4, NULL, 0},
+    [314] = {699, offsetof(VkLayerDispatchTable, BindBufferMemory), VK_API_VERSION_1_0, NULL, 0},
+    [315] = {5231, offsetof(VkLayerDispatchTable, CmdSetRenderingInputAttachmentIndices), VK_API_VERSION_1_4, NULL, 0},
+    [317] = {17269, offsetof(VkLayerDispatchTable, CmdDrawClusterHUAWEI), 0, NULL, 0},
+    [318] = {5021, offsetof(VkLayerDispatchTable, CmdBindIndexBuffer2), VK_API_VERSION_1_4, NULL, 0},
+    [321] = {4973, offsetof(VkLayerDispatchTable, CmdSetLineStipple), VK_API_VERSION_1_4, NULL, 0},
+    [322] = {12049, offsetof(VkLayerDispatchTable, CmdBeginDebugUtilsLabelEXT), 0, NULL, 0},
+    [326] = {19201, offsetof(VkLayerDispatchTable, CmdSetAttachmentFeedbackLoopEnableEXT), 0, NULL, 0},
+    [327] = {2397, offsetof(VkLayerDispatchTable, CmdDispatch), VK_API_VERSION_1_0, NULL, 0},
+    [328] = {11988, offsetof(VkLayerDispatchTable, QueueEndDebugUtilsLabelEXT), 0, NULL, 0},
+    [331] = {13828, offsetof(VkLayerDispatchTable, CmdSetPerformanceOverrideINTEL), 0, NULL, 0},
+    [332] = {8042, offsetof(VkLayerDispatchTable, GetFenceFdKHR), 0, NULL, 0},
+    [336] = {1236, offsetof(VkLayerDispatchTable, GetImageSubresourceLayout), VK_API_VERSION_1_0, NULL, 0},
+    [337] = {14533, offsetof(VkLayerDispatchTable, CmdSetPrimitiveTopologyEXT), 0, NULL, 0},
+    [339] = {7771, offsetof(VkLayerDispatchTable, UpdateDescriptorSetWithTemplateKHR), 0, NULL, 0},
+    [340] = {17144, offsetof(VkLayerDispatchTable, CmdCopyMemoryToMicromapEXT), 0, NULL, 0},
+    [342] = {4579, offsetof(VkLayerDispatchTable, CmdSetScissorWithCount), VK_API_VERSION_1_3, NULL, 0},
+    [343] = {877, offsetof(VkLayerDispatchTable, QueueBindSparse), VK_API_VERSION_1_0, NULL, 0},
+    [346] = {4019, offsetof(VkLayerDispatchTable, GetBufferDeviceAddress), VK_API_VERSION_1_2, NULL, 0},
+    [348] = {14492, offsetof(VkLayerDispatchTable, CmdSetCullModeEXT), 0, NULL, 0},
+    [349] = {2608, offsetof(VkLayerDispatchTable, CmdClearAttachments), VK_API_VERSION_1_0, NULL, 0},
+    [351] = {18622, offsetof(VkLayerDispatchTable, CmdSetCoverageReductionModeNV), 0, NULL, 0},
+    [356] = {10893, offsetof(VkLayerDispatchTable, CmdBeginQueryIndexedEXT), 0, NULL, 0},
+    [357] = {10796, offsetof(VkLayerDispatchTable, CmdBindTransformFeedbackBuffersEXT), 0, NULL, 0},
+    [359] = {10770, offsetof(VkLayerDispatchTable, CmdDebugMarkerInsertEXT), 0, NULL, 0},
+    [361] = {17916, offsetof(VkLayerDispatchTable, CmdSetColorWriteMaskEXT), 0, NULL, 0},
+    [363] = {19154, offsetof(VkLayerDispatchTable, GetLatencyTimingsNV), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [365] = {7998, offsetof(VkLayerDispatchTable, GetFenceWin32HandleKHR), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [366] = {3459, offsetof(VkLayerDispatchTable, GetDeviceQueue2), VK_API_VERSION_1_1, NULL, 0},
+    [368] = {9287, offsetof(VkLayerDispatchTable, GetPipelineExecutablePropertiesKHR), 0, NULL, 0},
+    [369] = {18546, offsetof(VkLayerDispatchTable, CmdSetShadingRateImageEnableNV), 0, NULL, 0},
+    [371] = {2648, offsetof(VkLayerDispatchTable, CmdSetEvent), VK_API_VERSION_1_0, NULL, 0},
+    [374] = {19272, offsetof(VkLayerDispatchTable, GetGeneratedCommandsMemoryRequirementsEXT), 0, NULL, 0},
+    [375] = {2031, offsetof(VkLayerDispatchTable, ResetCommandBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [376] = {2354, offsetof(VkLayerDispatchTable, CmdDrawIndirect), VK_API_VERSION_1_0, NULL, 0},
+    [381] = {18970, offsetof(VkLayerDispatchTable, CmdBindShadersEXT), 0, NULL, 0},
+    [382] = {18050, offsetof(VkLayerDispatchTable, CmdSetExtraPrimitiveOverestimationSizeEXT), 0, NULL, 0},
+    [383] = {4774, offsetof(VkLayerDispatchTable, CmdSetRasterizerDiscardEnable), VK_API_VERSION_1_3, NULL, 0},
+    [384] = {2234, offsetof(VkLayerDispatchTable, CmdSetStencilReference), VK_API_VERSION_1_0, NULL, 0},
+    [385] = {4932, offsetof(VkLayerDispatchTable, GetDeviceImageSparseMemoryRequirements), VK_API_VERSION_1_3, NULL, 0},
+    [389] = {20417, offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupStackSizeKHR), 0, NULL, 0},
+    [390] = {17094, offsetof(VkLayerDispatchTable, CmdCopyMicromapEXT), 0, NULL, 0},
+    [391] = {766, offsetof(VkLayerDispatchTable, GetImageMemoryRequirements), VK_API_VERSION_1_0, NULL, 0},
+    [392] = {9684, offsetof(VkLayerDispatchTable, CmdCopyBuffer2KHR), 0, NULL, 0},
+    [394] = {4148, offsetof(VkLayerDispatchTable, CreatePrivateDataSlot), VK_API_VERSION_1_3, NULL, 0},
+    [395] = {9642, offsetof(VkLayerDispatchTable, CmdWriteTimestamp2KHR), 0, NULL, 0},
+    [396] = {6695, offsetof(VkLayerDispatchTable, UpdateVideoSessionParametersKHR), 0, NULL, 0},
+    [399] = {15008, offsetof(VkLayerDispatchTable, CmdPreprocessGeneratedCommandsNV), 0, NULL, 0},
+    [400] = {18121, offsetof(VkLayerDispatchTable, CmdSetSampleLocationsEnableEXT), 0, NULL, 0},
+    [404] = {2662, offsetof(VkLayerDispatchTable, CmdResetEvent), VK_API_VERSION_1_0, NULL, 0},
+    [405] = {8496, offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements2KHR), 0, NULL, 0},
+    [409] = {6789, offsetof(VkLayerDispatchTable, CmdEndVideoCodingKHR), 0, NULL, 0},
+    [412] = {2433, offsetof(VkLayerDispatchTable, CmdCopyBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [414] = {525, offsetof(VkLayerDispatchTable, QueueWaitIdle), VK_API_VERSION_1_0, NULL, 0},
+    [416] = {16839, offsetof(VkLayerDispatchTable, CmdSetColorWriteEnableEXT), 0, NULL, 0},
+    [419] = {11082, offsetof(VkLayerDispatchTable, GetImageViewHandleNVX), 0, NULL, 0},
+    [420] = {4474, offsetof(VkLayerDispatchTable, CmdEndRendering), VK_API_VERSION_1_3, NULL, 0},
+    [421] = {2337, offsetof(VkLayerDispatchTable, CmdDrawIndexed), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [424] = {12347, offsetof(VkLayerDispatchTable, GetExecutionGraphPipelineScratchSizeAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [426] = {795, offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements), VK_API_VERSION_1_0, NULL, 0},
+    [427] = {4076, offsetof(VkLayerDispatchTable, GetDeviceMemoryOpaqueCaptureAddress), VK_API_VERSION_1_2, NULL, 0},
+    [428] = {16974, offsetof(VkLayerDispatchTable, BuildMicromapsEXT), 0, NULL, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [429] = {12469, offsetof(VkLayerDispatchTable, CmdDispatchGraphAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+    [430] = {14562, offsetof(VkLayerDispatchTable, CmdSetViewportWithCountEXT), 0, NULL, 0},
+    [431] = {9025, offsetof(VkLayerDispatchTable, GetBufferDeviceAddressKHR), 0, NULL, 0},
+    [433] = {5296, offsetof(VkLayerDispatchTable, CmdPushConstants2), VK_API_VERSION_1_4, NULL, 0},
+    [435] = {15292, offsetof(VkLayerDispatchTable, SetPrivateDataEXT), 0, NULL, 0},
+    [436] = {6569, offsetof(VkLayerDispatchTable, DestroyVideoSessionKHR), 0, NULL, 0},
+    [437] = {13524, offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectCountNV), 0, NULL, 0},
+    [438] = {7698, offsetof(VkLayerDispatchTable, CreateDescriptorUpdateTemplateKHR), 0, NULL, 0},
+    [439] = {1885, offsetof(VkLayerDispatchTable, CreateCommandPool), VK_API_VERSION_1_0, NULL, 0},
+    [440] = {4553, offsetof(VkLayerDispatchTable, CmdSetViewportWithCount), VK_API_VERSION_1_3, NULL, 0},
+    [444] = {18439, offsetof(VkLayerDispatchTable, CmdSetCoverageModulationModeNV), 0, NULL, 0},
+    [445] = {3830, offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCount), VK_API_VERSION_1_2, NULL, 0},
+    [446] = {671, offsetof(VkLayerDispatchTable, GetDeviceMemoryCommitment), VK_API_VERSION_1_0, NULL, 0},
+    [447] = {12630, offsetof(VkLayerDispatchTable, GetImageDrmFormatModifierPropertiesEXT), 0, NULL, 0},
+    [450] = {12846, offsetof(VkLayerDispatchTable, CmdSetCoarseSampleOrderNV), 0, NULL, 0},
+    [452] = {15615, offsetof(VkLayerDispatchTable, CmdSetDescriptorBufferOffsetsEXT), 0, NULL, 0},
+    [454] = {5435, offsetof(VkLayerDispatchTable, TransitionImageLayout), VK_API_VERSION_1_4, NULL, 0},
+    [455] = {7436, offsetof(VkLayerDispatchTable, GetMemoryFdKHR), 0, NULL, 0},
+    [456] = {2525, offsetof(VkLayerDispatchTable, CmdUpdateBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [458] = {16594, offsetof(VkLayerDispatchTable, GetPipelinePropertiesEXT), 0, NULL, 0},
+    [459] = {18472, offsetof(VkLayerDispatchTable, CmdSetCoverageModulationTableEnableNV), 0, NULL, 0},
+    [461] = {4993, offsetof(VkLayerDispatchTable, MapMemory2), VK_API_VERSION_1_4, NULL, 0},
+    [462] = {14646, offsetof(VkLayerDispatchTable, CmdSetDepthTestEnableEXT), 0, NULL, 0},
+    [464] = {4214, offsetof(VkLayerDispatchTable, GetPrivateData), VK_API_VERSION_1_3, NULL, 0},
+    [465] = {14937, offsetof(VkLayerDispatchTable, ReleaseSwapchainImagesEXT), 0, NULL, 0},
+    [466] = {19385, offsetof(VkLayerDispatchTable, CreateIndirectCommandsLayoutEXT), 0, NULL, 0},
+    [467] = {4492, offsetof(VkLayerDispatchTable, CmdSetCullMode), VK_API_VERSION_1_3, NULL, 0},
+    [468] = {1687, offsetof(VkLayerDispatchTable, ResetDescriptorPool), VK_API_VERSION_1_0, NULL, 0},
+    [472] = {1583, offsetof(VkLayerDispatchTable, CreateDescriptorSetLayout), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [474] = {16197, offsetof(VkLayerDispatchTable, ImportSemaphoreZirconHandleFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [475] = {11623, offsetof(VkLayerDispatchTable, RegisterDisplayEventEXT), 0, NULL, 0},
+    [476] = {1412, offsetof(VkLayerDispatchTable, MergePipelineCaches), VK_API_VERSION_1_0, NULL, 0},
+    [479] = {1054, offsetof(VkLayerDispatchTable, SetEvent), VK_API_VERSION_1_0, NULL, 0},
+    [483] = {20030, offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureToMemoryKHR), 0, NULL, 0},
+    [484] = {2955, offsetof(VkLayerDispatchTable, BindImageMemory2), VK_API_VERSION_1_1, NULL, 0},
+    [485] = {16930, offsetof(VkLayerDispatchTable, DestroyMicromapEXT), 0, NULL, 0},
+    [486] = {3139, offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements2), VK_API_VERSION_1_1, NULL, 0},
+    [489] = {494, offsetof(VkLayerDispatchTable, GetDeviceQueue), VK_API_VERSION_1_0, NULL, 0},
+    [491] = {14087, offsetof(VkLayerDispatchTable, GetBufferDeviceAddressEXT), 0, NULL, 0},
+    [492] = {8204, offsetof(VkLayerDispatchTable, ReleaseProfilingLockKHR), 0, NULL, 0},
+    [493] = {2974, offsetof(VkLayerDispatchTable, GetDeviceGroupPeerMemoryFeatures), VK_API_VERSION_1_1, NULL, 0},
+    [495] = {989, offsetof(VkLayerDispatchTable, DestroySemaphore), VK_API_VERSION_1_0, NULL, 0},
+    [497] = {12698, offsetof(VkLayerDispatchTable, DestroyValidationCacheEXT), 0, NULL, 0},
+    [500] = {17458, offsetof(VkLayerDispatchTable, CmdCopyMemoryToImageIndirectNV), 0, NULL, 0},
+    [503] = {8777, offsetof(VkLayerDispatchTable, GetSemaphoreCounterValueKHR), 0, NULL, 0},
+    [506] = {2139, offsetof(VkLayerDispatchTable, CmdSetBlendConstants), VK_API_VERSION_1_0, NULL, 0},
+    [509] = {2851, offsetof(VkLayerDispatchTable, CmdNextSubpass), VK_API_VERSION_1_0, NULL, 0},
+    [511] = {9796, offsetof(VkLayerDispatchTable, CmdResolveImage2KHR), 0, NULL, 0},
+    [512] = {18926, offsetof(VkLayerDispatchTable, DestroyShaderEXT), 0, NULL, 0},
+    [513] = {558, offsetof(VkLayerDispatchTable, AllocateMemory), VK_API_VERSION_1_0, NULL, 0},
+    [514] = {4730, offsetof(VkLayerDispatchTable, CmdSetStencilTestEnable), VK_API_VERSION_1_3, NULL, 0},
+    [515] = {1187, offsetof(VkLayerDispatchTable, DestroyBufferView), VK_API_VERSION_1_0, NULL, 0},
+    [516] = {15264, offsetof(VkLayerDispatchTable, DestroyPrivateDataSlotEXT), 0, NULL, 0},
+    [518] = {13939, offsetof(VkLayerDispatchTable, QueueSetPerformanceConfigurationINTEL), 0, NULL, 0},
+    [520] = {1755, offsetof(VkLayerDispatchTable, UpdateDescriptorSets), VK_API_VERSION_1_0, NULL, 0},
+    [522] = {6661, offsetof(VkLayerDispatchTable, CreateVideoSessionParametersKHR), 0, NULL, 0},
+    [523] = {3902, offsetof(VkLayerDispatchTable, CmdNextSubpass2), VK_API_VERSION_1_2, NULL, 0},
+    [526] = {13495, offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectNV), 0, NULL, 0},
+    [527] = {13666, offsetof(VkLayerDispatchTable, GetQueueCheckpointData2NV), 0, NULL, 0},
+    [531] = {1322, offsetof(VkLayerDispatchTable, DestroyShaderModule), VK_API_VERSION_1_0, NULL, 0},
+    [532] = {511, offsetof(VkLayerDispatchTable, QueueSubmit), VK_API_VERSION_1_0, NULL, 0},
+    [535] = {19875, offsetof(VkLayerDispatchTable, CopyAccelerationStructureToMemoryKHR), 0, NULL, 0},
+    [537] = {2411, offsetof(VkLayerDispatchTable, CmdDispatchIndirect), VK_API_VERSION_1_0, NULL, 0},
+    [538] = {5316, offsetof(VkLayerDispatchTable, CmdPushDescriptorSet2), VK_API_VERSION_1_4, NULL, 0},
+    [539] = {736, offsetof(VkLayerDispatchTable, GetBufferMemoryRequirements), VK_API_VERSION_1_0, NULL, 0},
+    [540] = {2630, offsetof(VkLayerDispatchTable, CmdResolveImage), VK_API_VERSION_1_0, NULL, 0},
+    [541] = {20495, offsetof(VkLayerDispatchTable, CmdDrawMeshTasksEXT), 0, NULL, 0},
+    [543] = {10663, offsetof(VkLayerDispatchTable, DebugMarkerSetObjectTagEXT), 0, (PFN_vkVoidFunction)DebugMarkerSetObjectTagEXT, offsetof(struct loader_device, layer_extensions.ext_debug_marker_enabled)},
+    [547] = {17012, offsetof(VkLayerDispatchTable, CopyMicromapToMemoryEXT), 0, NULL, 0},
+    [548] = {10919, offsetof(VkLayerDispatchTable, CmdEndQueryIndexedEXT), 0, NULL, 0},
+    [549] = {1389, offsetof(VkLayerDispatchTable, GetPipelineCacheData), VK_API_VERSION_1_0, NULL, 0},
+    [550] = {16732, offsetof(VkLayerDispatchTable, CmdSetPrimitiveRestartEnableEXT), 0, NULL, 0},
+    [552] = {19116, offsetof(VkLayerDispatchTable, LatencySleepNV), 0, NULL, 0},
+    [553] = {12017, offsetof(VkLayerDispatchTable, QueueInsertDebugUtilsLabelEXT), 0, NULL, 0},
+    [558] = {17064, offsetof(VkLayerDispatchTable, WriteMicromapsPropertiesEXT), 0, NULL, 0},
+    [559] = {1008, offsetof(VkLayerDispatchTable, CreateEvent), VK_API_VERSION_1_0, NULL, 0},
+    [562] = {9260, offsetof(VkLayerDispatchTable, DeferredOperationJoinKHR), 0, NULL, 0},
+    [564] = {17173, offsetof(VkLayerDispatchTable, CmdWriteMicromapsPropertiesEXT), 0, NULL, 0},
+    [567] = {5637, offsetof(VkLayerDispatchTable, CreateSwapchainKHR), 0, NULL, 0},
+    [568] = {14472, offsetof(VkLayerDispatchTable, ResetQueryPoolEXT), 0, NULL, 0},
+    [569] = {18373, offsetof(VkLayerDispatchTable, CmdSetCoverageToColorEnableNV), 0, NULL, 0},
+    [570] = {11015, offsetof(VkLayerDispatchTable, DestroyCuModuleNVX), 0, NULL, 0},
+    [571] = {19914, offsetof(VkLayerDispatchTable, CopyMemoryToAccelerationStructureKHR), 0, NULL, 0},
+    [572] = {3028, offsetof(VkLayerDispatchTable, CmdDispatchBase), VK_API_VERSION_1_1, NULL, 0},
+    [573] = {1640, offsetof(VkLayerDispatchTable, CreateDescriptorPool), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [575] = {14310, offsetof(VkLayerDispatchTable, AcquireFullScreenExclusiveModeEXT), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [578] = {15778, offsetof(VkLayerDispatchTable, GetImageViewOpaqueCaptureDescriptorDataEXT), 0, NULL, 0},
+    [579] = {10747, offsetof(VkLayerDispatchTable, CmdDebugMarkerEndEXT), 0, NULL, 0},
+    [580] = {9991, offsetof(VkLayerDispatchTable, GetRenderingAreaGranularityKHR), 0, NULL, 0},
+    [585] = {15075, offsetof(VkLayerDispatchTable, CmdBindPipelineShaderGroupNV), 0, NULL, 0},
+    [587] = {1485, offsetof(VkLayerDispatchTable, DestroyPipeline), VK_API_VERSION_1_0, NULL, 0},
+    [588] = {2765, offsetof(VkLayerDispatchTable, CmdWriteTimestamp), VK_API_VERSION_1_0, NULL, 0},
+    [589] = {18907, offsetof(VkLayerDispatchTable, CreateShadersEXT), 0, NULL, 0},
+    [591] = {4677, offsetof(VkLayerDispatchTable, CmdSetDepthCompareOp), VK_API_VERSION_1_3, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [593] = {16391, offsetof(VkLayerDispatchTable, DestroyBufferCollectionFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [594] = {6839, offsetof(VkLayerDispatchTable, CmdDecodeVideoKHR), 0, NULL, 0},
+    [597] = {14010, offsetof(VkLayerDispatchTable, SetLocalDimmingAMD), 0, NULL, 0},
+    [598] = {19419, offsetof(VkLayerDispatchTable, DestroyIndirectCommandsLayoutEXT), 0, NULL, 0},
+    [599] = {14449, offsetof(VkLayerDispatchTable, CmdSetLineStippleEXT), 0, NULL, 0},
+    [606] = {4756, offsetof(VkLayerDispatchTable, CmdSetStencilOp), VK_API_VERSION_1_3, NULL, 0},
+    [608] = {9884, offsetof(VkLayerDispatchTable, GetDeviceImageMemoryRequirementsKHR), 0, NULL, 0},
+    [609] = {3957, offsetof(VkLayerDispatchTable, GetSemaphoreCounterValue), VK_API_VERSION_1_2, NULL, 0},
+    [610] = {18094, offsetof(VkLayerDispatchTable, CmdSetDepthClipEnableEXT), 0, NULL, 0},
+    [611] = {6545, offsetof(VkLayerDispatchTable, CreateVideoSessionKHR), 0, NULL, 0},
+    [613] = {2935, offsetof(VkLayerDispatchTable, BindBufferMemory2), VK_API_VERSION_1_1, NULL, 0},
+    [614] = {13209, offsetof(VkLayerDispatchTable, GetAccelerationStructureHandleNV), 0, NULL, 0},
+    [621] = {16537, offsetof(VkLayerDispatchTable, CmdBindInvocationMaskHUAWEI), 0, NULL, 0},
+    [624] = {12809, offsetof(VkLayerDispatchTable, CmdSetViewportShadingRatePaletteNV), 0, NULL, 0},
+    [625] = {15376, offsetof(VkLayerDispatchTable, CreateCudaFunctionNV), 0, NULL, 0},
+    [626] = {13244, offsetof(VkLayerDispatchTable, CmdWriteAccelerationStructuresPropertiesNV), 0, NULL, 0},
+    [629] = {9597, offsetof(VkLayerDispatchTable, CmdWaitEvents2KHR), 0, NULL, 0},
+    [630] = {11183, offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirectCountAMD), 0, NULL, 0},
+    [632] = {15106, offsetof(VkLayerDispatchTable, CreateIndirectCommandsLayoutNV), 0, NULL, 0},
+    [633] = {13056, offsetof(VkLayerDispatchTable, CmdCopyAccelerationStructureNV), 0, NULL, 0},
+    [634] = {16951, offsetof(VkLayerDispatchTable, CmdBuildMicromapsEXT), 0, NULL, 0},
+    [635] = {20292, offsetof(VkLayerDispatchTable, CmdTraceRaysKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [638] = {16345, offsetof(VkLayerDispatchTable, SetBufferCollectionBufferConstraintsFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [639] = {9750, offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer2KHR), 0, NULL, 0},
+    [640] = {9723, offsetof(VkLayerDispatchTable, CmdCopyBufferToImage2KHR), 0, NULL, 0},
+    [642] = {299, offsetof(VkLayerDispatchTable, GetDeviceProcAddr), VK_API_VERSION_1_0, NULL, 0},
+    [644] = {971, offsetof(VkLayerDispatchTable, CreateSemaphore), VK_API_VERSION_1_0, NULL, 0},
+    [645] = {18184, offsetof(VkLayerDispatchTable, CmdSetProvokingVertexModeEXT), 0, NULL, 0},
+    [646] = {5194, offsetof(VkLayerDispatchTable, CmdSetRenderingAttachmentLocations), VK_API_VERSION_1_4, NULL, 0},
+    [647] = {8827, offsetof(VkLayerDispatchTable, SignalSemaphoreKHR), 0, NULL, 0},
+    [650] = {10864, offsetof(VkLayerDispatchTable, CmdEndTransformFeedbackEXT), 0, NULL, 0},
+    [654] = {10024, offsetof(VkLayerDispatchTable, GetDeviceImageSubresourceLayoutKHR), 0, NULL, 0},
+    [655] = {17552, offsetof(VkLayerDispatchTable, GetPipelineIndirectMemoryRequirementsNV), 0, NULL, 0},
+    [657] = {16686, offsetof(VkLayerDispatchTable, CmdSetDepthBiasEnableEXT), 0, NULL, 0},
+    [658] = {2543, offsetof(VkLayerDispatchTable, CmdFillBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [660] = {13900, offsetof(VkLayerDispatchTable, ReleasePerformanceConfigurationINTEL), 0, NULL, 0},
+    [661] = {11400, offsetof(VkLayerDispatchTable, CmdEndConditionalRenderingEXT), 0, NULL, 0},
+    [662] = {7591, offsetof(VkLayerDispatchTable, ImportSemaphoreFdKHR), 0, NULL, 0},
+    [666] = {1344, offsetof(VkLayerDispatchTable, CreatePipelineCache), VK_API_VERSION_1_0, NULL, 0},
+    [671] = {16651, offsetof(VkLayerDispatchTable, CmdSetRasterizerDiscardEnableEXT), 0, NULL, 0},
+    [672] = {19519, offsetof(VkLayerDispatchTable, UpdateIndirectExecutionSetPipelineEXT), 0, NULL, 0},
+    [673] = {10494, offsetof(VkLayerDispatchTable, CmdSetDescriptorBufferOffsets2EXT), 0, NULL, 0},
+    [674] = {3078, offsetof(VkLayerDispatchTable, GetImageMemoryRequirements2), VK_API_VERSION_1_1, NULL, 0},
+    [675] = {17630, offsetof(VkLayerDispatchTable, GetPipelineIndirectDeviceAddressNV), 0, NULL, 0},
+    [677] = {7808, offsetof(VkLayerDispatchTable, CreateRenderPass2KHR), 0, NULL, 0},
+    [679] = {1264, offsetof(VkLayerDispatchTable, CreateImageView), VK_API_VERSION_1_0, NULL, 0},
+    [680] = {2731, offsetof(VkLayerDispatchTable, CmdEndQuery), VK_API_VERSION_1_0, NULL, 0},
+    [681] = {4527, offsetof(VkLayerDispatchTable, CmdSetPrimitiveTopology), VK_API_VERSION_1_3, NULL, 0},
+    [683] = {2830, offsetof(VkLayerDispatchTable, CmdBeginRenderPass), VK_API_VERSION_1_0, NULL, 0},
+    [684] = {11106, offsetof(VkLayerDispatchTable, GetImageViewHandle64NVX), 0, NULL, 0},
+    [686] = {15957, offsetof(VkLayerDispatchTable, GetDeviceFaultInfoEXT), 0, NULL, 0},
+    [687] = {10530, offsetof(VkLayerDispatchTable, CmdBindDescriptorBufferEmbeddedSamplers2EXT), 0, NULL, 0},
+    [688] = {13371, offsetof(VkLayerDispatchTable, CmdWriteBufferMarker2AMD), 0, NULL, 0},
+    [689] = {13694, offsetof(VkLayerDispatchTable, InitializePerformanceApiINTEL), 0, NULL, 0},
+    [692] = {11216, offsetof(VkLayerDispatchTable, GetShaderInfoAMD), 0, NULL, 0},
+    [697] = {1065, offsetof(VkLayerDispatchTable, ResetEvent), VK_API_VERSION_1_0, NULL, 0},
+    [698] = {1096, offsetof(VkLayerDispatchTable, DestroyQueryPool), VK_API_VERSION_1_0, NULL, 0},
+    [699] = {17718, offsetof(VkLayerDispatchTable, CmdSetRasterizationSamplesEXT), 0, NULL, 0},
+    [700] = {4280, offsetof(VkLayerDispatchTable, CmdPipelineBarrier2), VK_API_VERSION_1_3, NULL, 0},
+    [701] = {18800, offsetof(VkLayerDispatchTable, DestroyOpticalFlowSessionNV), 0, NULL, 0},
+    [702] = {6882, offsetof(VkLayerDispatchTable, CmdEndRenderingKHR), 0, NULL, 0},
+    [705] = {8922, offsetof(VkLayerDispatchTable, CmdSetRenderingAttachmentLocationsKHR), 0, NULL, 0},
+    [706] = {4263, offsetof(VkLayerDispatchTable, CmdWaitEvents2), VK_API_VERSION_1_3, NULL, 0},
+    [710] = {16910, offsetof(VkLayerDispatchTable, CreateMicromapEXT), 0, NULL, 0},
+    [711] = {1734, offsetof(VkLayerDispatchTable, FreeDescriptorSets), VK_API_VERSION_1_0, NULL, 0},
+    [714] = {1137, offsetof(VkLayerDispatchTable, CreateBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [715] = {2121, offsetof(VkLayerDispatchTable, CmdSetDepthBias), VK_API_VERSION_1_0, NULL, 0},
+    [716] = {14591, offsetof(VkLayerDispatchTable, CmdSetScissorWithCountEXT), 0, NULL, 0},
+    [717] = {3508, offsetof(VkLayerDispatchTable, DestroySamplerYcbcrConversion), VK_API_VERSION_1_1, NULL, 0},
+    [718] = {19486, offsetof(VkLayerDispatchTable, DestroyIndirectExecutionSetEXT), 0, NULL, 0},
+    [720] = {3920, offsetof(VkLayerDispatchTable, CmdEndRenderPass2), VK_API_VERSION_1_2, NULL, 0},
+    [721] = {7271, offsetof(VkLayerDispatchTable, TrimCommandPoolKHR), 0, NULL, 0},
+    [723] = {15312, offsetof(VkLayerDispatchTable, GetPrivateDataEXT), 0, NULL, 0},
+    [725] = {16621, offsetof(VkLayerDispatchTable, CmdSetPatchControlPointsEXT), 0, NULL, 0},
+    [730] = {17242, offsetof(VkLayerDispatchTable, GetMicromapBuildSizesEXT), 0, NULL, 0},
+    [733] = {3940, offsetof(VkLayerDispatchTable, ResetQueryPool), VK_API_VERSION_1_2, NULL, 0},
+    [738] = {13791, offsetof(VkLayerDispatchTable, CmdSetPerformanceStreamMarkerINTEL), 0, NULL, 0},
+    [739] = {10943, offsetof(VkLayerDispatchTable, CmdDrawIndirectByteCountEXT), 0, NULL, 0},
+    [740] = {1709, offsetof(VkLayerDispatchTable, AllocateDescriptorSets), VK_API_VERSION_1_0, NULL, 0},
+    [742] = {11132, offsetof(VkLayerDispatchTable, GetImageViewAddressNVX), 0, NULL, 0},
+    [744] = {1991, offsetof(VkLayerDispatchTable, BeginCommandBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [745] = {1858, offsetof(VkLayerDispatchTable, GetRenderAreaGranularity), VK_API_VERSION_1_0, NULL, 0},
+    [748] = {9129, offsetof(VkLayerDispatchTable, CreateDeferredOperationKHR), 0, NULL, 0},
+    [752] = {17432, offsetof(VkLayerDispatchTable, CmdCopyMemoryIndirectNV), 0, NULL, 0},
+    [753] = {5416, offsetof(VkLayerDispatchTable, CopyImageToImage), VK_API_VERSION_1_4, NULL, 0},
+    [754] = {1115, offsetof(VkLayerDispatchTable, GetQueryPoolResults), VK_API_VERSION_1_0, NULL, 0},
+    [755] = {20341, offsetof(VkLayerDispatchTable, GetRayTracingCaptureReplayShaderGroupHandlesKHR), 0, NULL, 0},
+    [756] = {2868, offsetof(VkLayerDispatchTable, CmdEndRenderPass), VK_API_VERSION_1_0, NULL, 0},
+    [757] = {15493, offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSizeEXT), 0, NULL, 0},
+    [758] = {19844, offsetof(VkLayerDispatchTable, CopyAccelerationStructureKHR), 0, NULL, 0},
+    [759] = {5159, offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate), VK_API_VERSION_1_4, NULL, 0},
+    [760] = {3984, offsetof(VkLayerDispatchTable, WaitSemaphores), VK_API_VERSION_1_2, NULL, 0},
+    [762] = {6859, offsetof(VkLayerDispatchTable, CmdBeginRenderingKHR), 0, NULL, 0},
+    [763] = {9666, offsetof(VkLayerDispatchTable, QueueSubmit2KHR), 0, NULL, 0},
+    [764] = {9704, offsetof(VkLayerDispatchTable, CmdCopyImage2KHR), 0, NULL, 0},
+    [765] = {6764, offsetof(VkLayerDispatchTable, CmdBeginVideoCodingKHR), 0, NULL, 0},
+    [772] = {11366, offsetof(VkLayerDispatchTable, CmdBeginConditionalRenderingEXT), 0, NULL, 0},
+    [776] = {1945, offsetof(VkLayerDispatchTable, AllocateCommandBuffers), VK_API_VERSION_1_0, NULL, 0},
+    [777] = {2372, offsetof(VkLayerDispatchTable, CmdDrawIndexedIndirect), VK_API_VERSION_1_0, NULL, 0},
+    [778] = {9845, offsetof(VkLayerDispatchTable, GetDeviceBufferMemoryRequirementsKHR), 0, NULL, 0},
+    [779] = {4323, offsetof(VkLayerDispatchTable, QueueSubmit2), VK_API_VERSION_1_3, NULL, 0},
+    [780] = {17772, offsetof(VkLayerDispatchTable, CmdSetAlphaToCoverageEnableEXT), 0, NULL, 0},
+    [782] = {11573, offsetof(VkLayerDispatchTable, DisplayPowerControlEXT), 0, NULL, 0},
+    [783] = {9501, offsetof(VkLayerDispatchTable, GetEncodedVideoSessionParametersKHR), 0, NULL, 0},
+    [784] = {1282, offsetof(VkLayerDispatchTable, DestroyImageView), VK_API_VERSION_1_0, NULL, 0},
+    [785] = {3009, offsetof(VkLayerDispatchTable, CmdSetDeviceMask), VK_API_VERSION_1_1, NULL, 0},
+    [789] = {10061, offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2KHR), 0, NULL, 0},
+    [790] = {4861, offsetof(VkLayerDispatchTable, GetDeviceBufferMemoryRequirements), VK_API_VERSION_1_3, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [793] = {16234, offsetof(VkLayerDispatchTable, GetSemaphoreZirconHandleFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [795] = {13022, offsetof(VkLayerDispatchTable, CmdBuildAccelerationStructureNV), 0, NULL, 0},
+    [796] = {18009, offsetof(VkLayerDispatchTable, CmdSetConservativeRasterizationModeEXT), 0, NULL, 0},
+    [798] = {17397, offsetof(VkLayerDispatchTable, GetDescriptorSetHostMappingVALVE), 0, NULL, 0},
+#if defined(VK_ENABLE_BETA_EXTENSIONS)
+    [799] = {12311, offsetof(VkLayerDispatchTable, CreateExecutionGraphPipelinesAMDX), 0, NULL, 0},
+#endif // VK_ENABLE_BETA_EXTENSIONS
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [800] = {7970, offsetof(VkLayerDispatchTable, ImportFenceWin32HandleKHR), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [801] = {7734, offsetof(VkLayerDispatchTable, DestroyDescriptorUpdateTemplateKHR), 0, NULL, 0},
+    [803] = {718, offsetof(VkLayerDispatchTable, BindImageMemory), VK_API_VERSION_1_0, NULL, 0},
+    [807] = {5340, offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate2), VK_API_VERSION_1_4, NULL, 0},
+    [809] = {614, offsetof(VkLayerDispatchTable, FlushMappedMemoryRanges), VK_API_VERSION_1_0, NULL, 0},
+    [811] = {18990, offsetof(VkLayerDispatchTable, CmdSetDepthClampRangeEXT), 0, NULL, 0},
+    [812] = {17038, offsetof(VkLayerDispatchTable, CopyMemoryToMicromapEXT), 0, NULL, 0},
+    [813] = {17695, offsetof(VkLayerDispatchTable, CmdSetPolygonModeEXT), 0, NULL, 0},
+    [818] = {20547, offsetof(VkLayerDispatchTable, CmdDrawMeshTasksIndirectCountEXT), 0, NULL, 0},
+    [819] = {10377, offsetof(VkLayerDispatchTable, CmdBindDescriptorSets2KHR), 0, NULL, 0},
+    [820] = {11957, offsetof(VkLayerDispatchTable, QueueBeginDebugUtilsLabelEXT), 0, NULL, 0},
+    [823] = {6633, offsetof(VkLayerDispatchTable, BindVideoSessionMemoryKHR), 0, NULL, 0},
+    [824] = {14701, offsetof(VkLayerDispatchTable, CmdSetDepthCompareOpEXT), 0, NULL, 0},
+    [826] = {2580, offsetof(VkLayerDispatchTable, CmdClearDepthStencilImage), VK_API_VERSION_1_0, NULL, 0},
+    [827] = {8023, offsetof(VkLayerDispatchTable, ImportFenceFdKHR), 0, NULL, 0},
+    [828] = {1152, offsetof(VkLayerDispatchTable, DestroyBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [829] = {9005, offsetof(VkLayerDispatchTable, WaitForPresentKHR), 0, NULL, 0},
+    [830] = {12671, offsetof(VkLayerDispatchTable, CreateValidationCacheEXT), 0, NULL, 0},
+    [831] = {3880, offsetof(VkLayerDispatchTable, CmdBeginRenderPass2), VK_API_VERSION_1_2, NULL, 0},
+    [833] = {2304, offsetof(VkLayerDispatchTable, CmdBindVertexBuffers), VK_API_VERSION_1_0, NULL, 0},
+    [835] = {1778, offsetof(VkLayerDispatchTable, CreateFramebuffer), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [836] = {7400, offsetof(VkLayerDispatchTable, GetMemoryWin32HandlePropertiesKHR), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [840] = {1022, offsetof(VkLayerDispatchTable, DestroyEvent), VK_API_VERSION_1_0, NULL, 0},
+    [841] = {2502, offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [842] = {588, offsetof(VkLayerDispatchTable, MapMemory), VK_API_VERSION_1_0, NULL, 0},
+    [843] = {17323, offsetof(VkLayerDispatchTable, SetDeviceMemoryPriorityEXT), 0, NULL, 0},
+    [845] = {2715, offsetof(VkLayerDispatchTable, CmdBeginQuery), VK_API_VERSION_1_0, NULL, 0},
+    [846] = {13089, offsetof(VkLayerDispatchTable, CmdTraceRaysNV), 0, NULL, 0},
+    [847] = {18654, offsetof(VkLayerDispatchTable, GetShaderModuleIdentifierEXT), 0, NULL, 0},
+    [850] = {17805, offsetof(VkLayerDispatchTable, CmdSetAlphaToOneEnableEXT), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    [851] = {12271, offsetof(VkLayerDispatchTable, GetMemoryAndroidHardwareBufferANDROID), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+    [852] = {11768, offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleEnableEXT), 0, NULL, 0},
+    [853] = {3775, offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSupport), VK_API_VERSION_1_1, NULL, 0},
+    [854] = {4371, offsetof(VkLayerDispatchTable, CmdCopyBufferToImage2), VK_API_VERSION_1_3, NULL, 0},
+    [856] = {11900, offsetof(VkLayerDispatchTable, SetDebugUtilsObjectNameEXT), 0, (PFN_vkVoidFunction)SetDebugUtilsObjectNameEXT, offsetof(struct loader_device, layer_extensions.ext_debug_utils_enabled)},
+    [858] = {14965, offsetof(VkLayerDispatchTable, GetGeneratedCommandsMemoryRequirementsNV), 0, NULL, 0},
+    [859] = {1611, offsetof(VkLayerDispatchTable, DestroyDescriptorSetLayout), VK_API_VERSION_1_0, NULL, 0},
+    [862] = {1838, offsetof(VkLayerDispatchTable, DestroyRenderPass), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    [863] = {19241, offsetof(VkLayerDispatchTable, GetScreenBufferPropertiesQNX), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+    [866] = {4395, offsetof(VkLayerDispatchTable, CmdCopyImageToBuffer2), VK_API_VERSION_1_3, NULL, 0},
+    [867] = {15923, offsetof(VkLayerDispatchTable, CmdSetFragmentShadingRateEnumNV), 0, NULL, 0},
+    [868] = {15737, offsetof(VkLayerDispatchTable, GetImageOpaqueCaptureDescriptorDataEXT), 0, NULL, 0},
+    [869] = {15173, offsetof(VkLayerDispatchTable, CmdSetDepthBias2EXT), 0, NULL, 0},
+    [870] = {18248, offsetof(VkLayerDispatchTable, CmdSetLineStippleEnableEXT), 0, NULL, 0},
+    [875] = {7877, offsetof(VkLayerDispatchTable, CmdEndRenderPass2KHR), 0, NULL, 0},
+    [876] = {10455, offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplate2KHR), 0, NULL, 0},
+    [880] = {9158, offsetof(VkLayerDispatchTable, DestroyDeferredOperationKHR), 0, NULL, 0},
+    [881] = {8718, offsetof(VkLayerDispatchTable, CmdDrawIndirectCountKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [882] = {16268, offsetof(VkLayerDispatchTable, CreateBufferCollectionFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [883] = {8891, offsetof(VkLayerDispatchTable, CmdSetFragmentShadingRateKHR), 0, NULL, 0},
+    [884] = {12874, offsetof(VkLayerDispatchTable, CreateAccelerationStructureNV), 0, NULL, 0},
+    [885] = {10428, offsetof(VkLayerDispatchTable, CmdPushDescriptorSet2KHR), 0, NULL, 0},
+    [888] = {4419, offsetof(VkLayerDispatchTable, CmdBlitImage2), VK_API_VERSION_1_3, NULL, 0},
+    [889] = {12105, offsetof(VkLayerDispatchTable, CmdInsertDebugUtilsLabelEXT), 0, NULL, 0},
+    [891] = {2182, offsetof(VkLayerDispatchTable, CmdSetStencilCompareMask), VK_API_VERSION_1_0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [894] = {14382, offsetof(VkLayerDispatchTable, GetDeviceGroupSurfacePresentModes2EXT), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [896] = {19953, offsetof(VkLayerDispatchTable, WriteAccelerationStructuresPropertiesKHR), 0, NULL, 0},
+    [898] = {18215, offsetof(VkLayerDispatchTable, CmdSetLineRasterizationModeEXT), 0, NULL, 0},
+    [899] = {14512, offsetof(VkLayerDispatchTable, CmdSetFrontFaceEXT), 0, NULL, 0},
+    [902] = {10093, offsetof(VkLayerDispatchTable, CreatePipelineBinariesKHR), 0, NULL, 0},
+    [905] = {17594, offsetof(VkLayerDispatchTable, CmdUpdatePipelineIndirectBufferNV), 0, NULL, 0},
+    [907] = {8178, offsetof(VkLayerDispatchTable, AcquireProfilingLockKHR), 0, NULL, 0},
+    [908] = {1550, offsetof(VkLayerDispatchTable, CreateSampler), VK_API_VERSION_1_0, NULL, 0},
+    [909] = {9088, offsetof(VkLayerDispatchTable, GetDeviceMemoryOpaqueCaptureAddressKHR), 0, NULL, 0},
+    [912] = {12906, offsetof(VkLayerDispatchTable, DestroyAccelerationStructureNV), 0, NULL, 0},
+    [913] = {15399, offsetof(VkLayerDispatchTable, DestroyCudaModuleNV), 0, NULL, 0},
+    [915] = {12939, offsetof(VkLayerDispatchTable, GetAccelerationStructureMemoryRequirementsNV), 0, NULL, 0},
+    [916] = {11802, offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleModeEXT), 0, NULL, 0},
+    [918] = {13618, offsetof(VkLayerDispatchTable, CmdSetCheckpointNV), 0, NULL, 0},
+    [920] = {4700, offsetof(VkLayerDispatchTable, CmdSetDepthBoundsTestEnable), VK_API_VERSION_1_3, NULL, 0},
+    [921] = {6812, offsetof(VkLayerDispatchTable, CmdControlVideoCodingKHR), 0, NULL, 0},
+    [922] = {2012, offsetof(VkLayerDispatchTable, EndCommandBuffer), VK_API_VERSION_1_0, NULL, 0},
+    [923] = {5704, offsetof(VkLayerDispatchTable, AcquireNextImageKHR), 0, NULL, 0},
+    [924] = {4604, offsetof(VkLayerDispatchTable, CmdBindVertexBuffers2), VK_API_VERSION_1_3, NULL, 0},
+    [926] = {2694, offsetof(VkLayerDispatchTable, CmdPipelineBarrier), VK_API_VERSION_1_0, NULL, 0},
+    [927] = {13106, offsetof(VkLayerDispatchTable, CreateRayTracingPipelinesNV), 0, NULL, 0},
+    [928] = {8661, offsetof(VkLayerDispatchTable, BindImageMemory2KHR), 0, NULL, 0},
+    [929] = {9053, offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureAddressKHR), 0, NULL, 0},
+    [931] = {15445, offsetof(VkLayerDispatchTable, CmdCudaLaunchKernelNV), 0, NULL, 0},
+    [932] = {19176, offsetof(VkLayerDispatchTable, QueueNotifyOutOfBandNV), 0, NULL, 0},
+    [934] = {3607, offsetof(VkLayerDispatchTable, UpdateDescriptorSetWithTemplate), VK_API_VERSION_1_1, NULL, 0},
+    [935] = {20456, offsetof(VkLayerDispatchTable, CmdSetRayTracingPipelineStackSizeKHR), 0, NULL, 0},
+    [936] = {1526, offsetof(VkLayerDispatchTable, DestroyPipelineLayout), VK_API_VERSION_1_0, NULL, 0},
+    [939] = {15695, offsetof(VkLayerDispatchTable, GetBufferOpaqueCaptureDescriptorDataEXT), 0, NULL, 0},
+    [940] = {12781, offsetof(VkLayerDispatchTable, CmdBindShadingRateImageNV), 0, NULL, 0},
+    [941] = {18862, offsetof(VkLayerDispatchTable, CmdOpticalFlowExecuteNV), 0, NULL, 0},
+    [942] = {8683, offsetof(VkLayerDispatchTable, GetDescriptorSetLayoutSupportKHR), 0, NULL, 0},
+    [943] = {9188, offsetof(VkLayerDispatchTable, GetDeferredOperationMaxConcurrencyKHR), 0, NULL, 0},
+    [944] = {2464, offsetof(VkLayerDispatchTable, CmdBlitImage), VK_API_VERSION_1_0, NULL, 0},
+    [945] = {1221, offsetof(VkLayerDispatchTable, DestroyImage), VK_API_VERSION_1_0, NULL, 0},
+    [947] = {4830, offsetof(VkLayerDispatchTable, CmdSetPrimitiveRestartEnable), VK_API_VERSION_1_3, NULL, 0},
+    [951] = {8569, offsetof(VkLayerDispatchTable, CreateSamplerYcbcrConversionKHR), 0, NULL, 0},
+    [953] = {4628, offsetof(VkLayerDispatchTable, CmdSetDepthTestEnable), VK_API_VERSION_1_3, NULL, 0},
+    [955] = {1798, offsetof(VkLayerDispatchTable, DestroyFramebuffer), VK_API_VERSION_1_0, NULL, 0},
+    [956] = {5726, offsetof(VkLayerDispatchTable, QueuePresentKHR), 0, NULL, 0},
+    [958] = {7660, offsetof(VkLayerDispatchTable, CmdPushDescriptorSetWithTemplateKHR), 0, NULL, 0},
+    [959] = {19559, offsetof(VkLayerDispatchTable, UpdateIndirectExecutionSetShaderEXT), 0, NULL, 0},
+    [960] = {1301, offsetof(VkLayerDispatchTable, CreateShaderModule), VK_API_VERSION_1_0, NULL, 0},
+    [963] = {16713, offsetof(VkLayerDispatchTable, CmdSetLogicOpEXT), 0, NULL, 0},
+    [964] = {12753, offsetof(VkLayerDispatchTable, GetValidationCacheDataEXT), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [965] = {7562, offsetof(VkLayerDispatchTable, GetSemaphoreWin32HandleKHR), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [966] = {19811, offsetof(VkLayerDispatchTable, BuildAccelerationStructuresKHR), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [968] = {16125, offsetof(VkLayerDispatchTable, GetMemoryZirconHandleFUCHSIA), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [969] = {16867, offsetof(VkLayerDispatchTable, CmdDrawMultiEXT), 0, NULL, 0},
+    [970] = {5658, offsetof(VkLayerDispatchTable, DestroySwapchainKHR), 0, NULL, 0},
+    [972] = {18314, offsetof(VkLayerDispatchTable, CmdSetViewportWScalingEnableNV), 0, NULL, 0},
+    [973] = {4652, offsetof(VkLayerDispatchTable, CmdSetDepthWriteEnable), VK_API_VERSION_1_3, NULL, 0},
+    [975] = {12726, offsetof(VkLayerDispatchTable, MergeValidationCachesEXT), 0, NULL, 0},
+    [976] = {7634, offsetof(VkLayerDispatchTable, CmdPushDescriptorSetKHR), 0, NULL, 0},
+    [977] = {9777, offsetof(VkLayerDispatchTable, CmdBlitImage2KHR), 0, NULL, 0},
+    [979] = {9922, offsetof(VkLayerDispatchTable, GetDeviceImageSparseMemoryRequirementsKHR), 0, NULL, 0},
+    [980] = {1434, offsetof(VkLayerDispatchTable, CreateGraphicsPipelines), VK_API_VERSION_1_0, NULL, 0},
+    [981] = {15353, offsetof(VkLayerDispatchTable, GetCudaModuleCacheNV), 0, NULL, 0},
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    [982] = {15469, offsetof(VkLayerDispatchTable, ExportMetalObjectsEXT), 0, NULL, 0},
+#endif // VK_USE_PLATFORM_METAL_EXT
+    [984] = {10833, offsetof(VkLayerDispatchTable, CmdBeginTransformFeedbackEXT), 0, NULL, 0},
+    [985] = {938, offsetof(VkLayerDispatchTable, GetFenceStatus), VK_API_VERSION_1_0, NULL, 0},
+    [986] = {16463, offsetof(VkLayerDispatchTable, GetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI), 0, NULL, 0},
+    [989] = {11740, offsetof(VkLayerDispatchTable, CmdSetDiscardRectangleEXT), 0, NULL, 0},
+    [990] = {20203, offsetof(VkLayerDispatchTable, GetDeviceAccelerationStructureCompatibilityKHR), 0, NULL, 0},
+    [994] = {18830, offsetof(VkLayerDispatchTable, BindOpticalFlowSessionImageNV), 0, NULL, 0},
+    [995] = {2745, offsetof(VkLayerDispatchTable, CmdResetQueryPool), VK_API_VERSION_1_0, NULL, 0},
+    [996] = {19092, offsetof(VkLayerDispatchTable, SetLatencySleepModeNV), 0, NULL, 0},
+    [999] = {15237, offsetof(VkLayerDispatchTable, CreatePrivateDataSlotEXT), 0, NULL, 0},
+    [1000] = {8530, offsetof(VkLayerDispatchTable, GetImageSparseMemoryRequirements2KHR), 0, NULL, 0},
+    [1001] = {2887, offsetof(VkLayerDispatchTable, CmdExecuteCommands), VK_API_VERSION_1_0, NULL, 0},
+    [1002] = {15650, offsetof(VkLayerDispatchTable, CmdBindDescriptorBufferEmbeddedSamplersEXT), 0, NULL, 0},
+    [1003] = {9361, offsetof(VkLayerDispatchTable, GetPipelineExecutableInternalRepresentationsKHR), 0, NULL, 0},
+    [1004] = {5107, offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2), VK_API_VERSION_1_4, NULL, 0},
+    [1005] = {18945, offsetof(VkLayerDispatchTable, GetShaderBinaryDataEXT), 0, NULL, 0},
+    [1006] = {11036, offsetof(VkLayerDispatchTable, DestroyCuFunctionNVX), 0, NULL, 0},
+    [1008] = {15421, offsetof(VkLayerDispatchTable, DestroyCudaFunctionNV), 0, NULL, 0},
+    [1011] = {2052, offsetof(VkLayerDispatchTable, CmdBindPipeline), VK_API_VERSION_1_0, NULL, 0},
+    [1013] = {4246, offsetof(VkLayerDispatchTable, CmdResetEvent2), VK_API_VERSION_1_3, NULL, 0},
+    [1014] = {11929, offsetof(VkLayerDispatchTable, SetDebugUtilsObjectTagEXT), 0, (PFN_vkVoidFunction)SetDebugUtilsObjectTagEXT, offsetof(struct loader_device, layer_extensions.ext_debug_utils_enabled)},
+    [1015] = {4001, offsetof(VkLayerDispatchTable, SignalSemaphore), VK_API_VERSION_1_2, NULL, 0},
+    [1016] = {20252, offsetof(VkLayerDispatchTable, GetAccelerationStructureBuildSizesKHR), 0, NULL, 0},
+    [1017] = {13136, offsetof(VkLayerDispatchTable, GetRayTracingShaderGroupHandlesKHR), 0, NULL, 0},
+    [1018] = {4806, offsetof(VkLayerDispatchTable, CmdSetDepthBiasEnable), VK_API_VERSION_1_3, NULL, 0},
+    [1020] = {14905, offsetof(VkLayerDispatchTable, GetImageSubresourceLayout2EXT), 0, NULL, 0},
+    [1021] = {4355, offsetof(VkLayerDispatchTable, CmdCopyImage2), VK_API_VERSION_1_3, NULL, 0},
+    [1022] = {7856, offsetof(VkLayerDispatchTable, CmdNextSubpass2KHR), 0, NULL, 0},
+    [1023] = {12078, offsetof(VkLayerDispatchTable, CmdEndDebugUtilsLabelEXT), 0, NULL, 0},
+};
+
+// Device command lookup function
+VKAPI_ATTR void* VKAPI_CALL loader_lookup_device_dispatch_table(const VkLayerDispatchTable *table, const char *name, bool* found_name) {
+    if (!name || name[0] != 'v' || name[1] != 'k') {
+        *found_name = false;
+        return NULL;
+    }
+
+    name += 2;
+    const struct loader_device_command_lookup_entry *entry =
+        &device_command_lookup_table[loader_perfect_hash_slot(loader_hash_name(name, 0u), device_command_lookup_table_displacements, 511u, 10u)];
+    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {
+        *found_name = false;
+        return NULL;
+    }
+
+    *found_name = true;
+    struct loader_device* dev = (struct loader_device *)table;
+    const struct loader_instance* inst = dev->phys_dev_term->this_icd_term->this_instance;
+    uint32_t api_version = VK_MAKE_API_VERSION(0, inst->app_api_version.major, inst->app_api_version.minor, inst->app_api_version.patch);
+    if (dev->should_ignore_device_commands_from_newer_version && api_version < entry->api_version) return NULL;
+    if (NULL != entry->trampoline) {
+        return *(const bool *)((const char *)dev + entry->layer_extension_offset) ? (void *)entry->trampoline : NULL;
+    }
+    return *(void *const *)((const char *)table + entry->table_offset);
+}
+
+// Perfect hash table of all instance commands, generated from the registry
+static const uint16_t instance_command_lookup_table_displacements[64] = {
+    12, 1, 2, 0, 1, 4, 0, 0, 5, 5, 6, 0, 1, 0, 6, 0,
+    7, 1, 0, 4, 0, 0, 1, 1, 0, 0, 0, 2, 8, 0, 1, 4,
+    3, 0, 0, 0, 8, 0, 0, 27, 0, 0, 3, 10, 11, 0, 2, 3,
+    0, 19, 0, 11, 2, 0, 20, 2, 4, 0, 2, 0, 0, 2, 0, 10,
+};
+static const struct loader_instance_command_lookup_entry instance_command_lookup_table[128] = {
+    [0] = {6501, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceVideoFormatPropertiesKHR)},
+    [1] = {5459, offsetof(VkLayerInstanceDispatchTable, DestroySurfaceKHR)},
+    [2] = {8429, offsetof(VkLayerInstanceDispatchTable, GetDisplayPlaneCapabilities2KHR)},
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    [3] = {16052, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDirectFBPresentationSupportEXT)},
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    [4] = {11503, offsetof(VkLayerInstanceDispatchTable, GetRandROutputDisplayEXT)},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    [5] = {8352, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayPlaneProperties2KHR)},
+    [6] = {12135, offsetof(VkLayerInstanceDispatchTable, CreateDebugUtilsMessengerEXT)},
+    [7] = {277, offsetof(VkLayerInstanceDispatchTable, GetInstanceProcAddr)},
+    [8] = {8398, offsetof(VkLayerInstanceDispatchTable, GetDisplayModeProperties2KHR)},
+    [9] = {20, offsetof(VkLayerInstanceDispatchTable, DestroyInstance)},
+    [10] = {15218, offsetof(VkLayerInstanceDispatchTable, GetDrmDisplayEXT)},
+    [11] = {10639, offsetof(VkLayerInstanceDispatchTable, DebugReportMessageEXT)},
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    [12] = {6176, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceXlibPresentationSupportKHR)},
+#endif // VK_USE_PLATFORM_XLIB_KHR
+    [13] = {8122, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR)},
+    [14] = {7099, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMemoryProperties2KHR)},
+#if defined(VK_USE_PLATFORM_XLIB_XRANDR_EXT)
+    [15] = {11479, offsetof(VkLayerInstanceDispatchTable, AcquireXlibDisplayEXT)},
+#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    [16] = {9445, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR)},
+    [17] = {13398, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCalibrateableTimeDomainsEXT)},
+#if defined(VK_USE_PLATFORM_XLIB_KHR)
+    [18] = {6153, offsetof(VkLayerInstanceDispatchTable, CreateXlibSurfaceKHR)},
+#endif // VK_USE_PLATFORM_XLIB_KHR
+    [19] = {5885, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayPropertiesKHR)},
+    [21] = {5970, offsetof(VkLayerInstanceDispatchTable, GetDisplayPlaneSupportedDisplaysKHR)},
+    [22] = {3728, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalSemaphoreProperties)},
+#if defined(VK_USE_PLATFORM_IOS_MVK)
+    [23] = {11854, offsetof(VkLayerInstanceDispatchTable, CreateIOSSurfaceMVK)},
+#endif // VK_USE_PLATFORM_IOS_MVK
+    [24] = {11530, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceCapabilities2EXT)},
+#if defined(VK_USE_PLATFORM_MACOS_MVK)
+    [26] = {11876, offsetof(VkLayerInstanceDispatchTable, CreateMacOSSurfaceMVK)},
+#endif // VK_USE_PLATFORM_MACOS_MVK
+    [27] = {19597, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCooperativeMatrixFlexibleDimensionsPropertiesNV)},
+    [28] = {10228, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCooperativeMatrixPropertiesKHR)},
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    [29] = {6289, offsetof(VkLayerInstanceDispatchTable, CreateWaylandSurfaceKHR)},
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [32] = {6414, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceWin32PresentationSupportKHR)},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [33] = {6903, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFeatures2KHR)},
+    [34] = {93, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFormatProperties)},
+    [35] = {7292, offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDeviceGroupsKHR)},
+    [37] = {14422, offsetof(VkLayerInstanceDispatchTable, CreateHeadlessSurfaceEXT)},
+    [38] = {10607, offsetof(VkLayerInstanceDispatchTable, DestroyDebugReportCallbackEXT)},
+    [42] = {3175, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFeatures2)},
+    [43] = {5479, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceSupportKHR)},
+    [44] = {12166, offsetof(VkLayerInstanceDispatchTable, DestroyDebugUtilsMessengerEXT)},
+    [45] = {7009, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceImageFormatProperties2KHR)},
+#if defined(VK_USE_PLATFORM_DIRECTFB_EXT)
+    [46] = {16025, offsetof(VkLayerInstanceDispatchTable, CreateDirectFBSurfaceEXT)},
+#endif // VK_USE_PLATFORM_DIRECTFB_EXT
+    [47] = {5516, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceCapabilitiesKHR)},
+    [48] = {15195, offsetof(VkLayerInstanceDispatchTable, AcquireDrmDisplayEXT)},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [49] = {6390, offsetof(VkLayerInstanceDispatchTable, CreateWin32SurfaceKHR)},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [50] = {8273, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceFormats2KHR)},
+    [54] = {7480, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalSemaphorePropertiesKHR)},
+    [55] = {6008, offsetof(VkLayerInstanceDispatchTable, GetDisplayModePropertiesKHR)},
+    [56] = {6461, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceVideoCapabilitiesKHR)},
+    [57] = {7139, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSparseImageFormatProperties2KHR)},
+    [59] = {4114, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceToolProperties)},
+    [61] = {14115, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceToolPropertiesEXT)},
+#if defined(VK_USE_PLATFORM_VI_NN)
+    [63] = {11346, offsetof(VkLayerInstanceDispatchTable, CreateViSurfaceNN)},
+#endif // VK_USE_PLATFORM_VI_NN
+    [64] = {18726, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceOpticalFlowImageFormatsNV)},
+    [65] = {8058, offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR)},
+    [68] = {11270, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalImageFormatPropertiesNV)},
+    [69] = {8230, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceCapabilities2KHR)},
+    [70] = {65, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFeatures)},
+    [71] = {129, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceImageFormatProperties)},
+    [72] = {10576, offsetof(VkLayerInstanceDispatchTable, CreateDebugReportCallbackEXT)},
+    [73] = {14152, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCooperativeMatrixPropertiesNV)},
+    [74] = {6038, offsetof(VkLayerInstanceDispatchTable, CreateDisplayModeKHR)},
+    [75] = {12586, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMultisamplePropertiesEXT)},
+    [76] = {12198, offsetof(VkLayerInstanceDispatchTable, SubmitDebugUtilsMessageEXT)},
+#if defined(VK_USE_PLATFORM_ANDROID_KHR)
+    [77] = {6364, offsetof(VkLayerInstanceDispatchTable, CreateAndroidSurfaceKHR)},
+#endif // VK_USE_PLATFORM_ANDROID_KHR
+    [78] = {3272, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceImageFormatProperties2)},
+    [79] = {6061, offsetof(VkLayerInstanceDispatchTable, GetDisplayPlaneCapabilitiesKHR)},
+    [80] = {6969, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFormatProperties2KHR)},
+    [82] = {170, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceProperties)},
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    [83] = {16791, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceScreenPresentationSupportQNX)},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [84] = {15981, offsetof(VkLayerInstanceDispatchTable, AcquireWinrtDisplayNV)},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [85] = {3685, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalFenceProperties)},
+    [86] = {3204, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceProperties2)},
+#if defined(VK_USE_PLATFORM_SCREEN_QNX)
+    [87] = {16766, offsetof(VkLayerInstanceDispatchTable, CreateScreenSurfaceQNX)},
+#endif // VK_USE_PLATFORM_SCREEN_QNX
+#if defined(VK_USE_PLATFORM_WAYLAND_KHR)
+    [88] = {6315, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceWaylandPresentationSupportKHR)},
+#endif // VK_USE_PLATFORM_WAYLAND_KHR
+#if defined(VK_USE_PLATFORM_METAL_EXT)
+    [89] = {14063, offsetof(VkLayerInstanceDispatchTable, CreateMetalSurfaceEXT)},
+#endif // VK_USE_PLATFORM_METAL_EXT
+    [91] = {3356, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMemoryProperties2)},
+    [92] = {3393, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSparseImageFormatProperties2)},
+    [93] = {461, offsetof(VkLayerInstanceDispatchTable, EnumerateDeviceLayerProperties)},
+    [94] = {8848, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFragmentShadingRatesKHR)},
+    [95] = {14201, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV)},
+#if defined(VK_USE_PLATFORM_GGP)
+    [96] = {11235, offsetof(VkLayerInstanceDispatchTable, CreateStreamDescriptorSurfaceGGP)},
+#endif // VK_USE_PLATFORM_GGP
+    [97] = {5558, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfaceFormatsKHR)},
+    [98] = {3314, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyProperties2)},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [99] = {16005, offsetof(VkLayerInstanceDispatchTable, GetWinrtDisplayNV)},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [100] = {11459, offsetof(VkLayerInstanceDispatchTable, ReleaseDisplayEXT)},
+    [102] = {241, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceMemoryProperties)},
+#if defined(VK_USE_PLATFORM_WIN32_KHR)
+    [103] = {14267, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfacePresentModes2EXT)},
+#endif // VK_USE_PLATFORM_WIN32_KHR
+    [104] = {10301, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceCalibrateableTimeDomainsKHR)},
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    [105] = {6222, offsetof(VkLayerInstanceDispatchTable, CreateXcbSurfaceKHR)},
+#endif // VK_USE_PLATFORM_XCB_KHR
+    [106] = {5595, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSurfacePresentModesKHR)},
+    [107] = {3641, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalBufferProperties)},
+    [108] = {3235, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceFormatProperties2)},
+    [109] = {38, offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDevices)},
+    [110] = {8311, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayProperties2KHR)},
+    [111] = {830, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceSparseImageFormatProperties)},
+#if defined(VK_USE_PLATFORM_XCB_KHR)
+    [113] = {6244, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceXcbPresentationSupportKHR)},
+#endif // VK_USE_PLATFORM_XCB_KHR
+    [114] = {3046, offsetof(VkLayerInstanceDispatchTable, EnumeratePhysicalDeviceGroups)},
+    [116] = {7924, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalFencePropertiesKHR)},
+    [117] = {6935, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceProperties2KHR)},
+    [118] = {5925, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceDisplayPlanePropertiesKHR)},
+#if defined(VK_USE_PLATFORM_FUCHSIA)
+    [119] = {14031, offsetof(VkLayerInstanceDispatchTable, CreateImagePipeSurfaceFUCHSIA)},
+#endif // VK_USE_PLATFORM_FUCHSIA
+    [121] = {6094, offsetof(VkLayerInstanceDispatchTable, CreateDisplayPlaneSurfaceKHR)},
+    [122] = {389, offsetof(VkLayerInstanceDispatchTable, EnumerateDeviceExtensionProperties)},
+    [124] = {7054, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyProperties2KHR)},
+    [125] = {7327, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceExternalBufferPropertiesKHR)},
+    [126] = {5822, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDevicePresentRectanglesKHR)},
+    [127] = {200, offsetof(VkLayerInstanceDispatchTable, GetPhysicalDeviceQueueFamilyProperties)},
+};
+
+// Instance command lookup function
+VKAPI_ATTR void* VKAPI_CALL loader_lookup_instance_dispatch_table(const VkLayerInstanceDispatchTable *table, const char *name,
+                                                                 bool *found_name) {
+    if (!name || name[0] != 'v' || name[1] != 'k') {
+        *found_name = false;
+        return NULL;
+    }
+
+    name += 2;
+    const struct loader_instance_command_lookup_entry *entry =
+        &instance_command_lookup_table[loader_perfect_hash_slot(loader_hash_name(name, 0u), instance_command_lookup_table_displacements, 63u, 7u)];
+    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {
+        *found_name = false;
+        return NULL;
+    }
+
+    *found_name = true;
+    return *(void *const *)((const char *)table + entry->table_offset);
+}
+
+// clang-format on
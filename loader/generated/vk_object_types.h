@@ -98,64 +98,127 @@ typedef enum VulkanObjectType {
     kVulkanObjectTypePrivateDataSlotEXT = kVulkanObjectTypePrivateDataSlot,
 } VulkanObjectType;
 
-// Array of object name strings for OBJECT_TYPE enum conversion
-static const char * const object_string[kVulkanObjectTypeMax] = {
-    "Unknown",
-    "Buffer",
-    "Image",
-    "Instance",
-    "PhysicalDevice",
-    "Device",
-    "Queue",
-    "Semaphore",
-    "CommandBuffer",
-    "Fence",
-    "DeviceMemory",
-    "Event",
-    "QueryPool",
-    "BufferView",
-    "ImageView",
-    "ShaderModule",
-    "PipelineCache",
-    "PipelineLayout",
-    "Pipeline",
-    "RenderPass",
-    "DescriptorSetLayout",
-    "Sampler",
-    "DescriptorSet",
-    "DescriptorPool",
-    "Framebuffer",
-    "CommandPool",
-    "SamplerYcbcrConversion",
-    "DescriptorUpdateTemplate",
-    "PrivateDataSlot",
-    "SurfaceKHR",
-    "SwapchainKHR",
-    "DisplayKHR",
-    "DisplayModeKHR",
-    "VideoSessionKHR",
-    "VideoSessionParametersKHR",
-    "DeferredOperationKHR",
-    "PipelineBinaryKHR",
-    "DebugReportCallbackEXT",
-    "CuModuleNVX",
-    "CuFunctionNVX",
-    "DebugUtilsMessengerEXT",
-    "ValidationCacheEXT",
-    "AccelerationStructureNV",
-    "PerformanceConfigurationINTEL",
-    "IndirectCommandsLayoutNV",
-    "CudaModuleNV",
-    "CudaFunctionNV",
-    "AccelerationStructureKHR",
-    "BufferCollectionFUCHSIA",
-    "MicromapEXT",
-    "OpticalFlowSessionNV",
-    "ShaderEXT",
-    "IndirectExecutionSetEXT",
-    "IndirectCommandsLayoutEXT",
+// Object name strings for OBJECT_TYPE enum conversion, packed into a single string
+static const char object_string_pool[] =
+    "\0"
+    "Unknown\0"
+    "Buffer\0"
+    "Image\0"
+    "Instance\0"
+    "PhysicalDevice\0"
+    "Device\0"
+    "Queue\0"
+    "Semaphore\0"
+    "CommandBuffer\0"
+    "Fence\0"
+    "DeviceMemory\0"
+    "Event\0"
+    "QueryPool\0"
+    "BufferView\0"
+    "ImageView\0"
+    "ShaderModule\0"
+    "PipelineCache\0"
+    "PipelineLayout\0"
+    "Pipeline\0"
+    "RenderPass\0"
+    "DescriptorSetLayout\0"
+    "Sampler\0"
+    "DescriptorSet\0"
+    "DescriptorPool\0"
+    "Framebuffer\0"
+    "CommandPool\0"
+    "SamplerYcbcrConversion\0"
+    "DescriptorUpdateTemplate\0"
+    "PrivateDataSlot\0"
+    "SurfaceKHR\0"
+    "SwapchainKHR\0"
+    "DisplayKHR\0"
+    "DisplayModeKHR\0"
+    "VideoSessionKHR\0"
+    "VideoSessionParametersKHR\0"
+    "DeferredOperationKHR\0"
+    "PipelineBinaryKHR\0"
+    "DebugReportCallbackEXT\0"
+    "CuModuleNVX\0"
+    "CuFunctionNVX\0"
+    "DebugUtilsMessengerEXT\0"
+    "ValidationCacheEXT\0"
+    "AccelerationStructureNV\0"
+    "PerformanceConfigurationINTEL\0"
+    "IndirectCommandsLayoutNV\0"
+    "CudaModuleNV\0"
+    "CudaFunctionNV\0"
+    "AccelerationStructureKHR\0"
+    "BufferCollectionFUCHSIA\0"
+    "MicromapEXT\0"
+    "OpticalFlowSessionNV\0"
+    "ShaderEXT\0"
+    "IndirectExecutionSetEXT\0"
+    "IndirectCommandsLayoutEXT";
+
+// Offsets of the object name strings in object_string_pool, indexed by VulkanObjectType
+static const uint16_t object_string_offsets[kVulkanObjectTypeMax] = {
+    1, // Unknown
+    9, // Buffer
+    16, // Image
+    22, // Instance
+    31, // PhysicalDevice
+    46, // Device
+    53, // Queue
+    59, // Semaphore
+    69, // CommandBuffer
+    83, // Fence
+    89, // DeviceMemory
+    102, // Event
+    108, // QueryPool
+    118, // BufferView
+    129, // ImageView
+    139, // ShaderModule
+    152, // PipelineCache
+    166, // PipelineLayout
+    181, // Pipeline
+    190, // RenderPass
+    201, // DescriptorSetLayout
+    221, // Sampler
+    229, // DescriptorSet
+    243, // DescriptorPool
+    258, // Framebuffer
+    270, // CommandPool
+    282, // SamplerYcbcrConversion
+    305, // DescriptorUpdateTemplate
+    330, // PrivateDataSlot
+    346, // SurfaceKHR
+    357, // SwapchainKHR
+    370, // DisplayKHR
+    381, // DisplayModeKHR
+    396, // VideoSessionKHR
+    412, // VideoSessionParametersKHR
+    438, // DeferredOperationKHR
+    459, // PipelineBinaryKHR
+    477, // DebugReportCallbackEXT
+    500, // CuModuleNVX
+    512, // CuFunctionNVX
+    526, // DebugUtilsMessengerEXT
+    549, // ValidationCacheEXT
+    568, // AccelerationStructureNV
+    592, // PerformanceConfigurationINTEL
+    622, // IndirectCommandsLayoutNV
+    647, // CudaModuleNV
+    660, // CudaFunctionNV
+    675, // AccelerationStructureKHR
+    700, // BufferCollectionFUCHSIA
+    724, // MicromapEXT
+    736, // OpticalFlowSessionNV
+    757, // ShaderEXT
+    767, // IndirectExecutionSetEXT
+    791, // IndirectCommandsLayoutEXT
 };
 
+// Helper function to get the name string of an OBJECT_TYPE enum
+static inline const char *object_string(VulkanObjectType object_type) {
+    return &object_string_pool[object_string_offsets[object_type]];
+}
+
 // Helper array to get Vulkan VK_EXT_debug_report object type enum from the internal layers version
 const VkDebugReportObjectTypeEXT get_debug_report_enum[] = {
     VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT, // kVulkanObjectTypeUnknown
@@ -272,190 +335,148 @@ const VkObjectType get_object_type_enum[] = {
     VK_OBJECT_TYPE_INDIRECT_COMMANDS_LAYOUT_EXT,   // kVulkanObjectTypeIndirectCommandsLayoutEXT
 };
 
+// Debug report and core object type pair for the extension range of the conversion helpers
+typedef struct VulkanObjectTypeConversion {
+    VkDebugReportObjectTypeEXT debug_report_object_type;
+    VkObjectType core_object_type;
+} VulkanObjectTypeConversion;
+
+// Helper array to get the VkObjectType from a VkDebugReportObjectTypeEXT below the extension range, indexed by value
+static const VkObjectType core_object_type_from_debug_report_object_type[] = {
+    VK_OBJECT_TYPE_UNKNOWN,   // VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT
+    VK_OBJECT_TYPE_INSTANCE,   // VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT
+    VK_OBJECT_TYPE_PHYSICAL_DEVICE,   // VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT
+    VK_OBJECT_TYPE_DEVICE,   // VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT
+    VK_OBJECT_TYPE_QUEUE,   // VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT
+    VK_OBJECT_TYPE_SEMAPHORE,   // VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT
+    VK_OBJECT_TYPE_COMMAND_BUFFER,   // VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT
+    VK_OBJECT_TYPE_FENCE,   // VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT
+    VK_OBJECT_TYPE_DEVICE_MEMORY,   // VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT
+    VK_OBJECT_TYPE_BUFFER,   // VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT
+    VK_OBJECT_TYPE_IMAGE,   // VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT
+    VK_OBJECT_TYPE_EVENT,   // VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT
+    VK_OBJECT_TYPE_QUERY_POOL,   // VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT
+    VK_OBJECT_TYPE_BUFFER_VIEW,   // VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT
+    VK_OBJECT_TYPE_IMAGE_VIEW,   // VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT
+    VK_OBJECT_TYPE_SHADER_MODULE,   // VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT
+    VK_OBJECT_TYPE_PIPELINE_CACHE,   // VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT
+    VK_OBJECT_TYPE_PIPELINE_LAYOUT,   // VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT
+    VK_OBJECT_TYPE_RENDER_PASS,   // VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT
+    VK_OBJECT_TYPE_PIPELINE,   // VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT
+    VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT,   // VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT
+    VK_OBJECT_TYPE_SAMPLER,   // VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT
+    VK_OBJECT_TYPE_DESCRIPTOR_POOL,   // VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT
+    VK_OBJECT_TYPE_DESCRIPTOR_SET,   // VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT
+    VK_OBJECT_TYPE_FRAMEBUFFER,   // VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT
+    VK_OBJECT_TYPE_COMMAND_POOL,   // VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT
+    VK_OBJECT_TYPE_SURFACE_KHR,   // VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT
+    VK_OBJECT_TYPE_SWAPCHAIN_KHR,   // VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT
+    VK_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT,   // VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT
+    VK_OBJECT_TYPE_DISPLAY_KHR,   // VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT
+    VK_OBJECT_TYPE_DISPLAY_MODE_KHR,   // VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT
+    VK_OBJECT_TYPE_UNKNOWN,
+    VK_OBJECT_TYPE_UNKNOWN,
+    VK_OBJECT_TYPE_VALIDATION_CACHE_EXT,   // VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT
+};
+
+// Helper array to get the VkObjectType from a VkDebugReportObjectTypeEXT in the extension range, sorted by value
+static const VulkanObjectTypeConversion core_object_type_from_debug_report_object_type_extension[] = {
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CU_MODULE_NVX_EXT, VK_OBJECT_TYPE_CU_MODULE_NVX},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CU_FUNCTION_NVX_EXT, VK_OBJECT_TYPE_CU_FUNCTION_NVX},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT, VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR_EXT, VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_EXT, VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV_EXT, VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_MODULE_NV_EXT, VK_OBJECT_TYPE_CUDA_MODULE_NV},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_FUNCTION_NV_EXT, VK_OBJECT_TYPE_CUDA_FUNCTION_NV},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA_EXT, VK_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA},
+};
+
 // Helper function to convert from VkDebugReportObjectTypeEXT to VkObjectType
 static inline VkObjectType convertDebugReportObjectToCoreObject(VkDebugReportObjectTypeEXT debug_report_obj){
-    if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT) {
-        return VK_OBJECT_TYPE_UNKNOWN;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT) {
-        return VK_OBJECT_TYPE_UNKNOWN;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT) {
-        return VK_OBJECT_TYPE_INSTANCE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT) {
-        return VK_OBJECT_TYPE_PHYSICAL_DEVICE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT) {
-        return VK_OBJECT_TYPE_DEVICE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT) {
-        return VK_OBJECT_TYPE_QUEUE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT) {
-        return VK_OBJECT_TYPE_SEMAPHORE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT) {
-        return VK_OBJECT_TYPE_COMMAND_BUFFER;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT) {
-        return VK_OBJECT_TYPE_FENCE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT) {
-        return VK_OBJECT_TYPE_DEVICE_MEMORY;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT) {
-        return VK_OBJECT_TYPE_BUFFER;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT) {
-        return VK_OBJECT_TYPE_IMAGE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT) {
-        return VK_OBJECT_TYPE_EVENT;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT) {
-        return VK_OBJECT_TYPE_QUERY_POOL;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT) {
-        return VK_OBJECT_TYPE_BUFFER_VIEW;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT) {
-        return VK_OBJECT_TYPE_IMAGE_VIEW;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT) {
-        return VK_OBJECT_TYPE_SHADER_MODULE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT) {
-        return VK_OBJECT_TYPE_PIPELINE_CACHE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT) {
-        return VK_OBJECT_TYPE_PIPELINE_LAYOUT;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT) {
-        return VK_OBJECT_TYPE_RENDER_PASS;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT) {
-        return VK_OBJECT_TYPE_PIPELINE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT) {
-        return VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT) {
-        return VK_OBJECT_TYPE_SAMPLER;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT) {
-        return VK_OBJECT_TYPE_DESCRIPTOR_POOL;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT) {
-        return VK_OBJECT_TYPE_DESCRIPTOR_SET;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT) {
-        return VK_OBJECT_TYPE_FRAMEBUFFER;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT) {
-        return VK_OBJECT_TYPE_COMMAND_POOL;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_EXT) {
-        return VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT) {
-        return VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT) {
-        return VK_OBJECT_TYPE_SURFACE_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT) {
-        return VK_OBJECT_TYPE_SWAPCHAIN_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT) {
-        return VK_OBJECT_TYPE_DISPLAY_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT) {
-        return VK_OBJECT_TYPE_DISPLAY_MODE_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT) {
-        return VK_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_CU_MODULE_NVX_EXT) {
-        return VK_OBJECT_TYPE_CU_MODULE_NVX;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_CU_FUNCTION_NVX_EXT) {
-        return VK_OBJECT_TYPE_CU_FUNCTION_NVX;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR_EXT) {
-        return VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR_EXT) {
-        return VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR_EXT) {
-        return VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT) {
-        return VK_OBJECT_TYPE_VALIDATION_CACHE_EXT;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV_EXT) {
-        return VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_MODULE_NV_EXT) {
-        return VK_OBJECT_TYPE_CUDA_MODULE_NV;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_FUNCTION_NV_EXT) {
-        return VK_OBJECT_TYPE_CUDA_FUNCTION_NV;
-    } else if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA_EXT) {
-        return VK_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA;
+    if ((uint32_t)debug_report_obj < sizeof(core_object_type_from_debug_report_object_type) / sizeof(core_object_type_from_debug_report_object_type[0])) {
+        return core_object_type_from_debug_report_object_type[debug_report_obj];
+    }
+    uint32_t low = 0;
+    uint32_t high = sizeof(core_object_type_from_debug_report_object_type_extension) / sizeof(core_object_type_from_debug_report_object_type_extension[0]);
+    while (low < high) {
+        uint32_t mid = low + (high - low) / 2;
+        if (core_object_type_from_debug_report_object_type_extension[mid].debug_report_object_type == debug_report_obj) {
+            return core_object_type_from_debug_report_object_type_extension[mid].core_object_type;
+        } else if (core_object_type_from_debug_report_object_type_extension[mid].debug_report_object_type < debug_report_obj) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
     }
     return VK_OBJECT_TYPE_UNKNOWN;
 }
 
-// Helper function to convert from VkDebugReportObjectTypeEXT to VkObjectType
+// Helper array to get the VkDebugReportObjectTypeEXT from a VkObjectType below the extension range, indexed by value
+static const VkDebugReportObjectTypeEXT debug_report_object_type_from_core_object_type[] = {
+    VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT,   // VK_OBJECT_TYPE_UNKNOWN
+    VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT,   // VK_OBJECT_TYPE_INSTANCE
+    VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT,   // VK_OBJECT_TYPE_PHYSICAL_DEVICE
+    VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT,   // VK_OBJECT_TYPE_DEVICE
+    VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT,   // VK_OBJECT_TYPE_QUEUE
+    VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT,   // VK_OBJECT_TYPE_SEMAPHORE
+    VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT,   // VK_OBJECT_TYPE_COMMAND_BUFFER
+    VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT,   // VK_OBJECT_TYPE_FENCE
+    VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT,   // VK_OBJECT_TYPE_DEVICE_MEMORY
+    VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT,   // VK_OBJECT_TYPE_BUFFER
+    VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT,   // VK_OBJECT_TYPE_IMAGE
+    VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT,   // VK_OBJECT_TYPE_EVENT
+    VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT,   // VK_OBJECT_TYPE_QUERY_POOL
+    VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT,   // VK_OBJECT_TYPE_BUFFER_VIEW
+    VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT,   // VK_OBJECT_TYPE_IMAGE_VIEW
+    VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT,   // VK_OBJECT_TYPE_SHADER_MODULE
+    VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT,   // VK_OBJECT_TYPE_PIPELINE_CACHE
+    VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT,   // VK_OBJECT_TYPE_PIPELINE_LAYOUT
+    VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT,   // VK_OBJECT_TYPE_RENDER_PASS
+    VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,   // VK_OBJECT_TYPE_PIPELINE
+    VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT,   // VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT
+    VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT,   // VK_OBJECT_TYPE_SAMPLER
+    VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT,   // VK_OBJECT_TYPE_DESCRIPTOR_POOL
+    VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT,   // VK_OBJECT_TYPE_DESCRIPTOR_SET
+    VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT,   // VK_OBJECT_TYPE_FRAMEBUFFER
+    VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT,   // VK_OBJECT_TYPE_COMMAND_POOL
+};
+
+// Helper array to get the VkDebugReportObjectTypeEXT from a VkObjectType in the extension range, sorted by value
+static const VulkanObjectTypeConversion debug_report_object_type_from_core_object_type_extension[] = {
+    {VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT, VK_OBJECT_TYPE_SURFACE_KHR},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT, VK_OBJECT_TYPE_SWAPCHAIN_KHR},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT, VK_OBJECT_TYPE_DISPLAY_KHR},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT, VK_OBJECT_TYPE_DISPLAY_MODE_KHR},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT, VK_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CU_MODULE_NVX_EXT, VK_OBJECT_TYPE_CU_MODULE_NVX},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CU_FUNCTION_NVX_EXT, VK_OBJECT_TYPE_CU_FUNCTION_NVX},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT, VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR_EXT, VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_EXT, VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT, VK_OBJECT_TYPE_VALIDATION_CACHE_EXT},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV_EXT, VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_MODULE_NV_EXT, VK_OBJECT_TYPE_CUDA_MODULE_NV},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_FUNCTION_NV_EXT, VK_OBJECT_TYPE_CUDA_FUNCTION_NV},
+    {VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA_EXT, VK_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA},
+};
+
+// Helper function to convert from VkObjectType to VkDebugReportObjectTypeEXT
 static inline VkDebugReportObjectTypeEXT convertCoreObjectToDebugReportObject(VkObjectType core_report_obj){
-    if (core_report_obj == VK_OBJECT_TYPE_UNKNOWN) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_UNKNOWN) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_INSTANCE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_PHYSICAL_DEVICE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DEVICE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_QUEUE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SEMAPHORE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_COMMAND_BUFFER) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_FENCE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DEVICE_MEMORY) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_BUFFER) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_IMAGE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_EVENT) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_QUERY_POOL) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_BUFFER_VIEW) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_IMAGE_VIEW) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SHADER_MODULE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_PIPELINE_CACHE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_PIPELINE_LAYOUT) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_RENDER_PASS) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_PIPELINE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SAMPLER) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DESCRIPTOR_POOL) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DESCRIPTOR_SET) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_FRAMEBUFFER) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_COMMAND_POOL) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SURFACE_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SWAPCHAIN_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DISPLAY_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DISPLAY_MODE_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_CU_MODULE_NVX) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_CU_MODULE_NVX_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_CU_FUNCTION_NVX) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_CU_FUNCTION_NVX_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_VALIDATION_CACHE_EXT) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_CUDA_MODULE_NV) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_MODULE_NV_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_CUDA_FUNCTION_NV) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_FUNCTION_NV_EXT;
-    } else if (core_report_obj == VK_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA) {
-        return VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA_EXT;
+    if ((uint32_t)core_report_obj < sizeof(debug_report_object_type_from_core_object_type) / sizeof(debug_report_object_type_from_core_object_type[0])) {
+        return debug_report_object_type_from_core_object_type[core_report_obj];
+    }
+    uint32_t low = 0;
+    uint32_t high = sizeof(debug_report_object_type_from_core_object_type_extension) / sizeof(debug_report_object_type_from_core_object_type_extension[0]);
+    while (low < high) {
+        uint32_t mid = low + (high - low) / 2;
+        if (debug_report_object_type_from_core_object_type_extension[mid].core_object_type == core_report_obj) {
+            return debug_report_object_type_from_core_object_type_extension[mid].debug_report_object_type;
+        } else if (debug_report_object_type_from_core_object_type_extension[mid].core_object_type < core_report_obj) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
     }
     return VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT;
 }
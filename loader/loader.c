@@ -72,8 +72,8 @@
 #include "loader_linux.h"
 #endif  // LOADER_ENABLE_LINUX_SORT
 
-// Generated file containing all the extension data
-#include "vk_loader_extensions.c"
+// Generated declarations of the extension trampolines and terminators
+#include "vk_loader_extensions_internal.h"
 
 struct loader_struct loader = {0};
 
@@ -1260,8 +1260,8 @@ VkResult loader_get_icd_loader_instance_extensions(const struct loader_instance
                 for (int32_t j = 0; j < (int32_t)icd_exts.count; j++) {
                     // See if the extension is in the list of supported extensions
                     bool found = false;
-                    for (uint32_t k = 0; LOADER_INSTANCE_EXTENSIONS[k] != NULL; k++) {
-                        if (strcmp(icd_exts.list[j].extensionName, LOADER_INSTANCE_EXTENSIONS[k]) == 0) {
+                    for (uint32_t k = 0; k < LOADER_INSTANCE_EXTENSION_COUNT; k++) {
+                        if (strcmp(icd_exts.list[j].extensionName, &loader_name_pool[LOADER_INSTANCE_EXTENSIONS[k]]) == 0) {
                             found = true;
                             break;
                         }
@@ -1403,29 +1403,30 @@ void loader_icd_close_objects(struct loader_instance *ptr_inst, struct loader_ic
     for (uint32_t i = 0; i < icd_term->surface_list.capacity / sizeof(VkSurfaceKHR); i++) {
         if (ptr_inst->surfaces_list.capacity > i * sizeof(struct loader_used_object_status) &&
             ptr_inst->surfaces_list.list[i].status == VK_TRUE && NULL != icd_term->surface_list.list &&
-            icd_term->surface_list.list[i] && NULL != icd_term->dispatch.DestroySurfaceKHR) {
-            icd_term->dispatch.DestroySurfaceKHR(icd_term->instance, icd_term->surface_list.list[i],
-                                                 ignore_null_callback(&(ptr_inst->surfaces_list.list[i].allocation_callbacks)));
+            icd_term->surface_list.list[i] && NULL != ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR)) {
+            ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR)
+            (icd_term->instance, icd_term->surface_list.list[i],
+             ignore_null_callback(&(ptr_inst->surfaces_list.list[i].allocation_callbacks)));
             icd_term->surface_list.list[i] = (VkSurfaceKHR)(uintptr_t)NULL;
         }
     }
     for (uint32_t i = 0; i < icd_term->debug_utils_messenger_list.capacity / sizeof(VkDebugUtilsMessengerEXT); i++) {
         if (ptr_inst->debug_utils_messengers_list.capacity > i * sizeof(struct loader_used_object_status) &&
             ptr_inst->debug_utils_messengers_list.list[i].status == VK_TRUE && NULL != icd_term->debug_utils_messenger_list.list &&
-            icd_term->debug_utils_messenger_list.list[i] && NULL != icd_term->dispatch.DestroyDebugUtilsMessengerEXT) {
-            icd_term->dispatch.DestroyDebugUtilsMessengerEXT(
-                icd_term->instance, icd_term->debug_utils_messenger_list.list[i],
-                ignore_null_callback(&(ptr_inst->debug_utils_messengers_list.list[i].allocation_callbacks)));
+            icd_term->debug_utils_messenger_list.list[i] && NULL != ICD_TERM_DISPATCH(icd_term, DestroyDebugUtilsMessengerEXT)) {
+            ICD_TERM_DISPATCH(icd_term, DestroyDebugUtilsMessengerEXT)
+            (icd_term->instance, icd_term->debug_utils_messenger_list.list[i],
+             ignore_null_callback(&(ptr_inst->debug_utils_messengers_list.list[i].allocation_callbacks)));
             icd_term->debug_utils_messenger_list.list[i] = (VkDebugUtilsMessengerEXT)(uintptr_t)NULL;
         }
     }
     for (uint32_t i = 0; i < icd_term->debug_report_callback_list.capacity / sizeof(VkDebugReportCallbackEXT); i++) {
         if (ptr_inst->debug_report_callbacks_list.capacity > i * sizeof(struct loader_used_object_status) &&
             ptr_inst->debug_report_callbacks_list.list[i].status == VK_TRUE && NULL != icd_term->debug_report_callback_list.list &&
-            icd_term->debug_report_callback_list.list[i] && NULL != icd_term->dispatch.DestroyDebugReportCallbackEXT) {
-            icd_term->dispatch.DestroyDebugReportCallbackEXT(
-                icd_term->instance, icd_term->debug_report_callback_list.list[i],
-                ignore_null_callback(&(ptr_inst->debug_report_callbacks_list.list[i].allocation_callbacks)));
+            icd_term->debug_report_callback_list.list[i] && NULL != ICD_TERM_DISPATCH(icd_term, DestroyDebugReportCallbackEXT)) {
+            ICD_TERM_DISPATCH(icd_term, DestroyDebugReportCallbackEXT)
+            (icd_term->instance, icd_term->debug_report_callback_list.list[i],
+             ignore_null_callback(&(ptr_inst->debug_report_callbacks_list.list[i].allocation_callbacks)));
             icd_term->debug_report_callback_list.list[i] = (VkDebugReportCallbackEXT)(uintptr_t)NULL;
         }
     }
@@ -2004,6 +2005,19 @@ void loader_initialize(void) {
 }
 
 void loader_release() {
+#if defined(LOADER_HAS_TRAMPOLINE_STATS)
+    // Write out the calls made through the trampolines by the whole process, when asked to
+    char *trampoline_stats_file_name = loader_getenv("VK_LOADER_TRAMPOLINE_STATS_FILE", NULL);
+    if (NULL != trampoline_stats_file_name) {
+        FILE *trampoline_stats_file = loader_fopen(trampoline_stats_file_name, "w");
+        if (NULL != trampoline_stats_file) {
+            loader_write_trampoline_stats(trampoline_stats_file);
+            fclose(trampoline_stats_file);
+        }
+    }
+    loader_free_getenv(trampoline_stats_file_name, NULL);
+#endif
+
     // Guarantee release of the preloaded ICD libraries. This may have already been called in vkDestroyInstance.
     loader_unload_preloaded_icds();
 
@@ -4270,7 +4284,7 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL loader_gpa_device_terminator(VkDevice d
         return NULL;
     }
 
-    return icd_term->dispatch.GetDeviceProcAddr(device, pName);
+    return ICD_TERM_DISPATCH(icd_term, GetDeviceProcAddr)(device, pName);
 }
 
 struct loader_instance *loader_get_instance(const VkInstance instance) {
@@ -4519,6 +4533,9 @@ VKAPI_ATTR VkResult VKAPI_CALL loader_layer_create_device(VkInstance instance, V
     loader_init_device_extension_dispatch_table(&dev->loader_dispatch, inst->disp->layer_inst_disp.GetInstanceProcAddr,
                                                 dev->loader_dispatch.core_dispatch.GetDeviceProcAddr, inst->instance, *pDevice);
 
+    // The dispatch table is complete, copy it into the hot dispatch table the trampolines call through
+    loader_init_hot_dispatch_table(&dev->loader_dispatch);
+
 out:
 
     // Failure cleanup
@@ -5171,8 +5188,19 @@ VkResult loader_create_device_chain(const VkPhysicalDevice pd, const VkDeviceCre
         return VK_ERROR_INITIALIZATION_FAILED;
     }
 
-    // Initialize device dispatch table
-    loader_init_device_dispatch_table(&dev->loader_dispatch, nextGDPA, dev->chain_device);
+    // Initialize device dispatch table, skipping the core commands newer than the application requested when VK_KHR_maintenance5
+    // is enabled, as vkGetDeviceProcAddr would return NULL for them anyway
+    uint32_t api_version = UINT32_MAX;
+    if (dev->should_ignore_device_commands_from_newer_version) {
+        api_version =
+            VK_MAKE_API_VERSION(0, inst->app_api_version.major, inst->app_api_version.minor, inst->app_api_version.patch);
+    }
+    uint32_t skipped_count = loader_init_device_dispatch_table(&dev->loader_dispatch, nextGDPA, dev->chain_device, api_version);
+    if (skipped_count > 0) {
+        loader_log(inst, VULKAN_LOADER_DEBUG_BIT, 0,
+                   "loader_create_device_chain: Skipped looking up %u core device commands newer than Vulkan %u.%u", skipped_count,
+                   VK_API_VERSION_MAJOR(api_version), VK_API_VERSION_MINOR(api_version));
+    }
     // Initialize the dispatch table to functions which need terminators
     // These functions point directly to the driver, not the terminator functions
     init_extension_device_proc_terminator_dispatch(dev);
@@ -5287,8 +5315,8 @@ VkResult loader_validate_instance_extensions(struct loader_instance *inst, const
         if (check_if_known) {
             // See if the extension is in the list of supported extensions
             bool found = false;
-            for (uint32_t j = 0; LOADER_INSTANCE_EXTENSIONS[j] != NULL; j++) {
-                if (strcmp(pCreateInfo->ppEnabledExtensionNames[i], LOADER_INSTANCE_EXTENSIONS[j]) == 0) {
+            for (uint32_t j = 0; j < LOADER_INSTANCE_EXTENSION_COUNT; j++) {
+                if (strcmp(pCreateInfo->ppEnabledExtensionNames[i], &loader_name_pool[LOADER_INSTANCE_EXTENSIONS[j]]) == 0) {
                     found = true;
                     break;
                 }
@@ -5638,21 +5666,21 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateInstance(const VkInstanceCreateI
         if (ptr_instance->icd_tramp_list.scanned_list[i].interface_version < 3 &&
             (
 #if defined(VK_USE_PLATFORM_XLIB_KHR)
-                NULL != icd_term->dispatch.CreateXlibSurfaceKHR ||
+                NULL != ICD_TERM_DISPATCH(icd_term, CreateXlibSurfaceKHR) ||
 #endif  // VK_USE_PLATFORM_XLIB_KHR
 #if defined(VK_USE_PLATFORM_XCB_KHR)
-                NULL != icd_term->dispatch.CreateXcbSurfaceKHR ||
+                NULL != ICD_TERM_DISPATCH(icd_term, CreateXcbSurfaceKHR) ||
 #endif  // VK_USE_PLATFORM_XCB_KHR
 #if defined(VK_USE_PLATFORM_WAYLAND_KHR)
-                NULL != icd_term->dispatch.CreateWaylandSurfaceKHR ||
+                NULL != ICD_TERM_DISPATCH(icd_term, CreateWaylandSurfaceKHR) ||
 #endif  // VK_USE_PLATFORM_WAYLAND_KHR
 #if defined(VK_USE_PLATFORM_ANDROID_KHR)
-                NULL != icd_term->dispatch.CreateAndroidSurfaceKHR ||
+                NULL != ICD_TERM_DISPATCH(icd_term, CreateAndroidSurfaceKHR) ||
 #endif  // VK_USE_PLATFORM_ANDROID_KHR
 #if defined(VK_USE_PLATFORM_WIN32_KHR)
-                NULL != icd_term->dispatch.CreateWin32SurfaceKHR ||
+                NULL != ICD_TERM_DISPATCH(icd_term, CreateWin32SurfaceKHR) ||
 #endif  // VK_USE_PLATFORM_WIN32_KHR
-                NULL != icd_term->dispatch.DestroySurfaceKHR)) {
+                NULL != ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR))) {
             loader_log(ptr_instance, VULKAN_LOADER_WARN_BIT, 0,
                        "terminator_CreateInstance: Driver %s supports interface version %u but still exposes VkSurfaceKHR"
                        " create/destroy entrypoints (Policy #LDP_DRIVER_8)",
@@ -5703,7 +5731,7 @@ out:
             ptr_instance->icd_terms = icd_term->next;
             if (NULL != icd_term->instance) {
                 loader_icd_close_objects(ptr_instance, icd_term);
-                icd_term->dispatch.DestroyInstance(icd_term->instance, pAllocator);
+                ICD_TERM_DISPATCH(icd_term, DestroyInstance)(icd_term->instance, pAllocator);
             }
             loader_icd_destroy(ptr_instance, icd_term, pAllocator);
         }
@@ -5751,7 +5779,7 @@ VKAPI_ATTR void VKAPI_CALL terminator_DestroyInstance(VkInstance instance, const
     while (NULL != icd_terms) {
         if (icd_terms->instance) {
             loader_icd_close_objects(ptr_instance, icd_terms);
-            icd_terms->dispatch.DestroyInstance(icd_terms->instance, pAllocator);
+            ICD_TERM_DISPATCH(icd_terms, DestroyInstance)(icd_terms->instance, pAllocator);
         }
         struct loader_icd_term *next_icd_term = icd_terms->next;
         icd_terms->instance = VK_NULL_HANDLE;
@@ -5795,7 +5823,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDevice(VkPhysicalDevice physical
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
     struct loader_device *dev = (struct loader_device *)*pDevice;
-    PFN_vkCreateDevice fpCreateDevice = icd_term->dispatch.CreateDevice;
+    PFN_vkCreateDevice fpCreateDevice = ICD_TERM_DISPATCH(icd_term, CreateDevice);
     struct loader_extension_list icd_exts;
 
     VkBaseOutStructure *caller_dgci_container = NULL;
@@ -5854,7 +5882,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDevice(VkPhysicalDevice physical
         goto out;
     }
 
-    res = loader_add_device_extensions(icd_term->this_instance, icd_term->dispatch.EnumerateDeviceExtensionProperties,
+    res = loader_add_device_extensions(icd_term->this_instance, ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties),
                                        phys_dev_term->phys_dev, icd_term->scanned_icd->lib_name, &icd_exts);
     if (res != VK_SUCCESS) {
         goto out;
@@ -5924,7 +5952,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDevice(VkPhysicalDevice physical
     // are not recognized by the ICD. If this causes the ICD to fail, then the items would have to be removed here. The current
     // implementation does not remove them because copying the pNext chain would be impossible if the loader does not recognize
     // the any of the struct types, as the loader would not know the size to allocate and copy.
-    // if (icd_term->dispatch.GetPhysicalDeviceFeatures2 == NULL && icd_term->dispatch.GetPhysicalDeviceFeatures2KHR == NULL) {
+    // if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures2) == NULL && ICD_TERM_DISPATCH(icd_term,
+    // GetPhysicalDeviceFeatures2KHR) == NULL) {
     {
         const void *pNext = localCreateInfo.pNext;
         while (pNext != NULL) {
@@ -5934,8 +5963,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDevice(VkPhysicalDevice physical
                 case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2: {
                     const VkPhysicalDeviceFeatures2KHR *features = pNext;
 
-                    if (icd_term->dispatch.GetPhysicalDeviceFeatures2 == NULL &&
-                        icd_term->dispatch.GetPhysicalDeviceFeatures2KHR == NULL) {
+                    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures2) == NULL &&
+                        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures2KHR) == NULL) {
                         loader_log(icd_term->this_instance, VULKAN_LOADER_INFO_BIT, 0,
                                    "vkCreateDevice: Emulating handling of VkPhysicalDeviceFeatures2 in pNext chain for ICD \"%s\"",
                                    icd_term->scanned_icd->lib_name);
@@ -5955,8 +5984,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDevice(VkPhysicalDevice physical
                 case VK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO: {
                     const VkDeviceGroupDeviceCreateInfo *group_info = pNext;
 
-                    if (icd_term->dispatch.EnumeratePhysicalDeviceGroups == NULL &&
-                        icd_term->dispatch.EnumeratePhysicalDeviceGroupsKHR == NULL) {
+                    if (ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDeviceGroups) == NULL &&
+                        ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDeviceGroupsKHR) == NULL) {
                         loader_log(icd_term->this_instance, VULKAN_LOADER_INFO_BIT, 0,
                                    "vkCreateDevice: Emulating handling of VkPhysicalDeviceGroupProperties in pNext chain for "
                                    "ICD \"%s\"",
@@ -6038,7 +6067,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDevice(VkPhysicalDevice physical
     dev->driver_extensions.ext_debug_utils_enabled = icd_term->this_instance->enabled_known_extensions.ext_debug_utils;
 
     VkPhysicalDeviceProperties properties;
-    icd_term->dispatch.GetPhysicalDeviceProperties(phys_dev_term->phys_dev, &properties);
+    ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)(phys_dev_term->phys_dev, &properties);
     if (properties.apiVersion >= VK_API_VERSION_1_1) {
         dev->driver_extensions.version_1_1_enabled = true;
     }
@@ -6377,7 +6406,8 @@ VkResult setup_loader_term_phys_devs(struct loader_instance *inst) {
     icd_term = inst->icd_terms;
     uint32_t icd_idx = 0;
     while (NULL != icd_term) {
-        res = icd_term->dispatch.EnumeratePhysicalDevices(icd_term->instance, &icd_phys_dev_array[icd_idx].device_count, NULL);
+        res = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDevices)(icd_term->instance, &icd_phys_dev_array[icd_idx].device_count,
+                                                                    NULL);
         if (VK_ERROR_OUT_OF_HOST_MEMORY == res) {
             loader_log(inst, VULKAN_LOADER_ERROR_BIT, 0,
                        "setup_loader_term_phys_devs: Call to \'vkEnumeratePhysicalDevices\' in ICD %s failed with error code "
@@ -6396,8 +6426,8 @@ VkResult setup_loader_term_phys_devs(struct loader_instance *inst) {
                 goto out;
             }
 
-            res = icd_term->dispatch.EnumeratePhysicalDevices(icd_term->instance, &(icd_phys_dev_array[icd_idx].device_count),
-                                                              icd_phys_dev_array[icd_idx].physical_devices);
+            res = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDevices)(
+                icd_term->instance, &(icd_phys_dev_array[icd_idx].device_count), icd_phys_dev_array[icd_idx].physical_devices);
             if (VK_ERROR_OUT_OF_HOST_MEMORY == res) {
                 loader_log(inst, VULKAN_LOADER_ERROR_BIT, 0,
                            "setup_loader_term_phys_devs: Call to \'vkEnumeratePhysicalDevices\' in ICD %s failed with error code "
@@ -6614,7 +6644,7 @@ void unload_drivers_without_physical_devices(struct loader_instance *inst) {
                 const VkAllocationCallbacks *allocation_callbacks = ignore_null_callback(&(inst->alloc_callbacks));
                 if (cur_icd_term->instance) {
                     loader_icd_close_objects(inst, cur_icd_term);
-                    cur_icd_term->dispatch.DestroyInstance(cur_icd_term->instance, allocation_callbacks);
+                    ICD_TERM_DISPATCH(cur_icd_term, DestroyInstance)(cur_icd_term->instance, allocation_callbacks);
                 }
                 cur_icd_term->instance = VK_NULL_HANDLE;
                 loader_icd_destroy(inst, cur_icd_term, allocation_callbacks);
@@ -6798,8 +6828,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_EnumerateDeviceExtensionProperties(VkP
     else if (pProperties) {
         struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
         uint32_t written_count = *pPropertyCount;
-        VkResult res =
-            icd_term->dispatch.EnumerateDeviceExtensionProperties(phys_dev_term->phys_dev, NULL, &written_count, pProperties);
+        VkResult res = ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)(phys_dev_term->phys_dev, NULL,
+                                                                                       &written_count, pProperties);
         if (res != VK_SUCCESS) {
             return res;
         }
@@ -6839,7 +6869,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_EnumerateDeviceExtensionProperties(VkP
     VkResult res;
 
     // We need to find the count without duplicates. This requires querying the driver for the names of the extensions.
-    res = icd_term->dispatch.EnumerateDeviceExtensionProperties(phys_dev_term->phys_dev, NULL, &all_exts.count, NULL);
+    res = ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)(phys_dev_term->phys_dev, NULL, &all_exts.count, NULL);
     if (res != VK_SUCCESS) {
         goto out;
     }
@@ -6853,7 +6883,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_EnumerateDeviceExtensionProperties(VkP
     }
 
     // Get the available device extensions and put them in all_exts.list
-    res = icd_term->dispatch.EnumerateDeviceExtensionProperties(phys_dev_term->phys_dev, NULL, &all_exts.count, all_exts.list);
+    res = ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)(phys_dev_term->phys_dev, NULL, &all_exts.count,
+                                                                          all_exts.list);
     if (res != VK_SUCCESS) {
         goto out;
     }
@@ -7124,14 +7155,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_EnumeratePhysicalDeviceGroups(
 
         // Get the function pointer to use to call into the ICD. This could be the core or KHR version
         if (inst->enabled_known_extensions.khr_device_group_creation) {
-            fpEnumeratePhysicalDeviceGroups = icd_term->dispatch.EnumeratePhysicalDeviceGroupsKHR;
+            fpEnumeratePhysicalDeviceGroups = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDeviceGroupsKHR);
         } else {
-            fpEnumeratePhysicalDeviceGroups = icd_term->dispatch.EnumeratePhysicalDeviceGroups;
+            fpEnumeratePhysicalDeviceGroups = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDeviceGroups);
         }
 
         if (NULL == fpEnumeratePhysicalDeviceGroups) {
             // Treat each ICD's GPU as it's own group if the extension isn't supported
-            res = icd_term->dispatch.EnumeratePhysicalDevices(icd_term->instance, &cur_icd_group_count, NULL);
+            res = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDevices)(icd_term->instance, &cur_icd_group_count, NULL);
             if (res != VK_SUCCESS) {
                 loader_log(inst, VULKAN_LOADER_ERROR_BIT, 0,
                            "terminator_EnumeratePhysicalDeviceGroups:  Failed during dispatch call of \'EnumeratePhysicalDevices\' "
@@ -7196,13 +7227,13 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_EnumeratePhysicalDeviceGroups(
 
             // Get the function pointer to use to call into the ICD. This could be the core or KHR version
             if (inst->enabled_known_extensions.khr_device_group_creation) {
-                fpEnumeratePhysicalDeviceGroups = icd_term->dispatch.EnumeratePhysicalDeviceGroupsKHR;
+                fpEnumeratePhysicalDeviceGroups = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDeviceGroupsKHR);
             } else {
-                fpEnumeratePhysicalDeviceGroups = icd_term->dispatch.EnumeratePhysicalDeviceGroups;
+                fpEnumeratePhysicalDeviceGroups = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDeviceGroups);
             }
 
             if (NULL == fpEnumeratePhysicalDeviceGroups) {
-                icd_term->dispatch.EnumeratePhysicalDevices(icd_term->instance, &count_this_time, NULL);
+                ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDevices)(icd_term->instance, &count_this_time, NULL);
 
                 VkPhysicalDevice *phys_dev_array = loader_stack_alloc(sizeof(VkPhysicalDevice) * count_this_time);
                 if (NULL == phys_dev_array) {
@@ -7214,7 +7245,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_EnumeratePhysicalDeviceGroups(
                     goto out;
                 }
 
-                res = icd_term->dispatch.EnumeratePhysicalDevices(icd_term->instance, &count_this_time, phys_dev_array);
+                res = ICD_TERM_DISPATCH(icd_term, EnumeratePhysicalDevices)(icd_term->instance, &count_this_time, phys_dev_array);
                 if (res != VK_SUCCESS) {
                     loader_log(inst, VULKAN_LOADER_ERROR_BIT, 0,
                                "terminator_EnumeratePhysicalDeviceGroups:  Failed during dispatch call of "
@@ -60,6 +60,15 @@ static inline struct loader_dev_dispatch_table *loader_get_dev_dispatch(const vo
     return *((struct loader_dev_dispatch_table **)obj);
 }
 
+// Get the hot dispatch table of a dispatchable device object, or NULL if the object does not have a valid device dispatch table
+static inline const struct loader_hot_dispatch_table *loader_get_hot_dispatch(const void *obj) {
+    const VkLayerDispatchTable *disp = loader_get_dispatch(obj);
+    if (NULL == disp) {
+        return NULL;
+    }
+    return &((const struct loader_dev_dispatch_table *)disp)->hot_dispatch;
+}
+
 static inline VkLayerInstanceDispatchTable *loader_get_instance_layer_dispatch(const void *obj) {
     return *((VkLayerInstanceDispatchTable **)obj);
 }
@@ -41,6 +41,13 @@
 
 #include "settings.h"
 
+// vk_loader_extensions.h defines LOADER_HAS_TRAMPOLINE_STATS, along with the macros which count the calls made through each
+// trampoline, when the loader sources are generated with --trampoline-stats and built with LOADER_TRAMPOLINE_STATS
+#if !defined(LOADER_HAS_TRAMPOLINE_STATS)
+#define LOADER_TRAMPOLINE_STATS_BEGIN(command)
+#define LOADER_TRAMPOLINE_STATS_END(command)
+#endif
+
 typedef enum VkStringErrorFlagBits {
     VK_STRING_ERROR_NONE = 0x00000000,
     VK_STRING_ERROR_LENGTH = 0x00000001,
@@ -223,6 +230,8 @@ struct loader_dev_dispatch_table {
     VkLayerDispatchTable core_dispatch;
     PFN_vkDevExt ext_dispatch[MAX_NUM_UNKNOWN_EXTS];
     struct loader_device_terminator_dispatch extension_terminator_dispatch;
+    // Copy of core_dispatch ordered by call frequency, used by the trampolines
+    struct loader_hot_dispatch_table hot_dispatch;
 };
 
 // per CreateDevice structure
@@ -260,7 +260,7 @@ VkResult linux_read_sorted_physical_devices(struct loader_instance *inst, uint32
             sorted_device_info[index].icd_term = icd_term;
             sorted_device_info[index].has_pci_bus_info = false;
 
-            icd_term->dispatch.GetPhysicalDeviceProperties(sorted_device_info[index].physical_device, &dev_props);
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)(sorted_device_info[index].physical_device, &dev_props);
             sorted_device_info[index].device_type = dev_props.deviceType;
             strncpy(sorted_device_info[index].device_name, dev_props.deviceName, VK_MAX_PHYSICAL_DEVICE_NAME_SIZE);
             sorted_device_info[index].vendor_id = dev_props.vendorID;
@@ -270,8 +270,8 @@ VkResult linux_read_sorted_physical_devices(struct loader_instance *inst, uint32
                 loader_check_version_meets_required(LOADER_VERSION_1_1_0, loader_make_version(dev_props.apiVersion));
             if (!sorted_device_info[index].has_pci_bus_info) {
                 uint32_t ext_count = 0;
-                icd_term->dispatch.EnumerateDeviceExtensionProperties(sorted_device_info[index].physical_device, NULL, &ext_count,
-                                                                      NULL);
+                ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)
+                (sorted_device_info[index].physical_device, NULL, &ext_count, NULL);
                 if (ext_count > 0) {
                     VkExtensionProperties *ext_props =
                         (VkExtensionProperties *)loader_stack_alloc(sizeof(VkExtensionProperties) * ext_count);
@@ -279,8 +279,8 @@ VkResult linux_read_sorted_physical_devices(struct loader_instance *inst, uint32
                         res = VK_ERROR_OUT_OF_HOST_MEMORY;
                         goto out;
                     }
-                    icd_term->dispatch.EnumerateDeviceExtensionProperties(sorted_device_info[index].physical_device, NULL,
-                                                                          &ext_count, ext_props);
+                    ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)
+                    (sorted_device_info[index].physical_device, NULL, &ext_count, ext_props);
                     for (uint32_t ext = 0; ext < ext_count; ++ext) {
                         if (!strcmp(ext_props[ext].extensionName, VK_EXT_PCI_BUS_INFO_EXTENSION_NAME)) {
                             sorted_device_info[index].has_pci_bus_info = true;
@@ -298,9 +298,10 @@ VkResult linux_read_sorted_physical_devices(struct loader_instance *inst, uint32
 
                 PFN_vkGetPhysicalDeviceProperties2 GetPhysDevProps2 = NULL;
                 if (app_is_vulkan_1_1 && device_is_1_1_capable) {
-                    GetPhysDevProps2 = icd_term->dispatch.GetPhysicalDeviceProperties2;
+                    GetPhysDevProps2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties2);
                 } else {
-                    GetPhysDevProps2 = (PFN_vkGetPhysicalDeviceProperties2)icd_term->dispatch.GetPhysicalDeviceProperties2KHR;
+                    GetPhysDevProps2 =
+                        (PFN_vkGetPhysicalDeviceProperties2)ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties2KHR);
                 }
                 if (NULL != GetPhysDevProps2) {
                     GetPhysDevProps2(sorted_device_info[index].physical_device, &dev_props2);
@@ -361,8 +362,8 @@ VkResult linux_sort_physical_device_groups(struct loader_instance *inst, uint32_
                 sorted_group_term[group].group_props.physicalDevices[gpu];
             sorted_group_term[group].internal_device_info[gpu].has_pci_bus_info = false;
 
-            icd_term->dispatch.GetPhysicalDeviceProperties(sorted_group_term[group].internal_device_info[gpu].physical_device,
-                                                           &dev_props);
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)
+            (sorted_group_term[group].internal_device_info[gpu].physical_device, &dev_props);
             sorted_group_term[group].internal_device_info[gpu].device_type = dev_props.deviceType;
             strncpy(sorted_group_term[group].internal_device_info[gpu].device_name, dev_props.deviceName,
                     VK_MAX_PHYSICAL_DEVICE_NAME_SIZE);
@@ -373,16 +374,16 @@ VkResult linux_sort_physical_device_groups(struct loader_instance *inst, uint32_
                 loader_check_version_meets_required(LOADER_VERSION_1_1_0, loader_make_version(dev_props.apiVersion));
             if (!sorted_group_term[group].internal_device_info[gpu].has_pci_bus_info) {
                 uint32_t ext_count;
-                icd_term->dispatch.EnumerateDeviceExtensionProperties(
-                    sorted_group_term[group].internal_device_info[gpu].physical_device, NULL, &ext_count, NULL);
+                ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)
+                (sorted_group_term[group].internal_device_info[gpu].physical_device, NULL, &ext_count, NULL);
                 if (ext_count > 0) {
                     VkExtensionProperties *ext_props =
                         (VkExtensionProperties *)loader_stack_alloc(sizeof(VkExtensionProperties) * ext_count);
                     if (NULL == ext_props) {
                         return VK_ERROR_OUT_OF_HOST_MEMORY;
                     }
-                    icd_term->dispatch.EnumerateDeviceExtensionProperties(
-                        sorted_group_term[group].internal_device_info[gpu].physical_device, NULL, &ext_count, ext_props);
+                    ICD_TERM_DISPATCH(icd_term, EnumerateDeviceExtensionProperties)
+                    (sorted_group_term[group].internal_device_info[gpu].physical_device, NULL, &ext_count, ext_props);
                     for (uint32_t ext = 0; ext < ext_count; ++ext) {
                         if (!strcmp(ext_props[ext].extensionName, VK_EXT_PCI_BUS_INFO_EXTENSION_NAME)) {
                             sorted_group_term[group].internal_device_info[gpu].has_pci_bus_info = true;
@@ -400,9 +401,10 @@ VkResult linux_sort_physical_device_groups(struct loader_instance *inst, uint32_
 
                 PFN_vkGetPhysicalDeviceProperties2 GetPhysDevProps2 = NULL;
                 if (app_is_vulkan_1_1 && device_is_1_1_capable) {
-                    GetPhysDevProps2 = icd_term->dispatch.GetPhysicalDeviceProperties2;
+                    GetPhysDevProps2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties2);
                 } else {
-                    GetPhysDevProps2 = (PFN_vkGetPhysicalDeviceProperties2)icd_term->dispatch.GetPhysicalDeviceProperties2KHR;
+                    GetPhysDevProps2 =
+                        (PFN_vkGetPhysicalDeviceProperties2)ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties2KHR);
                 }
                 if (NULL != GetPhysDevProps2) {
                     GetPhysDevProps2(sorted_group_term[group].internal_device_info[gpu].physical_device, &dev_props2);
@@ -898,18 +898,18 @@ void sort_physical_devices_with_same_luid(struct loader_instance *inst, uint32_t
             // whether it is layered
             for (uint32_t k = 0; k < icd_phys_devs_array[i].device_count; k++) {
                 VkPhysicalDeviceProperties dev_props = {0};
-                icd_phys_devs_array[i].icd_term->dispatch.GetPhysicalDeviceProperties(icd_phys_devs_array[i].physical_devices[k],
-                                                                                      &dev_props);
+                ICD_TERM_DISPATCH(icd_phys_devs_array[i].icd_term, GetPhysicalDeviceProperties)
+                (icd_phys_devs_array[i].physical_devices[k], &dev_props);
 
                 bool device_is_1_1_capable =
                     loader_check_version_meets_required(LOADER_VERSION_1_1_0, loader_make_version(dev_props.apiVersion));
 
                 PFN_vkGetPhysicalDeviceProperties2 GetPhysDevProps2 = NULL;
                 if (app_is_vulkan_1_1 && device_is_1_1_capable) {
-                    GetPhysDevProps2 = icd_phys_devs_array[i].icd_term->dispatch.GetPhysicalDeviceProperties2;
+                    GetPhysDevProps2 = ICD_TERM_DISPATCH(icd_phys_devs_array[i].icd_term, GetPhysicalDeviceProperties2);
                 } else {
-                    GetPhysDevProps2 = (PFN_vkGetPhysicalDeviceProperties2)icd_phys_devs_array[i]
-                                           .icd_term->dispatch.GetPhysicalDeviceProperties2KHR;
+                    GetPhysDevProps2 = (PFN_vkGetPhysicalDeviceProperties2)ICD_TERM_DISPATCH(icd_phys_devs_array[i].icd_term,
+                                                                                             GetPhysicalDeviceProperties2KHR);
                 }
                 if (GetPhysDevProps2) {
                     GetPhysDevProps2(icd_phys_devs_array[i].physical_devices[k], &props2);
@@ -42,8 +42,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceProperties(VkPhysicalDevi
                                                                   VkPhysicalDeviceProperties *pProperties) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceProperties) {
-        icd_term->dispatch.GetPhysicalDeviceProperties(phys_dev_term->phys_dev, pProperties);
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)) {
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)(phys_dev_term->phys_dev, pProperties);
     }
 }
 
@@ -52,8 +52,9 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceQueueFamilyProperties(VkP
                                                                              VkQueueFamilyProperties *pProperties) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceQueueFamilyProperties) {
-        icd_term->dispatch.GetPhysicalDeviceQueueFamilyProperties(phys_dev_term->phys_dev, pQueueFamilyPropertyCount, pProperties);
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceQueueFamilyProperties)) {
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceQueueFamilyProperties)
+        (phys_dev_term->phys_dev, pQueueFamilyPropertyCount, pProperties);
     }
 }
 
@@ -61,8 +62,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceMemoryProperties(VkPhysic
                                                                         VkPhysicalDeviceMemoryProperties *pProperties) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceMemoryProperties) {
-        icd_term->dispatch.GetPhysicalDeviceMemoryProperties(phys_dev_term->phys_dev, pProperties);
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceMemoryProperties)) {
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceMemoryProperties)(phys_dev_term->phys_dev, pProperties);
     }
 }
 
@@ -70,8 +71,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceFeatures(VkPhysicalDevice
                                                                 VkPhysicalDeviceFeatures *pFeatures) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceFeatures) {
-        icd_term->dispatch.GetPhysicalDeviceFeatures(phys_dev_term->phys_dev, pFeatures);
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures)) {
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures)(phys_dev_term->phys_dev, pFeatures);
     }
 }
 
@@ -79,8 +80,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceFormatProperties(VkPhysic
                                                                         VkFormatProperties *pFormatInfo) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceFormatProperties) {
-        icd_term->dispatch.GetPhysicalDeviceFormatProperties(phys_dev_term->phys_dev, format, pFormatInfo);
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFormatProperties)) {
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFormatProperties)(phys_dev_term->phys_dev, format, pFormatInfo);
     }
 }
 
@@ -90,14 +91,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceImageFormatProperties
                                                                                  VkImageFormatProperties *pImageFormatProperties) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceImageFormatProperties) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties)) {
         loader_log(
             icd_term->this_instance, VULKAN_LOADER_ERROR_BIT, 0,
             "The icd's vkGetPhysicalDeviceImageFormatProperties was null, returning with VK_ERROR_INITIALIZATION_FAILED instead.");
         return VK_ERROR_INITIALIZATION_FAILED;
     }
-    return icd_term->dispatch.GetPhysicalDeviceImageFormatProperties(phys_dev_term->phys_dev, format, type, tiling, usage, flags,
-                                                                     pImageFormatProperties);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties)(phys_dev_term->phys_dev, format, type, tiling, usage,
+                                                                               flags, pImageFormatProperties);
 }
 
 VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceSparseImageFormatProperties(VkPhysicalDevice physicalDevice, VkFormat format,
@@ -107,9 +108,9 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceSparseImageFormatProperti
                                                                                    VkSparseImageFormatProperties *pProperties) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL != icd_term->dispatch.GetPhysicalDeviceSparseImageFormatProperties) {
-        icd_term->dispatch.GetPhysicalDeviceSparseImageFormatProperties(phys_dev_term->phys_dev, format, type, samples, usage,
-                                                                        tiling, pNumProperties, pProperties);
+    if (NULL != ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSparseImageFormatProperties)) {
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSparseImageFormatProperties)
+        (phys_dev_term->phys_dev, format, type, samples, usage, tiling, pNumProperties, pProperties);
     }
 }
 
@@ -138,10 +139,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceFeatures2(VkPhysicalDevic
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceFeatures2 fpGetPhysicalDeviceFeatures2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceFeatures2 = icd_term->dispatch.GetPhysicalDeviceFeatures2;
+        fpGetPhysicalDeviceFeatures2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures2);
     }
     if (fpGetPhysicalDeviceFeatures2 == NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceFeatures2 = icd_term->dispatch.GetPhysicalDeviceFeatures2KHR;
+        fpGetPhysicalDeviceFeatures2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures2KHR);
     }
 
     if (fpGetPhysicalDeviceFeatures2 != NULL) {
@@ -154,7 +155,7 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceFeatures2(VkPhysicalDevic
                    icd_term->scanned_icd->lib_name);
 
         // Write to the VkPhysicalDeviceFeatures2 struct
-        icd_term->dispatch.GetPhysicalDeviceFeatures(phys_dev_term->phys_dev, &pFeatures->features);
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFeatures)(phys_dev_term->phys_dev, &pFeatures->features);
 
         void *pNext = pFeatures->pNext;
         while (pNext != NULL) {
@@ -196,10 +197,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceProperties2(VkPhysicalDev
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceProperties2 fpGetPhysicalDeviceProperties2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceProperties2 = icd_term->dispatch.GetPhysicalDeviceProperties2;
+        fpGetPhysicalDeviceProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties2);
     }
     if (fpGetPhysicalDeviceProperties2 == NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceProperties2 = icd_term->dispatch.GetPhysicalDeviceProperties2KHR;
+        fpGetPhysicalDeviceProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties2KHR);
     }
 
     if (fpGetPhysicalDeviceProperties2 != NULL) {
@@ -212,7 +213,7 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceProperties2(VkPhysicalDev
                    icd_term->scanned_icd->lib_name);
 
         // Write to the VkPhysicalDeviceProperties2 struct
-        icd_term->dispatch.GetPhysicalDeviceProperties(phys_dev_term->phys_dev, &pProperties->properties);
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)(phys_dev_term->phys_dev, &pProperties->properties);
 
         void *pNext = pProperties->pNext;
         while (pNext != NULL) {
@@ -261,10 +262,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceFormatProperties2(VkPhysi
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceFormatProperties2 fpGetPhysicalDeviceFormatProperties2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceFormatProperties2 = icd_term->dispatch.GetPhysicalDeviceFormatProperties2;
+        fpGetPhysicalDeviceFormatProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFormatProperties2);
     }
     if (fpGetPhysicalDeviceFormatProperties2 == NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceFormatProperties2 = icd_term->dispatch.GetPhysicalDeviceFormatProperties2KHR;
+        fpGetPhysicalDeviceFormatProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFormatProperties2KHR);
     }
 
     if (fpGetPhysicalDeviceFormatProperties2 != NULL) {
@@ -277,7 +278,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceFormatProperties2(VkPhysi
                    icd_term->scanned_icd->lib_name);
 
         // Write to the VkFormatProperties2 struct
-        icd_term->dispatch.GetPhysicalDeviceFormatProperties(phys_dev_term->phys_dev, format, &pFormatProperties->formatProperties);
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceFormatProperties)
+        (phys_dev_term->phys_dev, format, &pFormatProperties->formatProperties);
 
         if (pFormatProperties->pNext != NULL) {
             loader_log(icd_term->this_instance, VULKAN_LOADER_WARN_BIT, 0,
@@ -299,10 +301,10 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceImageFormatProperties
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceImageFormatProperties2 fpGetPhysicalDeviceImageFormatProperties2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceImageFormatProperties2 = icd_term->dispatch.GetPhysicalDeviceImageFormatProperties2;
+        fpGetPhysicalDeviceImageFormatProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties2);
     }
     if (fpGetPhysicalDeviceImageFormatProperties2 == NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceImageFormatProperties2 = icd_term->dispatch.GetPhysicalDeviceImageFormatProperties2KHR;
+        fpGetPhysicalDeviceImageFormatProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties2KHR);
     }
 
     if (fpGetPhysicalDeviceImageFormatProperties2 != NULL) {
@@ -321,7 +323,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceImageFormatProperties
         }
 
         // Write to the VkImageFormatProperties2KHR struct
-        return icd_term->dispatch.GetPhysicalDeviceImageFormatProperties(
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceImageFormatProperties)(
             phys_dev_term->phys_dev, pImageFormatInfo->format, pImageFormatInfo->type, pImageFormatInfo->tiling,
             pImageFormatInfo->usage, pImageFormatInfo->flags, &pImageFormatProperties->imageFormatProperties);
     }
@@ -339,10 +341,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceQueueFamilyProperties2(Vk
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceQueueFamilyProperties2 fpGetPhysicalDeviceQueueFamilyProperties2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceQueueFamilyProperties2 = icd_term->dispatch.GetPhysicalDeviceQueueFamilyProperties2;
+        fpGetPhysicalDeviceQueueFamilyProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceQueueFamilyProperties2);
     }
     if (fpGetPhysicalDeviceQueueFamilyProperties2 == NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceQueueFamilyProperties2 = icd_term->dispatch.GetPhysicalDeviceQueueFamilyProperties2KHR;
+        fpGetPhysicalDeviceQueueFamilyProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceQueueFamilyProperties2KHR);
     }
 
     if (fpGetPhysicalDeviceQueueFamilyProperties2 != NULL) {
@@ -357,7 +359,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceQueueFamilyProperties2(Vk
 
         if (pQueueFamilyProperties == NULL || *pQueueFamilyPropertyCount == 0) {
             // Write to pQueueFamilyPropertyCount
-            icd_term->dispatch.GetPhysicalDeviceQueueFamilyProperties(phys_dev_term->phys_dev, pQueueFamilyPropertyCount, NULL);
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceQueueFamilyProperties)
+            (phys_dev_term->phys_dev, pQueueFamilyPropertyCount, NULL);
         } else {
             // Allocate a temporary array for the output of the old function
             VkQueueFamilyProperties *properties = loader_stack_alloc(*pQueueFamilyPropertyCount * sizeof(VkQueueFamilyProperties));
@@ -369,8 +372,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceQueueFamilyProperties2(Vk
                 return;
             }
 
-            icd_term->dispatch.GetPhysicalDeviceQueueFamilyProperties(phys_dev_term->phys_dev, pQueueFamilyPropertyCount,
-                                                                      properties);
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceQueueFamilyProperties)
+            (phys_dev_term->phys_dev, pQueueFamilyPropertyCount, properties);
             for (uint32_t i = 0; i < *pQueueFamilyPropertyCount; ++i) {
                 // Write to the VkQueueFamilyProperties2KHR struct
                 memcpy(&pQueueFamilyProperties[i].queueFamilyProperties, &properties[i], sizeof(VkQueueFamilyProperties));
@@ -397,10 +400,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceMemoryProperties2(VkPhysi
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceMemoryProperties2 fpGetPhysicalDeviceMemoryProperties2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceMemoryProperties2 = icd_term->dispatch.GetPhysicalDeviceMemoryProperties2;
+        fpGetPhysicalDeviceMemoryProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceMemoryProperties2);
     }
     if (fpGetPhysicalDeviceMemoryProperties2 == NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceMemoryProperties2 = icd_term->dispatch.GetPhysicalDeviceMemoryProperties2KHR;
+        fpGetPhysicalDeviceMemoryProperties2 = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceMemoryProperties2KHR);
     }
 
     if (fpGetPhysicalDeviceMemoryProperties2 != NULL) {
@@ -413,7 +416,8 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceMemoryProperties2(VkPhysi
                    icd_term->scanned_icd->lib_name);
 
         // Write to the VkPhysicalDeviceMemoryProperties2 struct
-        icd_term->dispatch.GetPhysicalDeviceMemoryProperties(phys_dev_term->phys_dev, &pMemoryProperties->memoryProperties);
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceMemoryProperties)
+        (phys_dev_term->phys_dev, &pMemoryProperties->memoryProperties);
 
         if (pMemoryProperties->pNext != NULL) {
             loader_log(icd_term->this_instance, VULKAN_LOADER_WARN_BIT, 0,
@@ -435,11 +439,13 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceSparseImageFormatProperti
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceSparseImageFormatProperties2 fpGetPhysicalDeviceSparseImageFormatProperties2 = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceSparseImageFormatProperties2 = icd_term->dispatch.GetPhysicalDeviceSparseImageFormatProperties2;
+        fpGetPhysicalDeviceSparseImageFormatProperties2 =
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSparseImageFormatProperties2);
     }
     if (fpGetPhysicalDeviceSparseImageFormatProperties2 == NULL &&
         inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        fpGetPhysicalDeviceSparseImageFormatProperties2 = icd_term->dispatch.GetPhysicalDeviceSparseImageFormatProperties2KHR;
+        fpGetPhysicalDeviceSparseImageFormatProperties2 =
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSparseImageFormatProperties2KHR);
     }
 
     if (fpGetPhysicalDeviceSparseImageFormatProperties2 != NULL) {
@@ -460,9 +466,9 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceSparseImageFormatProperti
 
         if (pProperties == NULL || *pPropertyCount == 0) {
             // Write to pPropertyCount
-            icd_term->dispatch.GetPhysicalDeviceSparseImageFormatProperties(
-                phys_dev_term->phys_dev, pFormatInfo->format, pFormatInfo->type, pFormatInfo->samples, pFormatInfo->usage,
-                pFormatInfo->tiling, pPropertyCount, NULL);
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSparseImageFormatProperties)
+            (phys_dev_term->phys_dev, pFormatInfo->format, pFormatInfo->type, pFormatInfo->samples, pFormatInfo->usage,
+             pFormatInfo->tiling, pPropertyCount, NULL);
         } else {
             // Allocate a temporary array for the output of the old function
             VkSparseImageFormatProperties *properties =
@@ -475,9 +481,9 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceSparseImageFormatProperti
                 return;
             }
 
-            icd_term->dispatch.GetPhysicalDeviceSparseImageFormatProperties(
-                phys_dev_term->phys_dev, pFormatInfo->format, pFormatInfo->type, pFormatInfo->samples, pFormatInfo->usage,
-                pFormatInfo->tiling, pPropertyCount, properties);
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSparseImageFormatProperties)
+            (phys_dev_term->phys_dev, pFormatInfo->format, pFormatInfo->type, pFormatInfo->samples, pFormatInfo->usage,
+             pFormatInfo->tiling, pPropertyCount, properties);
             for (uint32_t i = 0; i < *pPropertyCount; ++i) {
                 // Write to the VkSparseImageFormatProperties2KHR struct
                 memcpy(&pProperties[i].properties, &properties[i], sizeof(VkSparseImageFormatProperties));
@@ -505,10 +511,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceExternalBufferProperties(
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceExternalBufferProperties fpGetPhysicalDeviceExternalBufferProperties = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceExternalBufferProperties = icd_term->dispatch.GetPhysicalDeviceExternalBufferProperties;
+        fpGetPhysicalDeviceExternalBufferProperties = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalBufferProperties);
     }
     if (fpGetPhysicalDeviceExternalBufferProperties == NULL && inst->enabled_known_extensions.khr_external_memory_capabilities) {
-        fpGetPhysicalDeviceExternalBufferProperties = icd_term->dispatch.GetPhysicalDeviceExternalBufferPropertiesKHR;
+        fpGetPhysicalDeviceExternalBufferProperties = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalBufferPropertiesKHR);
     }
 
     if (fpGetPhysicalDeviceExternalBufferProperties != NULL) {
@@ -548,11 +554,12 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceExternalSemaphoreProperti
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceExternalSemaphoreProperties fpGetPhysicalDeviceExternalSemaphoreProperties = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceExternalSemaphoreProperties = icd_term->dispatch.GetPhysicalDeviceExternalSemaphoreProperties;
+        fpGetPhysicalDeviceExternalSemaphoreProperties = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalSemaphoreProperties);
     }
     if (fpGetPhysicalDeviceExternalSemaphoreProperties == NULL &&
         inst->enabled_known_extensions.khr_external_semaphore_capabilities) {
-        fpGetPhysicalDeviceExternalSemaphoreProperties = icd_term->dispatch.GetPhysicalDeviceExternalSemaphorePropertiesKHR;
+        fpGetPhysicalDeviceExternalSemaphoreProperties =
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalSemaphorePropertiesKHR);
     }
 
     if (fpGetPhysicalDeviceExternalSemaphoreProperties != NULL) {
@@ -595,10 +602,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_GetPhysicalDeviceExternalFenceProperties(
     // Get the function pointer to use to call into the ICD. This could be the core or KHR version
     PFN_vkGetPhysicalDeviceExternalFenceProperties fpGetPhysicalDeviceExternalFenceProperties = NULL;
     if (loader_check_version_meets_required(LOADER_VERSION_1_1_0, inst->app_api_version)) {
-        fpGetPhysicalDeviceExternalFenceProperties = icd_term->dispatch.GetPhysicalDeviceExternalFenceProperties;
+        fpGetPhysicalDeviceExternalFenceProperties = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalFenceProperties);
     }
     if (fpGetPhysicalDeviceExternalFenceProperties == NULL && inst->enabled_known_extensions.khr_external_fence_capabilities) {
-        fpGetPhysicalDeviceExternalFenceProperties = icd_term->dispatch.GetPhysicalDeviceExternalFencePropertiesKHR;
+        fpGetPhysicalDeviceExternalFenceProperties = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceExternalFencePropertiesKHR);
     }
 
     if (fpGetPhysicalDeviceExternalFenceProperties != NULL) {
@@ -635,17 +642,18 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceToolProperties(VkPhys
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceToolProperties) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceToolProperties)) {
         loader_log(icd_term->this_instance, VULKAN_LOADER_ERROR_BIT, 0,
                    "terminator_GetPhysicalDeviceToolProperties: The ICD's vkGetPhysicalDeviceToolProperties was NULL yet "
                    "the physical device supports Vulkan API Version 1.3.");
     } else {
         VkPhysicalDeviceProperties properties;
-        if (icd_term->dispatch.GetPhysicalDeviceProperties) {
-            icd_term->dispatch.GetPhysicalDeviceProperties(phys_dev_term->phys_dev, &properties);
+        if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)) {
+            ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceProperties)(phys_dev_term->phys_dev, &properties);
 
             if (VK_API_VERSION_MINOR(properties.apiVersion) >= 3) {
-                return icd_term->dispatch.GetPhysicalDeviceToolProperties(phys_dev_term->phys_dev, pToolCount, pToolProperties);
+                return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceToolProperties)(phys_dev_term->phys_dev, pToolCount,
+                                                                                    pToolProperties);
             }
         }
     }
@@ -64,7 +64,7 @@
  * instance passed in is both valid and minor version is greater than 1.2, which was when this change in behavior occurred. Only
  * instances with a newer version will get the new behavior.
  */
-LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetInstanceProcAddr(VkInstance instance, const char *pName) {
+static PFN_vkVoidFunction get_instance_proc_addr(VkInstance instance, const char *pName) {
     // Always should be able to get vkGetInstanceProcAddr if queried, regardless of the value of instance
     if (!strcmp(pName, "vkGetInstanceProcAddr")) return (PFN_vkVoidFunction)vkGetInstanceProcAddr;
 
@@ -111,6 +111,13 @@ LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetInstanceProcAddr(VkI
     }
 }
 
+LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetInstanceProcAddr(VkInstance instance, const char *pName) {
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetInstanceProcAddr);
+    PFN_vkVoidFunction addr = get_instance_proc_addr(instance, pName);
+    LOADER_TRAMPOLINE_STATS_END(vkGetInstanceProcAddr);
+    return addr;
+}
+
 // Get a device level or global level entry point address.
 // @param device
 // @param pName
@@ -118,7 +125,7 @@ LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetInstanceProcAddr(VkI
 //    If device is valid, returns a device relative entry point for device level
 //    entry points both core and extensions.
 //    Device relative means call down the device chain.
-LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetDeviceProcAddr(VkDevice device, const char *pName) {
+static PFN_vkVoidFunction get_device_proc_addr(VkDevice device, const char *pName) {
     if (!pName || pName[0] != 'v' || pName[1] != 'k') return NULL;
 
     // For entrypoints that loader must handle (ie non-dispatchable or create object)
@@ -161,9 +168,17 @@ LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetDeviceProcAddr(VkDev
     return disp_table->GetDeviceProcAddr(device, pName);
 }
 
+LOADER_EXPORT VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetDeviceProcAddr(VkDevice device, const char *pName) {
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceProcAddr);
+    PFN_vkVoidFunction addr = get_device_proc_addr(device, pName);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceProcAddr);
+    return addr;
+}
+
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceExtensionProperties(const char *pLayerName,
                                                                                     uint32_t *pPropertyCount,
                                                                                     VkExtensionProperties *pProperties) {
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumerateInstanceExtensionProperties);
     LOADER_PLATFORM_THREAD_ONCE(&once_init, loader_initialize);
 
     update_global_loader_settings();
@@ -189,11 +204,13 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceExtensionPropert
 
     res = parse_layer_environment_var_filters(NULL, &layer_filters);
     if (VK_SUCCESS != res) {
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceExtensionProperties);
         return res;
     }
 
     res = loader_scan_for_implicit_layers(NULL, &layers, &layer_filters);
     if (VK_SUCCESS != res) {
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceExtensionProperties);
         return res;
     }
 
@@ -249,11 +266,13 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceExtensionPropert
         loader_free(NULL, holder);
     }
 
+    LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceExtensionProperties);
     return res;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceLayerProperties(uint32_t *pPropertyCount,
                                                                                 VkLayerProperties *pProperties) {
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumerateInstanceLayerProperties);
     LOADER_PLATFORM_THREAD_ONCE(&once_init, loader_initialize);
 
     update_global_loader_settings();
@@ -279,11 +298,13 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceLayerProperties(
 
     res = parse_layer_environment_var_filters(NULL, &layer_filters);
     if (VK_SUCCESS != res) {
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceLayerProperties);
         return res;
     }
 
     res = loader_scan_for_implicit_layers(NULL, &layers, &layer_filters);
     if (VK_SUCCESS != res) {
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceLayerProperties);
         return res;
     }
 
@@ -339,10 +360,12 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceLayerProperties(
         loader_free(NULL, holder);
     }
 
+    LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceLayerProperties);
     return res;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceVersion(uint32_t *pApiVersion) {
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumerateInstanceVersion);
     LOADER_PLATFORM_THREAD_ONCE(&once_init, loader_initialize);
 
     update_global_loader_settings();
@@ -352,6 +375,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceVersion(uint32_t
                    "vkEnumerateInstanceVersion: \'pApiVersion\' must not be NULL "
                    "(VUID-vkEnumerateInstanceVersion-pApiVersion-parameter");
         // NOTE: This seems silly, but it's the only allowable failure
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceVersion);
         return VK_ERROR_OUT_OF_HOST_MEMORY;
     }
 
@@ -376,11 +400,13 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceVersion(uint32_t
 
     res = parse_layer_environment_var_filters(NULL, &layer_filters);
     if (VK_SUCCESS != res) {
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceVersion);
         return res;
     }
 
     res = loader_scan_for_implicit_layers(NULL, &layers, &layer_filters);
     if (VK_SUCCESS != res) {
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceVersion);
         return res;
     }
 
@@ -435,6 +461,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateInstanceVersion(uint32_t
         loader_free(NULL, holder);
     }
 
+    LOADER_TRAMPOLINE_STATS_END(vkEnumerateInstanceVersion);
     return res;
 }
 
@@ -479,6 +506,7 @@ void loader_remove_instance_only_debug_funcs(struct loader_instance *ptr_instanc
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateInstance(const VkInstanceCreateInfo *pCreateInfo,
                                                               const VkAllocationCallbacks *pAllocator, VkInstance *pInstance) {
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateInstance);
     struct loader_instance *ptr_instance = NULL;
     VkInstance created_instance = VK_NULL_HANDLE;
     VkResult res = VK_ERROR_INITIALIZATION_FAILED;
@@ -746,7 +774,7 @@ out:
                 // our way back out of it.
                 if (icd_term->instance) {
                     loader_icd_close_objects(ptr_instance, icd_term);
-                    icd_term->dispatch.DestroyInstance(icd_term->instance, pAllocator);
+                    ICD_TERM_DISPATCH(icd_term, DestroyInstance)(icd_term->instance, pAllocator);
                 }
                 icd_term->instance = VK_NULL_HANDLE;
                 ptr_instance->icd_terms = icd_term->next;
@@ -764,6 +792,7 @@ out:
         loader_platform_thread_unlock_mutex(&loader_lock);
     }
 
+    LOADER_TRAMPOLINE_STATS_END(vkCreateInstance);
     return res;
 }
 
@@ -771,7 +800,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyInstance(VkInstance instance,
     const VkLayerInstanceDispatchTable *disp;
     struct loader_instance *ptr_instance = NULL;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyInstance);
     if (instance == VK_NULL_HANDLE) {
+        LOADER_TRAMPOLINE_STATS_END(vkDestroyInstance);
         return;
     }
     loader_platform_thread_lock_mutex(&loader_lock);
@@ -794,6 +825,10 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyInstance(VkInstance instance,
     // Swap in the debug callbacks created during instance creation
     loader_add_instance_only_debug_funcs(ptr_instance);
 
+#if defined(LOADER_HAS_TRAMPOLINE_STATS)
+    loader_log_trampoline_stats(ptr_instance);
+#endif
+
     disp = loader_get_instance_layer_dispatch(instance);
     disp->DestroyInstance(ptr_instance->instance, pAllocator);
 
@@ -827,6 +862,7 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyInstance(VkInstance instance,
     // Unload preloaded layers, so if vkEnumerateInstanceExtensionProperties or vkCreateInstance is called again, the ICD's are
     // up to date
     loader_unload_preloaded_icds();
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyInstance);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumeratePhysicalDevices(VkInstance instance, uint32_t *pPhysicalDeviceCount,
@@ -834,6 +870,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumeratePhysicalDevices(VkInstan
     VkResult res = VK_SUCCESS;
     struct loader_instance *inst;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumeratePhysicalDevices);
     loader_platform_thread_lock_mutex(&loader_lock);
 
     inst = loader_get_instance(instance);
@@ -869,6 +906,7 @@ out:
 
     loader_platform_thread_unlock_mutex(&loader_lock);
 
+    LOADER_TRAMPOLINE_STATS_END(vkEnumeratePhysicalDevices);
     return res;
 }
 
@@ -883,7 +921,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceFeatures(VkPhysicalD
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceFeatures);
     disp->GetPhysicalDeviceFeatures(unwrapped_phys_dev, pFeatures);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceFeatures);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceFormatProperties(VkPhysicalDevice physicalDevice, VkFormat format,
@@ -897,7 +937,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceFormatProperties(VkP
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceFormatProperties);
     disp->GetPhysicalDeviceFormatProperties(unwrapped_phys_dev, format, pFormatInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceFormatProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceImageFormatProperties(
@@ -912,8 +954,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceImageFormatPrope
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceImageFormatProperties(unwrapped_phys_dev, format, type, tiling, usage, flags,
-                                                        pImageFormatProperties);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceImageFormatProperties);
+    VkResult result = disp->GetPhysicalDeviceImageFormatProperties(unwrapped_phys_dev, format, type, tiling, usage, flags,
+                                                                   pImageFormatProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceImageFormatProperties);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceProperties(VkPhysicalDevice physicalDevice,
@@ -927,7 +972,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceProperties(VkPhysica
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceProperties);
     disp->GetPhysicalDeviceProperties(unwrapped_phys_dev, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceQueueFamilyProperties(VkPhysicalDevice physicalDevice,
@@ -942,7 +989,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceQueueFamilyPropertie
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceQueueFamilyProperties);
     disp->GetPhysicalDeviceQueueFamilyProperties(unwrapped_phys_dev, pQueueFamilyPropertyCount, pQueueProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceQueueFamilyProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceMemoryProperties(VkPhysicalDevice physicalDevice,
@@ -956,7 +1005,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceMemoryProperties(VkP
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceMemoryProperties);
     disp->GetPhysicalDeviceMemoryProperties(unwrapped_phys_dev, pMemoryProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceMemoryProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDevice(VkPhysicalDevice physicalDevice, const VkDeviceCreateInfo *pCreateInfo,
@@ -966,16 +1017,20 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDevice(VkPhysicalDevice phy
                    "vkCreateDevice: Invalid physicalDevice [VUID-vkCreateDevice-physicalDevice-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDevice);
     loader_platform_thread_lock_mutex(&loader_lock);
     VkResult res = loader_layer_create_device(NULL, physicalDevice, pCreateInfo, pAllocator, pDevice, NULL, NULL);
     loader_platform_thread_unlock_mutex(&loader_lock);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDevice);
     return res;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDevice(VkDevice device, const VkAllocationCallbacks *pAllocator) {
     const VkLayerDispatchTable *disp;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyDevice);
     if (device == VK_NULL_HANDLE) {
+        LOADER_TRAMPOLINE_STATS_END(vkDestroyDevice);
         return;
     }
     disp = loader_get_dispatch(device);
@@ -990,6 +1045,7 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDevice(VkDevice device, const
     loader_layer_destroy_device(device, pAllocator, disp->DestroyDevice);
 
     loader_platform_thread_unlock_mutex(&loader_lock);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyDevice);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionProperties(VkPhysicalDevice physicalDevice,
@@ -1006,6 +1062,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionPropertie
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumerateDeviceExtensionProperties);
     loader_platform_thread_lock_mutex(&loader_lock);
 
     // always pass this call down the instance chain which will terminate
@@ -1016,6 +1073,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionPropertie
     res = disp->EnumerateDeviceExtensionProperties(phys_dev->phys_dev, pLayerName, pPropertyCount, pProperties);
 
     loader_platform_thread_unlock_mutex(&loader_lock);
+    LOADER_TRAMPOLINE_STATS_END(vkEnumerateDeviceExtensionProperties);
     return res;
 }
 
@@ -1024,6 +1082,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceLayerProperties(Vk
                                                                               VkLayerProperties *pProperties) {
     uint32_t copy_size;
     struct loader_physical_device_tramp *phys_dev;
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumerateDeviceLayerProperties);
     loader_platform_thread_lock_mutex(&loader_lock);
 
     // Don't dispatch this call down the instance chain, want all device layers
@@ -1046,6 +1105,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceLayerProperties(Vk
     if (count == 0 || pProperties == NULL) {
         *pPropertyCount = count;
         loader_platform_thread_unlock_mutex(&loader_lock);
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateDeviceLayerProperties);
         return VK_SUCCESS;
     }
 
@@ -1057,10 +1117,12 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceLayerProperties(Vk
 
     if (copy_size < count) {
         loader_platform_thread_unlock_mutex(&loader_lock);
+        LOADER_TRAMPOLINE_STATS_END(vkEnumerateDeviceLayerProperties);
         return VK_INCOMPLETE;
     }
 
     loader_platform_thread_unlock_mutex(&loader_lock);
+    LOADER_TRAMPOLINE_STATS_END(vkEnumerateDeviceLayerProperties);
     return VK_SUCCESS;
 }
 
@@ -1073,22 +1135,27 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceQueue(VkDevice device, uint3
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceQueue);
     disp->GetDeviceQueue(device, queueNodeIndex, queueIndex, pQueue);
     if (pQueue != NULL && *pQueue != NULL) {
         loader_set_dispatch(*pQueue, disp);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceQueue);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueueSubmit(VkQueue queue, uint32_t submitCount, const VkSubmitInfo *pSubmits,
                                                            VkFence fence) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(queue);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(queue);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkQueueSubmit: Invalid queue [VUID-vkQueueSubmit-queue-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->QueueSubmit(queue, submitCount, pSubmits, fence);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkQueueSubmit);
+    VkResult result = disp->QueueSubmit(queue, submitCount, pSubmits, fence);
+    LOADER_TRAMPOLINE_STATS_END(vkQueueSubmit);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueueWaitIdle(VkQueue queue) {
@@ -1099,7 +1166,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueueWaitIdle(VkQueue queue) {
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->QueueWaitIdle(queue);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkQueueWaitIdle);
+    VkResult result = disp->QueueWaitIdle(queue);
+    LOADER_TRAMPOLINE_STATS_END(vkQueueWaitIdle);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkDeviceWaitIdle(VkDevice device) {
@@ -1110,7 +1180,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkDeviceWaitIdle(VkDevice device) {
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->DeviceWaitIdle(device);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDeviceWaitIdle);
+    VkResult result = disp->DeviceWaitIdle(device);
+    LOADER_TRAMPOLINE_STATS_END(vkDeviceWaitIdle);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateMemory(VkDevice device, const VkMemoryAllocateInfo *pAllocateInfo,
@@ -1122,7 +1195,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateMemory(VkDevice device, c
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->AllocateMemory(device, pAllocateInfo, pAllocator, pMemory);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkAllocateMemory);
+    VkResult result = disp->AllocateMemory(device, pAllocateInfo, pAllocator, pMemory);
+    LOADER_TRAMPOLINE_STATS_END(vkAllocateMemory);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkFreeMemory(VkDevice device, VkDeviceMemory mem,
@@ -1134,7 +1210,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkFreeMemory(VkDevice device, VkDeviceM
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkFreeMemory);
     disp->FreeMemory(device, mem, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkFreeMemory);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkMapMemory(VkDevice device, VkDeviceMemory mem, VkDeviceSize offset,
@@ -1146,7 +1224,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkMapMemory(VkDevice device, VkDevi
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->MapMemory(device, mem, offset, size, flags, ppData);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkMapMemory);
+    VkResult result = disp->MapMemory(device, mem, offset, size, flags, ppData);
+    LOADER_TRAMPOLINE_STATS_END(vkMapMemory);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkUnmapMemory(VkDevice device, VkDeviceMemory mem) {
@@ -1157,7 +1238,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkUnmapMemory(VkDevice device, VkDevice
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkUnmapMemory);
     disp->UnmapMemory(device, mem);
+    LOADER_TRAMPOLINE_STATS_END(vkUnmapMemory);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkFlushMappedMemoryRanges(VkDevice device, uint32_t memoryRangeCount,
@@ -1169,7 +1252,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkFlushMappedMemoryRanges(VkDevice
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->FlushMappedMemoryRanges(device, memoryRangeCount, pMemoryRanges);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkFlushMappedMemoryRanges);
+    VkResult result = disp->FlushMappedMemoryRanges(device, memoryRangeCount, pMemoryRanges);
+    LOADER_TRAMPOLINE_STATS_END(vkFlushMappedMemoryRanges);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkInvalidateMappedMemoryRanges(VkDevice device, uint32_t memoryRangeCount,
@@ -1181,7 +1267,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkInvalidateMappedMemoryRanges(VkDe
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->InvalidateMappedMemoryRanges(device, memoryRangeCount, pMemoryRanges);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkInvalidateMappedMemoryRanges);
+    VkResult result = disp->InvalidateMappedMemoryRanges(device, memoryRangeCount, pMemoryRanges);
+    LOADER_TRAMPOLINE_STATS_END(vkInvalidateMappedMemoryRanges);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceMemoryCommitment(VkDevice device, VkDeviceMemory memory,
@@ -1193,7 +1282,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceMemoryCommitment(VkDevice de
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceMemoryCommitment);
     disp->GetDeviceMemoryCommitment(device, memory, pCommittedMemoryInBytes);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceMemoryCommitment);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindBufferMemory(VkDevice device, VkBuffer buffer, VkDeviceMemory mem,
@@ -1205,7 +1296,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindBufferMemory(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->BindBufferMemory(device, buffer, mem, offset);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkBindBufferMemory);
+    VkResult result = disp->BindBufferMemory(device, buffer, mem, offset);
+    LOADER_TRAMPOLINE_STATS_END(vkBindBufferMemory);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindImageMemory(VkDevice device, VkImage image, VkDeviceMemory mem,
@@ -1217,7 +1311,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindImageMemory(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->BindImageMemory(device, image, mem, offset);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkBindImageMemory);
+    VkResult result = disp->BindImageMemory(device, image, mem, offset);
+    LOADER_TRAMPOLINE_STATS_END(vkBindImageMemory);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetBufferMemoryRequirements(VkDevice device, VkBuffer buffer,
@@ -1229,7 +1326,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetBufferMemoryRequirements(VkDevice
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetBufferMemoryRequirements);
     disp->GetBufferMemoryRequirements(device, buffer, pMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetBufferMemoryRequirements);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageMemoryRequirements(VkDevice device, VkImage image,
@@ -1241,7 +1340,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageMemoryRequirements(VkDevice d
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetImageMemoryRequirements);
     disp->GetImageMemoryRequirements(device, image, pMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetImageMemoryRequirements);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL
@@ -1254,7 +1355,9 @@ vkGetImageSparseMemoryRequirements(VkDevice device, VkImage image, uint32_t *pSp
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetImageSparseMemoryRequirements);
     disp->GetImageSparseMemoryRequirements(device, image, pSparseMemoryRequirementCount, pSparseMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetImageSparseMemoryRequirements);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceSparseImageFormatProperties(
@@ -1270,8 +1373,10 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceSparseImageFormatPro
     }
 
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSparseImageFormatProperties);
     disp->GetPhysicalDeviceSparseImageFormatProperties(unwrapped_phys_dev, format, type, samples, usage, tiling, pPropertyCount,
                                                        pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSparseImageFormatProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueueBindSparse(VkQueue queue, uint32_t bindInfoCount,
@@ -1283,7 +1388,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueueBindSparse(VkQueue queue, ui
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->QueueBindSparse(queue, bindInfoCount, pBindInfo, fence);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkQueueBindSparse);
+    VkResult result = disp->QueueBindSparse(queue, bindInfoCount, pBindInfo, fence);
+    LOADER_TRAMPOLINE_STATS_END(vkQueueBindSparse);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateFence(VkDevice device, const VkFenceCreateInfo *pCreateInfo,
@@ -1295,7 +1403,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateFence(VkDevice device, cons
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateFence(device, pCreateInfo, pAllocator, pFence);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateFence);
+    VkResult result = disp->CreateFence(device, pCreateInfo, pAllocator, pFence);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateFence);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyFence(VkDevice device, VkFence fence, const VkAllocationCallbacks *pAllocator) {
@@ -1306,18 +1417,23 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyFence(VkDevice device, VkFence
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyFence);
     disp->DestroyFence(device, fence, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyFence);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetFences(VkDevice device, uint32_t fenceCount, const VkFence *pFences) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(device);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(device);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkResetFences: Invalid device [VUID-vkResetFences-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->ResetFences(device, fenceCount, pFences);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkResetFences);
+    VkResult result = disp->ResetFences(device, fenceCount, pFences);
+    LOADER_TRAMPOLINE_STATS_END(vkResetFences);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetFenceStatus(VkDevice device, VkFence fence) {
@@ -1328,19 +1444,25 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetFenceStatus(VkDevice device, V
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->GetFenceStatus(device, fence);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetFenceStatus);
+    VkResult result = disp->GetFenceStatus(device, fence);
+    LOADER_TRAMPOLINE_STATS_END(vkGetFenceStatus);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkWaitForFences(VkDevice device, uint32_t fenceCount, const VkFence *pFences,
                                                              VkBool32 waitAll, uint64_t timeout) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(device);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(device);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkWaitForFences: Invalid device [VUID-vkWaitForFences-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->WaitForFences(device, fenceCount, pFences, waitAll, timeout);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkWaitForFences);
+    VkResult result = disp->WaitForFences(device, fenceCount, pFences, waitAll, timeout);
+    LOADER_TRAMPOLINE_STATS_END(vkWaitForFences);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSemaphore(VkDevice device, const VkSemaphoreCreateInfo *pCreateInfo,
@@ -1352,7 +1474,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSemaphore(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateSemaphore(device, pCreateInfo, pAllocator, pSemaphore);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateSemaphore);
+    VkResult result = disp->CreateSemaphore(device, pCreateInfo, pAllocator, pSemaphore);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateSemaphore);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySemaphore(VkDevice device, VkSemaphore semaphore,
@@ -1364,7 +1489,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySemaphore(VkDevice device, VkS
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroySemaphore);
     disp->DestroySemaphore(device, semaphore, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroySemaphore);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateEvent(VkDevice device, const VkEventCreateInfo *pCreateInfo,
@@ -1376,7 +1503,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateEvent(VkDevice device, cons
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateEvent(device, pCreateInfo, pAllocator, pEvent);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateEvent);
+    VkResult result = disp->CreateEvent(device, pCreateInfo, pAllocator, pEvent);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateEvent);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyEvent(VkDevice device, VkEvent event, const VkAllocationCallbacks *pAllocator) {
@@ -1387,7 +1517,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyEvent(VkDevice device, VkEvent
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyEvent);
     disp->DestroyEvent(device, event, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyEvent);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetEventStatus(VkDevice device, VkEvent event) {
@@ -1398,7 +1530,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetEventStatus(VkDevice device, V
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->GetEventStatus(device, event);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetEventStatus);
+    VkResult result = disp->GetEventStatus(device, event);
+    LOADER_TRAMPOLINE_STATS_END(vkGetEventStatus);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkSetEvent(VkDevice device, VkEvent event) {
@@ -1409,7 +1544,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkSetEvent(VkDevice device, VkEvent
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->SetEvent(device, event);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkSetEvent);
+    VkResult result = disp->SetEvent(device, event);
+    LOADER_TRAMPOLINE_STATS_END(vkSetEvent);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetEvent(VkDevice device, VkEvent event) {
@@ -1420,7 +1558,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetEvent(VkDevice device, VkEve
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->ResetEvent(device, event);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkResetEvent);
+    VkResult result = disp->ResetEvent(device, event);
+    LOADER_TRAMPOLINE_STATS_END(vkResetEvent);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateQueryPool(VkDevice device, const VkQueryPoolCreateInfo *pCreateInfo,
@@ -1432,7 +1573,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateQueryPool(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateQueryPool(device, pCreateInfo, pAllocator, pQueryPool);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateQueryPool);
+    VkResult result = disp->CreateQueryPool(device, pCreateInfo, pAllocator, pQueryPool);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateQueryPool);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyQueryPool(VkDevice device, VkQueryPool queryPool,
@@ -1444,7 +1588,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyQueryPool(VkDevice device, VkQ
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyQueryPool);
     disp->DestroyQueryPool(device, queryPool, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyQueryPool);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetQueryPoolResults(VkDevice device, VkQueryPool queryPool, uint32_t firstQuery,
@@ -1457,7 +1603,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetQueryPoolResults(VkDevice devi
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->GetQueryPoolResults(device, queryPool, firstQuery, queryCount, dataSize, pData, stride, flags);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetQueryPoolResults);
+    VkResult result = disp->GetQueryPoolResults(device, queryPool, firstQuery, queryCount, dataSize, pData, stride, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkGetQueryPoolResults);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateBuffer(VkDevice device, const VkBufferCreateInfo *pCreateInfo,
@@ -1469,7 +1618,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateBuffer(VkDevice device, con
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateBuffer(device, pCreateInfo, pAllocator, pBuffer);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateBuffer);
+    VkResult result = disp->CreateBuffer(device, pCreateInfo, pAllocator, pBuffer);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateBuffer);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyBuffer(VkDevice device, VkBuffer buffer,
@@ -1481,7 +1633,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyBuffer(VkDevice device, VkBuff
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyBuffer);
     disp->DestroyBuffer(device, buffer, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyBuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateBufferView(VkDevice device, const VkBufferViewCreateInfo *pCreateInfo,
@@ -1493,7 +1647,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateBufferView(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateBufferView(device, pCreateInfo, pAllocator, pView);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateBufferView);
+    VkResult result = disp->CreateBufferView(device, pCreateInfo, pAllocator, pView);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateBufferView);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyBufferView(VkDevice device, VkBufferView bufferView,
@@ -1505,7 +1662,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyBufferView(VkDevice device, Vk
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyBufferView);
     disp->DestroyBufferView(device, bufferView, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyBufferView);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateImage(VkDevice device, const VkImageCreateInfo *pCreateInfo,
@@ -1517,7 +1676,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateImage(VkDevice device, cons
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateImage(device, pCreateInfo, pAllocator, pImage);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateImage);
+    VkResult result = disp->CreateImage(device, pCreateInfo, pAllocator, pImage);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateImage);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyImage(VkDevice device, VkImage image, const VkAllocationCallbacks *pAllocator) {
@@ -1528,7 +1690,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyImage(VkDevice device, VkImage
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyImage);
     disp->DestroyImage(device, image, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageSubresourceLayout(VkDevice device, VkImage image,
@@ -1541,7 +1705,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageSubresourceLayout(VkDevice de
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetImageSubresourceLayout);
     disp->GetImageSubresourceLayout(device, image, pSubresource, pLayout);
+    LOADER_TRAMPOLINE_STATS_END(vkGetImageSubresourceLayout);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateImageView(VkDevice device, const VkImageViewCreateInfo *pCreateInfo,
@@ -1553,7 +1719,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateImageView(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateImageView(device, pCreateInfo, pAllocator, pView);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateImageView);
+    VkResult result = disp->CreateImageView(device, pCreateInfo, pAllocator, pView);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateImageView);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyImageView(VkDevice device, VkImageView imageView,
@@ -1565,7 +1734,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyImageView(VkDevice device, VkI
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyImageView);
     disp->DestroyImageView(device, imageView, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyImageView);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateShaderModule(VkDevice device, const VkShaderModuleCreateInfo *pCreateInfo,
@@ -1578,7 +1749,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateShaderModule(VkDevice devic
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateShaderModule(device, pCreateInfo, pAllocator, pShader);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateShaderModule);
+    VkResult result = disp->CreateShaderModule(device, pCreateInfo, pAllocator, pShader);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateShaderModule);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyShaderModule(VkDevice device, VkShaderModule shaderModule,
@@ -1590,7 +1764,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyShaderModule(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyShaderModule);
     disp->DestroyShaderModule(device, shaderModule, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyShaderModule);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreatePipelineCache(VkDevice device, const VkPipelineCacheCreateInfo *pCreateInfo,
@@ -1603,7 +1779,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreatePipelineCache(VkDevice devi
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreatePipelineCache(device, pCreateInfo, pAllocator, pPipelineCache);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreatePipelineCache);
+    VkResult result = disp->CreatePipelineCache(device, pCreateInfo, pAllocator, pPipelineCache);
+    LOADER_TRAMPOLINE_STATS_END(vkCreatePipelineCache);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPipelineCache(VkDevice device, VkPipelineCache pipelineCache,
@@ -1615,7 +1794,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPipelineCache(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyPipelineCache);
     disp->DestroyPipelineCache(device, pipelineCache, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyPipelineCache);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPipelineCacheData(VkDevice device, VkPipelineCache pipelineCache,
@@ -1627,7 +1808,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPipelineCacheData(VkDevice dev
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->GetPipelineCacheData(device, pipelineCache, pDataSize, pData);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPipelineCacheData);
+    VkResult result = disp->GetPipelineCacheData(device, pipelineCache, pDataSize, pData);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPipelineCacheData);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkMergePipelineCaches(VkDevice device, VkPipelineCache dstCache,
@@ -1639,7 +1823,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkMergePipelineCaches(VkDevice devi
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->MergePipelineCaches(device, dstCache, srcCacheCount, pSrcCaches);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkMergePipelineCaches);
+    VkResult result = disp->MergePipelineCaches(device, dstCache, srcCacheCount, pSrcCaches);
+    LOADER_TRAMPOLINE_STATS_END(vkMergePipelineCaches);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateGraphicsPipelines(VkDevice device, VkPipelineCache pipelineCache,
@@ -1654,7 +1841,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateGraphicsPipelines(VkDevice
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateGraphicsPipelines(device, pipelineCache, createInfoCount, pCreateInfos, pAllocator, pPipelines);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateGraphicsPipelines);
+    VkResult result = disp->CreateGraphicsPipelines(device, pipelineCache, createInfoCount, pCreateInfos, pAllocator, pPipelines);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateGraphicsPipelines);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateComputePipelines(VkDevice device, VkPipelineCache pipelineCache,
@@ -1669,7 +1859,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateComputePipelines(VkDevice d
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateComputePipelines(device, pipelineCache, createInfoCount, pCreateInfos, pAllocator, pPipelines);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateComputePipelines);
+    VkResult result = disp->CreateComputePipelines(device, pipelineCache, createInfoCount, pCreateInfos, pAllocator, pPipelines);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateComputePipelines);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPipeline(VkDevice device, VkPipeline pipeline,
@@ -1681,7 +1874,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPipeline(VkDevice device, VkPi
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyPipeline);
     disp->DestroyPipeline(device, pipeline, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyPipeline);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreatePipelineLayout(VkDevice device, const VkPipelineLayoutCreateInfo *pCreateInfo,
@@ -1694,7 +1889,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreatePipelineLayout(VkDevice dev
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreatePipelineLayout(device, pCreateInfo, pAllocator, pPipelineLayout);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreatePipelineLayout);
+    VkResult result = disp->CreatePipelineLayout(device, pCreateInfo, pAllocator, pPipelineLayout);
+    LOADER_TRAMPOLINE_STATS_END(vkCreatePipelineLayout);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPipelineLayout(VkDevice device, VkPipelineLayout pipelineLayout,
@@ -1706,7 +1904,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPipelineLayout(VkDevice device
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyPipelineLayout);
     disp->DestroyPipelineLayout(device, pipelineLayout, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyPipelineLayout);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSampler(VkDevice device, const VkSamplerCreateInfo *pCreateInfo,
@@ -1718,7 +1918,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSampler(VkDevice device, co
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateSampler(device, pCreateInfo, pAllocator, pSampler);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateSampler);
+    VkResult result = disp->CreateSampler(device, pCreateInfo, pAllocator, pSampler);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateSampler);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySampler(VkDevice device, VkSampler sampler,
@@ -1730,7 +1933,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySampler(VkDevice device, VkSam
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroySampler);
     disp->DestroySampler(device, sampler, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroySampler);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDescriptorSetLayout(VkDevice device,
@@ -1744,7 +1949,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDescriptorSetLayout(VkDevic
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateDescriptorSetLayout(device, pCreateInfo, pAllocator, pSetLayout);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDescriptorSetLayout);
+    VkResult result = disp->CreateDescriptorSetLayout(device, pCreateInfo, pAllocator, pSetLayout);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDescriptorSetLayout);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDescriptorSetLayout(VkDevice device, VkDescriptorSetLayout descriptorSetLayout,
@@ -1756,7 +1964,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDescriptorSetLayout(VkDevice d
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyDescriptorSetLayout);
     disp->DestroyDescriptorSetLayout(device, descriptorSetLayout, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyDescriptorSetLayout);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDescriptorPool(VkDevice device, const VkDescriptorPoolCreateInfo *pCreateInfo,
@@ -1769,7 +1979,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDescriptorPool(VkDevice dev
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateDescriptorPool(device, pCreateInfo, pAllocator, pDescriptorPool);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDescriptorPool);
+    VkResult result = disp->CreateDescriptorPool(device, pCreateInfo, pAllocator, pDescriptorPool);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDescriptorPool);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDescriptorPool(VkDevice device, VkDescriptorPool descriptorPool,
@@ -1781,7 +1994,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDescriptorPool(VkDevice device
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyDescriptorPool);
     disp->DestroyDescriptorPool(device, descriptorPool, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyDescriptorPool);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetDescriptorPool(VkDevice device, VkDescriptorPool descriptorPool,
@@ -1793,7 +2008,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetDescriptorPool(VkDevice devi
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->ResetDescriptorPool(device, descriptorPool, flags);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkResetDescriptorPool);
+    VkResult result = disp->ResetDescriptorPool(device, descriptorPool, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkResetDescriptorPool);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateDescriptorSets(VkDevice device,
@@ -1806,7 +2024,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateDescriptorSets(VkDevice d
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->AllocateDescriptorSets(device, pAllocateInfo, pDescriptorSets);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkAllocateDescriptorSets);
+    VkResult result = disp->AllocateDescriptorSets(device, pAllocateInfo, pDescriptorSets);
+    LOADER_TRAMPOLINE_STATS_END(vkAllocateDescriptorSets);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkFreeDescriptorSets(VkDevice device, VkDescriptorPool descriptorPool,
@@ -1819,7 +2040,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkFreeDescriptorSets(VkDevice devic
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->FreeDescriptorSets(device, descriptorPool, descriptorSetCount, pDescriptorSets);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkFreeDescriptorSets);
+    VkResult result = disp->FreeDescriptorSets(device, descriptorPool, descriptorSetCount, pDescriptorSets);
+    LOADER_TRAMPOLINE_STATS_END(vkFreeDescriptorSets);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkUpdateDescriptorSets(VkDevice device, uint32_t descriptorWriteCount,
@@ -1833,7 +2057,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkUpdateDescriptorSets(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkUpdateDescriptorSets);
     disp->UpdateDescriptorSets(device, descriptorWriteCount, pDescriptorWrites, descriptorCopyCount, pDescriptorCopies);
+    LOADER_TRAMPOLINE_STATS_END(vkUpdateDescriptorSets);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateFramebuffer(VkDevice device, const VkFramebufferCreateInfo *pCreateInfo,
@@ -1846,7 +2072,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateFramebuffer(VkDevice device
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateFramebuffer(device, pCreateInfo, pAllocator, pFramebuffer);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateFramebuffer);
+    VkResult result = disp->CreateFramebuffer(device, pCreateInfo, pAllocator, pFramebuffer);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateFramebuffer);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyFramebuffer(VkDevice device, VkFramebuffer framebuffer,
@@ -1858,7 +2087,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyFramebuffer(VkDevice device, V
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyFramebuffer);
     disp->DestroyFramebuffer(device, framebuffer, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyFramebuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateRenderPass(VkDevice device, const VkRenderPassCreateInfo *pCreateInfo,
@@ -1871,7 +2102,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateRenderPass(VkDevice device,
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateRenderPass(device, pCreateInfo, pAllocator, pRenderPass);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateRenderPass);
+    VkResult result = disp->CreateRenderPass(device, pCreateInfo, pAllocator, pRenderPass);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateRenderPass);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyRenderPass(VkDevice device, VkRenderPass renderPass,
@@ -1883,7 +2117,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyRenderPass(VkDevice device, Vk
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyRenderPass);
     disp->DestroyRenderPass(device, renderPass, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyRenderPass);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetRenderAreaGranularity(VkDevice device, VkRenderPass renderPass,
@@ -1895,7 +2131,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetRenderAreaGranularity(VkDevice dev
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetRenderAreaGranularity);
     disp->GetRenderAreaGranularity(device, renderPass, pGranularity);
+    LOADER_TRAMPOLINE_STATS_END(vkGetRenderAreaGranularity);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateCommandPool(VkDevice device, const VkCommandPoolCreateInfo *pCreateInfo,
@@ -1908,7 +2146,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateCommandPool(VkDevice device
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->CreateCommandPool(device, pCreateInfo, pAllocator, pCommandPool);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateCommandPool);
+    VkResult result = disp->CreateCommandPool(device, pCreateInfo, pAllocator, pCommandPool);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateCommandPool);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyCommandPool(VkDevice device, VkCommandPool commandPool,
@@ -1920,19 +2161,24 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyCommandPool(VkDevice device, V
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyCommandPool);
     disp->DestroyCommandPool(device, commandPool, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyCommandPool);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetCommandPool(VkDevice device, VkCommandPool commandPool,
                                                                 VkCommandPoolResetFlags flags) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(device);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(device);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkResetCommandPool: Invalid device [VUID-vkResetCommandPool-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->ResetCommandPool(device, commandPool, flags);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkResetCommandPool);
+    VkResult result = disp->ResetCommandPool(device, commandPool, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkResetCommandPool);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateCommandBuffers(VkDevice device,
@@ -1946,6 +2192,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateCommandBuffers(VkDevice d
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkAllocateCommandBuffers);
     res = disp->AllocateCommandBuffers(device, pAllocateInfo, pCommandBuffers);
     if (res == VK_SUCCESS) {
         for (uint32_t i = 0; i < pAllocateInfo->commandBufferCount; i++) {
@@ -1955,6 +2202,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAllocateCommandBuffers(VkDevice d
         }
     }
 
+    LOADER_TRAMPOLINE_STATS_END(vkAllocateCommandBuffers);
     return res;
 }
 
@@ -1967,32 +2215,40 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkFreeCommandBuffers(VkDevice device, V
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkFreeCommandBuffers);
     disp->FreeCommandBuffers(device, commandPool, commandBufferCount, pCommandBuffers);
+    LOADER_TRAMPOLINE_STATS_END(vkFreeCommandBuffers);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBeginCommandBuffer(VkCommandBuffer commandBuffer,
                                                                   const VkCommandBufferBeginInfo *pBeginInfo) {
-    const VkLayerDispatchTable *disp;
+    const struct loader_hot_dispatch_table *disp;
 
-    disp = loader_get_dispatch(commandBuffer);
+    disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkBeginCommandBuffer: Invalid commandBuffer [VUID-vkBeginCommandBuffer-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->BeginCommandBuffer(commandBuffer, pBeginInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkBeginCommandBuffer);
+    VkResult result = disp->BeginCommandBuffer(commandBuffer, pBeginInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkBeginCommandBuffer);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEndCommandBuffer(VkCommandBuffer commandBuffer) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkEndCommandBuffer: Invalid commandBuffer [VUID-vkEndCommandBuffer-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->EndCommandBuffer(commandBuffer);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEndCommandBuffer);
+    VkResult result = disp->EndCommandBuffer(commandBuffer);
+    LOADER_TRAMPOLINE_STATS_END(vkEndCommandBuffer);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetCommandBuffer(VkCommandBuffer commandBuffer, VkCommandBufferResetFlags flags) {
@@ -2003,43 +2259,52 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkResetCommandBuffer(VkCommandBuffe
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->ResetCommandBuffer(commandBuffer, flags);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkResetCommandBuffer);
+    VkResult result = disp->ResetCommandBuffer(commandBuffer, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkResetCommandBuffer);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindPipeline(VkCommandBuffer commandBuffer, VkPipelineBindPoint pipelineBindPoint,
                                                            VkPipeline pipeline) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdBindPipeline: Invalid commandBuffer [VUID-vkCmdBindPipeline-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindPipeline);
     disp->CmdBindPipeline(commandBuffer, pipelineBindPoint, pipeline);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindPipeline);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetViewport(VkCommandBuffer commandBuffer, uint32_t firstViewport,
                                                           uint32_t viewportCount, const VkViewport *pViewports) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdSetViewport: Invalid commandBuffer [VUID-vkCmdSetViewport-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetViewport);
     disp->CmdSetViewport(commandBuffer, firstViewport, viewportCount, pViewports);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetViewport);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetScissor(VkCommandBuffer commandBuffer, uint32_t firstScissor,
                                                          uint32_t scissorCount, const VkRect2D *pScissors) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdSetScissor: Invalid commandBuffer [VUID-vkCmdSetScissor-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetScissor);
     disp->CmdSetScissor(commandBuffer, firstScissor, scissorCount, pScissors);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetScissor);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetLineWidth(VkCommandBuffer commandBuffer, float lineWidth) {
@@ -2050,7 +2315,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetLineWidth(VkCommandBuffer comma
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetLineWidth);
     disp->CmdSetLineWidth(commandBuffer, lineWidth);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetLineWidth);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBias(VkCommandBuffer commandBuffer, float depthBiasConstantFactor,
@@ -2062,7 +2329,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBias(VkCommandBuffer comma
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthBias);
     disp->CmdSetDepthBias(commandBuffer, depthBiasConstantFactor, depthBiasClamp, depthBiasSlopeFactor);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthBias);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetBlendConstants(VkCommandBuffer commandBuffer, const float blendConstants[4]) {
@@ -2073,7 +2342,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetBlendConstants(VkCommandBuffer
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetBlendConstants);
     disp->CmdSetBlendConstants(commandBuffer, blendConstants);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetBlendConstants);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBounds(VkCommandBuffer commandBuffer, float minDepthBounds,
@@ -2085,7 +2356,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBounds(VkCommandBuffer com
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthBounds);
     disp->CmdSetDepthBounds(commandBuffer, minDepthBounds, maxDepthBounds);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthBounds);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilCompareMask(VkCommandBuffer commandBuffer, VkStencilFaceFlags faceMask,
@@ -2097,7 +2370,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilCompareMask(VkCommandBuf
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetStencilCompareMask);
     disp->CmdSetStencilCompareMask(commandBuffer, faceMask, compareMask);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetStencilCompareMask);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilWriteMask(VkCommandBuffer commandBuffer, VkStencilFaceFlags faceMask,
@@ -2109,7 +2384,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilWriteMask(VkCommandBuffe
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetStencilWriteMask);
     disp->CmdSetStencilWriteMask(commandBuffer, faceMask, writeMask);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetStencilWriteMask);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilReference(VkCommandBuffer commandBuffer, VkStencilFaceFlags faceMask,
@@ -2121,7 +2398,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilReference(VkCommandBuffe
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetStencilReference);
     disp->CmdSetStencilReference(commandBuffer, faceMask, reference);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetStencilReference);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindDescriptorSets(VkCommandBuffer commandBuffer,
@@ -2129,100 +2408,116 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindDescriptorSets(VkCommandBuffer
                                                                  uint32_t firstSet, uint32_t descriptorSetCount,
                                                                  const VkDescriptorSet *pDescriptorSets,
                                                                  uint32_t dynamicOffsetCount, const uint32_t *pDynamicOffsets) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdBindDescriptorSets: Invalid commandBuffer [VUID-vkCmdBindDescriptorSets-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindDescriptorSets);
     disp->CmdBindDescriptorSets(commandBuffer, pipelineBindPoint, layout, firstSet, descriptorSetCount, pDescriptorSets,
                                 dynamicOffsetCount, pDynamicOffsets);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindDescriptorSets);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindIndexBuffer(VkCommandBuffer commandBuffer, VkBuffer buffer, VkDeviceSize offset,
                                                               VkIndexType indexType) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdBindIndexBuffer: Invalid commandBuffer [VUID-vkCmdBindIndexBuffer-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindIndexBuffer);
     disp->CmdBindIndexBuffer(commandBuffer, buffer, offset, indexType);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindIndexBuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindVertexBuffers(VkCommandBuffer commandBuffer, uint32_t firstBinding,
                                                                 uint32_t bindingCount, const VkBuffer *pBuffers,
                                                                 const VkDeviceSize *pOffsets) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdBindVertexBuffers: Invalid commandBuffer [VUID-vkCmdBindVertexBuffers-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindVertexBuffers);
     disp->CmdBindVertexBuffers(commandBuffer, firstBinding, bindingCount, pBuffers, pOffsets);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindVertexBuffers);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDraw(VkCommandBuffer commandBuffer, uint32_t vertexCount, uint32_t instanceCount,
                                                    uint32_t firstVertex, uint32_t firstInstance) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdDraw: Invalid commandBuffer [VUID-vkCmdDraw-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDraw);
     disp->CmdDraw(commandBuffer, vertexCount, instanceCount, firstVertex, firstInstance);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDraw);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndexed(VkCommandBuffer commandBuffer, uint32_t indexCount,
                                                           uint32_t instanceCount, uint32_t firstIndex, int32_t vertexOffset,
                                                           uint32_t firstInstance) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdDrawIndexed: Invalid commandBuffer [VUID-vkCmdDrawIndexed-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDrawIndexed);
     disp->CmdDrawIndexed(commandBuffer, indexCount, instanceCount, firstIndex, vertexOffset, firstInstance);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDrawIndexed);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndirect(VkCommandBuffer commandBuffer, VkBuffer buffer, VkDeviceSize offset,
                                                            uint32_t drawCount, uint32_t stride) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdDrawIndirect: Invalid commandBuffer [VUID-vkCmdDrawIndirect-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDrawIndirect);
     disp->CmdDrawIndirect(commandBuffer, buffer, offset, drawCount, stride);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDrawIndirect);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndexedIndirect(VkCommandBuffer commandBuffer, VkBuffer buffer,
                                                                   VkDeviceSize offset, uint32_t drawCount, uint32_t stride) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdDrawIndexedIndirect: Invalid commandBuffer [VUID-vkCmdDrawIndexedIndirect-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDrawIndexedIndirect);
     disp->CmdDrawIndexedIndirect(commandBuffer, buffer, offset, drawCount, stride);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDrawIndexedIndirect);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDispatch(VkCommandBuffer commandBuffer, uint32_t x, uint32_t y, uint32_t z) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdDispatch: Invalid commandBuffer [VUID-vkCmdDispatch-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDispatch);
     disp->CmdDispatch(commandBuffer, x, y, z);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDispatch);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDispatchIndirect(VkCommandBuffer commandBuffer, VkBuffer buffer,
@@ -2234,19 +2529,23 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDispatchIndirect(VkCommandBuffer c
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDispatchIndirect);
     disp->CmdDispatchIndirect(commandBuffer, buffer, offset);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDispatchIndirect);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyBuffer(VkCommandBuffer commandBuffer, VkBuffer srcBuffer, VkBuffer dstBuffer,
                                                          uint32_t regionCount, const VkBufferCopy *pRegions) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdCopyBuffer: Invalid commandBuffer [VUID-vkCmdCopyBuffer-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyBuffer);
     disp->CmdCopyBuffer(commandBuffer, srcBuffer, dstBuffer, regionCount, pRegions);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyBuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImage(VkCommandBuffer commandBuffer, VkImage srcImage,
@@ -2260,7 +2559,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImage(VkCommandBuffer commandB
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyImage);
     disp->CmdCopyImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, pRegions);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBlitImage(VkCommandBuffer commandBuffer, VkImage srcImage,
@@ -2274,20 +2575,24 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBlitImage(VkCommandBuffer commandB
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBlitImage);
     disp->CmdBlitImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, pRegions, filter);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBlitImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyBufferToImage(VkCommandBuffer commandBuffer, VkBuffer srcBuffer, VkImage dstImage,
                                                                 VkImageLayout dstImageLayout, uint32_t regionCount,
                                                                 const VkBufferImageCopy *pRegions) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdCopyBufferToImage: Invalid commandBuffer [VUID-vkCmdCopyBufferToImage-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyBufferToImage);
     disp->CmdCopyBufferToImage(commandBuffer, srcBuffer, dstImage, dstImageLayout, regionCount, pRegions);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyBufferToImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImageToBuffer(VkCommandBuffer commandBuffer, VkImage srcImage,
@@ -2300,7 +2605,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImageToBuffer(VkCommandBuffer
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyImageToBuffer);
     disp->CmdCopyImageToBuffer(commandBuffer, srcImage, srcImageLayout, dstBuffer, regionCount, pRegions);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyImageToBuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdUpdateBuffer(VkCommandBuffer commandBuffer, VkBuffer dstBuffer,
@@ -2312,7 +2619,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdUpdateBuffer(VkCommandBuffer comma
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdUpdateBuffer);
     disp->CmdUpdateBuffer(commandBuffer, dstBuffer, dstOffset, dataSize, pData);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdUpdateBuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdFillBuffer(VkCommandBuffer commandBuffer, VkBuffer dstBuffer, VkDeviceSize dstOffset,
@@ -2324,7 +2633,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdFillBuffer(VkCommandBuffer command
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdFillBuffer);
     disp->CmdFillBuffer(commandBuffer, dstBuffer, dstOffset, size, data);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdFillBuffer);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdClearColorImage(VkCommandBuffer commandBuffer, VkImage image,
@@ -2337,7 +2648,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdClearColorImage(VkCommandBuffer co
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdClearColorImage);
     disp->CmdClearColorImage(commandBuffer, image, imageLayout, pColor, rangeCount, pRanges);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdClearColorImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdClearDepthStencilImage(VkCommandBuffer commandBuffer, VkImage image,
@@ -2351,7 +2664,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdClearDepthStencilImage(VkCommandBu
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdClearDepthStencilImage);
     disp->CmdClearDepthStencilImage(commandBuffer, image, imageLayout, pDepthStencil, rangeCount, pRanges);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdClearDepthStencilImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdClearAttachments(VkCommandBuffer commandBuffer, uint32_t attachmentCount,
@@ -2364,7 +2679,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdClearAttachments(VkCommandBuffer c
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdClearAttachments);
     disp->CmdClearAttachments(commandBuffer, attachmentCount, pAttachments, rectCount, pRects);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdClearAttachments);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResolveImage(VkCommandBuffer commandBuffer, VkImage srcImage,
@@ -2378,7 +2695,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResolveImage(VkCommandBuffer comma
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdResolveImage);
     disp->CmdResolveImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, pRegions);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdResolveImage);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetEvent(VkCommandBuffer commandBuffer, VkEvent event,
@@ -2390,7 +2709,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetEvent(VkCommandBuffer commandBu
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetEvent);
     disp->CmdSetEvent(commandBuffer, event, stageMask);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetEvent);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResetEvent(VkCommandBuffer commandBuffer, VkEvent event,
@@ -2402,7 +2723,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResetEvent(VkCommandBuffer command
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdResetEvent);
     disp->CmdResetEvent(commandBuffer, event, stageMask);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdResetEvent);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWaitEvents(VkCommandBuffer commandBuffer, uint32_t eventCount, const VkEvent *pEvents,
@@ -2419,8 +2742,10 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWaitEvents(VkCommandBuffer command
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdWaitEvents);
     disp->CmdWaitEvents(commandBuffer, eventCount, pEvents, sourceStageMask, dstStageMask, memoryBarrierCount, pMemoryBarriers,
                         bufferMemoryBarrierCount, pBufferMemoryBarriers, imageMemoryBarrierCount, pImageMemoryBarriers);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdWaitEvents);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPipelineBarrier(VkCommandBuffer commandBuffer, VkPipelineStageFlags srcStageMask,
@@ -2430,15 +2755,17 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPipelineBarrier(VkCommandBuffer co
                                                               const VkBufferMemoryBarrier *pBufferMemoryBarriers,
                                                               uint32_t imageMemoryBarrierCount,
                                                               const VkImageMemoryBarrier *pImageMemoryBarriers) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdPipelineBarrier: Invalid commandBuffer [VUID-vkCmdPipelineBarrier-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPipelineBarrier);
     disp->CmdPipelineBarrier(commandBuffer, srcStageMask, dstStageMask, dependencyFlags, memoryBarrierCount, pMemoryBarriers,
                              bufferMemoryBarrierCount, pBufferMemoryBarriers, imageMemoryBarrierCount, pImageMemoryBarriers);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPipelineBarrier);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBeginQuery(VkCommandBuffer commandBuffer, VkQueryPool queryPool, uint32_t slot,
@@ -2450,7 +2777,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBeginQuery(VkCommandBuffer command
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBeginQuery);
     disp->CmdBeginQuery(commandBuffer, queryPool, slot, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBeginQuery);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdEndQuery(VkCommandBuffer commandBuffer, VkQueryPool queryPool, uint32_t slot) {
@@ -2461,7 +2790,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdEndQuery(VkCommandBuffer commandBu
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdEndQuery);
     disp->CmdEndQuery(commandBuffer, queryPool, slot);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdEndQuery);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResetQueryPool(VkCommandBuffer commandBuffer, VkQueryPool queryPool,
@@ -2473,7 +2804,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResetQueryPool(VkCommandBuffer com
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdResetQueryPool);
     disp->CmdResetQueryPool(commandBuffer, queryPool, firstQuery, queryCount);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdResetQueryPool);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWriteTimestamp(VkCommandBuffer commandBuffer, VkPipelineStageFlagBits pipelineStage,
@@ -2485,7 +2818,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWriteTimestamp(VkCommandBuffer com
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdWriteTimestamp);
     disp->CmdWriteTimestamp(commandBuffer, pipelineStage, queryPool, slot);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdWriteTimestamp);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyQueryPoolResults(VkCommandBuffer commandBuffer, VkQueryPool queryPool,
@@ -2498,33 +2833,39 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyQueryPoolResults(VkCommandBuff
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyQueryPoolResults);
     disp->CmdCopyQueryPoolResults(commandBuffer, queryPool, firstQuery, queryCount, dstBuffer, dstOffset, stride, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyQueryPoolResults);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushConstants(VkCommandBuffer commandBuffer, VkPipelineLayout layout,
                                                             VkShaderStageFlags stageFlags, uint32_t offset, uint32_t size,
                                                             const void *pValues) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdPushConstants: Invalid commandBuffer [VUID-vkCmdPushConstants-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPushConstants);
     disp->CmdPushConstants(commandBuffer, layout, stageFlags, offset, size, pValues);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPushConstants);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBeginRenderPass(VkCommandBuffer commandBuffer,
                                                               const VkRenderPassBeginInfo *pRenderPassBegin,
                                                               VkSubpassContents contents) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdBeginRenderPass: Invalid commandBuffer [VUID-vkCmdBeginRenderPass-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBeginRenderPass);
     disp->CmdBeginRenderPass(commandBuffer, pRenderPassBegin, contents);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBeginRenderPass);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdNextSubpass(VkCommandBuffer commandBuffer, VkSubpassContents contents) {
@@ -2535,18 +2876,22 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdNextSubpass(VkCommandBuffer comman
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdNextSubpass);
     disp->CmdNextSubpass(commandBuffer, contents);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdNextSubpass);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdEndRenderPass(VkCommandBuffer commandBuffer) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdEndRenderPass: Invalid commandBuffer [VUID-vkCmdEndRenderPass-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdEndRenderPass);
     disp->CmdEndRenderPass(commandBuffer);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdEndRenderPass);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdExecuteCommands(VkCommandBuffer commandBuffer, uint32_t commandBuffersCount,
@@ -2558,7 +2903,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdExecuteCommands(VkCommandBuffer co
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdExecuteCommands);
     disp->CmdExecuteCommands(commandBuffer, commandBuffersCount, pCommandBuffers);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdExecuteCommands);
 }
 
 // ---- Vulkan core 1.1 trampolines
@@ -2568,6 +2915,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumeratePhysicalDeviceGroups(
     VkResult res = VK_SUCCESS;
     struct loader_instance *inst = NULL;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkEnumeratePhysicalDeviceGroups);
     loader_platform_thread_lock_mutex(&loader_lock);
 
     inst = loader_get_instance(instance);
@@ -2599,6 +2947,7 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumeratePhysicalDeviceGroups(
 out:
 
     loader_platform_thread_unlock_mutex(&loader_lock);
+    LOADER_TRAMPOLINE_STATS_END(vkEnumeratePhysicalDeviceGroups);
     return res;
 }
 
@@ -2614,11 +2963,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceFeatures2(VkPhysical
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceFeatures2);
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
         disp->GetPhysicalDeviceFeatures2KHR(unwrapped_phys_dev, pFeatures);
     } else {
         disp->GetPhysicalDeviceFeatures2(unwrapped_phys_dev, pFeatures);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceFeatures2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceProperties2(VkPhysicalDevice physicalDevice,
@@ -2633,11 +2984,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceProperties2(VkPhysic
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceProperties2);
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
         disp->GetPhysicalDeviceProperties2KHR(unwrapped_phys_dev, pProperties);
     } else {
         disp->GetPhysicalDeviceProperties2(unwrapped_phys_dev, pProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceProperties2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceFormatProperties2(VkPhysicalDevice physicalDevice, VkFormat format,
@@ -2652,11 +3005,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceFormatProperties2(Vk
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceFormatProperties2);
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
         disp->GetPhysicalDeviceFormatProperties2KHR(unwrapped_phys_dev, format, pFormatProperties);
     } else {
         disp->GetPhysicalDeviceFormatProperties2(unwrapped_phys_dev, format, pFormatProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceFormatProperties2);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL
@@ -2672,11 +3027,15 @@ vkGetPhysicalDeviceImageFormatProperties2(VkPhysicalDevice physicalDevice, const
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceImageFormatProperties2);
+    VkResult result;
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
-        return disp->GetPhysicalDeviceImageFormatProperties2KHR(unwrapped_phys_dev, pImageFormatInfo, pImageFormatProperties);
+        result = disp->GetPhysicalDeviceImageFormatProperties2KHR(unwrapped_phys_dev, pImageFormatInfo, pImageFormatProperties);
     } else {
-        return disp->GetPhysicalDeviceImageFormatProperties2(unwrapped_phys_dev, pImageFormatInfo, pImageFormatProperties);
+        result = disp->GetPhysicalDeviceImageFormatProperties2(unwrapped_phys_dev, pImageFormatInfo, pImageFormatProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceImageFormatProperties2);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceQueueFamilyProperties2(
@@ -2691,11 +3050,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceQueueFamilyPropertie
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceQueueFamilyProperties2);
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
         disp->GetPhysicalDeviceQueueFamilyProperties2KHR(unwrapped_phys_dev, pQueueFamilyPropertyCount, pQueueFamilyProperties);
     } else {
         disp->GetPhysicalDeviceQueueFamilyProperties2(unwrapped_phys_dev, pQueueFamilyPropertyCount, pQueueFamilyProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceQueueFamilyProperties2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL
@@ -2710,11 +3071,13 @@ vkGetPhysicalDeviceMemoryProperties2(VkPhysicalDevice physicalDevice, VkPhysical
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceMemoryProperties2);
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
         disp->GetPhysicalDeviceMemoryProperties2KHR(unwrapped_phys_dev, pMemoryProperties);
     } else {
         disp->GetPhysicalDeviceMemoryProperties2(unwrapped_phys_dev, pMemoryProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceMemoryProperties2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceSparseImageFormatProperties2(
@@ -2730,11 +3093,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceSparseImageFormatPro
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSparseImageFormatProperties2);
     if (inst != NULL && inst->enabled_known_extensions.khr_get_physical_device_properties2) {
         disp->GetPhysicalDeviceSparseImageFormatProperties2KHR(unwrapped_phys_dev, pFormatInfo, pPropertyCount, pProperties);
     } else {
         disp->GetPhysicalDeviceSparseImageFormatProperties2(unwrapped_phys_dev, pFormatInfo, pPropertyCount, pProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSparseImageFormatProperties2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalBufferProperties(
@@ -2750,11 +3115,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalBufferProper
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceExternalBufferProperties);
     if (inst != NULL && inst->enabled_known_extensions.khr_external_memory_capabilities) {
         disp->GetPhysicalDeviceExternalBufferPropertiesKHR(unwrapped_phys_dev, pExternalBufferInfo, pExternalBufferProperties);
     } else {
         disp->GetPhysicalDeviceExternalBufferProperties(unwrapped_phys_dev, pExternalBufferInfo, pExternalBufferProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceExternalBufferProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalSemaphoreProperties(
@@ -2770,6 +3137,7 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalSemaphorePro
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceExternalSemaphoreProperties);
     if (inst != NULL && inst->enabled_known_extensions.khr_external_semaphore_capabilities) {
         disp->GetPhysicalDeviceExternalSemaphorePropertiesKHR(unwrapped_phys_dev, pExternalSemaphoreInfo,
                                                               pExternalSemaphoreProperties);
@@ -2777,6 +3145,7 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalSemaphorePro
         disp->GetPhysicalDeviceExternalSemaphoreProperties(unwrapped_phys_dev, pExternalSemaphoreInfo,
                                                            pExternalSemaphoreProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceExternalSemaphoreProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalFenceProperties(
@@ -2792,11 +3161,13 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPhysicalDeviceExternalFencePropert
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
     const struct loader_instance *inst = ((struct loader_physical_device_tramp *)physicalDevice)->this_instance;
 
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceExternalFenceProperties);
     if (inst != NULL && inst->enabled_known_extensions.khr_external_fence_capabilities) {
         disp->GetPhysicalDeviceExternalFencePropertiesKHR(unwrapped_phys_dev, pExternalFenceInfo, pExternalFenceProperties);
     } else {
         disp->GetPhysicalDeviceExternalFenceProperties(unwrapped_phys_dev, pExternalFenceInfo, pExternalFenceProperties);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceExternalFenceProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindBufferMemory2(VkDevice device, uint32_t bindInfoCount,
@@ -2807,7 +3178,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindBufferMemory2(VkDevice device
                    "vkBindBufferMemory2: Invalid device [VUID-vkBindBufferMemory2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->BindBufferMemory2(device, bindInfoCount, pBindInfos);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkBindBufferMemory2);
+    VkResult result = disp->BindBufferMemory2(device, bindInfoCount, pBindInfos);
+    LOADER_TRAMPOLINE_STATS_END(vkBindBufferMemory2);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindImageMemory2(VkDevice device, uint32_t bindInfoCount,
@@ -2818,7 +3192,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkBindImageMemory2(VkDevice device,
                    "vkBindImageMemory2: Invalid device [VUID-vkBindImageMemory2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->BindImageMemory2(device, bindInfoCount, pBindInfos);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkBindImageMemory2);
+    VkResult result = disp->BindImageMemory2(device, bindInfoCount, pBindInfos);
+    LOADER_TRAMPOLINE_STATS_END(vkBindImageMemory2);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceGroupPeerMemoryFeatures(VkDevice device, uint32_t heapIndex,
@@ -2830,7 +3207,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceGroupPeerMemoryFeatures(VkDe
                    "vkGetDeviceGroupPeerMemoryFeatures: Invalid device [VUID-vkGetDeviceGroupPeerMemoryFeatures-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceGroupPeerMemoryFeatures);
     disp->GetDeviceGroupPeerMemoryFeatures(device, heapIndex, localDeviceIndex, remoteDeviceIndex, pPeerMemoryFeatures);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceGroupPeerMemoryFeatures);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDeviceMask(VkCommandBuffer commandBuffer, uint32_t deviceMask) {
@@ -2840,7 +3219,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDeviceMask(VkCommandBuffer comm
                    "vkCmdSetDeviceMask: Invalid commandBuffer [VUID-vkCmdSetDeviceMask-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDeviceMask);
     disp->CmdSetDeviceMask(commandBuffer, deviceMask);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDeviceMask);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDispatchBase(VkCommandBuffer commandBuffer, uint32_t baseGroupX, uint32_t baseGroupY,
@@ -2852,7 +3233,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDispatchBase(VkCommandBuffer comma
                    "vkCmdDispatchBase: Invalid commandBuffer [VUID-vkCmdDispatchBase-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDispatchBase);
     disp->CmdDispatchBase(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDispatchBase);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageMemoryRequirements2(VkDevice device, const VkImageMemoryRequirementsInfo2 *pInfo,
@@ -2863,7 +3246,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageMemoryRequirements2(VkDevice
                    "vkGetImageMemoryRequirements2: Invalid device [VUID-vkGetImageMemoryRequirements2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetImageMemoryRequirements2);
     disp->GetImageMemoryRequirements2(device, pInfo, pMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetImageMemoryRequirements2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetBufferMemoryRequirements2(VkDevice device,
@@ -2875,7 +3260,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetBufferMemoryRequirements2(VkDevice
                    "vkGetBufferMemoryRequirements2: Invalid device [VUID-vkGetBufferMemoryRequirements2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetBufferMemoryRequirements2);
     disp->GetBufferMemoryRequirements2(device, pInfo, pMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetBufferMemoryRequirements2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageSparseMemoryRequirements2(
@@ -2888,7 +3275,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageSparseMemoryRequirements2(
             "vkGetImageSparseMemoryRequirements2: Invalid device [VUID-vkGetImageSparseMemoryRequirements2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetImageSparseMemoryRequirements2);
     disp->GetImageSparseMemoryRequirements2(device, pInfo, pSparseMemoryRequirementCount, pSparseMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetImageSparseMemoryRequirements2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkTrimCommandPool(VkDevice device, VkCommandPool commandPool,
@@ -2899,7 +3288,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkTrimCommandPool(VkDevice device, VkCo
                    "vkTrimCommandPool: Invalid device [VUID-vkTrimCommandPool-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkTrimCommandPool);
     disp->TrimCommandPool(device, commandPool, flags);
+    LOADER_TRAMPOLINE_STATS_END(vkTrimCommandPool);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceQueue2(VkDevice device, const VkDeviceQueueInfo2 *pQueueInfo, VkQueue *pQueue) {
@@ -2909,10 +3300,12 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceQueue2(VkDevice device, cons
                    "vkGetDeviceQueue2: Invalid device [VUID-vkGetDeviceQueue2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceQueue2);
     disp->GetDeviceQueue2(device, pQueueInfo, pQueue);
     if (pQueue != NULL && *pQueue != NULL) {
         loader_set_dispatch(*pQueue, disp);
     }
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceQueue2);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSamplerYcbcrConversion(VkDevice device,
@@ -2925,7 +3318,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSamplerYcbcrConversion(VkDe
                    "vkCreateSamplerYcbcrConversion: Invalid device [VUID-vkCreateSamplerYcbcrConversion-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CreateSamplerYcbcrConversion(device, pCreateInfo, pAllocator, pYcbcrConversion);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateSamplerYcbcrConversion);
+    VkResult result = disp->CreateSamplerYcbcrConversion(device, pCreateInfo, pAllocator, pYcbcrConversion);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateSamplerYcbcrConversion);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySamplerYcbcrConversion(VkDevice device, VkSamplerYcbcrConversion ycbcrConversion,
@@ -2936,7 +3332,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySamplerYcbcrConversion(VkDevic
                    "vkDestroySamplerYcbcrConversion: Invalid device [VUID-vkDestroySamplerYcbcrConversion-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroySamplerYcbcrConversion);
     disp->DestroySamplerYcbcrConversion(device, ycbcrConversion, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroySamplerYcbcrConversion);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDescriptorSetLayoutSupport(VkDevice device,
@@ -2948,7 +3346,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDescriptorSetLayoutSupport(VkDevic
                    "vkGetDescriptorSetLayoutSupport: Invalid device [VUID-vkGetDescriptorSetLayoutSupport-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDescriptorSetLayoutSupport);
     disp->GetDescriptorSetLayoutSupport(device, pCreateInfo, pSupport);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDescriptorSetLayoutSupport);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL
@@ -2960,7 +3360,10 @@ vkCreateDescriptorUpdateTemplate(VkDevice device, const VkDescriptorUpdateTempla
                    "vkCreateDescriptorUpdateTemplate: Invalid device [VUID-vkCreateDescriptorUpdateTemplate-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CreateDescriptorUpdateTemplate(device, pCreateInfo, pAllocator, pDescriptorUpdateTemplate);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDescriptorUpdateTemplate);
+    VkResult result = disp->CreateDescriptorUpdateTemplate(device, pCreateInfo, pAllocator, pDescriptorUpdateTemplate);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDescriptorUpdateTemplate);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDescriptorUpdateTemplate(VkDevice device,
@@ -2972,7 +3375,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyDescriptorUpdateTemplate(VkDev
                    "vkDestroyDescriptorUpdateTemplate: Invalid device [VUID-vkDestroyDescriptorUpdateTemplate-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyDescriptorUpdateTemplate);
     disp->DestroyDescriptorUpdateTemplate(device, descriptorUpdateTemplate, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyDescriptorUpdateTemplate);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkUpdateDescriptorSetWithTemplate(VkDevice device, VkDescriptorSet descriptorSet,
@@ -2984,7 +3389,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkUpdateDescriptorSetWithTemplate(VkDev
                    "vkUpdateDescriptorSetWithTemplate: Invalid device [VUID-vkUpdateDescriptorSetWithTemplate-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkUpdateDescriptorSetWithTemplate);
     disp->UpdateDescriptorSetWithTemplate(device, descriptorSet, descriptorUpdateTemplate, pData);
+    LOADER_TRAMPOLINE_STATS_END(vkUpdateDescriptorSetWithTemplate);
 }
 
 // ---- Vulkan core 1.2 trampolines
@@ -2998,7 +3405,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateRenderPass2(VkDevice device
                    "vkCreateRenderPass2: Invalid device [VUID-vkCreateRenderPass2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CreateRenderPass2(device, pCreateInfo, pAllocator, pRenderPass);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateRenderPass2);
+    VkResult result = disp->CreateRenderPass2(device, pCreateInfo, pAllocator, pRenderPass);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateRenderPass2);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBeginRenderPass2(VkCommandBuffer commandBuffer,
@@ -3010,7 +3420,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBeginRenderPass2(VkCommandBuffer c
                    "vkCmdBeginRenderPass2: Invalid commandBuffer [VUID-vkCmdBeginRenderPass2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBeginRenderPass2);
     disp->CmdBeginRenderPass2(commandBuffer, pRenderPassBegin, pSubpassBeginInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBeginRenderPass2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdNextSubpass2(VkCommandBuffer commandBuffer,
@@ -3022,7 +3434,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdNextSubpass2(VkCommandBuffer comma
                    "vkCmdNextSubpass2: Invalid commandBuffer [VUID-vkCmdNextSubpass2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdNextSubpass2);
     disp->CmdNextSubpass2(commandBuffer, pSubpassBeginInfo, pSubpassEndInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdNextSubpass2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdEndRenderPass2(VkCommandBuffer commandBuffer,
@@ -3033,7 +3447,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdEndRenderPass2(VkCommandBuffer com
                    "vkCmdEndRenderPass2: Invalid commandBuffer [VUID-vkCmdEndRenderPass2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdEndRenderPass2);
     disp->CmdEndRenderPass2(commandBuffer, pSubpassEndInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdEndRenderPass2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndirectCount(VkCommandBuffer commandBuffer, VkBuffer buffer, VkDeviceSize offset,
@@ -3045,7 +3461,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndirectCount(VkCommandBuffer
                    "vkCmdDrawIndirectCount: Invalid commandBuffer [VUID-vkCmdDrawIndirectCount-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDrawIndirectCount);
     disp->CmdDrawIndirectCount(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDrawIndirectCount);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndexedIndirectCount(VkCommandBuffer commandBuffer, VkBuffer buffer,
@@ -3059,7 +3477,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdDrawIndexedIndirectCount(VkCommand
                    "[VUID-vkCmdDrawIndexedIndirectCount-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdDrawIndexedIndirectCount);
     disp->CmdDrawIndexedIndirectCount(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdDrawIndexedIndirectCount);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetSemaphoreCounterValue(VkDevice device, VkSemaphore semaphore, uint64_t *pValue) {
@@ -3069,7 +3489,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetSemaphoreCounterValue(VkDevice
                    "vkGetSemaphoreCounterValue: Invalid device [VUID-vkGetSemaphoreCounterValue-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetSemaphoreCounterValue(device, semaphore, pValue);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetSemaphoreCounterValue);
+    VkResult result = disp->GetSemaphoreCounterValue(device, semaphore, pValue);
+    LOADER_TRAMPOLINE_STATS_END(vkGetSemaphoreCounterValue);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkWaitSemaphores(VkDevice device, const VkSemaphoreWaitInfo *pWaitInfo,
@@ -3080,7 +3503,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkWaitSemaphores(VkDevice device, c
                    "vkWaitSemaphores: Invalid device [VUID-vkWaitSemaphores-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->WaitSemaphores(device, pWaitInfo, timeout);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkWaitSemaphores);
+    VkResult result = disp->WaitSemaphores(device, pWaitInfo, timeout);
+    LOADER_TRAMPOLINE_STATS_END(vkWaitSemaphores);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkSignalSemaphore(VkDevice device, const VkSemaphoreSignalInfo *pSignalInfo) {
@@ -3090,7 +3516,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkSignalSemaphore(VkDevice device,
                    "vkSignalSemaphore: Invalid device [VUID-vkSignalSemaphore-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->SignalSemaphore(device, pSignalInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkSignalSemaphore);
+    VkResult result = disp->SignalSemaphore(device, pSignalInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkSignalSemaphore);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkDeviceAddress VKAPI_CALL vkGetBufferDeviceAddress(VkDevice device,
@@ -3101,7 +3530,10 @@ LOADER_EXPORT VKAPI_ATTR VkDeviceAddress VKAPI_CALL vkGetBufferDeviceAddress(VkD
                    "vkGetBufferDeviceAddress: Invalid device [VUID-vkGetBufferDeviceAddress-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetBufferDeviceAddress(device, pInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetBufferDeviceAddress);
+    VkDeviceAddress result = disp->GetBufferDeviceAddress(device, pInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkGetBufferDeviceAddress);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR uint64_t VKAPI_CALL vkGetBufferOpaqueCaptureAddress(VkDevice device,
@@ -3112,7 +3544,10 @@ LOADER_EXPORT VKAPI_ATTR uint64_t VKAPI_CALL vkGetBufferOpaqueCaptureAddress(VkD
                    "vkGetBufferOpaqueCaptureAddress: Invalid device [VUID-vkGetBufferOpaqueCaptureAddress-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetBufferOpaqueCaptureAddress(device, pInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetBufferOpaqueCaptureAddress);
+    uint64_t result = disp->GetBufferOpaqueCaptureAddress(device, pInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkGetBufferOpaqueCaptureAddress);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR uint64_t VKAPI_CALL
@@ -3124,7 +3559,10 @@ vkGetDeviceMemoryOpaqueCaptureAddress(VkDevice device, const VkDeviceMemoryOpaqu
                    "[VUID-vkGetDeviceMemoryOpaqueCaptureAddress-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetDeviceMemoryOpaqueCaptureAddress(device, pInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceMemoryOpaqueCaptureAddress);
+    uint64_t result = disp->GetDeviceMemoryOpaqueCaptureAddress(device, pInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceMemoryOpaqueCaptureAddress);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkResetQueryPool(VkDevice device, VkQueryPool queryPool, uint32_t firstQuery,
@@ -3135,7 +3573,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkResetQueryPool(VkDevice device, VkQue
                    "vkResetQueryPool: Invalid device [VUID-vkResetQueryPool-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkResetQueryPool);
     disp->ResetQueryPool(device, queryPool, firstQuery, queryCount);
+    LOADER_TRAMPOLINE_STATS_END(vkResetQueryPool);
 }
 
 // ---- Vulkan core 1.3 trampolines
@@ -3154,20 +3594,25 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceToolProperties(V
         abort(); /* Intentionally fail so user can correct issue. */
     }
 
-    return disp->GetPhysicalDeviceToolProperties(unwrapped_phys_dev, pToolCount, pToolProperties);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceToolProperties);
+    VkResult result = disp->GetPhysicalDeviceToolProperties(unwrapped_phys_dev, pToolCount, pToolProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceToolProperties);
+    return result;
 }
 
 // Device
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBeginRendering(VkCommandBuffer commandBuffer, const VkRenderingInfo *pRenderingInfo) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdBeginRendering: Invalid commandBuffer "
                    "[VUID-vkCmdBeginRendering-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBeginRendering);
     disp->CmdBeginRendering(commandBuffer, pRenderingInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBeginRendering);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindVertexBuffers2(VkCommandBuffer commandBuffer, uint32_t firstBinding,
@@ -3181,7 +3626,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindVertexBuffers2(VkCommandBuffer
                    "[VUID-vkCmdBindVertexBuffers2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindVertexBuffers2);
     disp->CmdBindVertexBuffers2(commandBuffer, firstBinding, bindingCount, pBuffers, pOffsets, pSizes, pStrides);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindVertexBuffers2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBlitImage2(VkCommandBuffer commandBuffer, const VkBlitImageInfo2 *pBlitImageInfo) {
@@ -3192,7 +3639,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBlitImage2(VkCommandBuffer command
                    "[VUID-vkCmdBlitImage2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBlitImage2);
     disp->CmdBlitImage2(commandBuffer, pBlitImageInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBlitImage2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyBuffer2(VkCommandBuffer commandBuffer, const VkCopyBufferInfo2 *pCopyBufferInfo) {
@@ -3203,7 +3652,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyBuffer2(VkCommandBuffer comman
                    "[VUID-vkCmdCopyBuffer2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyBuffer2);
     disp->CmdCopyBuffer2(commandBuffer, pCopyBufferInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyBuffer2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyBufferToImage2(VkCommandBuffer commandBuffer,
@@ -3215,7 +3666,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyBufferToImage2(VkCommandBuffer
                    "[VUID-vkCmdCopyBufferToImage2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyBufferToImage2);
     disp->CmdCopyBufferToImage2(commandBuffer, pCopyBufferToImageInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyBufferToImage2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImage2(VkCommandBuffer commandBuffer, const VkCopyImageInfo2 *pCopyImageInfo) {
@@ -3226,7 +3679,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImage2(VkCommandBuffer command
                    "[VUID-vkCmdCopyImage2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyImage2);
     disp->CmdCopyImage2(commandBuffer, pCopyImageInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyImage2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImageToBuffer2(VkCommandBuffer commandBuffer,
@@ -3238,30 +3693,36 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdCopyImageToBuffer2(VkCommandBuffer
                    "[VUID-vkCmdCopyImageToBuffer2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdCopyImageToBuffer2);
     disp->CmdCopyImageToBuffer2(commandBuffer, pCopyImageToBufferInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdCopyImageToBuffer2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdEndRendering(VkCommandBuffer commandBuffer) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdEndRendering: Invalid commandBuffer "
                    "[VUID-vkCmdEndRendering-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdEndRendering);
     disp->CmdEndRendering(commandBuffer);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdEndRendering);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPipelineBarrier2(VkCommandBuffer commandBuffer,
                                                                const VkDependencyInfo *pDependencyInfo) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(commandBuffer);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(commandBuffer);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkCmdPipelineBarrier2: Invalid commandBuffer "
                    "[VUID-vkCmdPipelineBarrier2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPipelineBarrier2);
     disp->CmdPipelineBarrier2(commandBuffer, pDependencyInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPipelineBarrier2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResetEvent2(VkCommandBuffer commandBuffer, VkEvent event,
@@ -3273,7 +3734,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResetEvent2(VkCommandBuffer comman
                    "[VUID-vkCmdResetEvent2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdResetEvent2);
     disp->CmdResetEvent2(commandBuffer, event, stageMask);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdResetEvent2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResolveImage2(VkCommandBuffer commandBuffer,
@@ -3285,7 +3748,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdResolveImage2(VkCommandBuffer comm
                    "[VUID-vkCmdResolveImage2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdResolveImage2);
     disp->CmdResolveImage2(commandBuffer, pResolveImageInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdResolveImage2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetCullMode(VkCommandBuffer commandBuffer, VkCullModeFlags cullMode) {
@@ -3296,7 +3761,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetCullMode(VkCommandBuffer comman
                    "[VUID-vkCmdSetCullMode-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetCullMode);
     disp->CmdSetCullMode(commandBuffer, cullMode);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetCullMode);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBiasEnable(VkCommandBuffer commandBuffer, VkBool32 depthBiasEnable) {
@@ -3307,7 +3774,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBiasEnable(VkCommandBuffer
                    "[VUID-vkCmdSetDepthBiasEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthBiasEnable);
     disp->CmdSetDepthBiasEnable(commandBuffer, depthBiasEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthBiasEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBoundsTestEnable(VkCommandBuffer commandBuffer,
@@ -3319,7 +3788,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthBoundsTestEnable(VkCommand
                    "[VUID-vkCmdSetDepthBoundsTestEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthBoundsTestEnable);
     disp->CmdSetDepthBoundsTestEnable(commandBuffer, depthBoundsTestEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthBoundsTestEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthCompareOp(VkCommandBuffer commandBuffer, VkCompareOp depthCompareOp) {
@@ -3330,7 +3801,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthCompareOp(VkCommandBuffer
                    "[VUID-vkCmdSetDepthCompareOp-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthCompareOp);
     disp->CmdSetDepthCompareOp(commandBuffer, depthCompareOp);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthCompareOp);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthTestEnable(VkCommandBuffer commandBuffer, VkBool32 depthTestEnable) {
@@ -3341,7 +3814,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthTestEnable(VkCommandBuffer
                    "[VUID-vkCmdSetDepthTestEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthTestEnable);
     disp->CmdSetDepthTestEnable(commandBuffer, depthTestEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthTestEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthWriteEnable(VkCommandBuffer commandBuffer, VkBool32 depthWriteEnable) {
@@ -3352,7 +3827,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetDepthWriteEnable(VkCommandBuffe
                    "[VUID-vkCmdSetDepthWriteEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetDepthWriteEnable);
     disp->CmdSetDepthWriteEnable(commandBuffer, depthWriteEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetDepthWriteEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetEvent2(VkCommandBuffer commandBuffer, VkEvent event,
@@ -3364,7 +3841,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetEvent2(VkCommandBuffer commandB
                    "[VUID-vkCmdSetEvent2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetEvent2);
     disp->CmdSetEvent2(commandBuffer, event, pDependencyInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetEvent2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetFrontFace(VkCommandBuffer commandBuffer, VkFrontFace frontFace) {
@@ -3375,7 +3854,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetFrontFace(VkCommandBuffer comma
                    "[VUID-vkCmdSetFrontFace-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetFrontFace);
     disp->CmdSetFrontFace(commandBuffer, frontFace);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetFrontFace);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetPrimitiveRestartEnable(VkCommandBuffer commandBuffer,
@@ -3387,7 +3868,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetPrimitiveRestartEnable(VkComman
                    "[VUID-vkCmdSetPrimitiveRestartEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetPrimitiveRestartEnable);
     disp->CmdSetPrimitiveRestartEnable(commandBuffer, primitiveRestartEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetPrimitiveRestartEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetPrimitiveTopology(VkCommandBuffer commandBuffer,
@@ -3399,7 +3882,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetPrimitiveTopology(VkCommandBuff
                    "[VUID-vkCmdSetPrimitiveTopology-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetPrimitiveTopology);
     disp->CmdSetPrimitiveTopology(commandBuffer, primitiveTopology);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetPrimitiveTopology);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetRasterizerDiscardEnable(VkCommandBuffer commandBuffer,
@@ -3411,7 +3896,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetRasterizerDiscardEnable(VkComma
                    "[VUID-vkCmdSetRasterizerDiscardEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetRasterizerDiscardEnable);
     disp->CmdSetRasterizerDiscardEnable(commandBuffer, rasterizerDiscardEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetRasterizerDiscardEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetScissorWithCount(VkCommandBuffer commandBuffer, uint32_t scissorCount,
@@ -3423,7 +3910,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetScissorWithCount(VkCommandBuffe
                    "[VUID-vkCmdSetScissorWithCount-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetScissorWithCount);
     disp->CmdSetScissorWithCount(commandBuffer, scissorCount, pScissors);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetScissorWithCount);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilOp(VkCommandBuffer commandBuffer, VkStencilFaceFlags faceMask,
@@ -3436,7 +3925,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilOp(VkCommandBuffer comma
                    "[VUID-vkCmdSetStencilOp-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetStencilOp);
     disp->CmdSetStencilOp(commandBuffer, faceMask, failOp, passOp, depthFailOp, compareOp);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetStencilOp);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilTestEnable(VkCommandBuffer commandBuffer, VkBool32 stencilTestEnable) {
@@ -3447,7 +3938,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetStencilTestEnable(VkCommandBuff
                    "[VUID-vkCmdSetStencilTestEnable-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetStencilTestEnable);
     disp->CmdSetStencilTestEnable(commandBuffer, stencilTestEnable);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetStencilTestEnable);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetViewportWithCount(VkCommandBuffer commandBuffer, uint32_t viewportCount,
@@ -3459,7 +3952,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetViewportWithCount(VkCommandBuff
                    "[VUID-vkCmdSetViewportWithCount-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetViewportWithCount);
     disp->CmdSetViewportWithCount(commandBuffer, viewportCount, pViewports);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetViewportWithCount);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWaitEvents2(VkCommandBuffer commandBuffer, uint32_t eventCount,
@@ -3471,7 +3966,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWaitEvents2(VkCommandBuffer comman
                    "[VUID-vkCmdWaitEvents2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdWaitEvents2);
     disp->CmdWaitEvents2(commandBuffer, eventCount, pEvents, pDependencyInfos);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdWaitEvents2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWriteTimestamp2(VkCommandBuffer commandBuffer, VkPipelineStageFlags2 stage,
@@ -3483,7 +3980,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdWriteTimestamp2(VkCommandBuffer co
                    "[VUID-vkCmdWriteTimestamp2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdWriteTimestamp2);
     disp->CmdWriteTimestamp2(commandBuffer, stage, queryPool, query);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdWriteTimestamp2);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreatePrivateDataSlot(VkDevice device,
@@ -3497,7 +3996,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreatePrivateDataSlot(VkDevice de
                    "[VUID-vkCreatePrivateDataSlot-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CreatePrivateDataSlot(device, pCreateInfo, pAllocator, pPrivateDataSlot);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreatePrivateDataSlot);
+    VkResult result = disp->CreatePrivateDataSlot(device, pCreateInfo, pAllocator, pPrivateDataSlot);
+    LOADER_TRAMPOLINE_STATS_END(vkCreatePrivateDataSlot);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPrivateDataSlot(VkDevice device, VkPrivateDataSlot privateDataSlot,
@@ -3509,7 +4011,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroyPrivateDataSlot(VkDevice devic
                    "[VUID-vkDestroyPrivateDataSlot-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroyPrivateDataSlot);
     disp->DestroyPrivateDataSlot(device, privateDataSlot, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroyPrivateDataSlot);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceBufferMemoryRequirements(VkDevice device,
@@ -3522,7 +4026,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceBufferMemoryRequirements(VkD
                    "[VUID-vkGetDeviceBufferMemoryRequirements-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceBufferMemoryRequirements);
     disp->GetDeviceBufferMemoryRequirements(device, pInfo, pMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceBufferMemoryRequirements);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceImageMemoryRequirements(VkDevice device,
@@ -3535,7 +4041,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceImageMemoryRequirements(VkDe
                    "[VUID-vkGetDeviceImageMemoryRequirements-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceImageMemoryRequirements);
     disp->GetDeviceImageMemoryRequirements(device, pInfo, pMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceImageMemoryRequirements);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceImageSparseMemoryRequirements(
@@ -3548,7 +4056,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceImageSparseMemoryRequirement
                    "[VUID-vkGetDeviceImageSparseMemoryRequirements-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceImageSparseMemoryRequirements);
     disp->GetDeviceImageSparseMemoryRequirements(device, pInfo, pSparseMemoryRequirementCount, pSparseMemoryRequirements);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceImageSparseMemoryRequirements);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPrivateData(VkDevice device, VkObjectType objectType, uint64_t objectHandle,
@@ -3560,7 +4070,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetPrivateData(VkDevice device, VkObj
                    "[VUID-vkGetPrivateData-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPrivateData);
     disp->GetPrivateData(device, objectType, objectHandle, privateDataSlot, pData);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPrivateData);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkSetPrivateData(VkDevice device, VkObjectType objectType, uint64_t objectHandle,
@@ -3572,19 +4084,25 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkSetPrivateData(VkDevice device, V
                    "[VUID-vkSetPrivateData-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->SetPrivateData(device, objectType, objectHandle, privateDataSlot, data);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkSetPrivateData);
+    VkResult result = disp->SetPrivateData(device, objectType, objectHandle, privateDataSlot, data);
+    LOADER_TRAMPOLINE_STATS_END(vkSetPrivateData);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueueSubmit2(VkQueue queue, uint32_t submitCount, const VkSubmitInfo2 *pSubmits,
                                                             VkFence fence) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(queue);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(queue);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkQueueSubmit2: Invalid queue "
                    "[VUID-vkQueueSubmit2-queue-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->QueueSubmit2(queue, submitCount, pSubmits, fence);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkQueueSubmit2);
+    VkResult result = disp->QueueSubmit2(queue, submitCount, pSubmits, fence);
+    LOADER_TRAMPOLINE_STATS_END(vkQueueSubmit2);
+    return result;
 }
 
 // ---- Vulkan core 1.4 trampolines
@@ -3603,7 +4121,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetRenderingAreaGranularity(VkDevice
                    "[VUID-vkGetRenderingAreaGranularity-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetRenderingAreaGranularity);
     disp->GetRenderingAreaGranularity(device, pRenderingAreaInfo, pGranularity);
+    LOADER_TRAMPOLINE_STATS_END(vkGetRenderingAreaGranularity);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSet(VkCommandBuffer commandBuffer,
@@ -3617,7 +4137,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSet(VkCommandBuffer
                    "[VUID-vkCmdPushDescriptorSet-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPushDescriptorSet);
     disp->CmdPushDescriptorSet(commandBuffer, pipelineBindPoint, layout, set, descriptorWriteCount, pDescriptorWrites);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPushDescriptorSet);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSetWithTemplate(VkCommandBuffer commandBuffer,
@@ -3631,7 +4153,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSetWithTemplate(VkCo
                    "[VUID-vkCmdPushDescriptorSetWithTemplate-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPushDescriptorSetWithTemplate);
     disp->CmdPushDescriptorSetWithTemplate(commandBuffer, descriptorUpdateTemplate, layout, set, pData);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPushDescriptorSetWithTemplate);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetLineStipple(VkCommandBuffer commandBuffer, uint32_t lineStippleFactor,
@@ -3643,7 +4167,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetLineStipple(VkCommandBuffer com
                    "[VUID-vkCmdSetLineStipple-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetLineStipple);
     disp->CmdSetLineStipple(commandBuffer, lineStippleFactor, lineStipplePattern);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetLineStipple);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindIndexBuffer2(VkCommandBuffer commandBuffer, VkBuffer buffer, VkDeviceSize offset,
@@ -3655,7 +4181,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindIndexBuffer2(VkCommandBuffer c
                    "[VUID-vkCmdBindIndexBuffer2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindIndexBuffer2);
     disp->CmdBindIndexBuffer2(commandBuffer, buffer, offset, size, indexType);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindIndexBuffer2);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCopyMemoryToImage(VkDevice device,
@@ -3667,7 +4195,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCopyMemoryToImage(VkDevice device
                    "[VUID-vkCopyMemoryToImage-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CopyMemoryToImage(device, pCopyMemoryToImageInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCopyMemoryToImage);
+    VkResult result = disp->CopyMemoryToImage(device, pCopyMemoryToImageInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCopyMemoryToImage);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCopyImageToMemory(VkDevice device,
@@ -3679,7 +4210,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCopyImageToMemory(VkDevice device
                    "[VUID-vkCopyImageToMemory-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CopyImageToMemory(device, pCopyImageToMemoryInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCopyImageToMemory);
+    VkResult result = disp->CopyImageToMemory(device, pCopyImageToMemoryInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCopyImageToMemory);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCopyImageToImage(VkDevice device,
@@ -3691,7 +4225,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCopyImageToImage(VkDevice device,
                    "[VUID-vkCopyImageToImage-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CopyImageToImage(device, pCopyImageToImageInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCopyImageToImage);
+    VkResult result = disp->CopyImageToImage(device, pCopyImageToImageInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCopyImageToImage);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkTransitionImageLayout(VkDevice device, uint32_t transitionCount,
@@ -3703,7 +4240,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkTransitionImageLayout(VkDevice de
                    "[VUID-vkTransitionImageLayout-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->TransitionImageLayout(device, transitionCount, pTransitions);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkTransitionImageLayout);
+    VkResult result = disp->TransitionImageLayout(device, transitionCount, pTransitions);
+    LOADER_TRAMPOLINE_STATS_END(vkTransitionImageLayout);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceImageSubresourceLayout(VkDevice device,
@@ -3716,7 +4256,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetDeviceImageSubresourceLayout(VkDev
                    "[VUID-vkGetDeviceImageSubresourceLayout-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceImageSubresourceLayout);
     disp->GetDeviceImageSubresourceLayout(device, pInfo, pLayout);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceImageSubresourceLayout);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageSubresourceLayout2(VkDevice device, VkImage image,
@@ -3729,7 +4271,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkGetImageSubresourceLayout2(VkDevice d
                    "[VUID-vkGetImageSubresourceLayout2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetImageSubresourceLayout2);
     disp->GetImageSubresourceLayout2(device, image, pSubresource, pLayout);
+    LOADER_TRAMPOLINE_STATS_END(vkGetImageSubresourceLayout2);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkMapMemory2(VkDevice device, const VkMemoryMapInfo *pMemoryMapInfo, void **ppData) {
@@ -3740,7 +4284,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkMapMemory2(VkDevice device, const
                    "[VUID-vkMapMemory2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->MapMemory2(device, pMemoryMapInfo, ppData);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkMapMemory2);
+    VkResult result = disp->MapMemory2(device, pMemoryMapInfo, ppData);
+    LOADER_TRAMPOLINE_STATS_END(vkMapMemory2);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkUnmapMemory2(VkDevice device, const VkMemoryUnmapInfo *pMemoryUnmapInfo) {
@@ -3751,7 +4298,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkUnmapMemory2(VkDevice device, con
                    "[VUID-vkUnmapMemory2-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->UnmapMemory2(device, pMemoryUnmapInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkUnmapMemory2);
+    VkResult result = disp->UnmapMemory2(device, pMemoryUnmapInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkUnmapMemory2);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindDescriptorSets2(VkCommandBuffer commandBuffer,
@@ -3763,7 +4313,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdBindDescriptorSets2(VkCommandBuffe
                    "[VUID-vkCmdBindDescriptorSets2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdBindDescriptorSets2);
     disp->CmdBindDescriptorSets2(commandBuffer, pBindDescriptorSetsInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdBindDescriptorSets2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushConstants2(VkCommandBuffer commandBuffer,
@@ -3775,7 +4327,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushConstants2(VkCommandBuffer com
                    "[VUID-vkCmdPushConstants2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPushConstants2);
     disp->CmdPushConstants2(commandBuffer, pPushConstantsInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPushConstants2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSet2(VkCommandBuffer commandBuffer,
@@ -3787,7 +4341,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSet2(VkCommandBuffer
                    "[VUID-vkCmdPushDescriptorSet2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPushDescriptorSet2);
     disp->CmdPushDescriptorSet2(commandBuffer, pPushDescriptorSetInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPushDescriptorSet2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSetWithTemplate2(
@@ -3799,7 +4355,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdPushDescriptorSetWithTemplate2(
                    "[VUID-vkCmdPushDescriptorSetWithTemplate2-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdPushDescriptorSetWithTemplate2);
     disp->CmdPushDescriptorSetWithTemplate2(commandBuffer, pPushDescriptorSetWithTemplateInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdPushDescriptorSetWithTemplate2);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL
@@ -3811,7 +4369,9 @@ vkCmdSetRenderingAttachmentLocations(VkCommandBuffer commandBuffer, const VkRend
                    "[VUID-vkCmdSetRenderingAttachmentLocations-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetRenderingAttachmentLocations);
     disp->CmdSetRenderingAttachmentLocations(commandBuffer, pLocationInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetRenderingAttachmentLocations);
 }
 
 LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetRenderingInputAttachmentIndices(
@@ -3823,5 +4383,7 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkCmdSetRenderingInputAttachmentIndices
                    "[VUID-vkCmdSetRenderingInputAttachmentIndices-commandBuffer-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCmdSetRenderingInputAttachmentIndices);
     disp->CmdSetRenderingInputAttachmentIndices(commandBuffer, pInputAttachmentIndexInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkCmdSetRenderingInputAttachmentIndices);
 }
@@ -57,6 +57,7 @@
 #include <pthread.h>
 #include <stdlib.h>
 #include <libgen.h>
+#include <time.h>
 
 #elif defined(_WIN32)
 // WinBase.h defines CreateSemaphore and synchapi.h defines CreateEvent
@@ -442,6 +443,27 @@ static inline void loader_platform_thread_lock_mutex(loader_platform_thread_mute
 static inline void loader_platform_thread_unlock_mutex(loader_platform_thread_mutex *pMutex) { pthread_mutex_unlock(pMutex); }
 static inline void loader_platform_thread_delete_mutex(loader_platform_thread_mutex *pMutex) { pthread_mutex_destroy(pMutex); }
 
+// Atomic counters:
+static inline void loader_platform_atomic_add_uint64(volatile uint64_t *pValue, uint64_t amount) {
+    __atomic_fetch_add(pValue, amount, __ATOMIC_RELAXED);
+}
+static inline uint64_t loader_platform_atomic_load_uint64(volatile uint64_t *pValue) {
+    return __atomic_load_n(pValue, __ATOMIC_RELAXED);
+}
+
+// Atomic pointers, published with release and read with acquire ordering:
+static inline void *loader_platform_atomic_load_pointer(void **pPointer) { return __atomic_load_n(pPointer, __ATOMIC_ACQUIRE); }
+static inline void loader_platform_atomic_store_pointer(void **pPointer, void *pointer) {
+    __atomic_store_n(pPointer, pointer, __ATOMIC_RELEASE);
+}
+
+// Monotonic clock, in nanoseconds:
+static inline uint64_t loader_platform_timestamp_ns(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (uint64_t)now.tv_sec * 1000000000ULL + (uint64_t)now.tv_nsec;
+}
+
 static inline void *thread_safe_strtok(char *str, const char *delim, char **saveptr) { return strtok_r(str, delim, saveptr); }
 
 static inline FILE *loader_fopen(const char *fileName, const char *mode) { return fopen(fileName, mode); }
@@ -608,6 +630,39 @@ static inline void loader_platform_thread_lock_mutex(loader_platform_thread_mute
 static inline void loader_platform_thread_unlock_mutex(loader_platform_thread_mutex *pMutex) { LeaveCriticalSection(pMutex); }
 static inline void loader_platform_thread_delete_mutex(loader_platform_thread_mutex *pMutex) { DeleteCriticalSection(pMutex); }
 
+// Atomic counters:
+static inline void loader_platform_atomic_add_uint64(volatile uint64_t *pValue, uint64_t amount) {
+    InterlockedExchangeAdd64((volatile LONG64 *)pValue, (LONG64)amount);
+}
+static inline uint64_t loader_platform_atomic_load_uint64(volatile uint64_t *pValue) {
+    return (uint64_t)InterlockedCompareExchange64((volatile LONG64 *)pValue, 0, 0);
+}
+
+// Atomic pointers, published with release and read with acquire ordering:
+static inline void *loader_platform_atomic_load_pointer(void **pPointer) {
+    return InterlockedCompareExchangePointer((PVOID volatile *)pPointer, NULL, NULL);
+}
+static inline void loader_platform_atomic_store_pointer(void **pPointer, void *pointer) {
+    InterlockedExchangePointer((PVOID volatile *)pPointer, pointer);
+}
+
+// Monotonic clock, in nanoseconds. The performance counter frequency is fixed at boot, so it is only queried by the
+// first call; racing first calls all store the same value.
+static inline uint64_t loader_platform_timestamp_ns(void) {
+    static volatile uint64_t performance_frequency;
+    LARGE_INTEGER counter;
+    uint64_t frequency = loader_platform_atomic_load_uint64(&performance_frequency);
+    if (0 == frequency) {
+        LARGE_INTEGER queried_frequency;
+        QueryPerformanceFrequency(&queried_frequency);
+        frequency = (uint64_t)queried_frequency.QuadPart;
+        InterlockedExchange64((volatile LONG64 *)&performance_frequency, (LONG64)frequency);
+    }
+    QueryPerformanceCounter(&counter);
+    return (uint64_t)counter.QuadPart / frequency * 1000000000ULL +
+           (uint64_t)counter.QuadPart % frequency * 1000000000ULL / frequency;
+}
+
 static inline void *thread_safe_strtok(char *str, const char *delimiters, char **context) {
     return strtok_s(str, delimiters, context);
 }
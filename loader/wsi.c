@@ -178,7 +178,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySurfaceKHR(VkInstance instance
                    "vkDestroySurfaceKHR: Invalid instance [VUID-vkDestroySurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroySurfaceKHR);
     loader_inst->disp->layer_inst_disp.DestroySurfaceKHR(loader_inst->instance, surface, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroySurfaceKHR);
 }
 
 // This is the instance chain terminator function for DestroySurfaceKHR
@@ -190,9 +192,10 @@ VKAPI_ATTR void VKAPI_CALL terminator_DestroySurfaceKHR(VkInstance instance, VkS
     if (NULL != icd_surface) {
         for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
             if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-                if (NULL != icd_term->dispatch.DestroySurfaceKHR && icd_term->surface_list.list[icd_surface->surface_index]) {
-                    icd_term->dispatch.DestroySurfaceKHR(icd_term->instance,
-                                                         icd_term->surface_list.list[icd_surface->surface_index], pAllocator);
+                if (NULL != ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR) &&
+                    icd_term->surface_list.list[icd_surface->surface_index]) {
+                    ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR)
+                    (icd_term->instance, icd_term->surface_list.list[icd_surface->surface_index], pAllocator);
                     icd_term->surface_list.list[icd_surface->surface_index] = (VkSurfaceKHR)(uintptr_t)NULL;
                 }
             } else {
@@ -220,7 +223,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceSurfaceSupportKH
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceSurfaceSupportKHR(unwrapped_phys_dev, queueFamilyIndex, surface, pSupported);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSurfaceSupportKHR);
+    VkResult result = disp->GetPhysicalDeviceSurfaceSupportKHR(unwrapped_phys_dev, queueFamilyIndex, surface, pSupported);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSurfaceSupportKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -245,7 +251,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceSupportKHR(VkP
     }
     *pSupported = false;
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfaceSupportKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceSupportKHR)) {
         // set pSupported to false as this driver doesn't support WSI functionality
         *pSupported = false;
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
@@ -257,11 +263,12 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceSupportKHR(VkP
     if (NULL != icd_term->surface_list.list &&
         icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
         icd_term->surface_list.list[icd_surface->surface_index]) {
-        return icd_term->dispatch.GetPhysicalDeviceSurfaceSupportKHR(
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceSupportKHR)(
             phys_dev_term->phys_dev, queueFamilyIndex, icd_term->surface_list.list[icd_surface->surface_index], pSupported);
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceSurfaceSupportKHR(phys_dev_term->phys_dev, queueFamilyIndex, surface, pSupported);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceSupportKHR)(phys_dev_term->phys_dev, queueFamilyIndex, surface,
+                                                                           pSupported);
 }
 
 // This is the trampoline entrypoint for GetPhysicalDeviceSurfaceCapabilitiesKHR
@@ -276,7 +283,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceSurfaceCapabilit
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceSurfaceCapabilitiesKHR(unwrapped_phys_dev, surface, pSurfaceCapabilities);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSurfaceCapabilitiesKHR);
+    VkResult result = disp->GetPhysicalDeviceSurfaceCapabilitiesKHR(unwrapped_phys_dev, surface, pSurfaceCapabilities);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSurfaceCapabilitiesKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -300,7 +310,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilitiesKH
         abort();
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilitiesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilitiesKHR)) {
         // Zero out the capabilities as this driver doesn't support WSI functionality
         memset(pSurfaceCapabilities, 0, sizeof(VkSurfaceCapabilitiesKHR));
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
@@ -312,12 +322,13 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilitiesKH
     if (NULL != phys_dev_term->this_icd_term->surface_list.list &&
         phys_dev_term->this_icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
         phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index]) {
-        return icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilitiesKHR(
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilitiesKHR)(
             phys_dev_term->phys_dev, phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index],
             pSurfaceCapabilities);
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilitiesKHR(phys_dev_term->phys_dev, surface, pSurfaceCapabilities);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilitiesKHR)(phys_dev_term->phys_dev, surface,
+                                                                                pSurfaceCapabilities);
 }
 
 // This is the trampoline entrypoint for GetPhysicalDeviceSurfaceFormatsKHR
@@ -334,7 +345,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceSurfaceFormatsKH
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceSurfaceFormatsKHR(unwrapped_phys_dev, surface, pSurfaceFormatCount, pSurfaceFormats);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSurfaceFormatsKHR);
+    VkResult result = disp->GetPhysicalDeviceSurfaceFormatsKHR(unwrapped_phys_dev, surface, pSurfaceFormatCount, pSurfaceFormats);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSurfaceFormatsKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -358,7 +372,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormatsKHR(VkP
         abort();
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfaceFormatsKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormatsKHR)) {
         // Zero out the format count as this driver doesn't support WSI functionality
         *pSurfaceFormatCount = 0;
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
@@ -371,13 +385,13 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormatsKHR(VkP
         if (NULL != phys_dev_term->this_icd_term->surface_list.list &&
             phys_dev_term->this_icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
             phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index]) {
-            return icd_term->dispatch.GetPhysicalDeviceSurfaceFormatsKHR(
+            return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormatsKHR)(
                 phys_dev_term->phys_dev, phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index],
                 pSurfaceFormatCount, pSurfaceFormats);
         }
     }
-    return icd_term->dispatch.GetPhysicalDeviceSurfaceFormatsKHR(phys_dev_term->phys_dev, surface, pSurfaceFormatCount,
-                                                                 pSurfaceFormats);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormatsKHR)(phys_dev_term->phys_dev, surface, pSurfaceFormatCount,
+                                                                           pSurfaceFormats);
 }
 
 // This is the trampoline entrypoint for GetPhysicalDeviceSurfacePresentModesKHR
@@ -394,7 +408,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceSurfacePresentMo
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceSurfacePresentModesKHR(unwrapped_phys_dev, surface, pPresentModeCount, pPresentModes);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSurfacePresentModesKHR);
+    VkResult result = disp->GetPhysicalDeviceSurfacePresentModesKHR(unwrapped_phys_dev, surface, pPresentModeCount, pPresentModes);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSurfacePresentModesKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -418,7 +435,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfacePresentModesKH
         abort();
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfacePresentModesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfacePresentModesKHR)) {
         // Zero out the present mode count as this driver doesn't support WSI functionality
         *pPresentModeCount = 0;
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
@@ -431,13 +448,13 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfacePresentModesKH
         if (icd_surface != NULL && NULL != phys_dev_term->this_icd_term->surface_list.list &&
             phys_dev_term->this_icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
             phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index]) {
-            return icd_term->dispatch.GetPhysicalDeviceSurfacePresentModesKHR(
+            return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfacePresentModesKHR)(
                 phys_dev_term->phys_dev, phys_dev_term->this_icd_term->surface_list.list[icd_surface->surface_index],
                 pPresentModeCount, pPresentModes);
         }
     }
-    return icd_term->dispatch.GetPhysicalDeviceSurfacePresentModesKHR(phys_dev_term->phys_dev, surface, pPresentModeCount,
-                                                                      pPresentModes);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfacePresentModesKHR)(phys_dev_term->phys_dev, surface, pPresentModeCount,
+                                                                                pPresentModes);
 }
 
 // Functions for the VK_KHR_swapchain extension:
@@ -460,7 +477,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSwapchainKHR(VkDevice devic
                    "extension enabled?");
         abort();
     }
-    return disp->CreateSwapchainKHR(device, pCreateInfo, pAllocator, pSwapchain);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateSwapchainKHR);
+    VkResult result = disp->CreateSwapchainKHR(device, pCreateInfo, pAllocator, pSwapchain);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateSwapchainKHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateSwapchainKHR(VkDevice device, const VkSwapchainCreateInfoKHR *pCreateInfo,
@@ -513,7 +533,9 @@ LOADER_EXPORT VKAPI_ATTR void VKAPI_CALL vkDestroySwapchainKHR(VkDevice device,
                    "vkDestroySwapchainKHR: Invalid device [VUID-vkDestroySwapchainKHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkDestroySwapchainKHR);
     disp->DestroySwapchainKHR(device, swapchain, pAllocator);
+    LOADER_TRAMPOLINE_STATS_END(vkDestroySwapchainKHR);
 }
 
 // This is the trampoline entrypoint for GetSwapchainImagesKHR
@@ -525,30 +547,39 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetSwapchainImagesKHR(VkDevice de
                    "vkGetSwapchainImagesKHR: Invalid device [VUID-vkGetSwapchainImagesKHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetSwapchainImagesKHR(device, swapchain, pSwapchainImageCount, pSwapchainImages);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetSwapchainImagesKHR);
+    VkResult result = disp->GetSwapchainImagesKHR(device, swapchain, pSwapchainImageCount, pSwapchainImages);
+    LOADER_TRAMPOLINE_STATS_END(vkGetSwapchainImagesKHR);
+    return result;
 }
 
 // This is the trampoline entrypoint for AcquireNextImageKHR
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAcquireNextImageKHR(VkDevice device, VkSwapchainKHR swapchain, uint64_t timeout,
                                                                    VkSemaphore semaphore, VkFence fence, uint32_t *pImageIndex) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(device);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(device);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkAcquireNextImageKHR: Invalid device [VUID-vkAcquireNextImageKHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->AcquireNextImageKHR(device, swapchain, timeout, semaphore, fence, pImageIndex);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkAcquireNextImageKHR);
+    VkResult result = disp->AcquireNextImageKHR(device, swapchain, timeout, semaphore, fence, pImageIndex);
+    LOADER_TRAMPOLINE_STATS_END(vkAcquireNextImageKHR);
+    return result;
 }
 
 // This is the trampoline entrypoint for QueuePresentKHR
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkQueuePresentKHR(VkQueue queue, const VkPresentInfoKHR *pPresentInfo) {
-    const VkLayerDispatchTable *disp = loader_get_dispatch(queue);
+    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch(queue);
     if (NULL == disp) {
         loader_log(NULL, VULKAN_LOADER_FATAL_ERROR_BIT | VULKAN_LOADER_ERROR_BIT | VULKAN_LOADER_VALIDATION_BIT, 0,
                    "vkQueuePresentKHR: Invalid queue [VUID-vkQueuePresentKHR-queue-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->QueuePresentKHR(queue, pPresentInfo);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkQueuePresentKHR);
+    VkResult result = disp->QueuePresentKHR(queue, pPresentInfo);
+    LOADER_TRAMPOLINE_STATS_END(vkQueuePresentKHR);
+    return result;
 }
 
 VkResult allocate_icd_surface_struct(struct loader_instance *instance, size_t base_size, size_t platform_size,
@@ -606,9 +637,9 @@ void cleanup_surface_creation(struct loader_instance *loader_inst, VkResult resu
         for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
             if (NULL != icd_term->surface_list.list &&
                 icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
-                icd_term->surface_list.list[icd_surface->surface_index] && NULL != icd_term->dispatch.DestroySurfaceKHR) {
-                icd_term->dispatch.DestroySurfaceKHR(icd_term->instance, icd_term->surface_list.list[icd_surface->surface_index],
-                                                     pAllocator);
+                icd_term->surface_list.list[icd_surface->surface_index] && NULL != ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR)) {
+                ICD_TERM_DISPATCH(icd_term, DestroySurfaceKHR)
+                (icd_term->instance, icd_term->surface_list.list[icd_surface->surface_index], pAllocator);
             }
         }
         if (loader_inst->surfaces_list.list &&
@@ -637,7 +668,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateWin32SurfaceKHR(VkInstance
                    "vkCreateWin32SurfaceKHR: Invalid instance [VUID-vkCreateWin32SurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateWin32SurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateWin32SurfaceKHR);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateWin32SurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                               pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateWin32SurfaceKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateWin32SurfaceKHR
@@ -672,9 +707,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateWin32SurfaceKHR(VkInstance insta
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateWin32SurfaceKHR) {
-                result = icd_term->dispatch.CreateWin32SurfaceKHR(icd_term->instance, pCreateInfo, pAllocator,
-                                                                  &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateWin32SurfaceKHR)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateWin32SurfaceKHR)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -703,7 +738,10 @@ LOADER_EXPORT VKAPI_ATTR VkBool32 VKAPI_CALL vkGetPhysicalDeviceWin32Presentatio
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceWin32PresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceWin32PresentationSupportKHR);
+    VkBool32 result = disp->GetPhysicalDeviceWin32PresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceWin32PresentationSupportKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -720,14 +758,14 @@ VKAPI_ATTR VkBool32 VKAPI_CALL terminator_GetPhysicalDeviceWin32PresentationSupp
         return VK_FALSE;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceWin32PresentationSupportKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceWin32PresentationSupportKHR)) {
         // return VK_FALSE as this driver doesn't support WSI functionality
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceWin32PresentationSupportKHR!");
         return VK_FALSE;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceWin32PresentationSupportKHR(phys_dev_term->phys_dev, queueFamilyIndex);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceWin32PresentationSupportKHR)(phys_dev_term->phys_dev, queueFamilyIndex);
 }
 #endif  // VK_USE_PLATFORM_WIN32_KHR
 
@@ -744,7 +782,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateWaylandSurfaceKHR(VkInstanc
                    "vkCreateWaylandSurfaceKHR: Invalid instance [VUID-vkCreateWaylandSurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateWaylandSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateWaylandSurfaceKHR);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateWaylandSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                                 pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateWaylandSurfaceKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateWaylandSurfaceKHR
@@ -778,9 +820,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateWaylandSurfaceKHR(VkInstance ins
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateWaylandSurfaceKHR) {
-                result = icd_term->dispatch.CreateWaylandSurfaceKHR(icd_term->instance, pCreateInfo, pAllocator,
-                                                                    &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateWaylandSurfaceKHR)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateWaylandSurfaceKHR)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -811,7 +853,10 @@ LOADER_EXPORT VKAPI_ATTR VkBool32 VKAPI_CALL vkGetPhysicalDeviceWaylandPresentat
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceWaylandPresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex, display);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceWaylandPresentationSupportKHR);
+    VkBool32 result = disp->GetPhysicalDeviceWaylandPresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex, display);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceWaylandPresentationSupportKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -829,14 +874,15 @@ VKAPI_ATTR VkBool32 VKAPI_CALL terminator_GetPhysicalDeviceWaylandPresentationSu
         return VK_FALSE;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceWaylandPresentationSupportKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceWaylandPresentationSupportKHR)) {
         // return VK_FALSE as this driver doesn't support WSI functionality
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceWaylandPresentationSupportKHR!");
         return VK_FALSE;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceWaylandPresentationSupportKHR(phys_dev_term->phys_dev, queueFamilyIndex, display);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceWaylandPresentationSupportKHR)(phys_dev_term->phys_dev, queueFamilyIndex,
+                                                                                       display);
 }
 #endif  // VK_USE_PLATFORM_WAYLAND_KHR
 
@@ -855,7 +901,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateXcbSurfaceKHR(VkInstance in
                    "vkCreateXcbSurfaceKHR: Invalid instance [VUID-vkCreateXcbSurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateXcbSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateXcbSurfaceKHR);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateXcbSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                             pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateXcbSurfaceKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateXcbSurfaceKHR
@@ -888,9 +938,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateXcbSurfaceKHR(VkInstance instanc
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateXcbSurfaceKHR) {
-                result = icd_term->dispatch.CreateXcbSurfaceKHR(icd_term->instance, pCreateInfo, pAllocator,
-                                                                &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateXcbSurfaceKHR)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateXcbSurfaceKHR)(icd_term->instance, pCreateInfo, pAllocator,
+                                                                          &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -922,7 +972,10 @@ LOADER_EXPORT VKAPI_ATTR VkBool32 VKAPI_CALL vkGetPhysicalDeviceXcbPresentationS
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceXcbPresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex, connection, visual_id);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceXcbPresentationSupportKHR);
+    VkBool32 result = disp->GetPhysicalDeviceXcbPresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex, connection, visual_id);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceXcbPresentationSupportKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -941,15 +994,15 @@ VKAPI_ATTR VkBool32 VKAPI_CALL terminator_GetPhysicalDeviceXcbPresentationSuppor
         return VK_FALSE;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceXcbPresentationSupportKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceXcbPresentationSupportKHR)) {
         // return VK_FALSE as this driver doesn't support WSI functionality
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceXcbPresentationSupportKHR!");
         return VK_FALSE;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceXcbPresentationSupportKHR(phys_dev_term->phys_dev, queueFamilyIndex, connection,
-                                                                         visual_id);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceXcbPresentationSupportKHR)(phys_dev_term->phys_dev, queueFamilyIndex,
+                                                                                   connection, visual_id);
 }
 #endif  // VK_USE_PLATFORM_XCB_KHR
 
@@ -968,7 +1021,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateXlibSurfaceKHR(VkInstance i
                    "vkCreateXlibSurfaceKHR: Invalid instance [VUID-vkCreateXlibSurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateXlibSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateXlibSurfaceKHR);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateXlibSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                              pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateXlibSurfaceKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateXlibSurfaceKHR
@@ -1001,9 +1058,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateXlibSurfaceKHR(VkInstance instan
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateXlibSurfaceKHR) {
-                result = icd_term->dispatch.CreateXlibSurfaceKHR(icd_term->instance, pCreateInfo, pAllocator,
-                                                                 &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateXlibSurfaceKHR)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateXlibSurfaceKHR)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1034,7 +1091,10 @@ LOADER_EXPORT VKAPI_ATTR VkBool32 VKAPI_CALL vkGetPhysicalDeviceXlibPresentation
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceXlibPresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex, dpy, visualID);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceXlibPresentationSupportKHR);
+    VkBool32 result = disp->GetPhysicalDeviceXlibPresentationSupportKHR(unwrapped_phys_dev, queueFamilyIndex, dpy, visualID);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceXlibPresentationSupportKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -1052,14 +1112,15 @@ VKAPI_ATTR VkBool32 VKAPI_CALL terminator_GetPhysicalDeviceXlibPresentationSuppo
         return VK_FALSE;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceXlibPresentationSupportKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceXlibPresentationSupportKHR)) {
         // return VK_FALSE as this driver doesn't support WSI functionality
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceXlibPresentationSupportKHR!");
         return VK_FALSE;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceXlibPresentationSupportKHR(phys_dev_term->phys_dev, queueFamilyIndex, dpy, visualID);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceXlibPresentationSupportKHR)(phys_dev_term->phys_dev, queueFamilyIndex, dpy,
+                                                                                    visualID);
 }
 #endif  // VK_USE_PLATFORM_XLIB_KHR
 
@@ -1078,7 +1139,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDirectFBSurfaceEXT(VkInstan
                    "vkCreateDirectFBSurfaceEXT: Invalid instance [VUID-vkCreateDirectFBSurfaceEXT-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateDirectFBSurfaceEXT(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDirectFBSurfaceEXT);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateDirectFBSurfaceEXT(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                                  pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDirectFBSurfaceEXT);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateDirectFBSurfaceEXT
@@ -1113,9 +1178,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDirectFBSurfaceEXT(VkInstance in
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateDirectFBSurfaceEXT) {
-                result = icd_term->dispatch.CreateDirectFBSurfaceEXT(icd_term->instance, pCreateInfo, pAllocator,
-                                                                     &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateDirectFBSurfaceEXT)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateDirectFBSurfaceEXT)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1146,7 +1211,10 @@ LOADER_EXPORT VKAPI_ATTR VkBool32 VKAPI_CALL vkGetPhysicalDeviceDirectFBPresenta
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceDirectFBPresentationSupportEXT(unwrapped_phys_dev, queueFamilyIndex, dfb);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceDirectFBPresentationSupportEXT);
+    VkBool32 result = disp->GetPhysicalDeviceDirectFBPresentationSupportEXT(unwrapped_phys_dev, queueFamilyIndex, dfb);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceDirectFBPresentationSupportEXT);
+    return result;
 }
 
 // This is the instance chain terminator function for
@@ -1165,14 +1233,15 @@ VKAPI_ATTR VkBool32 VKAPI_CALL terminator_GetPhysicalDeviceDirectFBPresentationS
         return VK_FALSE;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceDirectFBPresentationSupportEXT) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDirectFBPresentationSupportEXT)) {
         // return VK_FALSE as this driver doesn't support WSI functionality
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceDirectFBPresentationSupportEXT!");
         return VK_FALSE;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceDirectFBPresentationSupportEXT(phys_dev_term->phys_dev, queueFamilyIndex, dfb);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDirectFBPresentationSupportEXT)(phys_dev_term->phys_dev, queueFamilyIndex,
+                                                                                        dfb);
 }
 
 #endif  // VK_USE_PLATFORM_DIRECTFB_EXT
@@ -1192,7 +1261,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateAndroidSurfaceKHR(VkInstanc
                    "vkCreateAndroidSurfaceKHR: Invalid instance [VUID-vkCreateAndroidSurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateAndroidSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateAndroidSurfaceKHR);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateAndroidSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                                 pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateAndroidSurfaceKHR);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateAndroidSurfaceKHR
@@ -1236,7 +1309,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateHeadlessSurfaceEXT(VkInstan
                    "vkCreateHeadlessSurfaceEXT: Invalid instance [VUID-vkCreateHeadlessSurfaceEXT-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateHeadlessSurfaceEXT(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateHeadlessSurfaceEXT);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateHeadlessSurfaceEXT(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                                  pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateHeadlessSurfaceEXT);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateHeadlessSurfaceEXT(VkInstance instance,
@@ -1267,9 +1344,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateHeadlessSurfaceEXT(VkInstance in
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateHeadlessSurfaceEXT) {
-                result = icd_term->dispatch.CreateHeadlessSurfaceEXT(icd_term->instance, pCreateInfo, pAllocator,
-                                                                     &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateHeadlessSurfaceEXT)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateHeadlessSurfaceEXT)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1328,7 +1405,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateMacOSSurfaceMVK(VkInstance
                    "vkCreateMacOSSurfaceMVK: Invalid instance [VUID-vkCreateMacOSSurfaceMVK-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateMacOSSurfaceMVK(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateMacOSSurfaceMVK);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateMacOSSurfaceMVK(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                               pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateMacOSSurfaceMVK);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateMacOSSurfaceKHR
@@ -1360,9 +1441,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateMacOSSurfaceMVK(VkInstance insta
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateMacOSSurfaceMVK) {
-                result = icd_term->dispatch.CreateMacOSSurfaceMVK(icd_term->instance, pCreateInfo, pAllocator,
-                                                                  &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateMacOSSurfaceMVK)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateMacOSSurfaceMVK)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1396,7 +1477,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateIOSSurfaceMVK(VkInstance in
                    "vkCreateIOSSurfaceMVK: Invalid instance [VUID-vkCreateIOSSurfaceMVK-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateIOSSurfaceMVK(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateIOSSurfaceMVK);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateIOSSurfaceMVK(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                             pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateIOSSurfaceMVK);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateIOSSurfaceKHR
@@ -1444,8 +1529,11 @@ vkCreateStreamDescriptorSurfaceGGP(VkInstance instance, const VkStreamDescriptor
             "vkCreateStreamDescriptorSurfaceGGP: Invalid instance [VUID-vkCreateStreamDescriptorSurfaceGGP-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateStreamDescriptorSurfaceGGP(loader_inst->instance, pCreateInfo, pAllocator,
-                                                                               pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateStreamDescriptorSurfaceGGP);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateStreamDescriptorSurfaceGGP(loader_inst->instance, pCreateInfo,
+                                                                                          pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateStreamDescriptorSurfaceGGP);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateStreamDescriptorSurfaceGGP
@@ -1478,8 +1566,8 @@ terminator_CreateStreamDescriptorSurfaceGGP(VkInstance instance, const VkStreamD
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateStreamDescriptorSurfaceGGP) {
-                result = icd_term->dispatch.CreateStreamDescriptorSurfaceGGP(
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateStreamDescriptorSurfaceGGP)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateStreamDescriptorSurfaceGGP)(
                     icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
@@ -1511,7 +1599,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateMetalSurfaceEXT(VkInstance
                    "vkCreateMetalSurfaceEXT: Invalid instance [VUID-vkCreateMetalSurfaceEXT-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateMetalSurfaceEXT(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateMetalSurfaceEXT);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateMetalSurfaceEXT(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                               pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateMetalSurfaceEXT);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateMetalSurfaceEXT(VkInstance instance, const VkMetalSurfaceCreateInfoEXT *pCreateInfo,
@@ -1540,9 +1632,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateMetalSurfaceEXT(VkInstance insta
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateMetalSurfaceEXT) {
-                result = icd_term->dispatch.CreateMetalSurfaceEXT(icd_term->instance, pCreateInfo, pAllocator,
-                                                                  &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateMetalSurfaceEXT)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateMetalSurfaceEXT)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1573,7 +1665,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateScreenSurfaceQNX(VkInstance
                    "vkCreateScreenSurfaceQNX: Invalid instance [VUID-vkCreateScreenSurfaceQNX-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateScreenSurfaceQNX(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateScreenSurfaceQNX);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateScreenSurfaceQNX(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                                pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateScreenSurfaceQNX);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateScreenSurfaceQNX
@@ -1607,9 +1703,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateScreenSurfaceQNX(VkInstance inst
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateScreenSurfaceQNX) {
-                result = icd_term->dispatch.CreateScreenSurfaceQNX(icd_term->instance, pCreateInfo, pAllocator,
-                                                                   &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateScreenSurfaceQNX)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateScreenSurfaceQNX)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1639,7 +1735,9 @@ LOADER_EXPORT VKAPI_ATTR VkBool32 VKAPI_CALL vkGetPhysicalDeviceScreenPresentati
         abort(); /* Intentionally fail so user can correct issue. */
     }
     const VkLayerInstanceDispatchTable *disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceScreenPresentationSupportQNX);
     VkBool32 res = disp->GetPhysicalDeviceScreenPresentationSupportQNX(unwrapped_phys_dev, queueFamilyIndex, window);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceScreenPresentationSupportQNX);
     return res;
 }
 
@@ -1658,14 +1756,15 @@ VKAPI_ATTR VkBool32 VKAPI_CALL terminator_GetPhysicalDeviceScreenPresentationSup
         return VK_FALSE;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceScreenPresentationSupportQNX) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceScreenPresentationSupportQNX)) {
         // return VK_FALSE as this driver doesn't support WSI functionality
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceScreenPresentationSupportQNX!");
         return VK_FALSE;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceScreenPresentationSupportQNX(phys_dev_term->phys_dev, queueFamilyIndex, window);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceScreenPresentationSupportQNX)(phys_dev_term->phys_dev, queueFamilyIndex,
+                                                                                      window);
 }
 #endif  // VK_USE_PLATFORM_SCREEN_QNX
 
@@ -1682,7 +1781,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateViSurfaceNN(VkInstance inst
                    "vkCreateViSurfaceNN: Invalid instance [VUID-vkCreateViSurfaceNN-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateViSurfaceNN(loader_inst->instance, pCreateInfo, pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateViSurfaceNN);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateViSurfaceNN(loader_inst->instance, pCreateInfo, pAllocator,
+                                                                           pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateViSurfaceNN);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateViSurfaceNN
@@ -1714,9 +1817,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateViSurfaceNN(VkInstance instance,
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateViSurfaceNN) {
-                result = icd_term->dispatch.CreateViSurfaceNN(icd_term->instance, pCreateInfo, pAllocator,
-                                                              &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateViSurfaceNN)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateViSurfaceNN)(icd_term->instance, pCreateInfo, pAllocator,
+                                                                        &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -1748,7 +1851,9 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceDisplayPropertie
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceDisplayPropertiesKHR);
     VkResult res = disp->GetPhysicalDeviceDisplayPropertiesKHR(unwrapped_phys_dev, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceDisplayPropertiesKHR);
     return res;
 }
 
@@ -1765,7 +1870,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPropertiesKHR(
         return VK_SUCCESS;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceDisplayPropertiesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPropertiesKHR)) {
         loader_log(loader_inst, VULKAN_LOADER_WARN_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceDisplayPropertiesKHR!");
         // return 0 for property count as this driver doesn't support WSI functionality
@@ -1775,7 +1880,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPropertiesKHR(
         return VK_SUCCESS;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceDisplayPropertiesKHR(phys_dev_term->phys_dev, pPropertyCount, pProperties);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPropertiesKHR)(phys_dev_term->phys_dev, pPropertyCount, pProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceDisplayPlanePropertiesKHR(
@@ -1789,7 +1894,9 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceDisplayPlaneProp
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceDisplayPlanePropertiesKHR);
     VkResult res = disp->GetPhysicalDeviceDisplayPlanePropertiesKHR(unwrapped_phys_dev, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceDisplayPlanePropertiesKHR);
     return res;
 }
 
@@ -1806,7 +1913,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPlanePropertie
         return VK_SUCCESS;
     }
 
-    if (NULL == icd_term->dispatch.GetPhysicalDeviceDisplayPlanePropertiesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlanePropertiesKHR)) {
         loader_log(loader_inst, VULKAN_LOADER_WARN_BIT, 0,
                    "ICD for selected physical device does not export vkGetPhysicalDeviceDisplayPlanePropertiesKHR!");
         // return 0 for property count as this driver doesn't support WSI functionality
@@ -1816,7 +1923,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPlanePropertie
         return VK_SUCCESS;
     }
 
-    return icd_term->dispatch.GetPhysicalDeviceDisplayPlanePropertiesKHR(phys_dev_term->phys_dev, pPropertyCount, pProperties);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlanePropertiesKHR)(phys_dev_term->phys_dev, pPropertyCount,
+                                                                                   pProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayPlaneSupportedDisplaysKHR(VkPhysicalDevice physicalDevice,
@@ -1831,7 +1939,9 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayPlaneSupportedDisplaysK
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDisplayPlaneSupportedDisplaysKHR);
     VkResult res = disp->GetDisplayPlaneSupportedDisplaysKHR(unwrapped_phys_dev, planeIndex, pDisplayCount, pDisplays);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDisplayPlaneSupportedDisplaysKHR);
     return res;
 }
 
@@ -1847,7 +1957,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneSupportedDisplaysKHR(Vk
         return VK_SUCCESS;
     }
 
-    if (NULL == icd_term->dispatch.GetDisplayPlaneSupportedDisplaysKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneSupportedDisplaysKHR)) {
         loader_log(loader_inst, VULKAN_LOADER_WARN_BIT, 0,
                    "ICD for selected physical device does not export vkGetDisplayPlaneSupportedDisplaysKHR!");
         // return 0 for property count as this driver doesn't support WSI functionality
@@ -1857,7 +1967,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneSupportedDisplaysKHR(Vk
         return VK_SUCCESS;
     }
 
-    return icd_term->dispatch.GetDisplayPlaneSupportedDisplaysKHR(phys_dev_term->phys_dev, planeIndex, pDisplayCount, pDisplays);
+    return ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneSupportedDisplaysKHR)(phys_dev_term->phys_dev, planeIndex, pDisplayCount,
+                                                                            pDisplays);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayModePropertiesKHR(VkPhysicalDevice physicalDevice, VkDisplayKHR display,
@@ -1872,7 +1983,9 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayModePropertiesKHR(VkPhy
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDisplayModePropertiesKHR);
     VkResult res = disp->GetDisplayModePropertiesKHR(unwrapped_phys_dev, display, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDisplayModePropertiesKHR);
     return res;
 }
 
@@ -1889,7 +2002,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayModePropertiesKHR(VkPhysical
         return VK_SUCCESS;
     }
 
-    if (NULL == icd_term->dispatch.GetDisplayModePropertiesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetDisplayModePropertiesKHR)) {
         loader_log(loader_inst, VULKAN_LOADER_WARN_BIT, 0,
                    "ICD for selected physical device does not export vkGetDisplayModePropertiesKHR!");
         // return 0 for property count as this driver doesn't support WSI functionality
@@ -1899,7 +2012,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayModePropertiesKHR(VkPhysical
         return VK_SUCCESS;
     }
 
-    return icd_term->dispatch.GetDisplayModePropertiesKHR(phys_dev_term->phys_dev, display, pPropertyCount, pProperties);
+    return ICD_TERM_DISPATCH(icd_term, GetDisplayModePropertiesKHR)(phys_dev_term->phys_dev, display, pPropertyCount, pProperties);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDisplayModeKHR(VkPhysicalDevice physicalDevice, VkDisplayKHR display,
@@ -1915,7 +2028,9 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDisplayModeKHR(VkPhysicalDe
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDisplayModeKHR);
     VkResult res = disp->CreateDisplayModeKHR(unwrapped_phys_dev, display, pCreateInfo, pAllocator, pMode);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDisplayModeKHR);
     return res;
 }
 
@@ -1932,14 +2047,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDisplayModeKHR(VkPhysicalDevice
         return VK_ERROR_EXTENSION_NOT_PRESENT;
     }
 
-    if (NULL == icd_term->dispatch.CreateDisplayModeKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, CreateDisplayModeKHR)) {
         // Can't emulate, so return an appropriate error
         loader_log(loader_inst, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD for selected physical device does not export vkCreateDisplayModeKHR!");
         return VK_ERROR_INITIALIZATION_FAILED;
     }
 
-    return icd_term->dispatch.CreateDisplayModeKHR(phys_dev_term->phys_dev, display, pCreateInfo, pAllocator, pMode);
+    return ICD_TERM_DISPATCH(icd_term, CreateDisplayModeKHR)(phys_dev_term->phys_dev, display, pCreateInfo, pAllocator, pMode);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayPlaneCapabilitiesKHR(VkPhysicalDevice physicalDevice,
@@ -1954,7 +2069,9 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayPlaneCapabilitiesKHR(Vk
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDisplayPlaneCapabilitiesKHR);
     VkResult res = disp->GetDisplayPlaneCapabilitiesKHR(unwrapped_phys_dev, mode, planeIndex, pCapabilities);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDisplayPlaneCapabilitiesKHR);
     return res;
 }
 
@@ -1971,7 +2088,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneCapabilitiesKHR(VkPhysi
         return VK_SUCCESS;
     }
 
-    if (NULL == icd_term->dispatch.GetDisplayPlaneCapabilitiesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneCapabilitiesKHR)) {
         // Emulate support
         loader_log(loader_inst, VULKAN_LOADER_WARN_BIT, 0,
                    "ICD for selected physical device does not export vkGetDisplayPlaneCapabilitiesKHR!");
@@ -1981,7 +2098,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneCapabilitiesKHR(VkPhysi
         return VK_SUCCESS;
     }
 
-    return icd_term->dispatch.GetDisplayPlaneCapabilitiesKHR(phys_dev_term->phys_dev, mode, planeIndex, pCapabilities);
+    return ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneCapabilitiesKHR)(phys_dev_term->phys_dev, mode, planeIndex, pCapabilities);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDisplayPlaneSurfaceKHR(VkInstance instance,
@@ -1994,8 +2111,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateDisplayPlaneSurfaceKHR(VkIn
                    "vkCreateDisplayPlaneSurfaceKHR: Invalid instance [VUID-vkCreateDisplayPlaneSurfaceKHR-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateDisplayPlaneSurfaceKHR(loader_inst->instance, pCreateInfo, pAllocator,
-                                                                           pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateDisplayPlaneSurfaceKHR);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateDisplayPlaneSurfaceKHR(loader_inst->instance, pCreateInfo,
+                                                                                      pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateDisplayPlaneSurfaceKHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDisplayPlaneSurfaceKHR(VkInstance instance,
@@ -2034,9 +2154,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateDisplayPlaneSurfaceKHR(VkInstanc
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateDisplayPlaneSurfaceKHR) {
-                result = icd_term->dispatch.CreateDisplayPlaneSurfaceKHR(icd_term->instance, pCreateInfo, pAllocator,
-                                                                         &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateDisplayPlaneSurfaceKHR)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateDisplayPlaneSurfaceKHR)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -2065,7 +2185,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateSharedSwapchainsKHR(VkDevic
                    "vkCreateSharedSwapchainsKHR: Invalid device [VUID-vkCreateSharedSwapchainsKHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->CreateSharedSwapchainsKHR(device, swapchainCount, pCreateInfos, pAllocator, pSwapchains);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateSharedSwapchainsKHR);
+    VkResult result = disp->CreateSharedSwapchainsKHR(device, swapchainCount, pCreateInfos, pAllocator, pSwapchains);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateSharedSwapchainsKHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateSharedSwapchainsKHR(VkDevice device, uint32_t swapchainCount,
@@ -2119,7 +2242,10 @@ vkGetDeviceGroupPresentCapabilitiesKHR(VkDevice device, VkDeviceGroupPresentCapa
                    "[VUID-vkGetDeviceGroupPresentCapabilitiesKHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetDeviceGroupPresentCapabilitiesKHR(device, pDeviceGroupPresentCapabilities);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceGroupPresentCapabilitiesKHR);
+    VkResult result = disp->GetDeviceGroupPresentCapabilitiesKHR(device, pDeviceGroupPresentCapabilities);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceGroupPresentCapabilitiesKHR);
+    return result;
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDeviceGroupSurfacePresentModesKHR(VkDevice device, VkSurfaceKHR surface,
@@ -2131,7 +2257,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDeviceGroupSurfacePresentModes
                    "[VUID-vkGetDeviceGroupSurfacePresentModesKHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->GetDeviceGroupSurfacePresentModesKHR(device, surface, pModes);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDeviceGroupSurfacePresentModesKHR);
+    VkResult result = disp->GetDeviceGroupSurfacePresentModesKHR(device, surface, pModes);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDeviceGroupSurfacePresentModesKHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDeviceGroupSurfacePresentModesKHR(VkDevice device, VkSurfaceKHR surface,
@@ -2173,7 +2302,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDevicePresentRectangle
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDevicePresentRectanglesKHR(unwrapped_phys_dev, surface, pRectCount, pRects);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDevicePresentRectanglesKHR);
+    VkResult result = disp->GetPhysicalDevicePresentRectanglesKHR(unwrapped_phys_dev, surface, pRectCount, pRects);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDevicePresentRectanglesKHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDevicePresentRectanglesKHR(VkPhysicalDevice physicalDevice,
@@ -2181,7 +2313,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDevicePresentRectanglesKHR(
                                                                                 VkRect2D *pRects) {
     struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *)physicalDevice;
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
-    if (NULL == icd_term->dispatch.GetPhysicalDevicePresentRectanglesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDevicePresentRectanglesKHR)) {
         loader_log(icd_term->this_instance, VULKAN_LOADER_ERROR_BIT, 0,
                    "ICD associated with VkPhysicalDevice does not support GetPhysicalDevicePresentRectanglesKHX");
         // return as this driver doesn't support WSI functionality
@@ -2194,10 +2326,10 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDevicePresentRectanglesKHR(
     if (NULL != icd_term->surface_list.list &&
         icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
         icd_term->surface_list.list[icd_surface->surface_index]) {
-        return icd_term->dispatch.GetPhysicalDevicePresentRectanglesKHR(
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDevicePresentRectanglesKHR)(
             phys_dev_term->phys_dev, icd_term->surface_list.list[icd_surface->surface_index], pRectCount, pRects);
     }
-    return icd_term->dispatch.GetPhysicalDevicePresentRectanglesKHR(phys_dev_term->phys_dev, surface, pRectCount, pRects);
+    return ICD_TERM_DISPATCH(icd_term, GetPhysicalDevicePresentRectanglesKHR)(phys_dev_term->phys_dev, surface, pRectCount, pRects);
 }
 
 LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAcquireNextImage2KHR(VkDevice device, const VkAcquireNextImageInfoKHR *pAcquireInfo,
@@ -2208,7 +2340,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkAcquireNextImage2KHR(VkDevice dev
                    "vkAcquireNextImage2KHR: Invalid device [VUID-vkAcquireNextImage2KHR-device-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return disp->AcquireNextImage2KHR(device, pAcquireInfo, pImageIndex);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkAcquireNextImage2KHR);
+    VkResult result = disp->AcquireNextImage2KHR(device, pAcquireInfo, pImageIndex);
+    LOADER_TRAMPOLINE_STATS_END(vkAcquireNextImage2KHR);
+    return result;
 }
 
 // ---- VK_KHR_get_display_properties2 extension trampoline/terminators
@@ -2225,7 +2360,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceDisplayPropertie
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceDisplayProperties2KHR(unwrapped_phys_dev, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceDisplayProperties2KHR);
+    VkResult result = disp->GetPhysicalDeviceDisplayProperties2KHR(unwrapped_phys_dev, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceDisplayProperties2KHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayProperties2KHR(VkPhysicalDevice physicalDevice,
@@ -2235,8 +2373,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayProperties2KHR
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
     // If the function is available in the driver, just call into it
-    if (icd_term->dispatch.GetPhysicalDeviceDisplayProperties2KHR != NULL) {
-        return icd_term->dispatch.GetPhysicalDeviceDisplayProperties2KHR(phys_dev_term->phys_dev, pPropertyCount, pProperties);
+    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayProperties2KHR) != NULL) {
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayProperties2KHR)(phys_dev_term->phys_dev, pPropertyCount,
+                                                                                   pProperties);
     }
 
     // We have to emulate the function.
@@ -2244,14 +2383,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayProperties2KHR
                "vkGetPhysicalDeviceDisplayProperties2KHR: Emulating call in ICD \"%s\"", icd_term->scanned_icd->lib_name);
 
     // If the icd doesn't support VK_KHR_display, then no properties are available
-    if (icd_term->dispatch.GetPhysicalDeviceDisplayPropertiesKHR == NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPropertiesKHR) == NULL) {
         *pPropertyCount = 0;
         return VK_SUCCESS;
     }
 
     // If we aren't writing to pProperties, then emulation is straightforward
     if (pProperties == NULL || *pPropertyCount == 0) {
-        return icd_term->dispatch.GetPhysicalDeviceDisplayPropertiesKHR(phys_dev_term->phys_dev, pPropertyCount, NULL);
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPropertiesKHR)(phys_dev_term->phys_dev, pPropertyCount, NULL);
     }
 
     // If we do have to write to pProperties, then we need to write to a temporary array of VkDisplayPropertiesKHR and copy it
@@ -2259,7 +2398,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayProperties2KHR
     if (properties == NULL) {
         return VK_ERROR_OUT_OF_HOST_MEMORY;
     }
-    VkResult res = icd_term->dispatch.GetPhysicalDeviceDisplayPropertiesKHR(phys_dev_term->phys_dev, pPropertyCount, properties);
+    VkResult res =
+        ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPropertiesKHR)(phys_dev_term->phys_dev, pPropertyCount, properties);
     if (res < 0) {
         return res;
     }
@@ -2280,7 +2420,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetPhysicalDeviceDisplayPlaneProp
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceDisplayPlaneProperties2KHR(unwrapped_phys_dev, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceDisplayPlaneProperties2KHR);
+    VkResult result = disp->GetPhysicalDeviceDisplayPlaneProperties2KHR(unwrapped_phys_dev, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceDisplayPlaneProperties2KHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPlaneProperties2KHR(VkPhysicalDevice physicalDevice,
@@ -2290,8 +2433,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPlanePropertie
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
     // If the function is available in the driver, just call into it
-    if (icd_term->dispatch.GetPhysicalDeviceDisplayPlaneProperties2KHR != NULL) {
-        return icd_term->dispatch.GetPhysicalDeviceDisplayPlaneProperties2KHR(phys_dev_term->phys_dev, pPropertyCount, pProperties);
+    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlaneProperties2KHR) != NULL) {
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlaneProperties2KHR)(phys_dev_term->phys_dev, pPropertyCount,
+                                                                                        pProperties);
     }
 
     // We have to emulate the function.
@@ -2299,14 +2443,15 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPlanePropertie
                "vkGetPhysicalDeviceDisplayPlaneProperties2KHR: Emulating call in ICD \"%s\"", icd_term->scanned_icd->lib_name);
 
     // If the icd doesn't support VK_KHR_display, then no properties are available
-    if (icd_term->dispatch.GetPhysicalDeviceDisplayPlanePropertiesKHR == NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlanePropertiesKHR) == NULL) {
         *pPropertyCount = 0;
         return VK_SUCCESS;
     }
 
     // If we aren't writing to pProperties, then emulation is straightforward
     if (pProperties == NULL || *pPropertyCount == 0) {
-        return icd_term->dispatch.GetPhysicalDeviceDisplayPlanePropertiesKHR(phys_dev_term->phys_dev, pPropertyCount, NULL);
+        return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlanePropertiesKHR)(phys_dev_term->phys_dev, pPropertyCount,
+                                                                                       NULL);
     }
 
     // If we do have to write to pProperties, then we need to write to a temporary array of VkDisplayPlanePropertiesKHR and copy it
@@ -2314,8 +2459,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceDisplayPlanePropertie
     if (properties == NULL) {
         return VK_ERROR_OUT_OF_HOST_MEMORY;
     }
-    VkResult res =
-        icd_term->dispatch.GetPhysicalDeviceDisplayPlanePropertiesKHR(phys_dev_term->phys_dev, pPropertyCount, properties);
+    VkResult res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceDisplayPlanePropertiesKHR)(phys_dev_term->phys_dev, pPropertyCount,
+                                                                                           properties);
     if (res < 0) {
         return res;
     }
@@ -2337,7 +2482,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayModeProperties2KHR(VkPh
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetDisplayModeProperties2KHR(unwrapped_phys_dev, display, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDisplayModeProperties2KHR);
+    VkResult result = disp->GetDisplayModeProperties2KHR(unwrapped_phys_dev, display, pPropertyCount, pProperties);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDisplayModeProperties2KHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayModeProperties2KHR(VkPhysicalDevice physicalDevice, VkDisplayKHR display,
@@ -2347,8 +2495,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayModeProperties2KHR(VkPhysica
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
     // If the function is available in the driver, just call into it
-    if (icd_term->dispatch.GetDisplayModeProperties2KHR != NULL) {
-        return icd_term->dispatch.GetDisplayModeProperties2KHR(phys_dev_term->phys_dev, display, pPropertyCount, pProperties);
+    if (ICD_TERM_DISPATCH(icd_term, GetDisplayModeProperties2KHR) != NULL) {
+        return ICD_TERM_DISPATCH(icd_term, GetDisplayModeProperties2KHR)(phys_dev_term->phys_dev, display, pPropertyCount,
+                                                                         pProperties);
     }
 
     // We have to emulate the function.
@@ -2356,14 +2505,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayModeProperties2KHR(VkPhysica
                icd_term->scanned_icd->lib_name);
 
     // If the icd doesn't support VK_KHR_display, then no properties are available
-    if (icd_term->dispatch.GetDisplayModePropertiesKHR == NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, GetDisplayModePropertiesKHR) == NULL) {
         *pPropertyCount = 0;
         return VK_SUCCESS;
     }
 
     // If we aren't writing to pProperties, then emulation is straightforward
     if (pProperties == NULL || *pPropertyCount == 0) {
-        return icd_term->dispatch.GetDisplayModePropertiesKHR(phys_dev_term->phys_dev, display, pPropertyCount, NULL);
+        return ICD_TERM_DISPATCH(icd_term, GetDisplayModePropertiesKHR)(phys_dev_term->phys_dev, display, pPropertyCount, NULL);
     }
 
     // If we do have to write to pProperties, then we need to write to a temporary array of VkDisplayModePropertiesKHR and copy it
@@ -2371,7 +2520,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayModeProperties2KHR(VkPhysica
     if (properties == NULL) {
         return VK_ERROR_OUT_OF_HOST_MEMORY;
     }
-    VkResult res = icd_term->dispatch.GetDisplayModePropertiesKHR(phys_dev_term->phys_dev, display, pPropertyCount, properties);
+    VkResult res =
+        ICD_TERM_DISPATCH(icd_term, GetDisplayModePropertiesKHR)(phys_dev_term->phys_dev, display, pPropertyCount, properties);
     if (res < 0) {
         return res;
     }
@@ -2393,7 +2543,10 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkGetDisplayPlaneCapabilities2KHR(V
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetDisplayPlaneCapabilities2KHR(unwrapped_phys_dev, pDisplayPlaneInfo, pCapabilities);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetDisplayPlaneCapabilities2KHR);
+    VkResult result = disp->GetDisplayPlaneCapabilities2KHR(unwrapped_phys_dev, pDisplayPlaneInfo, pCapabilities);
+    LOADER_TRAMPOLINE_STATS_END(vkGetDisplayPlaneCapabilities2KHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneCapabilities2KHR(VkPhysicalDevice physicalDevice,
@@ -2403,8 +2556,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneCapabilities2KHR(VkPhys
     struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;
 
     // If the function is available in the driver, just call into it
-    if (icd_term->dispatch.GetDisplayPlaneCapabilities2KHR != NULL) {
-        return icd_term->dispatch.GetDisplayPlaneCapabilities2KHR(phys_dev_term->phys_dev, pDisplayPlaneInfo, pCapabilities);
+    if (ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneCapabilities2KHR) != NULL) {
+        return ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneCapabilities2KHR)(phys_dev_term->phys_dev, pDisplayPlaneInfo,
+                                                                            pCapabilities);
     }
 
     // We have to emulate the function.
@@ -2412,7 +2566,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneCapabilities2KHR(VkPhys
                "vkGetDisplayPlaneCapabilities2KHR: Emulating call in ICD \"%s\"", icd_term->scanned_icd->lib_name);
 
     // If the icd doesn't support VK_KHR_display, then there are no capabilities
-    if (NULL == icd_term->dispatch.GetDisplayPlaneCapabilitiesKHR) {
+    if (NULL == ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneCapabilitiesKHR)) {
         if (pCapabilities) {
             memset(&pCapabilities->capabilities, 0, sizeof(VkDisplayPlaneCapabilitiesKHR));
         }
@@ -2420,8 +2574,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetDisplayPlaneCapabilities2KHR(VkPhys
     }
 
     // Just call into the old version of the function.
-    return icd_term->dispatch.GetDisplayPlaneCapabilitiesKHR(phys_dev_term->phys_dev, pDisplayPlaneInfo->mode,
-                                                             pDisplayPlaneInfo->planeIndex, &pCapabilities->capabilities);
+    return ICD_TERM_DISPATCH(icd_term, GetDisplayPlaneCapabilitiesKHR)(phys_dev_term->phys_dev, pDisplayPlaneInfo->mode,
+                                                                       pDisplayPlaneInfo->planeIndex, &pCapabilities->capabilities);
 }
 
 #if defined(VK_USE_PLATFORM_FUCHSIA)
@@ -2437,8 +2591,11 @@ LOADER_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkCreateImagePipeSurfaceFUCHSIA(VkI
                    "vkCreateImagePipeSurfaceFUCHSIA: Invalid instance [VUID-vkCreateImagePipeSurfaceFUCHSIA-instance-parameter]");
         abort(); /* Intentionally fail so user can correct issue. */
     }
-    return loader_inst->disp->layer_inst_disp.CreateImagePipeSurfaceFUCHSIA(loader_inst->instance, pCreateInfo, pAllocator,
-                                                                            pSurface);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkCreateImagePipeSurfaceFUCHSIA);
+    VkResult result = loader_inst->disp->layer_inst_disp.CreateImagePipeSurfaceFUCHSIA(loader_inst->instance, pCreateInfo,
+                                                                                       pAllocator, pSurface);
+    LOADER_TRAMPOLINE_STATS_END(vkCreateImagePipeSurfaceFUCHSIA);
+    return result;
 }
 
 // This is the instance chain terminator function for CreateImagePipeSurfaceFUCHSIA
@@ -2473,9 +2630,9 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_CreateImagePipeSurfaceFUCHSIA(VkInstan
     // Loop through each ICD and determine if they need to create a surface
     for (struct loader_icd_term *icd_term = loader_inst->icd_terms; icd_term != NULL; icd_term = icd_term->next) {
         if (icd_term->scanned_icd->interface_version >= ICD_VER_SUPPORTS_ICD_SURFACE_KHR) {
-            if (NULL != icd_term->dispatch.CreateImagePipeSurfaceFUCHSIA) {
-                result = icd_term->dispatch.CreateImagePipeSurfaceFUCHSIA(icd_term->instance, pCreateInfo, pAllocator,
-                                                                          &icd_term->surface_list.list[icd_surface->surface_index]);
+            if (NULL != ICD_TERM_DISPATCH(icd_term, CreateImagePipeSurfaceFUCHSIA)) {
+                result = ICD_TERM_DISPATCH(icd_term, CreateImagePipeSurfaceFUCHSIA)(
+                    icd_term->instance, pCreateInfo, pAllocator, &icd_term->surface_list.list[icd_surface->surface_index]);
                 if (VK_SUCCESS != result) {
                     goto out;
                 }
@@ -2504,7 +2661,10 @@ vkGetPhysicalDeviceSurfaceCapabilities2KHR(VkPhysicalDevice physicalDevice, cons
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceSurfaceCapabilities2KHR(unwrapped_phys_dev, pSurfaceInfo, pSurfaceCapabilities);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSurfaceCapabilities2KHR);
+    VkResult result = disp->GetPhysicalDeviceSurfaceCapabilities2KHR(unwrapped_phys_dev, pSurfaceInfo, pSurfaceCapabilities);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSurfaceCapabilities2KHR);
+    return result;
 }
 
 void emulate_VK_EXT_surface_maintenance1(struct loader_icd_term *icd_term, const VkPhysicalDeviceSurfaceInfo2KHR *pSurfaceInfo,
@@ -2579,7 +2739,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilities2K
         return VK_SUCCESS;
     }
 
-    if (icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilities2KHR != NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilities2KHR) != NULL) {
         void *pNext = pSurfaceCapabilities->pNext;
         while (pNext != NULL) {
             VkBaseOutStructure pNext_out_structure = {0};
@@ -2601,11 +2761,11 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilities2K
             icd_term->surface_list.list[icd_surface->surface_index]) {
             VkPhysicalDeviceSurfaceInfo2KHR info_copy = *pSurfaceInfo;
             info_copy.surface = icd_term->surface_list.list[icd_surface->surface_index];
-            res = icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilities2KHR(phys_dev_term->phys_dev, &info_copy,
-                                                                              pSurfaceCapabilities);
+            res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilities2KHR)(phys_dev_term->phys_dev, &info_copy,
+                                                                                        pSurfaceCapabilities);
         } else {
-            res = icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilities2KHR(phys_dev_term->phys_dev, pSurfaceInfo,
-                                                                              pSurfaceCapabilities);
+            res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilities2KHR)(phys_dev_term->phys_dev, pSurfaceInfo,
+                                                                                        pSurfaceCapabilities);
         }
 
         // Because VK_EXT_surface_maintenance1 is an instance extension, applications will use it to query info on drivers which do
@@ -2631,14 +2791,14 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceCapabilities2K
         }
 
         // If the icd doesn't support VK_KHR_surface, then there are no capabilities
-        if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilitiesKHR) {
+        if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilitiesKHR)) {
             if (pSurfaceCapabilities) {
                 memset(&pSurfaceCapabilities->surfaceCapabilities, 0, sizeof(VkSurfaceCapabilitiesKHR));
             }
             return VK_SUCCESS;
         }
-        VkResult res = icd_term->dispatch.GetPhysicalDeviceSurfaceCapabilitiesKHR(phys_dev_term->phys_dev, surface,
-                                                                                  &pSurfaceCapabilities->surfaceCapabilities);
+        VkResult res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceCapabilitiesKHR)(
+            phys_dev_term->phys_dev, surface, &pSurfaceCapabilities->surfaceCapabilities);
 
         emulate_VK_EXT_surface_maintenance1(icd_term, pSurfaceInfo, pSurfaceCapabilities);
         return res;
@@ -2657,7 +2817,11 @@ vkGetPhysicalDeviceSurfaceFormats2KHR(VkPhysicalDevice physicalDevice, const VkP
         abort(); /* Intentionally fail so user can correct issue. */
     }
     disp = loader_get_instance_layer_dispatch(physicalDevice);
-    return disp->GetPhysicalDeviceSurfaceFormats2KHR(unwrapped_phys_dev, pSurfaceInfo, pSurfaceFormatCount, pSurfaceFormats);
+    LOADER_TRAMPOLINE_STATS_BEGIN(vkGetPhysicalDeviceSurfaceFormats2KHR);
+    VkResult result = disp->GetPhysicalDeviceSurfaceFormats2KHR(unwrapped_phys_dev, pSurfaceInfo, pSurfaceFormatCount,
+                                                                pSurfaceFormats);
+    LOADER_TRAMPOLINE_STATS_END(vkGetPhysicalDeviceSurfaceFormats2KHR);
+    return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormats2KHR(VkPhysicalDevice physicalDevice,
@@ -2679,18 +2843,18 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormats2KHR(Vk
         icd_surface = (VkIcdSurface *)(uintptr_t)(pSurfaceInfo->surface);
     }
 
-    if (icd_term->dispatch.GetPhysicalDeviceSurfaceFormats2KHR != NULL) {
+    if (ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormats2KHR) != NULL) {
         // Pass the call to the driver, possibly unwrapping the ICD surface
         if (NULL != icd_surface && NULL != icd_term->surface_list.list &&
             icd_term->surface_list.capacity > icd_surface->surface_index * sizeof(VkSurfaceKHR) &&
             icd_term->surface_list.list[icd_surface->surface_index]) {
             VkPhysicalDeviceSurfaceInfo2KHR info_copy = *pSurfaceInfo;
             info_copy.surface = icd_term->surface_list.list[icd_surface->surface_index];
-            return icd_term->dispatch.GetPhysicalDeviceSurfaceFormats2KHR(phys_dev_term->phys_dev, &info_copy, pSurfaceFormatCount,
-                                                                          pSurfaceFormats);
+            return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormats2KHR)(phys_dev_term->phys_dev, &info_copy,
+                                                                                    pSurfaceFormatCount, pSurfaceFormats);
         } else {
-            return icd_term->dispatch.GetPhysicalDeviceSurfaceFormats2KHR(phys_dev_term->phys_dev, pSurfaceInfo,
-                                                                          pSurfaceFormatCount, pSurfaceFormats);
+            return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormats2KHR)(phys_dev_term->phys_dev, pSurfaceInfo,
+                                                                                    pSurfaceFormatCount, pSurfaceFormats);
         }
     } else {
         // Emulate the call
@@ -2712,7 +2876,7 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormats2KHR(Vk
         }
 
         // If the icd doesn't support VK_KHR_surface, then there are no formats
-        if (NULL == icd_term->dispatch.GetPhysicalDeviceSurfaceFormatsKHR) {
+        if (NULL == ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormatsKHR)) {
             if (pSurfaceFormatCount) {
                 *pSurfaceFormatCount = 0;
             }
@@ -2721,8 +2885,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormats2KHR(Vk
 
         if (*pSurfaceFormatCount == 0 || pSurfaceFormats == NULL) {
             // Write to pSurfaceFormatCount
-            return icd_term->dispatch.GetPhysicalDeviceSurfaceFormatsKHR(phys_dev_term->phys_dev, surface, pSurfaceFormatCount,
-                                                                         NULL);
+            return ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormatsKHR)(phys_dev_term->phys_dev, surface,
+                                                                                   pSurfaceFormatCount, NULL);
         } else {
             // Allocate a temporary array for the output of the old function
             VkSurfaceFormatKHR *formats = loader_stack_alloc(*pSurfaceFormatCount * sizeof(VkSurfaceFormatKHR));
@@ -2730,8 +2894,8 @@ VKAPI_ATTR VkResult VKAPI_CALL terminator_GetPhysicalDeviceSurfaceFormats2KHR(Vk
                 return VK_ERROR_OUT_OF_HOST_MEMORY;
             }
 
-            VkResult res = icd_term->dispatch.GetPhysicalDeviceSurfaceFormatsKHR(phys_dev_term->phys_dev, surface,
-                                                                                 pSurfaceFormatCount, formats);
+            VkResult res = ICD_TERM_DISPATCH(icd_term, GetPhysicalDeviceSurfaceFormatsKHR)(phys_dev_term->phys_dev, surface,
+                                                                                           pSurfaceFormatCount, formats);
             for (uint32_t i = 0; i < *pSurfaceFormatCount; ++i) {
                 pSurfaceFormats[i].surfaceFormat = formats[i];
                 if (pSurfaceFormats[i].pNext != NULL) {
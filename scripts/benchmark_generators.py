@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Khronos Group Inc.
+# Copyright 2026 Valve Corporation
+# Copyright 2026 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measure how long each code generator target takes to parse and load the registry and to
+# generate its file, along with the methods of LoaderExtensionOutputGenerator which output
+# each section of the generated files. Results are written as JSON and can be compared
+# against a previous run to catch generator changes which make code generation slower.
+#
+# generator_benchmark_baseline.json next to this script holds the results for the vk.xml of
+# the Vulkan-Headers version pinned in known_good.json, and is what CI compares against. As
+# it was measured on another machine, the baseline timings are first scaled by how much
+# faster or slower this machine parses and loads vk.xml, which the generators do not take
+# part in.
+
+import argparse
+import contextlib
+import functools
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+# Run the block and add its wall clock and process CPU time to timings[name]
+@contextlib.contextmanager
+def timed(timings, name):
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        timing = timings.setdefault(name, {'wall': 0.0, 'cpu': 0.0})
+        timing['wall'] += time.perf_counter() - wall_start
+        timing['cpu'] += time.process_time() - cpu_start
+
+# Wrap the methods of cls matching pattern so every call is timed into the dict returned by
+# get_timings() at the time of the call
+def instrument_methods(cls, pattern, get_timings):
+    def wrap(name, method):
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            with timed(get_timings(), name):
+                return method(*args, **kwargs)
+        return timed_method
+
+    for name, method in list(vars(cls).items()):
+        if callable(method) and re.search(pattern, name):
+            setattr(cls, name, wrap(name, method))
+
+# Keep the fastest of the timings of each iteration, which is the least affected by other
+# work running on the machine at the same time
+def merge_fastest(best, timings):
+    for name, timing in timings.items():
+        if name not in best:
+            best[name] = dict(timing)
+        else:
+            best[name] = {key: min(best[name][key], timing[key]) for key in timing}
+
+# Timings rounded to 0.1ms, which is well below the timing noise, to keep the JSON readable
+def rounded(timings):
+    return {name: {key: round(value, 4) for key, value in timing.items()} for name, timing in timings.items()}
+
+# Fastest time taken to parse and load vk.xml by any target of results
+def registry_time(results):
+    return min(target_results['phases']['parse']['wall'] + target_results['phases']['load']['wall']
+               for target_results in results['targets'].values())
+
+# Compare the wall clock times of results against baseline, returning a message for each
+# phase or method which got slower by more than the allowed tolerance. The baseline timings
+# are scaled by the ratio of the registry load times of results and baseline first, so a
+# baseline measured on a slower or faster machine can be used.
+def compare_results(results, baseline, tolerance, min_delta):
+    regressions = []
+    scale = registry_time(results) / registry_time(baseline)
+    for target, target_results in results['targets'].items():
+        if target not in baseline['targets']:
+            continue
+        for kind in ['phases', 'methods']:
+            baseline_timings = baseline['targets'][target].get(kind, {})
+            for name, timing in target_results[kind].items():
+                # Parsing and loading vk.xml is not done by the generators, and is what the baseline is scaled by
+                if name not in baseline_timings or name in ['parse', 'load']:
+                    continue
+                current = timing['wall']
+                previous = baseline_timings[name]['wall'] * scale
+                if current > previous * (1.0 + tolerance) and current - previous > min_delta:
+                    regressions.append(f'{target} {name}: {previous:.3f}s -> {current:.3f}s '
+                                       f'(+{(current / previous - 1.0) * 100.0 if previous > 0 else 0.0:.0f}%)')
+    return regressions
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Benchmark the code generators of this repository')
+    parser.add_argument('registry', metavar='REGISTRY_PATH', help='path to the Vulkan-Headers registry directory')
+    parser.add_argument('--target', action='append', help='target to benchmark, may be repeated (default: all targets)')
+    parser.add_argument('--iterations', type=int, default=3, help='number of times to generate each target, keeping the fastest time')
+    parser.add_argument('--methods', default='^Output', help='regular expression selecting the LoaderExtensionOutputGenerator methods to time')
+    parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON file from a previous run to compare the results against, such as '
+                                           'scripts/generator_benchmark_baseline.json')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='fraction a timing may grow over the baseline before it is reported')
+    parser.add_argument('--min-delta', type=float, default=0.01, help='seconds a timing may grow over the baseline regardless of tolerance')
+    args = parser.parse_args(argv)
+
+    registry = os.path.abspath(os.path.join(args.registry, 'vk.xml'))
+    if not os.path.isfile(registry):
+        registry = os.path.abspath(os.path.join(args.registry, 'Vulkan-Headers/registry/vk.xml'))
+        if not os.path.isfile(registry):
+            print(f'cannot find vk.xml in {args.registry}')
+            return -1
+
+    import loader_genvk
+    temp_obj = tempfile.TemporaryDirectory(prefix='loader_codegen_benchmark_')
+    with contextlib.redirect_stdout(io.StringIO()):
+        genvk_args = loader_genvk.makeArgParser().parse_args(['-registry', registry, '-quiet', '-o', temp_obj.name])
+        loader_genvk.importScripts(genvk_args)
+        loader_genvk.makeGenOpts(genvk_args)
+
+    targets = args.target if args.target else list(loader_genvk.genOpts.keys())
+    for target in targets:
+        if target not in loader_genvk.genOpts:
+            print(f'unknown target {target}')
+            return -1
+
+    method_timings = {}
+    instrument_methods(loader_genvk.LoaderExtensionOutputGenerator, args.methods, lambda: method_timings)
+
+    with open(registry, 'rb') as f:
+        registry_digest = hashlib.sha256(f.read()).hexdigest()
+    results = {'registry_sha256': registry_digest,
+               'python': sys.version,
+               'iterations': args.iterations,
+               'targets': {}}
+
+    for target in targets:
+        best_phases = {}
+        best_methods = {}
+        for _ in range(args.iterations):
+            phase_timings = {}
+            method_timings.clear()
+            # ignore generator output, it is especially noisy
+            with contextlib.redirect_stdout(io.StringIO()):
+                genvk_args.target = target
+                (gen, options) = loader_genvk.genTarget(genvk_args)
+                with timed(phase_timings, 'parse'):
+                    tree = loader_genvk.etree.parse(registry)
+                with timed(phase_timings, 'load'):
+                    reg = loader_genvk.Registry(gen, options)
+                    reg.loadElementTree(tree)
+                with timed(phase_timings, 'apiGen'):
+                    reg.apiGen()
+            merge_fastest(best_phases, phase_timings)
+            merge_fastest(best_methods, method_timings)
+
+        results['targets'][target] = {'phases': rounded(best_phases), 'methods': rounded(best_methods)}
+        print(target)
+        for name, timing in list(best_phases.items()) + sorted(best_methods.items(), key=lambda item: -item[1]['wall']):
+            print(f'  {name}: {timing["wall"]:.3f}s wall, {timing["cpu"]:.3f}s cpu')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+            f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('registry_sha256') != registry_digest:
+            # Generation time depends on the registry, so only results for the same vk.xml can be compared
+            print('ERROR: baseline was measured with a different vk.xml, regenerate it with --output')
+            return 1
+        print(f'baseline timings scaled by {registry_time(results) / registry_time(baseline):.2f} for the speed of this machine')
+        regressions = compare_results(results, baseline, args.tolerance, args.min_delta)
+        for regression in regressions:
+            print('ERROR: slower than baseline:', regression)
+        if regressions:
+            return 1
+        print('SUCCESS: no timing is slower than the baseline')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Khronos Group Inc.
+# Copyright 2026 Valve Corporation
+# Copyright 2026 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Check the ways update_deps.py fetches, shares and caches the dependent repos. Each check
+# runs update_deps.py against a known_good.json written for it, naming bare repositories
+# created in a temporary directory and reached through file:// URLs, so nothing is
+# downloaded. The repos which are built use a custom_build step which copies the checked
+# out files to the install directory, so no compiler is needed either.
+#
+# The checks cover:
+#   - --shallow fetching only the known-good commit, and falling back to a full fetch when
+#     the server does not allow fetching it directly
+#   - --shallow with a --ref naming a tag, which is kept so the next run finds it locally
+#   - --mirror-dir clones borrowing their objects from the mirror, and being cloned again
+#     once the mirror is gone
+#   - --mirror-max-age removing the mirrors which were not used recently
+#   - --install-cache restoring install directories, and building them again when the
+#     commit or cmake_options of the repo or of a repo it depends on change
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+UPDATE_DEPS = os.path.join(SCRIPT_DIR, 'update_deps.py')
+
+sys.path.insert(0, SCRIPT_DIR)
+from update_deps import FileLock
+
+# Commits are made with a fixed identity, whatever the git configuration of the machine is
+GIT_ENV = dict(os.environ,
+               GIT_AUTHOR_NAME='update_deps', GIT_AUTHOR_EMAIL='update_deps@example.com',
+               GIT_COMMITTER_NAME='update_deps', GIT_COMMITTER_EMAIL='update_deps@example.com')
+
+# Makes git use version 0 of the wire protocol, whose servers refuse to send commits which are
+# not a branch or tag unless told to allow it, like many hosted servers do
+PROTOCOL_V0_ENV = dict(os.environ, GIT_CONFIG_COUNT='1', GIT_CONFIG_KEY_0='protocol.version', GIT_CONFIG_VALUE_0='0')
+
+class CheckError(Exception):
+    pass
+
+def expect(condition, message):
+    if not condition:
+        raise CheckError(message)
+
+def git(directory, *args):
+    result = subprocess.run(['git'] + list(args), cwd=directory, env=GIT_ENV, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise CheckError('git {} failed in {}:\n{}'.format(' '.join(args), directory, result.stderr))
+    return result.stdout.strip()
+
+class UpstreamRepo:
+    """A bare repository standing in for the server of a dependent repo, with a work tree to commit from"""
+
+    def __init__(self, top, name):
+        self.name = name
+        self.bare_dir = os.path.join(top, 'upstream', name + '.git')
+        self.work_dir = os.path.join(top, 'upstream', name)
+        os.makedirs(self.bare_dir)
+        os.makedirs(self.work_dir)
+        git(self.bare_dir, 'init', '--bare', '--quiet')
+        git(self.work_dir, 'init', '--quiet')
+        git(self.work_dir, 'remote', 'add', 'origin', self.bare_dir)
+        self.url = 'file://' + self.bare_dir.replace('\\', '/')
+
+    def commit(self, contents):
+        """Commit contents as the file version.txt and push it, returning the commit hash"""
+        with open(os.path.join(self.work_dir, 'version.txt'), 'w') as f:
+            f.write(contents)
+        git(self.work_dir, 'add', 'version.txt')
+        git(self.work_dir, 'commit', '--quiet', '-m', contents)
+        git(self.work_dir, 'push', '--quiet', 'origin', 'HEAD:refs/heads/main')
+        return git(self.work_dir, 'rev-parse', 'HEAD')
+
+    def tag(self, name):
+        git(self.work_dir, 'tag', '-a', '-m', name, name)
+        git(self.work_dir, 'push', '--quiet', 'origin', 'refs/tags/' + name)
+
+    def known_good(self, commit, build=False, cmake_options=None, deps=None):
+        """Returns the known_good.json entry for this repo at commit"""
+        repo = {
+            'name': self.name,
+            'url': self.url,
+            'sub_dir': self.name,
+            'build_dir': self.name + '/build',
+            'install_dir': self.name + '/install',
+            'commit': commit,
+            'build_step': 'skip',
+        }
+        if build:
+            # Install the checked out version.txt, which str.format in update_deps.py points at the install directory
+            repo['build_step'] = 'custom'
+            install_dir = '{{0[{n}][install_dir]}}'.format(n=self.name)
+            repo['custom_build'] = ['cmake -E make_directory ' + install_dir, 'cmake -E copy version.txt ' + install_dir]
+            repo['cmake_options'] = cmake_options if cmake_options else []
+            repo['deps'] = [{'var_name': d.name.upper() + '_INSTALL_DIR', 'repo_name': d.name} for d in (deps if deps else [])]
+        return repo
+
+class Checker:
+    def __init__(self, top):
+        self.top = top
+        self.runs = 0
+        os.makedirs(top)
+
+    def run(self, repos, *args, env=None):
+        """Run update_deps.py for the known_good.json entries in repos, returning its output"""
+        self.runs += 1
+        known_good_dir = os.path.join(self.top, 'known_good', str(self.runs))
+        os.makedirs(known_good_dir)
+        with open(os.path.join(known_good_dir, 'known_good.json'), 'w') as f:
+            json.dump({'repos': repos}, f, indent=4)
+        cmd = [sys.executable, UPDATE_DEPS, '--known_good_dir', known_good_dir] + list(args)
+        result = subprocess.run(cmd, cwd=self.top, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise CheckError('{} failed:\n{}{}'.format(' '.join(cmd), result.stdout, result.stderr))
+        return result.stdout + result.stderr
+
+    def dir(self, name):
+        return os.path.join(self.top, name)
+
+def check_shallow(checker):
+    upstream = UpstreamRepo(checker.top, 'Shallow')
+    first = upstream.commit('1')
+    second = upstream.commit('2')
+    upstream.commit('3')
+
+    # A commit which is neither a branch nor a tag is fetched on its own when the server allows it
+    top = checker.dir('shallow')
+    checker.run([upstream.known_good(first)], '--dir', top, '--shallow')
+    repo = os.path.join(top, 'Shallow')
+    expect(git(repo, 'rev-parse', 'HEAD') == first, '--shallow did not check out the known-good commit')
+    expect(os.path.isfile(os.path.join(repo, '.git', 'shallow')), '--shallow fetched the history of the known-good commit')
+    expect(git(repo, 'rev-list', '--count', 'HEAD') == '1', '--shallow fetched more than the known-good commit')
+
+    # A run without --shallow fetches the whole history of the repo left shallow
+    checker.run([upstream.known_good(second)], '--dir', top)
+    expect(git(repo, 'rev-parse', 'HEAD') == second, 'did not check out the known-good commit of a shallow repo')
+    expect(not os.path.exists(os.path.join(repo, '.git', 'shallow')), 'a shallow repo was not unshallowed without --shallow')
+    expect(git(repo, 'rev-list', '--count', 'HEAD') == '2', 'a shallow repo is missing history after a full fetch')
+
+    # A server which refuses to send the commit directly falls back to a full fetch
+    top = checker.dir('shallow-fallback')
+    output = checker.run([upstream.known_good(first)], '--dir', top, '--shallow', env=PROTOCOL_V0_ENV)
+    repo = os.path.join(top, 'Shallow')
+    expect('falling back to a full fetch' in output, '--shallow did not fall back to a full fetch:\n' + output)
+    expect(git(repo, 'rev-parse', 'HEAD') == first, 'the full fetch fallback did not check out the known-good commit')
+    expect(not os.path.exists(os.path.join(repo, '.git', 'shallow')), 'the full fetch fallback left a shallow repo')
+
+def check_shallow_tag(checker):
+    upstream = UpstreamRepo(checker.top, 'Tagged')
+    upstream.commit('1')
+    tagged = upstream.commit('2')
+    upstream.tag('v2')
+    upstream.commit('3')
+
+    top = checker.dir('shallow-tag')
+    repos = [upstream.known_good('main')]
+    checker.run(repos, '--dir', top, '--shallow', '--ref', 'v2')
+    repo = os.path.join(top, 'Tagged')
+    expect(git(repo, 'rev-parse', 'HEAD') == tagged, '--shallow --ref did not check out the tagged commit')
+    expect(git(repo, 'rev-parse', 'refs/tags/v2^{commit}') == tagged, '--shallow --ref did not keep the fetched tag')
+
+    # The tag is found locally the next time, without fetching
+    output = checker.run(repos, '--dir', top, '--shallow', '--ref', 'v2')
+    expect('cache hit' in output, 'the tag fetched by --shallow --ref was fetched again:\n' + output)
+
+def check_mirror(checker):
+    upstream = UpstreamRepo(checker.top, 'Mirrored')
+    first = upstream.commit('1')
+    mirror_dir = checker.dir('mirrors')
+
+    # Clones borrow the objects of the mirror and still point at the real URL
+    top = checker.dir('mirror-1')
+    checker.run([upstream.known_good(first)], '--dir', top, '--mirror-dir', mirror_dir)
+    repo = os.path.join(top, 'Mirrored')
+    mirrors = [entry for entry in os.listdir(mirror_dir) if entry.endswith('.git')]
+    expect(len(mirrors) == 1, 'expected one mirror, found {}'.format(mirrors))
+    mirror = os.path.join(mirror_dir, mirrors[0])
+    with open(os.path.join(repo, '.git', 'objects', 'info', 'alternates')) as f:
+        alternates = [os.path.normcase(os.path.realpath(line.strip())) for line in f if line.strip()]
+    expect(alternates == [os.path.normcase(os.path.realpath(os.path.join(mirror, 'objects')))],
+           'the clone does not borrow the objects of the mirror: {}'.format(alternates))
+    expect(git(repo, 'config', '--get', 'remote.origin.url') == upstream.url, 'the clone of the mirror does not point at the real URL')
+    expect(git(repo, 'rev-parse', 'HEAD') == first, 'the clone of the mirror did not check out the known-good commit')
+    objects = dict(line.split(': ') for line in git(repo, 'count-objects', '-v').splitlines())
+    expect(objects['count'] == '0' and objects['in-pack'] == '0', 'the clone of the mirror has objects of its own: {}'.format(objects))
+
+    # Another top directory uses the same mirror, which fetches the new known-good commit
+    second = upstream.commit('2')
+    top = checker.dir('mirror-2')
+    checker.run([upstream.known_good(second)], '--dir', top, '--mirror-dir', mirror_dir)
+    expect(git(mirror, 'rev-parse', '--verify', '--quiet', second + '^{commit}') == second, 'the mirror was not fetched')
+    expect(git(os.path.join(top, 'Mirrored'), 'rev-parse', 'HEAD') == second,
+           'the second clone of the mirror did not check out the known-good commit')
+
+    # Once the mirror is gone, the clone borrowing from it is cloned again
+    shutil.rmtree(mirror)
+    checker.run([upstream.known_good(first)], '--dir', checker.dir('mirror-1'))
+    expect(not os.path.exists(os.path.join(repo, '.git', 'objects', 'info', 'alternates')),
+           'the clone of a removed mirror was not cloned again')
+    expect(git(repo, 'rev-parse', 'HEAD') == first, 'the clone of a removed mirror did not check out the known-good commit')
+    git(repo, 'fsck', '--no-progress')
+
+def check_mirror_eviction(checker):
+    used = UpstreamRepo(checker.top, 'Used')
+    unused = UpstreamRepo(checker.top, 'Unused')
+    used_commit = used.commit('1')
+    unused_commit = unused.commit('1')
+    mirror_dir = checker.dir('evicted-mirrors')
+    top = checker.dir('eviction')
+    checker.run([used.known_good(used_commit), unused.known_good(unused_commit)], '--dir', top, '--mirror-dir', mirror_dir)
+    mirrors = {name: os.path.join(mirror_dir, entry) for entry in os.listdir(mirror_dir) if entry.endswith('.git')
+               for name in ['Used', 'Unused'] if entry.startswith(name + '-')}
+    expect(sorted(mirrors) == ['Unused', 'Used'], 'expected a mirror for each repo, found {}'.format(os.listdir(mirror_dir)))
+
+    # Make both mirrors look unused for 40 days. The run uses one of them, which is kept.
+    old = time.time() - 40 * 24 * 60 * 60
+    for mirror in mirrors.values():
+        os.utime(mirror + '.lock', (old, old))
+
+    # A mirror locked by another run is left alone
+    lock = FileLock(mirrors['Unused'] + '.lock')
+    expect(lock.acquire(blocking=False), 'could not lock the mirror')
+    try:
+        checker.run([used.known_good(used_commit)], '--dir', top, '--mirror-dir', mirror_dir)
+    finally:
+        lock.release()
+    expect(os.path.isdir(mirrors['Used']), 'a mirror used by the run was removed')
+    expect(os.path.isdir(mirrors['Unused']), 'a mirror locked by another run was removed')
+
+    os.utime(mirrors['Unused'] + '.lock', (old, old))
+    output = checker.run([used.known_good(used_commit)], '--dir', top, '--mirror-dir', mirror_dir)
+    expect(not os.path.exists(mirrors['Unused']), 'a mirror unused for longer than --mirror-max-age was kept:\n' + output)
+    expect(os.path.isdir(mirrors['Used']), 'a mirror used by the run was removed')
+
+    # A mirror is kept for --mirror-max-age days after its last use
+    checker.run([used.known_good(used_commit)], '--dir', top, '--mirror-dir', mirror_dir, '--mirror-max-age', '1')
+    expect(os.path.isdir(mirrors['Used']), 'a mirror used within --mirror-max-age was removed')
+
+def check_install_cache(checker):
+    base = UpstreamRepo(checker.top, 'Base')
+    app = UpstreamRepo(checker.top, 'App')
+    base_first = base.commit('base 1')
+    base_second = base.commit('base 2')
+    app_commit = app.commit('app 1')
+    cache = checker.dir('install-cache')
+
+    def run(name, base_commit, app_options):
+        top = checker.dir(name)
+        output = checker.run([base.known_good(base_commit, build=True),
+                              app.known_good(app_commit, build=True, cmake_options=app_options, deps=[base])],
+                             '--dir', top, '--install-cache', cache)
+        with open(os.path.join(top, 'Base', 'install', 'version.txt')) as f:
+            base_version = f.read()
+        with open(os.path.join(top, 'App', 'install', 'version.txt')) as f:
+            app_version = f.read()
+        expect(app_version == 'app 1', 'App was installed from the wrong commit: {}'.format(app_version))
+        return output, base_version
+
+    def expect_steps(output, steps):
+        for name, step in steps.items():
+            expect('{} {} ('.format(step, name) in output, 'expected {} to be {}:\n{}'.format(name, step.lower(), output))
+
+    output, base_version = run('cache-1', base_first, [])
+    expect_steps(output, {'Base': 'Installed', 'App': 'Installed'})
+    expect(base_version == 'base 1', 'Base was installed from the wrong commit: {}'.format(base_version))
+
+    # Another top directory restores both from the cache
+    output, base_version = run('cache-2', base_first, [])
+    expect_steps(output, {'Base': 'Restored', 'App': 'Restored'})
+    expect(base_version == 'base 1', 'Base was restored from the wrong package: {}'.format(base_version))
+
+    # Changing the cmake_options of App builds it again, but not Base
+    output, base_version = run('cache-3', base_first, ['-DAPP_OPTION=ON'])
+    expect_steps(output, {'Base': 'Restored', 'App': 'Installed'})
+
+    # Changing the commit of Base builds both again, as App depends on it
+    output, base_version = run('cache-4', base_second, [])
+    expect_steps(output, {'Base': 'Installed', 'App': 'Installed'})
+    expect(base_version == 'base 2', 'Base was installed from the wrong commit: {}'.format(base_version))
+
+    output, base_version = run('cache-5', base_second, [])
+    expect_steps(output, {'Base': 'Restored', 'App': 'Restored'})
+    expect(base_version == 'base 2', 'Base was restored from the wrong package: {}'.format(base_version))
+
+CHECKS = [check_shallow, check_shallow_tag, check_mirror, check_mirror_eviction, check_install_cache]
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Check how update_deps.py fetches, shares and caches the dependent repos')
+    parser.add_argument('--keep', action='store_true', help='keep the temporary directory of the checks')
+    args = parser.parse_args(argv)
+
+    top = tempfile.mkdtemp(prefix='update_deps_')
+    failed = []
+    for check in CHECKS:
+        print(check.__name__, flush=True)
+        try:
+            check(Checker(os.path.join(top, check.__name__)))
+        except CheckError as e:
+            print('ERROR: {}: {}'.format(check.__name__, e))
+            failed.append(check.__name__)
+    if args.keep:
+        print('Kept {}'.format(top))
+    else:
+        shutil.rmtree(top, ignore_errors=True)
+
+    if failed:
+        print('ERROR: {} of {} checks failed'.format(len(failed), len(CHECKS)))
+        return 1
+    print('SUCCESS: all {} checks passed'.format(len(CHECKS)))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
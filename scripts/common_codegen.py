@@ -19,6 +19,8 @@
 # Author: Mark Lobodzinski <mark@lunarg.com>
 
 import os
+import weakref
+from collections import namedtuple
 
 # Copyright text prefixing all headers (list of strings).
 prefixStrings = [
@@ -75,3 +77,188 @@ def GetFeatureProtect(interface):
 # helper to define paths relative to the repo root
 def repo_relative(path):
     return os.path.abspath(os.path.join(os.path.dirname(__file__), '..', path))
+
+#
+# Handle type defined in the registry, and whether it is dispatchable (VK_DEFINE_HANDLE)
+# or non-dispatchable (VK_DEFINE_NON_DISPATCHABLE_HANDLE)
+HandleTypeInfo = namedtuple('HandleTypeInfo', ['name', 'category', 'dispatchable'])
+
+# Handle type indexes already built, per registry tree
+_handle_type_indexes = weakref.WeakKeyDictionary()
+
+#
+# Return the handle types of the registry keyed by type name. The index is built on first use
+# and shared by every generator using the same registry, so looking up a handle type is a dict
+# lookup instead of a search through all the types in the registry tree.
+def GetHandleTypes(registry):
+    tree = registry.tree
+    if tree not in _handle_type_indexes:
+        handle_types = {}
+        for handle in tree.findall("types/type[@category='handle']"):
+            # Aliases only carry a name attribute and are not handle definitions themselves
+            name = handle.findtext('name')
+            if name is not None and name not in handle_types:
+                handle_types[name] = HandleTypeInfo(name = name,
+                                                    category = handle.get('category'),
+                                                    dispatchable = handle.findtext('type') == 'VK_DEFINE_HANDLE')
+        _handle_type_indexes[tree] = handle_types
+    return _handle_type_indexes[tree]
+
+#
+# Collects generated code as a list of fragments instead of one string that is copied on every
+# append, or writes the fragments straight to file when one is given. `emitter += text` appends
+# a string or everything collected by another CodeEmitter, so generators build code the same way
+# they would build a string.
+class CodeEmitter:
+    def __init__(self, file = None):
+        self.file = file
+        self.fragments = []
+        self.tail = ''
+
+    def write(self, text):
+        fragments = text.fragments if isinstance(text, CodeEmitter) else [text]
+        if self.file is not None:
+            self.file.writelines(fragments)
+        else:
+            self.fragments.extend(fragments)
+        for fragment in reversed(fragments):
+            if fragment:
+                self.tail = fragment
+                break
+
+    def __iadd__(self, text):
+        self.write(text)
+        return self
+
+    # Lets code that still builds a plain string append what was collected
+    def __radd__(self, text):
+        return text + self.getvalue()
+
+    # Start and end a block of code that is only compiled when protect is defined, if there is one
+    def beginProtect(self, protect):
+        if protect is not None:
+            self.write(f'#if defined({protect})\n')
+
+    def endProtect(self, protect):
+        if protect is not None:
+            self.write(f'#endif // {protect}\n')
+
+    # Whether the last text written ends with suffix
+    def endswith(self, suffix):
+        return self.tail.endswith(suffix)
+
+    # All of the collected code as one string
+    def getvalue(self):
+        return ''.join(self.fragments)
+
+#
+# Strings packed one after another into a single char array, so generated tables can refer to a
+# string by its offset in the array. Unlike a pointer, an offset does not need a relocation when
+# the library is loaded. Offset 0 holds an empty string so tables can use 0 for "no string".
+class StringPool:
+    def __init__(self, strings = ()):
+        self.offsets = {'': 0}
+        self.strings = ['']
+        self.size = 1
+        for string in strings:
+            self.add(string)
+
+    # Add string to the pool if it is not already in it, and return its offset
+    def add(self, string):
+        if string not in self.offsets:
+            self.offsets[string] = self.size
+            self.strings.append(string)
+            self.size += len(string.encode('utf-8')) + 1
+        return self.offsets[string]
+
+    def offset(self, string):
+        return self.offsets[string]
+
+    # Smallest unsigned C type which holds every offset in the pool
+    def offsetType(self):
+        return 'uint16_t' if self.size <= 0x10000 else 'uint32_t'
+
+    # C definition of the pool as a char array, one string per line. MSVC rejects string literals
+    # longer than 65535 bytes after concatenation, so a larger pool is initialized with a list of
+    # characters instead.
+    def definition(self, declaration):
+        if self.size <= 65535:
+            text = f'{declaration}[] =\n'
+            text += ''.join(f'    "{string}\\0"\n' for string in self.strings[:-1])
+            text += f'    "{self.strings[-1]}";\n'
+            return text
+        text = f'{declaration}[] = {{\n'
+        for string in self.strings:
+            chars = ''.join(f"'{char}', " if char not in "\\'" else f"'\\{char}', " for char in string)
+            text += f'    {chars}0,\n'
+        text += '};\n'
+        return text
+
+#
+# String hash used by the generated lookup tables. This must produce exactly the same
+# value as loader_hash_name() in the generated vk_loader_extensions_internal.h (32 bit FNV-1a).
+def LoaderNameHash(name, seed):
+    hash = (2166136261 ^ seed) & 0xFFFFFFFF
+    for c in name.encode('utf-8'):
+        hash ^= c
+        hash = (hash * 16777619) & 0xFFFFFFFF
+    return hash
+
+#
+# Map a name hash to its slot in a perfect hash table. This must produce exactly the same
+# value as loader_perfect_hash_slot() in the generated vk_loader_extensions_internal.h.
+def PerfectHashSlot(hash, displacement, slot_bits):
+    return (((hash ^ displacement) * 2654435761) & 0xFFFFFFFF) >> (32 - slot_bits)
+
+#
+# Collision-free hash over a fixed set of names, computed at generation time using the
+# "hash and displace" scheme. The name hash selects a bucket, and each bucket stores the
+# displacement that moves all of its names into otherwise unused slots, so a lookup costs one
+# pass over the name plus a single string compare against the only possible candidate.
+class PerfectHash:
+    def __init__(self, names):
+        if len(set(names)) != len(names):
+            raise ValueError('PerfectHash requires unique names')
+
+        # Power of two slot count so the generated code can shift instead of dividing,
+        # with twice as many slots as buckets to keep the displacement search short.
+        self.slot_bits = max(1, (len(names) - 1).bit_length())
+        self.slot_count = 1 << self.slot_bits
+        self.bucket_count = max(1, self.slot_count // 2)
+        self.bucket_mask = self.bucket_count - 1
+
+        for seed in range(0, 1024):
+            if self._build(names, seed):
+                self.seed = seed
+                return
+        raise RuntimeError('Unable to find a perfect hash for the given names')
+
+    def _build(self, names, seed):
+        hashes = {name: LoaderNameHash(name, seed) for name in names}
+        if len(set(hashes.values())) != len(names):
+            return False
+
+        buckets = [[] for _ in range(self.bucket_count)]
+        for name in names:
+            buckets[hashes[name] & self.bucket_mask].append(name)
+
+        self.slots = [None] * self.slot_count
+        self.slot_of = {}
+        self.displacements = [0] * self.bucket_count
+
+        # Place the largest buckets first while there are still plenty of free slots
+        for bucket_index in sorted(range(self.bucket_count), key=lambda i: -len(buckets[i])):
+            bucket = buckets[bucket_index]
+            if not bucket:
+                continue
+            for displacement in range(0, 0x10000):
+                slots = [PerfectHashSlot(hashes[name], displacement, self.slot_bits) for name in bucket]
+                if len(set(slots)) == len(slots) and all(self.slots[slot] is None for slot in slots):
+                    for name, slot in zip(bucket, slots):
+                        self.slots[slot] = name
+                        self.slot_of[name] = slot
+                    self.displacements[bucket_index] = displacement
+                    break
+            else:
+                return False
+        return True
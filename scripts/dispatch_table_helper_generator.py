@@ -131,6 +131,7 @@ class DispatchTableHelperOutputGenerator(OutputGenerator):
         preamble = ''
         preamble += '#include <vulkan/vulkan.h>\n'
         preamble += '#include <vulkan/vk_layer.h>\n'
+        preamble += '#include <stddef.h>\n'
         preamble += '#include <string.h>\n'
         preamble += '#include "loader/generated/vk_layer_dispatch_table.h"\n'
 
@@ -178,7 +179,7 @@ class DispatchTableHelperOutputGenerator(OutputGenerator):
     #
     # Determine if this API should be ignored or added to the instance or device dispatch table
     def AddCommandToDispatchList(self, name, handle_type, protect, cmdinfo):
-        handle = self.registry.tree.find("types/type/[name='" + handle_type + "'][@category='handle']")
+        handle = GetHandleTypes(self.registry).get(handle_type)
         if handle is None:
             return
         if handle_type != 'VkInstance' and handle_type != 'VkPhysicalDevice' and name != 'vkGetInstanceProcAddr':
@@ -204,33 +205,56 @@ class DispatchTableHelperOutputGenerator(OutputGenerator):
         table = ''
         if table_type == 'device':
             entries = self.device_dispatch_list
-            table += 'static inline void layer_init_device_dispatch_table(VkDevice device, VkLayerDispatchTable *table, PFN_vkGetDeviceProcAddr gpa) {\n'
-            table += '    memset(table, 0, sizeof(*table));\n'
-            table += '    table->magic = DEVICE_DISP_TABLE_MAGIC_NUMBER;\n\n'
-            table += '    // Device function pointers\n'
+            table_name = 'layer_device_dispatch_init_table'
+            table_struct = 'VkLayerDispatchTable'
+            handle = 'device'
         else:
             entries = self.instance_dispatch_list
-            table += 'static inline void layer_init_instance_dispatch_table(VkInstance instance, VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa) {\n'
-            table += '    memset(table, 0, sizeof(*table));\n\n'
-            table += '    // Instance function pointers\n'
+            table_name = 'layer_instance_dispatch_init_table'
+            table_struct = 'VkLayerInstanceDispatchTable'
+            handle = 'instance'
+
+        if table_type == 'device':
+            table += '// Entry of the tables of commands looked up by layer_init_device_dispatch_table and layer_init_instance_dispatch_table\n'
+            table += 'struct layer_dispatch_table_init_entry {\n'
+            table += '    size_t table_offset;  // Offset of the command in the dispatch table\n'
+            table += '    const char *name;     // Command name passed to gpa\n'
+            table += '};\n\n'
 
+        table += 'static const struct layer_dispatch_table_init_entry %s[] = {\n' % table_name
+        gpa_assignment = ''
         for item in entries:
             # Remove 'vk' from proto name
             base_name = item[0][2:]
 
-            if item[1] is not None:
-                table += '#if defined(%s)\n' % item[1]
-
             # If we're looking for the proc we are passing in, just point the table to it.  This fixes the issue where
             # a layer overrides the function name for the loader.
             if (table_type == 'device' and base_name == 'GetDeviceProcAddr'):
-                table += '    table->GetDeviceProcAddr = gpa;\n'
+                gpa_assignment = '    table->GetDeviceProcAddr = gpa;\n'
+                continue
             elif (table_type != 'device' and base_name == 'GetInstanceProcAddr'):
-                table += '    table->GetInstanceProcAddr = gpa;\n'
-            else:
-                table += '    table->%s = (PFN_%s) gpa(%s, "%s");\n' % (base_name, item[0], table_type, item[0])
+                gpa_assignment = '    table->GetInstanceProcAddr = gpa;\n'
+                continue
+
+            if item[1] is not None:
+                table += '#if defined(%s)\n' % item[1]
+            table += '    {offsetof(%s, %s), "%s"},\n' % (table_struct, base_name, item[0])
             if item[1] is not None:
                 table += '#endif // %s\n' % item[1]
+        table += '};\n\n'
 
+        if table_type == 'device':
+            table += 'static inline void layer_init_device_dispatch_table(VkDevice device, VkLayerDispatchTable *table, PFN_vkGetDeviceProcAddr gpa) {\n'
+            table += '    memset(table, 0, sizeof(*table));\n'
+            table += '    table->magic = DEVICE_DISP_TABLE_MAGIC_NUMBER;\n\n'
+            table += '    // Device function pointers\n'
+        else:
+            table += 'static inline void layer_init_instance_dispatch_table(VkInstance instance, VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa) {\n'
+            table += '    memset(table, 0, sizeof(*table));\n\n'
+            table += '    // Instance function pointers\n'
+        table += '    for (size_t i = 0; i < sizeof(%s) / sizeof(%s[0]); i++) {\n' % (table_name, table_name)
+        table += '        *(PFN_vkVoidFunction *)((char *)table + %s[i].table_offset) = gpa(%s, %s[i].name);\n' % (table_name, handle, table_name)
+        table += '    }\n'
+        table += gpa_assignment
         table += '}'
         return table
@@ -22,15 +22,79 @@
 
 import argparse
 import common_codegen
+import concurrent.futures
+import contextlib
 import filecmp
+import glob
+import hashlib
+import io
+import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import datetime
 import re
 
+# Run the code generators for targets in this process, writing the generated files to gen_dir.
+# Returns the return code, the generator diagnostics and the per-phase timings.
+def generate_in_process(registry, genvk_options, targets, gen_dir):
+    import loader_genvk
+    stderr = io.StringIO()
+    try:
+        # ignore generator output, vk_validation_stats.py is especially noisy
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            loader_genvk.errWarn = stderr
+            genvk_args = loader_genvk.makeArgParser().parse_args(['-registry', registry, '-quiet', '-o', gen_dir] + genvk_options)
+            loader_genvk.importScripts(genvk_args)
+            timings = loader_genvk.genTargets(genvk_args, targets)
+    except Exception as e:
+        return (1, stderr.getvalue() + f'ERROR: {str(e)}\n', [])
+    return (0, stderr.getvalue(), timings)
+
+# Compare (--verify) or copy (--incremental) a generated file against the one in the repo.
+# Returns whether the repo file matches and the messages to report for it.
+def check_generated_file(args, gen_dir, repo_dir, filename):
+    gen_filename = os.path.join(gen_dir, filename)
+    repo_filename = os.path.join(repo_dir, filename)
+    if os.path.exists(repo_filename) and filecmp.cmp(gen_filename, repo_filename, shallow=False):
+        return (True, '')
+    if args.verify:
+        if not os.path.exists(repo_filename):
+            return (False, f'ERROR: Missing repo file {filename}\n')
+        return (False, f'ERROR: Repo files do not match generator output for {filename}\n')
+    # replace the repo file in one step so it is never seen half written
+    with tempfile.NamedTemporaryFile(dir=repo_dir, prefix=f'.{filename}.', delete=False) as temp_file:
+        pass
+    shutil.copyfile(gen_filename, temp_file.name)
+    if os.path.exists(repo_filename):
+        shutil.copymode(repo_filename, temp_file.name)
+    else:
+        os.chmod(temp_file.name, 0o644)
+    os.replace(temp_file.name, repo_filename)
+    return (True, f'update {repo_filename}\n')
+
+# SHA-256 hex digest of the contents of a file
+def file_digest(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# Digest of everything the output of a generator target depends on: the registry, the registry scripts
+# from Vulkan-Headers, the loader generator scripts and the options the target is generated with.
+def target_input_digest(args, registry, target, generator):
+    sha = hashlib.sha256()
+    sha.update(json.dumps({'target': target, 'api': args.api, 'lazy_icd_entries': args.lazy_icd_entries,
+                      'trampoline_stats': args.trampoline_stats}).encode())
+    filenames = [registry] + sorted(glob.glob(os.path.join(os.path.dirname(registry), '*.py')))
+    if args.dispatch_profile:
+        filenames.append(os.path.abspath(args.dispatch_profile))
+    filenames += [common_codegen.repo_relative(f'scripts/{script}') for script in ['loader_genvk.py', 'common_codegen.py', generator]]
+    for filename in filenames:
+        sha.update(file_digest(filename).encode())
+    return sha.hexdigest()
+
 def main(argv):
     parser = argparse.ArgumentParser(description='Generate source code for this repository')
     parser.add_argument('registry', metavar='REGISTRY_PATH', help='path to the Vulkan-Headers registry directory')
@@ -39,6 +103,12 @@ def main(argv):
                         choices=['vulkan'],
                         help='Specify API name to generate')
     parser.add_argument('--generated-version', help='sets the header version used to generate the repo')
+    parser.add_argument('--single-process', action='store_true', help='load the registry once and generate every file from it in this process')
+    parser.add_argument('--manifest', metavar='FILE', help='record the inputs of each generated file in FILE and skip files whose inputs are unchanged')
+    parser.add_argument('--lazy-icd-entries', action='store_true', help='generate ICD dispatch tables which look up each entry from the driver when it is first used')
+    parser.add_argument('--dispatch-profile', metavar='FILE', help='JSON object of device command names to call counts, used to order the hot dispatch table')
+    parser.add_argument('--trampoline-stats', action='store_true', help='generate trampolines which count and time the calls made through them when built with LOADER_TRAMPOLINE_STATS')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='generate files in parallel in up to JOBS worker processes')
     group = parser.add_mutually_exclusive_group()
     group.add_argument('-i', '--incremental', action='store_true', help='only update repo files that change')
     group.add_argument('-v', '--verify', action='store_true', help='verify repo files match generator output')
@@ -51,18 +121,46 @@ def main(argv):
             print(f'cannot find vk.xml in {args.registry}')
             return -1
 
-    gen_cmds = [[common_codegen.repo_relative('scripts/loader_genvk.py'),
-                 '-registry', registry,
-                 '-quiet',
-                 filename] for filename in ['vk_layer_dispatch_table.h',
-                                            'vk_loader_extensions.h',
-                                            'vk_loader_extensions.c',
-                                            'vk_object_types.h']]
+    genvk_options = []
+    if args.lazy_icd_entries:
+        genvk_options += ['-lazyIcdEntries']
+    if args.dispatch_profile:
+        genvk_options += ['-dispatchProfile', os.path.abspath(args.dispatch_profile)]
+    if args.trampoline_stats:
+        genvk_options += ['-trampolineStats']
 
+    # generated files and the generator script that produces each of them
+    generators = {'vk_layer_dispatch_table.h': 'loader_extension_generator.py',
+                  'vk_loader_extensions.h': 'loader_extension_generator.py',
+                  'vk_loader_extensions_internal.h': 'loader_extension_generator.py',
+                  'vk_loader_extensions_dispatch.c': 'loader_extension_generator.py',
+                  'vk_loader_extensions_lookup.c': 'loader_extension_generator.py',
+                  'vk_loader_extensions_trampolines.c': 'loader_extension_generator.py',
+                  'vk_loader_extensions_gpa.c': 'loader_extension_generator.py',
+                  'vk_object_types.h': 'helper_file_generator.py'}
+    all_targets = list(generators)
     repo_dir = common_codegen.repo_relative('loader/generated')
+    targets = all_targets
+
+    # skip the files whose inputs are the same as when they were last generated, and that have not been modified since
+    manifest = {}
+    if args.manifest and not args.verify:
+        if os.path.isfile(args.manifest):
+            with open(args.manifest, 'r') as f:
+                manifest = json.load(f)
+        input_digests = {target: target_input_digest(args, registry, target, generators[target]) for target in all_targets}
+        targets = []
+        for target in all_targets:
+            repo_filename = os.path.join(repo_dir, target)
+            entry = manifest.get(target, {})
+            if entry.get('inputs') == input_digests[target] and \
+               os.path.isfile(repo_filename) and entry.get('output') == file_digest(repo_filename):
+                print('skip', target, '(inputs unchanged)')
+            else:
+                targets.append(target)
 
     # get directory where generators will run
-    if args.verify or args.incremental:
+    if args.verify or args.incremental or args.manifest:
         # generate in temp directory so we can compare or copy later
         temp_obj = tempfile.TemporaryDirectory(prefix='loader_codegen_')
         temp_dir = temp_obj.name
@@ -71,36 +169,78 @@ def main(argv):
         # generate directly in the repo
         gen_dir = repo_dir
 
-    # run each code generator
-    for cmd in gen_cmds:
-        print(' '.join(cmd))
-        try:
-            subprocess.check_call([sys.executable] + cmd,
-                                  # ignore generator output, vk_validation_stats.py is especially noisy
-                                  stdout=subprocess.DEVNULL,
-                                  cwd=gen_dir)
-        except Exception as e:
-            print('ERROR:', str(e))
-            return 1
+    # the targets, return code, output and timings of each generator run, in target order
+    runs = []
+    # for --verify and --incremental, whether each generated file passed and what was reported for it
+    checks = {}
+
+    if not targets:
+        pass
+    elif args.jobs > 1:
+        # spread the code generators over a pool of worker processes, checking each file as soon as it is generated
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {executor.submit(generate_in_process, registry, genvk_options, [target], gen_dir): target for target in targets}
+            for future in concurrent.futures.as_completed(futures):
+                target = futures[future]
+                if future.result()[0] == 0 and (args.verify or args.incremental or args.manifest):
+                    checks[target] = check_generated_file(args, gen_dir, repo_dir, target)
+        runs = [([target], future.result()) for future, target in futures.items()]
+    elif args.single_process:
+        # parse and load the registry once, then run every code generator from it
+        runs = [(targets, generate_in_process(registry, genvk_options, targets, gen_dir))]
+    else:
+        # run each code generator
+        for target in targets:
+            cmd = [common_codegen.repo_relative('scripts/loader_genvk.py'),
+                   '-registry', registry,
+                   '-quiet',
+                   target] + genvk_options
+            start_time = time.perf_counter()
+            try:
+                subprocess.check_call([sys.executable] + cmd,
+                                      # ignore generator output, vk_validation_stats.py is especially noisy
+                                      stdout=subprocess.DEVNULL,
+                                      cwd=gen_dir)
+            except Exception as e:
+                runs.append(([target], (1, f'ERROR: {str(e)}\n', [])))
+                break
+            runs.append(([target], (0, '', [('generate ' + target, time.perf_counter() - start_time)])))
+
+    # report every run in target order, regardless of the order they finished in
+    failed = False
+    for run_targets, (returncode, output, timings) in runs:
+        print(' '.join(['loader_genvk.py', '-registry', registry, '-quiet'] + run_targets + genvk_options))
+        print(output, end='')
+        for phase, seconds in timings:
+            print(f'  {phase}: {seconds:.2f}s')
+        failed = failed or returncode != 0
+    if failed:
+        return 1
 
     # optional post-generation steps
+    if args.verify or args.incremental or args.manifest:
+        for target in targets:
+            if target not in checks:
+                checks[target] = check_generated_file(args, gen_dir, repo_dir, target)
+            print(checks[target][1], end='')
+
+    if args.manifest and not args.verify:
+        for target in targets:
+            manifest[target] = {'inputs': input_digests[target],
+                                'output': file_digest(os.path.join(repo_dir, target))}
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(args.manifest)), delete=False) as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+        os.replace(f.name, args.manifest)
+
     if args.verify:
-        # compare contents of temp dir and repo
-        temp_files = set(os.listdir(temp_dir))
-        repo_files = set(os.listdir(repo_dir))
-        files_match = True
-        for filename in sorted((temp_files | repo_files)):
-            if filename not in repo_files:
-                print('ERROR: Missing repo file', filename)
-                files_match = False
-            elif filename not in temp_files:
-                print('ERROR: Missing generator for', filename)
-                files_match = False
-            elif not filecmp.cmp(os.path.join(temp_dir, filename),
-                               os.path.join(repo_dir, filename),
-                               shallow=False):
-                print('ERROR: Repo files do not match generator output for', filename)
-                files_match = False
+        # compare the remaining contents of temp dir and repo
+        files_match = all(checks[target][0] for target in all_targets)
+        for filename in sorted(set(os.listdir(temp_dir)) - set(all_targets)):
+            print('ERROR: Missing repo file', filename)
+            files_match = False
+        for filename in sorted(set(os.listdir(repo_dir)) - set(all_targets)):
+            print('ERROR: Missing generator for', filename)
+            files_match = False
 
         # return code for test scripts
         if files_match:
@@ -108,16 +248,6 @@ def main(argv):
             return 0
         return 1
 
-    elif args.incremental:
-        # copy missing or differing files from temp directory to repo
-        for filename in os.listdir(temp_dir):
-            temp_filename = os.path.join(temp_dir, filename)
-            repo_filename = os.path.join(repo_dir, filename)
-            if not os.path.exists(repo_filename) or \
-               not filecmp.cmp(temp_filename, repo_filename, shallow=False):
-                print('update', repo_filename)
-                shutil.copyfile(temp_filename, repo_filename)
-
     # write out the header version used to generate the code to a checked in CMake file
     if args.generated_version:
         # Update the CMake project version
@@ -89,7 +89,7 @@ class HelperFileOutputGenerator(OutputGenerator):
                  diagFile = sys.stdout):
         OutputGenerator.__init__(self, errFile, warnFile, diagFile)
         # Internal state - accumulators for different inner block text
-        self.enum_output = ''                             # string built up of enum string routines
+        self.enum_groups = []                             # List of EnumGroup records for the enum string routines
         # Internal state - accumulators for different inner block text
         self.structNames = []                             # List of Vulkan struct typenames
         self.structTypes = dict()                         # Map of Vulkan struct typename to required VkStructureType
@@ -98,11 +98,13 @@ class HelperFileOutputGenerator(OutputGenerator):
         self.object_type_aliases = []                     # Aliases to handles types (for handles that were extensions)
         self.debug_report_object_types = []               # Handy copy of debug_report_object_type enum data
         self.core_object_types = []                       # Handy copy of core_object_type enum data
+        self.object_type_values = dict()                  # Dict of debug_report and core object type enum names to values
         self.device_extension_info = dict()               # Dict of device extension name defines and ifdef values
         self.instance_extension_info = dict()             # Dict of instance extension name defines and ifdef values
 
         # Named tuples to store struct and command data
         self.StructType = namedtuple('StructType', ['name', 'value'])
+        self.EnumGroup = namedtuple('EnumGroup', ['name', 'bitwidth', 'enumerants', 'protect'])
         self.CommandParam = namedtuple('CommandParam', ['type', 'name', 'ispointer', 'isstaticarray', 'isconst', 'iscount', 'len', 'extstructs', 'cdecl'])
         self.StructMemberData = namedtuple('StructMemberData', ['name', 'members', 'ifdef_protect'])
 
@@ -161,13 +163,12 @@ class HelperFileOutputGenerator(OutputGenerator):
     #
     # Write generated file content to output file
     def endFile(self):
-        dest_file = ''
+        # Stream the generated code to the output file rather than concatenating it first
+        dest_file = CodeEmitter(self.outFile)
         dest_file += self.OutputDestFile()
-        # Remove blank lines at EOF
-        if dest_file.endswith('\n'):
-            dest_file = dest_file[:-1]
-        write(dest_file, file=self.outFile)
-        write("// clang-format on", file=self.outFile)
+        if not dest_file.endswith('\n'):
+            dest_file += '\n'
+        dest_file += '// clang-format on\n'
         # Finish processing in superclass
         OutputGenerator.endFile(self)
     #
@@ -204,22 +205,25 @@ class HelperFileOutputGenerator(OutputGenerator):
         groupElem = groupinfo.elem
         # For enum_string_header
         if self.helper_file_type == 'enum_string_header':
-            value_set = set()
+            bitwidth = int(groupElem.get('bitwidth', '32'))
+            enumerants = []
             for elem in groupElem.findall('enum'):
                 if elem.get('supported') != 'disabled' and elem.get('alias') is None:
-                    value_set.add(elem.get('name'))
-            self.enum_output += self.GenerateEnumStringConversion(groupName, value_set)
+                    enumerants.append((self.enumToValue(elem, True, bitwidth)[0], elem.get('name')))
+            self.enum_groups.append(self.EnumGroup(groupName, bitwidth, enumerants, self.featureExtraProtect))
         elif self.helper_file_type == 'object_types_header':
             if groupName == 'VkDebugReportObjectTypeEXT':
                 for elem in groupElem.findall('enum'):
                     if elem.get('supported') != 'disabled':
                         item_name = elem.get('name')
                         self.debug_report_object_types.append(item_name)
+                        self.object_type_values[item_name] = self.enumToValue(elem, True, parent_for_alias_dereference=groupElem)[0]
             elif groupName == 'VkObjectType':
                 for elem in groupElem.findall('enum'):
                     if elem.get('supported') != 'disabled':
                         item_name = elem.get('name')
                         self.core_object_types.append(item_name)
+                        self.object_type_values[item_name] = self.enumToValue(elem, True, parent_for_alias_dereference=groupElem)[0]
 
     #
     # Called for each type -- if the type is a struct/union, grab the metadata
@@ -297,20 +301,17 @@ class HelperFileOutputGenerator(OutputGenerator):
     # Check if a structure is or contains a dispatchable (dispatchable = True) or
     # non-dispatchable (dispatchable = False) handle
     def TypeContainsObjectHandle(self, handle_type, dispatchable):
-        if dispatchable:
-            type_key = 'VK_DEFINE_HANDLE'
-        else:
-            type_key = 'VK_DEFINE_NON_DISPATCHABLE_HANDLE'
-        handle = self.registry.tree.find("types/type/[name='" + handle_type + "'][@category='handle']")
-        if handle is not None and handle.find('type').text == type_key:
+        handle_types = GetHandleTypes(self.registry)
+        handle = handle_types.get(handle_type)
+        if handle is not None and handle.dispatchable == dispatchable:
             return True
         # if handle_type is a struct, search its members
         if handle_type in self.structNames:
             member_index = next((i for i, v in enumerate(self.structMembers) if v[0] == handle_type), None)
             if member_index is not None:
                 for item in self.structMembers[member_index].members:
-                    handle = self.registry.tree.find("types/type/[name='" + item.type + "'][@category='handle']")
-                    if handle is not None and handle.find('type').text == type_key:
+                    handle = handle_types.get(item.type)
+                    if handle is not None and handle.dispatchable == dispatchable:
                         return True
         return False
     #
@@ -358,24 +359,116 @@ class HelperFileOutputGenerator(OutputGenerator):
         self.structMembers.append(self.StructMemberData(name=typeName, members=membersInfo, ifdef_protect=self.featureExtraProtect))
     #
     # Enum_string_header: Create a routine to convert an enumerated value into a string
-    def GenerateEnumStringConversion(self, groupName, value_list):
+    def GenerateEnumStringConversion(self, enum_group, string_pool):
+        # Sort by value so the output is deterministic, keeping the first name of any repeated value
+        names_by_value = {}
+        for (value, name) in enum_group.enumerants:
+            names_by_value.setdefault(value, name)
+        values = sorted(names_by_value)
+        value_type = 'uint64_t' if enum_group.bitwidth == 64 else 'int64_t'
+        entry_type = 'VulkanEnumStringEntry64' if enum_group.bitwidth == 64 else 'VulkanEnumStringEntry'
+        offset_type = string_pool.offsetType()
+
+        # Values below the extension range index a dense array when they fill at least half of their range,
+        # every other value (extension values, bitmask bits) goes in a table sorted by value for a binary search
+        base_values = [value for value in values if -self.extBase < value < self.extBase]
+        dense_values = []
+        if enum_group.bitwidth != 64 and base_values and len(base_values) * 2 >= base_values[-1] - base_values[0] + 1:
+            dense_values = base_values
+        sparse_values = [value for value in values if not (dense_values and dense_values[0] <= value <= dense_values[-1])]
+
         outstring = '\n'
-        outstring += 'static inline const char* string_%s(%s input_value)\n' % (groupName, groupName)
+        outstring += 'static inline const char* string_%s(%s input_value)\n' % (enum_group.name, enum_group.name)
         outstring += '{\n'
-        outstring += '    switch ((%s)input_value)\n' % groupName
-        outstring += '    {\n'
-        for item in value_list:
-            outstring += '        case %s:\n' % item
-            outstring += '            return "%s";\n' % item
-        outstring += '        default:\n'
-        outstring += '            return "Unhandled %s";\n' % groupName
-        outstring += '    }\n'
+        if dense_values:
+            dense_min = dense_values[0]
+            dense_max = dense_values[-1]
+            outstring += '    // Offsets of the names of the values %d through %d in enum_string_pool\n' % (dense_min, dense_max)
+            outstring += '    static const %s dense_offsets[] = {\n' % offset_type
+            for value in range(dense_min, dense_max + 1):
+                if value in names_by_value:
+                    outstring += '        %d, // %s\n' % (string_pool.offset(names_by_value[value]), names_by_value[value])
+                else:
+                    outstring += '        0,\n'
+            outstring += '    };\n'
+        if sparse_values:
+            outstring += '    static const %s sparse_entries[] = {\n' % entry_type
+            for value in sparse_values:
+                outstring += '        {%s, %d}, // %s\n' % (self.EnumStringValueLiteral(value, enum_group.bitwidth), string_pool.offset(names_by_value[value]), names_by_value[value])
+            outstring += '    };\n'
+        if values:
+            outstring += '    const %s value = (%s)input_value;\n' % (value_type, value_type)
+        if dense_values:
+            outstring += '    if (value >= %d && value <= %d && dense_offsets[value - %d] != 0) {\n' % (dense_min, dense_max, dense_min)
+            outstring += '        return &enum_string_pool[dense_offsets[value - %d]];\n' % dense_min
+            outstring += '    }\n'
+        if sparse_values:
+            outstring += '    const char *name = FindVulkanEnumString%s(sparse_entries, sizeof(sparse_entries) / sizeof(sparse_entries[0]), value);\n' % ('64' if enum_group.bitwidth == 64 else '')
+            outstring += '    if (name != NULL) {\n'
+            outstring += '        return name;\n'
+            outstring += '    }\n'
+        if not values:
+            outstring += '    (void)input_value;\n'
+        outstring += '    return "Unhandled %s";\n' % enum_group.name
         outstring += '}\n'
         return outstring
     #
+    # C literal for an enum value in the enum string helper tables
+    def EnumStringValueLiteral(self, value, bitwidth):
+        if bitwidth == 64:
+            return '0x%xULL' % value
+        if value < -0x7FFFFFFF:
+            return '(%d - 1)' % (value + 1)
+        return '%d' % value
+    #
+    # Combine enum string helper header file preamble with body text and return
+    def GenerateEnumStringHelperHeader(self):
+        string_pool = StringPool(name for enum_group in self.enum_groups for (value, name) in enum_group.enumerants)
+        offset_type = string_pool.offsetType()
+        enum_string_helper_header = CodeEmitter()
+        enum_string_helper_header += '\n'
+        enum_string_helper_header += '#pragma once\n'
+        enum_string_helper_header += '\n'
+        enum_string_helper_header += '#include <stddef.h>\n'
+        enum_string_helper_header += '#include <vulkan/vulkan.h>\n'
+        enum_string_helper_header += '\n'
+        enum_string_helper_header += '// Names of all of the enum values, packed into a single string\n'
+        enum_string_helper_header += string_pool.definition('static const char enum_string_pool')
+        for (entry_type, value_type, suffix) in [('VulkanEnumStringEntry', 'int64_t', ''), ('VulkanEnumStringEntry64', 'uint64_t', '64')]:
+            enum_string_helper_header += '\n'
+            enum_string_helper_header += '// Enum value and offset of its name in enum_string_pool\n'
+            enum_string_helper_header += 'typedef struct %s {\n' % entry_type
+            enum_string_helper_header += '    %s value;\n' % value_type
+            enum_string_helper_header += '    %s offset;\n' % offset_type
+            enum_string_helper_header += '} %s;\n' % entry_type
+            enum_string_helper_header += '\n'
+            enum_string_helper_header += '// Binary search entries, which are sorted by value, for the name of value\n'
+            enum_string_helper_header += 'static inline const char *FindVulkanEnumString%s(const %s *entries, size_t count, %s value)\n' % (suffix, entry_type, value_type)
+            enum_string_helper_header += '{\n'
+            enum_string_helper_header += '    size_t low = 0;\n'
+            enum_string_helper_header += '    size_t high = count;\n'
+            enum_string_helper_header += '    while (low < high) {\n'
+            enum_string_helper_header += '        size_t mid = low + (high - low) / 2;\n'
+            enum_string_helper_header += '        if (entries[mid].value == value) {\n'
+            enum_string_helper_header += '            return &enum_string_pool[entries[mid].offset];\n'
+            enum_string_helper_header += '        } else if (entries[mid].value < value) {\n'
+            enum_string_helper_header += '            low = mid + 1;\n'
+            enum_string_helper_header += '        } else {\n'
+            enum_string_helper_header += '            high = mid;\n'
+            enum_string_helper_header += '        }\n'
+            enum_string_helper_header += '    }\n'
+            enum_string_helper_header += '    return NULL;\n'
+            enum_string_helper_header += '}\n'
+        for enum_group in self.enum_groups:
+            enum_string_helper_header.beginProtect(enum_group.protect)
+            enum_string_helper_header += self.GenerateEnumStringConversion(enum_group, string_pool)
+            enum_string_helper_header.endProtect(enum_group.protect)
+        return enum_string_helper_header
+    #
     # Combine object types helper header file preamble with body text and return
     def GenerateObjectTypesHelperHeader(self):
-        object_types_helper_header = '\n'
+        object_types_helper_header = CodeEmitter()
+        object_types_helper_header += '\n'
         object_types_helper_header += '#pragma once\n'
         object_types_helper_header += '\n'
         object_types_helper_header += '#include <vulkan/vulkan.h>\n\n'
@@ -384,7 +477,7 @@ class HelperFileOutputGenerator(OutputGenerator):
     #
     # Object types header: create object enum type header file
     def GenerateObjectTypesHeader(self):
-        object_types_header = ''
+        object_types_header = CodeEmitter()
         object_types_header += '// Object Type enum for validation layer internal object handling\n'
         object_types_header += 'typedef enum VulkanObjectType {\n'
         object_types_header += '    kVulkanObjectTypeUnknown = 0,\n'
@@ -409,13 +502,24 @@ class HelperFileOutputGenerator(OutputGenerator):
         object_types_header += '} VulkanObjectType;\n\n'
 
         # Output name string helper
-        object_types_header += '// Array of object name strings for OBJECT_TYPE enum conversion\n'
-        object_types_header += 'static const char * const object_string[kVulkanObjectTypeMax] = {\n'
-        object_types_header += '    "Unknown",\n'
+        # The names are packed into a single string with an offset table, which unlike an array of
+        # pointers needs no relocations when the header is used in a shared library
+        object_string_pool = StringPool(['Unknown'] + [item[2:] for item in self.object_types])
+        object_types_header += '// Object name strings for OBJECT_TYPE enum conversion, packed into a single string\n'
+        object_types_header += object_string_pool.definition('static const char object_string_pool')
+        object_types_header += '\n'
+        object_types_header += '// Offsets of the object name strings in object_string_pool, indexed by VulkanObjectType\n'
+        object_types_header += 'static const %s object_string_offsets[kVulkanObjectTypeMax] = {\n' % object_string_pool.offsetType()
+        object_types_header += '    %d, // Unknown\n' % object_string_pool.offset('Unknown')
         for item in self.object_types:
             fixup_name = item[2:]
-            object_types_header += '    "%s",\n' % fixup_name
+            object_types_header += '    %d, // %s\n' % (object_string_pool.offset(fixup_name), fixup_name)
         object_types_header += '};\n'
+        object_types_header += '\n'
+        object_types_header += '// Helper function to get the name string of an OBJECT_TYPE enum\n'
+        object_types_header += 'static inline const char *object_string(VulkanObjectType object_type) {\n'
+        object_types_header += '    return &object_string_pool[object_string_offsets[object_type]];\n'
+        object_types_header += '}\n'
 
         # Key creation helper for map comprehensions that convert between k<Name> and VK<Name> symbols
         def to_key(regex, raw_key): return re.search(regex, raw_key).group(1).lower().replace("_","")
@@ -449,53 +553,93 @@ class HelperFileOutputGenerator(OutputGenerator):
             object_types_header += '    %s,   // %s\n' % (vk_object_type, object_type)
         object_types_header += '};\n'
 
-        # Create a function to convert from VkDebugReportObjectTypeEXT to VkObjectType
-        object_types_header += '\n'
-        object_types_header += '// Helper function to convert from VkDebugReportObjectTypeEXT to VkObjectType\n'
-        object_types_header += 'static inline VkObjectType convertDebugReportObjectToCoreObject(VkDebugReportObjectTypeEXT debug_report_obj){\n'
-        object_types_header += '    if (debug_report_obj == VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT) {\n'
-        object_types_header += '        return VK_OBJECT_TYPE_UNKNOWN;\n'
+        # Pair each core object type with the first debug report object type of the same name. Enum values
+        # below the extension range are small and dense, so they index directly into an array. Extension
+        # values are too sparse for that and are kept in a small table sorted by value for a binary search.
+        dr_re = '^VK_DEBUG_REPORT_OBJECT_TYPE_(.*)_EXT$'
+        dr_map = {}
+        for dr_object_type in self.debug_report_object_types:
+            dr_map.setdefault(to_key(dr_re, dr_object_type), dr_object_type)
+        conversions = []
         for core_object_type in self.core_object_types:
-            core_target_type = core_object_type.replace("VK_OBJECT_TYPE_", "").lower()
-            core_target_type = core_target_type.replace("_", "")
-            for dr_object_type in self.debug_report_object_types:
-                dr_target_type = dr_object_type.replace("VK_DEBUG_REPORT_OBJECT_TYPE_", "").lower()
-                dr_target_type = dr_target_type[:-4]
-                dr_target_type = dr_target_type.replace("_", "")
-                if core_target_type == dr_target_type:
-                    object_types_header += '    } else if (debug_report_obj == %s) {\n' % dr_object_type
-                    object_types_header += '        return %s;\n' % core_object_type
-                    break
-        object_types_header += '    }\n'
-        object_types_header += '    return VK_OBJECT_TYPE_UNKNOWN;\n'
-        object_types_header += '}\n'
+            dr_object_type = dr_map.get(to_key(vko_re, core_object_type))
+            if dr_object_type is not None:
+                conversions.append((dr_object_type, core_object_type))
 
-        # Create a function to convert from VkObjectType to VkDebugReportObjectTypeEXT
         object_types_header += '\n'
-        object_types_header += '// Helper function to convert from VkDebugReportObjectTypeEXT to VkObjectType\n'
-        object_types_header += 'static inline VkDebugReportObjectTypeEXT convertCoreObjectToDebugReportObject(VkObjectType core_report_obj){\n'
-        object_types_header += '    if (core_report_obj == VK_OBJECT_TYPE_UNKNOWN) {\n'
-        object_types_header += '        return VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT;\n'
-        for core_object_type in self.core_object_types:
-            core_target_type = core_object_type.replace("VK_OBJECT_TYPE_", "").lower()
-            core_target_type = core_target_type.replace("_", "")
-            for dr_object_type in self.debug_report_object_types:
-                dr_target_type = dr_object_type.replace("VK_DEBUG_REPORT_OBJECT_TYPE_", "").lower()
-                dr_target_type = dr_target_type[:-4]
-                dr_target_type = dr_target_type.replace("_", "")
-                if core_target_type == dr_target_type:
-                    object_types_header += '    } else if (core_report_obj == %s) {\n' % core_object_type
-                    object_types_header += '        return %s;\n' % dr_object_type
-                    break
-        object_types_header += '    }\n'
-        object_types_header += '    return VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT;\n'
-        object_types_header += '}\n'
+        object_types_header += '// Debug report and core object type pair for the extension range of the conversion helpers\n'
+        object_types_header += 'typedef struct VulkanObjectTypeConversion {\n'
+        object_types_header += '    VkDebugReportObjectTypeEXT debug_report_object_type;\n'
+        object_types_header += '    VkObjectType core_object_type;\n'
+        object_types_header += '} VulkanObjectTypeConversion;\n'
+
+        object_types_header += self.GenerateObjectTypeConversion(conversions, 'VkDebugReportObjectTypeEXT', 'debug_report_object_type',
+                                                                 'VkObjectType', 'core_object_type', 'VK_OBJECT_TYPE_UNKNOWN',
+                                                                 'convertDebugReportObjectToCoreObject', 'debug_report_obj')
+        object_types_header += self.GenerateObjectTypeConversion([(core, dr) for (dr, core) in conversions], 'VkObjectType', 'core_object_type',
+                                                                 'VkDebugReportObjectTypeEXT', 'debug_report_object_type', 'VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT',
+                                                                 'convertCoreObjectToDebugReportObject', 'core_report_obj')
         return object_types_header
 
+    #
+    # Object types header: create a function converting between debug report and core object types, using an array
+    # indexed by the enum value for values below the extension range, and a sorted table for the extension values
+    def GenerateObjectTypeConversion(self, conversions, from_type, from_field, to_type, to_field, to_default, func_name, param_name):
+        # The first pair for each source value wins, as with aliases several names share the same value
+        to_by_value = {}
+        for (from_enum, to_enum) in conversions:
+            to_by_value.setdefault(self.object_type_values[from_enum], (from_enum, to_enum))
+        dense_values = [value for value in to_by_value if 0 <= value < self.extBase]
+        extension_values = sorted(value for value in to_by_value if value not in dense_values)
+        dense_table = '%s_from_%s' % (to_field, from_field)
+        extension_table = '%s_extension' % dense_table
+
+        conversion = CodeEmitter()
+        conversion += '\n'
+        conversion += '// Helper array to get the %s from a %s below the extension range, indexed by value\n' % (to_type, from_type)
+        conversion += 'static const %s %s[] = {\n' % (to_type, dense_table)
+        for value in range(max(dense_values) + 1):
+            if value in to_by_value:
+                conversion += '    %s,   // %s\n' % (to_by_value[value][1], to_by_value[value][0])
+            else:
+                conversion += '    %s,\n' % to_default
+        conversion += '};\n'
+        conversion += '\n'
+        conversion += '// Helper array to get the %s from a %s in the extension range, sorted by value\n' % (to_type, from_type)
+        conversion += 'static const VulkanObjectTypeConversion %s[] = {\n' % extension_table
+        for value in extension_values:
+            (from_enum, to_enum) = to_by_value[value]
+            pair = {from_field: from_enum, to_field: to_enum}
+            conversion += '    {%s, %s},\n' % (pair['debug_report_object_type'], pair['core_object_type'])
+        conversion += '};\n'
+        conversion += '\n'
+        conversion += '// Helper function to convert from %s to %s\n' % (from_type, to_type)
+        conversion += 'static inline %s %s(%s %s){\n' % (to_type, func_name, from_type, param_name)
+        conversion += '    if ((uint32_t)%s < sizeof(%s) / sizeof(%s[0])) {\n' % (param_name, dense_table, dense_table)
+        conversion += '        return %s[%s];\n' % (dense_table, param_name)
+        conversion += '    }\n'
+        conversion += '    uint32_t low = 0;\n'
+        conversion += '    uint32_t high = sizeof(%s) / sizeof(%s[0]);\n' % (extension_table, extension_table)
+        conversion += '    while (low < high) {\n'
+        conversion += '        uint32_t mid = low + (high - low) / 2;\n'
+        conversion += '        if (%s[mid].%s == %s) {\n' % (extension_table, from_field, param_name)
+        conversion += '            return %s[mid].%s;\n' % (extension_table, to_field)
+        conversion += '        } else if (%s[mid].%s < %s) {\n' % (extension_table, from_field, param_name)
+        conversion += '            low = mid + 1;\n'
+        conversion += '        } else {\n'
+        conversion += '            high = mid;\n'
+        conversion += '        }\n'
+        conversion += '    }\n'
+        conversion += '    return %s;\n' % to_default
+        conversion += '}\n'
+        return conversion
+
     #
     # Create a helper file and return it as a string
     def OutputDestFile(self):
         if self.helper_file_type == 'object_types_header':
             return self.GenerateObjectTypesHelperHeader()
+        elif self.helper_file_type == 'enum_string_header':
+            return self.GenerateEnumStringHelperHeader()
         else:
             return 'Bad Helper File Generator Option %s' % self.helper_file_type
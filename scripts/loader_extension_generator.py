@@ -22,6 +22,7 @@
 # Author: Mark Young <marky@lunarg.com>
 # Author: Mark Lobodzinski <mark@lunarg.com>
 
+import json
 import re
 import sys
 from collections import namedtuple
@@ -101,10 +102,61 @@ SHARED_ALIASES = {
     'vkGetPhysicalDeviceExternalFencePropertiesKHR':        'vkGetPhysicalDeviceExternalFenceProperties',
 }
 
+# Device commands placed first in the loader internal hot dispatch table when no call frequency profile is given,
+# from the most to the least frequently called in a typical frame
+HOT_DEVICE_CMDS = ['vkCmdDrawIndexed',
+                   'vkCmdDraw',
+                   'vkCmdBindDescriptorSets',
+                   'vkCmdBindPipeline',
+                   'vkCmdPushConstants',
+                   'vkCmdBindVertexBuffers',
+                   'vkCmdBindIndexBuffer',
+                   'vkCmdSetViewport',
+                   'vkCmdSetScissor',
+                   'vkCmdDrawIndexedIndirect',
+                   'vkCmdDrawIndirect',
+                   'vkCmdDispatch',
+                   'vkCmdPipelineBarrier',
+                   'vkCmdPipelineBarrier2',
+                   'vkCmdCopyBuffer',
+                   'vkCmdCopyBufferToImage',
+                   'vkCmdBeginRenderPass',
+                   'vkCmdEndRenderPass',
+                   'vkCmdBeginRendering',
+                   'vkCmdEndRendering',
+                   'vkBeginCommandBuffer',
+                   'vkEndCommandBuffer',
+                   'vkResetCommandPool',
+                   'vkQueueSubmit',
+                   'vkQueueSubmit2',
+                   'vkAcquireNextImageKHR',
+                   'vkQueuePresentKHR',
+                   'vkWaitForFences',
+                   'vkResetFences']
+
 PRE_INSTANCE_FUNCTIONS = ['vkEnumerateInstanceExtensionProperties',
                           'vkEnumerateInstanceLayerProperties',
                           'vkEnumerateInstanceVersion']
 
+# The sections written to each generated loader source file. The sections are split into translation units
+# which can be compiled in parallel, and share the declarations in vk_loader_extensions_internal.h.
+LOADER_EXTENSION_SOURCES = {
+    'vk_loader_extensions_internal.h': ['OutputHashFunctions',
+                                        'OutputTrampTermPrototypes'],
+    'vk_loader_extensions_dispatch.c': ['OutputDevExtError',
+                                        'OutputNamePool',
+                                        'OutputIcdDispatchTableInit',
+                                        'OutputLoaderDispatchTables',
+                                        'InitDeviceFunctionTerminatorDispatchTable',
+                                        'OutputHotDispatchTableInit'],
+    'vk_loader_extensions_lookup.c': ['OutputLoaderLookupFunc'],
+    'vk_loader_extensions_trampolines.c': ['CreateTrampTermFuncs'],
+    'vk_loader_extensions_gpa.c': ['InstExtensionGPA',
+                                   'InstantExtensionCreate',
+                                   'DeviceExtensionGetTerminator',
+                                   'InitInstLoaderExtensionDispatchTable',
+                                   'OutputInstantExtensionWhitelistArray']}
+
 #
 # API Version
 class APIVersion:
@@ -142,7 +194,10 @@ class LoaderExtensionGeneratorOptions(GeneratorOptions):
                  indentFuncProto = True,
                  indentFuncPointer = False,
                  alignFuncParam = 0,
-                 expandEnumerants = True):
+                 expandEnumerants = True,
+                 lazyIcdEntries = False,
+                 dispatchProfile = None,
+                 trampolineStats = False):
         GeneratorOptions.__init__(self,
                 conventions = conventions,
                 filename = filename,
@@ -164,6 +219,9 @@ class LoaderExtensionGeneratorOptions(GeneratorOptions):
         self.apientryp       = apientryp
         self.alignFuncParam  = alignFuncParam
         self.expandEnumerants = expandEnumerants
+        self.lazyIcdEntries  = lazyIcdEntries
+        self.dispatchProfile = dispatchProfile
+        self.trampolineStats = trampolineStats
 
 #
 # LoaderExtensionOutputGenerator - subclass of OutputGenerator.
@@ -233,13 +291,19 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
             preamble += '#pragma once\n'
             preamble += '\n'
             preamble += '#include <stdbool.h>\n'
+            if self.genOpts.trampolineStats:
+                preamble += '#include <stdio.h>\n'
             preamble += '#include <vulkan/vulkan.h>\n'
             preamble += '#include <vulkan/vk_layer.h>\n'
             preamble += '#include "vk_layer_dispatch_table.h"\n'
             preamble += '\n'
 
 
-        elif self.genOpts.filename == 'vk_loader_extensions.c':
+        elif self.genOpts.filename == 'vk_loader_extensions_internal.h':
+            preamble += '#pragma once\n'
+            preamble += '\n'
+            if self.genOpts.trampolineStats:
+                preamble += '#include <inttypes.h>\n'
             preamble += '#include <stdio.h>\n'
             preamble += '#include <stdlib.h>\n'
             preamble += '#include <string.h>\n'
@@ -250,6 +314,9 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
             preamble += '#include "debug_utils.h"\n'
             preamble += '#include "extension_manual.h"\n'
 
+        elif self.genOpts.filename in LOADER_EXTENSION_SOURCES:
+            preamble += '#include "vk_loader_extensions_internal.h"\n'
+
         elif self.genOpts.filename == 'vk_layer_dispatch_table.h':
             preamble += '#pragma once\n'
             preamble += '\n'
@@ -265,7 +332,11 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
     #
     # Write generate and write dispatch tables to output file
     def endFile(self):
-        file_data = ''
+        # Stream each section to the output file rather than concatenating the whole file first
+        file_data = CodeEmitter(self.outFile)
+
+        # The names used by the generated loader source tables, which the sections refer to by offset
+        self.name_pool = self.BuildNamePool()
 
         if self.genOpts.filename == 'vk_loader_extensions.h':
             file_data += self.OutputPrototypesInHeader()
@@ -273,32 +344,32 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
             file_data += self.OutputIcdDispatchTable()
             file_data += self.OutputIcdExtensionEnableUnion()
             file_data += self.OutputDeviceFunctionTerminatorDispatchTable()
+            file_data += self.OutputHotDispatchTable()
+            file_data += self.OutputTrampolineStatsDeclarations()
 
-        elif self.genOpts.filename == 'vk_loader_extensions.c':
-            file_data += self.OutputUtilitiesInSource()
-            file_data += self.OutputIcdDispatchTableInit()
-            file_data += self.OutputLoaderDispatchTables()
-            file_data += self.InitDeviceFunctionTerminatorDispatchTable()
-            file_data += self.OutputDeviceFunctionTrampolinePrototypes()
-            file_data += self.OutputLoaderLookupFunc()
-            file_data += self.CreateTrampTermFuncs()
-            file_data += self.InstExtensionGPA()
-            file_data += self.InstantExtensionCreate()
-            file_data += self.DeviceExtensionGetTerminator()
-            file_data += self.InitInstLoaderExtensionDispatchTable()
-            file_data += self.OutputInstantExtensionWhitelistArray()
+        elif self.genOpts.filename in LOADER_EXTENSION_SOURCES:
+            for section in LOADER_EXTENSION_SOURCES[self.genOpts.filename]:
+                file_data += getattr(self, section)()
 
         elif self.genOpts.filename == 'vk_layer_dispatch_table.h':
             file_data += self.OutputLayerInstanceDispatchTable()
             file_data += self.OutputLayerDeviceDispatchTable()
 
-        file_data += '// clang-format on'
-
-        write(file_data, file=self.outFile)
+        file_data += '// clang-format on\n'
 
         # Finish processing in superclass
         OutputGenerator.endFile(self)
 
+    #
+    # Pack the command and instance extension names used by the generated tables into one string pool
+    def BuildNamePool(self):
+        name_pool = StringPool()
+        for cur_cmd in self.core_commands + self.ext_commands:
+            name_pool.add(cur_cmd.name)
+        for ext in self.instanceExtensions:
+            name_pool.add(ext.name)
+        return name_pool
+
     def beginFeature(self, interface, emit):
         # Start processing in superclass
         OutputGenerator.beginFeature(self, interface, emit)
@@ -384,7 +455,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
     #
     # Determine if this API should be ignored or added to the instance or device dispatch table
     def AddCommandToDispatchList(self, extension_name, extension_type, name, cmdinfo, handle_type):
-        handle = self.registry.tree.find("types/type/[name='" + handle_type + "'][@category='handle']")
+        handle = GetHandleTypes(self.registry).get(handle_type)
 
         return_type =  cmdinfo.elem.find('proto/type')
         if (return_type is not None and return_type.text == 'void'):
@@ -517,18 +588,27 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         protos += '// a terminator.\n'
         protos += 'PFN_vkVoidFunction get_extension_device_proc_terminator(struct loader_device *dev, const char *name, bool* found_name);\n'
         protos += '\n'
+        protos += '// Fill in the terminators of the device commands requiring one, for the device extensions\n'
+        protos += '// enabled on dev.\n'
+        protos += 'void init_extension_device_proc_terminator_dispatch(struct loader_device *dev);\n'
+        protos += '\n'
         protos += '// Dispatch table properly filled in with appropriate terminators for the\n'
         protos += '// supported extensions.\n'
         protos += 'extern const VkLayerInstanceDispatchTable instance_disp;\n'
         protos += '\n'
-        protos += '// Array of extension strings for instance extensions we support.\n'
-        protos += 'extern const char *const LOADER_INSTANCE_EXTENSIONS[];\n'
+        protos += '// Names used by the generated tables, packed one after another so the tables store offsets instead of pointers\n'
+        protos += 'extern const char loader_name_pool[];\n'
+        protos += '\n'
+        protos += '// Offsets in loader_name_pool of the names of the instance extensions we support.\n'
+        protos += f'extern const {self.name_pool.offsetType()} LOADER_INSTANCE_EXTENSIONS[];\n'
+        protos += 'extern const uint32_t LOADER_INSTANCE_EXTENSION_COUNT;\n'
         protos += '\n'
         protos += 'VKAPI_ATTR bool VKAPI_CALL loader_icd_init_entries(struct loader_instance* inst, struct loader_icd_term *icd_term);\n'
         protos += '\n'
-        protos += '// Init Device function pointer dispatch table with core commands\n'
-        protos += 'VKAPI_ATTR void VKAPI_CALL loader_init_device_dispatch_table(struct loader_dev_dispatch_table *dev_table, PFN_vkGetDeviceProcAddr gpa,\n'
-        protos += '                                                             VkDevice dev);\n'
+        protos += '// Init Device function pointer dispatch table with core commands, skipping the commands newer than api_version.\n'
+        protos += '// Returns the number of commands which were skipped.\n'
+        protos += 'VKAPI_ATTR uint32_t VKAPI_CALL loader_init_device_dispatch_table(struct loader_dev_dispatch_table *dev_table, PFN_vkGetDeviceProcAddr gpa,\n'
+        protos += '                                                                 VkDevice dev, uint32_t api_version);\n'
         protos += '\n'
         protos += '// Init Device function pointer dispatch table with extension commands\n'
         protos += 'VKAPI_ATTR void VKAPI_CALL loader_init_device_extension_dispatch_table(struct loader_dev_dispatch_table *dev_table,\n'
@@ -537,6 +617,9 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         protos += '                                                                       VkInstance inst,\n'
         protos += '                                                                       VkDevice dev);\n'
         protos += '\n'
+        protos += '// Copy the device dispatch table into the hot dispatch table used by the trampolines\n'
+        protos += 'void loader_init_hot_dispatch_table(struct loader_dev_dispatch_table *dispatch);\n'
+        protos += '\n'
         protos += '// Init Instance function pointer dispatch table with core commands\n'
         protos += 'VKAPI_ATTR void VKAPI_CALL loader_init_instance_core_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,\n'
         protos += '                                                                    VkInstance inst);\n'
@@ -554,7 +637,9 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         protos += '\n'
         return protos
 
-    def OutputUtilitiesInSource(self):
+    #
+    # Create the function called through dispatch table entries of unsupported device extension commands
+    def OutputDevExtError(self):
         protos = ''
         protos += '// Device extension error function\n'
         protos += 'VKAPI_ATTR VkResult VKAPI_CALL vkDevExtError(VkDevice dev) {\n'
@@ -570,6 +655,34 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         protos += '}\n\n'
         return protos
 
+    #
+    # Create the name hash functions used by the generated perfect hash lookups
+    def OutputHashFunctions(self):
+        protos = ''
+        protos += '// Hash used by the generated perfect hash lookup tables, must match LoaderNameHash in common_codegen.py\n'
+        protos += 'static inline uint32_t loader_hash_name(const char *name, uint32_t seed) {\n'
+        protos += '    uint32_t hash = 2166136261u ^ seed;\n'
+        protos += '    while (*name) {\n'
+        protos += '        hash ^= (uint8_t)*name++;\n'
+        protos += '        hash *= 16777619u;\n'
+        protos += '    }\n'
+        protos += '    return hash;\n'
+        protos += '}\n\n'
+        protos += '// Slot of a name hash in a perfect hash table, must match PerfectHashSlot in common_codegen.py\n'
+        protos += 'static inline uint32_t loader_perfect_hash_slot(uint32_t hash, const uint16_t *displacements, uint32_t bucket_mask,\n'
+        protos += '                                                uint32_t slot_bits) {\n'
+        protos += '    return ((hash ^ displacements[hash & bucket_mask]) * 2654435761u) >> (32 - slot_bits);\n'
+        protos += '}\n\n'
+        return protos
+
+    #
+    # Create the string pool holding the names the generated tables refer to by offset
+    def OutputNamePool(self):
+        protos = ''
+        protos += self.name_pool.definition('const char loader_name_pool')
+        protos += '\n'
+        return protos
+
     #
     # Create a layer instance dispatch table from the appropriate list and return it as a string
     def OutputLayerInstanceDispatchTable(self):
@@ -708,6 +821,31 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                         table += f'#endif // {cur_cmd.protect}\n'
 
         table += '};\n\n'
+
+        # All uses of the ICD dispatch table go through ICD_TERM_DISPATCH so that the entries can be
+        # looked up from the ICD when they are first called rather than all during vkCreateInstance
+        if self.genOpts.lazyIcdEntries:
+            table += '// Placeholder stored in the entries of loader_icd_term_dispatch which have not been looked up from the ICD yet\n'
+            table += 'VKAPI_ATTR void VKAPI_CALL loader_icd_term_unresolved_entry(void);\n'
+            table += 'PFN_vkVoidFunction loader_icd_term_resolve_entry(struct loader_icd_term *icd_term, PFN_vkVoidFunction *entry, const char *name);\n'
+            table += '\n'
+            table += '// Return an entry of the ICD dispatch table, looking it up from the ICD the first time it is used. The entry is\n'
+            table += '// loaded atomically, as another thread may be storing it at the same time.\n'
+            table += 'static inline PFN_vkVoidFunction loader_icd_term_get_entry(struct loader_icd_term *icd_term, PFN_vkVoidFunction *entry,\n'
+            table += '                                                           const char *name) {\n'
+            table += '    PFN_vkVoidFunction func = (PFN_vkVoidFunction)loader_platform_atomic_load_pointer((void **)entry);\n'
+            table += '    if (func == (PFN_vkVoidFunction)loader_icd_term_unresolved_entry) {\n'
+            table += '        func = loader_icd_term_resolve_entry(icd_term, entry, name);\n'
+            table += '    }\n'
+            table += '    return func;\n'
+            table += '}\n'
+            table += '\n'
+            table += '#define ICD_TERM_DISPATCH(icd_term, func) \\\n'
+            table += '    ((PFN_vk##func)loader_icd_term_get_entry((icd_term), (PFN_vkVoidFunction *)&(icd_term)->dispatch.func, "vk" #func))\n'
+        else:
+            table += '// Access an entry of the ICD dispatch table, all of which are looked up in loader_icd_init_entries\n'
+            table += '#define ICD_TERM_DISPATCH(icd_term, func) ((icd_term)->dispatch.func)\n'
+        table += '\n'
         return table
 
     #
@@ -720,11 +858,19 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         table += 'VKAPI_ATTR bool VKAPI_CALL loader_icd_init_entries(struct loader_instance* inst, struct loader_icd_term *icd_term) {\n'
         table += '    const PFN_vkGetInstanceProcAddr fp_gipa = icd_term->scanned_icd->GetInstanceProcAddr;\n'
         table += '\n'
-        table += '#define LOOKUP_GIPA(func) icd_term->dispatch.func = (PFN_vk##func)fp_gipa(icd_term->instance, "vk" #func);\n'
+        if self.genOpts.lazyIcdEntries:
+            # Entries are looked up by loader_icd_term_resolve_entry when ICD_TERM_DISPATCH first uses them,
+            # except for the required ones which must be checked for here
+            table += '#define LOOKUP_GIPA(func) icd_term->dispatch.func = (PFN_vk##func)loader_icd_term_unresolved_entry;\n'
+            table += '#define LOOKUP_GIPA_NOW(func) icd_term->dispatch.func = (PFN_vk##func)fp_gipa(icd_term->instance, "vk" #func);\n'
+            required_lookup = 'LOOKUP_GIPA_NOW(func);'
+        else:
+            table += '#define LOOKUP_GIPA(func) icd_term->dispatch.func = (PFN_vk##func)fp_gipa(icd_term->instance, "vk" #func);\n'
+            required_lookup = 'LOOKUP_GIPA(func);'
         table += '\n'
         table += '#define LOOKUP_REQUIRED_GIPA(func)                                                      \\\n'
         table += '    do {                                                                                \\\n'
-        table += '        LOOKUP_GIPA(func);                                                              \\\n'
+        table += f'        {required_lookup:<80}\\\n'
         table += '        if (!icd_term->dispatch.func) {                                                 \\\n'
         table += '            loader_log(inst, VULKAN_LOADER_WARN_BIT, 0, "Unable to load %s from ICD %s",\\\n'
         table += '                       "vk"#func, icd_term->scanned_icd->lib_name);                     \\\n'
@@ -772,6 +918,10 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                         # The Core Vulkan code will be wrapped in a feature called VK_VERSION_#_#
                         # For example: VK_VERSION_1_0 wraps the core 1.0 Vulkan functionality
                         table += f'    LOOKUP_REQUIRED_GIPA({base_name});\n'
+                    elif self.genOpts.lazyIcdEntries and cur_cmd.ext_name in WSI_EXT_NAMES:
+                        # Drivers of interface version 3 and up learn that the loader uses their WSI
+                        # commands from it querying them, so they are looked up during vkCreateInstance
+                        table += f'    LOOKUP_GIPA_NOW({base_name});\n'
                     else:
                         table += f'    LOOKUP_GIPA({base_name});\n'
                     if cur_cmd.protect is not None:
@@ -779,10 +929,23 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
 
         table += '\n'
         table += '#undef LOOKUP_REQUIRED_GIPA\n'
+        if self.genOpts.lazyIcdEntries:
+            table += '#undef LOOKUP_GIPA_NOW\n'
         table += '#undef LOOKUP_GIPA\n'
         table += '\n'
         table += '    return true;\n'
         table += '};\n\n'
+
+        if self.genOpts.lazyIcdEntries:
+            table += 'VKAPI_ATTR void VKAPI_CALL loader_icd_term_unresolved_entry(void) {}\n'
+            table += '\n'
+            table += '// Look up an entry of the ICD dispatch table from the ICD and store it in the table. Threads which race to\n'
+            table += '// resolve the same entry all store the same pointer, and the store is atomic, so no lock is needed.\n'
+            table += 'PFN_vkVoidFunction loader_icd_term_resolve_entry(struct loader_icd_term *icd_term, PFN_vkVoidFunction *entry, const char *name) {\n'
+            table += '    PFN_vkVoidFunction func = icd_term->scanned_icd->GetInstanceProcAddr(icd_term->instance, name);\n'
+            table += '    loader_platform_atomic_store_pointer((void **)entry, (void *)func);\n'
+            table += '    return func;\n'
+            table += '}\n\n'
         return table
 
     #
@@ -840,67 +1003,94 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
     # Creates code to initialize the various dispatch tables
     def OutputLoaderDispatchTables(self):
         commands = []
-        tables = ''
+        tables = CodeEmitter()
         gpa_param = ''
         cur_type = ''
-        cur_extension_name = ''
+
+        tables += '// Entry of the generated tables of commands looked up to initialize a dispatch table\n'
+        tables += 'struct loader_dispatch_table_init_entry {\n'
+        tables += '    uint32_t table_offset;                 // Offset of the command in the dispatch table\n'
+        tables += f'    {self.name_pool.offsetType() + " name_offset;":<39}// Offset of the command name in loader_name_pool\n'
+        tables += '    uint32_t api_version;                  // Core version which added the command, 0 for extension commands\n'
+        tables += '};\n\n'
+        tables += '// Look up each command of entries with gpa and store it at its offset in table. The core commands newer than\n'
+        tables += '// api_version are set to NULL instead, and the number of them is returned.\n'
+        tables += 'static uint32_t loader_init_device_dispatch_entries(void *table, const struct loader_dispatch_table_init_entry *entries,\n'
+        tables += '                                                    size_t entry_count, uint32_t api_version, PFN_vkGetDeviceProcAddr gpa, VkDevice dev) {\n'
+        tables += '    uint32_t skipped_count = 0;\n'
+        tables += '    for (size_t i = 0; i < entry_count; i++) {\n'
+        tables += '        PFN_vkVoidFunction func = NULL;\n'
+        tables += '        if (entries[i].api_version > api_version) {\n'
+        tables += '            skipped_count++;\n'
+        tables += '        } else {\n'
+        tables += '            func = gpa(dev, &loader_name_pool[entries[i].name_offset]);\n'
+        tables += '        }\n'
+        tables += '        *(PFN_vkVoidFunction *)((char *)table + entries[i].table_offset) = func;\n'
+        tables += '    }\n'
+        tables += '    return skipped_count;\n'
+        tables += '}\n\n'
+        # Instance and physical device commands are never skipped: physical device commands follow the version of each
+        # physical device rather than the application's, and the KHR alias trampolines call through the core entries
+        tables += '// Look up each command of entries with gpa and store it at its offset in table\n'
+        tables += 'static void loader_init_instance_dispatch_entries(void *table, const struct loader_dispatch_table_init_entry *entries,\n'
+        tables += '                                                  size_t entry_count, PFN_vkGetInstanceProcAddr gpa, VkInstance inst) {\n'
+        tables += '    for (size_t i = 0; i < entry_count; i++) {\n'
+        tables += '        *(PFN_vkVoidFunction *)((char *)table + entries[i].table_offset) = gpa(inst, &loader_name_pool[entries[i].name_offset]);\n'
+        tables += '    }\n'
+        tables += '}\n\n'
 
         for x in range(0, 4):
             if x == 0:
                 cur_type = 'device'
-                gpa_param = 'dev'
                 commands = self.core_commands
-
-                tables += '// Init Device function pointer dispatch table with core commands\n'
-                tables += 'VKAPI_ATTR void VKAPI_CALL loader_init_device_dispatch_table(struct loader_dev_dispatch_table *dev_table, PFN_vkGetDeviceProcAddr gpa,\n'
-                tables += '                                                             VkDevice dev) {\n'
-                tables += '    VkLayerDispatchTable *table = &dev_table->core_dispatch;\n'
-                tables += '    if (table->magic != DEVICE_DISP_TABLE_MAGIC_NUMBER) { abort(); }\n'
-                tables += '    for (uint32_t i = 0; i < MAX_NUM_UNKNOWN_EXTS; i++) dev_table->ext_dispatch[i] = (PFN_vkDevExt)vkDevExtError;\n'
+                header = ('// Init Device function pointer dispatch table with core commands\n'
+                          'VKAPI_ATTR uint32_t VKAPI_CALL loader_init_device_dispatch_table(struct loader_dev_dispatch_table *dev_table, PFN_vkGetDeviceProcAddr gpa,\n'
+                          '                                                                 VkDevice dev, uint32_t api_version) {\n'
+                          '    VkLayerDispatchTable *table = &dev_table->core_dispatch;\n'
+                          '    if (table->magic != DEVICE_DISP_TABLE_MAGIC_NUMBER) { abort(); }\n'
+                          '    for (uint32_t i = 0; i < MAX_NUM_UNKNOWN_EXTS; i++) dev_table->ext_dispatch[i] = (PFN_vkDevExt)vkDevExtError;\n')
+                # Each table of commands with the function and handle its commands are looked up with
+                lookups = {'device_core_dispatch_init_table': ('device', 'gpa', 'dev')}
 
             elif x == 1:
                 cur_type = 'device'
-                gpa_param = 'dev'
                 commands = self.ext_commands
-
-                tables += '// Init Device function pointer dispatch table with extension commands\n'
-                tables += 'VKAPI_ATTR void VKAPI_CALL loader_init_device_extension_dispatch_table(struct loader_dev_dispatch_table *dev_table,\n'
-                tables += '                                                                       PFN_vkGetInstanceProcAddr gipa,\n'
-                tables += '                                                                       PFN_vkGetDeviceProcAddr gdpa,\n'
-                tables += '                                                                       VkInstance inst,\n'
-                tables += '                                                                       VkDevice dev) {\n'
-                tables += '    VkLayerDispatchTable *table = &dev_table->core_dispatch;\n'
-                tables += '    table->magic = DEVICE_DISP_TABLE_MAGIC_NUMBER;\n'
+                header = ('// Init Device function pointer dispatch table with extension commands\n'
+                          'VKAPI_ATTR void VKAPI_CALL loader_init_device_extension_dispatch_table(struct loader_dev_dispatch_table *dev_table,\n'
+                          '                                                                       PFN_vkGetInstanceProcAddr gipa,\n'
+                          '                                                                       PFN_vkGetDeviceProcAddr gdpa,\n'
+                          '                                                                       VkInstance inst,\n'
+                          '                                                                       VkDevice dev) {\n'
+                          '    VkLayerDispatchTable *table = &dev_table->core_dispatch;\n'
+                          '    table->magic = DEVICE_DISP_TABLE_MAGIC_NUMBER;\n')
+                lookups = {'device_extension_gipa_dispatch_init_table': ('instance', 'gipa', 'inst'),
+                           'device_extension_gdpa_dispatch_init_table': ('device', 'gdpa', 'dev')}
 
             elif x == 2:
                 cur_type = 'instance'
-                gpa_param = 'inst'
                 commands = self.core_commands
-
-                tables += '// Init Instance function pointer dispatch table with core commands\n'
-                tables += 'VKAPI_ATTR void VKAPI_CALL loader_init_instance_core_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,\n'
-                tables += '                                                                    VkInstance inst) {\n'
+                header = ('// Init Instance function pointer dispatch table with core commands\n'
+                          'VKAPI_ATTR void VKAPI_CALL loader_init_instance_core_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,\n'
+                          '                                                                    VkInstance inst) {\n')
+                lookups = {'instance_core_dispatch_init_table': ('instance', 'gpa', 'inst')}
 
             else:
                 cur_type = 'instance'
-                gpa_param = 'inst'
                 commands = self.ext_commands
+                header = ('// Init Instance function pointer dispatch table with core commands\n'
+                          'VKAPI_ATTR void VKAPI_CALL loader_init_instance_extension_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,\n'
+                          '                                                                        VkInstance inst) {\n')
+                lookups = {'instance_extension_dispatch_init_table': ('instance', 'gpa', 'inst')}
 
-                tables += '// Init Instance function pointer dispatch table with core commands\n'
-                tables += 'VKAPI_ATTR void VKAPI_CALL loader_init_instance_extension_dispatch_table(VkLayerInstanceDispatchTable *table, PFN_vkGetInstanceProcAddr gpa,\n'
-                tables += '                                                                        VkInstance inst) {\n'
+            table_type = 'VkLayerDispatchTable' if cur_type == 'device' else 'VkLayerInstanceDispatchTable'
+            init_tables = {table_name: CodeEmitter() for table_name in lookups}
+            cur_extension_names = {table_name: '' for table_name in lookups}
+            assignments = CodeEmitter()
 
             for cur_cmd in commands:
                 version = self.getAPIVersion(cur_cmd.ext_name)
                 is_inst_handle_type = cur_cmd.handle_type == 'VkInstance' or cur_cmd.handle_type == 'VkPhysicalDevice'
                 if ((cur_type == 'instance' and is_inst_handle_type) or (cur_type == 'device' and not is_inst_handle_type)):
-                    if cur_cmd.ext_name != cur_extension_name:
-                        if version:
-                            tables += f'\n    // ---- Core {version.name} commands\n'
-                        else:
-                            tables += f'\n    // ---- {cur_cmd.ext_name} extension commands\n'
-                        cur_extension_name = cur_cmd.ext_name
-
                     # Remove 'vk' from proto name
                     base_name = cur_cmd.name[2:]
 
@@ -911,31 +1101,86 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                         base_name == 'EnumerateInstanceVersion'):
                         continue
 
-                    if cur_cmd.protect is not None:
-                        tables += f'#if defined({cur_cmd.protect})\n'
-
                     # If we're looking for the proc we are passing in, just point the table to it.  This fixes the issue where
                     # a layer overrides the function name for the loader.
+                    if base_name == 'GetDeviceProcAddr' and cur_type == 'device':
+                        assignments.beginProtect(cur_cmd.protect)
+                        assignments += f'    table->GetDeviceProcAddr = {"gdpa" if x == 1 else "gpa"};\n'
+                        assignments.endProtect(cur_cmd.protect)
+                        continue
+                    elif base_name == 'GetInstanceProcAddr' and cur_type == 'instance':
+                        assignments.beginProtect(cur_cmd.protect)
+                        assignments += '    table->GetInstanceProcAddr = gpa;\n'
+                        assignments.endProtect(cur_cmd.protect)
+                        continue
+
                     if x == 1:
-                        if base_name == 'GetDeviceProcAddr':
-                            tables += '    table->GetDeviceProcAddr = gdpa;\n'
-                        elif cur_cmd.ext_type == 'instance':
-                            tables += f'    table->{base_name} = (PFN_{cur_cmd.name})gipa(inst, "{cur_cmd.name}");\n'
-                        else:
-                            tables += f'    table->{base_name} = (PFN_{cur_cmd.name})gdpa(dev, "{cur_cmd.name}");\n'
-                    elif (x < 1 and base_name == 'GetDeviceProcAddr'):
-                        tables += '    table->GetDeviceProcAddr = gpa;\n'
-                    elif (x > 1 and base_name == 'GetInstanceProcAddr'):
-                        tables += '    table->GetInstanceProcAddr = gpa;\n'
+                        table_name = f'device_extension_{"gipa" if cur_cmd.ext_type == "instance" else "gdpa"}_dispatch_init_table'
                     else:
-                        tables += f'    table->{base_name} = (PFN_{cur_cmd.name})gpa({gpa_param}, "{cur_cmd.name}");\n'
+                        table_name = next(iter(lookups))
+                    init_table = init_tables[table_name]
 
-                    if cur_cmd.protect is not None:
-                        tables += f'#endif // {cur_cmd.protect}\n'
+                    if cur_cmd.ext_name != cur_extension_names[table_name]:
+                        if version:
+                            init_table += f'\n    // ---- Core {version.name} commands\n'
+                        else:
+                            init_table += f'\n    // ---- {cur_cmd.ext_name} extension commands\n'
+                        cur_extension_names[table_name] = cur_cmd.ext_name
+
+                    api_version = version.constant if version else '0'
+                    init_table.beginProtect(cur_cmd.protect)
+                    init_table += f'    {{offsetof({table_type}, {base_name}), {self.name_pool.offset(cur_cmd.name)}, {api_version}}},\n'
+                    init_table.endProtect(cur_cmd.protect)
+
+            calls = CodeEmitter()
+            for table_name, (lookup_type, gpa_func, gpa_param) in lookups.items():
+                if not init_tables[table_name].getvalue():
+                    continue
+                tables += f'static const struct loader_dispatch_table_init_entry {table_name}[] = {{'
+                tables += init_tables[table_name]
+                tables += '};\n\n'
+                # Only core device commands are skipped by API version
+                if x == 0:
+                    calls += f'    uint32_t skipped_count = loader_init_{lookup_type}_dispatch_entries(table, {table_name}, sizeof({table_name}) / sizeof({table_name}[0]), api_version, {gpa_func}, {gpa_param});\n'
+                elif lookup_type == 'device':
+                    calls += f'    loader_init_{lookup_type}_dispatch_entries(table, {table_name}, sizeof({table_name}) / sizeof({table_name}[0]), UINT32_MAX, {gpa_func}, {gpa_param});\n'
+                else:
+                    calls += f'    loader_init_{lookup_type}_dispatch_entries(table, {table_name}, sizeof({table_name}) / sizeof({table_name}[0]), {gpa_func}, {gpa_param});\n'
 
+            tables += header
+            tables += calls
+            tables += assignments
+            if x == 0:
+                tables += '    return skipped_count;\n'
             tables += '}\n\n'
         return tables
 
+    #
+    # Create the definition of a perfect hash table and its displacement array. entries maps
+    # each name in perfect_hash to a (protect, initializer) tuple for its slot.
+    def OutputPerfectHashTable(self, perfect_hash, table_name, entry_type, entries):
+        table = CodeEmitter()
+        table += f'static const uint16_t {table_name}_displacements[{perfect_hash.bucket_count}] = {{\n'
+        for i in range(0, perfect_hash.bucket_count, 16):
+            table += '    ' + ', '.join(str(d) for d in perfect_hash.displacements[i:i + 16]) + ',\n'
+        table += '};\n'
+        table += f'static const {entry_type} {table_name}[{perfect_hash.slot_count}] = {{\n'
+        for slot, name in enumerate(perfect_hash.slots):
+            if name is None:
+                continue
+            protect, initializer = entries[name]
+            table.beginProtect(protect)
+            table += f'    [{slot}] = {initializer},\n'
+            table.endProtect(protect)
+        table += '};\n\n'
+        return table
+
+    #
+    # Create the expression which finds the only slot of a perfect hash table that can hold name
+    def PerfectHashTableLookup(self, perfect_hash, table_name, name_var):
+        return (f'&{table_name}[loader_perfect_hash_slot(loader_hash_name({name_var}, {perfect_hash.seed}u), {table_name}_displacements, '
+                f'{perfect_hash.bucket_mask}u, {perfect_hash.slot_bits}u)]')
+
     #
     # Create a lookup table function from the appropriate list of entrypoints and
     # return it as a string
@@ -943,40 +1188,32 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         commands = []
         tables = ''
         cur_type = ''
-        cur_extension_name = ''
+
+        tables += '// Entry of the generated perfect hash table used by loader_lookup_device_dispatch_table\n'
+        tables += 'struct loader_device_command_lookup_entry {\n'
+        tables += f'    {self.name_pool.offsetType() + " name_offset;":<39}// Offset of the command name without the "vk" prefix in loader_name_pool, 0 for unused slots\n'
+        tables += '    uint32_t table_offset;                 // Offset of the command in VkLayerDispatchTable\n'
+        tables += '    uint32_t api_version;                  // Core version which added the command, 0 for extension commands\n'
+        tables += '    PFN_vkVoidFunction trampoline;         // Trampoline that must always be returned instead of the table entry\n'
+        tables += '    uint32_t layer_extension_offset;       // Offset of the layer extension enable flag guarding trampoline\n'
+        tables += '};\n\n'
+        tables += '// Entry of the generated perfect hash table used by loader_lookup_instance_dispatch_table\n'
+        tables += 'struct loader_instance_command_lookup_entry {\n'
+        tables += f'    {self.name_pool.offsetType() + " name_offset;":<39}// Offset of the command name without the "vk" prefix in loader_name_pool, 0 for unused slots\n'
+        tables += '    uint32_t table_offset;                 // Offset of the command in VkLayerInstanceDispatchTable\n'
+        tables += '};\n\n'
 
         for x in range(0, 2):
             if x == 0:
                 cur_type = 'device'
-
-                tables += '// Device command lookup function\n'
-                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_device_dispatch_table(const VkLayerDispatchTable *table, const char *name, bool* found_name) {\n'
-                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
-                tables += '        *found_name = false;\n'
-                tables += '        return NULL;\n'
-                tables += '    }\n'
-                tables += '\n'
-                tables += '    name += 2;\n'
-                tables += '    *found_name = true;\n'
-                tables += '    struct loader_device* dev = (struct loader_device *)table;\n'
-                tables += '    const struct loader_instance* inst = dev->phys_dev_term->this_icd_term->this_instance;\n'
-                tables += '    uint32_t api_version = VK_MAKE_API_VERSION(0, inst->app_api_version.major, inst->app_api_version.minor, inst->app_api_version.patch);\n'
-                tables += '\n'
+                table_name = 'device_command_lookup_table'
+                entry_type = 'struct loader_device_command_lookup_entry'
             else:
                 cur_type = 'instance'
+                table_name = 'instance_command_lookup_table'
+                entry_type = 'struct loader_instance_command_lookup_entry'
 
-                tables += '// Instance command lookup function\n'
-                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_instance_dispatch_table(const VkLayerInstanceDispatchTable *table, const char *name,\n'
-                tables += '                                                                 bool *found_name) {\n'
-                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
-                tables += '        *found_name = false;\n'
-                tables += '        return NULL;\n'
-                tables += '    }\n'
-                tables += '\n'
-                tables += '    *found_name = true;\n'
-                tables += '    name += 2;\n'
-
-
+            entries = {}
             for y in range(0, 2):
                 if y == 0:
                     commands = self.core_commands
@@ -987,17 +1224,6 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                     version = self.getAPIVersion(cur_cmd.ext_name)
                     is_inst_handle_type = cur_cmd.handle_type == 'VkInstance' or cur_cmd.handle_type == 'VkPhysicalDevice'
                     if ((cur_type == 'instance' and is_inst_handle_type) or (cur_type == 'device' and not is_inst_handle_type)):
-                        if cur_cmd.ext_name != cur_extension_name:
-                            if version:
-                                tables += f'\n    // ---- Core {version.name} commands\n'
-                                if cur_type == 'device':
-                                    version_check = f'        if (dev->should_ignore_device_commands_from_newer_version && api_version < {version.constant}) return NULL;\n'
-                            else:
-
-                                tables += f'\n    // ---- {cur_cmd.ext_name} extension commands\n'
-                                version_check = ''
-                            cur_extension_name = cur_cmd.ext_name
-
                         # Remove 'vk' from proto name
                         base_name = cur_cmd.name[2:]
 
@@ -1007,35 +1233,79 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                             base_name == 'EnumerateInstanceVersion'):
                             continue
 
-                        if cur_cmd.protect is not None:
-                            tables += f'#if defined({cur_cmd.protect})\n'
-
-                        tables += f'    if (!strcmp(name, "{base_name}")) '
-                        if cur_cmd.name in DEVICE_CMDS_MUST_USE_TRAMP:
-                            if version_check != '':
-                                tables += f'{{\n{version_check}        return dev->layer_extensions.{cur_cmd.ext_name[3:].lower()}_enabled ? (void *){base_name} : NULL;\n    }}\n'
+                        if cur_type == 'device':
+                            api_version = version.constant if version else '0'
+                            if cur_cmd.name in DEVICE_CMDS_MUST_USE_TRAMP:
+                                trampoline = f'(PFN_vkVoidFunction){base_name}'
+                                layer_extension_offset = f'offsetof(struct loader_device, layer_extensions.{cur_cmd.ext_name[3:].lower()}_enabled)'
                             else:
-                                tables += f'return dev->layer_extensions.{cur_cmd.ext_name[3:].lower()}_enabled ? (void *){base_name} : NULL;\n'
-
+                                trampoline = 'NULL'
+                                layer_extension_offset = '0'
+                            initializer = (f'{{{self.name_pool.offset(cur_cmd.name) + 2}, offsetof(VkLayerDispatchTable, {base_name}), {api_version}, '
+                                           f'{trampoline}, {layer_extension_offset}}}')
                         else:
-                            if version_check != '':
-                                tables += f'{{\n{version_check}        return (void *)table->{base_name};\n    }}\n'
-                            else:
-                                tables += f'return (void *)table->{base_name};\n'
+                            initializer = f'{{{self.name_pool.offset(cur_cmd.name) + 2}, offsetof(VkLayerInstanceDispatchTable, {base_name})}}'
 
-                        if cur_cmd.protect is not None:
-                            tables += f'#endif // {cur_cmd.protect}\n'
+                        entries[base_name] = (cur_cmd.protect, initializer)
 
-            tables += '\n'
-            tables += '    *found_name = false;\n'
-            tables += '    return NULL;\n'
-            tables += '}\n\n'
+            perfect_hash = PerfectHash(list(entries.keys()))
+
+            if cur_type == 'device':
+                tables += '// Perfect hash table of all device commands, generated from the registry\n'
+                tables += self.OutputPerfectHashTable(perfect_hash, table_name, entry_type, entries)
+                tables += '// Device command lookup function\n'
+                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_device_dispatch_table(const VkLayerDispatchTable *table, const char *name, bool* found_name) {\n'
+                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
+                tables += '        *found_name = false;\n'
+                tables += '        return NULL;\n'
+                tables += '    }\n'
+                tables += '\n'
+                tables += '    name += 2;\n'
+                tables += f'    const {entry_type} *entry =\n'
+                tables += f'        {self.PerfectHashTableLookup(perfect_hash, table_name, "name")};\n'
+                tables += '    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {\n'
+                tables += '        *found_name = false;\n'
+                tables += '        return NULL;\n'
+                tables += '    }\n'
+                tables += '\n'
+                tables += '    *found_name = true;\n'
+                tables += '    struct loader_device* dev = (struct loader_device *)table;\n'
+                tables += '    const struct loader_instance* inst = dev->phys_dev_term->this_icd_term->this_instance;\n'
+                tables += '    uint32_t api_version = VK_MAKE_API_VERSION(0, inst->app_api_version.major, inst->app_api_version.minor, inst->app_api_version.patch);\n'
+                tables += '    if (dev->should_ignore_device_commands_from_newer_version && api_version < entry->api_version) return NULL;\n'
+                tables += '    if (NULL != entry->trampoline) {\n'
+                tables += '        return *(const bool *)((const char *)dev + entry->layer_extension_offset) ? (void *)entry->trampoline : NULL;\n'
+                tables += '    }\n'
+                tables += '    return *(void *const *)((const char *)table + entry->table_offset);\n'
+                tables += '}\n\n'
+            else:
+                tables += '// Perfect hash table of all instance commands, generated from the registry\n'
+                tables += self.OutputPerfectHashTable(perfect_hash, table_name, entry_type, entries)
+                tables += '// Instance command lookup function\n'
+                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_instance_dispatch_table(const VkLayerInstanceDispatchTable *table, const char *name,\n'
+                tables += '                                                                 bool *found_name) {\n'
+                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
+                tables += '        *found_name = false;\n'
+                tables += '        return NULL;\n'
+                tables += '    }\n'
+                tables += '\n'
+                tables += '    name += 2;\n'
+                tables += f'    const {entry_type} *entry =\n'
+                tables += f'        {self.PerfectHashTableLookup(perfect_hash, table_name, "name")};\n'
+                tables += '    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {\n'
+                tables += '        *found_name = false;\n'
+                tables += '        return NULL;\n'
+                tables += '    }\n'
+                tables += '\n'
+                tables += '    *found_name = true;\n'
+                tables += '    return *(void *const *)((const char *)table + entry->table_offset);\n'
+                tables += '}\n\n'
         return tables
 
     #
     # Create the appropriate trampoline (and possibly terminator) functions
-    def CreateTrampTermFuncs(self):
-        funcs = ''
+    def CreateTrampTermFuncs(self, prototypes = None):
+        funcs = CodeEmitter()
         cur_extension_name = ''
 
         # Some extensions have to be manually added.  Skip those in the automatic
@@ -1081,11 +1351,11 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                     funcs += f'\n// ---- {ext_cmd.ext_name} extension trampoline/terminators\n\n'
                 cur_extension_name = ext_cmd.ext_name
 
-            if ext_cmd.protect is not None:
-                funcs += f'#if defined({ext_cmd.protect})\n'
+            funcs.beginProtect(ext_cmd.protect)
 
             func_header = ext_cmd.cdecl.replace(";", " {\n")
             tramp_header = func_header.replace("VKAPI_CALL vk", "VKAPI_CALL ")
+            tramp_proto = ext_cmd.cdecl.replace("VKAPI_CALL vk", "VKAPI_CALL ") + '\n'
             return_prefix = '    '
             base_name = ext_cmd.name[2:]
             has_surface = 0
@@ -1139,6 +1409,13 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                 ext_cmd.name in DEVICE_CMDS_NEED_TERM):
                 requires_terminator = 1
 
+            if prototypes is not None:
+                prototypes.beginProtect(ext_cmd.protect)
+                prototypes += tramp_proto
+                if requires_terminator == 1:
+                    prototypes += tramp_proto.replace("VKAPI_CALL ", "VKAPI_CALL terminator_")
+                prototypes.endProtect(ext_cmd.protect)
+
             if requires_terminator == 1:
                 term_header = tramp_header.replace("VKAPI_CALL ", "VKAPI_CALL terminator_")
 
@@ -1164,7 +1441,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                     funcs += '    }\n'
                     funcs += '#error("Not implemented. Likely needs to be manually generated!");\n'
                 else:
-                    funcs += '    const VkLayerDispatchTable *disp = loader_get_dispatch('
+                    funcs += '    const struct loader_hot_dispatch_table *disp = loader_get_hot_dispatch('
                     funcs += ext_cmd.params[0].name
                     funcs += ');\n'
                     funcs += '    if (NULL == disp) {\n'
@@ -1223,45 +1500,36 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                     funcs += '        local_tag_info.objectHandle = (uint64_t)(uintptr_t)instance->instance;\n'
                     funcs += '    }\n'
 
-                if ext_cmd.ext_name in NULL_CHECK_EXT_NAMES:
-                    funcs += '    if (disp->' + base_name + ' != NULL) {\n'
-                    funcs += '    '
-                funcs += return_prefix
+                call = ''
                 if ext_cmd.handle_type == 'VkInstance':
-                    funcs += 'inst->'
-                funcs += 'disp->'
-                funcs += base_name
-                funcs += '('
+                    call += 'inst->'
+                call += 'disp->'
+                call += base_name
+                call += '('
                 count = 0
                 for param in ext_cmd.params:
                     if count != 0:
-                        funcs += ', '
+                        call += ', '
 
                     if param.type == 'VkPhysicalDevice':
-                        funcs += 'unwrapped_phys_dev'
+                        call += 'unwrapped_phys_dev'
                     elif ('DebugMarkerSetObject' in ext_cmd.name or 'SetDebugUtilsObject' in ext_cmd.name) and param.name == 'pNameInfo':
-                        funcs += '&local_name_info'
+                        call += '&local_name_info'
                     elif ('DebugMarkerSetObject' in ext_cmd.name or 'SetDebugUtilsObject' in ext_cmd.name) and param.name == 'pTagInfo':
-                        funcs += '&local_tag_info'
+                        call += '&local_tag_info'
                     else:
-                        funcs += param.name
+                        call += param.name
 
                     count += 1
-                funcs += ');\n'
-                if ext_cmd.ext_name in NULL_CHECK_EXT_NAMES:
-                    if ext_cmd.return_type is not None:
-                        funcs += '    } else {\n'
-                        funcs += '        return VK_SUCCESS;\n'
-                    funcs += '    }\n'
+                call += ')'
+                funcs += self.TrampolineCallDown(ext_cmd, call)
                 funcs += '}\n\n'
 
                 funcs += term_header
                 if ext_cmd.handle_type == 'VkPhysicalDevice':
                     funcs += f'    struct loader_physical_device_term *phys_dev_term = (struct loader_physical_device_term *){phys_dev_var_name};\n'
                     funcs += '    struct loader_icd_term *icd_term = phys_dev_term->this_icd_term;\n'
-                    funcs += '    if (NULL == icd_term->dispatch.'
-                    funcs += base_name
-                    funcs += ') {\n'
+                    funcs += f'    if (NULL == ICD_TERM_DISPATCH(icd_term, {base_name})) {{\n'
                     fatal_error_bit = '' if ext_cmd.ext_type =='instance' and has_return_type else 'VULKAN_LOADER_FATAL_ERROR_BIT | '
                     funcs += f'        loader_log(icd_term->this_instance, {fatal_error_bit}VULKAN_LOADER_ERROR_BIT, 0,\n'
                     funcs += '                   "ICD associated with VkPhysicalDevice does not support '
@@ -1287,9 +1555,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                         if update_structure_surface == 1:
                             funcs += update_structure_string
 
-                        funcs += '    ' + return_prefix + 'icd_term->dispatch.'
-                        funcs += base_name
-                        funcs += '('
+                        funcs += f'    {return_prefix}ICD_TERM_DISPATCH(icd_term, {base_name})('
                         count = 0
                         for param in ext_cmd.params:
                             if count != 0:
@@ -1311,10 +1577,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                             funcs += '        return;\n'
                         funcs += '    }\n'
 
-                    funcs += return_prefix
-                    funcs += 'icd_term->dispatch.'
-                    funcs += base_name
-                    funcs += '('
+                    funcs += f'{return_prefix}ICD_TERM_DISPATCH(icd_term, {base_name})('
                     count = 0
                     for param in ext_cmd.params:
                         if count != 0:
@@ -1426,42 +1689,168 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                 funcs += '        abort(); /* Intentionally fail so user can correct issue. */\n'
                 funcs += '    }\n'
 
-                if ext_cmd.ext_name in NULL_CHECK_EXT_NAMES:
-                    funcs += '    if (disp->' + base_name + ' != NULL) {\n'
-                    funcs += '    '
-                funcs += return_prefix
-                funcs += 'disp->'
-                funcs += base_name
-                funcs += '('
+                call = 'disp->'
+                call += base_name
+                call += '('
                 count = 0
                 for param in ext_cmd.params:
                     if count != 0:
-                        funcs += ', '
-                    funcs += param.name
+                        call += ', '
+                    call += param.name
                     count += 1
-                funcs += ');\n'
-                if ext_cmd.ext_name in NULL_CHECK_EXT_NAMES:
-                    if ext_cmd.return_type is not None:
-                        funcs += '    } else {\n'
-                        funcs += '        return VK_SUCCESS;\n'
-                    funcs += '    }\n'
+                call += ')'
+                funcs += self.TrampolineCallDown(ext_cmd, call)
                 funcs += '}\n\n'
 
-            if ext_cmd.protect is not None:
-                funcs += f'#endif // {ext_cmd.protect}\n'
+            funcs.endProtect(ext_cmd.protect)
+
+        if not self.genOpts.trampolineStats:
+            return funcs
+        stats_funcs = CodeEmitter()
+        stats_funcs += self.OutputTrampolineStats()
+        stats_funcs += funcs
+        return stats_funcs
+
+    #
+    # Declare the trampolines and terminators created by CreateTrampTermFuncs, so they can be used outside
+    # of vk_loader_extensions_trampolines.c
+    def OutputTrampTermPrototypes(self):
+        protos = CodeEmitter()
+        protos += '// Extension trampolines and terminators defined in vk_loader_extensions_trampolines.c\n'
+        self.CreateTrampTermFuncs(protos)
+        protos += '\n'
+        return protos
 
-        return funcs
+    #
+    # Call down the chain from a generated trampoline, where call is the call expression without a
+    # trailing semicolon. When trampoline statistics are generated, the call is counted (and timed)
+    # in the entry of loader_trampoline_stats_table for the command.
+    def TrampolineCallDown(self, ext_cmd, call):
+        call_down = ''
+        base_name = ext_cmd.name[2:]
+        null_check = ext_cmd.ext_name in NULL_CHECK_EXT_NAMES
+        has_return_type = ext_cmd.return_type is not None
+
+        if not self.genOpts.trampolineStats:
+            if null_check:
+                call_down += '    if (disp->' + base_name + ' != NULL) {\n'
+                call_down += '    '
+            call_down += '    return ' if has_return_type else '    '
+            call_down += call + ';\n'
+            if null_check:
+                if has_return_type:
+                    call_down += '    } else {\n'
+                    call_down += '        return VK_SUCCESS;\n'
+                call_down += '    }\n'
+            return call_down
+
+        call_down += f'    LOADER_TRAMPOLINE_STATS_BEGIN({ext_cmd.name});\n'
+        if null_check:
+            if has_return_type:
+                call_down += f'    {ext_cmd.return_type.text} result = VK_SUCCESS;\n'
+            call_down += '    if (disp->' + base_name + ' != NULL) {\n'
+            call_down += '        result = ' if has_return_type else '        '
+            call_down += call + ';\n'
+            call_down += '    }\n'
+        else:
+            call_down += f'    {ext_cmd.return_type.text} result = ' if has_return_type else '    '
+            call_down += call + ';\n'
+        call_down += f'    LOADER_TRAMPOLINE_STATS_END({ext_cmd.name});\n'
+        if has_return_type:
+            call_down += '    return result;\n'
+        return call_down
+
+    #
+    # Create the table which counts the calls made through the trampoline of every core and extension
+    # command, both the generated ones and the ones in trampoline.c, and the functions which report it.
+    # The counting is only compiled in when LOADER_TRAMPOLINE_STATS is defined.
+    def OutputTrampolineStats(self):
+        stats_commands = self.core_commands + self.ext_commands
+        stats = CodeEmitter()
+        stats += '// ---- Trampoline call statistics\n\n'
+        stats += '#if defined(LOADER_HAS_TRAMPOLINE_STATS)\n\n'
+        stats += 'struct loader_trampoline_stats loader_trampoline_stats_table[LOADER_TRAMPOLINE_STATS_INDEX_COUNT];\n\n'
+        stats += '// Offset in loader_name_pool of the name of the command counted by each entry of loader_trampoline_stats_table\n'
+        stats += f'static const {self.name_pool.offsetType()} loader_trampoline_stats_name_offsets[LOADER_TRAMPOLINE_STATS_INDEX_COUNT] = {{\n'
+        for cmd in stats_commands:
+            stats += f'    {self.name_pool.offset(cmd.name)}, // {cmd.name}\n'
+        stats += '};\n\n'
+        stats += '// Log the number of calls made through each trampoline since the loader was loaded, and the time spent\n'
+        stats += '// in them when LOADER_TRAMPOLINE_TIMERS is defined\n'
+        stats += 'void loader_log_trampoline_stats(const struct loader_instance *inst) {\n'
+        stats += '    for (size_t i = 0; i < LOADER_TRAMPOLINE_STATS_INDEX_COUNT; i++) {\n'
+        stats += '        uint64_t call_count = loader_platform_atomic_load_uint64(&loader_trampoline_stats_table[i].call_count);\n'
+        stats += '        if (0 == call_count) {\n'
+        stats += '            continue;\n'
+        stats += '        }\n'
+        stats += '        uint64_t total_time_ns = loader_platform_atomic_load_uint64(&loader_trampoline_stats_table[i].total_time_ns);\n'
+        stats += '        loader_log(inst, VULKAN_LOADER_PERF_BIT, 0, "%s: %" PRIu64 " calls, %" PRIu64 " ns",\n'
+        stats += '                   &loader_name_pool[loader_trampoline_stats_name_offsets[i]], call_count, total_time_ns);\n'
+        stats += '    }\n'
+        stats += '}\n\n'
+        stats += '// Write the same statistics to file as "command,calls,total_ns" lines, after a line naming the columns\n'
+        stats += 'void loader_write_trampoline_stats(FILE *file) {\n'
+        stats += '    fprintf(file, "command,calls,total_ns\\n");\n'
+        stats += '    for (size_t i = 0; i < LOADER_TRAMPOLINE_STATS_INDEX_COUNT; i++) {\n'
+        stats += '        uint64_t call_count = loader_platform_atomic_load_uint64(&loader_trampoline_stats_table[i].call_count);\n'
+        stats += '        if (0 == call_count) {\n'
+        stats += '            continue;\n'
+        stats += '        }\n'
+        stats += '        uint64_t total_time_ns = loader_platform_atomic_load_uint64(&loader_trampoline_stats_table[i].total_time_ns);\n'
+        stats += '        fprintf(file, "%s,%" PRIu64 ",%" PRIu64 "\\n", &loader_name_pool[loader_trampoline_stats_name_offsets[i]], call_count,\n'
+        stats += '                total_time_ns);\n'
+        stats += '    }\n'
+        stats += '}\n\n'
+        stats += '#endif // LOADER_HAS_TRAMPOLINE_STATS\n\n'
+        return stats
+
+    #
+    # Declare the table which counts the calls made through the trampolines, the macros the trampolines
+    # use to update it and the functions which report it, when trampoline statistics are generated.
+    # LOADER_HAS_TRAMPOLINE_STATS tells the hand-written loader code that they are available.
+    def OutputTrampolineStatsDeclarations(self):
+        if not self.genOpts.trampolineStats:
+            return ''
+        decls = CodeEmitter()
+        decls += '// ---- Trampoline call statistics\n\n'
+        decls += '#if defined(LOADER_TRAMPOLINE_STATS)\n\n'
+        decls += '#define LOADER_HAS_TRAMPOLINE_STATS 1\n\n'
+        decls += 'struct loader_trampoline_stats {\n'
+        decls += f'    {"uint64_t call_count;":<39}// Number of calls made through the trampoline\n'
+        decls += f'    {"uint64_t total_time_ns;":<39}// Time spent in the trampoline and below it, when LOADER_TRAMPOLINE_TIMERS is defined\n'
+        decls += '};\n\n'
+        decls += '// Index of the entry of loader_trampoline_stats_table which counts the calls made through the trampoline of each command\n'
+        decls += 'enum loader_trampoline_stats_index {\n'
+        for cmd in self.core_commands + self.ext_commands:
+            decls += f'    LOADER_TRAMPOLINE_STATS_INDEX_{cmd.name},\n'
+        decls += '    LOADER_TRAMPOLINE_STATS_INDEX_COUNT\n'
+        decls += '};\n\n'
+        decls += 'extern struct loader_trampoline_stats loader_trampoline_stats_table[LOADER_TRAMPOLINE_STATS_INDEX_COUNT];\n\n'
+        decls += '#if defined(LOADER_TRAMPOLINE_TIMERS)\n'
+        decls += '#define LOADER_TRAMPOLINE_STATS_BEGIN(command) \\\n'
+        decls += '    loader_platform_atomic_add_uint64(&loader_trampoline_stats_table[LOADER_TRAMPOLINE_STATS_INDEX_##command].call_count, 1); \\\n'
+        decls += '    uint64_t trampoline_start_ns = loader_platform_timestamp_ns()\n'
+        decls += '#define LOADER_TRAMPOLINE_STATS_END(command) \\\n'
+        decls += '    loader_platform_atomic_add_uint64(&loader_trampoline_stats_table[LOADER_TRAMPOLINE_STATS_INDEX_##command].total_time_ns, \\\n'
+        decls += '                                      loader_platform_timestamp_ns() - trampoline_start_ns)\n'
+        decls += '#else\n'
+        decls += '#define LOADER_TRAMPOLINE_STATS_BEGIN(command) \\\n'
+        decls += '    loader_platform_atomic_add_uint64(&loader_trampoline_stats_table[LOADER_TRAMPOLINE_STATS_INDEX_##command].call_count, 1)\n'
+        decls += '#define LOADER_TRAMPOLINE_STATS_END(command)\n'
+        decls += '#endif // LOADER_TRAMPOLINE_TIMERS\n\n'
+        decls += '// Log the number of calls made through each trampoline, and the time spent in them\n'
+        decls += 'void loader_log_trampoline_stats(const struct loader_instance *inst);\n'
+        decls += '// Write the same statistics to file in CSV form\n'
+        decls += 'void loader_write_trampoline_stats(FILE *file);\n\n'
+        decls += '#endif // LOADER_TRAMPOLINE_STATS\n\n'
+        return decls
 
 
     #
     # Create a function for the extension GPA call
     def InstExtensionGPA(self):
         gpa_func = ''
-        cur_extension_name = ''
-
-        gpa_func += '// GPA helpers for extensions\n'
-        gpa_func += 'bool extension_instance_gpa(struct loader_instance *ptr_instance, const char *name, void **addr) {\n'
-        gpa_func += '    *addr = NULL;\n\n'
+        entries = {}
 
         for cur_cmd in self.ext_commands:
             if (self.getAPIVersion(cur_cmd.ext_name) or
@@ -1470,35 +1859,44 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                 cur_cmd.name in AVOID_CMD_NAMES ):
                 continue
 
-            if cur_cmd.ext_name != cur_extension_name:
-                gpa_func += f'\n    // ---- {cur_cmd.ext_name} extension commands\n'
-                cur_extension_name = cur_cmd.ext_name
-
-            if cur_cmd.protect is not None:
-                gpa_func += f'#if defined({cur_cmd.protect})\n'
-
-            #base_name = cur_cmd.name[2:]
             base_name = SHARED_ALIASES[cur_cmd.name] if cur_cmd.name in SHARED_ALIASES else cur_cmd.name[2:]
 
+            # Commands from instance extensions are only returned once the extension is enabled
             if cur_cmd.ext_type == 'instance':
-                gpa_func += f'    if (!strcmp("{cur_cmd.name}", name)) {{\n'
-                gpa_func += '        *addr = (ptr_instance->enabled_known_extensions.'
-                gpa_func += cur_cmd.ext_name[3:].lower()
-                gpa_func += ' == 1)\n'
-                gpa_func += f'                     ? (void *){base_name}\n'
-                gpa_func += '                     : NULL;\n'
-                gpa_func += '        return true;\n'
-                gpa_func += '    }\n'
+                enable = f'true, offsetof(struct loader_instance_extension_enables, {cur_cmd.ext_name[3:].lower()})'
             else:
-                gpa_func += f'    if (!strcmp("{cur_cmd.name}", name)) {{\n'
-                gpa_func += f'        *addr = (void *){base_name};\n'
-                gpa_func += '        return true;\n'
-                gpa_func += '    }\n'
-
-            if cur_cmd.protect is not None:
-                gpa_func += f'#endif // {cur_cmd.protect}\n'
-
-        gpa_func += '    return false;\n'
+                enable = 'false, 0'
+            entries[cur_cmd.name] = (cur_cmd.protect, f'{{{self.name_pool.offset(cur_cmd.name)}, (PFN_vkVoidFunction){base_name}, {enable}}}')
+
+        perfect_hash = PerfectHash(list(entries.keys()))
+        table_name = 'instance_extension_command_table'
+        entry_type = 'struct loader_instance_extension_command_entry'
+
+        gpa_func += '// Entry of the generated perfect hash table used by extension_instance_gpa\n'
+        gpa_func += 'struct loader_instance_extension_command_entry {\n'
+        gpa_func += f'    {self.name_pool.offsetType() + " name_offset;":<39}// Offset of the command name in loader_name_pool, 0 for unused slots\n'
+        gpa_func += '    PFN_vkVoidFunction func;               // Trampoline returned for the command\n'
+        gpa_func += '    bool requires_enable;                  // Only return func if the instance extension is enabled\n'
+        gpa_func += '    uint16_t enable_offset;                // Offset of the enable flag in loader_instance_extension_enables\n'
+        gpa_func += '};\n\n'
+        gpa_func += '// Perfect hash table of the extension commands known to the loader, generated from the registry\n'
+        gpa_func += self.OutputPerfectHashTable(perfect_hash, table_name, entry_type, entries)
+        gpa_func += '// GPA helpers for extensions\n'
+        gpa_func += 'bool extension_instance_gpa(struct loader_instance *ptr_instance, const char *name, void **addr) {\n'
+        gpa_func += '    *addr = NULL;\n'
+        gpa_func += '\n'
+        gpa_func += f'    const {entry_type} *entry =\n'
+        gpa_func += f'        {self.PerfectHashTableLookup(perfect_hash, table_name, "name")};\n'
+        gpa_func += '    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {\n'
+        gpa_func += '        return false;\n'
+        gpa_func += '    }\n'
+        gpa_func += '    if (entry->requires_enable) {\n'
+        gpa_func += '        const uint8_t *enables = (const uint8_t *)&ptr_instance->enabled_known_extensions;\n'
+        gpa_func += '        *addr = (enables[entry->enable_offset] == 1) ? (void *)entry->func : NULL;\n'
+        gpa_func += '    } else {\n'
+        gpa_func += '        *addr = (void *)entry->func;\n'
+        gpa_func += '    }\n'
+        gpa_func += '    return true;\n'
         gpa_func += '}\n\n'
 
         return gpa_func
@@ -1506,41 +1904,37 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
     #
     # Create the extension name init function
     def InstantExtensionCreate(self):
-        entries = []
-        entries = self.instanceExtensions
-        count = 0
-        cur_extension_name = ''
+        entries = {}
 
-        create_func = ''
-        create_func += '// A function that can be used to query enabled extensions during a vkCreateInstance call\n'
-        create_func += 'void extensions_create_instance(struct loader_instance *ptr_instance, const VkInstanceCreateInfo *pCreateInfo) {\n'
-        create_func += '    for (uint32_t i = 0; i < pCreateInfo->enabledExtensionCount; i++) {\n'
-        for ext in entries:
+        for ext in self.instanceExtensions:
             if (self.getAPIVersion(ext.name) or ext.name in WSI_EXT_NAMES or
                 ext.name in AVOID_EXT_NAMES or ext.name in AVOID_CMD_NAMES or
                 ext.type == 'device' or ext.num_commands == 0):
                 continue
 
-            if ext.name != cur_extension_name:
-                create_func += f'\n    // ---- {ext.name} extension commands\n'
-                cur_extension_name = ext.name
+            entries[ext.name] = (ext.protect, f'{{{self.name_pool.offset(ext.name)}, offsetof(struct loader_instance_extension_enables, {ext.name[3:].lower()})}}')
 
-            if ext.protect is not None:
-                create_func += f'#if defined({ext.protect})\n'
-            if count == 0:
-                create_func += '        if (0 == strcmp(pCreateInfo->ppEnabledExtensionNames[i], '
-            else:
-                create_func += '        } else if (0 == strcmp(pCreateInfo->ppEnabledExtensionNames[i], '
-
-            create_func += ext.define + ')) {\n'
-            create_func += '            ptr_instance->enabled_known_extensions.'
-            create_func += ext.name[3:].lower()
-            create_func += ' = 1;\n'
-
-            if ext.protect is not None:
-                create_func += f'#endif // {ext.protect}\n'
-            count += 1
+        perfect_hash = PerfectHash(list(entries.keys()))
+        table_name = 'instance_extension_enable_table'
+        entry_type = 'struct loader_instance_extension_enable_entry'
 
+        create_func = ''
+        create_func += '// Entry of the generated perfect hash table used by extensions_create_instance\n'
+        create_func += 'struct loader_instance_extension_enable_entry {\n'
+        create_func += f'    {self.name_pool.offsetType() + " name_offset;":<39}// Offset of the extension name in loader_name_pool, 0 for unused slots\n'
+        create_func += '    uint16_t enable_offset;                // Offset of the enable flag in loader_instance_extension_enables\n'
+        create_func += '};\n\n'
+        create_func += '// Perfect hash table of the instance extensions tracked by the loader, generated from the registry\n'
+        create_func += self.OutputPerfectHashTable(perfect_hash, table_name, entry_type, entries)
+        create_func += '// A function that can be used to query enabled extensions during a vkCreateInstance call\n'
+        create_func += 'void extensions_create_instance(struct loader_instance *ptr_instance, const VkInstanceCreateInfo *pCreateInfo) {\n'
+        create_func += '    uint8_t *enables = (uint8_t *)&ptr_instance->enabled_known_extensions;\n'
+        create_func += '    for (uint32_t i = 0; i < pCreateInfo->enabledExtensionCount; i++) {\n'
+        create_func += '        const char *name = pCreateInfo->ppEnabledExtensionNames[i];\n'
+        create_func += f'        const {entry_type} *entry =\n'
+        create_func += f'            {self.PerfectHashTableLookup(perfect_hash, table_name, "name")};\n'
+        create_func += '        if (0 != entry->name_offset && 0 == strcmp(name, &loader_name_pool[entry->name_offset])) {\n'
+        create_func += '            enables[entry->enable_offset] = 1;\n'
         create_func += '        }\n'
         create_func += '    }\n'
         create_func += '}\n\n'
@@ -1550,50 +1944,123 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
     # Create code to initialize a dispatch table from the appropriate list of
     # extension entrypoints and return it as a string
     def DeviceExtensionGetTerminator(self):
-        term_func = ''
+        entries = {}
+        requirements = []
+
+        for ext_cmd in self.ext_commands:
+            if ext_cmd.name not in DEVICE_CMDS_NEED_TERM:
+                continue
+
+            base_name = ext_cmd.name[2:]
+            # Additional extension dependencies of a command are checked by index, shared between commands with the same ones
+            requirement = 0
+            if ext_cmd.require:
+                dep_expr = self.ConvertDependencyExpression(ext_cmd.require, lambda ext_name: f'dev->driver_extensions.{ext_name[3:].lower()}_enabled')
+                if dep_expr not in requirements:
+                    requirements.append(dep_expr)
+                requirement = requirements.index(dep_expr) + 1
+            driver_extension_offset = f'offsetof(struct loader_device, driver_extensions.{ext_cmd.ext_name[3:].lower()}_enabled)'
+            entries[base_name] = (ext_cmd.protect, f'{{{self.name_pool.offset(ext_cmd.name) + 2}, (PFN_vkVoidFunction)terminator_{base_name}, '
+                                                   f'{driver_extension_offset}, {requirement}}}')
+
+        perfect_hash = PerfectHash(list(entries.keys()))
+        table_name = 'device_terminator_table'
+        entry_type = 'struct loader_device_terminator_entry'
 
+        term_func = ''
+        term_func += '// Entry of the generated perfect hash table used by get_extension_device_proc_terminator\n'
+        term_func += 'struct loader_device_terminator_entry {\n'
+        term_func += f'    {self.name_pool.offsetType() + " name_offset;":<39}// Offset of the command name without the "vk" prefix in loader_name_pool, 0 for unused slots\n'
+        term_func += '    PFN_vkVoidFunction terminator;         // Terminator returned for the command\n'
+        term_func += '    uint32_t driver_extension_offset;      // Offset of the driver extension enable flag guarding terminator\n'
+        term_func += '    uint32_t requirement;                  // Additional requirement checked by loader_device_terminator_requirement_met\n'
+        term_func += '};\n\n'
+        term_func += '// Perfect hash table of the device commands which need a terminator, generated from the registry\n'
+        term_func += self.OutputPerfectHashTable(perfect_hash, table_name, entry_type, entries)
+        term_func += '// Check the extension dependencies of a command beyond the extension which added it\n'
+        term_func += 'static bool loader_device_terminator_requirement_met(const struct loader_device *dev, uint32_t requirement) {\n'
+        term_func += '    switch (requirement) {\n'
+        for index, dep_expr in enumerate(requirements):
+            term_func += f'        case {index + 1}:\n'
+            term_func += f'            return {dep_expr};\n'
+        term_func += '        default:\n'
+        term_func += '            return true;\n'
+        term_func += '    }\n'
+        term_func += '}\n\n'
         term_func += '// Some device commands still need a terminator because the loader needs to unwrap something about them.\n'
         term_func += '// In many cases, the item needing unwrapping is a VkPhysicalDevice or VkSurfaceKHR object.  But there may be other items\n'
         term_func += '// in the future.\n'
         term_func += 'PFN_vkVoidFunction get_extension_device_proc_terminator(struct loader_device *dev, const char *name, bool* found_name) {\n'
-        term_func += '''    *found_name = false;
-    if (!name || name[0] != 'v' || name[1] != 'k') {
-        return NULL;
-    }
-    name += 2;
-'''
-        last_protect = None
-        last_ext = None
-        for ext_cmd in self.ext_commands:
-            version = self.getAPIVersion(ext_cmd.ext_name)
-            if ext_cmd.name in DEVICE_CMDS_NEED_TERM:
-                if version:
-                    term_func += f'    // ---- Core {version.name} commands\n'
-                else:
-                    last_protect = ext_cmd.protect
-                    if ext_cmd.protect is not None:
-                        term_func += f'#if defined({ext_cmd.protect})\n'
-                    if last_ext != ext_cmd.ext_name:
-                        term_func += f'    // ---- {ext_cmd.ext_name} extension commands\n'
-                        last_ext = ext_cmd.ext_name
+        term_func += '    *found_name = false;\n'
+        term_func += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
+        term_func += '        return NULL;\n'
+        term_func += '    }\n'
+        term_func += '    name += 2;\n'
+        term_func += f'    const {entry_type} *entry =\n'
+        term_func += f'        {self.PerfectHashTableLookup(perfect_hash, table_name, "name")};\n'
+        term_func += '    if (0 == entry->name_offset || strcmp(name, &loader_name_pool[entry->name_offset])) {\n'
+        term_func += '        return NULL;\n'
+        term_func += '    }\n'
+        term_func += '\n'
+        term_func += '    *found_name = true;\n'
+        term_func += '    bool enabled = *(const bool *)((const char *)dev + entry->driver_extension_offset);\n'
+        term_func += '    return (enabled && loader_device_terminator_requirement_met(dev, entry->requirement)) ? entry->terminator : NULL;\n'
+        term_func += '}\n\n'
 
-                term_func += f'    if (!strcmp(name, "{ext_cmd.name[2:]}")) {{\n'
-                term_func += '        *found_name = true;\n'
-                if ext_cmd.require:
-                    dep_expr = self.ConvertDependencyExpression(ext_cmd.require, lambda ext_name: f'dev->driver_extensions.{ext_name[3:].lower()}_enabled')
-                    term_func += f'        return (dev->driver_extensions.{ext_cmd.ext_name[3:].lower()}_enabled && ({dep_expr})) ?\n'
-                else:
-                    term_func += f'        return dev->driver_extensions.{ext_cmd.ext_name[3:].lower()}_enabled ?\n'
-                term_func += f'            (PFN_vkVoidFunction)terminator_{(ext_cmd.name[2:])} : NULL;\n'
-                term_func += '    }\n'
+        return term_func
 
-        if last_protect is not None:
-            term_func += f'#endif // {last_protect}\n'
+    #
+    # Order the device commands of the loader internal hot dispatch table. Commands are sorted by their call count in the
+    # dispatch profile, or by their position in HOT_DEVICE_CMDS without a profile, and every other command follows in
+    # VkLayerDispatchTable order.
+    def HotDispatchCommands(self):
+        if self.genOpts.dispatchProfile is not None:
+            with open(self.genOpts.dispatchProfile, 'r') as f:
+                call_counts = json.load(f)
+            if not isinstance(call_counts, dict):
+                raise ValueError(f'{self.genOpts.dispatchProfile} must contain an object mapping command names to call counts')
+        else:
+            call_counts = {name: len(HOT_DEVICE_CMDS) - index for index, name in enumerate(HOT_DEVICE_CMDS)}
 
-        term_func += '    return NULL;\n'
-        term_func += '}\n\n'
+        commands = [cur_cmd for cur_cmd in self.core_commands + self.ext_commands
+                    if not (cur_cmd.name in ADD_INST_CMDS or cur_cmd.handle_type == 'VkInstance' or cur_cmd.handle_type == 'VkPhysicalDevice')]
+        # sorted() is stable, so commands with the same call count keep their dispatch table order
+        return sorted(commands, key=lambda cur_cmd: -call_counts.get(cur_cmd.name, 0))
 
-        return term_func
+    #
+    # Create the loader internal device dispatch table used by the trampolines, which unlike VkLayerDispatchTable is not part
+    # of the layer interface, so its entries can be ordered to pack the most frequently called commands into the first cache lines
+    def OutputHotDispatchTable(self):
+        table = CodeEmitter()
+        table += '// Copy of the device dispatch table used by the trampolines, with the most frequently called commands first so\n'
+        table += '// that they share as few cache lines as possible\n'
+        table += 'struct loader_hot_dispatch_table {\n'
+        for cur_cmd in self.HotDispatchCommands():
+            table.beginProtect(cur_cmd.protect)
+            table += f'    PFN_{cur_cmd.name} {cur_cmd.name[2:]};\n'
+            table.endProtect(cur_cmd.protect)
+        table += '};\n\n'
+        return table
+
+    #
+    # Create the function which fills in the hot dispatch table from the device dispatch table
+    def OutputHotDispatchTableInit(self):
+        table = CodeEmitter()
+        table += '// Offsets in VkLayerDispatchTable of the entries of struct loader_hot_dispatch_table, in the same order\n'
+        table += 'static const uint16_t hot_dispatch_table_offsets[] = {\n'
+        for cur_cmd in self.HotDispatchCommands():
+            table.beginProtect(cur_cmd.protect)
+            table += f'    offsetof(VkLayerDispatchTable, {cur_cmd.name[2:]}),\n'
+            table.endProtect(cur_cmd.protect)
+        table += '};\n\n'
+        table += '// Copy the device dispatch table into the hot dispatch table once it is completely initialized\n'
+        table += 'void loader_init_hot_dispatch_table(struct loader_dev_dispatch_table *dispatch) {\n'
+        table += '    PFN_vkVoidFunction *hot_entries = (PFN_vkVoidFunction *)&dispatch->hot_dispatch;\n'
+        table += '    for (size_t i = 0; i < sizeof(hot_dispatch_table_offsets) / sizeof(hot_dispatch_table_offsets[0]); i++) {\n'
+        table += '        hot_entries[i] = *(PFN_vkVoidFunction *)((char *)&dispatch->core_dispatch + hot_dispatch_table_offsets[i]);\n'
+        table += '    }\n'
+        table += '}\n\n'
+        return table
 
     #
     # Create a dispatch table solely for device functions which have custom terminators
@@ -1663,7 +2130,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         term_func += '// device function. This is used in the terminators themselves.\n'
         term_func += 'void init_extension_device_proc_terminator_dispatch(struct loader_device *dev) {\n'
         term_func += '    struct loader_device_terminator_dispatch* dispatch = &dev->loader_dispatch.extension_terminator_dispatch;\n'
-        term_func += '    PFN_vkGetDeviceProcAddr gpda = (PFN_vkGetDeviceProcAddr)dev->phys_dev_term->this_icd_term->dispatch.GetDeviceProcAddr;\n'
+        term_func += '    PFN_vkGetDeviceProcAddr gpda = ICD_TERM_DISPATCH(dev->phys_dev_term->this_icd_term, GetDeviceProcAddr);\n'
         last_protect = None
         last_ext = None
         for ext_cmd in self.ext_commands:
@@ -1754,21 +2221,21 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         extensions = self.instanceExtensions
 
         table = ''
-        table += '// A null-terminated list of all of the instance extensions supported by the loader.\n'
+        table += '// Offsets in loader_name_pool of the names of all of the instance extensions supported by the loader.\n'
         table += '// If an instance extension name is not in this list, but it is exported by one or more of the\n'
         table += '// ICDs detected by the loader, then the extension name not in the list will be filtered out\n'
         table += '// before passing the list of extensions to the application.\n'
-        table += 'const char *const LOADER_INSTANCE_EXTENSIONS[] = {\n'
+        table += f'const {self.name_pool.offsetType()} LOADER_INSTANCE_EXTENSIONS[] = {{\n'
         for ext in extensions:
             if ext.type == 'device' or self.getAPIVersion(ext.name):
                 continue
 
             if ext.protect is not None:
                 table += f'#if defined({ext.protect})\n'
-            table += '                                                  '
-            table += ext.define + ',\n'
+            table += f'    {self.name_pool.offset(ext.name)}, // {ext.name}\n'
 
             if ext.protect is not None:
                 table += f'#endif // {ext.protect}\n'
-        table += '                                                  NULL };\n'
+        table += '};\n'
+        table += 'const uint32_t LOADER_INSTANCE_EXTENSION_COUNT = sizeof(LOADER_INSTANCE_EXTENSIONS) / sizeof(LOADER_INSTANCE_EXTENSIONS[0]);\n'
         return table
@@ -16,7 +16,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import argparse, cProfile, pdb, string, sys, time, os
+import argparse, cProfile, pdb, pstats, string, sys, time, os
 
 # Simple timer functions
 startTime = None
@@ -79,6 +79,15 @@ def makeGenOpts(args):
     # Path to generated files, particularly api.py
     genpath = args.genpath
 
+    # Whether ICD dispatch table entries are looked up when first used instead of at instance creation
+    lazyIcdEntries = args.lazyIcdEntries
+
+    # Call frequency profile used to order the loader internal hot dispatch table, if any
+    dispatchProfile = args.dispatchProfile
+
+    # Whether the generated trampolines count (and optionally time) the calls made through them
+    trampolineStats = args.trampolineStats
+
     # Descriptive names for various regexp patterns used to select
     # versions and extensions
     allFeatures     = allExtensions = '.*'
@@ -195,15 +204,46 @@ def makeGenOpts(args):
             apientry          = 'VKAPI_CALL ',
             apientryp         = 'VKAPI_PTR *',
             alignFuncParam    = 48,
-            expandEnumerants = False)
+            expandEnumerants = False,
+            lazyIcdEntries    = lazyIcdEntries,
+            dispatchProfile   = dispatchProfile,
+            trampolineStats   = trampolineStats)
         ]
 
-    # Options for loader extension source generator
-    genOpts['vk_loader_extensions.c'] = [
-          LoaderExtensionOutputGenerator,
-          LoaderExtensionGeneratorOptions(
+    # Options for loader extension source generator, split into several files which can be compiled in parallel
+    for filename in LOADER_EXTENSION_SOURCES:
+        genOpts[filename] = [
+              LoaderExtensionOutputGenerator,
+              LoaderExtensionGeneratorOptions(
+                conventions       = conventions,
+                filename          = filename,
+                directory         = directory,
+                genpath           = None,
+                apiname           = apiname,
+                profile           = None,
+                versions          = featuresPat,
+                emitversions      = featuresPat,
+                defaultExtensions = defaultExtensions,
+                addExtensions     = addExtensionsPat,
+                removeExtensions  = removeExtensionsPat,
+                emitExtensions    = emitExtensionsPat,
+                prefixText        = prefixStrings + vkPrefixStrings,
+                apicall           = 'VKAPI_ATTR ',
+                apientry          = 'VKAPI_CALL ',
+                apientryp         = 'VKAPI_PTR *',
+                alignFuncParam    = 48,
+                expandEnumerants = False,
+                lazyIcdEntries    = lazyIcdEntries,
+                dispatchProfile   = dispatchProfile,
+                trampolineStats   = trampolineStats)
+            ]
+
+    # Helper file generator options for vk_object_types.h
+    genOpts['vk_object_types.h'] = [
+          HelperFileOutputGenerator,
+          HelperFileOutputGeneratorOptions(
             conventions       = conventions,
-            filename          = 'vk_loader_extensions.c',
+            filename          = 'vk_object_types.h',
             directory         = directory,
             genpath           = None,
             apiname           = apiname,
@@ -219,15 +259,16 @@ def makeGenOpts(args):
             apientry          = 'VKAPI_CALL ',
             apientryp         = 'VKAPI_PTR *',
             alignFuncParam    = 48,
-            expandEnumerants = False)
+            expandEnumerants  = False,
+            helper_file_type  = 'object_types_header')
         ]
 
-    # Helper file generator options for vk_object_types.h
-    genOpts['vk_object_types.h'] = [
+    # Helper file generator options for vk_enum_string_helper.h
+    genOpts['vk_enum_string_helper.h'] = [
           HelperFileOutputGenerator,
           HelperFileOutputGeneratorOptions(
             conventions       = conventions,
-            filename          = 'vk_object_types.h',
+            filename          = 'vk_enum_string_helper.h',
             directory         = directory,
             genpath           = None,
             apiname           = apiname,
@@ -244,7 +285,7 @@ def makeGenOpts(args):
             apientryp         = 'VKAPI_PTR *',
             alignFuncParam    = 48,
             expandEnumerants  = False,
-            helper_file_type  = 'object_types_header')
+            helper_file_type  = 'enum_string_header')
         ]
 
 # Create an API generator and corresponding generator options based on
@@ -288,11 +329,57 @@ def genTarget(args):
         write('No generator options for unknown target:', args.target, file=sys.stderr)
         return none
 
-# -feature name
-# -extension name
-# For both, "name" may be a single name, or a space-separated list
-# of names, or a regular expression.
-if __name__ == '__main__':
+# Create the registry object for gen and options and load vk.xml into it.
+# Appends (phase, wall time in seconds) tuples to timings.
+def loadRegistry(args, gen, options, timings):
+    # The options are set before XML loading as they may affect it.
+    reg = Registry(gen, options)
+
+    # Parse the specified registry XML into an ElementTree object
+    startTime = time.perf_counter()
+    tree = etree.parse(args.registry)
+    timings.append(('parse ' + os.path.basename(args.registry), time.perf_counter() - startTime))
+
+    # Load the XML tree into the registry object
+    startTime = time.perf_counter()
+    reg.loadElementTree(tree)
+    timings.append(('load registry', time.perf_counter() - startTime))
+
+    return reg
+
+# Load the registry once and generate each of the requested targets from it,
+# instead of paying for parsing and loading vk.xml once per target.
+# Returns a list of (phase, wall time in seconds) tuples.
+def genTargets(args, targets):
+    timings = []
+
+    reg = None
+    for target in targets:
+        args.target = target
+        (gen, options) = genTarget(args)
+
+        if reg is None:
+            # Only the output filename differs between targets, so the
+            # registry loaded for the first one can be reused by the rest.
+            reg = loadRegistry(args, gen, options, timings)
+        else:
+            # Reset the required/declared state left behind by the previous target
+            reg.apiReset()
+            for ext in reg.extdict.values():
+                ext.resetState()
+            reg.genOpts = options
+            options.registry = reg
+            gen.genOpts = options
+            reg.setGenerator(gen)
+
+        startTime = time.perf_counter()
+        reg.apiGen()
+        timings.append(('generate ' + options.filename, time.perf_counter() - startTime))
+
+    return timings
+
+# Set up the argument parser used on the command line and by generate_source.py
+def makeArgParser():
     parser = argparse.ArgumentParser()
 
     parser.add_argument('-api', action='store',
@@ -324,6 +411,13 @@ if __name__ == '__main__':
     parser.add_argument('-errfile', action='store',
                         default=None,
                         help='Write errors and warnings to specified file instead of stderr')
+    parser.add_argument('-lazyIcdEntries', action='store_true',
+                        help='Look up ICD dispatch table entries when first used instead of when the instance is created')
+    parser.add_argument('-dispatchProfile', action='store',
+                        default=None,
+                        help='Order the loader internal hot dispatch table by the call counts in the specified JSON file')
+    parser.add_argument('-trampolineStats', action='store_true',
+                        help='Generate trampolines which count the calls made through them when LOADER_TRAMPOLINE_STATS is defined')
     parser.add_argument('-noprotect', dest='protect', action='store_false',
                         help='Disable inclusion protection in output headers')
     parser.add_argument('-profile', action='store_true',
@@ -351,7 +445,15 @@ if __name__ == '__main__':
     parser.add_argument('-scripts', action='store',
                         help='Find additional scripts in this directory')
 
-    args = parser.parse_args()
+    return parser
+
+# Import the registry scripts from Vulkan-Headers and the generators that depend on them.
+# The imports need to be done at runtime so that they can be picked up from Vulkan-Headers.
+def importScripts(args):
+    global etree, Registry, write, VulkanConventions
+    global DispatchTableHelperOutputGenerator, DispatchTableHelperOutputGeneratorOptions
+    global HelperFileOutputGenerator, HelperFileOutputGeneratorOptions
+    global LoaderExtensionOutputGenerator, LoaderExtensionGeneratorOptions, LOADER_EXTENSION_SOURCES
 
     # default scripts path to be same as registry
     if not args.scripts:
@@ -362,14 +464,13 @@ if __name__ == '__main__':
     registry_dir = os.path.join(scripts_dir, args.scripts)
     sys.path.insert(0, registry_dir)
 
-    # The imports need to be done here so that they can be picked up from Vulkan-Headers
-    from reg import *
+    import xml.etree.ElementTree as etree
+    from reg import Registry
     from generator import write
-    from cgenerator import CGeneratorOptions, COutputGenerator
 
     from dispatch_table_helper_generator import DispatchTableHelperOutputGenerator, DispatchTableHelperOutputGeneratorOptions
     from helper_file_generator import HelperFileOutputGenerator, HelperFileOutputGeneratorOptions
-    from loader_extension_generator import LoaderExtensionOutputGenerator, LoaderExtensionGeneratorOptions
+    from loader_extension_generator import LoaderExtensionOutputGenerator, LoaderExtensionGeneratorOptions, LOADER_EXTENSION_SOURCES
 
     # Temporary workaround for vkconventions python2 compatibility
     import abc; abc.ABC = abc.ABCMeta('ABC', (object,), {})
@@ -379,6 +480,19 @@ if __name__ == '__main__':
     args.feature = [name for arg in args.feature for name in arg.split()]
     args.extension = [name for arg in args.extension for name in arg.split()]
 
+# Output files for errors/warnings and diagnostics, replaced on the command line
+errWarn = sys.stderr
+diag = None
+
+# -feature name
+# -extension name
+# For both, "name" may be a single name, or a space-separated list
+# of names, or a regular expression.
+if __name__ == '__main__':
+    args = makeArgParser().parse_args()
+
+    importScripts(args)
+
     # create error/warning & diagnostic files
     if args.errfile:
         errWarn = open(args.errfile, 'w', encoding='utf-8')
@@ -394,18 +508,12 @@ if __name__ == '__main__':
     (gen, options) = genTarget(args)
 
     # Create the registry object with the specified generator and generator
-    # options. The options are set before XML loading as they may affect it.
-    reg = Registry(gen, options)
-
-    # Parse the specified registry XML into an ElementTree objec
-    startTimer(args.time)
-    tree = etree.parse(args.registry)
-    endTimer(args.time, '* Time to make ElementTree =')
-
-    # Load the XML tree into the registry object
-    startTimer(args.time)
-    reg.loadElementTree(tree)
-    endTimer(args.time, '* Time to parse ElementTree =')
+    # options, and load the registry XML into it
+    timings = []
+    reg = loadRegistry(args, gen, options, timings)
+    if args.time:
+        for phase, seconds in timings:
+            write('* Time to', phase, '=', seconds, file=sys.stderr)
 
     if (args.validate):
         reg.validateGroups()
@@ -417,6 +525,11 @@ if __name__ == '__main__':
     # Finally, use the output generator to create the requested targe
     if (args.debug):
         pdb.run('reg.apiGen()')
+    elif (args.profile):
+        # Print the functions the generator spent the most time in
+        profiler = cProfile.Profile()
+        profiler.runcall(reg.apiGen)
+        pstats.Stats(profiler, stream=sys.stderr).strip_dirs().sort_stats('cumulative').print_stats(50)
     else:
         startTimer(args.time)
         reg.apiGen()
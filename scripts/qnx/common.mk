@@ -24,7 +24,9 @@ SRCS = cJSON.c debug_utils.c dev_ext_trampoline.c loader.c \
 	phys_dev_ext.c trampoline.c unknown_ext_chain.c wsi.c \
 	extension_manual.c unknown_function_handling.c settings.c \
 	log.c allocation.c loader_environment.c gpa_helper.c \
-	terminator.c
+	terminator.c vk_loader_extensions_dispatch.c \
+	vk_loader_extensions_gpa.c vk_loader_extensions_lookup.c \
+	vk_loader_extensions_trampolines.c
 
 LDFLAGS += -Wl,--unresolved-symbols=report-all -Wl,--no-undefined -Wl,-fPIC
 
@@ -81,6 +81,33 @@ $ scripts/update_deps.py --dir=/tmp/deps
 The "top" dir is then /tmp/deps (Linux filesystem example) and is
 where this program will clone and build the dependent repositories.
 
+The dependent repositories are cloned or updated at the same time, and
+each one is built as soon as the repositories listed in its "deps" are
+installed.  Repositories which do not depend on each other are built in
+parallel, sharing the number of CPUs given with the "--jobs" option.
+
+The "--shallow" option fetches only the known-good commit of each
+repository (or the "--ref" override) instead of its whole history, which
+is faster on machines that start without the repositories, such as CI
+runners.  If the server does not allow fetching the commit directly, the
+whole repository is fetched as usual.
+
+The "--mirror-dir" option keeps a bare mirror of each dependent repository
+in a directory shared by every "top" directory on the machine.  New clones
+borrow their objects from the mirror instead of downloading and storing
+their own copy, and existing ones fetch from it.  Each mirror is fetched at
+most once per run, under a lock file so that runs in other "top"
+directories wait for it rather than fetching it again.  Mirrors which have
+not been used for "--mirror-max-age" days are deleted.
+
+The "--install-cache" option keeps a packaged copy of each repository's
+install directory in a directory which can be shared between "top"
+directories.  Each package is named after a key computed from the commit
+that was built, the "cmake_options", "--cmake_var" values, configuration,
+generator and architecture, and the keys of the repositories it depends
+on.  A repository whose key is found in the cache is restored from it
+instead of being built, and a repository which is built is added to it.
+
 Helper CMake Config File
 ------------------------
 
@@ -233,16 +260,22 @@ option can be a relative or absolute path.
 """
 
 import argparse
+import concurrent.futures
+import hashlib
 import json
 import os
 import os.path
+import re
 import subprocess
 import sys
 import platform
+import threading
 import multiprocessing
 import shlex
 import shutil
 import stat
+import tarfile
+import tempfile
 import time
 
 KNOWN_GOOD_FILE_NAME = 'known_good.json'
@@ -274,6 +307,13 @@ def make_or_exist_dirs(path):
     if not os.path.isdir(path):
         os.makedirs(path)
 
+def print_line(line):
+    """Print a line in a single write, so the lines printed by repos which are
+    checked out or built at the same time do not run together.
+    """
+    sys.stdout.write(line + '\n')
+    sys.stdout.flush()
+
 def command_output(cmd, directory):
     # Runs a command in a directory and returns its standard output stream.
     # Captures the standard error stream and prints it an error occurs.
@@ -291,11 +331,12 @@ def command_output(cmd, directory):
         print(result.stdout)
     return result.stdout
 
-def run_cmake_command(cmake_cmd):
+def run_cmake_command(cmake_cmd, directory=None):
     # NOTE: Because CMake is an exectuable that runs executables
     # stdout/stderr are mixed together. So this combines the outputs
     # and prints them properly in case there is a non-zero exit code.
     result = subprocess.run(cmake_cmd,
+        cwd = directory,
         stdout = subprocess.PIPE,
         stderr = subprocess.STDOUT,
         text = True
@@ -312,6 +353,84 @@ def run_cmake_command(cmake_cmd):
 def escape(path):
     return path.replace('\\', '/')
 
+class FileLock(object):
+    """An exclusive lock on a file, shared with other processes on the machine.
+
+    The lock file itself is never deleted, as a process may be waiting on it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def acquire(self, blocking=True):
+        """Lock the file, returning False if it is locked and blocking is False"""
+        self._file = open(self.path, 'a')
+        try:
+            if platform.system() == 'Windows':
+                import msvcrt
+                while True:
+                    try:
+                        # LK_LOCK gives up after 10 seconds, so keep trying
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._file.close()
+            self._file = None
+            return False
+        return True
+
+    def release(self):
+        if platform.system() == 'Windows':
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+# Mirrors fetched during this run, which are not fetched again
+updated_mirrors = set()
+updated_mirrors_lock = threading.Lock()
+
+def EvictMirrors(mirror_dir, max_age_days):
+    """Delete the mirrors in mirror_dir which have not been used for max_age_days.
+
+    The lock file of a mirror is touched every time the mirror is used. Mirrors
+    locked by another run are left alone.
+    """
+    if not os.path.isdir(mirror_dir):
+        return
+    for entry in os.listdir(mirror_dir):
+        if not entry.endswith('.git.lock'):
+            continue
+        lock_path = os.path.join(mirror_dir, entry)
+        mirror = lock_path[:-len('.lock')]
+        if time.time() - os.path.getmtime(lock_path) < max_age_days * 24 * 60 * 60:
+            continue
+        lock = FileLock(lock_path)
+        if not lock.acquire(blocking=False):
+            continue
+        try:
+            # Check again now that no other run can be using it
+            if os.path.isdir(mirror) and time.time() - os.path.getmtime(lock_path) >= max_age_days * 24 * 60 * 60:
+                print('Removing unused mirror {}'.format(mirror))
+                shutil.rmtree(mirror, onerror=on_rm_error)
+        finally:
+            lock.release()
+
 class GoodRepo(object):
     """Represents a repository at a known-good commit."""
 
@@ -357,6 +476,11 @@ class GoodRepo(object):
             self.build_dir = os.path.join(dir_top, self.build_dir)
         if self.install_dir:
             self.install_dir = os.path.join(dir_top, self.install_dir)
+        # Bare mirror of the repo shared by all of the "top" directories
+        self.mirror_dir = None
+        if args.mirror_dir:
+            self.mirror_dir = os.path.join(os.path.abspath(args.mirror_dir), '{n}-{h}.git'.format(
+                n=self.name, h=hashlib.sha1(self.url.encode('utf-8')).hexdigest()[:12]))
 
         # By default the target platform is the host platform.
         target_platform = platform.system().lower()
@@ -372,6 +496,13 @@ class GoodRepo(object):
     def Clone(self, retries=10, retry_seconds=60):
         if VERBOSE:
             print('Cloning {n} into {d}'.format(n=self.name, d=self.repo_dir))
+        if self.mirror_dir:
+            # Borrow the objects of the mirror through the alternates file, and
+            # point origin back at the real URL so the clone still works without it
+            make_or_exist_dirs(self.repo_dir)
+            command_output(['git', 'clone', '--shared', self.mirror_dir, '.'], self.repo_dir)
+            command_output(['git', 'remote', 'set-url', 'origin', self.url], self.repo_dir)
+            return
         for retry in range(retries):
             make_or_exist_dirs(self.repo_dir)
             try:
@@ -393,10 +524,121 @@ class GoodRepo(object):
                 print("Failed to clone {} on all retries.".format(self.url))
                 raise e
 
+    def HasLocalCommit(self, ref, directory=None):
+        """Returns whether ref names a commit already in the local repository
+        (or in directory) which fetching can not change: a full commit hash or
+        a tag. Branches are always fetched, as they may have moved on the remote.
+        """
+        if re.fullmatch('[0-9a-fA-F]{40}|[0-9a-fA-F]{64}', ref):
+            name = ref
+        else:
+            name = 'refs/tags/' + ref
+        result = subprocess.run(['git', 'cat-file', '-e', name + '^{commit}'], cwd=directory if directory else self.repo_dir,
+                                stdout=DEVNULL, stderr=DEVNULL)
+        return result.returncode == 0
+
+    def HasMissingAlternates(self):
+        """Returns whether the repo borrows objects from a mirror which has been removed"""
+        alternates = os.path.join(self.repo_dir, '.git', 'objects', 'info', 'alternates')
+        if not os.path.isfile(alternates):
+            return False
+        with open(alternates) as f:
+            return any(not os.path.isdir(line.strip()) for line in f if line.strip())
+
+    def UpdateMirror(self, ref, retries=10, retry_seconds=60):
+        """Create or fetch the mirror of the repo, unless it already has ref.
+
+        The mirror is fetched at most once per run. Other runs using the same
+        mirror wait on its lock file while it is created or fetched, and then
+        find ref already there instead of fetching it again.
+        """
+        with updated_mirrors_lock:
+            if self.mirror_dir in updated_mirrors:
+                return
+            updated_mirrors.add(self.mirror_dir)
+        make_or_exist_dirs(os.path.dirname(self.mirror_dir))
+        lock_path = self.mirror_dir + '.lock'
+        with FileLock(lock_path):
+            # Mark the mirror as used, so it is not evicted
+            os.utime(lock_path, None)
+            if os.path.isdir(self.mirror_dir):
+                if self.HasLocalCommit(ref, self.mirror_dir):
+                    return
+                if VERBOSE:
+                    print('Fetching mirror of {n} in {d}'.format(n=self.name, d=self.mirror_dir))
+                cmd, directory = ['git', 'fetch', '--prune', 'origin'], self.mirror_dir
+            else:
+                if VERBOSE:
+                    print('Creating mirror of {n} in {d}'.format(n=self.name, d=self.mirror_dir))
+                # Clone next to the mirror and rename it, so an interrupted clone
+                # never leaves a partial mirror behind
+                partial = self.mirror_dir + '.partial'
+                if os.path.isdir(partial):
+                    shutil.rmtree(partial, onerror=on_rm_error)
+                cmd, directory = ['git', 'clone', '--mirror', self.url, partial], os.path.dirname(self.mirror_dir)
+            for retry in range(retries):
+                try:
+                    command_output(cmd, directory)
+                    break
+                except RuntimeError as e:
+                    print("Error updating mirror on iteration {}/{}: {}".format(retry + 1, retries, e))
+                    if retry + 1 < retries:
+                        if retry_seconds > 0:
+                            print("Waiting {} seconds before trying again".format(retry_seconds))
+                            time.sleep(retry_seconds)
+                        if cmd[1] == 'clone' and os.path.isdir(partial):
+                            shutil.rmtree(partial, onerror=on_rm_error)
+                        continue
+
+                    # If we get here, we've exhausted our retries.
+                    print("Failed to update the mirror of {} on all retries.".format(self.url))
+                    raise e
+            if cmd[1] == 'clone':
+                os.rename(partial, self.mirror_dir)
+
+    def Init(self):
+        """Create an empty repository with the remote set up, for a shallow fetch"""
+        if VERBOSE:
+            print('Initializing {n} in {d}'.format(n=self.name, d=self.repo_dir))
+        make_or_exist_dirs(self.repo_dir)
+        command_output(['git', 'init'], self.repo_dir)
+        command_output(['git', 'remote', 'add', 'origin', self.url], self.repo_dir)
+
+    def ShallowFetch(self, ref):
+        """Fetch only the commit ref names, without its history.
+
+        Returns False if ref could not be fetched this way, e.g. because the
+        server does not allow fetching a commit which is not a branch or tag.
+        """
+        # Refs of the form origin/<branch> name the branch on the remote
+        if ref.startswith('origin/'):
+            ref = ref[len('origin/'):]
+        fetch_cmd = ['git', 'fetch', '--depth', '1']
+        if self._args.filter:
+            fetch_cmd.append('--filter={}'.format(self._args.filter))
+        fetch_cmd.extend(['origin', ref])
+        try:
+            command_output(fetch_cmd, self.repo_dir)
+            # Keep a fetched tag, so the next run finds its commit locally
+            with open(os.path.join(self.repo_dir, '.git', 'FETCH_HEAD')) as fetch_head:
+                if "\ttag '" in fetch_head.readline():
+                    command_output(['git', 'update-ref', 'refs/tags/' + ref, 'FETCH_HEAD'], self.repo_dir)
+            return True
+        except RuntimeError as e:
+            print("Error fetching {} from {}, falling back to a full fetch: {}".format(ref, self.url, e))
+            return False
+
     def Fetch(self, retries=10, retry_seconds=60):
+        fetch_cmd = ['git', 'fetch', 'origin']
+        if self.mirror_dir:
+            # Update the remote branches and tags from the mirror instead of the network
+            fetch_cmd = ['git', 'fetch', '--tags', self.mirror_dir, '+refs/heads/*:refs/remotes/origin/*']
+        # Fetch the whole history of a repo left shallow by an earlier --shallow run
+        if os.path.exists(os.path.join(self.repo_dir, '.git', 'shallow')):
+            fetch_cmd.append('--unshallow')
         for retry in range(retries):
             try:
-                command_output(['git', 'fetch', 'origin'], self.repo_dir)
+                command_output(fetch_cmd, self.repo_dir)
                 # if we get here, we didn't raise an error, and we're done
                 return
             except RuntimeError as e:
@@ -420,18 +662,51 @@ class GoodRepo(object):
         else:
             url_changed = False
 
-        if self._args.do_clean_repo or url_changed:
+        # A clone made from a mirror can not be used once the mirror is evicted
+        if self._args.do_clean_repo or url_changed or self.HasMissingAlternates():
             if os.path.isdir(self.repo_dir):
                 if VERBOSE:
                     print('Clearing directory {d}'.format(d=self.repo_dir))
                 shutil.rmtree(self.repo_dir, onerror = on_rm_error)
+        # The steps taken to check out the repo and how long each one took
+        steps = []
+        ref = self._args.ref if len(self._args.ref) else self.commit
+        start = time.time()
         if not os.path.exists(os.path.join(self.repo_dir, '.git')):
-            self.Clone()
-        self.Fetch()
-        if len(self._args.ref):
-            command_output(['git', 'checkout', self._args.ref], self.repo_dir)
+            if self.mirror_dir:
+                self.UpdateMirror(ref)
+                steps.append(('mirror update', time.time() - start))
+                start = time.time()
+                self.Clone()
+            elif self._args.shallow:
+                self.Init()
+            else:
+                self.Clone()
+            steps.append(('clone', time.time() - start))
+
+        start = time.time()
+        if self.HasLocalCommit(ref):
+            # Nothing to fetch, the commit is already here
+            command_output(['git', 'checkout', ref], self.repo_dir)
+            if self.mirror_dir and os.path.exists(self.mirror_dir + '.lock'):
+                # The clone may still borrow objects from the mirror
+                os.utime(self.mirror_dir + '.lock', None)
+            steps.append(('cache hit', time.time() - start))
+        elif self.mirror_dir:
+            self.UpdateMirror(ref)
+            self.Fetch()
+            command_output(['git', 'checkout', ref], self.repo_dir)
+            steps.append(('mirror fetch', time.time() - start))
+        elif self._args.shallow and self.ShallowFetch(ref):
+            command_output(['git', 'checkout', '--detach', 'FETCH_HEAD'], self.repo_dir)
+            steps.append(('shallow fetch', time.time() - start))
         else:
-            command_output(['git', 'checkout', self.commit], self.repo_dir)
+            self.Fetch()
+            command_output(['git', 'checkout', ref], self.repo_dir)
+            steps.append(('fetch', time.time() - start))
+
+        print_line('Checked out {n} ({r}): {s}'.format(
+            n=self.name, r=ref, s=', '.join('{} in {:.2f} seconds'.format(step, seconds) for step, seconds in steps)))
 
         if VERBOSE:
             print(command_output(['git', 'status'], self.repo_dir))
@@ -471,9 +746,10 @@ class GoodRepo(object):
             if os.path.isdir(self.install_dir):
                 shutil.rmtree(self.install_dir, onerror=on_rm_error)
 
-        # Create and change to build directory
+        # Create the build directory. The configure step runs in it rather than
+        # changing the working directory, which other repos share when they are
+        # built at the same time.
         make_or_exist_dirs(self.build_dir)
-        os.chdir(self.build_dir)
 
         cmake_cmd = [
             'cmake', self.repo_dir,
@@ -531,9 +807,9 @@ class GoodRepo(object):
         if not VERBOSE:
             cmake_cmd.append("--no-warn-unused-cli")
 
-        run_cmake_command(cmake_cmd)
+        run_cmake_command(cmake_cmd, self.build_dir)
 
-    def CMakeBuild(self):
+    def CMakeBuild(self, jobs):
         """Build CMake command for the build phase and execute it"""
         cmake_cmd = ['cmake', '--build', self.build_dir, '--target', 'install', '--config', CONFIG_MAP[self._args.config]]
         if self._args.do_clean:
@@ -542,12 +818,16 @@ class GoodRepo(object):
         # Xcode / Ninja are parallel by default.
         if self._args.generator != "Ninja" or self._args.generator != "Xcode":
             cmake_cmd.append('--parallel')
-            cmake_cmd.append(format(multiprocessing.cpu_count()))
+            cmake_cmd.append(format(jobs))
 
         run_cmake_command(cmake_cmd)
 
-    def Build(self, repos, repo_dict):
-        """Build the dependent repo and time how long it took"""
+    def Build(self, repos, repo_dict, jobs=None):
+        """Build the dependent repo and time how long it took
+
+        Args:
+        'jobs':  Number of parallel jobs the build may use, by default one per CPU
+        """
         if VERBOSE:
             print('Building {n} in {d}'.format(n=self.name, d=self.repo_dir))
             print('Build dir = {b}'.format(b=self.build_dir))
@@ -555,17 +835,93 @@ class GoodRepo(object):
 
         start = time.time()
 
+        package = None
+        if self._args.install_cache and self.install_dir:
+            package = os.path.join(os.path.abspath(self._args.install_cache),
+                                   '{n}-{k}.tar'.format(n=self.name, k=self.InstallKey(repos)))
+            if os.path.isfile(package):
+                self.RestoreInstall(package)
+                print_line(f"Restored {self.name} ({self.commit}) from {package} in {time.time() - start} seconds")
+                return
+
         self.PreBuild()
 
         if self.build_step == 'custom':
             self.CustomBuild(repo_dict)
         else:
             self.CMakeConfig(repos)
-            self.CMakeBuild()
+            self.CMakeBuild(jobs if jobs else multiprocessing.cpu_count())
+
+        if package and os.path.isdir(self.install_dir):
+            self.PublishInstall(package)
 
         total_time = time.time() - start
 
-        print(f"Installed {self.name} ({self.commit}) in {total_time} seconds", flush=True)
+        print_line(f"Installed {self.name} ({self.commit}) in {total_time} seconds")
+
+    def InstallKey(self, repos):
+        """Returns a key identifying the contents of the install directory.
+
+        The key covers everything this script passes to the build, along with
+        the keys of the repos this one depends on. Install directories are
+        assumed to be relocatable, so the paths of the "top" directory are not
+        part of the key.
+        """
+        if getattr(self, '_install_key', None):
+            return self._install_key
+        if os.path.exists(os.path.join(self.repo_dir, '.git')):
+            commit = command_output(['git', 'rev-parse', 'HEAD'], self.repo_dir).strip()
+        else:
+            commit = self.commit
+        key = {
+            'name': self.name,
+            'commit': commit,
+            'build_step': self.build_step,
+            'prebuild': self.prebuild + self.prebuild_linux + self.prebuild_windows,
+            'custom_build': self.custom_build,
+            'cmake_options': self.cmake_options,
+            'cmake_var': self._args.cmake_var,
+            'config': self._args.config,
+            'generator': self._args.generator,
+            'arch': self._args.arch,
+            'osx_archs': self._args.OSX_ARCHITECTURES,
+            'platform': [platform.system(), platform.machine()],
+            'deps': {},
+        }
+        for d in self.deps:
+            dep = [r for r in repos if r.name == d['repo_name']]
+            if len(dep) and dep[0].on_build_platform:
+                key['deps'][d['var_name']] = dep[0].InstallKey(repos)
+        self._install_key = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+        return self._install_key
+
+    def RestoreInstall(self, package):
+        """Replace the install directory with the contents of package"""
+        if os.path.isdir(self.install_dir):
+            shutil.rmtree(self.install_dir, onerror=on_rm_error)
+        make_or_exist_dirs(self.install_dir)
+        with tarfile.open(package) as tar:
+            if hasattr(tarfile, 'tar_filter'):
+                tar.extractall(self.install_dir, filter='tar')
+            else:
+                tar.extractall(self.install_dir)
+
+    def PublishInstall(self, package):
+        """Package the install directory into the install cache"""
+        cache_dir = os.path.dirname(package)
+        make_or_exist_dirs(cache_dir)
+        # Write to a temporary file and rename it, so other runs never see a
+        # partial package. Renaming over a package published meanwhile by
+        # another run is harmless, as both have the same contents.
+        fd, partial = tempfile.mkstemp(dir=cache_dir, prefix=os.path.basename(package), suffix='.partial')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                with tarfile.open(fileobj=f, mode='w') as tar:
+                    tar.add(self.install_dir, arcname='.')
+            os.replace(partial, package)
+        except BaseException:
+            os.remove(partial)
+            raise
 
     def IsOptional(self, opts):
         return len(self.optional.intersection(opts)) > 0
@@ -636,6 +992,74 @@ def CreateHelper(args, repos, filename):
                                       dir=escape(repo.install_dir)))
 
 
+def CheckoutAndBuild(args, repos, repo_dict, selected):
+    """Clone/update the selected repos and build them.
+
+    All of the repos are cloned or updated concurrently. Each repo is built
+    as soon as it is checked out and the selected repos named in its 'deps'
+    are installed, so independent repos build at the same time. Each build
+    gets a fixed share of the '--jobs' CPU budget, and no more builds run at
+    once than there are shares, so the running builds never use more than
+    '--jobs' CPUs between them.
+    """
+    names = set(repo.name for repo in selected)
+    waiting_on = {}
+    for repo in selected:
+        waiting_on[repo.name] = set(d['repo_name'] for d in repo.deps if d['repo_name'] in names)
+
+    def NeedsBuild(repo):
+        return args.do_build and repo.build_step != 'skip'
+
+    # Check for dependency cycles up front, they would leave repos waiting forever.
+    # The widest step of the dependency order is how many builds are expected to
+    # run at once, which the '--jobs' CPUs are shared between.
+    builds = set(repo.name for repo in selected if NeedsBuild(repo))
+    max_builds = 1
+    ordered = set()
+    remaining = dict(waiting_on)
+    while remaining:
+        ready = [name for name, deps in remaining.items() if deps <= ordered]
+        if not ready:
+            raise RuntimeError('Dependency cycle between repos {}'.format(', '.join(sorted(remaining))))
+        max_builds = max(max_builds, len(builds.intersection(ready)))
+        ordered.update(ready)
+        for name in ready:
+            del remaining[name]
+    max_builds = max(1, min(max_builds, args.jobs))
+    jobs = max(1, args.jobs // max_builds)
+
+    checked_out = set()
+    installed = set()
+    running = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(selected))) as executor:
+        checkouts = {executor.submit(repo.Checkout): repo for repo in selected}
+        pending = set(checkouts)
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                # Raises any error from the checkout or build
+                future.result()
+                if future in checkouts:
+                    repo = checkouts[future]
+                    checked_out.add(repo.name)
+                    if not NeedsBuild(repo):
+                        installed.add(repo.name)
+                else:
+                    repo = running.pop(future)
+                    installed.add(repo.name)
+
+            # Start the builds whose repo is checked out and whose dependencies are installed,
+            # as long as there is a share of the '--jobs' CPUs left for them
+            ready = [repo for repo in selected
+                     if repo.name in checked_out and repo.name not in installed and
+                     repo not in running.values() and waiting_on[repo.name] <= installed]
+            for repo in ready[:max_builds - len(running)]:
+                future = executor.submit(repo.Build, repos, repo_dict, jobs)
+                running[future] = repo
+                pending.add(future)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Get and build dependent repos at known-good commits')
@@ -688,7 +1112,7 @@ def main():
         '--skip-existing-install',
         dest='skip_existing_install',
         action='store_true',
-        help="Skip build if install directory exists",
+        help="Skip build if install directory exists, without checking that it matches the known-good commit. See --install-cache",
         default=False)
     parser.add_argument(
         '--arch',
@@ -734,6 +1158,41 @@ def main():
         help="Architectures when building a universal binary. Takes a colon seperated list. Ex: arm64:x86_64",
         type=str,
         default=None)
+    parser.add_argument(
+        '--shallow',
+        dest='shallow',
+        action='store_true',
+        help="Fetch only the known-good commit (or --ref) without its history, falling back to a full fetch if the server does not allow it",
+        default=False)
+    parser.add_argument(
+        '--filter',
+        dest='filter',
+        metavar='FILTER_SPEC',
+        help="Partial clone filter used by --shallow fetches when the server supports it, e.g. 'blob:none'",
+        default=None)
+    parser.add_argument(
+        '--jobs',
+        dest='jobs',
+        type=int,
+        help="Number of CPUs shared by the repos that are built at the same time. Default is the number of CPUs",
+        default=multiprocessing.cpu_count())
+    parser.add_argument(
+        '--mirror-dir',
+        dest='mirror_dir',
+        help="Directory of bare mirrors of the repos shared with other --dir directories, which clones borrow their objects from. Takes precedence over --shallow",
+        default=None)
+    parser.add_argument(
+        '--mirror-max-age',
+        dest='mirror_max_age',
+        type=float,
+        metavar='DAYS',
+        help="Delete the mirrors in --mirror-dir which have not been used for this many days. Default is 30",
+        default=30)
+    parser.add_argument(
+        '--install-cache',
+        dest='install_cache',
+        help="Directory of packaged install directories, keyed by commit and build options, which are restored instead of building the repos. Built repos are added to it",
+        default=None)
 
     args = parser.parse_args()
     save_cwd = os.getcwd()
@@ -747,6 +1206,7 @@ def main():
 
     repos = GetGoodRepos(args)
     repo_dict = {}
+    selected = []
 
     print('Starting builds in {d}'.format(d=abs_top_dir))
     for repo in repos:
@@ -803,12 +1263,13 @@ def main():
             if not do_build:
                 continue
 
-        # Clone/update the repository
-        repo.Checkout()
+        selected.append(repo)
+
+    # Clone/update the repositories and build them
+    CheckoutAndBuild(args, repos, repo_dict, selected)
 
-        # Build the repository
-        if args.do_build and repo.build_step != 'skip':
-            repo.Build(repos, repo_dict)
+    if args.mirror_dir:
+        EvictMirrors(os.path.abspath(args.mirror_dir), args.mirror_max_age)
 
     # Need to restore original cwd in order for CreateHelper to find json file
     os.chdir(save_cwd)
@@ -1700,6 +1700,7 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL test_vkGetInstanceProcAddr(VkInstance i
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL test_vkGetDeviceProcAddr(VkDevice device, const char* pName) {
+    if (icd.record_device_function_queries) icd.queried_device_functions.push_back(pName);
     return get_device_func(device, pName);
 }
 
@@ -1730,6 +1731,7 @@ PFN_vkVoidFunction base_get_instance_proc_addr(VkInstance instance, const char*
             return icd.can_query_vkEnumerateInstanceVersion ? to_vkVoidFunction(test_vkEnumerateInstanceVersion) : nullptr;
         if (string_eq(pName, "vkCreateInstance")) return to_vkVoidFunction(test_vkCreateInstance);
     }
+    if (instance != NULL && icd.record_instance_function_queries) icd.queried_instance_functions.push_back(pName);
     if (string_eq(pName, "vkGetDeviceProcAddr")) return to_vkVoidFunction(test_vkGetDeviceProcAddr);
 
     auto instance_func_return = get_instance_func(instance, pName);
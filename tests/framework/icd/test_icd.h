@@ -175,6 +175,21 @@ struct TestICD {
     BUILDER_VALUE(TestICD, bool, enable_icd_wsi, false);
     bool is_using_icd_wsi = false;
 
+    // Record the name of every function the loader queries with vkGetInstanceProcAddr on a created instance. Not thread safe,
+    // so leave it disabled in tests which make the first calls of instance functions from several threads.
+    BUILDER_VALUE(TestICD, bool, record_instance_function_queries, false);
+    std::vector<std::string> queried_instance_functions;
+    size_t count_instance_function_queries(const char* name) const {
+        return static_cast<size_t>(std::count(queried_instance_functions.begin(), queried_instance_functions.end(), name));
+    }
+
+    // Record the name of every function the loader queries with vkGetDeviceProcAddr. Not thread safe either.
+    BUILDER_VALUE(TestICD, bool, record_device_function_queries, false);
+    std::vector<std::string> queried_device_functions;
+    size_t count_device_function_queries(const char* name) const {
+        return static_cast<size_t>(std::count(queried_device_functions.begin(), queried_device_functions.end(), name));
+    }
+
     TestICD& setup_WSI(const char* api_selection = nullptr) {
         enable_icd_wsi = true;
         add_instance_extensions({"VK_KHR_surface", get_platform_wsi_extension(api_selection)});
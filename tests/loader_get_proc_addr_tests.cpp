@@ -494,3 +494,64 @@ TEST(GetDeviceProcAddr, AppQueries13FunctionsWhileOnlyEnabling12) {
         }
     }
 }
+
+// The loader only skips looking up core device commands newer than the application's apiVersion when VK_KHR_maintenance5 is
+// enabled, since vkGetDeviceProcAddr returns NULL for them then. Otherwise every core command is looked up, even those newer
+// than the physical device's apiVersion, as drivers may still expose them.
+TEST(GetDeviceProcAddr, CoreCommandsNewerThanAppVersionOnlySkippedWithMaintenance5) {
+    FrameworkEnvironment env{};
+    auto& driver =
+        env.add_icd(TestICDDetails(TEST_ICD_PATH_VERSION_2, VK_API_VERSION_1_1))
+            .set_icd_api_version(VK_API_VERSION_1_1)
+            .set_record_device_function_queries(true)
+            .add_physical_device(
+                PhysicalDevice{}.set_api_version(VK_API_VERSION_1_1).add_extension(VK_KHR_MAINTENANCE_5_EXTENSION_NAME).finish());
+    const char* skipped_log = "loader_create_device_chain: Skipped looking up";
+
+    std::vector<const char*> newer_functions = {"vkGetDeviceQueue2", "vkCmdDrawIndirectCount", "vkCmdWaitEvents2",
+                                                "vkCmdPushConstants2"};
+    {  // doesn't enable the feature, so the commands newer than both the application and the physical device are looked up
+        InstWrapper inst{env.vulkan_functions};
+        inst.create_info.set_api_version(1, 0, 0);
+        inst.create_info.add_extension(VK_EXT_DEBUG_UTILS_EXTENSION_NAME);
+        inst.CheckCreate();
+        DebugUtilsWrapper log{inst, VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT};
+        CreateDebugUtilsMessenger(log);
+
+        DeviceWrapper dev{inst};
+        dev.create_info.add_extension(VK_KHR_MAINTENANCE_5_EXTENSION_NAME);
+        dev.CheckCreate(inst.GetPhysDev());
+
+        ASSERT_FALSE(log.find(skipped_log));
+        ASSERT_EQ(1U, driver.count_device_function_queries("vkCmdDraw"));
+        for (const auto& f : newer_functions) {
+            ASSERT_EQ(1U, driver.count_device_function_queries(f));
+        }
+    }
+    driver.queried_device_functions.clear();
+    {  // enables the feature and extension, so only the Vulkan 1.0 commands are looked up
+        InstWrapper inst{env.vulkan_functions};
+        inst.create_info.set_api_version(1, 0, 0);
+        inst.create_info.add_extension(VK_EXT_DEBUG_UTILS_EXTENSION_NAME);
+        inst.CheckCreate();
+        DebugUtilsWrapper log{inst, VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT};
+        CreateDebugUtilsMessenger(log);
+
+        VkPhysicalDeviceMaintenance5FeaturesKHR features{};
+        features.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR;
+        features.maintenance5 = VK_TRUE;
+
+        DeviceWrapper dev{inst};
+        dev.create_info.add_extension(VK_KHR_MAINTENANCE_5_EXTENSION_NAME);
+        dev.create_info.dev.pNext = &features;
+        dev.CheckCreate(inst.GetPhysDev());
+
+        ASSERT_TRUE(log.find(skipped_log));
+        ASSERT_TRUE(log.find("core device commands newer than Vulkan 1.0"));
+        ASSERT_EQ(1U, driver.count_device_function_queries("vkCmdDraw"));
+        for (const auto& f : newer_functions) {
+            ASSERT_EQ(0U, driver.count_device_function_queries(f));
+            ASSERT_EQ(nullptr, dev->vkGetDeviceProcAddr(dev.dev, f));
+        }
+    }
+}
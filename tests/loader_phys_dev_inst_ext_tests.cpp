@@ -952,6 +952,66 @@ TEST(LoaderInstPhysDevExts, PhysDevFormatPropsMixed) {
     }
 }
 
+// Test that each driver's vkGetPhysicalDeviceFormatProperties2 entry is looked up once per instance, however many times it is
+// called, both when the driver has the command and when the loader has to emulate it. With --lazy-icd-entries the entries are
+// looked up by the first call instead of during vkCreateInstance, and a driver without the command must not be asked again.
+TEST(LoaderInstPhysDevExts, PhysDevFormatProps2ICDEntryLookedUpOnce) {
+    FrameworkEnvironment env{};
+    const uint32_t max_icd_count = 2;
+
+    for (uint32_t icd = 0; icd < max_icd_count; ++icd) {
+        // ICD 0 has vkGetPhysicalDeviceFormatProperties2, ICD 1 only supports 1.0
+        uint32_t icd_version = icd == 0 ? VK_API_VERSION_1_1 : VK_API_VERSION_1_0;
+        env.add_icd(TestICDDetails(TEST_ICD_PATH_VERSION_2_EXPORT_ICD_GPDPA, icd_version))
+            .set_icd_api_version(icd_version)
+            .set_record_instance_function_queries(true);
+        auto& cur_icd = env.get_test_icd(icd);
+
+        uint32_t rand_vendor_id;
+        uint32_t rand_driver_vers;
+        FillInRandomICDInfo(rand_vendor_id, rand_driver_vers);
+
+        cur_icd.physical_devices.push_back({});
+        auto& cur_dev = cur_icd.physical_devices.back();
+        FillInRandomDeviceProps(cur_dev.properties, icd_version, rand_vendor_id, rand_driver_vers);
+        FillInRandomFormatProperties(cur_dev.format_properties);
+    }
+
+    InstWrapper instance(env.vulkan_functions);
+    instance.create_info.set_api_version(VK_API_VERSION_1_1);
+    instance.create_info.add_extension(VK_EXT_DEBUG_UTILS_EXTENSION_NAME);
+    instance.CheckCreate();
+    DebugUtilsWrapper log{instance, VK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT};
+    CreateDebugUtilsMessenger(log);
+
+    PFN_vkGetPhysicalDeviceFormatProperties2 GetPhysDevFormatProps2 = instance.load("vkGetPhysicalDeviceFormatProperties2");
+    ASSERT_NE(GetPhysDevFormatProps2, nullptr);
+
+    uint32_t device_count = max_icd_count;
+    std::array<VkPhysicalDevice, max_icd_count> physical_devices;
+    ASSERT_EQ(VK_SUCCESS, instance->vkEnumeratePhysicalDevices(instance, &device_count, physical_devices.data()));
+    ASSERT_EQ(device_count, max_icd_count);
+
+    for (uint32_t call = 0; call < 3; ++call) {
+        for (uint32_t dev = 0; dev < device_count; ++dev) {
+            VkFormat format = static_cast<VkFormat>((dev + 1) % 5);
+            VkFormatProperties props{};
+            instance->vkGetPhysicalDeviceFormatProperties(physical_devices[dev], format, &props);
+            VkFormatProperties2 props2{VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2};
+            GetPhysDevFormatProps2(physical_devices[dev], format, &props2);
+
+            ASSERT_EQ(props.bufferFeatures, props2.formatProperties.bufferFeatures);
+            ASSERT_EQ(props.linearTilingFeatures, props2.formatProperties.linearTilingFeatures);
+            ASSERT_EQ(props.optimalTilingFeatures, props2.formatProperties.optimalTilingFeatures);
+        }
+    }
+    ASSERT_TRUE(log.find("Emulating call in ICD"));
+
+    for (uint32_t icd = 0; icd < max_icd_count; ++icd) {
+        ASSERT_EQ(1U, env.get_test_icd(icd).count_instance_function_queries("vkGetPhysicalDeviceFormatProperties2"));
+    }
+}
+
 // Fill in random but valid data into the image format data struct for the current physical device
 void FillInRandomImageFormatData(VkImageFormatProperties& props) {
     props.maxExtent = {static_cast<uint32_t>(rand() % 512), static_cast<uint32_t>(rand() % 512),
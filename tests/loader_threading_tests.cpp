@@ -27,6 +27,7 @@
 
 #include "test_environment.h"
 
+#include <algorithm>
 #include <thread>
 
 void create_destroy_instance_loop_with_function_queries(FrameworkEnvironment* env, uint32_t num_loops_create_destroy_instance,
@@ -129,3 +130,47 @@ TEST(Threading, DeviceCreateDestroyLoop) {
         device_creation_threads[i].join();
     }
 }
+
+void query_physical_device_format_properties_loop(VkPhysicalDevice phys_dev,
+                                                  PFN_vkGetPhysicalDeviceFormatProperties2 get_format_props2,
+                                                  uint32_t num_loops_query_properties) {
+    for (uint32_t i = 0; i < num_loops_query_properties; i++) {
+        VkFormatProperties2 format_props2{VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2};
+        get_format_props2(phys_dev, VK_FORMAT_UNDEFINED, &format_props2);
+        ASSERT_EQ(format_props2.formatProperties.optimalTilingFeatures, VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT);
+    }
+}
+
+// The threads make the first calls of the driver's vkGetPhysicalDeviceFormatProperties2 of each instance at the same time,
+// which race to look up its ICD dispatch table entry when the loader is generated with lazy ICD entries
+TEST(Threading, PhysicalDeviceQueryLoop) {
+    // There must be several threads to race, even on machines with a single CPU
+    const auto thread_count = std::max(4U, std::thread::hardware_concurrency());
+
+    FrameworkEnvironment env{FrameworkSettings{}.set_log_filter("")};
+    env.add_icd(TestICDDetails(TEST_ICD_PATH_VERSION_2_EXPORT_ICD_GPDPA, VK_API_VERSION_1_1))
+        .add_physical_device(PhysicalDevice{}
+                                 .set_api_version(VK_API_VERSION_1_1)
+                                 .add_format_properties(VkFormatProperties{0, VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT, 0})
+                                 .finish());
+    uint32_t num_loops_create_destroy_instance = 100;
+    uint32_t num_loops_query_properties = 10;
+
+    for (uint32_t i = 0; i < num_loops_create_destroy_instance; i++) {
+        InstWrapper inst{env.vulkan_functions};
+        inst.create_info.set_api_version(VK_API_VERSION_1_1);
+        inst.CheckCreate();
+        VkPhysicalDevice phys_dev = inst.GetPhysDev();
+        PFN_vkGetPhysicalDeviceFormatProperties2 get_format_props2 = inst.load("vkGetPhysicalDeviceFormatProperties2");
+        ASSERT_NE(get_format_props2, nullptr);
+
+        std::vector<std::thread> query_threads;
+        for (uint32_t j = 0; j < thread_count; j++) {
+            query_threads.emplace_back(query_physical_device_format_properties_loop, phys_dev, get_format_props2,
+                                       num_loops_query_properties);
+        }
+        for (uint32_t j = 0; j < thread_count; j++) {
+            query_threads[j].join();
+        }
+    }
+}
@@ -834,6 +834,39 @@ TEST(WsiTests, ForgetEnableSurfaceExtensions) {
     ASSERT_EQ(VK_ERROR_EXTENSION_NOT_PRESENT, create_surface(inst, surface));
 }
 
+// Drivers of interface version 3 and up learn that the loader uses their WSI from it querying their WSI commands, so those must
+// be looked up during vkCreateInstance, even when the other entries are looked up by their first call (--lazy-icd-entries).
+TEST(WsiTests, ICDWSIEntriesLookedUpDuringCreateInstance) {
+    FrameworkEnvironment env{};
+    auto& driver = env.add_icd(TestICDDetails(TEST_ICD_PATH_VERSION_2))
+                       .setup_WSI()
+                       .set_record_instance_function_queries(true)
+                       .add_physical_device(PhysicalDevice{}
+                                                .add_extension("VK_KHR_swapchain")
+                                                .add_queue_family_properties({{VK_QUEUE_GRAPHICS_BIT, 1, 0, {1, 1, 1}}, true})
+                                                .finish());
+
+    InstWrapper inst{env.vulkan_functions};
+    inst.create_info.setup_WSI();
+    inst.CheckCreate();
+
+    ASSERT_TRUE(driver.is_using_icd_wsi);
+    ASSERT_EQ(1U, driver.count_instance_function_queries("vkDestroySurfaceKHR"));
+    ASSERT_EQ(1U, driver.count_instance_function_queries("vkGetPhysicalDeviceSurfaceSupportKHR"));
+
+    VkSurfaceKHR surface{};
+    ASSERT_EQ(VK_SUCCESS, create_surface(inst, surface));
+    ASSERT_EQ(1U, driver.surface_handles.size());
+    VkBool32 supported = VK_FALSE;
+    ASSERT_EQ(VK_SUCCESS, env.vulkan_functions.vkGetPhysicalDeviceSurfaceSupportKHR(inst.GetPhysDev(), 0, surface, &supported));
+    ASSERT_EQ(VK_TRUE, supported);
+    env.vulkan_functions.vkDestroySurfaceKHR(inst.inst, surface, nullptr);
+
+    // Using the commands did not look them up again
+    ASSERT_EQ(1U, driver.count_instance_function_queries("vkDestroySurfaceKHR"));
+    ASSERT_EQ(1U, driver.count_instance_function_queries("vkGetPhysicalDeviceSurfaceSupportKHR"));
+}
+
 TEST(WsiTests, SwapchainFunctional) {
     FrameworkEnvironment env{};
     env.add_icd(TestICDDetails(TEST_ICD_PATH_VERSION_2))